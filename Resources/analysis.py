@@ -0,0 +1,734 @@
+"""
+Shared spectral analysis objects.
+
+"""
+import math
+import functools
+import collections
+import wx
+from .engine import *
+from .constants import VOCODER_MAX_FFT_SIZE
+
+try:
+    import numpy
+    FOUND_NUMPY = True
+except:
+    FOUND_NUMPY = False
+
+class AnalysisBus:
+    """
+    Shared phase vocoder analyses.
+
+    A consumer gets a PVAnal object analysing a source with given size,
+    overlaps and window with `subscribe`, and gives it back with
+    `unsubscribe`. Identical requests (same source object, size, overlaps
+    and window) share one analysis, counted by reference.
+
+    An analysis nobody uses anymore is stopped but kept (with its window,
+    twiddle factors and frame buffers) among the `keep` most recently
+    released ones, so going back to previous parameters, as
+    SpectralSwitcher does when the FFT settings move back and forth,
+    doesn't allocate anything. A kept analysis holds its source: a
+    consumer about to be destroyed gives its sources back with `forget`.
+
+    """
+    def __init__(self, keep=4):
+        # key -> [pvanal, source, count] of the analyses in use
+        self.analyses = {}
+        # id(pvanal) -> key (pyo objects aren't hashable)
+        self.keys = {}
+        self.keep = keep
+        # key -> [pvanal, source, 0] of the released analyses
+        self.parked = collections.OrderedDict()
+
+    def _key(self, source, size, overlaps, wintype):
+        return (id(source), size, overlaps, wintype)
+
+    def subscribe(self, source, size=1024, overlaps=4, wintype=2):
+        """
+        Returns a PVAnal object analysing `source` with the given
+        parameters, shared with the other subscribers of the same
+        analysis or a released one if possible.
+
+        """
+        key = self._key(source, size, overlaps, wintype)
+        if key in self.analyses:
+            entry = self.analyses[key]
+        elif key in self.parked:
+            entry = self.parked.pop(key)
+            entry[0].play()
+        else:
+            # The source is kept in the entry so that its id can't be
+            # reused by another object while the analysis is alive.
+            entry = [PVAnal(source, size, overlaps, wintype), source, 0]
+        entry[2] += 1
+        self.analyses[key] = entry
+        self.keys[id(entry[0])] = key
+        return entry[0]
+
+    def unsubscribe(self, pva):
+        """
+        Gives `pva` back. The last subscriber's release parks it.
+
+        """
+        key = self.keys.get(id(pva))
+        if key is None:
+            return
+        entry = self.analyses[key]
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del self.analyses[key]
+        del self.keys[id(pva)]
+        pva.stop()
+        self.parked[key] = entry
+        while len(self.parked) > self.keep:
+            self.parked.popitem(last=False)
+
+    def forget(self, sources):
+        """
+        Drops the released analyses of `sources`, so they don't keep
+        these sources (and their graph) alive.
+
+        """
+        ids = [id(source) for source in sources]
+        for key in list(self.parked):
+            if key[0] in ids:
+                del self.parked[key]
+
+    def clear(self):
+        """
+        Forgets every analysis (the server is about to be shut down).
+
+        """
+        for entry in self.analyses.values():
+            entry[0].stop()
+        self.analyses = {}
+        self.keys = {}
+        self.parked.clear()
+
+class SpectralSwitcher:
+    """
+    Double-buffered phase vocoder processing.
+
+    `build(*pvas)` creates a processing chain fed by the analyses of
+    `sources` (obtained from the AnalysisBus) and returns its output,
+    usually a PVSynth. `output` is an InputFader reading the current chain.
+    Without `sources`, `build()` makes its own analyses and may return an
+    object with an `output` attribute and a `stop` method (FFTVocoder).
+
+    When the FFT parameters change, the running chain is left untouched: a
+    second chain is built on analyses with the new parameters and runs,
+    unheard, for `prime` seconds (by default, the latency of the analysis
+    plus the resynthesis). The output then crossfades to the new chain and
+    the old one is released.
+
+    """
+    def __init__(self, anabus, sources, build, size=1024, overlaps=4, wintype=2, fadetime=0.1):
+        self.anabus = anabus
+        self.sources = sources
+        self.build = build
+        self.size = size
+        self.overlaps = overlaps
+        self.wintype = wintype
+        self.fadetime = fadetime
+        self.pending = None
+        self.fading = []
+        self.pvas = self._subscribe()
+        self.chain = build(*self.pvas)
+        self.output = InputFader(self._signal(self.chain))
+
+    def _signal(self, chain):
+        if isinstance(chain, PyoObjectBase):
+            return chain
+        return chain.output
+
+    def _subscribe(self):
+        return [self.anabus.subscribe(source, self.size, self.overlaps, self.wintype)
+                for source in self.sources]
+
+    def _release(self, pvas, chain):
+        chain.stop()
+        for pva in pvas:
+            self.anabus.unsubscribe(pva)
+
+    def primeTime(self):
+        """
+        Returns the time, in seconds, before a new chain outputs valid frames.
+
+        """
+        sr = self.output.getSamplingRate()
+        return (2 * self.size + 2 * self.output.getBufferSize()) / float(sr)
+
+    def chains(self):
+        """
+        Returns the current chain and the one waiting to replace it.
+
+        """
+        if self.pending is not None:
+            return [self.chain, self.pending[1]]
+        return [self.chain]
+
+    def change(self, size=None, overlaps=None, wintype=None, prime=None):
+        """
+        Builds a new chain with the given parameters and switches to it
+        after `prime` seconds.
+
+        """
+        if size is not None:
+            self.size = size
+        if overlaps is not None:
+            self.overlaps = overlaps
+        if wintype is not None:
+            self.wintype = wintype
+        if prime is None:
+            prime = self.primeTime()
+        if self.pending is not None:
+            # Parameters changed again before the switch.
+            pvas, chain, later = self.pending
+            later.Stop()
+            self._release(pvas, chain)
+        pvas = self._subscribe()
+        chain = self.build(*pvas)
+        self.pending = (pvas, chain, wx.CallLater(int(prime * 1000) + 1, self._switch))
+
+    def _switch(self):
+        pvas, chain, later = self.pending
+        self.pending = None
+        self.output.setInput(self._signal(chain), self.fadetime)
+        old = (self.pvas, self.chain)
+        self.pvas, self.chain = pvas, chain
+        self.fading.append(old)
+        wx.CallLater(int(self.fadetime * 1000) + 50, self._fadeEnd, old)
+
+    def _fadeEnd(self, old):
+        if old in self.fading:
+            self.fading.remove(old)
+            self._release(*old)
+
+    def close(self):
+        """
+        Releases every analysis (the module is about to be destroyed).
+
+        """
+        if self.pending is not None:
+            self.pending[2].Stop()
+            self._release(*self.pending[:2])
+            self.pending = None
+        for old in self.fading:
+            self._release(*old)
+        self.fading = []
+        self._release(self.pvas, self.chain)
+        self.anabus.forget(self.sources)
+
+class CurveTable:
+    """
+    DataTable drawn with a DataMultiSlider.
+
+    `setCurve` can be called on every drag event: the events are
+    coalesced and the table is written at most every `interval` seconds,
+    only over the range of bins that changed. Every bin glides toward the
+    drawn curve, with a time constant of `lagtime` seconds, to avoid
+    zipper noise in the spectral processes reading the table.
+
+    """
+    def __init__(self, size=256, lagtime=0.05, interval=0.03):
+        self.size = size
+        self.lagtime = lagtime
+        self.interval = interval
+        self.table = DataTable(size)
+        self.current = [0.0] * size
+        self.target = [0.0] * size
+        self.later = None
+
+    def _schedule(self):
+        self.later = wx.CallLater(int(self.interval * 1000), self._step)
+
+    def setCurve(self, values):
+        self.target = [float(x) for x in values[:self.size]]
+        if self.later is None:
+            self._schedule()
+
+    def _step(self):
+        coeff = 1.0
+        if self.lagtime > 0:
+            coeff = 1.0 - math.exp(-self.interval / self.lagtime)
+        first = last = None
+        for i in range(self.size):
+            diff = self.target[i] - self.current[i]
+            if diff == 0:
+                continue
+            if abs(diff) < 1e-4 * (1 + abs(self.target[i])):
+                self.current[i] = self.target[i]
+            else:
+                self.current[i] += diff * coeff
+            if first is None:
+                first = i
+            last = i
+        if first is None:
+            # The table has reached the curve.
+            self.later = None
+            return
+        if last - first >= self.size // 4:
+            self.table.replace(self.current)
+        else:
+            for i in range(first, last + 1):
+                self.table.put(self.current[i], i)
+        self._schedule()
+
+    def stop(self):
+        if self.later is not None:
+            self.later.Stop()
+            self.later = None
+
+def vocoderBands(sr, bands, freq, spread):
+    """
+    Returns the number of bands, among the first `bands`, centered below
+    the Nyquist frequency.
+
+    """
+    nyquist = sr * 0.5
+    if freq >= nyquist:
+        return 0
+    count = int(pow(nyquist / freq, 1.0 / spread))
+    while count > 0 and freq * pow(count, spread) >= nyquist:
+        count -= 1
+    return min(bands, count)
+
+def vocoderSize(sr, bands, freq, spread):
+    """
+    Returns the FFT size giving at least two bins between the two
+    closest bands of an FFTVocoder (at most VOCODER_MAX_FFT_SIZE).
+
+    """
+    bands = vocoderBands(sr, bands, freq, spread)
+    if bands < 2:
+        spacing = freq
+    else:
+        # The spacing of the bands only grows or only shrinks with their
+        # number, the closest bands are the first or the last two.
+        spacing = min(freq * (pow(2, spread) - 1),
+                      freq * (pow(bands, spread) - pow(bands - 1, spread)))
+    size = 64
+    while size < VOCODER_MAX_FFT_SIZE and sr / size > spacing * 0.5:
+        size *= 2
+    return size
+
+@functools.lru_cache(maxsize=32)
+def vocoderShape(sr, size, bands, freq, spread, q):
+    """
+    Returns the weight of every bin (0 to Nyquist) of an FFTVocoder, as a
+    list. Every bin is weighted by the response of the nearest band.
+
+    """
+    width = sr / size
+    bands = vocoderBands(sr, bands, freq, spread)
+    if bands == 0:
+        return [0.0] * (size // 2 + 1)
+    if FOUND_NUMPY:
+        centers = freq * numpy.arange(1, bands + 1) ** spread
+        qs = numpy.minimum(q, centers / width)
+        f = numpy.maximum(numpy.arange(size // 2 + 1), 0.5)[:, None] * width
+        x = qs * (f / centers - centers / f)
+        return (1.0 / numpy.sqrt(1.0 + x * x)).max(axis=1).tolist()
+    centers = []
+    for n in range(1, bands + 1):
+        center = freq * pow(n, spread)
+        centers.append((center, min(q, center / width)))
+    values = []
+    for i in range(size // 2 + 1):
+        f = max(i, 0.5) * width
+        gain = 0.0
+        for center, bq in centers:
+            x = bq * (f / center - center / f)
+            gain = max(gain, 1.0 / math.sqrt(1.0 + x * x))
+        values.append(gain)
+    return values
+
+class FFTVocoder:
+    """
+    Channel vocoder computed in the frequency domain.
+
+    The magnitudes of `input2` (the excitation) are multiplied by the
+    smoothed magnitudes of `input` (the spectral envelope) and keep the
+    phases of the excitation. `slope`, between 0 and 1, is the time
+    response of the envelope (higher is more accurate).
+
+    The bands are placed as in pyo's Vocoder: band `n` (from 1) is
+    centered on `freq * n**spread` and its bandwidth is its frequency
+    divided by `q`. Every bin is weighted by the response of the nearest
+    band, a resonant band-pass never narrower than a bin, so only the
+    frequencies around the bands pass. The envelope keeps the resolution
+    of the bins instead of being averaged over each band. The bands above
+    Nyquist are left out.
+
+    The FFT size is given by `vocoderSize` when the vocoder is created
+    and never changes: when the bands need another size, a new vocoder
+    is built (see SpectralSwitcher). The cost hardly depends on the
+    number of bands.
+
+    """
+    def __init__(self, input, input2, bands=128, freq=100, spread=1.2, q=20, slope=0.5,
+                 overlaps=4, wintype=2, mul=1):
+        self.bands = bands
+        self.freq = freq
+        self.spread = spread
+        self.q = q
+        self.playing = True
+        self.sr = input.getSamplingRate()
+        self.size = vocoderSize(self.sr, bands, freq, spread)
+        self.fin = FFT(input, self.size, overlaps, wintype)
+        self.fin2 = FFT(input2, self.size, overlaps, wintype)
+        self.pol = CarToPol(self.fin["real"], self.fin["imag"])
+        self.pol2 = CarToPol(self.fin2["real"], self.fin2["imag"])
+        # pyo's FFT gives a full scale sinusoid a magnitude of about 1/4,
+        # whatever the size.
+        self.envelope = Vectral(self.pol["mag"], framesize=self.size, overlaps=overlaps,
+                                up=slope * 0.9 + 0.1, down=slope * 0.9 + 0.1, mul=4)
+        self.shape = DataTable(self.size // 2 + 1)
+        self.weight = TableIndex(self.shape, self.fin["bin"])
+        self.car = PolToCar(self.envelope * self.pol2["mag"] * self.weight, self.pol2["ang"])
+        self.ifft = IFFT(self.car["real"], self.car["imag"], self.size, overlaps, wintype, mul=mul)
+        self.output = self.ifft.mix(1)
+        self.objects = [self.fin, self.fin2, self.pol, self.pol2, self.envelope, self.weight,
+                        self.car, self.ifft, self.output]
+        self._shape()
+
+    def _shape(self):
+        self.shape.replace(vocoderShape(self.sr, self.size, self.bands, self.freq, self.spread, self.q))
+
+    def setBands(self, bands):
+        self.bands = bands
+        if self.playing:
+            self._shape()
+
+    def setFreq(self, x):
+        self.freq = x
+        if self.playing:
+            self._shape()
+
+    def setSpread(self, x):
+        self.spread = x
+        if self.playing:
+            self._shape()
+
+    def setQ(self, x):
+        self.q = x
+        if self.playing:
+            self._shape()
+
+    def play(self):
+        # The band shape is only kept up to date while playing.
+        self._shape()
+        self.playing = True
+        for obj in self.objects:
+            obj.play()
+
+    def stop(self):
+        self.playing = False
+        for obj in self.objects:
+            obj.stop()
+
+class DisplaySpectrum(Spectrum):
+    """
+    Spectrum analyser whose number of active channels can be changed.
+
+    The object is created with the maximum number of channels. Channels
+    above `setActiveChannels` are stopped, so they don't compute any FFT,
+    and are left out of the points sent to the display.
+
+    """
+    def __init__(self, input, size=1024, wintype=2, function=None):
+        self._active = len(input)
+        Spectrum.__init__(self, input, size, wintype, function)
+
+    def setActiveChannels(self, num):
+        self._active = max(1, min(num, len(self._base_objs)))
+        for i, obj in enumerate(self._base_objs):
+            if i < self._active:
+                obj.play()
+            else:
+                obj.stop()
+
+    def refreshView(self):
+        self.points = [obj.display() for obj in self._base_objs[:self._active]]
+        if self._function is not None:
+            self._function(self.points)
+        if self.viewFrame is not None:
+            self.viewFrame.update(self.points)
+
+class DisplayScope(Scope):
+    """
+    Scope whose number of active channels can be changed.
+
+    See DisplaySpectrum. The first channel, which triggers the display
+    refresh, is always active.
+
+    """
+    def __init__(self, input, length=0.05, gain=0.67, function=None):
+        self._active = len(input)
+        Scope.__init__(self, input, length, gain, function)
+
+    def setActiveChannels(self, num):
+        self._active = max(1, min(num, len(self._base_objs)))
+        for i, obj in enumerate(self._base_objs):
+            if i < self._active:
+                obj.play()
+            else:
+                obj.stop()
+
+    def refreshView(self):
+        self.points = [obj.display() for obj in self._base_objs[:self._active]]
+        if self.viewFrame is not None:
+            self.viewFrame.update(self.points)
+        if self._function is not None:
+            self._function(self.points)
+
+class MultiResSpectrum:
+    """
+    Multi-resolution spectrum analyser.
+
+    The frequency range is split in octave bands. The highest band (from
+    sr/8 to Nyquist) is analysed at full sampling rate and every lower
+    octave is analysed by its own Spectrum object running in a downsampling
+    block (factor 2, 4, 8, ...) with the same FFT size. Each level thus has
+    twice the frequency resolution of the one above it, which is roughly a
+    constant-Q analysis. The levels form a pyramid: the signal of a level
+    is the signal of the level above it, low-pass filtered at its own
+    rate and decimated by 2, so the filter and the FFTs of a level cost
+    half as much as the ones above it: all the levels together compute
+    less than twice the frames of a single one. The last level covers everything
+    below its octave.
+
+    Every level draws only the pixels of its own band, at the position
+    the band occupies on the display, and the pieces are merged into one
+    curve per channel.
+
+    The object exposes the methods used by PyoGuiSpectrum, so it can be
+    given to its `setAnalyzer` method in place of a Spectrum object.
+
+    """
+    def __init__(self, input, size=1024, wintype=2, levels=5):
+        self._input = input
+        self._size = size
+        self._wintype = wintype
+        self._function = None
+        self._chnls = len(input)
+        self._active = self._chnls
+        self._fscaling = 0
+        self._mscaling = 1
+        self._gain = 1
+        self._width = 500
+        self._height = 400
+        self._running = True
+        self.points = None
+
+        server = input.getServer()
+        self._sr = server.getSamplingRate()
+        self._lowfreq = 0
+        self._highfreq = self._sr * 0.5
+
+        # Levels are ordered from the lowest to the highest band.
+        self._factors = [2**i for i in reversed(range(levels))]
+        self._chains = []
+        self._spectrums = []
+        self._offsets = [0] * levels
+        self._visible = [True] * levels
+        signal = input
+        lowpass = None
+        for factor in reversed(self._factors):
+            if factor == 1:
+                chain = []
+            else:
+                # Decimation by 2 of the filtered signal of the level above:
+                # held at full rate (upsampling by the previous factor, the
+                # server still knows it), then one sample out of `factor`
+                # is kept in the new block.
+                held = lowpass if factor == 2 else Resample(lowpass, mode=1)
+                server.beginResamplingBlock(-factor)
+                signal = Resample(held, mode=1)
+                chain = [lowpass, signal] if held is lowpass else [lowpass, held, signal]
+            spec = Spectrum(signal, size, wintype, function=self._dummy)
+            # Levels are read by our own timer.
+            spec.poll(False)
+            if factor != self._factors[0]:
+                # Anti-aliasing filter of the next level, at 3/4 of its Nyquist.
+                lowpass = Biquadx(signal, freq=self._sr / factor * 0.1875, q=0.707, stages=4)
+            if factor != 1:
+                server.endResamplingBlock()
+            self._chains.insert(0, chain)
+            self._spectrums.insert(0, spec)
+
+        self._timer = Pattern(self.refreshView, 0.05).play()
+        self._layout()
+
+    def _dummy(self, *args):
+        pass
+
+    def __len__(self):
+        return self._chnls
+
+    def _bandEdges(self, level):
+        factor = self._factors[level]
+        if factor == 1:
+            high = self._sr * 0.5
+        else:
+            high = self._sr / factor * 0.25
+        if level == 0:
+            low = 0
+        else:
+            low = self._sr / factor * 0.125
+        return low, high
+
+    def _freqToPixel(self, freq):
+        if self._fscaling:
+            lf = math.log10(max(self._lowfreq, 20))
+            hf = math.log10(self._highfreq)
+            return (math.log10(max(freq, 20)) - lf) / (hf - lf) * self._width
+        else:
+            return (freq - self._lowfreq) / (self._highfreq - self._lowfreq) * self._width
+
+    def _pixelToFreq(self, pixel):
+        if self._fscaling:
+            lf = math.log10(max(self._lowfreq, 20))
+            hf = math.log10(self._highfreq)
+            return pow(10, lf + pixel / self._width * (hf - lf))
+        else:
+            return self._lowfreq + pixel / self._width * (self._highfreq - self._lowfreq)
+
+    def _layout(self):
+        if self._highfreq <= self._lowfreq:
+            return
+        for level, spec in enumerate(self._spectrums):
+            low, high = self._bandEdges(level)
+            low = max(low, self._lowfreq)
+            high = min(high, self._highfreq)
+            visible = False
+            if high > low:
+                x1 = int(round(self._freqToPixel(low)))
+                x2 = int(round(self._freqToPixel(high)))
+                if x2 > x1:
+                    visible = True
+                    sr = self._sr / self._factors[level]
+                    spec.setFscaling(self._fscaling)
+                    spec.setMscaling(self._mscaling)
+                    spec.setWidth(x2 - x1)
+                    spec.setHeight(self._height)
+                    spec.setLowbound(min(self._pixelToFreq(x1) / sr, 0.5))
+                    spec.setHighbound(min(self._pixelToFreq(x2) / sr, 0.5))
+                    self._offsets[level] = x1
+            self._visible[level] = visible
+        self._activate()
+
+    def _activate(self):
+        for level, spec in enumerate(self._spectrums):
+            # A level feeds every level below it.
+            needed = self._running and True in self._visible[:level + 1]
+            for i in range(self._chnls):
+                if needed and i < self._active:
+                    if self._visible[level]:
+                        spec[i].play()
+                    else:
+                        spec[i].stop()
+                    for obj in self._chains[level]:
+                        obj[i].play()
+                else:
+                    spec[i].stop()
+                    for obj in self._chains[level]:
+                        obj[i].stop()
+
+    def play(self):
+        self._running = True
+        self._activate()
+        self._timer.play()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._activate()
+        self._timer.stop()
+        return self
+
+    def setActiveChannels(self, num):
+        self._active = max(1, min(num, self._chnls))
+        self._activate()
+
+    def setFunction(self, function):
+        self._function = function
+
+    def refreshView(self):
+        w, h = self._width, self._height
+        points = [[(0, h)] for i in range(self._active)]
+        for level, spec in enumerate(self._spectrums):
+            if not self._visible[level]:
+                continue
+            offset = self._offsets[level]
+            for i in range(self._active):
+                pts = spec[i].display()
+                points[i].extend([(x + offset, y) for x, y in pts[1:-1]])
+        for chnl in points:
+            chnl.append((w, h))
+        self.points = points
+        if self._function is not None:
+            self._function(self.points)
+
+    def setSize(self, x):
+        self._size = x
+        for spec in self._spectrums:
+            spec.setSize(x)
+
+    def setWinType(self, x):
+        self._wintype = x
+        for spec in self._spectrums:
+            spec.setWinType(x)
+
+    def setGain(self, x):
+        self._gain = x
+        for spec in self._spectrums:
+            spec.setGain(x)
+
+    def setLowFreq(self, x):
+        self._lowfreq = x
+        self._layout()
+
+    def setHighFreq(self, x):
+        self._highfreq = x
+        self._layout()
+
+    def setLowbound(self, x):
+        self.setLowFreq(x * self._sr)
+        return self._lowfreq
+
+    def setHighbound(self, x):
+        self.setHighFreq(x * self._sr)
+        return self._highfreq
+
+    def setWidth(self, x):
+        self._width = x
+        self._layout()
+
+    def setHeight(self, x):
+        self._height = x
+        self._layout()
+
+    def setFscaling(self, x):
+        self._fscaling = x
+        self._layout()
+
+    def setMscaling(self, x):
+        self._mscaling = x
+        self._layout()
+
+    @property
+    def size(self):
+        """int. FFT size of every level."""
+        return self._size
+    @size.setter
+    def size(self, x): self.setSize(x)
+
+    @property
+    def wintype(self):
+        """int. Window type of every level."""
+        return self._wintype
+    @wintype.setter
+    def wintype(self, x): self.setWinType(x)
@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with pyo-tools. If not, see <http://www.gnu.org/licenses/>.
 import math
-from pyo64 import *
+from .engine import *
 
 class DSPDemoBLOsc(PyoObject):
     """
@@ -0,0 +1,329 @@
+"""
+Offline benchmark of every module.
+
+Each module of MODULES is built against each InputPanel source and a
+fixed duration is rendered with pyo's offline server, using fixed random
+seeds. The sound file source, and the modules playing their own sound
+files, play the bundled impulse response (IRMediumHallStereo.wav).
+Every case runs in its own process so that the peak memory is measured
+independently. The real-time factor is the rendering time divided by
+the rendered duration (lower is faster).
+
+Run from the application folder:
+
+    python -m Resources.benchmark [--baseline benchmark-baseline.json]
+
+With --precision single double, every case is rendered with both audio
+engines (see engine.py) and the single precision results get the ratio
+of the double precision real-time factor to their own (speedup).
+
+Results are written as JSON. When a baseline file exists, every case is
+compared to it and the command exits with status 1 if a case is slower
+than the baseline by more than the tolerance. Use --save-baseline to
+replace the baseline by the new results.
+
+The branch profiler of the application (see instrument.py) runs one case
+with --state (the controls of the running module, saved by saveState)
+and --branches: the cost of each branch of the module is measured by
+rendering again with the branch, and every object it is computed from,
+stopped. Frozen builds start the application's executable with
+WORKER_FLAG as first argument, dspdemo.py hands the rest to `main`.
+
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tempfile
+import subprocess
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+RESULT_PREFIX = "BENCHMARK_RESULT "
+
+WORKER_FLAG = "--benchmark"
+
+def peakMemory():
+    """
+    Returns the peak resident memory of the process, in kilobytes.
+
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return peak
+
+def render(server, dur, path):
+    """
+    Renders `dur` seconds with the offline server and returns the
+    real-time factor.
+
+    """
+    server.recordOptions(dur=dur, filename=path)
+    start = time.time()
+    server.start()
+    return (time.time() - start) / dur
+
+def runCase(modindex, srcindex, dur, sr, bufsize, seed, state=None, branches=False):
+    """
+    Renders one module with one source and returns the measurements.
+
+    `state` (saveState) is replayed on the module. With `branches`, the
+    cost of each branch is added to the measurements.
+
+    Must be called in a fresh process.
+
+    """
+    import wx
+    import threading
+    from .engine import Server, Mix, PyoObject, PRECISION
+    from .constants import RESOURCES_PATH, AUDIO_NCHNLS
+    from .modules import MODULES
+    from .analysis import AnalysisBus
+    from .preanalysis import PreAnalysis
+    from .instrument import moduleObjects, countStreams, moduleBranches, branchObjects
+    from .widgets import restoreState
+
+    class BenchmarkFrame(wx.Frame):
+        # Stands in for the MainFrame: modules look for `server` and
+        # `anabus` on their top-level parent.
+        def __init__(self, server):
+            wx.Frame.__init__(self, None)
+            self.server = server
+            self.anabus = AnalysisBus()
+            self.panel = wx.Panel(self)
+
+        def build(self, cls):
+            module = cls(self.panel)
+            if hasattr(module, "inputpanel"):
+                panel = module.inputpanel
+                if srcindex == 2:
+                    panel.soundtable.setSound(soundpath)
+                    panel.soundfile.freq = panel.soundtable.getRate()
+                    panel.soundfile.loop = 1
+                    panel.soundfile.play()
+                panel.setSource(srcindex, 0)
+            module.processing()
+            return module
+
+        def loadSound(self, module):
+            # The modules playing their own sound files are silent until
+            # a file is loaded and played.
+            for name in ["loadSoundfile", "loadSoundfile2"]:
+                if hasattr(module, name):
+                    getattr(module, name)(soundpath)
+            for name in ["onPlaySoundfile", "onPlay"]:
+                if hasattr(module, name):
+                    evt = wx.CommandEvent()
+                    evt.SetInt(1)
+                    getattr(module, name)(evt)
+
+    soundpath = os.path.join(RESOURCES_PATH, "IRMediumHallStereo.wav")
+    cls = MODULES[modindex]
+    result = {"module": cls.name, "source": None, "precision": PRECISION}
+
+    app = wx.App(False)
+    random.seed(seed)
+    server = Server(sr, AUDIO_NCHNLS, bufsize, duplex=0, audio="offline")
+    server.setGlobalSeed(seed)
+    server.boot()
+    handle, path = tempfile.mkstemp(suffix=".wav")
+    os.close(handle)
+    server.recordOptions(dur=dur, filename=path)
+
+    frame = BenchmarkFrame(server)
+    start = time.time()
+    module = frame.build(cls)
+    result["build_time"] = round(time.time() - start, 4)
+    frame.loadSound(module)
+    if state is not None:
+        restoreState(module, state)
+    # The spectral analyses of the sound files are started and applied
+    # by wx.CallAfter, there is no main loop.
+    app.ProcessPendingEvents()
+    for thread in threading.enumerate():
+        if isinstance(thread, PreAnalysis):
+            thread.join()
+    app.ProcessPendingEvents()
+    objects = moduleObjects(module)
+    if hasattr(module, "inputpanel"):
+        result["source"] = module.inputpanel.sources[srcindex]
+    elif srcindex > 0:
+        result["skip"] = True
+        return result
+    frame.output = Mix(module.output, 2).out()
+    if hasattr(module, "onStart"):
+        module.onStart()
+    result["objects"] = len(objects)
+    result["streams"] = countStreams(objects.values())
+
+    rtf = render(server, dur, path)
+    result["render_time"] = round(rtf * dur, 4)
+    result["rtf"] = round(rtf, 5)
+    result["peak_memory_kb"] = peakMemory()
+
+    if branches:
+        result["branches"] = {}
+        for name, obj in moduleBranches(module):
+            stopped = [o for o in branchObjects(obj) if isinstance(o, PyoObject) and o.isPlaying()]
+            for o in stopped:
+                o.stop()
+            result["branches"][name] = round(max(0.0, rtf - render(server, dur, path)), 5)
+            for o in stopped:
+                o.play()
+
+    server.shutdown()
+    os.remove(path)
+    frame.Destroy()
+    return result
+
+def runAll(args):
+    from .modules import MODULES
+    from .modules.inputpanel import InputPanel
+    results = []
+    for modindex, cls in enumerate(MODULES):
+        if args.modules and not any([m.lower() in cls.name.lower() for m in args.modules]):
+            continue
+        for srcindex in range(len(InputPanel.sources)):
+            skip = False
+            for precision in args.precision:
+                cmd = [sys.executable, "-m", "Resources.benchmark", "--case",
+                       str(modindex), str(srcindex), "--dur", str(args.dur),
+                       "--sr", str(args.sr), "--bufsize", str(args.bufsize),
+                       "--seed", str(args.seed)]
+                env = dict(os.environ, DSP_DEMO_PRECISION=precision)
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                        universal_newlines=True, env=env)
+                out, err = proc.communicate()
+                result = None
+                for line in out.splitlines():
+                    if line.startswith(RESULT_PREFIX):
+                        result = json.loads(line[len(RESULT_PREFIX):])
+                if result is None:
+                    lines = err.strip().splitlines()
+                    result = {"module": cls.name, "source": InputPanel.sources[srcindex],
+                              "precision": precision,
+                              "error": lines[-1] if lines else "returncode %d" % proc.returncode}
+                if result.get("skip"):
+                    skip = True
+                    break
+                print("%-60s %-24s %-6s %s" % (result["module"], result["source"], precision,
+                                               "rtf %.4f" % result["rtf"] if "rtf" in result else "ERREUR"))
+                results.append(result)
+            if skip:
+                break
+    return results
+
+def precisionSpeedups(results):
+    """
+    Adds to the single precision results the ratio of the double
+    precision real-time factor (and peak memory) to their own.
+
+    """
+    double = dict([((r["module"], r["source"]), r) for r in results
+                   if r.get("precision", "double") == "double"])
+    for result in results:
+        if result.get("precision") != "single" or "rtf" not in result:
+            continue
+        ref = double.get((result["module"], result["source"]))
+        if ref is None or "rtf" not in ref:
+            continue
+        if result["rtf"] > 0:
+            result["speedup"] = round(ref["rtf"] / result["rtf"], 3)
+        if result.get("peak_memory_kb") and ref.get("peak_memory_kb"):
+            result["memory_ratio"] = round(result["peak_memory_kb"] / float(ref["peak_memory_kb"]), 3)
+        print("%-60s %-24s single x%.2f" % (result["module"], result["source"],
+                                            result.get("speedup", 0)))
+
+def compare(results, baseline, tolerance):
+    """
+    Compares results to a baseline and returns the list of regressions.
+
+    """
+    def key(r):
+        return (r["module"], r["source"], r.get("precision", "double"))
+    reference = dict([(key(r), r) for r in baseline["results"]])
+    regressions = []
+    for result in results:
+        ref = reference.get(key(result))
+        if ref is None or "rtf" not in ref or "rtf" not in result:
+            continue
+        for metric in ["rtf", "build_time", "peak_memory_kb"]:
+            if ref.get(metric) and result.get(metric) is not None:
+                result[metric + "_ratio"] = round(result[metric] / float(ref[metric]), 3)
+        if result.get("rtf_ratio", 0) > 1 + tolerance:
+            regressions.append(result)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DSPDemo offline benchmark.")
+    parser.add_argument("--dur", type=float, default=10, help="Rendered duration in seconds.")
+    parser.add_argument("--sr", type=int, default=44100)
+    parser.add_argument("--bufsize", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--precision", nargs="+", choices=["single", "double"], default=["double"],
+                        help="Audio engine(s) to benchmark.")
+    parser.add_argument("--modules", nargs="*", help="Only modules whose name contains one of these strings.")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", default="benchmark-baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed slowdown of the real-time factor (0.1 = 10%%).")
+    parser.add_argument("--case", type=int, nargs=2, help=argparse.SUPPRESS)
+    parser.add_argument("--state", help=argparse.SUPPRESS)
+    parser.add_argument("--branches", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case is not None:
+        state = None
+        if args.state is not None:
+            with open(args.state, "r") as f:
+                state = json.load(f)
+        result = runCase(args.case[0], args.case[1], args.dur, args.sr, args.bufsize, args.seed,
+                         state, args.branches)
+        print(RESULT_PREFIX + json.dumps(result))
+        return 0
+
+    results = runAll(args)
+    if len(args.precision) > 1:
+        precisionSpeedups(results)
+    report = {"meta": {"date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "platform": platform.platform(),
+                       "python": platform.python_version(),
+                       "duration": args.dur,
+                       "sampling_rate": args.sr,
+                       "buffer_size": args.bufsize,
+                       "seed": args.seed,
+                       "precision": args.precision},
+              "results": results}
+
+    status = 0
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        report["regressions"] = [[r["module"], r["source"], r["precision"], r["rtf_ratio"]]
+                                 for r in regressions]
+        for r in regressions:
+            print("REGRESSION: %s / %s (%s): rtf x%.2f" % (r["module"], r["source"],
+                                                          r["precision"], r["rtf_ratio"]))
+        if regressions:
+            status = 1
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
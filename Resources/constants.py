@@ -13,8 +13,16 @@ else:
 if not os.path.isdir(RESOURCES_PATH) and sys.platform == "win32":
     RESOURCES_PATH = os.path.join(os.getenv("ProgramFiles"), "DSPDemo", "Resources")
 
+CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".dspdemo")
+CONFIG_FILE = os.path.join(CONFIG_PATH, "config.json")
+
 WITH_VIDEO_CAPTURE = False
 
+LATENCY_FIRST_ID = 90
+AUTO_LATENCY_ID = 94
+AUDIO_SETTINGS_ID = 95
+EXPORT_STATS_ID = 96
+PROFILE_BRANCHES_ID = 97
 SOURCE_DOC_ID = 98
 MODULE_DOC_ID = 99
 MODULE_FIRST_ID = 100
@@ -31,6 +39,64 @@ OVERLAPS = ["2", "4", "8", "16", "32"]
 
 AUDIO_NCHNLS = 2
 AUDIO_BUFSIZE = 512
+AUDIO_SAMPLING_RATES = [22050, 44100, 48000, 88200, 96000]
+AUDIO_BUFFER_SIZES = [64, 128, 256, 512, 1024, 2048, 4096]
+# Latency profiles: range of buffer sizes allowed to the automatic tuning,
+# initial buffer size and maximum CPU load at which the buffer size can
+# be lowered.
+LATENCY_PROFILES = ["low", "balanced", "safe"]
+LATENCY_PROFILE_SETTINGS = {
+    "low": {"name": "Latence faible", "min": 64, "max": 512, "start": 128, "headroom": 0.5},
+    "balanced": {"name": "Équilibré", "min": 256, "max": 2048, "start": 512, "headroom": 0.4},
+    "safe": {"name": "Sécuritaire", "min": 1024, "max": 4096, "start": 2048, "headroom": 0.3},
+}
+AUDIO_LATENCY_PROFILE = "balanced"
+# Upper limits of the slices of the audio callback's histogram, in
+# fractions of the buffer duration. Loads above the last limit are late.
+TIMING_BINS = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+TIMING_LOG_FILE = os.path.join(CONFIG_PATH, "audio-timing.log")
+# Pre-analysed spectral frames of sound files ("float16" halves the
+# files, needs numpy).
+SPECTRAL_CACHE_PATH = os.path.join(CONFIG_PATH, "spectral-cache")
+SPECTRAL_CACHE_FORMAT = "float32"
+# Memory given to the frames of one pre-analysed sound, in bytes. The
+# frames are played at the engine's precision, longer sounds are cut.
+SPECTRAL_FRAMES_MEMORY = 128 * 1024 * 1024
+# Longest delay of the spectral delay lines, in seconds, at 4 overlaps in
+# double precision. The memory of such a line is kept when the overlaps
+# or the precision change: the single precision engine or fewer overlaps
+# give longer delays, more overlaps never a shorter one.
+SPECTRAL_DELAY_TIME = 2.0
+# Above this number of bands, the vocoder is computed with FFTs.
+VOCODER_MAX_FILTER_BANDS = 64
+# Largest FFT of the spectral vocoder, whose size is set by the spacing
+# of its closest bands.
+VOCODER_MAX_FFT_SIZE = 8192
+# Granulation: maximum number of overlapping grains per channel and
+# CPU load (fraction of the buffer duration) above which the density of
+# the grains is lowered.
+GRAIN_MAX_OVERLAPS = 256
+GRAIN_CPU_BUDGET = 0.6
+# HRTF sets read from SOFA files (needs h5py): cache of their spectra,
+# smallest FFT size of the binaural renderer and crossfade time between
+# two directions of a source.
+HRTF_CACHE_PATH = os.path.join(CONFIG_PATH, "hrtf-cache")
+HRTF_FFT_SIZE = 512
+HRTF_FADE_TIME = 0.05
+# Dynamics: attack and release times of the level detector, in seconds,
+# and longest lookahead (the delay line is allocated for it).
+DYNAMICS_DETECTOR = (0.001, 0.05)
+DYNAMICS_MAX_LOOKAHEAD = 0.02
+# The "null" host computes the audio without any device (for CI).
+if sys.platform.startswith("win"):
+    AUDIO_HOSTS = ["mme", "directsound", "asio", "wasapi", "wdm-ks", "null"]
+    AUDIO_DEFAULT_HOST = "directsound"
+elif sys.platform.startswith("linux"):
+    AUDIO_HOSTS = ["alsa", "oss", "pulse", "jack", "null"]
+    AUDIO_DEFAULT_HOST = "alsa"
+else:
+    AUDIO_HOSTS = ["core audio", "jack", "soundflower", "null"]
+    AUDIO_DEFAULT_HOST = "core audio"
 if WITH_VIDEO_CAPTURE:
     AUDIO_DUPLEX = 1
 else:
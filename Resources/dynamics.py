@@ -0,0 +1,87 @@
+"""
+Dynamics processing shared by the gate and compressor modules.
+
+"""
+from .engine import *
+from .constants import DYNAMICS_DETECTOR, DYNAMICS_MAX_LOOKAHEAD
+
+class DynamicsEngine:
+    """
+    Gate or compressor for one or several bands.
+
+    Every stream of `input` is a band. Each step of the processing is a
+    single object with one stream per band, whatever the number of
+    bands: the level of the bands is followed once (Follower2, with the
+    fixed times of DYNAMICS_DETECTOR), converted to dB, and the gain
+    reduction is computed from it then smoothed with the attack (`rise`)
+    and release (`fall`) times.
+
+    With `mode` "compress", the part of the level above `thresh` is
+    divided by `ratio`. With `mode` "gate", the band is attenuated by
+    `depth` dB while its level is under `thresh`.
+
+    The detector reads the input as it comes while the audio is delayed
+    by `lookahead` seconds (up to `maxlookahead`, the delay line is
+    allocated once), so the gain moves before the transients arrive.
+
+    `reduction` is the gain reduction of every band, in dB (positive),
+    and `getReduction()` its current values, for the meters.
+
+    The parameters may be lists, one value per band (needed to set the
+    bands separately with `setBand`).
+
+    """
+    def __init__(self, input, mode="compress", thresh=-20, ratio=4, rise=0.01, fall=0.1,
+                 gain=0, lookahead=0, maxlookahead=DYNAMICS_MAX_LOOKAHEAD, depth=90, mul=1):
+        self.mode = mode
+        self.thresh = SigTo(thresh, 0.05)
+        self.ratio = SigTo(ratio, 0.05)
+        self.rise = SigTo(rise, 0.05)
+        self.fall = SigTo(fall, 0.05)
+        self.gain = SigTo(gain, 0.05)
+        self.maxlookahead = maxlookahead
+        self.delay = SDelay(input, delay=min(lookahead, maxlookahead), maxdelay=maxlookahead)
+
+        self.follower = Follower2(input, *DYNAMICS_DETECTOR)
+        self.level = AToDB(self.follower)
+        if mode == "gate":
+            self.target = (self.level < self.thresh) * depth
+            # The gate opens (the reduction falls) with the attack time.
+            self.reduction = Port(self.target, risetime=self.fall, falltime=self.rise)
+        else:
+            self.target = Clip(self.level - self.thresh, 0, 200, mul=1 - 1 / self.ratio)
+            self.reduction = Port(self.target, risetime=self.rise, falltime=self.fall)
+        self.amp = DBToA(self.gain - self.reduction)
+        self.output = Sig(self.delay, mul=self.amp * mul)
+
+    def setThresh(self, x):
+        self.thresh.value = x
+
+    def setRatio(self, x):
+        self.ratio.value = x
+
+    def setRise(self, x):
+        self.rise.value = x
+
+    def setFall(self, x):
+        self.fall.value = x
+
+    def setGain(self, x):
+        self.gain.value = x
+
+    def setBand(self, band, param, x):
+        """
+        Sets the parameter `param` ("thresh", "ratio", "rise", "fall"
+        or "gain") of one band only.
+
+        """
+        obj = getattr(self, param)
+        values = list(obj.value)
+        values[band] = x
+        obj.value = values
+
+    def setLookahead(self, x):
+        self.delay.delay = min(x, self.maxlookahead)
+
+    def getReduction(self):
+        return self.reduction.get(all=True)
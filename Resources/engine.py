@@ -0,0 +1,55 @@
+"""
+Audio engine.
+
+Every file imports pyo through this module (`from .engine import *`) so
+that the sample precision is chosen in one place, before pyo is imported
+for the first time:
+
+    single: pyo, 32-bit floats. Half the memory of the tables and of
+            the audio buffers, usually faster.
+    double: pyo64, 64-bit floats (default).
+
+The precision comes from the command line (--precision single), or the
+DSP_DEMO_PRECISION environment variable, or the "precision" key of the
+configuration file.
+
+"""
+import os as _os
+import sys as _sys
+import json as _json
+from .constants import CONFIG_FILE as _CONFIG_FILE
+
+PRECISIONS = ["single", "double"]
+
+def _precision():
+    argv = _sys.argv[1:]
+    for i, arg in enumerate(argv):
+        if arg.startswith("--precision="):
+            value = arg.split("=", 1)[1]
+        elif arg == "--precision" and i + 1 < len(argv):
+            value = argv[i + 1]
+        else:
+            continue
+        if value in PRECISIONS:
+            return value
+
+    value = _os.environ.get("DSP_DEMO_PRECISION")
+    if value in PRECISIONS:
+        return value
+
+    try:
+        with open(_CONFIG_FILE, "r") as f:
+            value = _json.load(f).get("precision")
+    except:
+        value = None
+    if value in PRECISIONS:
+        return value
+
+    return "double"
+
+PRECISION = _precision()
+
+if PRECISION == "single":
+    from pyo import *
+else:
+    from pyo64 import *
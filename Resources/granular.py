@@ -0,0 +1,355 @@
+"""
+Granular synthesis engines shared by the granulation modules.
+
+"""
+import math
+import time
+import random
+from .engine import *
+from .constants import GRAIN_MAX_OVERLAPS, GRAIN_CPU_BUDGET
+
+# Grain envelopes, in the order of the menus, and their names.
+ENVELOPES = ["hann", "tukey-0.25", "tukey-0.5", "tukey-0.75", "gaussian",
+             "expo-attack", "expo-decay", "trapezoid"]
+ENVELOPE_NAMES = ["Hanning", "Tukey (25 %)", "Tukey (50 %)", "Tukey (75 %)", "Gaussienne",
+                  "Attaque exponentielle", "Chute exponentielle", "Trapèze"]
+# Envelopes drawn at random by RandomGrainEngine.
+RANDOM_ENVELOPES = ["hann", "tukey-0.5", "gaussian", "expo-decay"]
+
+_envelopes = {}
+
+def _tukey(x, ratio):
+    # `ratio` is the tapered fraction of the window.
+    if x < ratio / 2:
+        return 0.5 - 0.5 * math.cos(2 * math.pi * x / ratio)
+    elif x > 1 - ratio / 2:
+        return 0.5 - 0.5 * math.cos(2 * math.pi * (1 - x) / ratio)
+    return 1.0
+
+def _gaussian(x):
+    edge = math.exp(-0.5 * (0.5 / 0.15) ** 2)
+    return (math.exp(-0.5 * ((x - 0.5) / 0.15) ** 2) - edge) / (1 - edge)
+
+def _expodec(x):
+    # Short linear attack, then an exponential decay reaching 0 at the end.
+    attack = 0.02
+    if x < attack:
+        return x / attack
+    end = math.exp(-5)
+    return (math.exp(-5 * (x - attack) / (1 - attack)) - end) / (1 - end)
+
+def _trapezoid(x):
+    return min(1.0, x / 0.2, (1 - x) / 0.2)
+
+def envelopeShape(name, x):
+    """
+    Returns the value, between 0 and 1, of the envelope `name` at
+    position `x` (0 to 1).
+
+    """
+    if name == "hann":
+        return 0.5 - 0.5 * math.cos(2 * math.pi * x)
+    elif name.startswith("tukey-"):
+        return _tukey(x, float(name[6:]))
+    elif name == "gaussian":
+        return _gaussian(x)
+    elif name == "expo-attack":
+        return _expodec(1 - x)
+    elif name == "expo-decay":
+        return _expodec(x)
+    elif name == "trapezoid":
+        return _trapezoid(x)
+    raise ValueError("Unknown envelope: %s" % name)
+
+def envelopeTable(name, size=8192):
+    """
+    Returns the envelope table `name` of `size` points. Every table is
+    computed once per size, on first use, and shared by every engine.
+
+    """
+    key = (name, size)
+    if key not in _envelopes:
+        values = [envelopeShape(name, i / float(size)) for i in range(size)]
+        _envelopes[key] = DataTable(size, init=values)
+    return _envelopes[key]
+
+def clearEnvelopes():
+    """
+    Forgets the envelope tables (the server is about to be shut down).
+
+    """
+    _envelopes.clear()
+
+class GrainEngine:
+    """
+    Particle granulator whose density follows a CPU budget.
+
+    Particle takes its grains from a preallocated pool (4096 voices),
+    nothing is allocated when a grain starts. On top of it, the number of
+    overlapping grains (density x duration) is capped at `maxgrains` per
+    channel and the density is lowered as long as the audio callback uses
+    more than `budget` of the buffer duration, then raised back slowly
+    when the load goes down.
+
+    `update(load)` must be called regularly from the GUI thread with the
+    current CPU load (0 to 1). `density` is the density actually played,
+    `droprate` the grains per second that were asked for but not played
+    and `dropped` their total while the engine was playing.
+
+    The parameters are those of Particle. If `dur` is a PyoObject, the
+    longest grain duration must be given in `maxdur` to compute the
+    overlap. `env` may be a list of envelope tables: Particle then runs
+    one stream per envelope, each with its share of the density.
+
+    """
+    def __init__(self, table, env, dens=128, pitch=1, pos=0, dur=0.2, dev=0.01, pan=0.5,
+                 chnls=1, maxgrains=GRAIN_MAX_OVERLAPS, budget=GRAIN_CPU_BUDGET, maxdur=None, mul=1):
+        self.dens = dens
+        self.dur = dur if maxdur is None else maxdur
+        self.voices = len(env) if isinstance(env, list) else 1
+        self.maxgrains = maxgrains
+        self.budget = budget
+        self.scale = 1.0
+        self.density = dens
+        self.droprate = 0.0
+        self.dropped = 0.0
+        self.last = None
+        self.effective = SigTo(dens / float(self.voices), 0.25)
+        self.particle = Particle(table, env, dens=self.effective, pitch=pitch, pos=pos, dur=dur,
+                                 dev=dev, pan=pan, chnls=chnls, mul=mul)
+        self.output = self.particle
+        self.update()
+
+    def setEnv(self, x):
+        """
+        Replaces the envelope table(s), without rebuilding Particle.
+
+        """
+        self.particle.env = x
+
+    def setDens(self, x):
+        self.dens = x
+        self.update()
+
+    def setDur(self, x):
+        self.dur = x
+        self.particle.dur = x
+        self.update()
+
+    def capacity(self):
+        """
+        Returns the highest density allowed by `maxgrains` for the
+        current grain duration.
+
+        """
+        return self.maxgrains / max(self.dur, 0.001)
+
+    def update(self, load=None):
+        now = time.time()
+        if load is not None:
+            if load > self.budget:
+                self.scale = max(0.05, self.scale * 0.7)
+            elif load < self.budget * 0.75:
+                self.scale = min(1.0, self.scale * 1.1)
+            if self.last is not None:
+                self.dropped += self.droprate * (now - self.last)
+                self.last = now
+        self.density = min(self.dens, self.capacity()) * self.scale
+        self.droprate = self.dens - self.density
+        self.effective.value = self.density / self.voices
+
+    def play(self):
+        self.last = time.time()
+        self.particle.play()
+
+    def stop(self):
+        self.last = None
+        self.particle.stop()
+
+class ScrubIndex:
+    """
+    Read position of a granulator, in samples, with jumps and random
+    deviations.
+
+    The position moves through the sound at `speed` times its natural
+    speed. `jumpfreq` times per second, it jumps ahead by a tenth of
+    `jump` (0 to 1, relative to the sound's length), coming back on the
+    regular position every ten jumps. A random deviation of up to `rand`
+    (0 to 1) is drawn `randfreq` times per second and `jitter` adds a
+    small noise, in samples. The sum is wrapped in the sound.
+
+    Everything is computed in the audio graph by six objects, chained
+    by their `add` inputs. Every change (`setSound`, `seek`, `reset` and
+    the setters) is queued and the queue is emptied at once by a
+    CallAfter. The CallAfter runs in the audio thread, during the
+    processing of a block, but it is created after the objects of the
+    index and of its granulator, which have already computed that block:
+    they all get the changes from the next block on, so a restart never
+    mixes old and new settings. `playAfter` queues the start of the
+    granulator behind the changes.
+
+    """
+    def __init__(self, dur=1, size=44100, speed=1, jump=0, jumpfreq=8, rand=0, randfreq=8, jitter=50):
+        self.dur = dur
+        self.size = size
+        self.speed = speed
+        self.jitter = jitter
+        self.queue = []
+        self.caller = None
+        self.pending = False
+        self.phasor = Phasor(speed / float(dur))
+        self.jumps = Phasor(jumpfreq / 10., mul=10)
+        self.steps = Floor(self.jumps, mul=jump / 10., add=self.phasor)
+        self.random = Randh(0, rand, freq=randfreq, add=self.steps)
+        self.noise = Noise(jitter / float(size), add=self.random)
+        self.output = Wrap(self.noise, mul=size)
+
+    def _post(self, *messages):
+        # messages are (object, attribute, value) tuples, value None
+        # meaning a call to the object's `attribute` method.
+        self.queue.extend(messages)
+        if not self.pending:
+            self.pending = True
+            self.caller = CallAfter(self._apply, 0)
+
+    def _apply(self):
+        # Called by the audio thread, after the objects created before
+        # the CallAfter have computed the current block.
+        self.pending = False
+        queue, self.queue = self.queue, []
+        for obj, attr, value in queue:
+            if value is None:
+                getattr(obj, attr)()
+            else:
+                setattr(obj, attr, value)
+
+    def _freq(self):
+        return (self.phasor, "freq", self.speed / float(self.dur))
+
+    def setSound(self, dur, size, pos=0):
+        """
+        Adapts the position to a sound of `dur` seconds and `size`
+        samples and restarts it at `pos` (0 to 1).
+
+        """
+        self.dur = dur
+        self.size = size
+        self._post(self._freq(), (self.noise, "mul", self.jitter / float(size)),
+                   (self.output, "mul", size), *self._seek(pos))
+
+    def _seek(self, pos):
+        return [(self.phasor, "phase", pos), (self.phasor, "reset", None), (self.jumps, "reset", None)]
+
+    def seek(self, pos):
+        """
+        Restarts the position, and the jumps, at `pos` (0 to 1).
+
+        """
+        self._post(*self._seek(pos))
+
+    def reset(self):
+        self.seek(0)
+
+    def playAfter(self, obj):
+        """
+        Plays `obj` (anything with a play() method, created before the
+        first change is queued) with the changes queued before.
+
+        """
+        self._post((obj, "play", None))
+
+    def setSpeed(self, x):
+        self.speed = x
+        self._post(self._freq())
+
+    def setJump(self, x):
+        self._post((self.steps, "mul", x / 10.))
+
+    def setJumpFreq(self, x):
+        self._post((self.jumps, "freq", x / 10.))
+
+    def setRand(self, x):
+        self._post((self.random, "max", x))
+
+    def setRandFreq(self, x):
+        self._post((self.random, "freq", x))
+
+class RandomStreams:
+    """
+    Precomputed uniform random values, between -1 and 1, read at audio
+    rate.
+
+    `stream(n)` returns the n-th stream: the same table read with a step
+    of its own, so the streams aren't correlated. Nothing is computed
+    but a table lookup per sample, and Particle only samples the streams
+    when a grain starts.
+
+    """
+    STEPS = [7.31, 13.77, 29.13, 51.59, 97.43, 173.21]
+
+    def __init__(self, size=65536, seed=1234):
+        rnd = random.Random(seed)
+        self.table = DataTable(size, init=[rnd.uniform(-1, 1) for i in range(size)])
+        self.freq = self.table.getSamplingRate() / float(size)
+
+    def stream(self, n, mul=1, add=0):
+        return TableRead(self.table, freq=self.freq * self.STEPS[n], loop=1, interp=1,
+                         mul=mul, add=add).play()
+
+class RandomGrainEngine(GrainEngine):
+    """
+    GrainEngine whose grains get independent parameters.
+
+    When a grain starts, its pitch, position, duration and pan are drawn
+    from RandomStreams, and its envelope from a small set of shared
+    envelope tables. No object is created per grain nor per varied
+    parameter of a grain.
+
+    `pos` is the position in the table, from 0 to 1. The deviations, from
+    0 to 1, are relative to the pitch (`pitchdev`), the table's length
+    (`posdev`), the duration (`durdev`) and the stereo width (`pandev`).
+    `setTableSize` must be called when the table's content changes.
+
+    """
+    def __init__(self, table, envs=None, dens=500, pitch=1, pos=0, dur=0.1, pitchdev=0, posdev=0,
+                 durdev=0, pandev=0, mul=1):
+        if envs is None:
+            envs = [envelopeTable(name) for name in RANDOM_ENVELOPES]
+        self.table = table
+        self.streams = RandomStreams()
+        self.pitchdev = SigTo(pitchdev, 0.05)
+        self.posdev = SigTo(posdev, 0.05)
+        self.basedur = SigTo(dur, 0.05)
+        self.durdev = SigTo(durdev, 0.05)
+        self.pandev = SigTo(pandev, 0.05)
+        self.tablesize = Sig(table.getSize(False))
+
+        self.pitches = pitch * (1 + self.streams.stream(0, mul=self.pitchdev))
+        self.positions = Wrap(pos + self.streams.stream(1, mul=self.posdev), mul=self.tablesize)
+        self.durs = self.basedur * (1 + self.streams.stream(2, mul=self.durdev))
+        self.pans = self.streams.stream(3, mul=self.pandev * 0.5, add=0.5)
+        GrainEngine.__init__(self, table, envs, dens, self.pitches, self.positions, self.durs,
+                             dev=0.5, pan=self.pans, chnls=2, maxdur=dur * (1 + durdev), mul=mul)
+        self.output = self.particle.mix(2)
+
+    def setTableSize(self):
+        self.tablesize.value = self.table.getSize(False)
+
+    def setDur(self, x):
+        self.basedur.value = x
+        self.dur = x * (1 + self.durdev.value)
+        self.update()
+
+    def setPitchDev(self, x):
+        self.pitchdev.value = x
+
+    def setPosDev(self, x):
+        self.posdev.value = x
+
+    def setDurDev(self, x):
+        self.durdev.value = x
+        self.dur = self.basedur.value * (1 + x)
+        self.update()
+
+    def setPanDev(self, x):
+        self.pandev.value = x
@@ -0,0 +1,243 @@
+"""
+HRTF sets and binaural rendering of several sources.
+
+A set of head-related impulse responses (HRIR) is read from a SOFA file
+(AES69, needs h5py and numpy). The spectrum of every measured direction
+is computed once, at the FFT size and sampling rate of the renderer, and
+kept in a cache file named after the file's hash, so a set is only
+analysed the first time it is used.
+
+BinauralRenderer filters its sources in the spectral domain: one FFT
+object analyses every source, the spectra of the directions are read in
+tables shared by all the sources and the filtered spectra of all the
+sources are summed before the inverse FFT, so the scene needs only one
+IFFT per ear, whatever the number of sources.
+
+"""
+import os
+import math
+import time
+import wx
+from .engine import *
+from .constants import HRTF_CACHE_PATH, HRTF_FFT_SIZE, HRTF_FADE_TIME
+from .preanalysis import fileHash
+
+try:
+    import numpy
+    import h5py
+    FOUND_H5PY = True
+except:
+    FOUND_H5PY = False
+
+CACHE_VERSION = 1
+
+def readSofa(path):
+    """
+    Returns the impulse responses (directions x 2 ears x samples), the
+    directions (azimuth and elevation, in degrees, SOFA convention:
+    azimuth counterclockwise from the front) and the sampling rate of a
+    SOFA file.
+
+    """
+    with h5py.File(path, "r") as f:
+        irs = numpy.asarray(f["Data.IR"], dtype=numpy.float64)
+        positions = numpy.asarray(f["SourcePosition"], dtype=numpy.float64)
+        sr = float(numpy.asarray(f["Data.SamplingRate"]).ravel()[0])
+        kind = f["SourcePosition"].attrs.get("Type", b"spherical")
+    if isinstance(kind, bytes):
+        kind = kind.decode("utf-8")
+    if irs.ndim != 3 or irs.shape[1] != 2:
+        raise ValueError("%s: not a two ears HRIR set." % path)
+    if kind.lower() == "cartesian":
+        x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+        azimuths = numpy.degrees(numpy.arctan2(y, x))
+        elevations = numpy.degrees(numpy.arctan2(z, numpy.hypot(x, y)))
+    else:
+        azimuths, elevations = positions[:, 0], positions[:, 1]
+    return irs, numpy.stack([azimuths, elevations], axis=1), sr
+
+def fftSize(length):
+    """
+    Returns the FFT size used for impulse responses of `length` samples:
+    HRTF_FFT_SIZE, or the power of two holding twice the response.
+
+    """
+    size = HRTF_FFT_SIZE
+    while size < 2 * length:
+        size *= 2
+    return size
+
+def hrtfSpectra(irs, irsr, size, sr):
+    """
+    Returns the real and imaginary parts of the responses at the
+    frequencies of the bins of a `size` points FFT at `sr` Hz (the
+    responses keep their timing whatever their own sampling rate).
+    The bins above the Nyquist frequency of the responses are zero.
+
+    """
+    bins = size // 2 + 1
+    freqs = numpy.arange(bins) * sr / float(size)
+    times = numpy.arange(irs.shape[2]) / irsr
+    kernel = numpy.exp(-2j * numpy.pi * numpy.outer(times, freqs))
+    spectra = numpy.dot(irs, kernel)
+    spectra[:, :, freqs > irsr / 2] = 0
+    return spectra.real, spectra.imag
+
+def cacheFile(digest, sr):
+    return os.path.join(HRTF_CACHE_PATH, "%s-%d.npz" % (digest, int(sr)))
+
+class HRTFSet:
+    """
+    Spectra of every direction of a SOFA file, at the sampling rate `sr`.
+
+    `tables[ear][part]` (ear 0 = left, part 0 = real) holds the spectra
+    of the directions one after the other, `bins` values each, so the
+    spectrum of direction `d` starts at `d * bins`.
+
+    """
+    def __init__(self, path, sr):
+        filename = cacheFile(fileHash(path), sr)
+        spectra = self.readCache(filename) if os.path.isfile(filename) else None
+        if spectra is None:
+            irs, directions, irsr = readSofa(path)
+            size = fftSize(irs.shape[2])
+            real, imag = hrtfSpectra(irs, irsr, size, sr)
+            spectra = {"size": size, "directions": directions, "real": real, "imag": imag}
+            self.writeCache(filename, spectra)
+
+        self.path = path
+        self.size = spectra["size"]
+        self.bins = self.size // 2 + 1
+        self.directions = spectra["directions"]
+        self.count = len(self.directions)
+        az = numpy.radians(self.directions[:, 0])
+        el = numpy.radians(self.directions[:, 1])
+        self.vectors = numpy.stack([numpy.cos(el) * numpy.cos(az), numpy.cos(el) * numpy.sin(az),
+                                    numpy.sin(el)], axis=1)
+        self.tables = [[DataTable(self.count * self.bins, init=spectra[part][:, ear, :].ravel().tolist())
+                        for part in ["real", "imag"]] for ear in range(2)]
+
+    def readCache(self, filename):
+        try:
+            with numpy.load(filename) as data:
+                if int(data["version"]) != CACHE_VERSION:
+                    return None
+                return {"size": int(data["size"]), "directions": data["directions"],
+                        "real": data["real"], "imag": data["imag"]}
+        except:
+            return None
+
+    def writeCache(self, filename, spectra):
+        try:
+            if not os.path.isdir(HRTF_CACHE_PATH):
+                os.makedirs(HRTF_CACHE_PATH)
+            tmp = filename + ".tmp.npz"
+            numpy.savez(tmp, version=CACHE_VERSION, size=spectra["size"],
+                        directions=spectra["directions"], real=spectra["real"],
+                        imag=spectra["imag"])
+            os.replace(tmp, filename)
+        except Exception as e:
+            print("HRTF cache not written: %s" % e)
+
+    def nearest(self, azimuth, elevation):
+        """
+        Returns the measured direction closest to `azimuth` (degrees,
+        clockwise, -90 = left) and `elevation` (degrees).
+
+        """
+        az = math.radians(-azimuth)
+        el = math.radians(elevation)
+        target = [math.cos(el) * math.cos(az), math.cos(el) * math.sin(az), math.sin(el)]
+        return int(numpy.argmax(numpy.dot(self.vectors, target)))
+
+class BinauralRenderer:
+    """
+    Binaural rendering of mono sources with an HRTFSet.
+
+    Every source reads the spectrum of the measured direction nearest to
+    its position. It has two slots: a new direction goes in the silent
+    slot and the source crossfades to it in `fade` seconds, so a moving
+    source never switches filters abruptly. A position given during a
+    crossfade is applied when the crossfade is over: a source changes
+    direction at most once every `fade` seconds (the crossfades are
+    driven from the GUI thread), a fast moving source lags behind.
+
+    `output` is the stereo mix of the sources.
+
+    """
+    def __init__(self, inputs, hrtf, overlaps=4, fade=HRTF_FADE_TIME, mul=1):
+        if not isinstance(inputs, list):
+            inputs = [inputs]
+        self.hrtf = hrtf
+        # Every stream of the inputs is a source. FFT would only read the
+        # first stream of each object of a list, so it gets the streams.
+        streams = [stream for obj in inputs for stream in obj]
+        self.count = n = len(streams)
+        self.fade = fade
+        size = hrtf.size
+        self.directions = [0] * n
+        self.offsets = [[0] * n, [0] * n]
+        self.active = [0] * n
+        self.flips = [0.0] * n
+        self.pending = {}
+        self.calls = {}
+
+        self.fin = FFT(streams, size=size, overlaps=overlaps, wintype=2)
+        self.slots = [Sig(self.offsets[0]), Sig(self.offsets[1])]
+        self.weight = SigTo([0.0] * n, time=fade)
+        self.objects = []
+        ears = []
+        for tables in hrtf.tables:
+            parts = []
+            for table in tables:
+                a = TableIndex(table, self.fin["bin"] + self.slots[0])
+                b = TableIndex(table, self.fin["bin"] + self.slots[1])
+                self.objects.extend([a, b])
+                parts.append(a + (b - a) * self.weight)
+            hr, hi = parts
+            real = self.fin["real"] * hr - self.fin["imag"] * hi
+            imag = self.fin["real"] * hi + self.fin["imag"] * hr
+            # Streams are ordered overlap by overlap: reordered source by
+            # source, the mix sums the sources of every overlap.
+            order = [j * n + c for c in range(n) for j in range(overlaps)]
+            real = Mix(Dummy([real[i] for i in order]), voices=overlaps)
+            imag = Mix(Dummy([imag[i] for i in order]), voices=overlaps)
+            ifft = IFFT(real, imag, size=size, overlaps=overlaps, wintype=2)
+            self.objects.extend([real, imag, ifft])
+            ears.append(ifft.mix(1))
+        # The Hann windows of the FFT and the IFFT overlap-add to a gain
+        # of 3/8 per overlap (1.5 at 4 overlaps).
+        self.output = Mix(ears, voices=2, mul=mul * 8.0 / (3 * overlaps))
+
+    def setPosition(self, source, azimuth, elevation):
+        direction = self.hrtf.nearest(azimuth, elevation)
+        remaining = self.flips[source] + self.fade - time.time()
+        if remaining > 0:
+            self.pending[source] = direction
+            if source not in self.calls:
+                self.calls[source] = wx.CallLater(int(remaining * 1000) + 1, self._flush, source)
+        else:
+            self._flip(source, direction)
+
+    def _flush(self, source):
+        del self.calls[source]
+        if source in self.pending:
+            self._flip(source, self.pending.pop(source))
+
+    def _flip(self, source, direction):
+        if direction == self.directions[source]:
+            return
+        slot = 1 - self.active[source]
+        self.directions[source] = direction
+        self.active[source] = slot
+        self.flips[source] = time.time()
+        self.offsets[slot][source] = direction * self.hrtf.bins
+        self.slots[slot].value = self.offsets[slot]
+        self.weight.value = [float(s) for s in self.active]
+
+    def stop(self):
+        for call in self.calls.values():
+            call.Stop()
+        self.calls = {}
+        for obj in [self.fin, self.output] + self.objects:
+            obj.stop()
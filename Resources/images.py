@@ -1,3426 +1,42 @@
-#----------------------------------------------------------------------
-# This file was generated by /usr/local/bin/img2py
-#
-from wx.lib.embeddedimage import PyEmbeddedImage
+"""
+Application images.
 
-DSPDemo_Icon = PyEmbeddedImage(
-    b'iVBORw0KGgoAAAANSUhEUgAAAf4AAAH+CAYAAAB9b2wlAAAABmJLR0QA/wD/AP+gvaeTAAAA'
-    b'CXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4gEEEBwtmtQMlgAAAB1pVFh0Q29tbWVudAAA'
-    b'AAAAQ3JlYXRlZCB3aXRoIEdJTVBkLmUHAAAgAElEQVR42uy9edx1aVUduNcpStSgjUOKaIsS'
-    b'IiYKqQJkKEopwXJABBxKFAOhLJHBKoZShEKmYBkER7QBQUABi0lAnMBZo8SpNSry07Q2HU1i'
-    b'ayLtFGNMovFd+ePec5691t7P/bTDUMN5/qjvq/d7773nnuHZe6+99lqIfe1rXzfY9epf+B0A'
-    b'cQECf3dBfCgQH4LAB2OJD1oQtz4v8L8tCz5wAT7gPMStlgV/5xbA+y8L3m8B3ndZcMvzEO9z'
-    b'3rKcv4C3OG9ZzjsvYlkWYAHivAVcFpydh/jrBfgf5y34q/OAv1wW/PfzgP+2IP7reQv+Ylnw'
-    b'X85D/PmC5T+ft8Sf/fe//Mv/9Dv/7vf/9Cd+5lf+5Ld++9//8e/9xz/6oz/84z/9w//053/x'
-    b'//3Xv/hv7/ydX3oj96u3r33dMNct9lOwr329d9a3vfUdt1oiPgrARwJxWwQ+Aoj/fQl8OJb4'
-    b'sCXw9yLiNhERAQYDgUAEjm/ACOLw5+FnWH8czL+w/Q4OP1qOb4Dtv0tE3CIQtxxHd4zbwHj7'
-    b'QAQYEcvhj/Fbsb4hePjZh130WX/wl3/1V//xr/7HX/+Hs78++/3zbvk+v/d+t7rV/3vB7W73'
-    b'ux/wwR/879/vVrf6dz/+DVf/+X4X7Gtfe+Df175uUuubf+I3P3RBfAwCd0DERy/APwjg9kvE'
-    b'3w/GBVywBVUgh27EIdRHBPO/rXF5DcJhodcCMSK9Y6TXpN8kI7Bsv8TmPcn8Eh4SDuQcgdth'
-    b'Hd/jNsek5aIt8ZA3RTzgWa985y3f//1+5/z3fd/fPv993/ffnP8+t/x/bvE+57/j/PPf5/9+'
-    b'4YPv9of73bOvfe2Bf1/7usGu5/7wv77NgrgTgDsC8XEIfOwS8Y+CcQGPVfqx4A4Ej/9/qJzX'
-    b'GH4ozlPA36rsEXghUXz8O8J+lmJ6AIEjYnAIwMeDkd8+4AnBOCYZKB9z+J3FwIIjkpCPmHYU'
-    b'TMmKrguCcUFE3DMsO3j8977tncv55//meefd4v867xa3+NfLectvLOed9+tfc+lH/sF+t+1r'
-    b'X3vg39e+3qPrujf/+j9cEHdB4M4ALgLiwoj4cDIHyhWaDwmUa4jkMcAHIpYNQj/8bMmBe3sV'
-    b'R4BGxve3VCIlBLTQnCD/CgtsScCaE6z5weKFOo/HHEuMbITHn433HW2GHM65ZQT5PSl/wZb4'
-    b'ROACRFwQiEtzVvO0n/2931+W5e1Yll8Dlrdhwa8+624f+lv7Xbmvfe2Bf1/7epesp3/f228L'
-    b'xD2AuDsCdwPi4yPi1msBi9F5PwbNQ8mMBLMjhVEeq+NljYUZi1/L7RSfjyFd6mFGxIKw5IDH'
-    b'frz2BAhapB/vBPs59A2tWo+IhRFcIsDtuNa+fv7dLbnBoBaMn9rR5A9ljCQiH21qJQTjwyPi'
-    b'wyPifuuBXvfLf/ynAfzygvhXgeWXAPzi0y76wN/d79597WsP/Pva1znXk9/0trstEZdgWe6F'
-    b'iIsZcbtDAZ8g9RRsCWwI9rLB6Bq61jp3FOO5jl8DoFXosb7vkTC3HIL9CscTCU04/n+skANz'
-    b'T2Cxb0j5FK3AYajBYggBUhIzEhtHEJgxDoUMEvHQw3scE4rUNuD6aSz5yJr9HE4lbw3gMgYu'
-    b'W8/2s9/+Z/82GL/A4M8H+XNPv/Ot/9V+d+9rX3vg39e+4sve8KuXAHEpgHsvEZ+IiA889Ny5'
-    b'NeUBrT6xhFW7B/hd4u1o2gdqbDwGQcTi7x+HfnyM/OBIph/BcYPZYe+KRBRce/vMJXg0vf0Y'
-    b'3Xzk94RU5GhCOyc/HyfhWPWnHj88GTCuIS0fQMIQkK7BIryGfD6wnv7bBeJ2YDzkLCK++lf/'
-    b'5M94xp+J4L/k2dlb/9nd/+7P7Xf/vvbAv6993QzWY1/3yxctiE8GcN+IuA8iPiAHtq0Wz7w1'
-    b'LTJHXEpjdKOGT3FoSUV0CrqYlcnLwAfWIJ2DMlNLYfDpCgwRo6UQG2pQPjIRBtmkJQdUoYb2'
-    b'jaG4/k73XSSN4ZYcVdaf8/1ggwK0NGMkMUQ+/zESF7t+A6fgBwbi/jyL+0dEPOsX3/mfSf5U'
-    b'nPFfkGc/ed0lH/5r+9Oxrz3w72tfN4H16Nf80ocg8GkAPnVBfEpE3HaNWwsOdfeSo8hxdO5Q'
-    b'6TNIHGB4SCGrZTxSPx6QUlgqbuvhj/K3zNwdA7JS+5ZUoZNI43kp4YiaBGwRNhP/NiR/fCEZ'
-    b'2fMJAqRIv8AHA0YCsGH5PEL1yBlCTQ+ofzJ/R+j3jpw/UL/74X8xOhuibXCWTvnGIviAiHgg'
-    b'gw8MIJ7xs7/3uyR/nGf8sYizH332pR/1R/vTs6898O9rXzeS9Yjrf+nOCH7GAtwviEtRInZI'
-    b'Vc2hSxM53HLtY6+VJ7KAjuDzqeo+4NDYAhITga+pvAmtYq3+Fe4bUjug1NcpoAuB36F9TP6s'
-    b'FMCVupgjKe0TIxgyzZATAfk+aP8cXYD1RA4WAOipgJ4j+ndP13T97LM4LSB4uLyMCNw2glcC'
-    b'cSXPIp76U//2rSR/mOQPPfeTb/+2/ana1x7497WvG9i64pX/52WIeMACfGYE75AVbwqvnRnH'
-    b'T5FyQ9VRoyA80I+5+EHMRyni18SBx1n6Q6KBtucPT0qW0bcW6CBN1I2kQBsIlGRnKfnO+JNB'
-    b'Libcw1GpG7yB3G8/qvUgN+0R49QnsEFZeR3FjyXtGG0KFoDkcC5t8BGJzECIaOF2nmw+YiNF'
-    b'jrOx/uulEXEpIr7m2h//N+9gnL0lzvjmr/u0j/mJ/Wnb1x7497Wv99J66Lf//AOWJT4LwIMi'
-    b'4gKpc20kTUbKUCfsydMs9Y33tjLLVkwAUOTcq9KsukdDCOhVPiUpEDjfoHpkIkEt1VOchaES'
-    b'/uFIAj6Lf+uE58s3TK1+FhSFKV9gRJwquovSYPtvKC8isREwjyLCkrRAIj4mB4EmyWmTozuA'
-    b'cQ0jrnnSD//WO4P8fvLs+77h/h/35v0p3Nce+Pe1r3fz+oKX/MxnAvG5wPI5gfggqZM3AtxR'
-    b'UnYN5kKwo5PbJbSMUNCHoEEHUH3bLdAcZ923OG3lP1buQGoGjOQjBbDFgqpCFkcSew1czH3u'
-    b'TKHHKhgEL+ITiS8He2cMrp8VUcH2mAZVHJOE0+F+FqQhzYUQ9QCnTfCI1EBIlpp5sGR0SHhL'
-    b'jLtnniwgLojgl0TElzzxLb/xJyS/hzx70/MeeOFb9qdzX3vg39e+3kXr8hf99H0APHgBPm+t'
-    b'7D1olgJVtnQ1t8FWotdu+eHH2Bj2WEfQcixBShCS6h0cZuAYiTP1/UNshmUgg1XYVrxSxS+S'
-    b'B4zjK6J+0HqaUQiIs4HDCns0x1NQ+/Q/mdxXfgXdK0zAhwmAHx+GCW7gLIT1/OecAuSg+gnv'
-    b'jzqNuH5mVh9EebMPCsYXR8QXX/P9v/bOYLyRZ2dv+JbPuctP7U/tvvbAv699/S3Xg57/k3dc'
-    b'sDwEiC8Ixh0CGse2ojsG3A1qpbfO26/Kb0hUdR6rb+IovLPYuPv6ivX3O1Icm2MKpcRJwb7N'
-    b'9Sd8gaXITWHPKHYp+0BhtUPCHiUyI8gkCLS+R0oc5L2UJ5hi6DgfuZlPRw7QYiX2HU3MJyVl'
-    b'HcmwIyuuIkfteGTyOBj8TATB7bqtuRk5Iv7qbaA/08kErhlDPnjyApJXRcRVj3/Tr7wjzvhd'
-    b'jLPXPf/z7v4b+9O8rz3w72tfk3X/5/34rZYFDwXin8SBXFWL0dzWRta/gxa4on4TErBIHOfx'
-    b'B4kMXIle65hfLqpRRe02ad7xvlsrAeNzF6XYC5cd+p92YftuEC0AQnUDtogtNn75g02xj2mG'
-    b'HpQgmoMsPTnIUwipIj78DkqAZ2jPP/ocxyB5bPLDdFxga6kUGOI0ZoFcvadMq+MYMhLkHwX1'
-    b'B3sHw3REd2Dw6UE8/bGv/8W3kmevIePV3/qQi3cb4n3tgX9f+4qIuN83/uh9seCfAvGwCJ7f'
-    b'Qvnhcq2xQd4i9FrQf5v1tl55ruC3YIVNWT8qGdAU4nLMcNQhXII/V8QYs+eYHTNTwB/eAD15'
-    b'MZvnJCIiDt9EPmcTBwpBC7pJgzXQs9HxqXGT6XtwGpBVzKgmKkoIhKAf20tp1wnjOuUErTQa'
-    b'mPD9jRuQpZOPvH56zqDvtKEAMaSbR4ZzPEiexSGBxaUIPv+q1/z8q8iz61/00E/4F/tTv689'
-    b'8O/rZrc+5et+6IMAfBEWXBGIizSij+DYwbgb8H6sQLFVrClAH3vzK0v+oDvT9bZpkLoa0soI'
-    b'WSkNj++PpEu/hNZ+6d2TnGz6ipTERZOXZP6zxlQY/HGs1Mu8vcIfIwJuLRB38BugATM/QPIY'
-    b'xwOO8Y0DSt8QFkal9DNKBU2ozC9TsyLP8SPYwgUro39rpSxFxrCgCkIXJOIsRX5Sx/tGQkNT'
-    b'R2IPVkQ3rMiIiPMDvDIYVz7mVT/za0G+8oxnr3jJwz/pT/bdYF974N/XTXrd97k/eAkQX8yI'
-    b'K7H6r8BKuWPgQmLpZ8rVcijzU2DCtolHy9Y/utxEVPW6lWm/mE692NgqQI+NE4CQ2t/EfNZZ'
-    b'dxfNs/RFQ3Y/TGC9ckxddtUIbzD+abP8EquycdBxRt4d9brRPaagLP4CSVdgywLo16WLlJAK'
-    b'n+cQ31FkIo9spktMBSM6siGYtf0q9s/Qan4TGxKi31nqRlDPAREUTkBcFBHfhIhveNQrf/rl'
-    b'5Nl3vPSL7rt7B+xrD/z7ummtS7/mBx4O4EsieG+H77kGXnGrXyIawB+p6+3/VUedXNHCGPcj'
-    b'2GWEYP0D27/Ftukji+4YjL+SAPNYPTJ/oERvJfflfr1o/rNrK6wjis1InIkKQdz08kdaAIce'
-    b'i/T/Q9shWUZ4fXdmFb8NYEiwP6NwNYRoaOF+SwE6n2CMAlyuiYx0oAgrhtn/6g2Yc7YDchTZ'
-    b'WIhnKTE4fKGay6iOwIH8d4BC1nN3lnSJj39bgnxEMB7xJd/xk/8yePaylz3iU75z3y32tQf+'
-    b'fd1o1yXXfe8FwPLoBfGoYHxENCgsU9k//rskbfilFbvZHPRiiNAoOR0bTs8GDZAuuszAIRWh'
-    b'CsFnThkiCfPEqJZHUOOkUaGfLkF+gTjXSeADiv5PBjC4tT0g52v7nDTGh9K3YE1Iet+9JEmg'
-    b'LQeYRu8g9VG5GVvClCYIIk0GrMETfjwpaC7Kd1jPIsmR5Dn6w9GSEO0+NlaBrBDK6o9gsw7p'
-    b'6CgqB2dyyOlfmHgBmjncmxH3fsTLfvzZ5NlLgvy273jUp79z30X2tQf+fd0o1j2f9T0XAvGl'
-    b'EfGYtXTLY1qC0G+Wd0ged4m5hTGGJ2Hp2M/FZgZjI/HM1Tv6uLttwSOQGcItrq8L+kAID/FM'
-    b'MrZkldMNVZ0bvfvRMiiCuVv1z8Q7gI/EH6PbIr4DJYgb+gHr5+dIvX2zjdW/SHG9nR+k6LpV'
-    b'7M3MPTW1CnjVfLwXPGlw/kC6DsumeNinWNt18lG9cPIfNnEkK/C1kZ/8G+ToV77DlslQUgOI'
-    b'2FLfAgnyI4JxHRnXXfniH3oxz/iiV1x1/7fvu8q+9sC/rxvkuvszv/u+CFwdwctHwDjWcEto'
-    b'Rzwj85ui3mJd7yZewyv/oc6XK1lidd1rIPcuuKVAHCnIbwY0SYQnC+zAKviscNe165Eq+EIg'
-    b'zDoDq4AuRpW7yBG3tX8yu1kDqLHym0jMI/Nfym5EP2d/zKiWZUnCeBiC/NL+hirzw3MwHxeg'
-    b'oCuUzCQhC6jJ29AiCJHsRWAz6qnywQxr3xdE4PArlAq+kxliw2FQiQaqvbAnDcc/z/THjwnE'
-    b'Y6741rd8N8/4wu987AP2aYB97YF/XzeMdbdnfPdnBeJxEbhs7Vdv/HhUj3Ukdv0oyFP3Pkuw'
-    b'hpHemKRwt6r38LtccoXPAQRnHf6IMcq2jdVhq043/X2JqRmWx7DsTRyC3E6Al4GWGiwpymBp'
-    b'EpNNmW+M7Y1WhVD8o/fFKyYFYyRwyiDEMNPJrQpRJoaoBgoivrH66iFtXDiHJ7x0T4lCHM9n'
-    b'bgts5wn5nlHkxaOpCPishkmp9j4jlEaIfJzjPB+4e5R7kFDQgjL2n8kDbNCFsEmAISVNz7bI'
-    b'yyPi8oc//wd+gjx7/vWP/6zv23edfe2Bf1/vrYD/kIh4AhAXb7UWG1GZBSX4bvEHucIc7nbI'
-    b'KnXQaplAah9Q++1lXj4akZw8H89SYcJf74oAOFTWS4wRPnSfm2Ivmpgcy7HHjCP0vyBMMeAE'
-    b'P6D/EaQmXcLbB0D08LsQHWd5BaMR3t94FIIMRFLLIwNkG/hQko30z6jyvY2N0DHxi+oxkGbt'
-    b'NQAnX4MCt3MkJVsuowN6wBFFOBu3eM4VmM/JKgZEmgYRi+XB9ntdlnBQGLyMEZc97Ju/7xfI'
-    b's2959Zd9zuv2XWhfe+Df13so4L/xYRHxZRG86xi9000qQ9pcNzoilsV03jE25UwYK2Zykfjl'
-    b'HLr4awDf9PNz0pBfK/40QwVvVOH5uDZlmDEi5oI8OTpSA/5BGZASsLY2BHxsDzafn6p0U9uD'
-    b'Z01QGWLp+ROJ6IBBtjN53vWjK6w/MdJhDzJsKn+pp4DkvkNx80tVcWr1F+ViVqXDVLgf2jHH'
-    b'680tuVmRioacyG5EkIWdD/CovRNa2mekxhWIN72e9V0PyVxOCrLoDwNNCjOEhQRhOP7/OBtn'
-    b'F0fExQ/9pjc96Yxnz3vtEz/vVfuutK898O/r3bI+/ulvfGggnsiIu+RtqI6WMVvj2BRbQyyL'
-    b'EOGbGR9ex+oTywuL8gQzy34l0GGU3gwfvsIGu4ula24or+NjW4ICaVPUehs6YZCqUNgxHj7q'
-    b'+P9L+tUteNasamWwc2acc2wVMLcp8mw/sjLCSq4UVRy7AodZxVp3S6grjnhI18m/CxLfnfQZ'
-    b'ex4Dup1fKiIAoLs5mmo65UIF2WGC6RlnnYzvqTwACJ6xeQai/RnHBd56EUgtCP1I2gSivOtd'
-    b'I+L6L/yGN3w5z/iNr3vy579636X2tQf+fb1L1l2f/oYHI+JJEXF3RbN78XWxnOVhWG9Z0JPr'
-    b'MHZTYq29meLlUkMNtVSlBc/KzoJav2JlgY+ZdGIgF/TgnqbMR6WvynfSDIDq8CPqIDsJG2pY'
-    b'AxCS016actiCWiv704eF9M+UJASbCJBI/KbgvQX4lRwodjnprDBqMEtBOnHuJKQRaCkKKOlj'
-    b'CLkv7LYZCWQ+9jE1kTv4W02dxx3PjNwXIda8iDNJDBhsxIXozfljlZ/G9+gJw1HUJ6VNcbQw'
-    b'XpGDzBM4iAzpfZCmE+4SEa/6gq/9rieQZ1//+qd84Rv2XWtfe+Df1/+/gP+0N9w/ENdGxKXC'
-    b'dVs39IWbNG6eyx8M6yVGKD/y1I3lNnxlBuCuJDcO9TsR1rPeflTW/uE1fc/8MJmWgi+p+vE5'
-    b'hWEeP6ggRyd+O07BhGyXvu+WFrDnJWy/mYh2S/YZSImKgCFQu97RtbBMDSszHZvmPI7QA6Ox'
-    b'6kumReFOhFAO+8TVPmUMjatemFAvfb7S882hTAjLsSj6+rFlQdZwsJTibCA39BIfJeyDh2jN'
-    b'NLYXEXGWRwSAECiB6UKd5VmQqOeNBjVweix3R+D1n/+c17yV5Ne+4akP/cF9F9vXHvj39Tda'
-    b'd3na6y+JwFdGxAMibTFbkDDMtMYrWhBLQ/VbQJH/FWneDTFwIZY1kDIhChgENsJMW60JmxOK'
-    b'1Y53E3tZUo2FpFS3cgagWvnu1Aez2IUgGSFWvpmdv43t0aDrEfGHjlH+J47Rxq23vwZAwvr4'
-    b'qcIXg5xcPaNxtWfxBhAJ5WQ2tL1UKtoa0CWpU+n/anffYRnMOSESKpI/Jp1Xe8816A9Fv6zS'
-    b'14RdIMizNJqwJlpVfGj9wdT9T982goepghVRYAFqmFIQUyE8c8xA1qURcenn/fPr3xzkc974'
-    b'jIfvcsD72gP/viYB/6mvv0MgnhYRV2TYU1TzRFhFR8VGrBhBOPf769R5guglaA87OqBqvRLO'
-    b'P1P1uwg1zHGXvlxXeh994BQr9Ioo7MElTfAjcedhffsIc/ZL8rzr2DuSmAvQMu5LspGPliZl'
-    b'ixxZMhSt33okC8mYpywlAEbmP3DA/qZIMEh2AhTQ62/17HUlXY+bQPv9V+0HxlG3IWJTYuRE'
-    b'DwKp204PzGfK0N9+P0VmZk9iYTzqm2FrERj+gXWa40gSZL7naRGeCYTI4xs0LeLjeKJaDT6A'
-    b'jAdcft13vpJnZ89+07O+6B37LrevPfDvKyIi7vzU1/+diHhGRFw7qsVRPaFheYvIbu75Y1RE'
-    b'hx8tStVzxTp3kYtM2GJDoMuRKFnXHjf8XAlnqJ20aS84Op30+OnVLGKBorOxZBmd9CfHqB/T'
-    b'vPfGEnAEw44lxxC6JHAbmNVMqA92ziBfRA8BqR+AXK/D5/iPQQwj0aIU+8nFDrXuR5njr39V'
-    b'1f9eHteToKTfJ9MSETWIK5TvFyIG0U7Ie01m4laDdD++KuqUk5yDhoC+zwbbs7wyfeLQS+Am'
-    b'JZyEiPq+yhWBuOJz/tnLv5bkV3/vdV/8X/Zd7+a9lv0U3MyD/le+/uqI+O2IuDaMCFX1YGsx'
-    b'Gr4BHyVqtzqQ1C6kk7BzwS6IqffbmxgmEwCRDFFCVeUytkonkB0DZqqAa0DSGWxHiPXd1hDI'
-    b'RDBPPnZpLk6LcqTYQc1t5Mfe6+bJa9MFzXJC16r0GMiHzS9NluCoV0+Usbvx91WDH1tw4iwX'
-    b'2dR4XKt/rbLTT0xRb5uC8PvIYHvkrIUs/Aagi+euk0DLDXgisUpfj5b0GAklt3W2CQd48tA8'
-    b'C5ORyu5esHHIaxHx25/9jG+/et/59op/XzfDddFXftdnROBZRNwjb+woWxs3i9w6XoctGOi8'
-    b'u9KcsvRsmFvdmJpzityqU2uz7K2N7/hsmfP2UQCYuAsasxxDIQ7FfbbWxZHsrujA+MwuYYGa'
-    b'wyX9gByAYOS5YG/3mw4sESbTqGBBNSC2ujCoP1vyhp3jdWRwWXUPwE0lj3lGTst6cedD0uyF'
-    b'OvWEjQUkVCEjPbTzMoiZGX3C9qJJsio6/esYYRUW8nG9jBF04XXw7iB1uRD9uzlAecogxj2a'
-    b'qp0dj0HHS8UzIL3/ZiNM1u8VcUEwXvBZT3vpw0k+6/u/5lE/tO+Ge+Df10094D/lu24fiOsi'
-    b'4qFhHLCyh88Kms4uNRVHq6AKLLrngLdpqa/yd1gavxZuY2+FA5ClaFPQX1IAktE45wks1dsG'
-    b'a6W7+tGnSLhx5jEa4kh9egZiWVsNzcnLrREk/HxTzCPVqnYg8nMlv+MI5NZ0yLa8uVg++hYQ'
-    b'UPndxmfY9IqSO+3aMkmWtxvvAU3ta7a/6+QA0rmL+lokpKgw/1LAA9NkR4zxuUEQXVUkUySt'
-    b'uH/D0V/RHBXbGax79gR9Sw9EhS8EytLfXKcoLLkYcpJpjh+qEgTSyH6Rvv34blRAbn3/e0TE'
-    b'Dz7oK7/t1Qw+8wee85jf3nfHm8/aof6b0brwKd/11EC8IyIeOqIdbavWqmUAkSoQgwnQCYPJ'
-    b'0Qr8hBqeEMYGxwb3o7yAFtQsWylVduoZZ0taq+rzNp7HxmFYSBVSMRIZeqkVKGrt8bZWqqi4'
-    b'QUzyrQJXd3CxB1r2x0nPvsCYHQnRdJ8lyriOPRLzvc8lc2+fggpgHA+ynfI4B6AhOPBzzWOS'
-    b'5gmm/n+5+0EZEeFpH8DR8kG0LZkytGdOh+M2olwPODgCTYy6lgr82kHhFSIeGox3PODaFz11'
-    b'3yH3in9fN6mA/7rPjMCzgbioMqOhVa9PpSfiW+mBA1tPX1jmGDXSCq9mQRybCagNUKQ2Qrb0'
-    b'zQI0jczviInZ+CalM0k/fVmgOvrbKzP8oUnENk8PAa2HAY4YAjEgsAJM0CcqgS+r+pnngYQb'
-    b'9JMK1eiol9bf2hOpk4BEZFQyX9YZdpEiaGEugdTaM5ZJgRM4npPWR4y2S852NlOo1aYZ2h4p'
-    b'4DqVRNe1xjMGsFX/7CF6SV7DxvmYEh2i6B6cyUSDjSs2eEROMQ/SAUZoyH+IS6LCE5QMh3Ho'
-    b'F+HZD7j2RZ8fcfa0N3/t1W/Zd8098O/rRrr+8VNed5tgPCcirizoaQMdI2vPQ0tKZte6MlTs'
-    b'ZSZyNDy+Lpv0pL49IxZAOQTm/b4lFw3unQP90AWoPfuD6I37BAzSHVL/n0DyktfkZrTTuYnq'
-    b'AJ35TRaHOf6XA45fkRCga6mYPe+xNSFn2+QMG0X/9Nn17QWzkO9DHV9w4Z6UCJDNxEUytlF9'
-    b'hzGimQf74AhJUhOkv6nD9vl2wYrULOr5zGZ4Xvruyp3H2nLJHyWN+rOja6C1C3DW5AVpiO+Y'
-    b'NDFV7RDOQfZZoLAyokMINsvhgWaFfS1zAJAUViYwBrJyESPe/JlPfuHLg/zKt3z9Y/9g30Vv'
-    b'mmuH+m+qQf/a1z06In4TEVdqxRYdrqkbFuoolLCjTzGKEa6c05PRG1CS2RktY5vNxxFNOQsI'
-    b'vIw0G4VtQ61wNmKFiQUVHkGzHTtLBC7ZeBWeJbrznqBroqnGxvdB8NDLZhhBMETRbjVByj1+'
-    b'msGgK8HBhHy26wQf6XQMWsc9o0WQRqJEaAAXCicrEN5xBrtDGakIk3FROkFNOQ9X2q06fIXB'
-    b'D79uluwwExRNw1/SsTIZ0I0IsrnTQhUXqdISiFPPVmM8AH9u6XDNlYz4zft/xQseve+ke8W/'
-    b'rxvButO1r7sjIr4uIu4fqdLY4NUZ4blDALrKWGIHQ9XbWUR3DqQ3JUnB9k4eK+olEbdMdM7b'
-    b'8mkjt2ouUNTfFLlo+tW0z/BdtHG0E8wVKtu7BpPtPOSglNlz0iZBozmckrCsBRCN2FE0Qbwy'
-    b'DVMSNFoyzOI8dghKDWCQy+AUsAkxhtxIHiiCQBQl3hAYnJuSoR405FJ426pziTyF0AMRZ2eU'
-    b'4J/zhbUqj4wCrBB7Et8HTXB3m7E/K3wCUr+pOw92gn/1KU3Xt6Qt6VObSQIqxC/TFgSProAR'
-    b'CNyawRff/yue/6Agn/yD3/j439h3173i39cNMeg/+XVPjuCv8xj0x7PdkNjQwL6YFB1FbrXy'
-    b'A1BqlrrZrCxk0kECpOBS6x4t46gAACAASURBVEI0fiiQYI5mt6QUrSpuwiYQxYm6CYUImEls'
-    b'Asv6rKJQ7DkGEsxyVkD5iRILs6hQVw0n5mXhOwL23olGlyMdMxEvXQcWXEZbCdQqsp4TC0BU'
-    b'QR8Pg2VW3s9J5/g0ZPBED2D2Grr3sygSNhoFkchyJnRFI1uCVVkvZMpkoCGdpoWeqJwVoPAv'
-    b'MsdETzejeCm0ib1m2FAH4vtHxK9/xhO/5cn7DrtX/Pu6Aa07Xvvau4LxjQHeR3vpvfz4bEEU'
-    b'1zRQIonvFhEdQIFC+0Ckig3WckCzgW8Cv9bYFoY4Rv98cUeaTO7DcMAbNvZZmx+b/8Bicmkr'
-    b'7yBDqmVKIY0R5g14Eevh4RQHKZetdt84Cs0AX3Kf014GtvMxHPdyHemiL/kc24WHARM5JkIT'
-    b'oNJKmI15RNgYWXYNOmHQAzd1HoN63WjJgQtxuNBuuxwzCHzzvVd2Pc/soUhGPeOvrbi+5ZSw'
-    b'N6NU9EgDCyR7a0Wd/Yt1pn/z67HfkbZDM87nqfnQGhhygsV2+PCfr73fl3/zZwTjiT/8vGt+'
-    b'Zd9194p/X+/NoP/k1z4FjF+OiPsYhTrXNnXWh7XvKME8fF+jotQW+aBzSFKRbFsQJtKziPAG'
-    b'6TpPz4keCzLJrBw1R8VPiN6JQMgYfWYkSd6VcMWsFdBAxq5uyC7ycagYMlXbB7VAc2SDzZ6H'
-    b'HqvY2kaoeJAEG8290OjIs4GIN0U+qV5ZC2+5bM23Xgl8yEjF8btlGkdioJU+OOs9Mart4xHT'
-    b'0JLM8eg4JRy2uvkhKHf7dIYy0swipFWVOTAFWNru50mCxHly7redIHNQDR8Zf4Vl4tl3QN4Q'
-    b'Jz7NOQS4T0T88v2ued5T9p13r/j39d4I+E96zZ0i8M0RcZn2lwflGRib/MwiZ9WXhxSZRtMS'
-    b'oZiml5oTA3N5w9avPbqlgUUTYIy5ZeuVSRlpTmhYkFj92FJZQSYQvY7eyi3wNjwQWasHYDGJ'
-    b'yfD7Sh7fWP6mhINcoUo5im2uHCVhCJlkGON8aL9fefNsfWxYtWz8S0qVHEGIxal4rq3Y2uRu'
-    b'PIQV9mdOYmgJTY6pYzzT08D1vhmoTWyGTFmFsOOq5FtI+vHMyhW0tGi9RdIUAsZ78GinOz5f'
-    b'hXXOMloQ0YoHOR7BDKUIf4YSiJnseTOqVbiwzOd+JCmuH7AZEzXHyG1aQn7+nE9/wjd9SkRc'
-    b'8yPf8uW/vu/Ge8W/r/fA+rgnveZxRLw9wMssQisETQ3ITe0QmX/WS6tE8tcL4w2M90BvopoM'
-    b'XTocoP+0IbIDmUXW3jZUdjaUXU9xPWsqp1ypS4DSGW8woxqltK2osyvjCYSLKuiSzo9s75nF'
-    b'Harjv6HPHdxc/m7scVqbpelpowTdDLdXt8RStZbMaNxorpPQqRDk6h6OXKWCO/MtAKpzJH1q'
-    b'PpJvBOUZqa6BNvuyKjmmIOo6/DCyTOcxka8X/NRmxcZjiqOcyIa7b8pNrNKXKv1L/Wn+Iez3'
-    b'1i+G3nM5InBZRLz90x//TY/bd+S94t/Xuzfgf1hEPD8iLpfK3PC/zHyGV8sdg132FzSz22z2'
-    b'creRoyAGcKvcZMpSndUgPntiaYu6iWqLfaAWWwUo2UXX4+Zm3brJAbv1cN2Zy5T8pga4JBTE'
-    b'oWuPk9v5GTC66BCkA6CRGB1lQNSJAkV7BnaSR+o2YyIR6+HwGG4IZiyMwYzPRENLSBHubASO'
-    b'GcdS716GU/SUPbeSAzmQJMKQmT611Ll2c8bbxvv6vrzHYeZq+sxS5c7YB+OeYenf1/T3oM5v'
-    b'c5jU+Xvh/RUHwjTJP/k4+kRCvo2o+AerQBAY/D8+7XHf+Enk2eN+7AVP+g/7Lr1X/Pt61wb9'
-    b'BzPibRFxuWf+7GR20e2w7EfGbOMGGifTMq40SQuABBvbccJqsDSLf8o/Lmuc1wgMYzFrZVxo'
-    b'2aXlgYFMZLU7wMxtolaBXWUXzWx1cYyzPn2EzqCv7RdmRcTuQuU/2JrY5nZNve5iE2R+CJow'
-    b'YRv581kEqyARVmmzZ5P7GIjcY1Diovf6U786N63W81kJqHpvDkqJcTPQjLQ0+UMdMOBUcyI/'
-    b'o/TzPft9aELsSXfz5lGyoqgTDV0LpOAI7Tyv3h+1zReXR+Btn/rYr3/wvlPvgX9f76L1sV/x'
-    b'6ucx+HowLvCnXXTBpxuOdt8RIq9SNzYLIkELIgmSpHR/s0EMiuiI1HRr0PKRoy2I4+Rmx0bz'
-    b'XcMWolEqbzdTdAGaPDFLrRKsMduc8+ll7qtCFO6i8XsvvCtxFtSAOeYDZsEnoxtJf2EbsaRW'
-    b'9ls3nX3QyywOeCKBTfqZ4YN5jbt88RBYBZUg1sbhktFCCGVyTOpHRddnBeHvo1a97FInqIxx'
-    b'tfLFidRvwOvwrgu09UN73ipa0SeaJXrP3HuR9wNIMs6SQyArVOmtl0maG1TFCyLi9Z969dc9'
-    b'b9+xd6h/X/9rAf/OEfGiQFzs4jsri3jYw0ZtIVvGnkl57KT8FOfepFAjwfAqk8sE1aql77JG'
-    b'CSwbhJylfmR0ONveGk6+jtnJpB0YwNLYpTByFxOrw18gZbhMr+oYEOgTggYxGNU0Awu2tkZR'
-    b'H04BDOU9Eht8iUqMzEHEJ+Ga8bGaJLnVsmvRQRotK+S/BqUqjrjyOtCgQiO5YajEcYHLDY0i'
-    b'KLa/gbBRR44uROOyg2YMU6/XQU9/JauNxLOaNDnYRBPZYaiVL49OkOubrc/NWXigjwlN33gz'
-    b'7jNwfOuzcnzU15ydFv4Z35vWQhg+fgM4cxIgBXlbyY1MaNJxT7nmU6762osZ8aU/8a3Xvm3f'
-    b'xfeKf19/i/WPvuLVj4zDmN7FjZzJmmWXgEVr/sHHuayvWlzDCjKOiIbQRRNLd5B06yNvx2lM'
-    b'5SyWsu0vLBvNTLPcmxs4VlA68satgsxJTpFPTXPMNMndUW03UPtWiaLOcedgbFUUU1YhbHJS'
-    b'kH8adFCqMuMH5sSnDmmhXGTKaUEiaY6L2nWLzvkn9Vv3qEylnGaBpyCNad+gKd1Nm6cp+jPQ'
-    b'4jRMMIu7LbrcMghzU0QS7BkID05A/yjHMwn6Mo7Kcm8Vrmj5Xja3zxDTK8RAt1zLSMn/aKAO'
-    b'BQcSdnAxIn75si997iP3nXwP/Pv6mwb9J77qxRHxkrVQPbjbGSO48HOz5hmaKj4KnV5tVE2x'
-    b'K5xF4MojmkCYcnlIhGPqwXovWtTt3JoWrZwZkrocjfmf1e+ytKtUKx7cLUmq4i+0/netEHOf'
-    b'uNfdy4V7b5yzje9thi1G2RZGuDIJ1Y++0VIo+gosnjXSeiDaOpiIghRVi12o90sbcFXG2a7e'
-    b'5srYcj+KmVFOCAaezvLdYhsJ2NJk1GcFLg5EOwGowLhPmGRzBUzPBeuEiDx/MJtnNEQ+Fnif'
-    b'JWmd3q3b72zSzWjBv7FRZC+E7thHS2qJiJdc9pjnvHjf0Xeof1+nA/6FEfHSCNyj7nOwaRva'
-    b'xPwEsRdJzioRSsw21fkGLVrpRTfd+AS5HTFZPKoNbiA8jSpPDbxJeG9jcpfqsW10Dpg/u9tt'
-    b'TmkRhXjIDMdXUtPREZAh9rWLjswls9xxHhk2fw6Zq+8mGWABo7ROVondJYac4PY94cWiSdbG'
-    b'qOjSa4ooIrPam5T4pUoGoiWDhcj+UnJJWD8ZXeNazpPntH6gDkMp7IU4i7Ok1r9p3RcYXB4a'
-    b'U+SrH1HZDJC+wvZ4pjdmpB5EkViKzk6oJAJFE4g8l2BnMicwQeatdZHvX72GLocNqtoDEY++'
-    b'7DHPuQvJR/7ktz317fsuv1f8+0rrHz7xVQ+LwC+uQR/dc5k3OTaJQTQSpUBb/I8wOK/cHFKk'
-    b'FJ9m2GOEJIHhjztAB30idJ7c42u2F6Xtvc7Ko2c16UQR2FACMFpXlFKZsansfHZe5snHfBdD'
-    b'3wOunLPquRtiwqThj+zXToEG3ABRmemplztKX2rioHw4yd62a2cQkFgviRiAqdZlLYUjPCOV'
-    b'JrP3QedCNwLdOTHynLBIloRWAheWPNPbEuvMfqdJsV0LnvuBTuxMTJ5ZNmD/xGWg/ZlP8CFd'
-    b'/+h3g35BRvcLNoDuSBFCAy0oxsYjYDDiHhHxi/d91LMftu/0e+Df1xr0v/xVz42I6xm8ZXjM'
-    b'abYJhz8LtB45YAzLu+rW3mKDfTUQztC3I0G05d3gHPSVOVNxFsIppyQGNoavI1kc6oNMKnC0'
-    b'GmibbTdWWpbJdT8ZTOD6AauPDRkooKx2WP3UJtIiWTXyKVBsU/l5NgQKyTN7JJTJTWRUHJIk'
-    b'QpiXSMGBiRluiHYjkeszJNkBEKxsPyEhpguhSYPGf09SAJ5Q3z22hhqcIF8Uavan/XAMdMhg'
-    b'q4o2yD1QISP3qaj21ZgiJXL0bm4F/42OAFsTtXwexd65dBVoYkNjfHcjilaU75YRcf19HvXs'
-    b'5+47/g7136zXx3z59R+CwMsD8UBETO1ksT1IY1cnZz7cusVgKpHHfra3WLmis4wJFQsP8UUt'
-    b'kPuRYHdgVC/Do148ZA6mPCMB6ExcQvSC4JrkZPKYH6IvY0Q+CQkthhhsI1ucbLo6G5+h4U38'
-    b'Z7W6zV8sn4/Vwlfao9wkgpkJWyUeUWDnMTWBUd1jSTLN4zWu1rRt9uKBRIHWFdxF4lQcgzQx'
-    b'Q89LYuO3F5MeT7p0kiAhwUvAlFq5+THQBOxBanpgTXb1N4ipMMUmhZOraLLB8o1A26ICleGQ'
-    b'PwiZFkMH+1mPuwrwlTFUcWWAFhUbVwYDolekjmoOmL8iV4cjbPeDaimwlCrH63LtfR75zz8u'
-    b'yCt/6mXP+KM9CuwV/80r6H/Zqy6JwM9HxAPFRCaxqbc6G2phOkaWKJvsGjaySR21pHYBNEf0'
-    b'a4UAbuYyqgOQjhVtTmHbDjayUh7Bls/dYuUAF+nM4ohCvsoBJVBqqKBnLbBZ+HXDzBoEXhFB'
-    b'6ZQkREld2gr0SrApiUskYxHVEQSBUCtidDU1zQm48hzcZU+CCtG0lRIKAOWVsCsiKTVh06fu'
-    b'zzGiI8Fxi07orKUTigNEEfiVqQlEJT+uMD9r4jtgfZ+ex1B6LA+SGyrl69fpUaR7PssAcvaE'
-    b'OujeKf9r7ycTAtckCV1i1iVGnM1mZCyEY/qEk0RHeoQIRDwwIn7+Po/46kv2SLAH/ptTpX9F'
-    b'gD8bEXeY9uDcr30ivDbIUWmjpanQib6o7XHtw8rmOLr9qPqWy2aPFIBhY0X5i7AmE0gb5oCX'
-    b'mUbkWMb5svsb6WwxPZX0shpNdEKCqJn8aXPDlpBcYvSuWeFcpOPMcHqTb9HVEVNTHwxVJZRN'
-    b'HzqOFQVRPwY7TjENuZImlLRButtH1WF4NZXRAKwqeZ50xkl3upzMiSNkJq5ChalQ6Pl6Mkr3'
-    b'GkkxUekLpYXhHkn0hwGWLJTvwVMP/jhN6L9/c3XrxA1oCIwJM9lUhA5/iCNH6QjC/6WxS25Y'
-    b'HOtv3yHAn/2kR1x3xR4R9sB/M6j0r78uIl5R6he6QUvC6l0ilENXf1TGrFAuNdTCakTd0CFq'
-    b'd9sji0Hmm6QG9anOgh+b/Wzfb2RfcKRA12x4xmhf+/aUEaoB64/pBVPOE2h2JBgrdwCkVsn+'
-    b'+3IxOuXAypzXfnVWzYuaKHBcB2SzIjSJSxvgWM5zF1TXio0+tlG0gzCkf02Fzoco0CIHTMGi'
-    b'oirJfmLCY2mQk3ROkFEbDzOMcK5DJZxCVXY4SYYcts9mWFkcobxUzymtunc4HdUxKRT44wRx'
-    b'aVAsf3HzVw3QFHKiGvao1fcgzk44MXa8tgu84pO++Kuu2yPDHvhvsusOX3b99RHxjJEHVznZ'
-    b'sA2zh9iiwsIdocl00wfRmKO6wSxYpIe/k7t3yd+KXgqbGV34QYaQc086yZui3c82s5toK0CF'
-    b'VRmp52sKr+vGJSJCm4xpblhooEejocCU3nRo/1qpM81xwYe9qcDuiMMo45K9/azqwbMpPilu'
-    b'bVQxmBx06BCTwf8GP8O+hnQxqBI0rFo0codAfB1g6oOWNIVPCDSIQQ62pvBfua3Qv7fmRCnJ'
-    b'W9UAS1o9ybY8YcotCVoG3ckBbyOWmSxTv680KXqji00sqUdXQukRiS4hJELatARr8ppv8qHx'
-    b'sO1Lz7j0ymddv0eI99zayX3viYB/zfW3DcSrI+LeWrWmR0KG681lLxoyFGakOxQVrn4TQuXx'
-    b'sQklYJtMbEGp9amvo1oq84vCSD9wzdQ+MGuFZNO4LWEhB1LR6Q8QUQfREznSpIanXu6mie8/'
-    b'hFnrHkbpq7Tv+nWXVPkxMfCBg5teVj7EWs3GSHQ2EmFEVQ301v1issZJfAHHJGDxgfiul1w0'
-    b'5TG2cHKMMKKyzdFAGmgUIyVQZSEjaxXF5sSIHg+f/sy8CZCkbKfwOdPkA7cquuoVM58RE/Wt'
-    b'ONlBMOcstbpSK2tLrM8ikx3PchI6JA6lLwRDUOjtlTyrz6R4mad/WKdosrefClyhth9sukY5'
-    b'G+MfKSqFeNilVz7ro4J86Ftf8VW/u0eNveK/sQf9e0XEWyN4b3SWbVKJZJqtct7EPgSjT9uV'
-    b'N2jLDooIzAxJyAp4mOyD0jYvUqXZyIUq30rjDojDXlPBwZwCrecKg2ZZS54ZBpoOz7exScUo'
-    b'w+l5BE7NW6J1JeQGYyOi5R1Q6vgwZnoK8GuXlnaeJse9KTmyS8yix2dr2dY5GIzWEMyW2eNS'
-    b'bs2sAUlc/qjcCCl0IZUvJGC4XiNHT5vNnV5c69hyCrqhORndhD57mxIkat7pUJjq8CGZXTmy'
-    b'opGc0TnoedJLaRdGRk2Yr9t03rHllczrAnv2XMnPcm7YWDIqz+TeEfHWe1/xzHvtkWMP/Dfa'
-    b'9dHXfOflDP50gLdLMaNUE2s2TteTjxScWo3szhWM0uPPdSxZyvaKak4BZCUJUapSD34pkOWP'
-    b'sjLQQwvMNay0Sa2E4cZyq5A8yDaARVGAZxMMG+3iFWHBBMRNZL0yQplG35jlcKljfeVKKgwk'
-    b'CVxOHmFTIHXOcxDycqDNKQ/8vrBRNangwlEotgaRFSlPLBJa9cuZOx3bUy1tD0YxIurn4aGV'
-    b'eB0DibBz0Y1WTi8/893MLr8rOhGOGBS+iIjxnLITsnu68AJYrl/N8RqtEFZKbsEvoFbJWfo5'
-    b'8z6r/HLXLovbRcRP3/vhz7x8jyB74L8xBv2rEfFGBM6PNMteBEWsCF3hadKDUyOOzsr6qwr+'
-    b'9AcrOkcZykZYN+ECF4veeUQtf1OBDLTGn7KBOLGPYUAiSlxyumIeOCQQPVXfw7z5zof1L6EJ'
-    b'WCbrZRGToG2qiMbHYN0IeaLShm7I62dR++Owiv8Q2Dl68wkFzidNveBzQFQGP5CZ6LSeu2vZ'
-    b'o7Sjq4YjG8A7tVBWr/fGKSH8tfQEjcnCF3O9uk3QD6UalfMvapBmXYCOS9AgKnB/CYuACMO4'
-    b'Vt8JFpRA1DML/4d9ouMiVJw8B/JyqJ0xWd9T9quBJtTgjlKcIHkoRDPjn/44n+AbP/Hhz7h6'
-    b'jyR74L/xBP0nfOdXRcQL2NzYlMfAzS0GNupTzmx9d2ZSM8VPbLQPhBaMIvbRK/8zirJdIh/J'
-    b'eFkZC+K8OrLWxKjWc6+X473NJ6gQ6DZ2NY9Odxkq57Ry4wxSbeoTuHIgohggkDo9yQL/mk1q'
-    b'h0f4lzSaQn+1E2PBhyg8YCRCGagA+IZkZ3Il6/0LiR7R8TxTYqJiSnl8DMekw82UMDOaTxFL'
-    b'WxoUIZs1WUNQ1PiEwMkKe9OhMHZyu/4yDaY0ViUBu9YwLgSHnTBUUjhPd0Q0xtF054OSs5a2'
-    b'X5hOBkuZwKKcgKIZnngdMrrbTQlouw5OZjTS4/Hav+AT/+nTv2qPKHvgv8Gvf/CE73xhIJ4p'
-    b'xQDZbNLOvNMeogR6cKpbjlPyo9tMMouG94CJO6cug4Wp8+GyKbfBKMPSGAz9Au/1sbgEyope'
-    b'pg15JCtIm9FwulMIciOvldPPqUGRoiKp+oQiNGiHvlGUz5AJjGaTDGB6bnpWRm+TRzZ4rPRq'
-    b'RmBaOSM0pnq2pF2r6aILESewcB+dZEQH/Aj9UEgdNJKgqj4xzMfe3jO3rqYdGphCPh1JYx2d'
-    b'9N50I9IEmwzs0vGgo0n+PbAhLdsTXsb7EiHQLISJSuyU2lwg+nTd5bw243+M1o9iO+/052XC'
-    b'J0IEznEPMeKZn/Cwp71wjyx74L8BB/1XvjYQV/k4S9EwIwT6qgi+bRHse/xai3PL05kqsJVY'
-    b'JmMBTSMgvyNX85JssZaLfEKx5KZnWYxr0A9dMasLCkLC0WKgHgYydflY2gLUAMLRI5etPSMT'
-    b'VIdBSVDYVZghfgOjeIc1SKz8T+Q2QNyKRXHRyYmuIosi5p6r2WhnOofMc2JSI5oxd6jYiyUx'
-    b'mjM241+dYlAZJWRHL5HzyoKMhEyVAnW+cxg4jquA0iQ4BisZKzSPhqhESbDRDBRZxYrIbTqX'
-    b'NppJH3Mz8inAZu69FgfsUv1WV3dmBYSaWOcs0HpDgj5s9xB7tKNoP/QsmjVh2K5rI/yT1lWf'
-    b'8LCnvXaPMO+6tY/zvSsC/uNf+f6B+O6IuF+mviIFsGFmkdnabX+rhZjzZJoGFR9DY1KG8wcO'
-    b'G/Rp0XjAe0VFZRizwEfkMmNgxuwSyeEoY3HIwcncbVet8Fig5MHjmNr4HzdHwSCQoaNrHb/n'
-    b'kuFcDIK6DC130wHYEAXG0NovbRDpCaREYzFyX5n2qKZMC82vgcPzFilqAX76vdccQ0ygk1qe'
-    b'KcYmgSNIO6dLHh33qT1kunYdtfcDA5yT6ZvJT2FDljwGokuRgSDPRr+cExBFphNYEnFutrzY'
-    b'HAjD2P46915NhZjaOYhsDjS0LM442hdnOXmkiRptFtZnE0SGkto78tBLPuU9CpvFL9hoEzHr'
-    b'ZbimpiGa234GI5aebUODK8cg7ZwPueShT711kJf/3Gue8xd71Nkr/vfquv3jX3mbQPxYBO4n'
-    b'jK6yqUGqy9XBalI6FS46hIeG8C5ckQ4Rf+wBG/ooTzHUQUzRhcwTyLPQLexJDzYwWDf3sqEw'
-    b'8jEwg6gkdROVYRoElPGoglLC+gfhovotMk7oKF3uSXI15NnImOgJVduMO9SEXdBjTuB8bRlI'
-    b'1MXoUTslbqrZN5HxzSTN3CPX1xnJbgM0WKX6oo070YWFMRyoM+GUgH2izZWRmnIvjePCMXhl'
-    b'BALeekIztuYdNLDp88N4NzxB+EuKBT4tMUwCxqQL1IGToWgODbYvpjzRqiXJvHBnkpxxkbU6'
-    b'j2zEk+2WoQjYvPWTL0n6Pi7hLBMO27/dLyJ+7JJ/8pW32SPPHvjfm0H/9oj4UTIu6fZUNDe8'
-    b'wP2ndMlPsYSR4XCe7gXn6onu4kohUzl7vhqWsSQC68NPaoCC5fsDTi/1Rp1dPg7wEy2VLFVY'
-    b'bt3DpqMBLaQNcnaUWoLJ+v5Z1RBU21sf2MZQnVs3QRFUYht1lVktEwPWlmG2TVVhA8J05Wjm'
-    b'Pe01TG0VJoIhTt3Rw6Boa2Y37QakcbvuHTKddGtJ5aJ3u65QK+JyryetAuvPo6m+5XXlXlgJ'
-    b'nKlfz44sq9gG20aXQfLk5L4PCeCRya3OMzHJBNp0CUOJsZqU2E1IS5q8ZYFuBBlTNEmrlHq/'
-    b'MSlnZgVvJKZ/1TPQ7lwgLongj97rC6+9/R6B9sD/Xgj6r7hjRPwIIy4Un3e75b0TZi6w1aNl'
-    b'FUNBtWBhF6nMx7sXLs1brb5FFlJZNydTKE3tAShHa9UeoO4BOR1Z+4Es+u9pnh8NxhpMYm1o'
-    b'2N5osVn0WkGFaOW+7kPJLhHD6OQyhM42N7serZebKeFFowGJz6F2uFpfQyF2mdMb98amSofZ'
-    b'1c8nHDqVEObwOGUtUKY/tkQONUFgOk6vDKvMkTkd2tgkqckTO/Jfk6xw8vd8DWx4olSsih4Z'
-    b'0XbLwSmInE/vGSCUnvVodRfYtB+cUAugeU41SlLnOEey5cnq5IRpvcE+tjdQFZumD8is352S'
-    b'R3+NOxNB7TWICyPwI/d6yLV33CPRHvjfk5X+XSPihyPio7vZ1mgR0k58g3USitGah1QyFCef'
-    b'obgq03wdG9GcRqRMneVyHxeqtrfaAwMzVI+DkEbU3iJ8s03df4qbSdXsR60qS7+cNSGQloYR'
-    b'6qR/TLU09fQLac67mCoZwQJJf13FjigsawkWIr/I0joQBWLMcXxyJRTSKnzmU67nCLOqn2Ea'
-    b'kmnsnRryMylD5HZzxsVJhMbmZwCiID6i4Mj63E3nDbrBl5aIprNlnZGPa+KLMFM+LzkZZyjR'
-    b'l40XRkkaIdD40PrIwRMnekR26Bz3XjlB6J9i+MmqpUg7YtrNMo1zl9it6zgpZ/ySqlfCiI9m'
-    b'xA9f/AVPvusekfbA/25ff/9xr7hnBH8oAh9RIeVj315EMNBsoNqjb6i5jcLfXJ6X9lDmSgLt'
-    b'QPl4oFAesG4Tci36rAZ4YtMBigww++JedlduICZNSCZv+K4PrtK0mVi5yY82yUMtEjlTHsg2'
-    b'CjIv7+2LThgob3pAA9x45RXVf6FL+lqbxBax6boMuapn1WYVm2NJd6KESygSIra9XWAiRTdh'
-    b'tStGQO1gYWIPRQkyJSQuJd3FUbODZHCKkQXaKNa0B9wmuSbuJE1qN2w2jxNtANfhHg/isBhi'
-    b'T9T0M0BNQorFxSmrZslp3MXTX9KIF9k+cEg8WZ28ZtfBexCHH39ERPzQxV/wpHvukWkP/O/O'
-    b'oH9JIH4wAhes2yAbFTGF7Fj3DnC2a0dmg4MnSpUcSOzBzi1pOrTeVDsGyG0BO0c7nJpjLlW4'
-    b'Bmd4QgE0MgbQSHyMHKTJ7G6SBLCchKXqY0IrtMfK7RcOo4sNlR1Ic9Fszpn1LjHhK+RkBNo/'
-    b'ht02rVRwPl40cDYsIOX7D3kuHaXipju2MWPmrMEva+HDrlsz1olObhrathhtXzPiyVgHRiIo'
-    b'UD+7XIelkmeDHm+99GYalUAZQXOiLqiqmyVo41Tt3AVsnJYHZkfMhX6/E/lfuV2yngWNgU9H'
-    b'eFLSJ2gQU2uo29HWqZ5JOlvUtBunocm1S+9yQQR+8J6f/6RL9gi1B/53R9D/hEC8BYwPjsQj'
-    b'9xISRZkTAtPlGfHK9J6b7wAAIABJREFUom80022+GmVbNJzaHm64d3wtuibw3CTzb6pUYvKc'
-    b'Ar1hEFk2TNW3Z4E6C+CMDheZVYTZxldNjCpHiSNYsvbae8c9SsECUarrZuObcae1h1sOWqFZ'
-    b'0tIbnmwIlexOW7se8DuQfBI+soZ8teKLktMkrFk9FaJaGVeCewqMJjCTco7DHPw55Q1jLiYw'
-    b'KlTP75AubtGjQCX6tZMBbCbwT8S6MEKjq3izgmVF0R/wVkBq1SQOCyZIB5mTfUZFOWPT/ajn'
-    b'+siYYTc+DHEYlYSzzi7brVeMgT44It5yzwd/xSfskWoP/O+ydbvHveKSiHhzMG5NVPQJNjYD'
-    b'B46TopxAeKApxqElU+UNuyPAEH+TIM3KHYBvGpBqnl3sYLTjBy1SR1oPvTHvZYdOo/Qb6AAz'
-    b'J9WDBY0t2JfZ7EiKaVSSgMmKIrKHAbekJic4srH5Oe2q+BPFvQj9dHh1tobNIFM7VTf0DoS4'
-    b'Zn3qcpP5fSjjjBS1AXQlJ0NEAUiVg+73dQ2IazAX3XiTMZA2+Amhq4Ydm+4rKuFyjlqHYUjj'
-    b'PjenSQBVj9mexzqyC9O2N2mH2fyOiOaYr0ZGFmDIGLqkIrcr0MpBizofU1uNlbqxIij1xmKj'
-    b'B8DoZDo9KUQ//nRrRrz5ng/+ir3y3wP/uyDoP/bl94yIH4iIW/fwW5yoqHqgTxl9fVRlsWv1'
-    b'34Kw6uXDcQLnwyQQrUlGgTnRGqvIF26CdyawMQzGb8Fylhn0EPUzFE3/PI/EjlWuft+GolRs'
-    b'Fk2/vKqxYmtjtEzo6PXsadVOmZ32WTYqvFpKPiNrDzC8Jp9ZYhVoGAzdKF7uy8JGKfNmDPbY'
-    b'Msadg67+h11BzP8tCzOtHBrxhuCQ58X0Hst3Wo2JnL6iw80xgn9OcNAjO/LsmQ6FtMeK3S9a'
-    b'8CLfXZBESXWai1qgP8BZM4mTDayT9Y2mr5EEoYgmjWe3UbL5RoqsUBKHKB0pKLpxa0b8wD0+'
-    b'74l7z38P/P8rlf7L7xqI78cBSjIP96qBFTEIUxJXTSDFq3s3qCiQaacwVhKC6om+wqRisUkW'
-    b'mC4HtOIJQE4wUczL1myTWjakxk2s0ZEVwplhoBCyXDKmyYIidMIVp8laK+/qLQV2iQ0F/cna'
-    b'iFsopjK8GT3UzxI8HII1VCG/Dm5qU8F2wqxoMdN/gGy2Wbyl+rrbtUG9dbCZ06yf286vbYgC'
-    b'OzVL5HQ3I2BD3161GDqtgmOgmDDXIxzKrx0XxZ4080KxMu7suNhX83FiPDT8Pefwm6shujzv'
-    b'phDYVfzwnGBwKoZwD9OeQUUJ4PoSCdmQR56tza/vRkr8pJ6vtQXHBgVkfHBEfP/dP+/Ld7b/'
-    b'Hvj/9uujHvvyO0bg+yLigl6UlKUYgP7HRW0LnFsy61wfUkU2gaaaIsvUd2ECQ5WwABTA0ieR'
-    b'KoR4anQw7eUCUw+J1Nqnp/LJYPo6MWSNixCgDYFLygBVGGQzsqcbKQYawPpvEfVzRvKBtC1x'
-    b'q7ikg00dicQ0gcjjgZkoNyzyWKbCx5tnginK6NSMGKrF1/CPXwmIHKqF2Vcdp+fG3N3NSZeK'
-    b'atCmH2mbe8cxt3YRdHSV1l6q3SdX7rNnuzFrgqtxEK1awIyLKw6BOQ5jYqe7fSE0IAnl+avC'
-    b'QYjJYZTnrD1NE5G/g2Rvbg9hUoJw6oa9Kf4184t11JeKbrbtiGjxHAYvAOP77v65X7bP+e+B'
-    b'/28V9G8fEd8bh3GRJlYrI0ch8SZJaN0qErmvq0C6zbDsCR0tv+qb66Op7iaj383qVk8NgvSN'
-    b'owgNJUg5V+8NqYnF7lSnIjhTCJNJBarUqb0XEvMJ0ZDNwLR9Jl1/2NWUPZhbABn9YTTIMEYg'
-    b'34IOxLBHzHNSAB68hES6S2OhQ+51OM/lNojyOZssqZFtznK3PB4DGkOejKJ092BW5qumUwao'
-    b'w5TcAjYumgymGFXy2qpqeLZLu+ecccfGGw5QLkrn2ogyF1h+jT4d4wqSR2dJCiHWIHJ460Nh'
-    b'ENrewCJt1ctzcz4oquAYG9ij4DVqQ9gN+JVBkGZXgn2eyj1wco/VTzwQBhGHvRvfe7fPvWZX'
-    b'+NsD/98k6H/HbSLiexDx0d3NXpyspAxUeU/G6QDd43xsUXR2uKyPP/UGfNEBleOjGm+BqAJ7'
-    b'uVRlJoOxJ4Mz/XLW4Pf3zlMOGeY7cANYQWGbz8oQIdvTjLQhTDY42UY44MmUfAyJYjUXSi3m'
-    b'gaA4w1+M7vWLgCpiS8zaLBSI03fIXE3lRGCo31Fl72FZwiZSb4kMVJmx57BMxFq2Y0r3DzUI'
-    b'Kp9jRJzVic9RNHW4PIfqAbSPhibQVZGmKM9UQZ1YPxedGZIQZW0kFTQfCrYyvicJNphdhaSK'
-    b'mZOt5hyshEhYpY0uwLaaH6y9Agng0NaDtzAz6gSU550NQFoSM3nexX78oxH4nrt9zjW7tv8e'
-    b'+E9W+u8fEW9CxIVF23YSSP1hF936gPh717fqHEFCTeFCH4hRDWgqnz+Xkw1ZvWHQVn+BCrxt'
-    b'lWU+Ps4V/LetfZXrPcLX3rfX5ILD7AXR69RneWCxS4UkXbDKsEICbBKa1F5pbJFJfR0bxTRI'
-    b'a+KIIGwb0bnntMkqBBMwD3XxX49zwPiUvr1spqzUiuqmJ133fpVkkw360cG+rKYt0DE7ckIh'
-    b'YA+xc5rUhbR+vG8lyFuDCgCWDnU21IXg2U20Y4qzsx28p1wjYRVtPhDsW2kxBJGUT9gjkptA'
-    b'E9HeD7UywCQfYZlM6Fsm/bRQT2VSTooKYJlgmj2WZFwYEW+622c/4f33CLcH/tnm+90RuERN'
-    b'Z6pwhjqtKdQm/XgkqdtOQEcqv7zl4lRpmqo3NM+abVBwaG26d5u7WGwypOhGotEhFG7MA+np'
-    b'iY6+Y++52Z+Y0sU/LwWE3P9rpyuYLXrVHW37DAxEglbVjo3GKFOuvMeo6ndaMA9qlJWXg6FM'
-    b'xUSO7n9kssJN0weSoNDut1IVS0MjwcgQ3fsonYBizmpSyiF6B2a13nBPXACCddIl0Fbn1nUS'
-    b'MiNsSoJ2DSX5BZtwRAsy+RQyEVT75AZRfeiBhnWDptWRQ7/dh9IeYLLNLhQcFgg96Ep5tQVT'
-    b'P5tjlL5oVujI4jbXz5JS9whm9ElX7UU05E7a3D5PJPH99M4lEfHde4DbA39ZH3n1d7w2DraP'
-    b'TXXiECdE2CMroKmpReNNzkn4hSq5o2sNZGMfb2W2tYY65fko3MakLsw5iAwpmw5HOUnFpGcY'
-    b'9Az9Vu3nEV1MsAeaqL+CGozzN3fCXN4Jt/OBvKFCfNFhSPiQKc3Vs85CiVth2cPYivuorYIq'
-    b'BQJ5jpqikiQdJlHAQRUBSmY6I4lJVxlNZYsZdG/qellutSnSWNRhMq+Bk/mwlNwBPc8UE65m'
-    b'3vA9FIjGQXWZpEMvEpBwYo48Td1ktIduI4UG/rBg2gRqwwTGFAfTk4mmxdbVDlPkpI74oiSx'
-    b'ED5OliNHOWZNpJRzQBNmom2OsMTRECvWaxxdkcY1ER6Wvh//2U947R7p9sCfg/4LEfEQqSGl'
-    b'xEAV5Ums+lJqui+2V9woylMzhf70lmhQa0ZBtNXA9rTVr/8V8121zj6r92CRTM1f8IhhyyBP'
-    b'E0+GNegRKWCqTHMQZq7mGZXPrDv+GE+jkd+YEiMkKNTESCaBBnkWKlVKsFk8msa6nqcOqK4A'
-    b'e7nT0OGxrKNWzfAiclLatkTyZ5zwjk7PyObWmFEdzhIwSFKMjqABd7zze7XeoCxQUm05oMHe'
-    b'ALaol9zvJpFB1EtRq1eLspw6OhSICO21gE2GoEED7Ts3Y3rtv9t9x0IGbuZKEOduCDEaFMoK'
-    b'h62gSbod6EoYvZjVShgN7Cfqmw/5+Ac97oV7xNsDf3zk1d/xVRFxFacPJOOEC42ilE31C1g/'
-    b'AOVJbBExOmQeTcHQcGjRomzZWzyHEvbmKe5jbufBKTgM907X/Y84qdpr33c0uwkjezVSq73K'
-    b'Wh2DErY8IVQCssGSG6Sn5xan3Q0VbmfRWlgh2zpbxdWVLg8wFQvWWU+fKqZSErr6osL5YLNj'
-    b'syLx+XyrfC10rh1qc0uv2NmJLqPeGEXuOle8GaGHojM8pW2Qq3OUxGggeJRzxcax7+CA2EhH'
-    b'ArWPnzUJ2Px7mpjoJHodp2CT2GVfAUwbfNGq4A1/L5oxk7cy2M5z4MRei0lOlNUTOzRRfTb8'
-    b'oc9JG9UHoztG4Kq7PuhxX7UH/pvxuu1V3351RDzTa3Il8VQmNVooOeWV7RgMFM5iR6rz16wZ'
-    b'7XzkRt+jIdzkDbK0wFAkOtddtDKYIRa/hpVHU9tuzXgw2mlumXM3pRUSow3hmJ4E9I7ZTdGL'
-    b'qaJhnIwwJBAcaXMjSgjP0Q9ATRnRuK5xVJ0UAQVHBJLkUSFsjnHCWtKinCcwbPqkEuu2Rgk0'
-    b'YDKNUlLgXlSkxz1nGrJWnsyEiRARHOIyVC8GN8wpTDr3I5j53HJCBBSTWe9JYyQVcq+goAkq'
-    b'rBTGfE/RG0kSz0WHGMkYy0EEJtOiRA7mHGYnR+uhZPPoBPQqUbF7/FQemYX418k+c7KJoQR3'
-    b'iLsiO2wEfVJDcLo9ptvimXd90GOv3gP/zbHSv+rbL0fgBTMEcybiIbcrymB7gbGZBD/GVBv7'
-    b'1ml+DHIwZVX9YntT2xR3w/xWeMwDFdtuALY+XjaK6YiIg16F4KkM5bj3ZUlaNgGCW1CFtT46'
-    b'NlE33UQaEU2OE6Vilsk7unxcbgOkwN5VI+lg80g5pjsS6vQGerZ8kYdqORKnNkIouYydx4Qe'
-    b'KzCBpxKBVV8wktiCmpQxWSYpJZSYXhUosI1/6T8kRIqeioaQbGcDLbCknBUqG88j7PktnA4b'
-    b'iJPfN7ltIW2uwS+PXHI7d5kPoqRCbbOBhhSdaPXVKUIkop+hOU3bBbOWjLcr2O9kFMg+5Ll3'
-    b'EM/3sKkLIRWNlIkl4gV3eeDVl++B/+ZV6d8rIl7L2uzTqp15s6gZZ8/Tc51qWkXR36U8QVhi'
-    b'83QiDxgL2QV9RSbPbiN6cyRTAY3RuGnEo7MVtjE0rYAQYVK2MRENWgMpM2XeansRq0nfndGP'
-    b'zokQUON5792Yvt2Trin6UKwa/JEIRpOqh/kSZl111jhqSVzR3M+RGhXehoFJIoziXyhTF9pE'
-    b'JVX4Ta+F9kzV9pMGV3AIIhWkLd1CSEEYjJpwwRAfVg4FY66wF9HpZSRTpLDWCQ29QAPY6duk'
-    b'c4taTED1AAC37T0mh0dIm6fkh2HE1GRCNfV08OpZ5KaTFkTU5JrenmFFlNaCZ6hHU1g6xdyX'
-    b'ZaZHOFIDMTzFaKm4UWpDvfYuD7j6Xnvgv3kE/dsi4jVEnN/O4ptXeLT1Ui2uK3ad2fQ4J5NW'
-    b'aCiYV3sOgOYbu9P+yLs05nvXaD+wPtyE8nZZ56rKd0KWs4WSruYjhRRYU6FSFSJxgqFu3Czq'
-    b'fNuYGJOYCtgHb7LuX42r2rbfI12B1n+JVgkerweUZzAQUlRzEgeys/MgTUe/2QjZ9OirXKwy'
-    b'/g9Vqc/K6yQH3YQlqw2jQeaP7SX/blWrgg2aleHyPEGjOhkU0ohWvLCIhE6jA5W55524oiGD'
-    b'qcf0FsS7Uckmiuo1oUsApWekaVexGHdPU9S+xJBaAvXuRVdMZHtfTuyOk2gTvPUVZTR6KGmG'
-    b'YEIlqGcfAFddRL9nckNQcH5EvOYuD7jqtnvgv+mvVzPidl5iZ2hIkHgXnukqKVMjy9UKDUrN'
-    b'0Hb2wSNn1pMoMDYSVOuQrASgRmxr7vpnlplywGyAER0TmyIfQMNUsp2J2u1bZ+6zHn73GZWQ'
-    b'CbUHbmR8idRqWJnwXfLWBAlJUYBEUINuYBZwsoM7rS2k8YlFHiGfR+aqFqeg2orJKnSqkask'
-    b'jmzg6Zh0bmzejhU8a0xvkMbFaM/ZSOAEZmeWOV7vqXWkDBJstZKe0AfdECkjHawEzRLG2JaV'
-    b'9TVI7pA+60/7HaoADXliBt7Ija7HEBOcsZ1+YU0H6EqPrqIJzi/w5FwVCwwjtuZnx8BMzctK'
-    b'y2I4ZnYc1baGGx9+OxKv3gP/TXh9xJd++/URuPcIbp2uVLcZQLBl0gxa1ioTndgNqpFPChi5'
-    b'ZEPabCl9O9TgJGODmjZjiiaUeBHd/lVEPljrA6RRNUzUDMGUQDTtgTZh8ZE06uxvWHBNNjvp'
-    b'WlSVvI0xz2SjkyVhUSuk/N1qO5lW3jok2duudaNk3XlG7v1bkomMnKKyrnN2R6OE5xSUJRx4'
-    b'iwjtZtv6zLlE7azrkOb0IwVElplxNUAKz+GQeg3UZ6XPNiKEN4/RVuo8ZRBzqKRr/RV0ZuU2'
-    b'ME7eDxUOTwJG6NA+PQ52zju292gnzsimjZFXnCvXc6iP5oeYHw2gsx9J97veacL5SIpaEOJw'
-    b'bgOxUQDN18UyiGaqAMF73/kzr7p+D/w3xaB/1bdfB8TDQmxoNTvGtBNvzVaoxWwOBpxV39H1'
-    b'Ptt/kN5lx13dfNURDRxqDzBCXPDMX6iSyeBiQ9H6h1Z72YojswDjqBUU8rhfNlRpc47JlcFI'
-    b'ArwSSsnUmMlHGUSsKnWQz2dT/SOdWNmOqaJO9eLZl4/c1kYBK9QRbdUlOAYxmmWpkRQdxYHn'
-    b'GJk3wKnCS+JSsNhN50hFnFC5Nmg/31o1tWTbYsNR9IZs9BFO3SyJzCHXqrESntEa8tXxIxua'
-    b'A/PEth25cVfLzfiKWs1WDcXGutowPJhBjpfPxckbm8S0JgKVxIvWMXDAldu0at0QpUWTJ4lK'
-    b'kmX6Ipy4ZmpS2FKfVTCzY3ZGPOyi+z/muj3w37Qq/SuC8Ywos7eYPuFADxV77l+KC3TT3miV'
-    b'+DiT12rUvDhVu6Td2OhtZjO7PGXLrW+n9+JZTXJwjnpAjHyKbGiaVWb9PigkOUzsWJjSCxob'
-    b'mwJ9DlZ93gjgLcXRw7ZAOXwAFJ0p53BrQaO0cWCVV+4pkaiz6dn9h8nXgeYmF+7+Hn3okg03'
-    b'ITtUlRpmOJRoGysD9YGiCgyrzpqWN01lsaWJ2/+nVg0YJdnKcq7sh3O1nVDb2uXYayKSCXop'
-    b'8RaGPspXqVVxiMZ+RhEgmROHdXGiwTWNC20esUuMQ1LkUaxroBeuxZTMxJKUohcjrTunQi4j'
-    b'sfYHpPE0gFX0oBVG3o5L7bq2BcjC93jGRZ/xmCv2wH+TqPRfdklEvAIt4YRtm0qqPvjGMttM'
-    b'+zKaWbTFHgIUww19+MXOls02xAJwythd5EAWrA6jRJmRpk/HVy8aa10YlmgCJ2gEUsqJE6LC'
-    b'UbeAGDAsWMRMFHJFKQEQ6npX1BSbBIcGqbPtrGRUgTXRgUOOzKFxfMJqoMK5BjxbWIZFDU71'
-    b'7jntw5MNhL9V3zWAuGyq/OHCf54Ez/yWfC7enBApn92IWLckRdo9qRMSNQOJicAfy1jZxh84'
-    b'5dOFqoAPS8AJd/DzFkxqXWQSAvqdqaA6SBRe5BpC1f1Y0kRNvMgorpm9wNOJ4B4zKi8TvYTR'
-    b'QmGd8dR0VDCUuJR2xyGHMHHvhN/EW3bxios+4zGX7IH/Rl3pv+xDgnjFupHU2ffGLSv7fkuP'
-    b'1dXzaoe0WoUeIXn2G6P2X6ngeB6tAwvRGF3ugQ6m7OEzB90zsxyeXNAU1aga50DLD9JzRtoU'
-    b'IcsomFj55s0z9+w3Vj6b60DpgeNUY8D1vgHdstDqnaRNFz0CsxEzkXrw2j/PvAdYkAGil1zG'
-    b'5Js0yQFS0Sj2x0nLHI2KsHiaE8IE6JXkIUC0PwJsR8ddgKg1rpWEG+LdxGYs1ZLo6BOWmQ5W'
-    b'JssCFDnhgv+DfYXrOQVZW3mckUU5tAdEBrmSG1xaOJPwOliMWSrRoX5BksZDwxbL5IkmqN+x'
-    b'KALU0/ZLsFWBpiOZNAcoA6XG/YF2H0I5WsUNtyLo8N6vuPDTH/0he+C/8a6XR/AOefa3T5e9'
-    b'WvORE9fvrzsJT0HfOJEqo1PFUJKb76DDrrTpn6WxG3GNi4bxWrQBIsnjamY8C0BdEdrgcylb'
-    b'GWI1eUY7u6YhmbjIWF+q9EHYxjk+gznoWJ9QOzg0SlFtV1BgxaZV4yhoI7WaDYU4y9RkmjIR'
-    b'+dC43NG4kgk+RdZ6T0YumIyfVnOaxFFAWLVLkzqmtDEy6BAdq19ikJHYJiRISPtARW302DFx'
-    b'0maDKvk2cMJkJnqmwVTCItiDW7QRxs2IiDIBEMUMjIJGdJyUgENETfBH7uZADZaABoWAJoaY'
-    b'5vRNJ0glnDkTMEmmWHnSCU5ktUzLR4tREtDUDjI7jZDdNRlXQQTW7hCIl++B/8ZZ7T+XEQ9M'
-    b'vmlCuCKd3CfaXSK1hhP897lQ/npjImIyW3rKA0BqRMx8qmvx4J4rTjpDQ86rEYuGYtT8vow4'
-    b'sjk4dIRADTKjSm5U1cnGyChNPFBrClD15096zKTeTfUsgE5DOJEJ2d0OzYbtwoJqn8zN4yl7'
-    b'qTPFWBTRH5ocMYH2KtppHcEDDcRM9xFQtGPrkTZcl2G62GfQGWqn+dM6X4zNXT97XiAJLJpE'
-    b'Hoaq6atRrGtRn9cyFWMoXu2ZlTFNv28AJbqtiSood2FpPPh1G8gZWslwVIm7qILGnLT7OHgl'
-    b'STtfZat1r9jQO/h91PRlSjFOsy5WUx2deFFNhFnrUMmrlPvVpdXama7x/Dzwwk9/1HP3wH8j'
-    b'Wh/+mJc9jBHXSn7MCoHD/abZe7DlLBNi/ciJxr5RrdqRrekMTtWXJ3uPtZY1XGeQaUSaAoFK'
-    b'RRHV5IUyqa5QIK3DkdHnlFwhmu5+0gugR9lhkFseaveimYA2G7mvoKBkDRSNtj6bKY2YuISh'
-    b'poQV7UHqm0OH6nhiDA3NJgoyObY1RibRqDRmCD0xyLfvT1W3a7kunbEOjetg9zu0PDsGr8p+'
-    b'r9LvWQ4Y5TzBqtxNmAVz6Ls6Y7KFn7XQVPkiNoV9SVsBC7WNnwCtn2/Jdz2upnnFMM4LTyuE'
-    b'0iXFKfLGRBTuUJd8q821cVWs5y7K0MLXgSRcsKdfkRAI2ddT+WRxkAE+QfnqhoEmsZak/doL'
-    b'P/2RD9sD/40j6F+IiJepoAVLhdjx0oE65JVHbcojWch+EKIUmhvK+3Z0dy56PsHSVhC/WClg'
-    b'0UKZqMLVtW3QxRxGqrAwFzVhj+Plh40zGLT4qeREhRUdOAXEAsLBgDsYZjJWEXBBqRhXidRD'
-    b'q2PiDgY29rSYIzlG/ERrXavYpFaq7l/e6TiizNnTMmCw4SZULeJBrmSYy86kbXaUcB2cOFNH'
-    b'pJLlSvfNNBWqkJZDwA2MPbunk/8CukSOYQ5xXjxjMouD0r9f0arWYGabqoie/5Mq6zJxALsv'
-    b'DDkpCnfN1IcgUHZPIhskZWvclDF4H58iJR0FnpP9NQtHkfN2KOeIaLUSjqIX4roFgCOibIjN'
-    b'eksdE8uX/eNPfeSFe+C/gS8EXxoRt9QEGjVbRd2QmSxpmaqX/GBr/YqSN/pY2ZQD1NiXTgex'
-    b'3BSeSSY0TO63JCUDyVCtGWogyv2+hF5nQS0hG2/bTNXbp9XrTWzQPi2NvEVr4qI+mB3UR+8H'
-    b'0PKk/HsGvUplzWx+MhIPTqov0VTn+r4MqzcaYxg25wQFeWiVEwsGMqv0FMJk8WKIaFwhys1b'
-    b'OS6phAzla0g7oxkPa6cAolG/jnnRq0qXlvD5fH6aVgRcuZ0ThCUGRwLVirq+qM6XI13/MnuD'
-    b'IjXTHBV7LoE8g9MrLt8HMps/yuIuvjIhY6ILQLZiYJkmsKkNdvyJo902SqFFIxkaRymPuQKm'
-    b'msjNfSCaOf8OOZ0JEmXSb9pGbhmIl+6B/wZd7b/0xQzcYwZ3Kipvc6msFx3tRm86s1b1g00X'
-    b'a1Yslv5pyppl6qwqBwCztMLHBFPf2KeDjNI9rDYpBjinJI1o3An9rtlRjD0NIFfNkR3x0mjj'
-    b'LGmSDZNJBtbU2WaBMKrCLtIMsDPP5+q1nTSjDyg3BaYEYiPRpdKzHeiCR2RUIuAaXDosHe59'
-    b'3nWjmsAg05tspYZ7Imkor6J5JnJywVy9089nSkxntpqdjv1qbqOhtQYKN2NwKdxOFpbdQJum'
-    b'eLT7DCfZcutkhWnvJ4Sjbh0sWE8+LZQW4XANtZrCTlrec+r32FoyzNMOsJZZxjG6YWNY8sRN'
-    b'nrpRcihIPyXTSMA9bdwYk2kDVi0WNXfiPe70qV/y4j3w3zCD/iMj4tETmbzZj6apMk6k0DDI'
-    b'bqYhz1nIgELaLnnC0oOmxZfJlADrsD/Rx/kJWtJUeCybzCDi9ZssJkkXTnxyqQSYUUnEPHZn'
-    b'tb80MgfzIwC69nw7mcEu2haYVuVpOTnBtE11ZXJn+FaSQNS7xttFmPmgu8APa4un75Mej6BN'
-    b'NJyYpSNRMoyXkreZCM5AdrquD8u9w8ImNzUMdOgYY/qkwHQHXOADPK09z6J0UTk5ka6xIwmc'
-    b'FB+N+A9REyjV90dBYmjXRI41C1qlpC3LFmvyyBkNqaA/MH4QE6SJ/KxRA243iRjWHPS9RpA6'
-    b'xEkDtDJhE42KYUpT6AXI+E6PvtOnPuKRe+C/IQX9R7/0zhHx4srVjJPhhuiJPa03DU4Ez44N'
-    b'n2D8foC4F50w0fjxEM1MQMStTfngnX4ZZkT+GbybdleU89ZLHNMMcTbuQqdl0LGhy7dkX5GG'
-    b'9gzW4KmbSXXOy9K0ZPVS3WILINXcpvYHD4Fs4PGmy0ydlADcry9tnCb7O62eS3uZMre/SQoX'
-    b'0nJjZIOcOLC5o1PVlrpPtLEsYDKyLiasbCr+MbcfbLsqCb1qEjaMir6x2IyJm848Uwv3cs8i'
-    b'PKbj0Xl0tNHSUJ0Ev1PR/o00B3lGNGjqcBGa4iKkn8087rsmCoA3GNo/e4vHMM4G28cgb4Ns'
-    b'mPg+npzHPateh01mNO5OrluxteTC1DOjtgBztqnE33jxnT7li++8B/4bznpRMJZe8OREv51d'
-    b'txHN3G5PjFM2ugCQelO6hnqezwYbFzyFzxt6jvSsMcUjdGOp/Q4jmxkc6kgCfUNJEFvHJx/E'
-    b'SNYzO5Rxy5ljfbwbn3T9vkDIhuaj8oi2xGwqfFUfJCaxwwbp53oA+dxRNiOSzWVhW8kIQCqc'
-    b'gg4yhs1Bs7FYgNuLAAAgAElEQVTgrfB7rrIPLRwU2BbuNDmZLKnH7uRJJZjlq0k7n/lmpJDG'
-    b'elqmjtKpUiOJc5QERlyjGgGxgYRgTJcOaygdoIaAibwX0NCvmIhzQTHD9jslMmuRvUVJoXuL'
-    b'xahWyq1VdcP+n0nwR0rUcbzfED2VZFLH276ykh25Jdh0PYLIY6iY1DyclY8LI160B/4bwPqw'
-    b'R7/0eRFxcRd0cep2IUqfqsi4Al3e2zwplsWnG1hgpcSAcjcu88Ftijs0BjlD8/5ciQ7FSC6x'
-    b'cpzgBp+ftVH1DHNnyLqQ1lLPj7YxIr0GUWfEoyCT0lKpVeDI1ml5FAgrtydQB2f3SRsX0uQF'
-    b'JkEE7Sw1+52szC0jIQ1AdWVrZt+MuY964uQ2nwVA2KRFr9xHS1I0UXRBGtOIyIkMNAD4p2Tc'
-    b'QSYAMOv90DQCrHEhkx5H5okMeWvbqZDJ2Ji8+EbQbhVQ/lrh39foXu3AORWyGWhAeibB6rpH'
-    b'nmq4Kd/FPBFUFCrmfmb01kz/FTNxmJPjcGlyRV3CrRS3/a1z7gN1nz81HVT5CdvHXXzHy658'
-    b'3h7437tB/8GIuCYHQpyreT9J95E2LbXkTMaveeRJqasFwmfzMDirlsb02pING5ZGgcGitCVb'
-    b'T20bfCea2e4M42NA8ijxK23LNDvQonlifXdnIHuQNbc1MrUJ3MkOej5zggVqm4boue50r2IL'
-    b'ZSVPyx1t2LVMiEYRAkIjFJItZR3JoI5IEV0N2limWCsmjx9WjXJO9mrUvZSO8Axnymo+Vfu2'
-    b'ZeyueQDpSFJHdF+ldEPHxYom0ZFerrPt1eehiDil6QbgNBFmSFqbelwZ8ayiP/WWs6KCqGiP'
-    b'nV+YVCIdEfFkQ/PVViG//OlywKFZdTHs46xFpx/sjQJ3scR0f0Z0ZiUjjqfzBraJRkdWLlS/'
-    b'xrxHDJLGubjmjp985YP3wP9eCfov+bCIeAFnmB10K6/+PBOBjAkrfAQDnqtrWA+kkwIu0DcL'
-    b'nUVkQ4CmYkWLWJR5Z57YxfLzOeEalScx6bKC57hQXYuhOAq23LuofWgWbXlOvk+uWGr+p57h'
-    b'p9GEDEE7c7lxDWwtcc0cJ1VSaG6VGitRiJqqSU45ytyawmoZ69srQt6zxlvVBR6BPpG2ok4G'
-    b'wKvx4r2eR2cdSQqdpc/UfediiMkKRuuu0XxwnweInLQpAXLeBNg+np0afVd9xyQJT7BFN9XB'
-    b'TkukXqg6kULV8zMEk/LvkEc5d7AwMdGhOx1yOnAqn6kPx0zqtNcvVIIwa3sViDJ5O0EzNC9H'
-    b'dMZTmGwZrA/2Cz7uk7/ow/bA/x5feH4EL1BY3qBuCxKd97Y+0GyV2BCd6Aeb6AOBAaet4U74'
-    b'ns7s9l4Y3Xq7Pj4evHAODwFFa8WRvjpy+oggBlTaqCIaLlqMarL+t/ncDU5Axw53S9QmCegg'
-    b'VEafYDCNB6k5EWT7zukYqcYgdMvVLKcLNmzi9siq33gihRCTSQo2oqVr378bSaRCUGigZWRV'
-    b'vG48tWkZbJsy3ezJWXpsn8VcePdqFj1lU07CBsIxZkKI0o9PBM6+8dHp7ve9bnRQdZlGGdj1'
-    b'0HoYNkF5Br6zwlUfjsZiODoLbIWQmK9CZ9871T5pziTcqlHFxrKeR+tBCTaJBZq6TEnCKK0o'
-    b'io7EFOvFRGjVkdqJ3YIgsxEXHGLQHvjfc9X+o17yuAherpJVDJf9Imwc6cRdAPT69WxhsAmj'
-    b'F1plZvvJ4l/tu4RUHbARIdOwjhNTB7mq7CrervGfvwca5beTBh0o4vS0UadRISmmsUJ9EGvS'
-    b'1Yhlzq0QwlMzr8MZmXGDP7PICMqYe6v9ACojWkagTpm8GBjOMhCaEp4olr7CcZiomZW+O2j9'
-    b'0AT943TyV2RjvVTi4KhknodMliALYKEmn34OmkdUqv8IVaBjciBm6DwdMRd9y7PuacKjkMLB'
-    b'PsFfAx5Z3q/0i1E714SRd60IQOlpw9pNTG1A9C0suZGN6+HqdeVZZnEChAgjGVHVcxRHfybm'
-    b'vD2O2KBnrCO39jCYNeikSIiGdkCrFc00rOUSG6KK4OUfd98rHrcH/vfA+nuPesmdAvEts2q3'
-    b'jxV50xva7Dk2kI0oThd8moIsj7vQKuaWtBLzue/oUb1mvniQkBhdxu92L4gTTTSrSKwCjNlT'
-    b'cPw8NlDmuumXPnGPvOeNArI5qqe5KJfl/gQbF8MiglOd/jzwzCB6GFvdK6kCOWfQt9wzja45'
-    b's4Y9KrqLWQsFpeKnf6HSXurwYhr3QnFPpiRHusecTMMkBK1AwMY1ASsMyxU5SUhYZxILzAFi'
-    b'ucwenJIqZzXhwQkYXwp3DVq5r0a1WSowfIGSHb2pCvIu0YtS6dpzTpRzADajp+BJEzBQoTJ0'
-    b'RhnQZn6x1m12ADYsWpxL1jsVR6WLZCRAkUPmLE1S8iSMFLOKmnX25sfj/5aPvc8Vd9oD/7t/'
-    b'fTOJGfdlwi7OznQ0LfjUM+I58lLZoLAZgqAZhteKqx/w6adi2Yhj6BhS+yix8XRDnQA4RUhg'
-    b'cVuD5vpoBItQZ/NHIM5Wv7RKoMqqaku7tj3QdFpc/jNvxZVPZpQ0a+uoslkGRDgrj20ekdX3'
-    b'PCorPJ8HpJEJAHXyJE6MSrbQz2iVZAIUzNpwnb1XZKjbmPX7bu0I75lsaoOh56B1rIxSZUuf'
-    b'1YibvUEPotd+yFA/9JSjEWYBz/FQNBgOXTY5TwageFgOcyPa44Vq99FYFxc3Pkk40CaqikjE'
-    b'PIMU5j6kD0dyUl1RkZ6VDsyuQTN3IABgiF0T7eeHrElSp7LoYCcn3zlWBA9CqNWMofYWj2ga'
-    b'EPHNe+B/90L8T4mIyxxI6py28sDOxvC2We28d289N/QzKiy3JS3T77PaQUyqfuzI8D2NEtN4'
-    b'CdT2Qh1/g4/0TGGE1d88b2iuF5BnAFG09SPYSodKlVJ60WOjZJPgSHe02wtUcbRUVbLlOvGN'
-    b'/ehQuRqpDcB0wpGwUuGHgILAUsxzmn6zTwGIG1r2ODgXc3Jyv3aWDcYhQwGoOXmGYPmOQc6J'
-    b'jzFuEwpApdYu1WsAni9mUiGagJ7AhpWLADOxymhVhqMxa3tFbeGFQ9oZOUz2tcV6Oxqr5k4b'
-    b'1+2eO4IgYmJawCYzYXn+pUPUwA2cdqdobPxGklKeU9oETPbemJx0H58m48R2VbQkKmay8lOQ'
-    b'Crkqs0VvFzTKlsJFRO+bkRQOLvvY+zz8KXvgf/dA/HdlxHNgAads39ve3MiPWqOn14XrRwTg'
-    b'sDCKsNvx37UczfOkZTNtbjzbuVL60snpKkjW9v6aPCRvLD6d2G0OUHeeCExGCvUR1N8X5APV'
-    b'oz1XaOyiPuZBbfMWaHgQFciNXp2BFRqWPqJW9+gn9+sG2DExOf6tbCOgpplo2R3HTQndvJ7N'
-    b'ntO8G1jSWEx6HnQNdbSxJhRHGwmTzLuvZMmNpc9ajRUgIakEZvQEUZA2GjsQE9CuE1agY/jg'
-    b'RDzJbvi1ckQl4nUERciYGKR952O2VWo3TKKnMgtELwOKCRDTrS1d+iPB0BQEtaXjz3mI62FN'
-    b'EzBNGhTNCeODzMSCmq2NqAkqExJh+8Bow05sjhPkR8Eo/UCY9+vnfOwnPfx/sveuwZqmV3XY'
-    b'Xqe7Z7p7ema659KjuUkaSSMhCSQkcRVGlpAhFsIQMMTYYCGBbUwRh6RcsctO4nLscvlS5fwx'
-    b'wjhV+ZHYcapSScVgguNgOxhkgWx0K92lYW6a6Z6Z7unb9L3POSs/vu97373XXs/bgxG6zvyB'
-    b'GXWf812e99l7r7X2Wm98ofB/of9h/H3b8UI2M0X30Z/uxNw1Ah6Dg2vaAHWCSienuYMRLYlL'
-    b'Ib4W4oExpFcEalEdABfj412DUZ5iWEiNektySVw4ikGoSAKGNZ0x4A4W3g66ap4+JmUT9dt8'
-    b'RYjm1U+lTWiNblsJbd/VyC4XOdnP5B5Qs9IHliPFj5fzpgJysUBbC4O4I1GT67CBcGcoe6Se'
-    b'hozWSJNZ84zKivD8vW3+PDMVI6bGLr4V2VHQcX76GuXvymspgyeUN+fyimyeXmmAv1a0QmgM'
-    b'RBvQXXPgaJ/mmNhfE2W8haPMMPqwaNHPufmJTstpYBPljktnLWJgtzbwR0LD8JfyNlip3Xw+'
-    b'swZJw6uMsyHGZMbff6HwfwH/uevP/o9/KRBvrVMGzDfMwajbHyYNTZuU5BxlY5siNtirA4a9'
-    b'sX99bq2EYd34+mtKufeUyXxU4IcFmoMBiXO5RsNALMiAvAvouGp0e9XOuLMZkRZ9FuvEXwuJ'
-    b'dCdEMShqTUgxIWZTunu60+8B0FiY9k+Zc4mcRFeMsrqkVBANimAaGL382aII5fhtTJbYofl2'
-    b'zW8aAKoLXkVqfDTTrBWhi5sFaiMDNiKnZisIFYXZXIrmxIgscT4jrAhdW/lC83uV2wDNgreF'
-    b'G4GFVYZrcOnuMBRUxRKRZSuC5a/RyIvLSmYL72BaPVYqKiX6NcGlZk5kpAfdKjqiogst8hDj'
-    b'Hdzi2mWmeXenEe0qnoyvGHVLh37Q6HTdpmGefvRbv+4tf/ovvVD4vyBF/x+9FhF/twFHiuFz'
-    b'sf+W89PjLoHBFjGbYeh4NaWjsUZ1EMWfOsO/pdmAgTv9hppAwSgQ/XDn38TTcuB1UyZqWpir'
-    b'F92MIcJY53KgeYCJK2b15G/Jg5spiaziy6Lj6oYxBSUyS3zdXCdNojkylb0hySlopZ6p1W+e'
-    b'6NuOlwhRMlLijivYvNuy9+SoMbR5NlMsbBTHR2yoBAzWLV0jjmqHCilwKNHQvoWHPckuB1K8'
-    b'fbQNoZQJqfIY3CG0Zz89G6VJSdqOHHNNuUmIqp0AugENtZ3oHnnQ/3/w9gS4kOcyPF0BDpIq'
-    b'UbQUbN9Kj/ydQ7Q2q4KDxMzNC7TbTemNsH/33RtDciAQDfq3tyqNNSIEHaWyR4iI+Ltf950/'
-    b'/toXCv/v/5+/l01Q2JH+4lLWvqDnYSjNXOB7zqcBc0dIOmoGAHMgRNTDTunGwcFkniBOS1zK'
-    b'BGMjSWkpM50gwGq7lqN5bTM+mGZB4dVYPhZJTwvTaCE5cjEVNMygTMkP6BMtZdKbV8YS+y8Q'
-    b'KgZgDHQaM3elM4rJNsjTXYIQL3S5lCebX80WMBcclWgwAVOqoCQit7J5QqNfOC0OgktrqC2m'
-    b'pjjrZedF1A8/f5+I1hAhNSKWw29/hwMh20z15ELP1JRwIKTLIja2n6vxCLRFBeYJVKMtLFF1'
-    b'i1SYjb0I4+SVWM2+BknIpkSa8M0yz/Q9V+dp2jtY1zXrfTIWqWaXx+wJool+DQGQ9c3pWXbB'
-    b'W88n1JXSkFhnIkZE/L0XCv/vb9r/6Yj43s0DXzTfRhzKZM5Ru7vOf3cYLFI8pY5vKIeHC00A'
-    b'HCGVjR+4LBCLxjNJB7q5UIEhvpGbIxm2aiMLUUNHteFs41O/D+00UOyOHR+cYQ8DW898PGyQ'
-    b'BtivvJqxnlTrzVqWtRbl91gSE5PLmVvpsrQIi/fDBJeGh+OJnDA3dweMMGuag4FXCef8JQ9S'
-    b'yLJ/XUGWmAUcG58IjRfiQsMm4LohqgFGy5RyzBmcO99AYcGxc1tv4uWQ0uXVo4KJ7EiIrsyV'
-    b'6R6uzENceVnUwTANOhywxhi+1un30EzAxYtoUtw2vxEYykxDwqYnlAsIqIombYNtlboN3ofF'
-    b'lmDvI4ynMhlGBrJeLpxyRL2TFDybtDLxva/6Qz/+0y8U/v+If47+2X90V0T8HVvkIVNtWb9C'
-    b'S3XyWBWMKrivWSF8UK/j3BwrRIQRJHWuLQo8iNaxt3CPVGSqNiy94txAsMbAzmFAlf8095jO'
-    b'hs1DHhn+EsgXySFtnh5gPsswO/B2AOi4sBYROmSoZh04Zf9U4AkJW0KJVB6iHtokbcKGRjw/'
-    b'WVY6Q8/KMHxlBLPXFbu8Xk5RpNNo1WGCcig5ABRXIaKO4FQUVgyLisjNGKtzyCCgnpGyPZPc'
-    b'FBsyLRHRrL4LlO8SrBWI6MO1s/tomwhY0v9tVmnZ7w6Ou3k1g1I9CtPDi0FuctHftKwGdqtc'
-    b'On+nSptN92CJ3esNG9tbFGdEaEipegWY15XFkBA9S1sPhD127YbNtA36wIKlwjX7xfydV/2h'
-    b'H7vrhcL/e/wHEX87Ig5biFoyxLPbUhFmoYa7FNEGnJ1Od4ZhOAXuzJzKNVHc4nyJi24a4vKm'
-    b'2/rRdRIGW6663lCMrk6uW+yTzsGmEFWxWVPgw/fJxdQOSTDG8O088//O3qlH2t+Hz0BnkxGH'
-    b'KOTl4y+ajDkXfRqqkS5JVK4e9PnhhK7ixcDgJCpMv7yWP/O8I0GUqqM3K3LsYo7mxjsVx95X'
-    b'qV/RVMCSxwNiYOPchC/seLFe0Mj0k4nByWLATYOzhupHq2ugcbIXSCevhWbqiYpINVFcvUtA'
-    b'zpTXqAAjYmmmdR9O/nxp3BL7NApzz3V4kHbsZvgdzoqATpkakjTZFukmNGokbI7ku8LWZFth'
-    b'dlpPbaFcsDC89zFiIgeJtvCaFf36TQ62jw/Hqoa9UPh/D9P+OyPiPZup1HbGeow3a0wjeY6s'
-    b'm8zRr+48I/y3ac4smwuoiRaF7Vj9FIhiw+rCNKGXpkxQlMliBI3llUAfthM+3UjAdTqvewis'
-    b'L/m99Ph/rVaJfuF1L8X6S+HS0GJwv5YUxhLHY2FXolnXVyRB6wKrVS2T1XJGj2q4kctp1E9Z'
-    b'1t9MHKzDcTcr5HqBQb84xPC3szv2NgxFwvNMtHWMv5OM0tAtUeX/zvKGwLCUQDPNZZTgmqmB'
-    b'ZaXloPA0jQhPFQ5A45c73GzCbBFGxFQRxh7/DNm+yV+Sn3o9TskSO043r7QOo/XtgojBRgfM'
-    b'j/lAU9UaO/RzH6k5dMgRiyolObeaRars+YOlLSp9rGGprvW/vOdV3/Gn3vlC4X/+//ytMlA6'
-    b'gcsgElK3Y5By4bkAyU/7ym7dJ0/haqjSVuE5zIZja/crrACBvpgfRhetSoGu4Godw4WNWMYW'
-    b'dp4PR8bT+3n1rSS3sZB+M4dT4QAOFhTRkS3lNbDeWpCiZqdN0+BpM+ebOM6CzjRJRHqvxTMA'
-    b'6huItkVRzmI2jEroDAoUopNSMorhppGuf1/AXjFtQQpFyqGuTmNeKx3VIpXdLXKUi5e3aai2'
-    b'tBSPDvdFavBQ/jxk4K9IQnbkXKE/bQ21iRS8q0NQIfHr9J75LkBCrpjRngWRYM0erE02/QCv'
-    b'moelNE8iBlbMfnW6PyusSCPZEvK63U4f3bVZsKaDRptEzKOQi9m2DofZYlsaJ2+sSW0B/9YL'
-    b'hf95Tfu/+Fcj4vUsjBTs3dK+fcKEVrjF9Q6tzWIbEX+hO4IXlIFVFWybdRd20oSFSYmuHvKc'
-    b'o0Ar2K4rXm7dJz8JOmRwEFOJUXKwP/EYevnI3vYgKSv8iltwwyGPhYxYMGip2TlSZBkDwVQF'
-    b'1V2xR8tAYLtEZyo6AeDTdgotAEuxlaXJTQBEJEa01cspyY5a+HJqXGoS1GBocqRLcKoNCdJ9'
-    b'fD/x2yRK9taYSLw1RtRX/vv1ywbSXKzrfGBtWdNKKNsTMTrNqZTKBwKMmd+RYr9pRFIsL4fJ'
-    b'UQa21oY+N34lpphVkSdbt1FMzQbaKCriALkxuhEPB+Yh7V5H/im1AhB+66bYNWc7bxE/AtpO'
-    b'YLz9D/hhSFA4imlSacvmH/H6V37Hn/yrLxT+paL/Z37xZUH8zQacWQgaEtKATlouZHY1Phr6'
-    b'JJhGwWREtweXNehhtCVC9rHSSxDTSS58LAZmIm767+lyBYoc33MG3M8F16xXyWoSEtXRLXQR'
-    b'XJrbTIBKSSiNYRCjfHZSYFR5DRX/rZuVAuGzQYNMxXiUXs4kyGIyDmExj9f41ihudPkxIE0g'
-    b'D2l3uVCsRwcL0+auqtQ05VHIBQC+8TEFyjZ8lGwGquFdanbYoWkqDDQJSGGc+zBAvNk8PcI1'
-    b'w8U3SISivJ5lL81lwORjz6Ai9pH0SmZF1d8WjGY6R2OgNEDPptTS6MVu+u8woWKple2AggqT'
-    b'B416Yy9StgZQnsAq9ktnO21Q9VKAMUihIunmLlUwymaRzhwH7ivO33zw2//ky14o/MN/8Dci'
-    b'Yis83VuraXPZYn2INdcUvYQ0pfwgTcyUe5/xYRmk6ApVsIebiWd+ax7kLxQ176hySpBMixxm'
-    b'9/XO1wMGnUCZdsnhZ8aslp5dw2snLVxcLTxi9iLWxtqYa4JaQRkE+i3bC8ybbNlNjOazZbtI'
-    b'qCgQqo855BJEJ0JTTeUsGIRvJuAgSINOEWLPS2fbN7qrYsLUO82OdN3325sLcRG0zfaMMEAa'
-    b'E+ZJeFqly41hn1Bpmx+HXEUzExop9tm72fp32psWk2rgOreKb1OcX0P5TlvjlXxC6Cqq9CPp'
-    b'QZhoKNqeYqw9RLWWdlKF2o0YGk+zFwoi55Ak36wNo9URxpI7a13ZHSQtalP9F4bTUvXd2ArE'
-    b'33ih8Ptp/x0R8WPOi7u7WaV5avThQ2K86OJv4cZwuVzrighTN0711ZHLCQnCcqfIRVZOqCRj'
-    b'OA1nEQrM78kolwc/VKvqrkzttGrRS+k7HpEJU4mjemW3KKxGIzB9RWjTobjpzwYv66nZQXBZ'
-    b'xTH5g0PaQQ1PQV7Lg8SporrxieUzUBcHGZLsqLA5pGFAV0yzFU1/TWFYeUXdR5aLzwVbIZLF'
-    b'6loIOGVGqAY6X3pi3oNROrQ8W1WfsmQuLY8zKALN2hm2+gxIk8beYAOiHZIHS/kiwi7HLIwd'
-    b'BpOM0gxGov0q4tJpiBBr7bqSZnZv2H0wsskSCjIWiwNSu0eSVqGtz7bI0esOhsP/pgjxhC6i'
-    b'4QJtWAAtHrLwbEnD7r7TLgD4sQe//Uff8ULh7//89e7/3B8RlG4AzQyiRDeK0YZyec1zH674'
-    b'pZ17s/qiw6Dqw9iCW2DMSSrozUXMsR93lkLIBUa8W1o6MU7HfutlGuJ+5syR3P9H9qYKyqIQ'
-    b'1iubigOXdSaKP38YY1NpMtKPY5tEUK1dNzRLIocpe8oc3E0s+Q8o8azMa0sT/Q4rvp6NqVAv'
-    b'eBo2StCInBLZemND4hSCIwWbFLg1Fws/eAtih7FDm2DquufN0pxwYFecP6lq/lLoXraNezkW'
-    b'UqRg3h8jjGF8eb5hBXAYNC9iQBFewNeakvx+MIvXFCGrQ4xC/az3EXxixuYsczDAYBSqQ0Uo'
-    b'YmDg0+WP4CAzhd1+bdpuZV2jZT9Jg+ZxEGQxxD1NAgwdjVSQp7/+QuFP/9z5U7/4sxHxLTNE'
-    b'WUcOavoSTMVwQTF54dq42MFO4jB8j3TReS0HCgP6C41y0RTHsOihJhrACZtbxT7R2DmQ4cN0'
-    b'mBmrdZ/k4qiqgMxF5ngmMeN3KZGNC/REhEFxrGjGRGWK0KikbrENujC0yXT5YcECrhk7QZIg'
-    b'0dawwk2VSCKxJEhqQTGbEJh14STnC856vIJtCN1E+LK4saAAOM11UrIQSrOAqh8oFBt9DGuf'
-    b'kli54LX2oRAAHHzHo3gOI81GKnL5+SOV4e9pdW16y/7Pmt6oUH9BS1BosfI+E4dNdddMn49m'
-    b'ULQAIYpSk+l3Qyb20hWyJVs6yhIQCF0SF8urLoH27BO+EHRoKBhSvkY9mcWYMjdLyTio2YJz'
-    b'/jlww8DAunCYiFm+RaRkTKVYy2bGtzz4bX/iZ18o/KuifxMQf40N7UUtkG09R5z7Bpz+aBJr'
-    b'O64xuOzV+zky9yrTOTFYEc8dKpoDGAQIbhO0W/snumAFokVnsTnqfDPy/IjGyeXPFk1NMbiE'
-    b'W/odGmVidE4Nho/iFEcbvczWcVehkUMY1BxwPjoURobi/siGCnSJOmef/dz72F3lLBVCG+Cp'
-    b'X/zkurjmwhdS/xyLstF4IPqFrJ+weqQ3JXhJK8S0kYIY9eIcXvdQZ8kQ/wLX3yOqHbEKG4ES'
-    b'jT33Y2hBNiAX1+yUkrORvHBUYhgEr7fHhbYS6lBYr3q2mm5j/b9TxU9sKYQtGRCyyoZ6z2Jx'
-    b'Zx9zvLR865AGE+ymaRAkkkPyIgPqKbsCHa3rRI9YcFeY1BbtUfRy1phoeFRpTNwZWf3z117x'
-    b'bf/ZTS9M/MB/z4ijWbDUZmQR25OMxdAcDr5AVJi4wX42iWnmczutirAjd5vADB8AhwagTDmL'
-    b'eYDKQw+402zR2YXfzTar3DbIqIb9BR0azFR4mUrSe3RFfwYbII+7pg661C4I782k0Sk2jvat'
-    b'F18AoPsQbF7LxlddzWqGdPugmUrnaqMBgLrfMYqPvzErTAqo/Hdhz0E92zVmWVx+O8iJ/Nln'
-    b'XQTFp0LpGQ8vOzo3mxrlxESyXtjdV702Jdj4Bbg1E4rYD91XHzBmWfo6deneRGjrDeWoKLXa'
-    b'ZrsnjGmR/J3IyAt6mBcLqpPkgIRB3tBL77Sl1KOOczYJ270t2wBRt0QarcMwuI5pxyBeE2Vd'
-    b'kB0EK/t9mdbpFE3VcVAGt/n712tdM0PASimWJhA8GhH/3dd04b/zp37xtUH+RaSVEVcV3FpX'
-    b'KHyKWN7A5fCZal39hsOMMpNRDcTkl3T1aMnHtsXOWM4mOHfu/NndhNkYJvtmtTiCYUH56TNw'
-    b'tlZMJx0WETOFbbRwlAq5mqFQaQ+xCUpeBoTZGLbrwqZohYlDoIrq3FCXduSLkUffLSlQYJM4'
-    b'symWc0EZWIBOU3Et+pHgTSm9bqvNrrtW+olq/MTqFVGCfBIyMQprQQlPok2Rm+J/MaAUIsSK'
-    b'mi1vAUjfq2bYb6ZS9ChsiAMBxQgKgujMg7ZZ6d1MyYBPInIwV6aICmrGLtKN7vfgNh4ynKBm'
-    b'20ifK6SINvoTPW4aEQVSpwha1Y+/IG9IGSlgxCIi684Tp0K+Ofr1+aMO+g1p4xK8o14govKv'
-    b'0dz1A0IMc8dmQe+qA/vLr/jWH3nwa3ni/xsZovZ8PSvxFbCzPqVbdVn0Tb+OAS89hJzDqp77'
-    b'v1dBlD4UdlrJhTdENR5itAZzmYhtZ4VIIdXYvZfZqx+Qhahm6l5/xvOKMLJpWFzY4+fsAR5J'
-    b'3FdreBH3QaDh1TZahVrl20xwpXzveTpc56RjcFNwMTeM4k4of1dso4mcNIaiULaXFwyUTMou'
-    b'ewizWVcHkHYAACAASURBVLcjUNYJzYyJPgmVaNKpkcECBDcXiSE3byxhObCYnUVcKJsw2iuh'
-    b'AkFNoEaTcttU7NnGliL4MzV91PCTel8JOgSOrRAwc+kj18ISliM7+lrVOCBhOPLiDbWoVUi/'
-    b'4UQNoWsGYIq60ULj3sIYVZ9Sv/BoRkC5obISokGz6gaa2hCxWhlHXilkUP5sei//zddk4b/j'
-    b'p37xj0XED9ls+oVrNDsmtQO2wNJpsUW2ixzZfwpM3UlGs/4GMZTQh3nzUAKiTxiBCcx2/007'
-    b'5dzNhggAIA561ck8CJsNDrqHrsYV5zczK+UxcKFja5oc1Ex45aZy9BaGiFnYlHk9Wv5uwYTG'
-    b'/llRG8PAtHqH5ZXrBJ0XoWi2nPdk8tS2IJoRvmw80FJdYAvPTZy+4XRZofe+huHuZzSaRA9s'
-    b'h9AxjFPIivvsXEhnENTOYfpMAEuXlaYeaPG/uteO3Gd3mUcTDLqbDKG2UCo7YmfiNt/fgrte'
-    b'd51G2ahsmiAnuGO7WaQZ0yZYNCsMC6E3K2GoVmtsCDJctBNeDtQmVtIZ/YctTRY8DgwZ65sn'
-    b'Flq5QUFwijPpT7z8W3/4zV9zhR8R/20733Y3OVlwmqzErPLPvBn1qW/PSBUWZQ5qdPF06A7W'
-    b'CqD6uCPCLtkx5QNoV9D3jWG57cS2lQebEnMJKbRz4Yaa/OiaZHDtnBXVlaZFalaMoud8j5P7'
-    b'JrS4pJ+hFKPWPLgo74TfZ4EoDZ/abZQHqmThKXtTsi7FThRZetLVRAcMpho5Y1bBQraGNL82'
-    b'yA57oTg13MdO7/ROraREBkMaDOdGH9X+Ws5PA/DXkC11jVKz7tkh6IB+nByoH53Bl0nk5CjR'
-    b'jp0SMpByFQzSugLNORzz72jBUuLhAJ1wN3s5OWTGE13i/ifWJRSlOwbPQceCFib0hkM0/yi3'
-    b'rcHyXcldKZ97o582Dz45hvET4TFCk8a7xlEN5JJzH+gwaKSJ35lE4a98TRX+O37qF3+GwW/J'
-    b'F/KEGNJ5Hxhouon3uq8/ZJzM9xZpgn7SOhscBM/sCDdwprKHyan1O1fM8cgefqMVgwSAkoVb'
-    b'mxkMf8FMslKhPZZoUowuRUesQDC4DqYMcEcmH26U5sf6OVnUyBPPENFc31rTmLcumMMA6oUx'
-    b'YchCuOJERq8nh2kewqwOoufridNZ1PjexE1vxK09zA+pvxAOm7LylxtB9lTDjfp6Y2lrIoki'
-    b'63h062PyDqD5Fji4r1EpM9eNlVVdVjqqrZ+XzwhzxLHs09OscOWUPqVBFj32SVtl2QNgBg55'
-    b'2QqYQqULHg5/4NjwbXRsgTPfjyFgi76lgAXVvNFKNRKR9FwIOVmZ0zWHRFmr7rUE1eth+sMU'
-    b'8KoKXKsuxrwfRoQPtPq+l3/LD3/v187Ez/gvN0CXrvh2dSvaajlgKgXTg5EEMdTRMv07pUsF'
-    b'x/BqrY0odbLAYeMnoHSFzD1n2TFhs1FxdEIohwWhJRBTVHFZR2MMiw1ETARZBkcpMMboKDsH'
-    b'QsY8ufwnxKwwBom/lc7AQW45nhWSPU702o/Jk8D4ReQVwUnxjFYQGjkgcClBsaBBd4QcIVxT'
-    b'ca6NmnVBp0uam3gkWXtLkyUrOlBAWhll0WGb6HGt+Xs30GmGQLe20vOiRQatsBY9hjZhC4xM'
-    b'a5EpPCtrUUI/lc3znh20qIhPs9SuttDQQKMGnlSryO5zsGmCGrzhs0HQof8lsSFFN6TUebh9'
-    b'dvMaehdk42qnJNM+QFyHW0+/l5bt8Jsl85mPRrE69dEy3Yy4DvdQ7+8cHqWNHuMvf00U/jt+'
-    b'6h/+ZUS80n6siYehgYoi72cD9RJCr9VwEE2CYRBjfDbvtfZzVU1AWghFtvWNGLjVVAuYpTCL'
-    b'ViMYAz60/8cWH7sAJdOuJMKgLj3sh5r8NSErScHvQkKKTACdSzNiTMgEBP17oelgAyBF+BxC'
-    b'7I+NBbrbR6PblKDiwCihthsEgzYlZ4N8sSq8i28+GqAU2qiwF5ziOSEXN1reYRQ6a9OpoaHp'
-    b'6h0Ag4ih2P5Cn2qY/fKpcDEVvNFOZn5GJMJa7HoptoYsJjD9fekKbBMOaxyyeT71nrA0YytG'
-    b'mFfDVAm/OTv0hXm5ZqXGmr1QwRmBTRoDU9Gbg6ooADiA8wOVvc0NdrM9Dwubd11hpe8ypUHl'
-    b'FlsPhY4+jZb74Z93RAy1KuHiyRBvedk3//Ef+VqY+H+6i7aQDi+cbkLg44UUEGn9Ea6Z2Dzs'
-    b'ZnWFaHn2lEmS4b5kWNq2VJUhFN77ToI2MxZtCTBPFhzH8i7aVY7DgLKzVkkGFDS9NUdc8v+v'
-    b'Fu71rmRNxGJRrDX1Nb3HWIsZmlTg5GD9kDaxy3YLqK6BAId8pzOymxoSOPh6nmiZcFwyfRbK'
-    b'2Rv+C50dFd5VaDJunNJYP5PCXyIsyZBFoZAlTIFbkZ0Fzeeh7pOdT6+pbXOD6Qsd2uaMxgT3'
-    b'/526106zFiucVTML4+DKt0l7LrAL9TkxaaJl44DomnyEyRbIGhqRwAPdeJKiDoFSGBktciFD'
-    b'sz8oggpYVp0cYKlDjUCuDU//3weMg1xMHIRvufeRdTFoNEPzY6A0LpQhRKB/MP7rr+rCf/tP'
-    b'/sO/EhEPFD9yzjO9TZOa+MgyN9hlSQyfItgc+laMHE8M9KhLOznOHWKz3HROgnrLOU9cNRwa'
-    b'GOlQatfAfdLUMRo1OpuzYB9iMotLC3BtXk+BwVOX4NPHZF0RVfzUnRjnvSUIt6mvehOB2vds'
-    b'F9T8ettlxiTrvTgQ4UUWVFLok35oKSr4sqKGzHsnkxBJqFPXwKZsTLBnvj0R4+2m/uRkyL9v'
-    b'rWh7oLanLdgMIRdijpGG7FFz7qOtMU/f06Y0lNrsVdZi4d2jn5rx52c+lObCww4QY4wQtmZN'
-    b'Rt6RI2bF11kKWfGZodlLhDcW1+kcA2MPpJ/RzosaQqb46Cb8rdEY9WeYQo4l+L4FmGnsr6Bw'
-    b'ST0JqmlTf+Motsss+S4ZTOSMRH3zy77ph37sq3ni/8mCF9EcEhNrhabqQzGnCMe/oXJ2vVgq'
-    b'P1rV5LnTyxcHac4cMq/H66RyJQhWXsPIWEJ3XLvZav3hzjSKdZVknr6WLrjBtNucwTiaShIH'
-    b'H1GsNifkpqHcqLG1ItYE0wPDVOjSeIlFbEMonrH3rbmnUeM81x8oZILdhNtgYOQ4CnTuTm8p'
-    b'4Imsja9MlZmdJvryRdG/ZJqJY3pJodL5JSUenKIlB2VLp0K9anDUnBvXMCuN4dCk/yG78mWw'
-    b'IcH0lABmu2Tcsw1EWR4Naw24y9ymazgdZj23usOzTIQ3G0YZozdZ9t3UIJIGyFN/oEEtKfw+'
-    b'BwNFKaoWgxHxhOCV+Z5gNXKiM7qywujqn6jtGVBRiVkSo6Jv+wtr9C51KKsx8RBTLbQCgr/4'
-    b'VVn47/ipf/hziHhFCVFoF49/tqjre5RFysm3HjWEo/jj6ypVbQgo0JZd6kOavjdNASsqrLvC'
-    b'BFrDjynmlR6xWKjFNZOdMViUs94AdUPNOPmZ9DJVB82DojZOZqOBqnKnxJkPDAwShVFAQjUm'
-    b'gd9VZvR4Vab0woxLk7YVlMbSqJaLIR/aUlJVg1PuOfq7PLV1Fe7mtOfOvBMMk67Yg+KiGEJZ'
-    b'l8SlgF/Ir+oRQvMFKBoB85CjO9/XblZMorotAGpoVFtdxEKjbSgZmr7WrNXVxFXWlEWl+abJ'
-    b'0GbLFVSmoBG4jg7ITAd1G6kmgNatC8dooRVMavlmb/rLBhbMrDBtckgjKOZoVWqhFmyC0OUG'
-    b'06wDDtb25Y6nLzXobBsbjcAKtU35F2yD1ELmajRL5xmtesPL3vRDP/7VOPH/Ge3kRupJyP43'
-    b'4IhSzyD7tRnKJR/dzrF0xG4KUkc3huP125UkEZLZeAQT7xxdPK1IBpyKfgRDqo2t8oXVXbv8'
-    b'WY0mFmiahlMmayPV4kZRjI97mFgpvixNlT5KFIMbaEBxN11I3b3zUmDdHQ+1Tc0Xf/ocSrPn'
-    b'9JBsl7692wf2yi1Nsl3VFHfB+QPSOOExxYPimlxhSfaDKQ0bW6PJ9n79/WoSCIFqwyyI3jSV'
-    b'rS8HOJ5uiLNF8tNwPQvqhU8zkEhUL9UWwTnP6c4nZEBg1tXAAGb0zGVBU/SFh+RtaIwxW4jX'
-    b'fM3pIDTCLrNS3bkyJA2B4dEZvjkrLGdBL+tzTfO9q5ivTi40z5CKS9FXaJkbEKMrY6V5/LsT'
-    b'ijo1P6bp/q++qgr/7T/5C+8m4+uF0BlPuDC+z+jwsS5QT8WsmJIhrIFPKupTzbJrf2wvhEPn'
-    b'PgMrYxlOTnfS3DFKfKz1H07TOcJM6un5o2SOD18tEKOo3f631MQH44ffAaayclaXiObRnoHn'
-    b'xbXW5EOWhsdu+Cf0BuvGKucl5Lu4uDwalBL2N3VraTjoML+X3ACpOyUVxRo1T1XpxhL/C4Gv'
-    b'qSCxfFOmSZeYBRN60aevMjmjNwbGVrEoyxklRXL66FC/hbyqWObLFIoFaRILosMR3SWpduyO'
-    b'mR20YnfYNLxwpsLameACJMrZQIyp4VXb8gCqvw0wnHbn+8otEZtOKFFR1YNByA82s3SLnD8/'
-    b'ypGhqDFJ8/RFhGY9ituaboXrdlk57279UT3MtHtZALPpQa83PvCmH/zRr6KJHz9TYPos9ohx'
-    b'fGdMe6tqLwoPFZpPHC1EtnOCHF1c1Vs5bR5o3ndWF1cxGxuIOyMLTCNjcedn9UMrU1x0vzk2'
-    b'Qi6rv9G51yFlaVKILB3dk7iqt4AUFzoJAI2OcePSmHhKDmaPEjHKXoFhYLVOAVfjL0FSp5hY'
-    b'oKOsgPnYoNZqxa1v1lWxncFNcEqx413qeZi8Y4vohM3xzXu2suyZT0l1rPSYRSoKJL9gka2v'
-    b'upnkGcyPSqUY+eX6MyV1TIyicKWyegqHUxAkY8KCotgf7W9zsW4VgFDj6lPBps0glp/ISKK7'
-    b'rJ1xuE700ClWvRrJMXAyVDOHMcEITblNPwOGqnDrjajiZ0LQvQgH8o/1mCIWBCtat5CL0E3j'
-    b'0FDpEZUxNCSLGGgfygD3c18Vhf/29/zCD0bEt5Tvn8nQENGms+X4pLmzQqOqBld8guPoK3ya'
-    b'Amh/Ss9nF8JrWjGhhYTQOuxRQsXaIhf2vqg/16r8ZUpmfm2KRmDAK/RDqrdz6ajhRWzTvvk0'
-    b'+bFzwE1wiWQR67wJtT9pakPZkdZQkrqa04Ro7lqaPPVzg8eSbZ+nCW7OEbvx0kisRc5Ohda2'
-    b'SGxcmTLWC8fMwXMD2xNVXtb9pbVim2q8A1PUte80zi11OwFS5Lsg1SrVi7UvBYuHnwcwFr0Y'
-    b'X8aOCpY6Rgvi2okwQ/mlwNJt6MVy183C3atTI3KMeYaD9N6bMu07VQYsN/1qJlVQInRPAaLz'
-    b'q3BdhvJlawvX1VeH6wABCwJMXg9OkCMMabAiBTuxDjItS850sZBSMzl6YIAUg9/2wBt/8Ae+'
-    b'8id+xM+2rhdJs0rHiQrHv+DfaJXKmLmv6VKDuLsZpfw8EdCIoNBRBGMDRWD5jHHpgHaNQxkw'
-    b'm3sVBVLuCXN+7WEaaaeOv67biGxGVr/mQ56aCt3qYoX6OsAL08cklmwQusQ0HcC4jLVfAYWw'
-    b'KV8ZTdghpyYlGv8nbCI3MHpyXWT2DVAYXm8K0YmwSRpLg8IJDRrE/bpLCIYWMZwmi3gy5bv3'
-    b'kXv5Zm0OzTWjnVOUalVUsfbpxtAnqukKDAKDvp9NmfD1gWAjOhiDNtqi3mR213BWdexfissR'
-    b'b0YxvE4hm3VCWZvRbGLE12FGCOH65kadcDi35tAvWP5gSdNCjNHFoo5Yr/IsIZbK1NJAVV0Y'
-    b'PRj9k5aECV2Zg6KyQSG6uwXkJkbf/5h0UeZlMOIvfEUX/tve8wtvi8Db++BIWd2QKXSAckmJ'
-    b'bXXMZVxDgluLYAgGPm5q7+5mxhJ/Krwu6Z2pFqROEBKQYXadOYblaQpJPYAcPFyo8w6EHUPU'
-    b'BDmmLrw8JNFS/VA655TuppijcoxRF3AcjseoEw9jkINd3FhYtRSMHgcdg8Aepm2ERG3QUAlz'
-    b'tC4TYkkTkwx3Zci3skS7MOf0rC8iDAfFoWVT0RXUGGDoJEUtlqahQaVK3I2+0Z3QhAn54hzF'
-    b'sa6PfOjI0aDhRQzc4UacBoaO3+kZ0+0filgUsvHj7im4/q0JbttGA8x3Os0utFNS8cNnhb8h'
-    b'd+uQxJgasI1uQ1BCwE/j9DSsnqnSrDNsUFY+F4gYbN7kYapG5cpTmy4ShI1UjerGqsBi3wxj'
-    b'qJB1U+uBeRtGax4i3v7AG/7Tt33FFn5E/Gx1YBp0t+lTodxHNuowYY/Zlx5l8o4hgeO8T7Qu'
-    b'oWKn3jjG3ceoXKS7taEIB9F3+jVYo2/ehGxEp2x0mDtPdawDiNbwdBS7Wlr3laU6s46uladl'
-    b'UBccTtxV7eblw/xACFwMJjEUmVIB6zKaFt6membaj1ZJkQxTSNGDkDXBKEY1ggawhgk1K9hk'
-    b'RTtnWCTx6ebyB+2UnhET6vfjWDe1Lc5Xtnaq6Nzz5j3Ok5LxXNxMWDboD9E4sKi57GrFjegi'
-    b'0h6xHfIsSuPucHzAoG++ERmfT7TJPGTiRrOuZjXdcxWapZ1wYv+GlDh6DNLkT01CWXimJQGG'
-    b'KAXkc2TdeCnqIWZMM91fxXhpwXvArgz7exvlntOahXHXV3pEyAAzm1GxDS0ZQO3NNGONlH+l'
-    b'Ff7b3vMLr4uIP27hQMoswX5Ac9Qo2yVA7/vYpPKuKx5QSvbAcsHJiya2kc3OlmayYDMGoThh'
-    b'yfrKyPeVErBF6RpUSIUKwTc1xNA/vMa52EKfL1qX+Bbi+NUc2xJ2gbo+mLERGl2GrmX2Ji1k'
-    b'x39+w9nCtxseMQrbUXjeXA3ROQabDErjLd4pDeZoZnTDNXcEy2oRRUFGRI+qRZmy57UwJMU+'
-    b'+xQfcN942v7jAsrgTH/N1F0iqNc/e10BN8WBiJIp29JY2Ruk65LAMA0f0RAgCD9tPfbQrba1'
-    b'IBEOyfSvDknsmIWvACXbgH1IgHHXzBWIA+dNPdNAw0BhBgZz3VtSjjY9czZ9IqIhqvnDoKUC'
-    b'k0UUlr58RzXmx5d+MErPBOGjuyj3bP7+gTqQDGnAiD/+0jf8wOu+4go/ED9DwEM9EFtNmUiI'
-    b'vt2cUUykVTZdFOlWjZwfkHyIxJO/J27NTUajK3MYCnQCNsXU8vMVkgRqcgFyZ+32xDGKAB6c'
-    b'7azQ2vx0DBS9k2DcjEgYNAvpwWsr1W1chQ00oVjVonXCbLW80zLTq5iLe3vpKeY3fQGQaXvs'
-    b'mpYU5a4LggtQnSfeadZ1myiAxQ9LsxJVVJ/pGtUiTNMEQ00Q2teC1lD3MXnzmQHhCLcUKNTp'
-    b'oyyupzMJZjRO1CnGCXQ00IMvqf9R06+IUd3pCJ40dOBiCWFO0QuzUZGRiSWbWRjEg90wpsF1'
-    b'0pbV54zp3oHoYLLlGWMs6ceyaLXIpBLJChlw2ge9ELpitALZvnj+duG+/MlUyGcMdeMdC4Vm'
-    b'qjqJS2FR2k7h6ZDY3m83H/yZr6jCf9t7fuEoGX8eYl5DjM8SpfqhJPGxJ9dhAUuC+wIQQ6SN'
-    b'g4M47MTZ+SsMim+aYDSPvaurU7lvy9rocBaGFkgxcJGQQ4jej5SHk763gAB9MFSi4WHLpZKH'
-    b'UMp63WTgg0nRi+HSp7R+cqswW4I2ozj4SE7z3Ge1yEB6YL/T5Us5uriOviJRtGvQ7IqGSmTl'
-    b'O2w0K6NmlxNagMWWMlu+snOxRTRGewiKgVU90GvFNwSlkg+rRt265zk3ZBBfBbSf6aKZiyCM'
-    b'GxpkRpf6I0FXahuF0OgR+fKdDK01nwV9YYPsG2UIz67apDtFq0q2AZOfEydUKWU8VTQEVPeD'
-    b'btJDo48oZwJlK8MOX8kXomyfoOpvCNayAUdXjHJQUKzJkZMmyyOHyImKlLVq4aYTEuwdDSPi'
-    b'z7/kG3/g6FfSxP/TFeTq+43d31wUji56EW5nPaw5TykiivozLL9I4VUbpTNgs4pyG/Aragr5'
-    b'GAvRUrTRp7xGXbFH1g4Pb1kd13WclGCn0xPrPnctMDCubs3sbyqxQ18SBQDA6gu6mUUw2UDI'
-    b'A8fhFpsn/yKFwOTLDoPrG/XCp24tRGtu3QLStMLlvAZYYUDrTudo0lxCyrYMy5ztFwDylzab'
-    b'X1GRIsR12i7pndumznU8qalanu7TMQdobRCMkeIdQ4PkskwKPzNQVPkFOo5ZpLpEE9JxDajn'
-    b'EAYO706NPY3GbrMjUz2V2irUWvpcwMGrzwJYWI6mvY5+AjLSK3bXrNqIEWGy8W/JtMr8jLkU'
-    b'knxdTHL8qfWDeKXkKRSpTrFRXCoIhyBrMJdsTyjPotieO8Cw7S7nWvqVUvj/nHaP2qGTg3sA'
-    b'4XfOY+62DPLSpj6ztVMhUnN4IdDwiAfU8J/KnVFynjm8FjxawA4zMxYrAGKAiI2s8Af/A8oS'
-    b'ZW2ytHBk34MxKqgHGsXcG5INMO2/b7phoTNGUewzbQO7adbXtcKqoW0YVB6zKw9iAT3Msv6p'
-    b'mWrfM9n0H/kSnJocs4pEcbir/QNbmuR1cQdGnZxgnPsocHPjaut3QTmQ2UmP4dESREWayD5L'
-    b'10a6+/wzB0HQWWe79E2JZkYXvkL3y2k8g9Cjql3gpozG1dfdLnFUb2CNgFV8uW+3wDy3MBsU'
-    b'tVhnd9Qp/A4ZseMAuqpmZa6PMx/nVBSYmnlnVL1QIJOcBcJd5s8aE7IJmj/WJ0HpR3OYj6Ke'
-    b'1fQHhj6AaZIpjWsVL/PPfUUU/iPv/oV3RcR9tQVzoSRVyVpKqK4toRtQBGiVksQ4kFHNaPv6'
-    b'R5KSaAxrGSJkj7WsyTj3EEfkwfLAldNbgEu1E+byUOV+C1xwIRxOIX1ZgtfmxDqzhEZ0YJPz'
-    b'6hIFn0ZKAFOHRKjLi6w/RkX/GlHDhF+y1TU0I4I2tTXEoO4jT85jSOY6EbHL3fr+skc++9VQ'
-    b'IW14+iBX0EKDY73nz6jp1TANxACxIu1MT8zRxu48RuTbUOJuWWNgGwSMsGpp3UivK6Qc5AhD'
-    b'kg09ahZ5kAhF67SYDviumFX2SGujatONhmBSshhbvJEXKWZ4yWzweGbOiGndRlUp1WkXhhjw'
-    b'Uhg7+mLw1Zj4aiKx8sCgaWdDgMsJUgMRjNfBy91aBjRH1cEMntEmfmf125+77uXQtsvgzl7c'
-    b'95LXf/+7vuwLP7AO43FfIKIFJ7RO1GXKs+9J+wx3iKJ5ZA3Klt6GZAkHgasZNeyCg4lbY2i4'
-    b'cKDLa3AXUCh+VZO+7OU2cdH0MCSrEK5pyxCj4DhpsiSkiJYpu26caZvKFMJURTX7XWcvxQ0F'
-    b'omiFmnNLABO7GNvcHN6ZMZsBISK2r12JE8cej0c//qE4d+pk7O7uJs6PZn3L2J6GaTr1/4ac'
-    b'0ZSgOAvAaJXn6jIM8xr0sqddj2JD1nIlokFjEBzuz6NoFlJpzHRajNwk1dJjIRQM1ecdTqlP'
-    b'9CdK4FmWZwmzoDgV31VUswhJRf/SnEV7qy7VyyuQMu3Tn0PG4r+yU2QMReYEClkbpDVq1sH5'
-    b'xmG651F6g160vUTUBoRRt7CafmPZAqgmHQ7A3uKxJBtcGHQTlMwYPYPoXIv8sT/zZV34j7zn'
-    b'vW+OiO/sxUuEVjLZQwCiZpYD32H0gjEKmHFgN/qBR+riCw6I687S09HMphHTJWBAAFnnKFcL'
-    b'5dibABx6e7YoqdamsABhO/h5gJYELBp6ILm7zUM/BrSD5MhHLAYFTdsGqjD3y/4p0nPENtZM'
-    b'hEBCJoo98/OKJQld1Zsz5FNfz4hnjz8Z/+qf/qP4lf/pf4j3/fI/jSuXLk4IERmWPO3r4lKw'
-    b'gcmpjRY6Vv9+jliXwd23bJ61eglo8HPdyMGo7SwNDWECljJbRjXY4uA9zQEsVRfpOzgfU425'
-    b'FYGp7XGd4tia5oH5C+kn8Q0kD7aaA1RYhmUKpYjGGDWG6Dr3lqVUMfzyweVhJCy1MZqmN/fl'
-    b'IKZZlBr1bh9EUSdB3dysdE1B3Ujppzk06GjTlkCRBo3l1VwYDhv7oWScFHwDERHf+eLX/7E3'
-    b'f9kWfjB+MjRhzPF5EpFZ5zLYtbzsRz1a4bepZTFe4qU97tUstZtzLN2blJ9EC98U84kmT9aM'
-    b'dbZp2v2JnIbHBrP0iWuz4litMQdKRnH0U2QWSezm1zRRnQaTAs7NY6CTzdPTfQsX9IaXhHjs'
-    b'j+kUtVd3MKp4+xm6ExHxuQ+/Pz75gX8bj37yI/GR3/iX8cRDn5zYBKBziM3CN6oR0CzUYjI7'
-    b'MRfKurPYaA022zK1D2dZYcUQJx4EXDnYy6PuDTqfNZs+jjiLniHws50oZV1XMw2qIx5bZHVR'
-    b'lq953wIFY2FFTv8Y7FfpG6hBPeCoBDM1D0WGwLInOanNmelHRQnqndUeoWZFu2nIo+aWcSFH'
-    b'JLcEBWDTwLO69ojSYGYKBi0XCo6vzS8SAwF15ZiSvTsNINJXX5kGWQ6DeWSDScYH17yWK65L'
-    b'UX7yy7LwH3n3e48E8J7uzCZO8mk9DwmOLJu+MhGVaRwcdPHVq1/3x4GODrQUPsr8B9S1ldHl'
-    b'JlwpDfkJ8a6m8YhnNrCBDXSNIgJqgz0rbQBzeDsdlg6bE0VFsf9k8SZPMcJOxJg5/pwtAJr+'
-    b'XiZfMq4n1W/yOprZmVg2CunYpBGH9qu+aEmEP3768Yfjd37tl+L82VOxu7sTJ489Fu/75f8t'
-    b'zp0+KUnP1RRFEwVt9m8Sn3JBiDHQCfd83TQdtQkIfSfa2Q2N+SH2ydcUPzbkr6YwUFsuU+Sr'
-    b'uj1qy1z+HGPU50zNKJbPifO/EOmPddxTLbp1oHQ0C+QHN9VcJE0H2+unKebqfAhXHREzQgWz'
-    b'jpY1NW7WMPegbmrAd3P9HGEJv83XuNJOaE9CdbbOpu7w8M7ICtvFLSCh24QsfmfBMgQpqFbn'
-    b'7OfiPS9+3R878uU48b87yC0PYOTLDHPwQge+piJNWxLCJ1oh+pUxpLLgmOHuDojU5cqaTPbq'
-    b'r7AzBIwbc6zjKYDCxedpPn0eGABKLQeGotQNh6fMJAtGFwEspDV+H/WiQCam2f31jadcusA8'
-    b'TNi3VQAAIABJREFUNzByFqNxLcsJhWxTpATeoHfvFK4a7KYsmzf2qX//b+PJ3/10cHcl7Nu+'
-    b'di0++6HfimOPfFYE0Aybp4ROPzTjkXaxXXcmbaN4gc+Tyrm9f9aLdXd3N7g74A7AlKaWfevH'
-    b'2wZ1iyQmxILpqZqGBYiOQdGavNpJdUhjpaJAQ/lxGAiWeIo6cYNNv0Aa1pb1TnOmYXCNABHq'
-    b'sV9GUBjcSlfRBN6ePmfpMvO9THah4jS0ZKSgOC1KzwePIDV/+8Aw9bjcclMuwCDsS03jRFOV'
-    b'15RZa7WvMdbb3ZxemEtwZJVtUceul4woJm5bEXz3l2Ph/wn11cHCihfq7TxI+XS2inPXq+sQ'
-    b'GE1sUiggBgoTmlReX0iwhyeuoDAOhJ3g4FDIg+8tYTtiUA4Ll3PAN504h1EbEJiaddUsXSB+'
-    b'FZfXpY3rY5ffHxMiB7t7QTn+/nehQp7CRysvSbj88o40gQsXKyX4KZ2VSxfPxyc/8Ouxs30t'
-    b'IiL23XBjRERcfO5cfPLf/2Zcu3otiQ8H0xEN1zgqmnQevvSQfXHfy1A/iv98OxOGFtnd3fGd'
-    b'GJHgYzHR0TXqmF8PpCi3dTcJz6KBuuu+drQcdxvnCsoSq+GRxKMDwkDC+P3DeIiqXSsWnqPu'
-    b'3i62wZPBJAti2NMFo182BV2r3xWsl0UTpkimQQyozDArg3L/hO38zX2QBSDy7yM0VuhEdRu0'
-    b'cPuE4GlcF2c6pVH88FG9Iau2E0K6bsjWmg59hHtDOJ37n/iyKvxH3v3et0XE69vmHmNoADmx'
-    b'lQMDA8b4IJDs1sYQOA1uKky/G2FWRDDoNTHQSnXW18N31xccjsRjw8LOWEhP6yhVDdgRQ56G'
-    b'ArNdes1qQDZVqRxt+M4YSm1HFIEPgKb5qIK1mthbwpyK73xMq2mFbLIXoHRxbHOZOUOwGeZP'
-    b'P/5QPPm5T0ZExP6bbo6XvvYNU6H87Id/Ky6dPztvFJfmMkVIj49JJTgRA1IdjQxj5Em1SPm7'
-    b'KVYOgalpQ+uCz9ja2gpyN3bXqAazGCG7/BUBnj2mE6rG5A4XxYoYaVvFGWTpt+VNQkjhUulS'
-    b'kuXG4MDIpsHyQhtqu23WuEgTQcXwDpg9xCXmnfT8eSmKgWLRCyWT2W9eb2jaQfO8Kul26mHB'
-    b'JpTBpZqQogGcNNy7Hvm2qZQbffu5xRCB4roRVUMpaKqoXinh9A5d6MoSvKH+/Vk8W+3v1n/k'
-    b'9fd/wzvf9mVT+CPiTwtGOW6selPfDB3qQYQY2tTDS+i2peHwYJwtggPt7eDFu+IrRkQwq62t'
-    b'0HZwUz46v4LD1qPAQkPmaZ4F3zDvj8kuOQzsMnkbOHnuek2JYegEbUYMk4Y+bM/pY5xXIxnF'
-    b'1xwm3yDaOtDmPcNPVS3ApxqIjO97Y9uacM1HP/6huHLpQkRE3P3Ag/Gmt70zDh2+LSIiTh5/'
-    b'Io4/9tAKiWj3fLHvmdeFBK4uhiyMBpHPf8fjLtmYCUWHIaJQUc1Ozo6B2Nraiq09WwFsReyy'
-    b'txpwvRUdJT3qM8VPgg1xbfocYFhodRBAsqAoKG2xiA5XfaVBjjnoif2dYShCnZ8ddEh30FB0'
-    b'FGwUqaOq876KjPAK+R6TzNHtDbgJz9CIXqnfTwFt8BEatTGge5VWBsLtK2fUbmR2VnSaiOp+'
-    b'yMEo0Hb9MOW8VLQ5oVmNw2NCbVCQv4SQ/ekvi8J/5N3vPRQRPx6jDwNG3Bco3vzl64dg92A3'
-    b'3kSrXdW7uj1nRizn+EFrwOMO2cJmrDNlCY8eYjRKGDHMgm9VbXBsA4b5UI3sM9n8FaU7HdOe'
-    b'wwkf+uQKEMkQBXcUfUNZR0rRxRxxsKaJm1oWotuUAiYjIvrly+r02KOD5v/vdz/2H4Jk7Nm3'
-    b'L77xD78jvvGt74hXvuHbIiLi8sXz8dinPxY717Yr1GxWK9l83aOuKzk4cmooWPJ13PsqBjQZ'
-    b'8hdKS+ntrS2xid7KIUiVXwUdhI7e/EfZJC3RvRX1iVocdTvCUKrPJ5SvvB90UywO4eSRaxb8'
-    b'pNN+H70iHgv0nS2aMXHfzvGUYuvbFDYY3H86HHGMBGKEiqQ7Bw5RnJBIxDDqXCLVSz2gecc5'
-    b'bdKT8j2nIPuRAbVJgR8YsPglc/45cJg30llbt7ea8ikbKut/+fH7v+F7D33JCz8ZPxYR+3q9'
-    b'yd7IXTWUrXen3ldT93IG96DcNTe+ckkgqfMrNw35NqmRtOiXU5vd6dLt6isihRscxnA6Awzp'
-    b'YBW2pMrbOOyK8w64e2NonVRVmhfeVHf5BncqOSMVxdnMUjjqcoVQ+xUV/WXIEGlMz8IpJDOf'
-    b'nvjGybgJAqmoiBmsM5LTslw6fy5OPP5IREQcuvW2ePU3fWccuOnm+Po3vz229uwN7u7G5z/7'
-    b'idjZvjo3D61mrZ0YUhGC8Inzvi/almOBw0difkHkqR20QpXlI8Na3LcS+O3Z2opd7pbsgqlB'
-    b'AsepatHF6RkNanbX2oDqdgTRU7LRW3QYLjob4ZGIGCnuDVysaJz7c2h4FKa7AVKw8uUHaf6K'
-    b'UBHKfUdrqiFbLnmJujwLhp6FaZ4Q/rmn+e9jGRKb8U37MCLsat38PDo6ywwisl5dN3j8tAIx'
-    b'ftIETaqplPNbzGLJwHhIIQarfr17TZ/2vgj82Je88APxp0pHSOHizXHLHW+BXdaLtTDCH1dg'
-    b'3UNN+YN5xz8nmtW1QCYL1LpqSL1I2BYUS0cKmO8/hF52WdKjREpTaEaeQi4CcioGFG8sVp5C'
-    b'XHA7Mind98RAcSm8s8YXl8Kw5CuCBc+/wQq58tRtVax8n6iXrSqXYXE8f5kxYnd39SE8+dCn'
-    b'47kzJ9cw/yvj1jvvigjG173pzXHzkRXcf/zRh+LqlUupSV2IeKGm3gkO0pL9EleuPKsbJNSV'
-    b'D37FQAvpJz/1qfiX/++vxcMPP7x+bLbWRQmz0YzaX06vCW54GIRbQmSdNFG06KLOjtWv7yrt'
-    b'dtm5Xmsx3vnLkQYpeyJAni20l64OnfJD0eEaUMlCtrtiBGkMXBFaIzDXzbG+AWXwYmkMg51+'
-    b'LcyRyWMarVbyOphHjOD2GCGzSKY8aDWXKgg1QuzRsLbc4JgmEXXQmYaUhYSu9V/5U1/Swn/4'
-    b'J9772mC8pTya6F/EiC8jNYkO7Rlw7lMIlAuOSYhUQt0GSrMN5M3E5wEZUtZnceaaaZoBzWmu'
-    b'sZ4waraMiCxw9BmMlRMD0v16W6cxcr1RUQKaFE6+C/b3G9UGGI5NQd+IWsoWyO+tqYXsMwHv'
-    b'vgdxQVTxozFG4ohBVeGamaCffOgTcfXyqqi/5OteF3v27QsG4tDhI3H0vgciIuLss8/EqWee'
-    b'Mli0D5KvU3mVWGFAebgGOJ+Csk2AUehKen7TssDFSxfiV37ln8f//I//l/jt335/7GzvlOZy'
-    b'0iEUtK4ZEIcA+aWjqqFDIRGq0fy8B2bKzeCImStlhwSgz3/4oC0QftV01CxvnpP879BNnevv'
-    b'xpSGf7MJwcHvBvo9lZ+VLNIVJFTySWXgSrUyBzxhPMGwBT8ZB0/ht6BW7tN7bZaO8qJGhdrc'
-    b'oVkXgahUqGQFWGOhAbjahI2M7usf1xuYMP7yGW+57+u/97VfssIPxI8uxcdmPhQFotpwIFGj'
-    b'FBvAPeFvppFLRo7OBKfPKy1utOpTaOk5DmoyDJQ4C7bUvQ9DIHCkOFWSi4vTwQBNMpkG5X4X'
-    b'gQslZILQ7xCiuHZNylL6KmynPIoL0IUa64OtnyYr1E/5O50wommSanRmCZ2Bu1xW/+H4w58J'
-    b'7u7GDfsPxEtf840r8dv6p97/4GtWdMCF8/HEQ59aQeVuMkXXDkxUGJ1xzvOLZUJbjaNM06g6'
-    b'nLIBuPqUtrevxS//81+JX/rlX473ve998au/+ivxuc98zAdMwX2+DKsflE6gBKDQI2hsWwFR'
-    b'tzHo9LyS5SEGHj050C/CpsyhySK7r5F15S3sZD5+VmtTvf5tMnEM0bHrJXOa8z+C2DBocTIl'
-    b'rTz+kG7J9t5JdzMno9Y49CnGlr256I6tWBVmmv2wBE2So48eFj0cZrOPtBgUfZmpalaAMrCK'
-    b'LuLd+Vf/6JcO6mf8ifqGnase2hRdii0UD5d+ByiuZc7lYWj2YxitUfc6vX66EBKBhRldgWUe'
-    b'aZgnmqOmdwn9xsgKdYQ8ONFiFygRg+lVVdRwV0b16+ZACNkvu855kSJ2QsjDq5HHHLYUEWpK'
-    b'RrMTn8x8gDJc8rrK4emYpilgT0REnDz2eERE3HTrkbjrpQ/GFramn/PS17wh9t1wY+zubMfx'
-    b'Rz43rcG1B6PQWMYfNdFSBEyzxVC9RK9BbPvHuiEAgZgjIk6dPh3/6z/5x/HRj340jh8/Hh/5'
-    b'6IfjIx/8rdjd2W6Pcf5mCrUCo5pPNBjtxIXQhLTWIRZdxshgyhRy9J0KaByxnjVKcdYTKA0F'
-    b'xIdj9T5N5HBeWW3B4Wn1i85XnrVoor4+A1+VJ2eyrTVZ5zT1D6NcB72vKOJI1mJM0MLoUEUO'
-    b'uh5i3vJlbdSKq2WH8yHdKQEzdOgZMAczP6sYTP+qJdNHkMa1F/RUb0Wb/8SXpPAffvd730rw'
-    b'we71Lot3TlHfl9XCuUzpRz7x/cLlVmMMeOjo90jRgOYiRbpgqNERWVAWhv9C3o5LDlSmfKHv'
-    b'GIdmvltoBb6450MH4bvCw2s9gdDA+EyXkSJg8sDnGBvqe6y7M+v3l9PK6gvLa2A0V728q8Jc'
-    b'9lWsqm/HcF6OBvfm2vHc6ZPx3KlnVs/GHS+KAzcdKkj3S1/9uth/00qMe+LY54M7Ow1Wbtce'
-    b'kXh7dI6ZfQrtosiNoYx2ZLBtQkYWtJn79x/4QHzowx+K7e3VVsL2tWvx+KO/G8+eOF6Kx6aA'
-    b'Q86uTmiVPaGxJtDsi3kLAhQEqek9zHcJNIGa9vklKhkwpI+3AyonDhTPmfZLQhKp7SnjqJq4'
-    b'eN30DKAg4jSoJLslLGpT05toFOC7bcdDL9pMw0IGofpuUSZ8lC6DBaHqXwMbTcJwuRe5UMzU'
-    b'cHbSo61Q6LyDTOco9+9k7Eg/kqqOKqCujmifoyUCGQ/e/9p3vPWLP/EzfqSZjTTDsBmirmG1'
-    b'dVex9K/mcoeBPtvYC5gM9RhMmfCqduvf0wuGdviUSXARdk1mcBjphUmjAIY7D02YhFTguTS1'
-    b'OqapqatR97ljTK21ZQHMaYUhiWHlwrcEGcQ0bz4raClgNFRLLTqMapM5KWXb55OnAAdcwl75'
-    b'wRXMf/G5sxERcfs9L46tPXvLBXbk6N1x8+HbIyLi9InjbX0M5pqYMw3qyh1L/DRkTcqoM9Uf'
-    b'hh4pQTHVqq/pyuXL8c/+2f8Vzz77bOE6z545FY//7qdKMQLmSx/wBE535sAAEGXh8kmHgqEj'
-    b'ulShuIP/XQ41w5UBKkWSI2lDheqo4Cdg7PXh419Z0RrqDnt59lGe96qxoW0a2YYH9oa4PedI'
-    b'XheVZrWC4tSIwHClLEJNeARBtqqoNcKcJGdJ7ii5kVtsp6gFctDJCYJSgnXhQnwDrL+KooxM'
-    b'ltQjN7T5OvyRLwXU/8O9UTEaTI465Xp5F9c6EYO174w04hxWqF3c11qePDmAZWA4QFYDmXTs'
-    b'IYIADLijnH+ef649coaPdnajnWs2HEC15rZ8VDYwqdAnbXPTPBAGMntCRdIirllM20Dxocs+'
-    b'D1AYGO4przQS4Qp43TLgAiSUdShMQVOb6enpxx6Kq5cvBYA4et8DU+HPp+zWO45GRMS5Uyfi'
-    b'2aefaBPtgl65WKtW4RBtS8LYGDyhNFk+ljZsAA+xchxkRDx57Fh84AMfiIiIffv2xb333hsR'
-    b'ETvb2/HUscfi2rWr8xTFmrXeqS8VttEqFool8mRzas4n2JCscSItw4BIpTvWia+aSkFckSlL'
-    b'W2wJeo21CeU11r0u0e4xpIJTJsxsouWuEnaZXnu/KdEvFzcMzl42zuqC7Pk5q8mosM+11R6Q'
-    b'/q7IgxL6hF49OBDZ+MkZvUV9kgzdJkgPepasW3KkbXKiNMqVaTN3O0SEOgapVzX4i1n4D//E'
-    b'e98JxNHBsDq+lCsA3laufDpflJ17oArrSA+HS69eeWNs+Gezs6zpaNawB+VoQZoFtn1iSgOD'
-    b'btpCIb2RpwUYIavr1Mu2b5uC24BDMWhLmaQYaRcK50VLyzjXrRalvLsTVy+cjWtXLwV3dy0V'
-    b'09K7xpKE2W8+wduKD1XxzmiOr43L5oBSU0Ll+X/68YeCu7uxZ98Ncfu9L4nY6k/ubS+6LyJW'
-    b'vv1PPvzZ2N3djd2dZHk7XcQLFFC7pzD1kRTiCc5Mj3FdS9n8d/ZsbQWA+NQnPxGf//xKw/Ca'
-    b'V786/sLP/udx552rK+Ds6ZNx9eKFVNIxN2tlj5bJkdEED0Zd+SqWSUwoTdJnuEZpaOSFDnsT'
-    b'XQxrt2KmrACjKtfCC/QiD0c/qVZEBGjMFJngIbwOxKh0QIqURZ5QS6If3RM/f6psuPx8n8PR'
-    b'kJ2nbwOc0k/G5KNZPecgHvEzyZWlpMNSdRjqWZgsrMG2Esp2V6P4Rq2+4tz81FVROrMgwmTN'
-    b'RBFRT3+X0czhInD0vte8451fxImfP0QzPaCtK9AkqA3P6fOYBGsEZlHhwnOxFuom1iETIoli'
-    b'TZCrHzYKOwVZE5oOl8Ysan5qSW1KAhqghevM1Y8WRVBDs1CnPUgRVG9wmN3iElYxfx8cmWWT'
-    b'w++S7j2sX/PpRz4ej/76/xmP/fr/EWcfX6nhdUWqQIb5ZxrqU0vJJIICzORgiOZgjyyln8b7'
-    b'il3EmROrFb0b9h+II3fdE3uwR2ZbxF33PxBbW3vi6uVLcfLY59d2x7uhaWIMZ26KTm7mYobq'
-    b'i+jMopCQDQv/trCZ+X/74Ac/GNeuXQsA8d3f/T3xcz/3X8Qb3/hNERFx+dKFOHfmmRqbC60E'
-    b'XZird3yOEsjx1XnULPcLDYTvkFFJ0CzNMGukc1tdp2gqWgiSuh0iyD79QY1y0lXASJ7y6Xsl'
-    b'UAqpDtHd38ElkzhhNWTiqo6fLN6UbKnGdIFYzU+7IrYIs7KI/vzSdf1qhU5aVBIQLY/YOA8s'
-    b'e6bcFhbUFqPdzNnvIjnPQh39pDdCW1BH0U+1ZKPy/CL9/AYj/dAXE+r/Qb3PCasvKy8WYBeg'
-    b'NVl6V7JQ+t58pIbwLPwEGdEvescRVd4UFuSJdknF7Kg29Q0+375XsLrTSwkAyIpdIFQq5x+S'
-    b'HoFeO3su6xHADIn570ZV0fbbAAqstn31Sjzzsd+M4x/6N3Hsd34tnvnkb8e1i8/ZGFguP7X1'
-    b'u0QnRPxUCytGnB8mFqi0Ydbmc33u1ImIiDh46NY4fPtd8yWG+TTc+7JXxZ59K5PLU089Gbs7'
-    b'O2WFMrsk1tRVdoAyN7Hlhm3uBzPsDto1L7i1szQdnzlzOn7r/f8uIiL2798ff/gtb4l9e/fG'
-    b't7/5OwJA7O7sxMmnHq870FmV3PeuqmiP8MsaRgfU9StUtN+bXbFJJA2CSHPJp4KVET3NIGhW'
-    b'9mgubcj25dNmhj/cWRg91sPkawQSSZsE080am/XxpVJqqYVQASoq9IQ88USPNQZiYMAWbduu'
-    b'oBXIE7bZ9BLUxlGtBfVCp4c0K8J6DdC0xOyx7N69kXLx10kLziiLg2hecxes/8cf/KIU/lt/'
-    b'4ue/LyKOqNBiKuwWIu6uCl2wVzvGInSiHmbR/0J4dAeTxnintcRmjpbKW71waXwosY16sxZD'
-    b'G7jlIkRNe0uCtrT4TFZNLEeVV6OGF0mj8cYvLIViinPIJIJuAhTBeObj74tnP/PBuHLuVFw+'
-    b'cyKe+dj749mHPhK7O9tywaLGwpr+g5XQaWt3oGsDmF07SmAdu+tG+2wy1I+IOPPM8bhw9nRE'
-    b'RBw6cnvsP3ST/Rxvu+veuOHG/RERcfrkUxGxm5AMmn6M3uNnQG31fAZTnDA3fxAaozeRqz/z'
-    b'zNNPx+c+97mIiDh659F4wxvfGBER3/xN3xoHDq7e69lnnxqsliqSh3Lxwkw4+eVDyPF6nrr3'
-    b'BpplMRKDVtXooO5v+3RJ3ZSFsY8cXta5VuQtF6AYxljzVzgtgjEYUqCSUVMeB5b1BTXaWKer'
-    b'cQ5cHWMZ9lRFYFFEurQ+SM3IK5vq/9B9KGYFvaA44RwoMxUaoQY+TZ/k3nhBRaJSE04IHro2'
-    b'yR6u1XoqRDeWQktZTZ/WkXtf/Ue/74sx8f+Am3Znz33plq2fJmcBA2R1TtW4UFcDdqGFqnFh'
-    b'EIdGzRlZf9phmtfVauNCtq+y38xghyNl4i/5BMqXSUs8tsXpiXMqSwAdQ4iZS9ZAFhh9AAcZ'
-    b'Wy0TCK0rTvU1IiKuXTgbx//Dr8WlU09FcOX5fv6Zx+P4R38jti9dmKe5IlyrbmPRchSMCc+G'
-    b'E9ZmEDW0pHPNrtJyEMqz+jUnnng0rlxcJfLdeueLAnv2pp82X4SHjtweNx5YF8qTz8S1K1di'
-    b'z769cs7DxvLS4PeIZDENnV5Yja6K/oEGKpaJLI21Tz75RJw7t9pY+IbXvS6OHj0aZMTRu47G'
-    b'7XfcFRERly4+F9vXrkY0nUEP2WpW7c1JcDaTylwwqUBAFv/lQs7B6G+KK6t198Tbrn0WoM0Y'
-    b'ZxQvrxkrRgkDKbHB/KJJoRhLsRqBARhja4zmKOBWXa2fw9T80Tv89a5ermSWhDzmwDSwxKbX'
-    b'+yqjoz5rkInyg0A01EJMiffNwUUafijCSgtDI0dGV6QJw5ZvkrKUugHWNtfmVXCub2A9NzCN'
-    b'f+o9f+CLUfi/37sVdP5uPty0aoDNm6NJzph3vUX6AINPbrpwLRBheM+J1xkmQEjkZwLBECWF'
-    b'TDJ56hpcPE9PtabsoN3rlPPs+SAOHXhjTomaO5gCp422LliphWww0m8Ttmkbwl2e+tyH4/xT'
-    b'j6y7iRkyO/vYZ+Lc8UdW++1ICEzOYY8eqlKe3FLQMIRAMoQPdLctoHsTqM97VjifePLR2L56'
-    b'JSIi7rj7/tiztWdqQ5GCivYfOBi33HZHREScO/1snHn2mRoCQn8ZzDqO+ZLjxlufnoYqzoVg'
-    b'mawgnLsOLUiCCkbEo488EleurN7f29/+XdOZ2LNnT7z4pS+PiBV9c+nCmVZkCXRnAfbQqjn6'
-    b'N8VmmEQpprEWyDDYZqpGsaFFgbX97nnJr1gfiE3hr3RNQbk1ckxyMAw87jQpWIQW5OzSuuRV'
-    b'YW9IM09rv12ubOdgOtJMTKJA2nVKvU8ybQnnnDeZL3l9QkMeKGl/pFAEbJyCbZUy/0+/1hlO'
-    b'XAyTzpgVfoIiNA+BcHPwwAocog8B7BYdGN//B1r4b33Xz789Io5mkpOtzTGe2o6bt/Ak+3Ts'
-    b'DooprrTJRrng9ZmNOplTzrAJpZjFfI7W4MAUyO/KWv6ZZasu8gpM+TxYZtQqSrEQfOd+wxjs'
-    b'NK7LwWccZNybYULlvs987H2xfen8qhDeekfccOjWiIi4fPZknHroI7G7fW3KlS8CNLAyl86y'
-    b'25octMWsaMojUYnSXN4UmorprDz75COxu7sTe/btizvvf2AKrZm3PtY/eWsrbrvrnohYKftP'
-    b'PPlEmsdoNje6dfMmiRDVKWTAkUuPPEDONg6aNI3N7u5ufOITnwiSsW/fvviWb/7W6bRsbW3F'
-    b'i+65PyIQu7s7cf7M052ioMaSIpxirSX1UdsYzs0APExQdtNtbgW6+kHphZ2d4A5ja+8qTZHc'
-    b'NQ0uhhZkHkkx6Y8Gbs+mSTRmZhyGco3wfNhC4qD1/nec1kpAVDg9FTr6Ifd4sfpFWCdTCNoR'
-    b'I3HxWkEP4UdyKiuy7iIG43PI2o5c0kiwAoXDYQsUChOwxyELBnR6moZWcWZS60/m6L2v/k/e'
-    b'/gc48eP7XAdUC5faH6oYQWIvW5JElehShSRhnNbL98DR8etmMLwOfD7cQTeoQ8SwHWiPEz1/'
-    b'NE55Zg8/MjvczlajPDjiKqhw+rzz3UVtVXlazTd4neTJzd+/dOp4nD/2u6vitWdfHH7gG+Lw'
-    b'S1+76mR3d+LUw5+I7csX7eWDhTutNBnNWShBzet1iXZJQVojLhkxsYm7z55cOfbdsP9g3HHv'
-    b'S2Jrz1bn1tf/3Hnvi1eUx9UrcfrEsdjZpVwso443zHMlq0vo9aysvbEiKHQ3T9KRBBC7u4xP'
-    b'f+qTq8b/1lvj5S9/+Xw0GHH7HUdjz56VZfGFMyeij0VIKZ2D73LTzBCjULLomyoG0od/jjl6'
-    b'RpULZwR3Gbu7O1OjRu42EXwTCatL4LqJKq6ZORtkYK09TKQfinNo70MalMtaMU5CRTZDbedi'
-    b'CXTUthRwiz2pet1/F2rcxrRy2u5pLq8dVhgJDQWD30T2/5JXX90uMWoSKiSnpYdrjTxR2Ip9'
-    b'+azLsyvmRasf/Xvi+X9vhR98p0LJ7d8x4O7kwmIYX/wWgs3mU5xXJzoXyrJl4C3s5raTJhBF'
-    b'odP543ahGy5so5o20Fkugs30BgNf6cL/tWSx7hBCFT0SU5Futq0UCFVSfFjU67TIzcj1qgZO'
-    b'rL7vMw9/PK6eX3HFNx29L+5+03fF/W/+vrjxlpWj3XPHHo7L5561PvF28oiuT1B0VC/2kgAJ'
-    b'FgWF6z+nywX5wqtH6vzplZvdjQduituO3iPTan2dL3rJK2Jrz97Y3dmOc6dORHC3jYHIdIUu'
-    b'FGCGUPN628SUskK4k5J/OI7MSBXMSHL61Klpf/+ee+6JWw8fLrqbWw7fNgkWL50/vV5PZNXh'
-    b'lg4/RzRXb/kS9+wKZDpy6HZ59tlgjLak2G19169hz9596Ywgdnco15TOb93nz5vqSCuu9w9j'
-    b'eZCgUpII50RSr5KkpdLLOJsJyLMM6xPMjui0ohWVs0cYzVK+gxwtOXPic/Jjzxegg+0DVnA8'
-    b'NT4Ltabdw1nTUPSCfv++UbKuKck0DCteBAwQ6yHTXb6ld/6BFP5b3/Xz3xgRDzqvZRmwfGMW'
-    b'RgGfdtEjouXDG2AlcWhoEC9MXB4tDbWBTA2BBY4HDfRHfRTctIFQscDwd6HmCDBjtHEhOQpy'
-    b'NCBNQqRkmiJiQtp8wCp9pLOqLMiJQTc2D8bu7vTfzz76idjdvhoREbc9+IY48vLXxR3FzmaB'
-    b'AAAgAElEQVSvelMceekque7qxefi7Oc/Gzs725FV5/Uhp8tCm4VMLRiN2Yph5vinXmpTyClq'
-    b'Xhr7jVldvPk6rl29EhefW3HbBw7dHDccvKlwevpKj973kti7Xuk7e+qkTFD5OULl9xMJnvcY'
-    b'JqEeMuKV46kRQ4yx0SFsIVonTz4z2fS++tWvKZwkI2L//oNx6NYjq+/v8oXYuXbVFFoJHSGs'
-    b'VznbihwsH1725FHX3mxipmUBBd1aC/q29u6Nuu62FdiDifO3mQ5EYY3YVA2UqRGtuYGJCG5f'
-    b'GdCaJhQUD+azT+dq0+gSNXcEIxW8dlR1zXnKTkkCVl2RW2kxqu8+zCXYaHbx3yjOm4v0Fuuq'
-    b'awYe0P3/tVrTrvbNYCLchKMuoc79kIKy9fz6jpBTzcYY6kqZCNEH7/m67/nGP4iJ/x3zi3GC'
-    b'PV2xQSMv2ODGOhzk9aritkYvxFPTBTbbPBgzhtSX091/XVrdrR1hFP2+x3NRvk1L4EAr/TGk'
-    b'BD+g8uBJCOJnTWmyMmcaqatVCJWd568xysMA7EqV7ezG+WMPRZCx58YDcfiBr489W3uDEXHn'
-    b'a79tpYTnbpz87Idj9+rl9BAzRs5sbbpIfu5woUYUOyC4T7/MMYYnr4qoC2dPTYr+m245Elux'
-    b'NSXvwZAud7zo/th3w40REXHu1Ml5Qi7BIis0igmRyKudNOOFcpwc3IzOW53S2c5cLOL48eNx'
-    b'6dLKivgNb3jDrG1Yn439+w/ErYdXgsWdnWuxffVSg8JZDgPTcwo74YBV7yRtaPSuFENI3DpW'
-    b'Wgqbga2tACK2r1yOc88ciwunTpiwHwyMDxwiML8+tdxXC/DyWiHqGdaWYtPdUjoE5B0W5So5'
-    b'o39QVG+AcosJen3i82tQhRXY9tMdo95244076QzPd4puRG0WZBVqtMZCx8yIHu24yaxbo77b'
-    b'osZo9HehWOVDJMy69JKLu94o7JINBN7xB1H4/+g8cTEca6GHta+5tFJ6XahLgZ0aW5g6zSFM'
-    b'wuhWwOwZGYuUGivYkPeHtICP8mntqK93x8B4pnT7sNDwBsrS1e2S0blAndYDjOQxZIB1mE4V'
-    b'HhncPCyXzzwdl8+uJtwDt90dN9/7soit1fG741Vvin0Hb14Vw2MPx5XzZ0u3Dudp72JkIwSC'
-    b'xYAr1QYGs3tiMk5yqKDy7889eyKuXr4YERGHDt++ek8c6TkQNx+5PW7Yf2BFEZw5FVcvXZ7f'
-    b'm1BYKFwqzbcUDfIEOUdbc+HrFhvg0hKn93rs2LHY2dmJvXv3xpve9KZkbhSxvX0t9uzbG7cc'
-    b'vm31p3d349qVC4JOucWn7HqlkTjoRxbzOh/t+5ApCQY5w+jfq/MViTj7zLH43Pv/VTz8O78Z'
-    b'l86dWT1LW1vzJU5j7x2VmgPMs1+AM7Q45NmvQy3+ZGPJ3BfzoMNCU0xCMecVBqVMEEu3IBoV'
-    b'QPMe0dFgsu6oM7WEIw0VFWFQ4+2s5R2sEetJcauImU6NvlILkzCBNmypcEIbxZTOh46XcyHZ'
-    b'raKuM+Vc8pLmn/RHv6CF/9Z3/YPbI+It/c3oU+QmfJH5wZf+JficeoGn9BcKMeu3BdChNA5c'
-    b'/8ihS5Zf5ejcXQwgfDr0oblnOnlOVu6zWHTDwLYlA0GqJBtlYh7Xsi6TpINAnX7tSUWB1rG1'
-    b'En499/nPxs6VSxERcfN9r4h9B26ZXuuNN98WN9258rG/dOrpuPjs8dKV911ftStWHQUHIUjG'
-    b'lS3xz/lMMM0lbUMlfejPHns8rq7f16133LXpZUy85PyXDt682mQ4f+5MXL54vvk00CJbYxqr'
-    b'CANzpnv2vzWiaPX9Z3FqW0HCjzz8uyv9wo03xstf/orMuk5v79AtR6afffXiuR5k0C5RlgPM'
-    b'5qcB0f26qOFKg9UeDhLSNeDaQpY3EHH+1DPxiX/1S/HpX/8X8en/7/+Oh37rX8e1a1fm6Rcd'
-    b'41Q6yq3bZ9vsQQSIQTMqkqyIAAS5pPrycyl1VDqpdvfqWh/Mn+sroSoizsFK04ZHozc4CiC0'
-    b'yJlZsujxwlJQiZGXgdIDYdpqNFlEDFkROGIkNPRnSCdHiK10ahiYvFfYlR0MvOWeV33P7V/A'
-    b'iR/f0z4xph3oDHY0A5iR+YzjvGmFVc/nAp/V6R4roXj4tbVJXetCfrzXtsHFwAem4TU78JLG'
-    b'SNfZticaHppUo4qWMDiKmpxvDxQUnw0b6Y1/kmQ2RIoGsmPNZFn/yXOf/3RwdycCW3HL/a+K'
-    b'PTfsD+5sTz/n8Eu+LgJbsXP1cpw/8USQuzYaKdxnGFVfwgLJU4lC2duugNAIx3JueoyIMyeO'
-    b'xe72duzZty9uu/v+iK09sWczHZY+bv45txxZPZsXnzsb58+diYH7+7y33V180h9sStDStjgh'
-    b'VYmcL4ZU9bnY2dmOh9aOfQcOHoybbjqUCj5ia93lHDh4aEojvHzxbIrSVfkZEyvJdueCztUv'
-    b'isoUg1E+02h0E75x8tOiunttOx7+wL+Nj/7q/x6f//jvxKMf+nfxoV/6J3Hykc/55yQJxpR9'
-    b'ILAI+hUrXaFeygXvmEoaRNSEDeUFVo80mnhyCtDQ3jgTzaik/Qh0Z0PqIiG3tOhCNR2DKfKZ'
-    b'HqbQwpRzBAdMGAIRWkX08SpW05WOYNMQjP//yq5V9MRRhMx5v9S/n14o4nu+gIWf3918WqGO'
-    b'UPCCuaWa7faWGQvrGfkSzFnOvoUuHj9A83frlp/ypUIm9ZE6Vrka6/NLi/z1aGGIExaiuhXG'
-    b'COgNn7jmd2Dp9voXJiPfVKBPotIXcT3+XHz68Qgy9u4/GIfufiCwhYitWTR1y72vWMOpEeeP'
-    b'Pxrb6ykaKoyidzbXG9I5OCJkdW6zBQDEwrJo3TcOlKJ27uQzQTJuuPFA3Hnfaoe/fF7i2Q5E'
-    b'HDm62uW/culinDt1YsEHS0xrTJNltRz65JTGg01jUia6tPT/3HPn4rHHHl2hGbfcEvv3759b'
-    b'g7S9cvCmm2PvvhsiIuLa5fOr7zRBk4jeYZfnsSnCsNh6FY9482xgMTmiN0mb33j+zIl46Lf/'
-    b'dZw7cTx2t6/F9tUrceKRz8Qjv/ObqTlJiNtGMGZzHDhGf4POHNK0uaN8A/bPh7ThTrHgIBgx'
-    b'dPpOglfK8LRpShIW1ygYVvl5brhBLSPFb99uYMCjlNP7zuZnktyHHOpWgt0gO/KQaZ6WEs6R'
-    b'wGi0AGtDohU++vp1v8boKSQVT0Kv9+mC+u4v5MT/RwxW33j7sLaLkZTI5j2GWm12IxM0u7YE'
-    b'z9axvwjxCvWj6nOU5dOxp71bGUpLYCWidZraYR5xtBCgclDoLXTm5mMUPdrdzYoqmaMml2XV'
-    b'zXFiS6vERXfhXAaZHhRGXD6z2nXff+RoHDh8dH14tyLWO9OHXvTi2FqvUT339OOxfflCz1lg'
-    b'DCFBtLEryrSsaYw14rbHEOVUb43JzPzquVOr93XjgZvi6P0PxB5s1e0zc7Pecc99ga2t1S7/'
-    b'M0/F7u6uL1ZJNIa28rZ+10Q/BiOVClzxaL4+03979tln46njK9rl/he/OLa2UCaQLWwFwTh4'
-    b'6JbJinj76qUI7lTe3MH408YLesrrDHBGZ1F1tEXnSK3/BmssbYjifXc3nvz4B+OxD/92+dK2'
-    b'r1yOz/zGv4jzp0+Wyx8ydYdbujGHV9MxS/y2IADwfIzluleTImakCHNSKHMUoGznLLVY0FCZ'
-    b'8nyX3RL5fip/Un3mYVs0ENKMUvJAOKBTYTTx7DQAmv3JMJWyyA/FfIeuCi8UcEixzyBvrWIY'
-    b'mNN5JThbiZo+nz/yBSn8t77r518fwfs7j83+UIPizoSiLtbzO7mxJa9QNMplZQDCvN6DxkoP'
-    b'iGe3EpJgNuW0m4Xn3L1DGgHtWufDSnsGYENkxXxFzhTbdGMQkoao1YOSU/5MbHjd25ffM4rA'
-    b'NeqDWPpTl8+ciO2LK7e+m+56SWztu6FdYPsPH40bDx1eQeAnj60EfsEpuIca1NZaTRZDIxR+'
-    b'PFmCDsyGiO6hPcwdTBfZpedWvgT7bzoUNx48GMQI1Zp/8V33PRB79+6L3Z2dOHfm2eAuB2hX'
-    b'H07ZkBeaWuf2RdDgHYzEmevn85mnno6zZ1erig8++MpaBDA3j/sPHIyDN92yoge2r8buzk7S'
-    b'hXQLPY64z4jynMdSqGrey4YHfzrWDonTnu+o7atX4rGP/HZcPLNaXdzas3fSp5x87KF48uMf'
-    b'HMDSHGzoyPzOTi9SaEA4jplLAzzEMrw6UzZ9IWGJ89GmJwfIZPdYgEchlofJSqChbwRRvjvX'
-    b'EOu+NsqWB+V3oAxa8/fA9rIoaICzTvHkshrQmW4UYc2odaAq/SQccGuUEIz773nVd7/+9134'
-    b'GfFdERhOfxhpJCjcv0CfSF3ePMkZEVNhXrmg/q9IIWIwGmYgh7NwAlG9AVAaloE6YJQWZ+B8'
-    b'v32u8Fo1tBi5/anRCougwHkLQIQ8OULzeopSo5dn7ppFbazFGIjzxx6KnWurFb1Dd78stm44'
-    b'OHmnY+++YETccNMtcfPdD0RExNXzZ+PKuZOTjiFk4u6GbX73NWjehzlADjtpbpCDxYzLF9b2'
-    b'w4duWVv1mnKV08QYcddLXjat9J0/czryopG7bJ30j5JzsfleQD/pd7R9zp+AVKHNzzxx8pm4'
-    b'evVqbG1txatf/ZrYAsx0Emue/5b15LwzeTXQNBvdeAsmX0IVPhzST13Eyf5n6uPRDioi4vL5'
-    b'c/HEx34nIiL27LshXvKGb4+7X/UNq2bm2tV46Lf+9WBRBHZidFtCTTqjefQwhw+xQEynII3C'
-    b'heUtiC4QMC7QMeAhzbDioRWI2gsaPlb3rscsDC2+ME4ahFHR599DEUYXljjf/4oioNQRmIfJ'
-    b'f1x1WoepljAU7aBMGcRObiywKRQi4ru+AFA/36ZF3eaw08PDHEDANLaIhbMPz/nMk0Sn0NnG'
-    b'NQe0ZHKprwlFdDv63rfNXDy5dCr73xpV2Pwndq5cjAuPfyLOfPw348Ljn4jdK5f6a+CosWn2'
-    b'bwbbzl4L6f91H7ZC5hu4VKZNbzq4+o/PPfHZ4O5OYM/eOHD73bFnz1ZNYVz/31vuffl6arwW'
-    b'l8+diV3uRmBr5gXhZouQ3eUBU19yCcwsn1ZkLKjI2mASiPNnno1L58+teO5bDnukwISe3H7X'
-    b'vXHDgYOrwn/2dKzieVm6esrBZNoOoIMn6VkfZF4ym/zAFch6qT29hvn37NkTr3zwlavfvbsr'
-    b'a6wMYCv2ryf+IGNn+7JM2hxPkqS1eK6Af90MmoYAfQ8MsyRudgDZP7OzTz0Rp598LCIibr7z'
-    b'RfFdP/NX45t/+Cdjz1q7cOxTH4mLZ08lO+NYuL5Rcuwn+96CmnZyyT7SA5FvY6XBcG6mCC5G'
-    b'x3Lws6cNBnIIovj/0g3QWgopIoYSXQmIyv4iM0zfx1/l63s96poSND6dQ2Of+U4VsTN9psIS'
-    b'/jxCT6nD4+joQj1oZDRlvO0LUPjxVraZL1KiEoZMSYFGMIB6aOxSm1bLRCiSvkkoYS5pEQwS'
-    b'66n+4WquyzFehZbP5TEquDg9jDvrzX+9evp4nPnEb8TpD/0/cfqj/yaunD7e/s5o2g21Qk7i'
-    b'HOeRngy21tbAiiqwRGoGB7BUjDHq80/Oxj033Hwk8uiUv4ab735g/fntxpVzp1ZOanv2Gg/v'
-    b'MWbS/zcKQjLDvd0m1FxYhg/dfK6nnnpi2uG/6ZbDsbWGhvNBdWur+2+6abK5PX/u9Ez7jFIO'
-    b'c/MKo+J2stLG6eRnFwu8JKYj9MSTT0yF/7bbVrv6u7u7sgaKSeOwQZGuXT6/cD7Q1NU0k18W'
-    b'YeX4VqQs9PJ8qeqJQjUiUlrh/IWTq4n+8Y98IK6s6aj7vv6b4q6Xvzpe/PpvjVtfdG9ERFw4'
-    b'fSJOPvpQe3418jXSfSNKhOZjgGpy3ydDosd+G6h5vo9l/ZT9s1VbX5TUzqqzYJL2q/StIUvk'
-    b'8Plv4At9T0ih3pp3ywZhQTcm4ICTJDvEglIul70LNoJ1uxTiwS8b5Txyuu308VwXqbpvNj/B'
-    b'2X+g1ty3/r4K/y3v+gdvjuDNxqQ+/dJqI8j2oYvyPtuoFT8AFOip7OXm3eSi4DeqfCseQW3e'
-    b'6CjD6pU80EgJrEJ5blvyeH9Epy6R5rJDbF84E+c/9x/i4uc/FVdOPRmXnvh0nPvU++Pq6acN'
-    b'T+oEaxV6RM5kD1k91NVwGFSBGMZ5Xu/BQUTs7lyLy6dXqW03HDoc+w7ekri3WhYP3nHPJPC7'
-    b'cOKJ2Ll2tRZ1Vk0mOcIshduWnrlE1g55dRR9hK6LIiJOP/VEXL28crW7+fAd1eVt8+dRv+ed'
-    b'deHcf3BVKC+eOxvXrlwReBhzuM6G15/Cc9DVzKZ+A/28QioUJMt8LkiIq1evxpNPfH5V1G+8'
-    b'MW48sDId2tlY12JmlYMRN+4/uObEGdcunVVyKDQ+ug95NZdjVouz7PXXxtxYzUoS4Wg9M3/O'
-    b'165ejcc++oFVc3rDjfHK71jpo/bffEu89E3fuWrGL12Kpz73sZlHToAOBwx/OXHsUD+TkAcM'
-    b'6/oJs4PWwlwQZn3Vz+BtwpeGEyaSo28LbFwlTaMDlEexjIZE1xw41hTi1gixu23aFFjov6CY'
-    b'uuHEBaM2dqt3DClmWBqgDRLhEHHZqUXFI2cvAk5hStFQH9kDWH3wN9/9yu9+83/8xE+8pXxT'
-    b'eXcDsJwDrgdzc/AhWZBY/LRDDwzEdErEHGP7jvYAD+xTmtgSg0mrdIg6iBhFGenVNRce/Wic'
-    b'/dT7Y/u5U8Hta7F94Uyc/dT748LjH1/twYeL5zBAEg39ZSaKvoqEmtSFHtl6HSVTeSXXLp6P'
-    b'axdWcPiB2++JvQcODcf2Gw8djhvWXPG544/G9pULUeO0ZGJtHFi3Je4wHhaOuzZnlRranK7d'
-    b'nVXxe+7ZZ2Ln2tXY2rM3brn96LSO6C6jQt+CxcTn4nPnWgulV122ZZ30b9SLl63Oclqn4sT5'
-    b'ImNcFM/49es7e/ZMPPnEauK/+eab4+DBA33nOL28Gw/cFHv2rmDx7auX5HpmJ/9MUp0z1Mo/'
-    b'A6J7aBI6a97O6tfeI1Vi58rlOP3EIyvk5vDtcd83fNMK6dh7Q7z0jd8eW3v3BXd34qnPfMw/'
-    b'SvC68C6AM2ctw8NkGx1qAmf2gRcpca4JrfkJrxjXOSnQRHYFDWClMv5/zt5sSZbkyBI76u6x'
-    b'ZuSeeTPvUoUqVDXQC3rvGXJGmpRuDkVahB/AJ+Knuj9nhMMnvrA5Pb2Bg61QqOUuuWfsm7sr'
-    b'H8zC3UxVLQqN+wDUzZsZkeHuZqZ6ztFzlEQz9DUwRuTYEDrEZmOkos0118aJ8krTrWx+mZSd'
-    b'NRunafuZbfOepClSeLuJYhO1xD4cibw5bOoSeytpjQMpAQr/z7/9wU/4n9BwhKFmgjTcxHqJ'
-    b'h5wM7bU8CitwwwJCSq7F5hNSmLbZCQcbeQhdUaSINYdqGQo+kxfdcpCKphOM0o/IEH7UJWZf'
-    b'/hPK2WP0RtVijNkX/4hy/qyuuaQ4omMvaRXFSiEPhPGtrAQPdl/P5t9D1nL9fNuIvYYXb5B3'
-    b'uyKNql1QnYMjDM7cqN/q+Q7VchndW7BBx4QlZ1PsaAtclhshiW7c2uykYlhweLPnBzAzsrzA'
-    b'4bmLp1W2so3AqA0QAjtqAACW8ykmTw9Kp0Dfsfe1wFlMLnJ4yjUhPaysjcNDNdRfVT5UaTIe'
-    b'4+7WjSpevrhCr9sDmJFRDj1R4zr+bs+jApslVNJeRFpyw48qHjPiNkkjS8wwEXLWIk7iPeRq'
-    b'cG3Gt+8we3SRwi8+/z0cnl/7NZrh+gc/wvDY0Rx3X/4Mq/nETkUX8H/oLU/7eENx09WgnjG/'
-    b'HVJW2p2EDPP/8NlncY1YTwQJZFcxRpYMNdJWBJgntbQAEQs1fdiIC2pMFjKBDTLLUUqZvuoL'
-    b'COLv1iSk7gcLxE4R2qZuPOBXmL6DMk60j8F9Cu2KZVxYyH3apKI7u39Ljp//EiJFz4Q9KKw8'
-    b'2m0l0uOHJijM9ngqpHGdGM1gm6IkJLgWGHNywaSn7TJFkUVu0ptAHF7W5wAlxD8scBD/Zouv'
-    b'f4LFNz/1FytDPhg1q23x7udYvv9FBLXp85ySsdKKfmEtAacm6Y1iXlyNxcSehuBUx09Y3HzV'
-    b'IBWd0TEoy32IDasyK+90cfjy+wCA7XKOstzEiVqy4hU0C5O2HFU+6LDvl5rOoJQ1ki8ZvbgP'
-    b'ADrdLo4vrxE65Ib7GQfio8wb/ByfXzoIebXE+PEOdV2pUJTkg06J+0pWk8kCLt6HurVIwGQ6'
-    b'wbMf5Xv58hUGwyFAhCzP/MEdz1kXnR46fUdf1NU20XlRC5sF/68d5/YFJiUEtFH4FZm21iTG'
-    b'TxhAXZZ4/7N/xmbpgpZe/uCP2vciRnd4iPOP3LTJ7PEO4w/fioKRmwkJlQzMkCRG/OuSsVft'
-    b'KfxiQylzgl5UCXJhBmqD8FoB2u67geYp6Halyb9BIXC8D5Ehug5jyyG6b+ntYO6lEkagNFVn'
-    b'2hWRUMHvi1dhJKkiipoSQaFS4sQ3xInhdFkbo444ZibS1HAw0s6xKLl96b/8rQ7+ox//3V+A'
-    b'cWRukrLKZrbT2cTDxxxXDpqPNGx0DK9zU21p3Nw0mUPmWI5lp9iGEsFEOVSnEZkGUeR3r3/f'
-    b'uOWd//pfUC2n7hAcHmHw6ocohg4SrpYzzL/6CarV3G2MptpXz7vJMI9o80sNIChjHg10RDBV'
-    b'wqyRAMxvvnKFXpaje3CMPO+ILiO+RUevnMCvLrfYzMa6uDMSvHSDEhaM4XgG68iHPVVSHBdN'
-    b'MdzHjPnEHYyd/hCjk7MGW5B5CMQSKiScXF4jy3OUmw1mz4+RTa+29gwz+tQsY/Qx9Sw/tYc0'
-    b'iyKpEXa1xXBVbkEAJuNnLObuMPzkk08w6Pf9fcxcByIjJ7IcPX/w7wo907RedmzCZCvy9xAK'
-    b'jWhSg41CiCxqAXGAlYCuqnKDb//1v4KrCnmni+sf/mF0n4puD69+/89ckbaY4fGbL0THSY0D'
-    b'JCEN00hOHMYaTsLcxApm3om65HLmhg8WXXRzDdiNXKL2U0k16qpS3L/MNmGKCzIS4tGoM44U'
-    b'18bkBRBFYUf7koBWrcBUUsub9mSQkTrNKYyrTtCkbNFHgvJkStOcmi4OD2yOng2Kq614XyWO'
-    b'kEJttUb62XPX5Ojl7/ynv/htOv7/KHud7zxMDZYSkLPxGiaUVbkKjOFENWboNiLnPsl/cVyl'
-    b'E8fcVjRyKnaIfenJcWQtiVhSwSclwuLKxQSzX/8zwDUoLzD69E9w8od/hdHnfw540dTi7c+x'
-    b'Hd8F3T4r0EghC2SMPQdVO8tZRilwZJIUmeJSme2noK4rLG7ciFTeG6AzOvGIDkVm4OH9PLh8'
-    b'A6IMzDUW92/9IbIPNqPYWtmwVDYoMRP6TaMB7eJioPGoX/qDvzcYNpa1YcXePMfUHt+7De7i'
-    b'+jXyvEBVlZhPnoVZSewomKLTIsaLrSc1EbAC6RPR4jeU5wADk/EEZenMk773yffcZ27S/+wi'
-    b'qdso+ytU5VpaiSKODGRlpKLpdzYCmgKdjZloGZoVhcJjUqgwMaPabvHw1S/dfTwY4eLjz9oi'
-    b'ra7R6fRw/cM/RN7pgusaD9/8ygxV0eE2JJ5PioS1GnBRDhjC9ZOjTjAUdcn3Did+Ygvd9tnM'
-    b'kAEgZETOPtuCJSE2DrbIUFITUmr0WzQ7DThDwdhaZM4mGhYOPfglKqICtK1OxljqwdUNeQra'
-    b'wwjw/n82Hkl1HlIUvU3aOjuBLHDgPCkn4ZhULbH7YP/xtzn4/0M7ysERDBfuNKx2IXHYSQW7'
-    b'hOyEapSVyOc3YMii6Mq2syNLoWI+jBz5sZMBcRjyJPOlmaATvBJxkBxcq+W3/x3bseNUi6ML'
-    b'nP7RX+Pw8z/D2Z/+DTqHjmPcjG+xuv/G9m0P7kEqepQkuiLwYZYhF7b0JSiw9C8S3qtqvcT6'
-    b'+c7D/CftKF+eqZnY3Z/B6aVT9jNjevsNynIDaYiiPVso4uM4ZYBiuKfp04QMNJPV9Vivl1jO'
-    b'HTozGB0hz3M0Y6OmmVL8Wc9ffoSi64qF+WTc+tszm/QVmdwgVBa88ksh1huueUS5i5r5D/30'
-    b'+Ni8z+vXb1SF18a9tptl0R3sKj5U67lAm1lx8SZwF3TxFLH8bAibED1H0STAb0LnElBut5jc'
-    b'Or+Cw8uXOHpxHTxnNZiA4xev0PFRyg9ffWGMxYYFMhl7BqU06YKCZ0Gxk/DRYHXANOhf2JGz'
-    b'pFt3y71u0JnQXZyQtf8W6H9YTLKwAeDsnPLUwWugeaYzaHO7dZcSEQ9E7Tgiyxkd0nSlAh4o'
-    b'Fs+TTCNlgZalp5XSSRBknhd2B8p6bUSmQmQiF8msDpJ9OQOM//DbHPz/Y5xsJj6FoXA3BLMe'
-    b'IiUBi1j+83F0owGsC0heevVzjAdbM6xkQ44B9qQRDg6XkLYiITZgKEWlWgKZ+LRcfP0TsO+w'
-    b'+lefoji5cl3IxWsMXn7uFtd2g+X7L1BvVo1gzAKa2PDXDhBPE5qKcZhAOS6NgBrlf1A0sH00'
-    b'1ZulV+YD/eML9A5PI8Gb9ad7cILCi8RmN9+i3o30SXqRTLPavba3cYFjHDohGcmIhXLiik7u'
-    b'bxpeeHB4jNyPITbPGes53gZlIuDo7KJBCWaT5+jq0z4xg1RCK+MybsVAgfzfzCAIks2aTtAX'
-    b'ZTc3H9zfswzX1y/bwryBSznG50HodPtNd1quZ6LwET4FZESxhop1TgA8oYHODrKlFBoA9dkl'
-    b'IjK5e4/l1CE3Z28+RdEbxuOwAIanF+j7KYynd7/GYjpWNglEukAmi/9OITa74lb5aCCeYmCy'
-    b'LSaFriQ1XL67GnVZotyuwWUVc8fWfoIYOImZLDK9BeLkz4QRFoy5/T0jqhxZExsZZESRrkNS'
-    b'xixD14SSJI4z4GRzRYl/20MeGNoFjUxQ8IGY97+qCpLl+D5xc4b/Gw7+wx//3UcAPrHQH/lg'
-    b'cej8xileWCosKeYqo4OclBpXzpfHhxwiPjFEFylRhNrVtn0gp+8uwzJOYSspjFBf8nwAACAA'
-    b'SURBVAE9px2o9tdzLD/8yn3+Tg8HH/8IxeCw+d7Dz/8cVBQAGKvbr1DNx7BTnGLcN+b3palI'
-    b'PMbFYkFwyJnbwdOIpyV0HbxZTFCXW1fAnFwi6w5UhS7/FP0hut4FbvHw3h/8BAVUBIs9mRjA'
-    b'pCodklhpdOhIGRqZxQQDeL59h83Kja2NTs6bWFqOKiZh5xrsBqOj09bE5/kRzJV2FW7Sy9Lm'
-    b'KIr/ZivSObYxDXMM4o3C/QJlWeKbrx1F0+v1cHJ8orUpRuJWVvR8McGo1jPsjeY0RjItP3JS'
-    b'wDVHa5BNyoOSkppwfdZVjcdvfoVq44rLk1cfR65yRJmzkx4McHzlUI/p3Q0mt2+9R0UJq0Jh'
-    b'w1OC2dDCkKAeg2sZFelsd8zxHiWc+pVzIflxUwJXJSb37/D49S+xmo39hc58FLZ2ObVlQSzG'
-    b'ZGXlrfUAlKCd2ORwWUICwXNC6r7GIpFUe07mP5CByIXhXgmsTTVRrBpEMvtmqcchdWAZyyWE'
-    b'Oi0HU5L6HwIDn1z/zn/66Dfv+An/XnWMqnKnaAPmZpcis7vlPVw8UezGz8KLgs0Hq+VMOBpt'
-    b'Y8QBQmQ7r6lqk6KJg3S1FXPLpmklh8c7GcqreAFtHt75ET6gGJ2if/WJp84c/Db86A/QOXQZ'
-    b'7tvxLTazB995kUkpxLUpRdeBRNWchABSrEgDmX/32ODq8QPYh+x0j84dfwxhIyquR1Z00D9x'
-    b'ivf17Bnb5UyVUyQO0ejQoz2BI4zkv0cbWVOZtyM90jxt+niH7XoFIsLB8WnjmhY7GxreFP7N'
-    b'8zxH18PH0+dHoDJEomTQ6WZ0JeLizlK0I449aAoLFqppBlarVZPKd3AwwuhwpOgFNgrNotMF'
-    b'+QKo2i6hA0hDlTgLglKP9rHyu2OzUlDZ9cTJ3iu8WtV2i7svf466KkFZhtNX32v2E3cWZm4/'
-    b'yAucf/yZL2ZnmN68c69Y177LlNMxWvXeREAn9CZkxYqrWF7WyEm48yueXT/wdV1icvcO73/6'
-    b'D3j/03/A3Vc/xXa58M9OHu8n0eiB+N3ILmhJahCI9ripBLA9k0ISzOhwxYkL2SeREheSCfEm'
-    b'NhQ1Ppn20U919dbYeSTwZVlo6OaEEgw1G8V9q78Ike5mTfz73/zgZ/y7MKUoLvTbh0k5I9ko'
-    b'PXQKnsVjysuXrrSUfSFxcnPUSYK2msKoayCNf+OGIx1wo+dd5WRDBC5hffc1am960n/xCTqH'
-    b'Fw1XylyhODhC/8qNFFXLGTZPN1rVT6w4famxCBtgIkVkR2IrUrcuNBsK2cO01ezy7ltXvBCh'
-    b'e3CMLCssXFf9Obh0NqnleomN98KPPplS0rKUjQTdERmfhyJ/hlYAF8MfbEVt+B+dPz/6AyPH'
-    b'4emF76ZYjKLqwqK581mG/nDUQP3T6VPstGzA4Nb4psSGm00ltNWVs8jEiTrCfX21XOL+3mkz'
-    b'Tk9P0e8PVRdmyV07nR7yvBMc/JL71EFAoR2v6asuNnfeeWeEtryy+JGJdc29jgvIqtzi9lc/'
-    b'dUVLr4/T1x9r7peATqeL84++76ZNqhLju/euxsyydi+KFPAcb8BmC0ERcyuzGcjcTONKkASt'
-    b'Jy3L2FC7ryZP+NXf/5/4+p/+b7z/2X/Dl3//X/DuZ/8ADRjJiPT46oWxypZffUyxBq/FexBU'
-    b'FkVe6vUsrUTUdAWdduN0SQrNYKTZZdoDGHBgqQvdZdv+82TuWJE7X1zwphBkapT+kYxT7Ym0'
-    b'o+P+3b+F4/8LZrJT7syuGsYcfRiOQglWw0AAmmeAY85apP1BzrGS7pZklyDjKSQPxaGCnRN4'
-    b'C8muWlSBxBYGhJ2q13qWV7dfOn6fMvSvv+/m93eHkX8qB9ffd3BctcX67hvU5Rp75vFgomcp'
-    b'fYP5cAcvkFS8WyukfYHV43ugrpHlHXRHp6BMlHOJwung4jUoy1CXJVbTRw3Rq0aDrLpDIPoU'
-    b'h/yR5mJJUUDWuIL72rwx78lj176mhtgnSnVfPTxxos3FdILxw52KSY4eO0r7JaQ0Gw0ELLup'
-    b'wPky7NJ2XP9qvW7ieC9fvEC314kQlRSFknd6yDt9zyFv1DZH0CNoUZnK8Y3bZVrGM9cU1Kva'
-    b'kJ5Ye4cTWYoXYD2fNsE8g6MTHL98o13mmJDlBY6v3zR0zuTGQf1ZXgTX2OKCbZ0Ghwdb8Dk4'
-    b'shjXOhTLl5QiapNEQmlsdFZXFR6//QK3X/wEq+kzNssZpnfvcPOLf8LGd/0W0WJZ41JYZAqS'
-    b'jEiiXhoN2+3rlNqsWNvwmup3YTtpOeI3KBXZ2E+oblCmmxJaNKyVQzo39vKw1/LOFrtBzoK1'
-    b'uCsCKLHKWaXRCa0dBVMA7qt/8W85+P+c5MFuwVSkKG8NO+6hzjWS0F48OW/OZIMIlOBy48pQ'
-    b'CCbMqQ2KRFn7dZycRK7ApB/oEJGJuhpGVW6wvv/WcaS9AfovPmmf4yxvRsn61581BcHq7mtU'
-    b'y5mxKxhSFCbbU9v6KGQdxhyMyLGAy0ndTOZ2/G797KcUBiN0js6b7sySdoZ/hpev3GfnGsvn'
-    b'ez9nTDb0DRi8JgngPuYESPVH/niRo4yQs/vt5upS9YC86DiO3xvzqJGxRqFOEd+ZZRkOTx19'
-    b's1ktMb6/0bckQHFYPbSk4mvNolo74YujKC6fmBjldoP5zAkXr66v0e/3RVXBhjkVIaMMRdd9'
-    b'L1db1bOkhU3toiSVR8FmEmE7UWCM76ZEYhz3T9vVEgtvwnR4eY2TFx811Ye0oz04vUDHazKe'
-    b'330dNQYR48LCZz7RucVR2TtTKBb7KaUdpoyON/RAsJqS1eQJ3/7r/4N1gKIx13h6+yt8+Nk/'
-    b'tNef2+sFY7/dreHw9yX1SclGb4K9nlLyAKVloBQ9r6Z7JDobOgmnimSLt9d5rIYgLNDyKMFU'
-    b'4jknSQmFsD8hSiKV523I7llOfiQPL/dDf/4bHfyHP/67HwI4iZs3UptaFHTiDw2SMJQw3lNo'
-    b'vXqerQRmiheEqLSahz1UmnP8e2tHtNhDn6IAEwtASh2UBoYXmG1Ec+DhvQgCRMrxLcppy+8X'
-    b'o1MzDKJ3/hqdkesQy+mDO/iVcYPhktFYA7Pg6yii8OKZar3gVddlkvRxJbrz6O8cHKN7cNSI'
-    b'nmjnIRDqyYPfY3hy4QNfgMXDB9TVNg7CMK6PAPy055NEsDicY+AgmXAHS8boj3Tj283wd7o9'
-    b'jPwBvruepCihoD8Lmp/js0sQETbrFabjJ598F95Kim8th5txJOUypBocbQAEqWpuxw4jlTMD'
-    b'm/UaKy9cfPXqdVzUBFMz6i5keTPSx3UFrktlowtC0jBNunonvOHijl/yI3swZxazK+vFDOu5'
-    b'mz44uf4IWacQAsB2cqg7PGiU/eMP32LxdG9AzLvznBO0DCKonA18IG5+2XYftD4jB889w9xs'
-    b'J3dv8fjNLxvt0O7fN8s5Pvzin8C1tKIjVe9xFJRF9ly/hb5F10F36CRn2jmMcmd9DYyZMDXG'
-    b'SWIMTk6aR7dGdN+JEyDUTUXufMIkilOUn2yAEyEPMpWRA2iHDavyUPOFeD2fXH/+v/zwN+j4'
-    b'+U8VV6AeSDln235oVi5x0lSGFESSSNs2YWmKPlOQ/Mcc+aTDUENbMUAtexVuThxV8GzN0CpT'
-    b'C7ID4qx6P7i5m4e3qHyMae/iI+T9UQxD+003Hxyic+J87KvVDNvZg4bkYVeJ2l645Uvpu0z8'
-    b'sKf8VJ4BoWJ66z3bgd7xBYrBQQx2smCx2ImlGEDeHSLzgS87Zb/Vx3CwFHXBR1FXHELlHMSi'
-    b'muIZf29ZFHThGy9911R0e+gNDyNOtS0mNE8fFpynL65BWYaq3DYIQuXFkE3FoQpmEcwiHOk4'
-    b'rOY47ISg5sgsZoFAmM1mjXnPxx9/L6rKWltn6DFOAvJdx8816nIdu+8RGvc482lT0xNsucIn'
-    b'eeJIX5E0emrv+dyHLAHA8dVrT/zHMOtOxNYdHODw4trTPPcNUrDjV2nfeALYyIXYF8rQ7kly'
-    b'DbNxzVgeSnL4gYDteombX/5LM4LaOzjE0dWbJg1z/OFrPH7zy2gf4VTYjbdsjnf3YFyQjcmL'
-    b'BCevEwdtGi4qxzgO1GEbcNbdtNCXkIkeC/ia41AjYk0UKG0lh4WY5dueIoFghs1ZzoQpFEWd'
-    b'Oe4H//Q7D34C/YkUK2ge3/tTk5WVRPGBzeaVjVl3ChTwCtlp7VJ3/1atFtg+vcP2/mvU8+d2'
-    b'FKqZX+akMCN5ljUwCadinUTlwYhBvVY1Jw2I7H3OXZz1w1sHi2Y5epffQ94fSmv85j16Z68A'
-    b'IlSbFdb3b8FcQoK50WKicG6bxTnCzmWQUlV5OnzHdjdsCxUGUC6mqLdrt2keXzTcrxIThpfO'
-    b'8+RFb4DCK96Xz3fYrpYm7CcYxwDmNMIyvgs1JAtdDIva9qfqusR66Yq1bn+ArjfiCd0bd4UW'
-    b'Q24cLSp06m17AWA+bU18KOXQRForQxRz5sTcTiGQzVdSkE0vS20mxtPTI+q6BhHhe598Yptf'
-    b'hc9xICwsdveZGfVmEfCNHORECJTJsPBltbYogMRhDvlzGCJGFuLfvmJVlnh6/w1qby98ePmy'
-    b'ubeRQM4v5t7BIc7eOIHtZjHDPOj4tWyQUzrt4L6xkUcfm9oLks449ilAEwN1QFMHt3d3PR/j'
-    b'/qufO0oxL/DxH/8lfvS//u84evGm+Uw3X/yLQf3p2Yw4Nll31hTtgaHuQLi2yiAjCViywvDM'
-    b'EmK/k164/uLmbk/PpKF0QEcWS+7RfI4NREf4xbAKltM7FHN8mFPqeLEzlv7kOw9+Bv447Caw'
-    b'Hz0z0r4EjGHabdnmHDJtyqA6wXWN7e2vsPiX/wvzf/7PWH31T6hXC9PJzdowYyRHKICIBJxC'
-    b'Zuod6Tym6C4QJS+Surebpw8u9azTQ//itef1TTcA9C4/AhVdoK6w/PArVOuVoF2MK8tC4Bi6'
-    b'eslAmRQ/yppeDiEoS6y7fHjXzvAfnjVjXsQtbMVkH8Z5t4/+kaM11tNnbBeTABK0Oydl3c4J'
-    b't0aGwf/LgpRjqF281HIybmb4+weHyIoiST+a2kf/wU/Or5D767KcTo1NIuW1F69sFjhoFI4V'
-    b'bMzN5w7zh0k/17c3N2Bm5HmOl9cvEY7tcdQ1x34IRBmyvC2C6nIZ0Qg2qknG7BJF0DzFpYmA'
-    b'ZClAC6j1YwibNmFE76KVSzx9+yW4qly64uV1ICrmOEiGgCzPcebDeuqqwvT+Q0wjfafFNwxz'
-    b'GbF3stEbE/YF5kU6ARjvs/vz/P4bLJ7cpEb/6BSvfv8vcPHJD3HxvR+CMjfD//jtFyi38Z4S'
-    b'rvUIBY2I5lD/QwrCZp0pbB7QLGgoTsWx0Hfx9ftCcLG/XDCh/vaZYOkaGBbewtMGImvCQqjS'
-    b'hmOWV0Zc8aYSPEMkyv/cH/8GUD/+iBRklTbMZRbbhhxBCvBOlpWW8RuzYW0bfuP24Vusfv2P'
-    b'WL/9/7B+9zMsv/xv2Lz/mVe569hCVjhSWE1YkwQJeBcS+oeNTsg6X9UgrYCuWi8bm968d4Di'
-    b'4NR3HWywk4ze6UvkPeeHvhnfol4v4obCUt8nLGN3h/B+9QkaPpWFxaqK9xQvs7p/52b4idA9'
-    b'PG1m+Fv4khO+BkDRH2DgZ/m3y7mfM4YS6pgqXw6901nI/GBksttQv/Q/CHUiy1l78A+PTsSY'
-    b'EEfyJiYzHwwMYHRy2hz88+nY5TREGuNdsp7xTDcQvpgWaXRHHBXNIf9JBhdLgbL43dtvwcwo'
-    b'igKXLy61jaqczaYWznZKd/98b1em4XZC+tqCbcxGqZO27KUg0CRiINju6Ahuhv/x7a9dYTo6'
-    b'wtHltT/giyjZfPdM5Z0uTl9/AspyMDNm97dxX0FsUGzBCmbdz0PsnRTlQdscHH8Hchlx2P7Z'
-    b'KTdrPH77C5SbFQDC+ZvPcHjhEI6r7/8B+odu35k/3mB6/16BnWxRriwkFWEHwAxOHcFiKD+y'
-    b'ZyJWSFZIcEh3VIqCiOI+vbVfZ7G/s4j4jh8YEoYfRHHOPRGlU3aNxEDeV4kIVEHmx4YTBO2w'
-    b'CzXUHQdR5BCeF6IU/KO9B//hj//2CsArtvKcv8sw33wwBSxLmntJFS2WmKGaPWLxr/8Fqy//'
-    b'AdX0HvX8GZv3P8fsn/8ztrdfmlKT5C8pJgFkzANJjkN9JLJFSrLSZQmdMxgOXtyOb1p//sMz'
-    b'5I1bX8hXtg9e5+QFiqFztasWk8YPPX16k4Iapf981HWTYS3GVghPHL4shyoIwPLBBexkeQed'
-    b'0YnFrSQgNpcANzhzfGq1WWHrEwslzqX3wPYzki5PtJ+ycc1CR0OdBu828OnjHUqPtgyPToE8'
-    b'jzrtsD+NXy9+8/7wAHnHcayL+cTp4zp5vAmkVKZMEUSqnnyW5XT7THOi4GZfdL5/5wxqev0+'
-    b'Do+OI9FyezAHATrcKpSzvNPoUni7ijQHTDCgI41Q7fQ7ChsMzHWapkJ89oZvD2Nng4zY3avW'
-    b'VYnZg+uAD07PcfzSGZxleS66z5ZCOry4dveLOer4FRdNseMbBxND8qxhM0FKzH+HplBWLroO'
-    b'AYn+v9ysMP7wjWswOh1cfvp7zmKagYPzaxy92PlmrPD07RcqatayII6EoqyHDM2mjgJtmG8C'
-    b'pdMJiYQ8ShX4BmSvLOYVVR66vYrClY0SQzSuFOpujMRYpoRXf4BWKcRf7U8cIQhR20Kxc5/0'
-    b'7acE0cHAq6vP/vpqX8f/o9g+i9NClLAbJAQe4YERoaTHLQdGCyqOFmr7vdvbL7H+9ifg1ay9'
-    b'IdUW2/uvsf7mJ6i2a5jjFU3FJ4GlWJBDFnzPe/AUjvqg6IBIQlPB/d8+fWi69u7ZS2S9QSJt'
-    b'2G0+eW+Iwgf2VOtlE+GrizJOXGcZ6iCy31VRxsHlDKYVoshXCtwX2z/r59uGwij6Q4jBuqQQ'
-    b'cufZMDh94Q7TusJ2MbNbkCQKFTrKxZAkhzSUtdDR2vdykKLFwSqdPt6j3G5ARBgdn7UbgjIE'
-    b'iuEJFlxjbzBEz2sZFtMJKplEuA+uJIPDRCLDBsK/QBbjaOeO67pqfPqHw6GL44WAVIyda3fo'
-    b'5kUH5I2a6nIdK9xZUogcFbaKRhKjfOx9LZiF053ghBUyZYwRMtdYjt00zdHlSxycXQZ1RzxW'
-    b't4tw7Y2O0PE5EtNo/FIbmhClSB+DrYFty6xRASsbQ04mxeUcA5g93mL24H7f7mCE849/0Lx5'
-    b'd3CAszefR3C/TmG1lBJkShhon19+CJlLHUd7kJiNGJLUSfuERwI+yPHp9rpJK3NW8nq2ARcO'
-    b'ukKdnZ221haImo0Nc6zxIENcGI4EsfYJUmQ7R1ZRP9p38P+BHHsDrLE7RG9O0YKmCN4KvdSl'
-    b'eCecNTZtwIMCuJo9YfWr/xf17rCjzMfVAqhKrL76Z5T3Xwu3RNYUfuo8Z9ZOW0I405ojSF1D'
-    b'+DBzTHsYVeDuJm2fb52gK8vRObkGdfvNphHPJLcCme7JC/f62xXWD++C0Zx9IBKUQE0qvZtU'
-    b'Q2tMiMWhSzomlQXesp06lXoxOAg6fkO1KP7UpRNq9o/P2yJi9tyq3XmfGMfgvohFHLM/1DmE'
-    b'hjm+r/5nKNyignGZ2fgBXNfOte/sorE6jZLyUjkHwSXIi07j3recz7CYjmFlf5vebMy6Exen'
-    b'eWo0jo0OctfBbTcb3N26Q+Lw8Khxp2OOaZLwkWgEi97sJvPufXW1joMVzExTO+CjxTOEo3mY'
-    b'TS5qBqb0IRoWtQxgPZt40xpgdHG1J9ip3fg6vT56I4e4zR5vsd4VpNJThcQmDj2+Zzfpsd6C'
-    b'BV+v5rQD0SSHazJEJesas4cbbLwY9eDsBQ5OL5sfz7Icp68+RafvKMT5852foiFzYrctiNkc'
-    b'c+Ygttn4VZF0SJGGUCRxRV0tUXTm7KKzQzEfx5bzZD2HFBWaUPqjWCwdjSMKu2kYa9BakwQ5'
-    b'nRaqcuwJKua4a4yKnPAMTQbR8R/sOfjp97UiNeBeRCqUdosXNZ5o0Aipm88JXrr9vu3919h8'
-    b'+CXgD7rs4ATFyXVz+JfjW6zf/0Jxuc3GaBgtcwIYDyEsFp1FbKwIUwWru08Wi8fZu27Gt40X'
-    b'ePf40h8gBCBP6gq6p9dAloHrCpvHd016HVtjnCzSqlMDCgiDTw37olAhnDA1kDzcDp7vjE58'
-    b'4ll6XcT8XQ2A0Ts6aSDj9eQJdVVBDlZyoqOyhHSIFNBQo+VsQDRs5MMDwPzpAXVdIS86OLq4'
-    b'ai1xOQ5PJYrDWUhpRxjDQ3eQrJdzzCdj5c1OAZfXCNjaF2+gR0pAjBYxLDMB2o2DsFwt8egj'
-    b'ec/Pz5FIshKw/G6zZGRFtxkR42obRenJ0SY5iqoOCqNbjManWMNGuhkjhSwSgNnjHcq102kc'
-    b'vXgZNbhM9u6Ud7oYnbuR2sXzA1bey0FrgKUCn3Rwjq5Qg/2m1eCo0BeSuiqBrIr1XVUV5g8f'
-    b'UJVbgAgXH/8gAKHc+w1PzjH0hfZmMcP04QO0OpIaC9z4xseJgWSUXqSQJlbMG4UXkWQhwNYr'
-    b'mggn+4aT69ojkhxrtxr0ngxClFQaa8rEqP08FJmLkdS1iXseU7gx+t8q97VxE4nnRGvOjXHz'
-    b'+Jr9/p6Dn39Ph2CQsPwk7XkasDGcQAWtG0UpPIXjnqWuS6y/+RfUft49OzhF/5M/xeDz/wGd'
-    b'8498ZVti/fW/YDu5bzcA4sj6kkV1EUVpKptfmDRHbPtiS5cMiYOyUq03a2wf3wNgZN0B8oMT'
-    b'ZbFpqbm7Z6+Q+VnpzfOtG5lqql9BNFCoQjUOM2nNyClIWbuuUKJlZ3fDUHkKo3d04SYRYL+O'
-    b'oiX95tLpHzYHyPzxxnkC7PYYNQpM9sPGFjNIsCKEZSQIEZnaToAw9xt+3ung+OK6EejtDQaL'
-    b'2qL2Ph0cnfiDf+kEftIYhWx+k6MwIRJwN8fqaOMIbX034vnlxXyO+cyts6ura3MtEFErRBNR'
-    b'xlneaTwYuK7AqE2eSygqok2RkFqLUtgZWwDHHj462m7H/9d1jae3X6Hcbv3B/ype48ITlpqD'
-    b'v4MTrwXYLOZYPD8i5UBpAdXRAWM0WEqGQrr6ZIVusU7MC16j2q4xfbgBmJEXHVx++rtq6qjT'
-    b'H+Lw0l2D7XqJ6f27WOcUGuaQvCtsAvPWyCw3fitkuA5qpDQpVcO+LoIM9W/tBdPpColUNmes'
-    b'wYjQwMCUq3meOaQ5lJm4aSsu0dN4hF0UUkY6YWq7C8toajuq30sf/Ey/K2fuQ7hTeS0rTJiS'
-    b'il2N48MI5wCklzeBUU8esL35AqgrICvQ/+RPMPqz/w0Hf/I3GP3x3yDzVrbbx3fY3v1aQCpq'
-    b'Xi3gPklVgY3to/BmZ7ajV2B1haxPM9lHb8e32E6dCUgxPEIxOBAcjzys/Dzx2asmsnc7e0S9'
-    b'WasnaTfLSwgjLFkIQDiqo8l8Xxjh3jqUR3L15WLSIBHdozN/gBslknmwZiAARbePzg4Gf7pF'
-    b'uZvlr2sTwmUNduwpOWUnTMGT3nY5kVgnKHJ3+e3dXh8nF9eQYxUkg2/YrskBxtHphd9wV1gt'
-    b'5uZkRuxEGNoTBZZBIkAkPmTUx7UpKBAWywVWXrj46s0bnaHR6JvaeL9ovWYZ8qLXHPyoK7Po'
-    b'amBjjp+j2L2PI7QmRoZEMUCJQtV4KOqqxPPbr1GXW2RFBwf+HqjCQsxp5XkHZz6spyq3WE6e'
-    b'AptY2kM9cSTSY8OsSJ7xjUSOUtsNKRqedht9cMaUmzXmT7cNv3/y6tPgFTKgZuRFF8dXHzX5'
-    b'GOObb4NPUBulL8dUk7EgWeznbKHrRHuaeMOkAdpOOQpkqxmoXCgYZVkwoZ0hI/K0KJnDsTLe'
-    b'KMqxUOPR4Wg0xcFgsmvi30RwLo2FSBmrkSEMNT3MpYt7m6T7u+bBP/rx314A/IKEmUDzADKJ'
-    b'G8Y2rK3CMXZZ06zcw4iMA4A0FLv58HNUU9fJ5wcn6H/6Z8j7hyDK0H31A3QunbsYb5ZYv/1p'
-    b'EwXLiYqbA143Xngs+CNDzEIAp+aqreJGjZX5w3H22Aj7OkeXyHqH7SqmhMczA53DMxQHrkus'
-    b'lvPG9S8ugGNVcnhccKjKVGuvVWnZ5V3AMQm73fC7lk83YD/D3z08R5Z3zGtmpXVR5t67c3CI'
-    b'/uFulv8J1Xq517FDStyIkdCkJoxWWNdwxNZGRFjNPY3RH6AzGOiCOGnSRk03s9ufTy5egIhQ'
-    b'lSVmE2fiQztHxXBUyQjpSbheRGp2juBnockR5kIAMJ9Osd1skGUZ3rx5oyJvqTnsSRX9u6Is'
-    b'K9pZfufZb0XGmgBZemCbA4SD03sFYf+8UDPD/+5rcF2j0+vj4PRc/RIR2+4fhKwocP7RZ8jy'
-    b'wk0FPN4GOovYM51ZHP8cFyW6UCWzZmGGjT7Sd1S5/t9X02dXoMBZYeedriFjyHD04g06PSfC'
-    b'nT/eqOfM1j5YS1JK/4JRRjKuCRK/u7SLbZpKPWYUaadoZyDk4P6dERXL9ybR9KU2FTbOcoGc'
-    b'hVM7JM64fcPrtHcPizVnMfIgaCTJxinOnwHQi6vP/vrC6PjpB9g3oxjCaUGQRVzZaWybA8Vh'
-    b'WPnGDa1wcwoOV+Ya629+AvaK/e5Hf4Du1febCYJscIT+J3/mhHFgbG6+QDm90zQEGZuKOPlJ'
-    b'UuHWJGM05xnOUSbaz6iAaouR7eShCTLpnFwh7x+0VSYnYjz9F4uRn/ffrlplf5gIxyZ6rxLN'
-    b'TMAuOeLO0CMYHIXX7P6s/SgfiNAZHoLyHKlSQh7OLsGP0R0eOmU/gO1y1vCxzLVJkbJcKpaQ'
-    b'U9kv6zkOcz/lEF7jRtTV6w9BlKEKBJZqsiNwP2Nhbw14974sR1WVWE7HraVvMJcex7ja7koc'
-    b'6XEogtTNAhfSLc39x3j8jKqqkGWZt+uNUbimoAgk07trWvvX23X8YAZXG1U0xvuMVaGR6hsV'
-    b'RkcifIkRuQTaD7Gj9+qywuTWjSx2hyOMzq8EChXP5DcdXpbh+OUbR+0wY/ZwmzgsyNzVmQ3A'
-    b'hZSTcoQQJQXJO/SAY/8c+c2zxxtsV67BcO6Egor0Opr+6LjJIlhNn/yEuTTluAAAIABJREFU'
-    b'FPt/Z3FYk6Lnwq+S2mfbwyClfCezv2DR7UOr1wMdhFun7vNUVYn1YoLKI6IkDenkkcxGiSgt'
-    b'r8XOEI+4pqa/yXCvtWSriMSnTHHUUzT9IcN9EGgvSGQPxBf4BxbU/zt2hheLOc101Kvcj5gh'
-    b'3MvbDxor3MMFHctDqucPKB+/dV/rDtB7/Xug3M3S1r7D6L78HeSHrmqvpg8oH99GVpMge8YR'
-    b'UQxvWxWygRNYrnVJmCrlThX4c5TTB3c4Zjk6x5egooiEMbGmJM6y7oxO3feVG2zH96ibw5CR'
-    b'9BAjtsfn9HfqoAumPaZFGhJdPn4As1O95/0RjDzGdHccqBSH3mSk2m5QeoMma+ORfYZKXVSH'
-    b'PBmVvAgJgYwQdv+2WsywXni/8+EIlMXKPQ42O4bYxBV5Qzi5fNHY9i68/39o+hMZdZA0BAow'
-    b'RqZIIERW79DoAEgVSLui8PHhoXHte/XaQ/3CWtUcW+WA//eqfufetzLaOA42cBEAlkRG9XoT'
-    b'TrDfnZDmY0/rqmy64MHRCUYXL5K6jGYsrnai027/AEXPFTbNLD8bxqFiDItZjgtTUmhr4wJa'
-    b'zyiT2uSfutxieuccNCnPcXL9catPaup/dy+K3gCDY9cQrhczTO7eBXHoskIPSTHy+0M8k8/m'
-    b'GDcr3wLpQ0Eh9cZCFatH4RUyQACqcoPF0w2m999g9vgO29W8QTagqCRux9HN8h0mpcERP2Po'
-    b'LcKwHdIUtq3cQUDVcuTGqr5TqOeJZKiSHHUlf8aLg5/An8eiIo43bMM8hBPigmg1MgOJDdkU'
-    b'b3B8Dzbvf4F6Pnad7vELdC4+8Q9W3UCL7usfu812s8L63c+bzrARYjAn4TK2FQvNE2wFYrKJ'
-    b'11jXhWL6wH/HdnrvXjsrUBwc7eeBqB27Ik8NIMvAVYXN+LaB1RGeAYRYHcuxlaT+9TkIkGGF'
-    b'eZMFhagHzf3c+rG1IS783HOShKIE/02E4dlVw8lW63UwvsU2IsdIOy6aC5gN+C1AQ4xxj8X4'
-    b'CZv1zq531GS0c1TVsxkkExbNu/c6u3rtzFQAB/Vz3SqOWR0/uiQVyBaZflsUjd8xaX52t8l+'
-    b'eP/e89k5jo6OktiPXjuMzL95XrRwMperuJXlMMvAOPnIRnvNQrHlL1Vjoe5xiObVNVZTV2QN'
-    b'j0/R6Q/T60+s7ywv0Bm4758Fs/wqW4NYHzKWlTdrUDhQAqiDIh5LNszDg22uLNdNmFDR7ePk'
-    b'9fdbG+QwuZNd2NTIr7fSC/xUxKuA6sKRV2X5QjH83jxjLKkqiiEQkVURhWaZ41dxYkdVbfD0'
-    b'7gu8//nf4+aX/4gPv/ivuPv1v2KzmreQOMHQZtinEyVyYVvrDlbHCgs9TkP/wEBCEo1MiiIg'
-    b'U1RvrRG2DF0/1x0/02cxMqBjCkgPZRpe/QKeMQyoGKxMMsJxsfD52N79GlxuABA6Lz5FPjoN'
-    b'bEzZjfdlGbpXn3n1OGN7/w3q5SSIKoy1+M0Ds8ech0TdTSbrxUZgjQ7jCEdHAKDerLAdO9ew'
-    b'rNtDPjzez00GWBKTG+nLOj33WScPTRhOIwQL99mQ25KbSFKbTwqijM81jnz9pSXuxk9W5N0B'
-    b'8l4fag5CW9nFx5lfLYPTq2ZsrVzOwVXt/BuMtU/B5sRs5SqwojSITLS/3aw4HowhALPnB5Qe'
-    b'PhwcngRwY9yVmUuYheSOCSfnL1B497755Nl3lhL9CmD/hO6Sgs2VDN47mgHfOTKGBaD/oXdv'
-    b'v/WHd+HDhxyyRgbAwzJO279+lheNt0G9XTXUoOlWJxzaQ2mylR9BpDfXfZCtVWByXWGz2M21'
-    b'X6ahusAdcBcglXWKJo1x/nSPladnrFTB6Ctka3aitSgmZkzrFDY+VlBRhkMW1XaL+fOdR6cO'
-    b'cfrye02gEHO8OvKig4OzF6Asd1kEd28N0Ys4XaKJPoqpkkTHryLK0e4pUYEcrqvQg0SF0sRT'
-    b'Apv5FA9f/3dMbr7CcnKP2cN7PHzzU8we37cCbYPOiZYcs9Dj26FZ0WRK0J0TQ8QP788OsNML'
-    b'7eyHeJxfxgWzKrqi4RvGZwbUz9+PYbjYMDb2jiAT/2CKldCmiKrh9ElR8E1V6dd5vZqhfHrr'
-    b'Pla3j871Z0BGLlGLMhf8QhmIge7V58j6bkGW03tsH9/60ZHKpffBcg8QBj9KYKINZ2gvDSCq'
-    b'XwHm7K5ouXhGOXNQYz48Qt4f6QZRJR+2O1739Lqx9y3nT23HT1JdSsp7OppU8AHb35lyRXuE'
-    b'KCxGCasK25lTvRfDQxT9UXQAs0CpzIff7ya7WX7mGqvZM+q6cgcKp2a+xUoWm1votLg7JFXk'
-    b'c5wz1jwpu/daTp5RbkLXPkKe5UkpVLghhumBO8He4GCETq/fHPxlWSZDO0KZpsQgQzIljnMN'
-    b'OFiVVR4XNlXg2tfv9ZH78KEsz9JjisGNy3aHY9FrQpm42vhNXTYLAcJkGNnERicU9xN7itW2'
-    b'ieJEx+Rn+DcrdfCHnbqJvzOQ5wWGfgpgOXnGejZNWVvEok65+7AEd2EkuhkhUpRuDkjAydvF'
-    b'DCs/geKMh4LralRJw6MzFF4rtRg/iAhaErRYrGCODyayix5TmWmD3hw4dUX3hfVL7F6pKrd4'
-    b'ev9LzB7eB8ZmjM1igud3v8TG66HMTCgTd4GRtpqmeOP7GBgwsZSLwhRlmN4HUeFLhvEPmrjg'
-    b'vWOlDp34vsXxf4pgPIEiRq81KJGiG04jp8kKh0TKFsmyyP9n+fwBtT8gs+EJOmdvWsibyB36'
-    b'/vuLkyvkR952cz1H+fQ+8my3IHgyx/kkl6LHmewPzDYhFBD7O4FXOQ0U/Yfn/hCnPVKB+F07'
-    b'p5foNMr+GertyiZRmDXHqUQHlKg/TaRU1MCs1CfVZoXSc2rd0Qny/gBqnIsp6WIaupV1Bk4Y'
-    b'CGasnu+9YJDToAg0kd463QlxmMEVsoDK1AQCgPn4CVW5BWU5hsenrhOMHPsMyJBkMEv8PTvb'
-    b'3vlkjLLcBCZzhhQxkPASp8TdbLCVwXAcSf9799+L+RwP965DHB4cIM9yXQyz9VxyJIDKim5j'
-    b'28vVRgdnBWK82O5VPk60H/gMJiS0WxzpG02Mqq5x//UXqLbO0GZ0dhmnArA8TDm65nmRu0Af'
-    b'OLOb1Xwc74i7+yJ7Bh2xHii198whiIkQVutcZoa0v+vs8bZBNgZHp81P1Vz7c4AiCqI7OkLX'
-    b'j9A6JCMxbseJxo5hiC/jIJ52tJnNKokEX697YIqxW2/swQBW0wc8fP1TVGI/5LrC5O4bTO/f'
-    b'Yv/mAUPExulqi80fDvyOOEZGAgQ1RMD0faQIHd9v9Su6qXBih+V2SZ9GB//hj/92BKIXYY59'
-    b'NFPaCJ84yb3tP+rtQBUjeMyJwvxC2d7+qj0gz14hG554UEyHClJWoHv9OZDl4HKLcnwLrisQ'
-    b'ZU7UoSq8ML9dVlbygnGaECDdbariQHSe5fTRd+mE7qnz6JeEArN4jwBvJsqQHzgFbrVeoN6s'
-    b'BF9IuvtVvC7ZshErQtj49KTcDN03V6s56tIpuTsHx8iKXsCnWckZlosre16yh7zjhFSL5zsH'
-    b'9QeHHyvwSc93UUhFiLlhFu+5A1fJcDhsOv7ZBFxXyIsCh6cXjWCoue57ym62fBIADA5G/uCd'
-    b'YrtaRxV/6B/AAl5nskatOJr9YUEVqU4ycLhcLOZ4fnKF9vHxMYoiN7oQjoR0oV96Y3RT9AIT'
-    b'n1ITSiSjhluqgBMOgWQtzAaWhU7eDIvUkPqqSjy9/Qp1VYKyzDvxsa09IjkFAmRFB8fXbua9'
-    b'3Kyxnk3FfedgkinAFkm68hnwlxGGJfMHQrOlODcjwoBRlxVmj7cO2SDC6Oy6WfGZb5gYbYIf'
-    b'A+j2D9AfHfuiZor19Km9vqxFpdFZwNZEzc45b49sQgTgJHEaJr2OA3vkuqowvv0Gq/mzf70M'
-    b'RbffaHDK9RKT269Q+cJaoQxsFCmymBbfw5RkRxWNSsEa3m0wMoiLDOVG/F52YiOZxaLpO/Pi'
-    b'6vt/NWo7fsb3BCUfjz8YAVowctGl2xmRnS/Napoaul8hoHz4BqhLICtQXHwPWW/oZpwNaIbA'
-    b'6F5/3vD85fi2cY9Tv+7uoWXaW/hZQQztVpUIU2HD9U7Mg26nvnvNMnTPXiMrusqLOYaEqDk0'
-    b'uK5BDN/xE+rNCmUw0peIoDcEmQyoEBRL57Db61nBYlBdNmM7e258FDqjE2RF0VAtmiSGhu0D'
-    b'djMruj7gB1iPH1CVa9skieMoy7QKVj5rHI1KcmBqRAludTl9dqr3ooOj8xdi1JI15M+JNMHg'
-    b'IRnuxqgWcywXMwVD2EoMPW0T4kqRfohi4R8xmcLcxXyO6dQ9S8cnpy5wJ4ByGxg+5Ka5vWJN'
-    b'15flyPLAvY9t4p0JZhZG6FSm/B/YEAVbO18w/hQa3NR1hfG7r1FXFfKii1HE8euXk0Vglndw'
-    b'9voTEGWoqxKL8WMgmm2RRDUVIukXg35imZyZyKRnipMorSOgrkssnu7Ade2e1avX0dRSvG7d'
-    b'q+VFpzn4t+uls+4lMg+kaCXtoH8yciVkwyVFj800CifpYSJpyxjW6+7+bpZTTG5+jdrTnsOT'
-    b'F3jzo7/E6avPQVkOgDG9f4vF042BQJOypWcIzYKxxmWGiZzEgjVjFUxAsWxE7cGC3xxapxgJ'
-    b'ZKPBYcb3moOfCR/r+VpbzcAwoPngJrClyNxdBkrjx+GsLADUqzmqiVOkZr2BU+0jNFvQEHbn'
-    b'9CWygVMil+NbVNN7NWuavHQkEr9k5Woe7HrgnlTLzJA29+XsyXv0d1AcnmpL4RhdbGc3g829'
-    b'ODx396vcYPP03hUSLI9yqPgHzXhyggmV++gel63ga+vn24ZfK3pDEBUwzR0acZ0QMQW7W9Eb'
-    b'oOuFVOv52CM4ZFTY2vTS0hHoN4ntZkPem8kCmAlLP3JXdLs4Or9yqWYSxg6fGZLdpPBCIMbo'
-    b'2MGwm9USy9kU2q87PpSaA5ZIzCbvNkrbxIDVphT/Zov5AsuFK5bPz89R+G4phHJ33CvHT6e6'
-    b'rI2JT8C1Wvkj1gCxJpUoMWaXpouE7297T+uySdbr9PoYnpynfjgqj5vfJ8twcHrRjGDOn+60'
-    b'TYviW0Wr4+8dJc0FSZ6TMbgf6UVI7C8+XrksG4fJvOMV+9ZgQfCFrNNtKIG62rbKfjW8KYpZ'
-    b'02VPA1BWFbMbTyUB78OgX2iPQHI1fcRyd17kBU5ff47LT/4IF5/+CF3v7FquF5g+vN3DaLIS'
-    b'/oXiaGIpRSVDbBAjq2wx+EyK/rJUACFSSFEGBGlzVc1OQm6V/lZ+HHb8H4VhBLZtptHwkXV4'
-    b'JszFId0L2ajvWl6imt6hWrgHNxudu0CemJCPN3gi5KNTFMduJrdejlGNbyO3JxZuNkx2eI10'
-    b'TyaVkSyKF8PoQSbEhZ/YCfsYWaeLvDfUokFhN+2o+NhXv3N0BsoLcF1j8/gB9baESjmUsYpy'
-    b'XpYEEsBIzGgSRAJm9Cbh5rR+uvG8VoZ8cNBEqYZdF0PPqFpK37zTRdePOm6Xc9U9posVSpTO'
-    b'nMJ2Gk4gVOYSCDIBpXHt6/ZxcHxidvKshQZxj8TxIj88cSLB7WaN2fipXeCkFw8HHaxMvCUY'
-    b'E5dBV2U7pbZCx/V6hZW3Rr64fIFur2vE/sbcoQoE8b9cA/UzB4d/vFNZqBrbfb4YwdBonQw3'
-    b'goKn3Z+qrDF/clMn3YMRhqdnNhqh9gJvCQs4zw1/8EsTH4ZFV8Rjd2R1eAjjhu1HmZVGhYxO'
-    b'0D271XaDtR+DzosOBodnppog/EqWZRievkCWF+CaMb1/H4vIwoOIY1PieA2QFtbKQ6PRZ1Cw'
-    b'DXHURJrSAo73X/JWvPOnG2z9mO3w+BKnr34HIMbB0SWOrz9tRMKT269RNvHtrFaPwdwitIUi'
-    b's1wQhReLqXbeY/UiEy8FG8YeSU9axZMW4DCpYzLcBT9qD37CGzaDTtjKz0lw9x6S5n3iB8AM'
-    b'eTPec/vwLeqV22SLk+tGsS8rLRZlYefyE8/zb/zIHEdQVMTpclzJabyPrZpAmZZYwTc6592L'
-    b'35bTVtHfOwB1+s0IGosKnrXCp+GUu8dXrmgAYzu5A29XbYCErLRDiDDkedko6qwYvbBiI538'
-    b'Vgd+3uvxnZvhzwsU/VEcr+oRIaIU0xePaWV5gb43FSlXS9RlmWBX2te3Fq3FzxlbaXAohm5j'
-    b'8WvuXPs6vb4fLSS9cZCMUgEMyVnz5/j8EpRlqMoSq+UcXNfRNGz0XKRy0E0+Mn58mmIyyiho'
-    b'NSDz2QxbH1xzfXXtVfqs7U2JjfAv8egEJj5cu6I0Q6YNo/Yoqi2numZkk1i72UhdAwWK+obj'
-    b'32LpQ5b6oyMMTy4gsGcDpufWO4TdvS+89e307oO5RzCn0FlqqDf1hFCq/NFdMEIqgMTeTA6q'
-    b'X+3Qqd4A3eEBzPmCcPSVcqfs77XKfstj30wwNMJnQp8A665GUcXi2d5nTARRdG7XS8wfPzhE'
-    b'MMtwfP0pBofO5Czv9nHy8jMUPUcZrmbPWI7vky8qfRdYfXBZ5bMM3NTed4TWtTCMbU6Q/CpY'
-    b'iwWFScH+LQtwDi2gWZ/kjDftwQ96jeQhEEN5NlOM77Dzo6hoj6QNZKcSVU/vgHLr+P2z18FG'
-    b'kjjVdsrUF584np8Z1fSucbVT1qUBMceCvqHvoARY7rhIwSD6kNvOn1Et3ILMD46RdXuGCMEC'
-    b'P+M53+7xZTvSt5g6botTfTCZl42TXH0sIop0AiwTqADUfjOuK2ynLtI16/ZQDEY+LCM0giLT'
-    b'Y5Qkduer3IHfmKtyg9prB4hT90ZkoBMF1IBtOqWENCHnaGw+TcffG3haioOo0tj3mwTMRTaS'
-    b'h8OT89a2dz5rRYBkQIVkBwGwBV1K/wUyDpgArZrOZo23+eXVlcFxtwd+fLDJQXkgyzoN1M87'
-    b'9z7F92riNqy3LF03M7WHAomCKIQ9KGbLd+9Zl1us/T0cHJ2g6814otE7ayAAvugmRtHtNhTU'
-    b'9P4G6/nMPdbeg2EH41Owryiak9j2rg9QOj3rH1OtBO2j4hIRgfnDDdbzSfM5dxQqG0BX+Kc3'
-    b'OvKe/Q5la5qiSL9ljOWRcX5Ljwn15JISv0XFPGsQvFXLh7P7Eyy8L0rRG+L4+pPoQO0fnmHo'
-    b'G4i63GB2/21bCzKbceYc6ms45dzKplHkbryZLbNQaos+EgY5xPq6SEQlEg0GP0epqGcS15Dw'
-    b'OoT6X5G0KUxUWtbIdMtrxcI0kqkFuwvCMAxw4sqgnNy629/pozh9FV15kiBj8BwWpy+R+dnx'
-    b'8vkGtX/4Lc6eTWW6WISGqlbF57K6uIgsGqll2uvFBPXGQVKd4xfIeyPr5oSMXlTp7f4Uo2Pv'
-    b'7++U/Vytm42Uww0aYt7TFjbsr9lkcSZ5Aa598Vtj4w/+vHeAzvBYQ987HQilydlw+fePL1wR'
-    b'UJUoV4vk1KEEHlnRjWxCxkgmIuqR4XK7be16B0MfT6s39d3ceijaNryvmq+dvniJLM/BdY3l'
-    b'bCaXd7sRkECnWE9sqvUX2uBw8DNhxrr/gcnkuTm4zs7P2x/dTaoQKYvjqGsJRm13c/xgRu3t'
-    b'ltlo2UgiAErhrAnMiOijVhGOBNcZVrLr+RylTx8cHp9FCpF2T7N0SqH2pI+Bj1Nejh+w8Pa/'
-    b'SIGdVgqZMq4wlLnMAfJI4nliIeRshQx1WWH+fO986olwcHalN/FwFjx4oIpOH52B21e26yU2'
-    b'y7nR07CqIIjjjsHUdFlgYgJuJOagYAj3Gu0hs56PG1ve4fElRmcvo+ak0xtidPaygfvnTx+c'
-    b'jbFMOIQy4tOgLesjWJX2JDxwSE9fsPWofmfvLD1SgwAfNqorqVFzn/NV0PHzS6bUjAAn2FPL'
-    b'qlAs08ZFLdyNWJfB4irUkwdUk7umKy4OXyRLVZnP3jm6RD70M+7TB1SzB1jRHcTamCd0a+No'
-    b'fyPlKR3CQaq7EGELYY1QLiZu3I2yZpQvCnEh+T6soll2N3HX8debZRODG/Kwuw0i7TJoxe2K'
-    b'mEkOS53Eqth9/nKLym8UxWCE4vDYqW4zy/aIkwEk4RTJ8PTSLdi6xno6RqP4pvRGGy0riiOh'
-    b'iVnbiiYUAyTg2cn9B6wX0wYm3gn7eI8vVwRucGyms/upsxfXjXvfKtxoOdiciYR4MxgYZwje'
-    b'mKKumchOdQtNusCMsR/lIyKMRqNod7azGVhpUxruNivaorVa6UvD3EKeYZdHiJ43q0iM6rNw'
-    b'nE81PaTEtsvJE8qNWyuD41M9Ty4EXNT8nl54TM6Rcmf8s5yOsZqOfUFVW2gvbHEixaE3ljOR'
-    b'2Lib1D82aIAwgKqusJo+uZFFynD84o3iWZljLnn3PnnRQdcf/NV2g0UIi3MCS5S0JAcOlhQf'
-    b'lqG+Q7oQmg2YgtjdaGRbb9aYPrxrPuvo/JX6XESEg/OXyLt9T9dNsFlOPe1I5l4mu1vSFakO'
-    b'GAuuAVFw5jQhX6QM66QZYkThmD4BjLp2iYf1roli3kVkiWdClCTu7V82Bz+BrkmKAATspO89'
-    b'RQcJg9QMO4nIQGZL2KMr++3Tt6h3cPjoHNnBoYG1sIJLdsVH4Y186vWiKSCk8YgwlwpsX2Na'
-    b'glnIz6LDgNQBYXvFt9ewnD97j/4cxei0DY7gFN1AyU6x8HBjvV2jXEwTZjsW6G99Hm4OEwoN'
-    b'aTyXKgeUWDMQ4Lpq7IOLwSHyot8+8AYVwrynxPW/Q3d07A5YrrF4vkVdbSWaa565DZ8W4G1O'
-    b'DU2mAr+VCJCpPNjZ9W59tzgYHTuPiGAza1Eue1qi3bA4ut/H55cNZ7yYThxkvONIlSmKjBGS'
-    b'h3zbDZJl7IJ2lJXEjdyZ92RZhv5gYLFM7cYWoAcsfCZ2EyvYwcve14GkcEmlWsaWvbBG4oCk'
-    b'yihSNhp+AHXNmD3cNJTR8ORMO0BSPILGsvBhoOh0cHhx1WhPdlx6ZEvNiUIlPEw48bhRes4h'
-    b'dCGPktqobUTqusZq5oR9WZ7j6MVrtcs2WQIUaxgozxtL4qrcYP50Y6AZpLaOcJKEZNpqInkp'
-    b'tl4g002vBUxDq982FGiznGL+6Nwm804Xhxevg52mfb/+4Rn6I9cQlpslVtMnGR6s9BPx2kk7'
-    b'L1qRLWxiSeIE08aw7bnJIt+FNUVJ6vqmqM8I1LwGgGz0f/wtMfhKnS/hw6X4eBICjDDqVQIa'
-    b'2qrVbTqUqjSwvf/axfASIT+6RNYZRB847gpCeMm9anFyBWSFE/g9vTeVImb0LUs5PcwZEpYM'
-    b'OUk4JhhRYo4qu2q+G+XbJde1ULk08NFSj/gXKQ5O/Ujf1o30canogmQRuKt2TWGizBHfi683'
-    b'f6m3GzdWCKAzOnZTBwaXHq/oPeodAJ3hyMHGzFg83gRji/tWlGIGY/4t3KB2UKqsvkV2KhMw'
-    b'e7rHdr0GEWHooV7lYhnC6AoY0ZPQNdcYjo7Q8VqPxWwCmTQgdG0KsYX5mKZ9F3Qqn4sxvbt1'
-    b'CvVOt4t+rw/b6cS4+Sw+PwFZ1vr1o95EhR5HgB9H8G1kBa3GGlnbUht7HadMlLjG5PZ9Mxa6'
-    b'g/qjzyC8cyn0off/UxRdH3EL1HWFzWwiRrhIZ1GRQFE5hn2kWZxGkhiGsArxxA55r/1N49iX'
-    b'7SyG2fCCF6NklGVuAuD4zKFsVYX5071CTXYTJ7ZVsRgWDXQ2ZHbS4qBn3aiwIWrc/btzT3QU'
-    b'VWcwwvDo3EQBi+4Qg+PLtqB5/mDD6BwXscSkzIvkAKqaSmChwCDVdYvPKCH7VvzHYbz97qcy'
-    b'NK6rTrthXV+ODN24XTtXV5/+FWUAXlja0SjxiqyO3455TR0MFLwwG04WIc9fPb8HuALyDvKT'
-    b'awWXk2mX3FauxdlrkA+xKcc34O02HucjHYvJLOgHAgyXalM4YV/vOLJ097eNnzSgooe8P1Tj'
-    b'OlDGHBQ7pgUPQXF4CsoKcF1i83TTqN5J4pVJSl8nbqWGZeMI1aBb9OgFPI3RHPyDQ1Bg+arG'
-    b'fsgOsROkOTqDwya9bvF4A96WQIrOEiKq1IhQeL0pULrLMc1mDVTOTXI5fXZ2vZRheHSKLM+F'
-    b'v3ucNJaWWcboCwHNwT+fjlHvDI/YGkYUCmOOYng0iMOJeFdx/ebzGe7u3ME/HA7R89GzHE5y'
-    b'UMyDKLsiCgr7vNPY9tbVNuoyW7hZc6Is1FSUMMkm5bAU3FPjwCQCqrL0B3/tDsSTM83thN7s'
-    b'1LrWhXtPVuQ4OPXaE2bX8QuXFE4mz4c5SSJAKkL8tfKV9wnp0FrEVmXZTJ/knS76fiRWbQkk'
-    b'xiaZQUUHo7Nr5J0umGs/G8/tvaFYQR6lubLtwskcEEPhfsehFkc4yHGi4qSYwFmO71Hu0jJH'
-    b'J416X6IsGREOTq6ckx8zFuP7pB8rR8l5MTXIKVRAXlxmE31laYsLEe5DNuVD4XViAjKKigyi'
-    b'zFkxM6uJMlLeFPwiA3CpPKoTkZ0w+H0WIrB9MfVqpEVRj86QpprujHuGKE5fIh1SKC1J3Qbd'
-    b'OXmJzPM51fQB1WoCi1DmfahIcDftDJgErh7MtbcPSOVh/jFKn1yX9YbtKF9zrkt1+O4A04ZF'
-    b'IEb36BJZx00wbKf34HId8/BkqPphLzyJK1FqxyK5KZGnKxjr5/vGta8Y+MhaloVZwFeThm4l'
-    b'tFV0+41t72ryiLrc6oKT2oKBm86a9M1tvBvY5hETSBnDKaWX0wnqqkSW5xidnLuuyHgGZEys'
-    b'6ogFbM4EdJugnjGagL5go2FKUa2UeNOUQikuIXZfWi2XjV3v4eERev2+JjMZ0UGo9gpuEySz'
-    b'vNMK/OrScZPMKZBexdBSwpucLPxCHUiaKGe4eOfp/QfnvNjt4uD0Qo22NQpphlGE7xqtDIMj'
-    b'T9MxN9G37u/+9zTMcmJLbYrSGtn/PUQNiHVAjOUvIJ/d7XKOjZ9c6A4O3B5B7aHJBnkeAkOD'
-    b'43M/0ocGOWBoLwdIPwhqCSgWD4gSRYPibAYJp8ckfVyQe7FcXVVYTO4ba/aDk6v0iQmgf3TW'
-    b'FAbb5bQpGFQHHhgwsUoRbz8fxdYVwuY+vkccYBckeFuyF4TwvfEYVdw1AAAgAElEQVQuhd5+'
-    b'fqdv4IgjDrsp1jHmLYN2mQG4kJRYarYSRudBkY6KhGBIwHtyFSgTIkY9e2z4/WxwjGx4Eo1G'
-    b'sMGHyeMqOzhpHPyqxQT1YhyIuijgsg3tSMSlGRsNt9kFVliFiYLWLcxfLRz3VhycIPPhLKQ8'
-    b'1xmm6kPwDcXhmUc2XFHB223bGXD8wKXOAhIVeISsKOtgiKhfjvRzm8md56czFIPDwMxJCqha'
-    b'JTALDpvFppt1Oq1t72yMqio1KBEq1TkM5lGqGcgYNNoLVsUJ7/PxY8ObHpycGlUj782GJTlX'
-    b'GqzVrufUl7Mp1o3Aj6Nm1H5t/cwRS+dBFoc3qfJuvlhgOnHr7vj4BIN+3xzfVQ50HHbF1MKF'
-    b'WQHyI30OBSKkLzo1G39cn5OxzFhZrRDvY7fan3Yxte4e9oYjL9BLkPEh4iDNgYjQHQyb9ML5'
-    b'84P76FkG4d8roHvxNkpQHc9vs7Anj4ekyCwsmYD1YorNctZ0wWTsmXrNe8t1YnT6Q3T8xNB2'
-    b'tYDWebFRNXOEOkQ60tB6L0DWQh//yIdDGwXEfgP+f+pyjdXUC1LzHAenVwYc3L5mb3jkjYwc'
-    b'z79ePEfuniLfBgrzVc9BsLeZVIrcZygo4slG8kCiWJKWxn5HrypwuXETM359ZRRrqaxUQV8T'
-    b'XGQAzluazRLMsR2BGczAR5Ixkh/fSjuhpNf99v4bsB93y4ZHyLpDxQVxsLiINfqZdXrIfXpd'
-    b'vZph+/A2iAuO5NJCf0AKl1GwPcUz6IT9kTOhBqJajFGtfOjQ0TmyznAHRMW/F1Gy3AqvaWd0'
-    b'irzrXqNaL5pwHFJcL2nTFd6zUXI8G87JOdb4a5vxnRcIFSiGI2h3ZVL8D5HUF1L0nGR50bj3'
-    b'beYTlP7ZkHsCpbr2yGZ0p+LVEylmwRYctszActY6oQ2PzpBlmUkDhV2MSjUUToiZ1xkceL/+'
-    b'5WKK+eTZdsZky4BF1IakJ13iOFQJDbvfcbteY+ZFamfn5+j3+3uEFBRTZrsDm+L72tr2VtHP'
-    b'Eku3EwmekuGp1ladLIoitqpz47Guqw2WvjvvjY5weH5lqu3jAzveAdk3N53+EPmOnnm6U8+c'
-    b'xaBFsVhkox/mzLtZTzJS5dN6PmlEqI1BUcQ1G1nOgb4h73TR8cX2djX3o3L64JXZAk1BQrFo'
-    b'LmrayLaTo3Df49Rajg/K9WKKtV+TRXeA/tGZ+J644C26fQy8BqAqt87Ix6SQSR2XrLApakZc'
-    b'WczLN89nUJGG6zPpQyJyRrROJAMzUG6XWM/vsZzeYjm7xWrxiGq7RM0cBdhRlMVAYdLjeQbg'
-    b'zDI1NQ8djkfb2m6PIw4kFkiJRo+j/1CCo/L5HbjauAfw4AzUHcQPHSOKWY31Le3rFcdXzsGv'
-    b'2qAc37Qq5OizStiA1dx+9B+7hRN8MKZkMJjEoV2AjXcxKw7Pm/ESS31p9YvSCCLvHTSz/PV6'
-    b'ibpcwRpNCvCxmGPV84nJEoaT0Ej7spvJA8A18k4PxdCPu7EKQIblF8EJ2UGWF+gduu66XC1Q'
-    b'bddG08vK45wlhNxAlKzQqqRdcfDBidD49OedLvrDUfDqwp+b4g0iAjOV0t7d0OHIFzerFSZP'
-    b'D7rroVC3oBsjgpF5wAH/anRBTVFLwHK1xML79J+dn2MwGLZOkJxOagwPZMkXUh769QdWtWn6'
-    b'trkZRLEqmg1eukHf9tA14Rer7RarmTfvOTzBwfmFSR6yJXYSp16nP2jG3pbjp8bfIfLRsBAX'
-    b'2I4pjJTgRWgoRKKfSgasa6znMzf9kmWNCDEc5+VwIwz24t3vlOcFej6ed7teYfp4Y3BI4cQJ'
-    b'tcZH4vkOp3p2TnNkaqf2+DYKk50GYZyPsVk5ZKN3sDMeCs2zSOQmEPqjM1CWg+sK8+fb+L4b'
-    b'CJfWJOv0HJE5ppuQVHx2AtSgUHsUqqOYwVxhvRhj9vQNJvdfYvbwJeZP32KzmrR+KtiNlnJA'
-    b'V7dNPQNnGQGnbGb3xm8bfyUgkEWOeTQWyEa3IdTSELxRNb510EXRQXH+xsFnYQoZ6SSBVtjV'
-    b'isk6Fx87cREzqtmTExhRoho0SFjpqxFV/WS4NpGWIjUDhrlLh6rmYw+DZsgHR40oDso9Sg1F'
-    b'xpTKDqIjRh6M9O1m6EPnNzOuNrmTJ4x1KPBop8AnnaihUBjAducN3uujMzxK0iipeEm1WHjH'
-    b'zZ36jXvtzFcs68zEnQ1RF2YzPy8ow+0hwSzPAQbW/uDv9Pqek49V6iyUwRKiZ0ndBF3r4S6o'
-    b'Z73CfDqODjkOzFzCZL0IldjNmkuUJq4O/G0TGyID69UKpbfrvbp+iSzPYM3Bx5eb7eaMd9et'
-    b'03KRvpjXugv7sI4yy8XBaQAPSNQScVNSldj4A9oJ+8jQ8FDCsyC+6EW3j74v1pbTZw+J20e2'
-    b'NRItdVPK2E+MBRqW7DIiyekY6hqr2XMjYBydXyk3QJLPgojozooO+iNneVtt11g836tyuoWV'
-    b'pBcLm41YcxPIMtcyUFOWbo4ciOnc/6/m40Y4Ojg6R96knAboAlE0+dUdjJD70dn1bOd1ALWW'
-    b'zSciLEalMDJMTzfsrCW9ZzaJ3K5vZUzrG7Xteo717AGbxTOq7QLlZoHN4gnrxSOqzRzMjMxn'
-    b'IOjOu/nracbASaOFJUoDy9FBYrGHFCvPjW3Y6vqi36sqUc8dZ5N1ByhOXlqkVGxjydACEDh/'
-    b'/x3/XS0nbjwQaU6XKaQ35LnYhl+YbWpU4IgqPoDXytmjV8EXyAeHxgG9eyBIjfOZmeNMKIZH'
-    b'AAh1tcV2ct/yQomzlaUK2BJ/Eac78rB+9Orl3T3YxQMXg6PGY0B2CdiX8scx5Ln7XftHTkhX'
-    b'lyXKXdQymZY7hg6FFFsXlo0cyXbi8CepjFgv3Xt3ewNknVwJm1RcsLEJpECFw5Pzxq9/MZui'
-    b'rlkfchx3GA1syyRoDzJ0HHJUlBBOlK1XK9ReVXh9/TI65MgsrSQo4mmU8NcOOv56u2oOMjID'
-    b'UmAI11hjOCzXHUvxtZwObj5ztS1dPj2AwfGZ1wPXkF4pLOY6yUDkOoNB4963nk2xWS7iY4Jl'
-    b'JDlZZII0BRSKENpLrbHhLVJVZVOgZkUHR5evBY9A8T5qRCtSnmNwcoYsz1GVW6wmjwDtxJny'
-    b'mWJ7CwGM6xC5vugCPkQoI2QqPsQI5MLJljN3/7IMQx/OBtQ2buD36O7wED3flGyWU7efcKDB'
-    b'Meh2024hzFYReyMFbb80xrMcYiNRd9OZ65+ryw1W01usZreoq9awra42WE3vsJzdtV+XEEOk'
-    b'pOSTDKDjcNMjoyAPFxKnXN+MQBuyjDSa1xEGBWBUs0fUHrqh3rAR6BlWynGHTVrwkg+Pm4O/'
-    b'XkxQLSZilIz0SJDVAexG8YgMt0jeFZURP6+bBQJzhXLqRmOyThf5LsCGNZRpZgcEo1C867qJ'
-    b'0Wnied3BX3lVvaUx0CgW6ZG3IHmrSZZimSdByt8BAOrN2msPjpEVPbEhCPZWzO2qro13Dz9h'
-    b'cOw/I9fYzKZGoA9s3j4wI1J6AEWZstT9RfKbxXTc2Jd2BwfNqJqqAVWBbQUHQVE8R2cXzq+/'
-    b'3GK5+4zSHVlN0ZDmRwKovPXFadECRJC5974HsFwum4P/6uoqspoO3QZJzN0jQQc5294W0eJq'
-    b'JYRTlBD5xf+WithVD411mooaM3TtG56cuqKH60hHQCJt0uxdyTncHZy6ufByvfIKcY5JfVGC'
-    b'smikWCzL2KgpFhayEPOxfOb9Oq7LTRPHW3T7Lo43AhUNj30Oo1+BLMsxODxFVnQAZvd6TPFh'
-    b'FJ4HxEF0LsVeC9HhEYerkYF0UoTu24JQJka5XTX8PmU5BkfnYCKXoMiGm96uIewNPJrhEwwX'
-    b'E1Odk9RWMJlIANiiAdCobNmIRrdti8PSKH6tcjPHanaPcrMAZTnyzhB5ZwDKclTbBdaLR5Tr'
-    b'RVugBaZ0MdtHxxnK1akJW7Mog6Od3x7vYyZt4MOEqKYJsSaK36Ia36LeuMo5Hxx7z31jKpeE'
-    b'uIfV0gB1+41nf7WaopzeReMRe7UMCubWCHXKipNElvNO6FHOpygDNCMfHKiKnQNeioUojkDm'
-    b'L18cnbsNlmts58/gcmtsEEG1LHMBtLBYiaWY5CAOq5FVrraNuLAz8psGJQHUViNihVz4/689'
-    b'T9U9Om3g6dX0qRkZJL0nxMUOW59P6KulX0JY9ASrZf58j42Hcwejw0BBK4JTWBE9AZIUMXaN'
-    b'RTMBOLm4RJ7nYGbMp+PIJGWnJCd132IzKxJLlyP4RPhn7LoR/7Xx+KlRDp9fXLSbmUL6A8xE'
-    b'bIhSHEVUtHejXMOMdw7GD4hZPHuU6IxjxbJlfiOxiYprjG/eujArAMOT8wZdi2hEMeIauVgG'
-    b'sHPe6eDw0kWFV1WJzXwuUJVkIG3c9VpfYVa2XTYJpV0967LEyh/83cFBM+9NOxW9tQ6p5cR3'
-    b'79o7OEbhNUjb5Rw+eUkVDaTcOLU9DYVUQoDQhv4sJOCxUC8W3SP/+tvVAiufclp0B+gOR02j'
-    b'EIptQp8ABiMveuj4c4G5wspniyBxXRAa6YhJDBYjtPZ4JUfFTyuFEe6xRFFQWZt/Q57K3WA1'
-    b'e8BmNQFRhv7BBQ4vPsXhxffRG54DIJTrKTbLR7CnP2T0eVDAHmX1YnyuOGzLJMrivFTIBkfQ'
-    b'DgnY2HIWYq5b97DJjVf0E/LjK1BvoCxwmwRnInV/wqWedXooPPzDmyWq2WMsLTDshW3sjYXC'
-    b'O5i5J6Nbj8QlLbpWLydtKt/wCFn/YI/lrDZ4MGfXQW6Wv9iN9E38TWdT+k3S+5uw3wJVoDlB'
-    b'DogyU91OntqD/+C47fZEx8RWQSXhHI7tfjqDkberApbP9+CqSnbxsmJjkdzCRhgIANs5MbDN'
-    b'WkyesPWIRn905DwKjMKRKRaIkCA0Q0V0aFx3dH7ZvOZ6uWigfk6xXEHKV+RotzM4CfU2rPnj'
-    b'nUh19/LPT8++28swOjxqEzctIpYoIWATNVVWtMFR5bopfFTKG8mZZk5w5QFWJUXDqmmL6cW6'
-    b'KjG+eY/aR7cOj88TGevicRSz9LwTqGU5RhdXPkCqaixyxfKE7eCYajpiq2JJiLDwP7F+4+1q'
-    b'0aTydYcjwffsmUjiGOXqDg7Q6Q2aQxYCAVPmNaSBGRbP7M5SujELCmsXEpRIOEsvpbtM2K4X'
-    b'TTBP7+C4OcwjG64QvQk+bKd/4ITHdY3l5F59plCWsTMWIms8muKGU9k/K5qbgrOKVEYNs24f'
-    b'm0Jns8B67g71vNNH7/ASw+OXGB5do3dwjrwzQF1tsVk+oypX9sbajtYfZvXs4cwYQIFSgagA'
-    b'KQ3AW2ygjnZtj28WaVvV5A6oAmGfN8SIq3I2qkrjzGSgc/7GKfvLLarZY6N25LrWfH0wpKGZ'
-    b'4bjVZ7J2HP2xG7MMJpTLWZPKV4zOkPcOUvV7tGkbMrTwZELn8NwF/cCNLvIudSoSJsqDwx+C'
-    b'gRozMT3WFmihUyPHPT8TsB7fgb1zoFP058ISVOsJzNlmgy/s9IZNrOhq/ID/n7E325IcSZbE'
-    b'RA2Lw7dYM7O67x1+IvlV80V8IQ+XmTOXd7qrKpeI8N2xKR/MYDBTVUR1ntNduUR4uAMwM1UR'
-    b'UZGh740Wj0waWEHJbO7OcunntRcBl+MH+nDwT6592WuypQUzJtDJOMEZeHh6iXPhl9NR7ASp'
-    b'oktyxzllRomqPDqtkRZZpbxi1/f48f1PMDOqqppH+Vi5IOeTMWxMaibSYXJFLNgmcd/sABcQ'
-    b'CMrJKBYNRt71ad98BfmLfx/HGco///oOHgYUVY3N0zPADOecITQh5AwzZf9GIBRFif3r32Li'
-    b'2/XjbX6KFvzV53EtXo6o5fygX0YJjPAO5ELDZvc4Z7azWNdS+zUVaOHrirJGGfaV9naOAURz'
-    b'06DdKU1rgmx8LVGXyzlzTgKnYFE3+WkxtjcMIZhs8/gluntS4ZZRxvAK9eYRRWiWrsdfGPp2'
-    b'GVVVgzUL7mFyXFP1uIYI0u7zxHoijEOP++kH2tsHiAo0u29oti9wrgIVFVbbFzS7ryBXoLuf'
-    b'0F0/5rwPGAUIY+f49POJl+x3pcSRyQwtXUxDSzZXLYHQOO94+QgceOPH8aCrtfTCmdY0aVLf'
-    b'y78HLpYxBDvZyfmISU8bTEY6rIqBpbl6WtozMqEGAAyXj9iplrsnUFCWsqFC4bQqTOfaRVUO'
-    b'JpQPr7GIGG5ncN9mlautcCfI6NcUCcn4aEM9rcSIAO7vf/hRRXIomq2366UFVMh4HcMeJP6b'
-    b'q+vEve9nWKjQByBxMnIKPRcrAGAybiFlzomc8MPvGPved4tJvvmUFmbBF/wvUkkAsGq2KEIx'
-    b'cT0fjQRU7WBFNPeGTGJX/+yXeE0exxjQU9crrOqV2HxFYgqL5DFIiDw8WUUV/fp5aJPvsfvs'
-    b'DKFg2xrWbKvZONCETmkcRpzffvjiZtVg/fgci6IcYtfOlCx6Tg5rc/P8Cuecp2fef8zPOLGh'
-    b'9UlpntQHwdKoGMLOJaxAwBb300eM490EbUw+hEVmRHTc6SaevyjiuGJ3u+Dy8Qvp2N+ypbtu'
-    b'DZls1RGRTa+zOmtS+si/x669xf18/fhFrW+p1kqHKFfrXWJQdIoxzdbGREL7RdZazLSnlHjC'
-    b'pDgyZ9oaIuGyp7rzeYFN3P7YtyhXWzT7LyhXu7j+62aPZvcFZbXB2N/R3j68yI85f7/z+9y6'
-    b'8fRzz30bVZqWEQoJH820/2SGkC3orZwMGGS2xg4dQXfDGFThtNqAQrRuOrcuS8nP4lBBQPn4'
-    b'bRb43U7RGIjgQt6zBe2ycU8tH+KEIOG/2OCJ0V8+fNVMPlzHlXU+85ke9On1YlbjWGmh5Ypy'
-    b'nuXvbhi6e/KaYn5erPiUQhDDPsbmQEbRM0eWtu/fg8K2QBFsMZlZddJy3h4G1UAT7xv4yape'
-    b'x4zw++kD/e28MCYoro/xMJPYwLODdHFvZVwO7xjHAc457F++wBWllS+lrKgVxMAL6K4Dyimo'
-    b'53iIAp1Fk8hsBiHtlAQsxVrln3HgQdn+8e471mbdYNU09kQO6fqQScOh80NVzCOrYwfLdS8t'
-    b'ZaNegVI6iRMuma2QTMVCkmFOwTyGwwuo1pvA8QsEgcR8suHRkL5qs3+Eq7wA7vzrh70DJMU3'
-    b'qWz3tKZPHTeT1E91OOe5F5mL6Djifj56W2lXzM6ELDRHotmx4FMqCtTrXRCV3XB5+76sMmAR'
-    b'KyXoIcISGrZsIsJC9JfuleMw4nr45Wli56JKX32/4AAn867UmXDsO3RBUI5P6iskNIUKGLe8'
-    b'KNief+GIluZiRyFYy/76dv6F7n4KFMwDqmaX5ZwwA9Vqj3rtz8zufkTfnhPDMIWBbtx4/LHh'
-    b'9qzhGl6uNImMMBmyVeNT5Zbz66Q8/ofDD4yXwDOuH+JhNkXC5kU+5RahyQaSfrxi8wQXXmc4'
-    b'/cIQbzAlFwXLlTYmwSKZnTkU50aL3Ux/evNZAq7wqXpyRMmEkliPiRlqnyIs0KG9Ywz+07ks'
-    b'nBYaThHdysFuk7XXttZb5e/9fvgB8AhXVijD+4mdKIvaN3TIbA8bCGKaUK7WWO28s117OaK/'
-    b'XuzoFnNsjo0RQdZisuS9zs/1fB8vhyDMLEpsn15T657Fvp6tQkAWHmEzKYpq9us/fqDv2hgY'
-    b'w2aBmRioUP68zp1FjtNTJqicD9VxHKNP/3a3R1mVMNvC9GqS5v9YGGBRUQJBt8Bjn2copOEh'
-    b'rFsESbHxAtuPRZ1InrTB7A9FwNv1bp5eAh3hIO0sObcJzachknS6sqyiAG7u+BcsJsQ4ZpqM'
-    b'OUf6SNyL7a435ZuT5LhhHHC/HH0WQVlh+/zNaJqM4AhmJYh1ReVNfIgw9h0uHz8EMcEKESej'
-    b'q0+1VHotGOWU1KVgjpCejv+uvUZu3pUV6s1e2yMZA/mTENGVq/ngH0fcA9JsvaW0dWEWJnUG'
-    b'x8fZBiIzbQi24GN5DIHHEffTTwzdDUW5wmrzjKLa5CFyBBTVCqvNC4qywdBe0N0OISMjuS4z'
-    b'grt2fPq54svBojRMjpuMzjgLylm6cLwQUhLe1PD+O8abX5hu+wyqmkXBGXF+IDKMbp0Bqppo'
-    b'3Tuc3zGe3vLH0x4nVjAO/wXatrwlzVX8cH4PcbwliuD6Rp/gBHk9Y6AbySoq1n5mnvsW/fWY'
-    b'zf8qSkO8OxX4QqSq7Sm4ZEkI6MV9wce+XnsxnnioWeKSCwm/pCYBGEWzxmofsrSvlwj1q+fD'
-    b'GqWU3hRiJ6SFUCm5YU6ufa4osX14QeEEl7gYtUCaxsmBY4C8z/Zmt48c/+X4Ydek2mQyi+yV'
-    b'Pg4KeyNNqXRDj1NwtNvv9zGSl2RARmqUyTr/Vgo+HRXRrx/jEDdKbeWcHECqWyLjYBDjSX9t'
-    b'fIlxGNCeJ5e3PZrdo3aQZtJFtjZpjwUrFSVWG3+AXN5+YOg62PM+bMYKWhG0OZ9GYj18ltzG'
-    b'seMHvLvk9vmbqt/yETTK1wjPI8uucFjtHuFcgXEccD38MunI9LawcdjnsBrlYDxrzpsyT62c'
-    b'+5n2g/5+we30HvU/9XpnZrgAdrL0jBL4Mevr6ddMfJrnP2UhRPKukcn3MxYk4+oZZcmSJ6/X'
-    b'tWd/iINRrnaomkdNnE+BZqsdytUOzCO69oRhaJOx92wXaBzfjiVf3qL1rtnFpDyzyD/Np/PE'
-    b'mI1Q38qFlNqBDh9/gPsOoALF7jXLcme2qkYxT0naHIIIKB+++r/tbhiuBw17kIasSF3VhR6D'
-    b'WOUrs0QFiDEOLfqQGU3VKorxFpgvs4dMN3NZaJSbx6Au7tCf3z2loCJZyThvhXjIsFJWYMOC'
-    b'rehs3rONyYhzoZgvBBIKd6l5yfcCym1721s0YdGPFS/SoEjc72CAIdblT0VaqU//7ulZoEWc'
-    b'Q7RIRXcs76I+yIKb4zoc/PfrBcf3tzxoiVgKv5Pug4QinhfWHJtY6tgPOJ38ofjw+IjVqslE'
-    b'gREhyNswSAEiI8e0mWgO6uEBQ9/rIkloOjIfB6UbYm1dzPzp8xm/bBijyc764RlFWQql9gwP'
-    b'K5Mn5aIWCu6yRBMK0tvpIwbj6OE7yiB5NjRKLP3zF+EMZIYz6S44DH1U9HsB4xf/VVHolZTf'
-    b'nFdyczTsdM8dmv1TnOW/nw/C+tmOi5wpYwPqJmED9qnbMs9Kf4Fadvdrpugv6rX6GSQA4Qz5'
-    b'J6DePMCV3tn1dvgV/U9Gaw8UBXbezPwLyCNLlQEUGieRkGk/664f6LtbgPkfUa12i49FUTWo'
-    b'Gk979Pczhu6qyp7wyVaO72caD3+C+9bMqWW5G0OtzMWNlDHnB9MnVZS3s/3lofCyzoV90KYH'
-    b'bPLOEvP0X1I+/T149vfeMjfjW6x9kBUNITPk001bqe+1lTPG28V3/ACK1Q6uWgMLV8RcTEkl'
-    b'Ph8E89eW28foP90df/kCSu6kihhd0khA+0UKiJelEoKBPmx65eYhcvwK+YA2XoMRAJQ5QYbj'
-    b'cv38LXRuHfrbJT1rF3cPtchSzYO0WNZ5MdkM99RJVasV6jR5cLpeKpUtEd0lm2He6yc9OhG2'
-    b'4RBpb1dcTgfdr5DxjMiMCVrqL0SnmYwTDkOPWzgUX15ePdSfrLGJbki1JprRYqNiIlCw7fXW'
-    b'eb2AloHZzx0GEqA5ZH2GEBb2UFFQjuhibvuDaA45K3w5eVqZ9dhbtCQuK2yeXwMFdcb9fIIc'
-    b'mVusoIn0+CJbdGJK47BoMnJcYeja6NpXVDVcUczPnAjbIMtpL8bqBhHc5gFl0Ejdz4eF/UnY'
-    b'EbPOppi7aW0hS2S5LkgHv/z+9vdb9GNYbR8TTw2dgsDGuC6x9/Yvq+BT0F6i4x2ZAI0ccaGF'
-    b'iQ1SkEMqG+Gs2EnXdJKjIJ71++UjplvW6zBGTDZGTK5E1ew93N/f0N3PvuiTgg5G7TD2NB6/'
-    b'Y+xuYZFzdulIWEey6FZyGDGHr8kacUjno5PrNJw8VEz1Gu7x65JZknnMM1izDOEP5dPfQGXl'
-    b'bUPPb8siDuE9Ld0KIzphII85rKvV3MPliOHuK9Ri+wi32maFkjL7JRbGKSwsHDkrxqr9C6hc'
-    b'eaOg02xwA9bPqLJCZVF0MEwaQqdVzDKtcejiqGK1fQpjXEncsNjgyIAJ5YZHjMz4o3l8jZxX'
-    b'd78JoxctJtIxEayEODL0mhdG/fqui3a91WrtR8CkCIc554IVUsNzy0E5CkPwY2X7Zx8Z2rb3'
-    b'2a9fdAe2pwYlZlELSUqQavf5a9quw/3mRxVfX79oTpn0WvEymwR2IEGdTYhgdDhkDP0tSTSD'
-    b'srmWvhJsdsCc5xfR56S/C+NdY99F9fb68cko5OeCOlvPRMbYIgc4vMA2pN9191soLLROyE5/'
-    b'ZJXRzmQUCqkIkEQOhFg3/f0aO36vPUjgZiNzJHV0mw6dyRMeIJTNGmXQnXS3i9HQ5mIwghHv'
-    b'zlC6hQwfZTI5/6lIUCAeE+7nj+jH0OxfskhcFaebjXrOP7te71Gvp5yTNowGMshpD5V0lFR3'
-    b'e6x1Xmb3L3w90qkq1hUtE9D3N7TXj/C+ClTN3phUSIPyGGW9Q1lvwWOPoT1jHDsYRk+VQ1GB'
-    b'Tz+B2ynhhcW4hurMyPSY1xnKsF1iKIVHgeH8gTF0xG61gVvtDNsDNqH99LHLPO2nedSHL3Ch'
-    b'suvPb6FStKQlbBdwJA7CcKJwupEvdCNxlO9+jl149fAFrlrpzTxVX1oVpTL1mSu4+vEbikAf'
-    b'DNfT3FmRnQRmkzp592m3zqmgbP7+7vQRiw1v11vHM/XTwDRa0klQGLOa/6XZPkZRZ387R491'
-    b'0bPlz8SnKjDJrtJig9a11wgTrzZbUFmYL8SGZ5z0O8j1QPMid67Aw9MLiAh91wa//jHa6M6b'
-    b'GOegG+UFNxEvb9CCL5vg5/v1iq6fA3rmw37m5ImxIEBKvPZZ0oHIOv6xvS5aoLJxUFDGZ7Au'
-    b'rNk6Z3OMd1qLp1/fow/DJBSFYVdPRivHC8SsK0o8fPs3gAhD14YAIMosya0GXl47nqyTleRe'
-    b'oqfaAyMtoq/H99lWOpr3cEaJWAWD3Iym9e1d7kI87/06B8/4yaoAACAASURBVBGReCA+zfZY'
-    b'gM3JPECU9TUprUaP++k9Zp40uydIuYBqUI3fF1UTpxaGvp2jh1kz+KwkRPZrsoVYYLn4k5TH'
-    b'nHrr/9vfL+hDw1hWDYpU96Z0Q37fLssVyjDe3XcXjP09P7/8b0pHzQ7j9QBuT5G/IpZ+Q/kh'
-    b'y8wG/M8W0pFjgtadIe/YN4ZxBbd+QLHaIR8cZFgSunwfs/x4/egcBeh5zgJgDXUTxYVFCcRo'
-    b'HwwLqSuU2qLOZpbD5RD0C+QNd5p1lvCXjVIu2HuxFXAYLnm1f4lTEMPthCFaNrIpycsgVoIJ'
-    b'sqU/iJJNmo1iqz3+wBgO/nK992pu1QKwLdDi5aogVTrXu1nUcj/5it/SYJFUCImNm0wKQ28b'
-    b'lIiL2usFXUA0VptdHEHNbg7LviWBN0mCCPlFnyr2x5evIOcwDgOup6PaLayEWGbtq8tEuTOY'
-    b'OkjCBh8sQa+3K8ZhABHhb3//GzSIa73f6cjKjV8yG17mOMfv9RkXvVbDHH3aCyhLJZLvhpYF'
-    b'tUzK7HYYRrz/4z+C+A5Y7x8BQyskdxzleBmV2xT1Hk9//1+8AG7o0V6OyAjmT9Ins8RN5JkS'
-    b'mWsfCYI589VIPuk44HZ8D5kBXsew9MN5EbHMO3VXlNG9b2jvuEz2tio+blHZOufVJyx3mlcv'
-    b'x3zJODpTEKtvb9Gq1xUFVpudGpfMEWnbKMe5MoqQeRxyz36y6DREtIpktHT82CT6XxLNwNKB'
-    b'Lxtq/0rd9RApCA/hr7KbFr1wKKGlXImqeYQragzdFUPQB4h4jcJRswdfjxiPP4C/gndhuzUZ'
-    b'6gc1vEoKnpy/ZXj7B7j1VIPbPgFhnnl+CK0O1IY05c9xdeOh9QlZuHwkiytXchGJERqybxsZ'
-    b'CWia+5nH/YZLENyRQ/X0Wzw4KKNL2DS/WCKv03Ef12xRTLkE7W3m+LPTwuhktAes5r35U7UR'
-    b'CIT725/AOAIgFKv1DJcxZ12N2UlZc+qKwCeUTePFOACub98xdq1epyTdw3I5HX3mbWPwhNOv'
-    b'88cv9HffLa53D4YdFX3yunnCAUvANTnNH7/Oz8YlcLWmMC+pb0lG/tI8NJfnMkhefS5+D+/v'
-    b'GMcRRIRv3/6e1DKUR7+Sng5lRevNn5nIAdMcf3BbI9Lzy9J7SI19pZAD5T4NpKlOWRqBxx6H'
-    b'P/6Bse/8YbHbm/ohSDpKWammBalXh+9ef5vtX4NHfu5LuiTXldwzpdYLYMPLX4r70h1sGEdc'
-    b'D28Y+g7kCmyeZsqGnMsopjwAjBe7Y1cVATlASOl7S/oBtrsS4wghA2Wkv8Dh1BMSfl53v8QC'
-    b'q6xWKFPr82wqjqNZTqZLSapXr9VxGMcB94A4SwwxM+fieZ8miQZT7qmRFQM8PxPKgEIu69H/'
-    b'xcgj2mvK7z/BfNSZFZVR1T68Z+jv6LtLEHtnseTO0eYZ6O8YP/4Eh8hTNi9AyoPm5UPG2iiD'
-    b'Es5vuSHK69/+6WcOXYFiP5mj0DwpoDgX1jAK27Aaw3vjA8B4P4eEvHBDpRpVqRMNg4UFKAfQ'
-    b'4zbTBhxn+IsyFiFZNcrQG6xAEqQ3+dRJMo/eQjQc/GN79ULNTM9hAf5kV6C0VPKRCYMzgPbj'
-    b'ezQnclWTmAJRvtjkjVkUMhOk7U+x2qAMyM31/Ufs3vJ9h1WsISuVPtn3TPw3/drzxy/0IdZ5'
-    b'vX9KbEE54ddy2A2i9qE0+jfLCJ9piqeXL9FC9no+gQfWXbcoZNjuuQxUigToMm/5f/z+T5/j'
-    b'7Ry+fPmioWjO08qY5TgiYGfjwnf8oZgZ2quoI/WML1miaoHm5evdeGApn+PmccTx55/egKko'
-    b'0Uwdv2Wey0JKTARNvVMUTa22+2hSdPr5fX4KFhw8s8M3s/JYCO3hhXpGriUecTt5q1bnHHav'
-    b'3wxhAeUFB3/WxjEclahj7HeP6/EtWUs2N89LNKGkdkhO/pNOHTS0AP39gi6cU9V6FwR6rPRC'
-    b'ckpbrzeganZeLMccD34WdFE67aaf23zDJOF+aGo6DBt8Ntb0ONwDv+9FpFWzhwYMaY5FT0a+'
-    b'XYT7GX17mqN6Z/0eObcPoqnTT3B7FhzQ7FxPlocyJ4E1IO2GZzTrkOlwBIxTTn1Zo4i5yrNH'
-    b'vFJLW6O9gOYywnsu9l8AcuC+xXD6abWGyMLJBX3wWeInGZIGWTf0xzfvC17WcBOaIRTm/EkV'
-    b'SBYELw7IInBxY3vDEEZd5m6F9R469XNkaxMog+p0TnX6ntqP7968pyhRrtbRzjYZ4DPJfTLH'
-    b'kllcx0BKrRqUa/8Zb8d3jENnbFkkeFvtrsjKGWsWtljFB+DteoeuAzmH7eOL92dPLwTJdpUj'
-    b'UkIkFjdrsdjUte9CBvp08PuCz2XFAaWWzswLvJc47+3h5LhW//nP/+lNX4oCT68v4hFLIFmx'
-    b'dqU7nQweIQomPuHgH7vbQtgU5okFsgpsUs1GugmTyBUhUVTyOHqf/nFEUdfYPr1mh54eOTOU'
-    b'72TrAKqmQVlV4eD/cyb4ONcccPacGSl5E7GVfq7E2o8F5kwCsh9HRnsJdG1RYvP01Sy0yRLW'
-    b'cH5Po1V2WaDZPsAVBXgccUsOfjnaSYyFNa0SObJONUMDyEoPypug7naOHv2r7aMfN1SmUMp9'
-    b'PJtjmpq8arVBUc/iRR4HZUbFJjVI2k0ypWuNmXxaYqbEPeJQQPT3K/owjleUTTz4zaNAmGlR'
-    b'UaGqPSU5dNcQnkbZ+nVu+8ooa4znX+DrMa9uRPltWs5Ikxa2wCkyNCThNbsuGvdQvUaxezWQ'
-    b'O4KVqRt5MknJEDKfmOrxm9+AxiF0/KwqLZUUJigGXtKpLHLUgca4X9FPEwvVygsN2RANpUlP'
-    b'0vtdRoWGosUHZwS+cTKk6Nv48+bNSyZKIUKLbIxpZtOSmeqdlRIaANrA/blqhWK9myFmZRGc'
-    b'7A5J1KXlLcDIRZ3VaoN665Gb7nqK4zyWwcoMASdKe9IsZ6rCJ+IFiN6b90x2vbvnV5AjHSds'
-    b'bgJszIFpR7bp95vtPgb1XIPZDCEfhmTbvcX0Q88WhChyKRFf/uM//zO4vZWoJw8G0QGTRecl'
-    b'z5HZiDIAV0T6YujuoBj2kroKU0xCY4ZWPqfuX8ZkA3O+WctfI4+4vHukr6xnn34EceQS7Myc'
-    b'6BhYCLCip30Z3fsub98T1QMtUpJshKJR4sSY6Yqy0QbKczxSvGoc0E8pes5hvXua38eS0QHL'
-    b'55fmSRwQyBV+lr/weSf308HWPLGhsZqEp/IUoLzHkpohylgdzvJKCD4waBx7gMgLfoU1rtSN'
-    b'UmJNztmWRsH8Zx+0A1cMfRtYRn1ykaB5mD/JWVH6M51KGnXvaQFKCDQpob0dZt1UvQ5jlSQM'
-    b'kvLP7qYJFHIoqg1cucLQ3zF0t2Rc0x8njrZPI6224NsR4+VjZkUX9Gv56Z50Iiw/+gIMJzrt'
-    b'4fg9CO686xullQ1k6IGtQaCsmp2LgcnqsXj4CirrwPO/A8OQRZLK920JTMjUF5CR8JYjjuP9'
-    b'jD7oCor1Hm4ym2ArusgSuXiFO1lFCDhsXIRy8wA4Bx56dIefgRtKxWukUlbty2p9FlJwXHoA'
-    b'dZNHQbNB2WzzSj2LGaUZJlzIRDUGZbyAsdn50Z1w8A/dXZlj5BfRMNlQhgHJQmU9MDz92/UY'
-    b'INSiwv7lK4qiFByCIQYiJNG28qCm/N6En1c3DaoQ3nQ5HtB3vbGa+BPrgrTlEYe1QrQD2M/A'
-    b'n3/87ourqsaqqZUbJnE+C87Gxp/1zmnXWlRAEPiNfYsxOfgpKSpYNPZMCzSTpDtkng3JlTSH'
-    b'LAFAvd5g8/gCe7xTd8QsKt1phHFCtYgcqoBEnd9/ob1c5kJS6mfShpa1TkQVwpyZM8TiwCxu'
-    b'hh734KXhXIF6u8tn4SmhKdTjqPObp2262T2hCM/k/XpU721+xrXXfsyd5/mZS0N+ksnITMCX'
-    b'RhCnxTMze/U9eySs3j4IDVnudJhqrjI/gfBZy2YTff6HvvUphBaKG8V8+T0k1pQ3gQ3hiI6o'
-    b'o7SRErssM6O7HiO/X9bbSCfRJwqJNP64qBoUZePN47qLL5Zm/HV0tH4cqHkA307g8y9wVEuT'
-    b'Xgosev4kXYjDISQ8Jg1YKIeVho8/wG1YLMnBOG8QubqGFrpgiwsb2VdMxe4lHvzj9YihvQTv'
-    b'ZVGJLySb0ZIwJ3K4uWI9dR8bbudY2JS7l/ngFza8ZDl8Toc7W10DZhiY2Af/FCV4HNEefmAM'
-    b'nLQ5bmVU/ilkRAYtIGfvpmJs7O/oA8RYNDs/XcC641+uyzWcmmtBwgbgCOvnL6E6v0e4b+Ja'
-    b'tckrKUh0eUSVko5/VoxNUPhk3lNWFZ6//XtQznO+PhKUgxdmy9PEwLxfm0RYJepwiFzPR7SB'
-    b'y5SdtUBpBU9KEZ1hAenrdshvlFMy33q9Rl3WWX3CiqFhMTPNifurkT3vqrhpceio7FJ3plvm'
-    b'3oAzG9lZ58V2Ss+ChmXse9yCWLJeb+dRN9LWusysNE4sCOO093FFGQ2Bbsf3cDDZcjVOhZgC'
-    b'YSKRT0+WRmVZ7oe+vaGdntNVE2NnSXB5JEeTI39OArQKc+GrJoZH9ffbPCdDohkg/b7itVNJ'
-    b'dwm6uBQSZHQFQ99FYR+RQ9146/NxScAsUhLlVznnkrCeHm0weGMW+R7IMzGkXoMtp77UD4XZ'
-    b'3HaJkskDmjVxY9+ivXn0nZxDvXlUKPHiKRWesaKovac/+3Q/HroMiHa02vZu9wyMA8bzz5hg'
-    b'l8oiONnVMg6Kc1s7BUSyTXSkb344/AnuPAdR7L+A6nW4vi5eZbagfNIhOZIvmX6KW21AAY4b'
-    b'roeQAkjaZVmKzQyfYyX4M3r29F+G2zEcwoTq8Stcs064Zzm9rnnMbKExTK4cDFR7n28AMPrT'
-    b'u5+rJ4PFZOP+TJ8zGRNZnN+I7rEhnnUYonlPud5lrn2czawb44SK98uLCvmUrx9ewyLtIgxm'
-    b'UUrZuJJcqJ9FAWdigPnn3y6p//mXiCbZRaF2c8zuIyCO/PkYLZzDOqior5cz2mCqwwaSkJUd'
-    b'ajMiLONQaZvl7/T7m6dqNptNzDVHEq6U+yJo2EgA0fk9diUQTHzGoUty3VNtRK7vsHQWEJCo'
-    b'KYdhvbt7odQY+e/Vdod6szULWgodo3QJTREJ+TldVaJ5eIoFYnu9LIwJcjz4TBcRFd1n6V9g'
-    b'h1NNP/s2eU3sYxKdLdVO1wdJbDWZpfd22RMP3rc3jEMvv0qjdiSeT9ZUokKltBRgRh7Cn4f2'
-    b'Fg2KXFGgCop+YlZPEAsBGKvm0N/Jqtl6/RePuJ3fMuWUaiU4bzgzApzFpBgZgjBD02Fdl6G7'
-    b'YgjNsCtr1M1jXiCZdS/PDoDsef6y9mdN310wjF3aUPaOVtuOdl8BV2A8/QKHefqZDLFnK6cO'
-    b'ZAl21MEFrMZiJqgf4wAUJcqXf58hDTKq0SjMECHxmWcHKQEalauoph9vZ/SHoL7lYZGqX3JB'
-    b'oyxDmbG4+4e/H85hJIMI1cNXuKK2k2FI8sC6O01hKhJjkvXjt3mBRphID8/QX8Dqk1e5ReVp'
-    b'1Jgw3K+Rby/Xe++SqA4YaziR7RjKVNmbRMwygPXLb5HP5HHwb8+5fGJEWS7kRRsxsOBaYKBU'
-    b'/l+nbrFaNSiq2pvqiFn0Rfdj6XBJEMl5uRJ++/AYYNUL7hNnm53ZycGRzMEx22ocCUhZp+Xp'
-    b'6Aub3f4BzulRCxJx25w+e8HtzZIz8LR/TH79Yw8e+/xmpR7yJEI+VRyaDnUmyztENZaM7ubn'
-    b'mVe7hzg5YUTpKCOoqdkhWdpPA9FFFRX03e3i0/GMJ4ys4pBJn3pps2HmcpFpNHQ/faC7XeNn'
-    b'nAW2tAyrWYE2GbISFOVT09TeQ2YF5UWCHHfMcgiEwTfRUhaaeJ5TGshfi/Z2ih795WqDarUR'
-    b'b5qVuJBJB6+mn7dabbyglscY/AOijNWPnmrp2iVhQbwwDcU5m6eRAePc6rtrDCIrq7UXTLO9'
-    b'j7PV05FHRMpqg6JceYqtu6WFa+eoau7F/gtQrcCXd/D1kC38dJMm1rxw1jWxEUnKbCR9zbOK'
-    b'Y4hEpGqF8uEbYBx9WdCJOHRzTYkGlBkAlSXKnc/f5vaaC/zSDoSXAnxI+OSLqjnvGbKgiOHy'
-    b'EVymipiil2lMs2kCU6ml1M5k3Oxi8xjDccb2hrG7qyE+JWBbsB2U9y7bQITwup8Km8Dxk3OZ'
-    b'25xe3mTGdKriRnmyEpqHl2C0NOJ+fFcKBFN79ok/I8lk+IVa7hZ9+tdwlCM/eSeRqhoZBHsS'
-    b'Rh4sqQJoF4xX7rcrrpczJBfERgWWhWExKbBUj3RStqbPpxOICA8PyaGYPoosKZRE4KRdd/ID'
-    b'fVL2B1pmCoyhBU97puS+GKFSqgJlFk+Z/o7udo7BTs3uAfzJS1q7M4l2K92PXFli9/w1uPd1'
-    b'6G7XmYvP+keDA084NlPHQLpII+MU4WHE/TKr3dcPL5nLFxsdRDyzmE3h9FRsO1egnEx8+jYo'
-    b'+zkf6ZSOkuJZoKVulReiMS0dCwX3wEB/rbYPKFdr/7Oc+Fzi/jHUKH78+qJeR8/+9vwRIHF5'
-    b'DnBubZwJPI1odZrPI2KBfJAU7ALSTLm7nXyBDKBcbeFclRf0JPYvMWI/T2Ws4MoG49jN8/z+'
-    b'VVoH4I7tC1yzB18P4OuHgqg4qXrIKPPYusFL9EO6Ad0vGEMFR1UDt37Q6NGSvavyz1Y+bSBX'
-    b'+IvjCpTPf4/iN58LQMBodQtJf2MtCAmDGxkB6S31M/wMKoqoM8jmkWUABBYO9yxjnFQ34cpi'
-    b'Pvi7G3joBWDIC0ZI8rpSnhyWjEVOnUpK97THn0B4oIpmC+cKBQVnWV3Rk4AWIUzmnEueXqHe'
-    b'7Pzrj4zzz9/RB6SB1TSE9dqkfi4vzNwkYJcXTQWYuG7W3pCGgXEc1CbN4gCx0Zr5PiojlaTj'
-    b'77sW1/NJ+MZrbhiKk9YbCStfhJnauXct7sHD/vnldX5/PNNB2nwYmYvfkj9HPNTcbNs7dHfV'
-    b'nVgxyTExVlZirDwWY1dFJkRFOP34E307HYrP2bUjMyCHc9rE0hZOX+IcNs9fQEQYxwHt5RSe'
-    b'HRZ7ioaEKHfUtaQ3moIyWQ32ky5DByLCZhpX5LyIUmuNE1tkWbNNM+FFFS2Ox77H7fiup7sS'
-    b'Ip+NzTpz7iNJzTGMbs8MEOvbG8a+DwXcE4qyivA6C+qIBX0BoUeZflWrTeT5+/aKvuugIzpJ'
-    b'5MFQRJJkUR6/jsi2SjDR5VSHNfpwncnwbZrfJ+vZXxARhWe4KFe+qOERQ3/DGHl+vjsAN7fe'
-    b'gdYP4PaC8fyWCQE+g4chwnFYwEeURXSms/F+wY3nn3GUzzU70HqvK302S/9ogsKG3IWMcJby'
-    b'+e+BRmCM16OvqAqXl4JE5gbHYqEKA+OFW+gPh+7wI9ANdRJXS+bM6mJanioO2DRJSE18xu6u'
-    b'YHkZoU7Wj6PZYIaEoMnSrLUfP+KuVazWPopVQr5yRJKN5xRa2CM3mKrZwpUVGIzTj38Cw5Bv'
-    b'q0bGQbolsRHow2RtuPNmdD1+RJ/+eh0KGy0Jy8U8xJ/C/rYng//t/uk5+PV3uF/P/xKHLVlD'
-    b'StZHuoYkYkfwuQB92Exfv3zJAndokY4S/g9kUC0pa5W49w1ppDLr642kP85ivtnmk/MDRo/p'
-    b'juOA44/foyZk/fCYfSBmUjYBmmFnLB3hjhw2D97bAcy4Ht7wqUV5qq+x8g/IICGkWUx6Lo1+'
-    b'rLe9XXx+hXPBtc/Ku9MzQzmSREnRF8qowqHZ+fTPcexxO31kU1Yqj5KEtotZHfKcCRztDYmM'
-    b'NM+hvXuKjxya3bMgEShJ+2ODPkUypTL/c9VsUG/2gVu/J1G2qf1uUkCwkfDJJCB7nmkuq3OD'
-    b'F5LLQGoO+qVusq93JepmD9usjkRRnJwJc8sfcmoozPN30729OQBX1FvQ/gswjhgP3xOB31Kp'
-    b'aGI6OQ3AyJz7iKFgieHje/AOAIr9K6hem0l8SmxPBEuwFmsz1jxvtX8FAuQ43s9BYUyz77rg'
-    b'm83hPgsjJOlWyFFpPlxP0SnQ1Wu4aqUVvUyGJxErgJwXxhlT07RycijsW3THX8pEg4x8BV6o'
-    b'MWCIR+KfxzFuFPeP714F60rP8bsCcLRQCuWQLC+wDSy436kYLJo1isqnEF7fvseum8m0wNeg'
-    b'hmIPEr90Jd/1r3v++IV28j/fP4QFSSiS8RoiMqkvfYhIrozUBv34+i3QJQOu5xPGcRTOXoJy'
-    b'odRTIE3pEyZByV+kToe3ICAkInz99m3BPAefSswA4ZXOwgskiPuYGb2YVMg2VdKJirSADJh7'
-    b'TWy0kw12HHH87g9+IsL64VmhCJZL5XwNWXWAmaTDOVTr2bTq8vbz05Er2bhYM+DTwRCvqRnP'
-    b'yPOzN3IM0CFy3qBIZlAwJS+WJAKyDELLrRGLssL64TVMDHHwtOdF7UK6luykF9ssSJU7wjyN'
-    b'eUR3O0eH0HpqEjPVJYHZoP+S+XdZtLuiQlmt489ow0hkbnpGmT4nupzyJ1UoGUBSaqJDyJM7'
-    b'w79Nc/cAUFSr0PFPwuv8gWerZkwWTFGUKKsNyJUY+jvG8T4dvVcH4EJVg+LhG1BW4PMv4H7+'
-    b'ZN8XsFBmlGxlvJMNS4AxHn96dIGc//nBPnEB4Z83B8sbmnPbFxm75dYPoCLM8t9O4OQzWk8h'
-    b'0SKgoqoNIoOPBzBePjCE8IdivY9BOjMcRUbnPaemab1tcgeSznx6w8Xaz7Vy36M7/PAHI6dQ'
-    b'NGl0hA1XRKPzIetSg9EdPNTvqtof/OSSxceJSIbVZk4Lh3MaQDTrRwhVvUbZ+EV6O/zCkGYS'
-    b'5IN7uosQgInNn873ZvJHuHy8JT79j95gg8QEFNuLP0+14+zCktrI/Ys9vX6Fc94p7Rq0BWkn'
-    b'z/y58DMefJSPiqbpbkTzlPSkx/A+/X9ToiEm1X/moVIEI+UuD3YiKuOLdlOQzV9AlmKE3bi1'
-    b'ZNIFKiCUR5zffvhuuCi8eU/OEGb6o+mAoBQ6zgSYpGavi7qOjovn9x9zANdC8xJXv8ixJV7o'
-    b'xJkN/Gv29x/GIUYOU1FiHSKs1SyNYjUojza3shMYWD++hFn+xB2QE3RUOJ5G5IWUCmwJ7Fp8'
-    b'JqY1NHRdPJS9d8LWaFg4F76ytYNx8DPh2DhMPgU8joln/7w3T0mhc2OtjeNkLCyxpE9STRCZ'
-    b'khL/Oe8Y+nugIbYo681MjzLbO6fFVoVr7ef5VxiHFkN/mz7DxQE4u6oG7V5Bqx34dpyV/Z9K'
-    b'ZkjBtLKjVN+ZPOgMwnB5A8YRVNYoH/8GRwVkCC9b8jCyOijWm0E66rBaowhpTOPlA/35YyEW'
-    b'VlBqRLrYEeyphMqnjr+/n+ZRt92cEpjZO8punuaRjHTXY7bGZxLGnxnVwzPIld7E5/jDq+0n'
-    b'CJTps4xBs/qhZPVnvjgjR1eubkrKqhtUu6fQBLn4uZbRThJJaJgFpNoxyW+wq3V077ufDzEK'
-    b'eBZ2Gg6Rn2WJZFxGMr/PjHHwApDb+YC+u3sI9eEpps2lXSWZF5Vzypg+6Y6S9/Py2795i1Rm'
-    b'3C4XQUsklTbPZDxnSB+r6zod3kR6nHBCM5xzeP36VU+BcIaEZ58pVSwTpdckKbYcBYrNf3GX'
-    b'2ElbKQRkXBYYpjwmRaXWPmEcOR78RVlj8/QiwC3h8wo5fcT6P5x3dFXdeCQKwPnXdxvaBy3R'
-    b'2UnRwvbHItJZWul9GDrcp5HTsgwR1gvUrNiz2Fj18l34Wf7Z2jYxv40HbASiUrfMCVUDq46U'
-    b'ZMSyxeQkqMHYt2inJqqsUK02igVmycdSLkqOxZJoYsu6AbnCi4bP7/PaZc72alboIs+oEGk/'
-    b'zpTCYglLgc3P3N1P4EBhlvU27k1sxmLzslYr/JzCrVCUK/DYY+zuwcgHZwfgxAy49RO8g98J'
-    b'PFU9bCWb5eEpM+yV8Ouq+9UjJARgDLARVQ3cw5e08RHRpql63xLV8ecjkyBQUaPY+UU/3s5+'
-    b'moDt/Vp6vavQVmZTCzRDdBQKjFMUVJS7FxSrrRANIpmnzj88KSEXZSic1FNMkb8U7DX70wcQ'
-    b'Rt7sCodhO4YsC8amg2MMqkgee/S3ybxni2r7qBBZSg5XMrnTnEpiQzA0/WNZrxLb3nOo2DlN'
-    b'pjRXAKtCUJYU+Uhe1Ckw4Xr8wND3s0+/MyYvUudIQuYmaKK0pgbA/93r17+jDLa9l+NBiIYS'
-    b'RXkiPMsm2oz1QQJKTruOtu1ix/+wf/CvNQ4mLZMHbXFOP3BC0SSoSWipol9/hPqF/0e0VWW7'
-    b'wQBhkUSREhhO+Y5xwPntRzjAVtg8vZox9DkKnyIA1oOTNzhFvUIdOtDL+y8vBiX6hD9LeI3U'
-    b'nnjJ98Lk+Od31t/vuIeR07JuUK5WxqTJp4tgAZn1F7Us69nEp70F10drBhBmhcsGXcyTbFzs'
-    b'hfmW5s15mBh9e4vFTdnMHvsp505JkyNtpNlsISeefxs8/4Hb+QNj389TTYYyj9NJCZrF7xIV'
-    b'1TQVabIsLVyY0d2OfsycXAglM8TfYoifWW8y01qiskIRqIy+u4aigk8OhCMA0GoH2jyCb0cM'
-    b'H7+DuztAiSuSDlUDZTOuhkVqagUjZOrj7Yjx5PlvWm1AzQ46Gp3NKFBIYQjTMp41fbkrUD39'
-    b'LbrNDddj9LvPEDfKbR0zUF75e5Mp0Jpeoz+/x4en2DyAijK3cDERB1KdqlmhUypQ8v9SPXyB'
-    b'C7BVfz34cAZeGN9eaPY5y3OleJ2jzWhKQTDHeNxyvUex2uSJYlabkvBtZCDylO33ybEzmfgE'
-    b'GLO/X4K4b55hN2LUTDiOjW2O2BDsgXE7e08EV5TYv/6WcOypXTRrhxDKcwls2EOb4eyfXqKJ'
-    b'zvl4iBMTlNtZfMZSJR3Igo5jQqbA6Np74DoLrLcekRrGMREAGho0EpoIKUmnPCqUXJkc/Ffz'
-    b'3RsUfobh5eZWRsa6Pf+HkUdcP3wjUzUbrPePZsOQy4ekBoBV4cFZR7yOUb/X4/us7De7aDay'
-    b'MlntB4yFZzp7jv33pIditd6K/dI+WHUB42PJVePGDY96TAAAIABJREFUnj4oExOf4XZLJik+'
-    b'ecaMwyhd1/78SIbbhLMkJ1bfQ9fGorFe73yXbvx0MooZVdbQ5LDp70u9fghe+H5f6Yc2mfZg'
-    b'VeRmGTFsF1C6fJv3C2bZJIRndejQTWL3ogwdv6ZSiOwfSaKaJSI4V6CoNiAqMPY3z/ODjg6M'
-    b'AwBQ3cDt/Rz9+PEHuD3jc5ab9cw0C095mjlkTrx4QED//nuY4Qfc+gHFajcLAUXpROLhTyNT'
-    b'SbgzsOCp08ahfP43rzAeBgzXg8EI08KmSkIwJWD3lHckzKEkl3e/cTsXFfdqnpS14CpbpPTZ'
-    b'QZ0bqVT7l6DiBIbbJbr3LW1y1sFIqcaCZ9oh9c2OVsF9G5KfgGr7ACoK2OZDUu6d7AdmyEau'
-    b'dk1FO82jR4aGrosmFza5RNo8iPJ+kRUcnh0ZAPmOf4IXH16/zXPuCTqwpEg1pxX0PFVGJ7my'
-    b'QBW6q9PHm+emYR9q5uGsrHMpiQSWRRahaz1dUpUVqrKe19YnVSKJ449JOKWlgkkiuMS2dwjU'
-    b'F2G2WzZRGBbHJRu5GayROGmQNHZdYte7web5S5bPQNJj3rjG+VADK1ahrFdY758iBXU/HdXn'
-    b'Uz8HdsRDfi6TlQSj+o2+vUdx32qzM6mTbIVlIUgih8DYHwpXogrpn/39iuvxDYbTyOLn0BiO'
-    b'nM1MTHHMbofRd3cMgdprtk8oiiqhLhKEhs3Mzhw1SUYdETr+crKKHzpw32m/lgSh59TXhshE'
-    b'G2lhzdi8sl/B49Cin6jhah0DhFJNEiV+Obzg48iMRLTujXxcWWMcOo9AEw4OwAf5Tw+3ewGq'
-    b'BuP1Axw8p12iGjah1M8eXp7fcaySJse+j98xtp4vKnavwVKXcj4LFudm2EAmhK70VEgPl/Lx'
-    b'm+8+wkifh6+d6PL0WfkZTz2PhM1Y9fTsdccQN1xUcOHgh1WNkxQWWA8sDG+R/J2Vm4c566C9'
-    b'zjnMCZTIrLs+TapxHnEiiXdXgMHeIXBKkFrvE58CqUHJlb1moAYElMukd2MC1k9fvIBw6KN9'
-    b'p9yAcr0piz8DZra95JXhQk73MR783pOdNF2hzHU0FE2ax8qiJNP7UK2a0PF/YBhZFLlWoUPZ'
-    b'SJ1uEinHORKUbghGIavVClVdzWpvSkB4GbwmOGayTuH05ye2vdkcv+BP9QUjlXKns29E98+z'
-    b'1wTBz55PMPhqs8Mq+OovdmnG2ZdqKEjdQk9BTdqB7nYNDnqcmYMxsbAA58wWHEu6Bes9Cpaj'
-    b'u1+juK+JPgVyMJ7yl+MchrdlDWEXKMuQb+CLjOvxDVITbE5iaNIib5A5nUhho1mYn5Oxa0Mj'
-    b'Q1htHzyCTMa9I83dmk158r+irCKiMQ4D+oCCTR4HqdiRaR4dtBIC5ESWXcnkhUQ07okRukBZ'
-    b'b7wiXwDcnHkh0CelxvwGXbmCK1YYxxZDfwePfHAA3hnwBjPbmecfb0cxcqLNXzkbJ59DPwA7'
-    b'4S49rMbjL2DofTf88CWZ9f1rWHqyTmSBMlq0GiWisWL3Evzsg2d/ezXPKRa3kdJFmntL2tUe'
-    b'A+P9ij6Jqy3Xu0zpbC1kMmpiezGZJ5VXcYbKfGiv4DgzndSHEk3hxZ5rZnbZRhy74xs4teuN'
-    b'NqHiPSvIn2cLZ0kPkj69Uoeq9cML4Mir3j9+qa7xMyQ9m6kVkAuLQ3J6p7cY0FOjbjbJCbCQ'
-    b'f2BAKXovShInhSc+ADRrX7xdzyf0fZuodElMlmkjp6mYY7Z4Vpa4C7rA8TebDcqQbR7Zi3Sk'
-    b'LOnIVKY7JyE0ZHQ0rgwFtzdEig5io3FvaEFou5R2RqSFgAkt2Hft7MOw9QZQZAl7FpAazYqT'
-    b'GhWr6hW2L1/9tw9D4PihdhGTa+eFNj5FmaXpKeWTHt314idciLB5eMn2mPR7UiSMrQC1BbGY'
-    b'cw6rzYPPd+9b3CbXTBLLSVAlMmiIJI1JVlOXt/4uIGrt7YRxHEBEqNZ7cS7l1JI8p2z3zPn3'
-    b'rqy8eh7eVrq9HvyVcxT0XNKAnoVH/hLawRmSK58czp4OQn87TeI7FFUTEcsscEs5Mwg6mpNt'
-    b'JfzXFWUQ+A3o2zPG4XZ3AN6mDdKtH0HNHnw7YDz8Gbo5ytKYWFSjM52ZxHd+BhGG/xtOfgyM'
-    b'igpu/xX5KESOZZJUeEtLOUohzlzVNAmZmIBis4eb7CePv2JqniYMdX2aezCI7smYOR/uZ2/X'
-    b'i+BoFx7WvAyyhG12XOhyOwU90geAuxbd5WAe6HlnlRz0lFfaJK6tBB/u799jx1+sdxl6kqpn'
-    b'QayT6FjfwhgwoQ7l+Z6u9s++4wfj8vN3MA/mmcAKzCSdhJCRoZzUYxRoizmgp1o1Aea3rFRJ'
-    b'b9aCD+YFHltdEwDrbeCLz0fcE9telpkAliMYk4GmMORkxnTAtcHRbrvZoq69tqBwRVbkshE4'
-    b'YwOAbMF+IcbWv/bYd+E5yXnCzEDG7P4XcDe2gL/5/bbX3K43Gzgmm59eWiPzsyhif4sS25dA'
-    b'k44juvNJPQNpmELeAFgIn104p7xwuqLulyN4GOCc8659SQGYs12co5o00wmfeQ+4ovRdtiu8'
-    b'PfD5YI8mxvqUFuoqztB2VQ8hMXlL7uEwBnSPGURFEFLaLo205CDIyA28kseP2QsGAQojfR82'
-    b'ypbalwvPj8zAhyyLPUqmENKNzz8UI49op4wV8rG6nnCUehOCHMjklHakvDfxyaZlEPh5I5++'
-    b'PXcOwK9o7djs4LbPQN9i/Pgd3N30Jg76XGm0OP6XfMU4YDj7bpjqNYrtU0Z2z5NVvFCqsckv'
-    b'kLopuTGFq5rolz+c3/2MPX+CtiVJdFaempkGN+UQ3C8Yg1dAsX3yCYEGsrcU1kCU9wvSwId4'
-    b'GtHLt+Vy653JxqHDEPOzSYt7SItGctpCNwHxfwEJag8/vJOWK/zCIbIfB7Z9xJb3boHFxUeB'
-    b'UK1DNjUzLm9/YuwHMVKaNsa5Clp1rJJTTCYapio8BvQ067lIYuvEFh1dFP+xccCw8Pym7EJv'
-    b'91NQzxWnw4ds2UyodjGvM2nZSQTdEYA2QO+b3dZ3/MQgR0JzIqY86JNjwkTN2Sv7Q0flO349'
-    b'QW5qICa+n5cP5rSwkwE29+MBw2Tz+vDkV7JAidL3SSSAfBXUpZnzoiyxCQl90wjolGw3I2aG'
-    b'yRP91eajoCr1axgGdDfvw06uxPbpq+TZFFZhF1azAJsMqm61e4Qr/efx0biseGV7QacmTKRe'
-    b'n+RhCuQuTuTpoWm+3hVlzA5gNZnEcSSSktOeTbSWUt8frIL5GPOI9vJh5hv8ZeUeTxsykFvW'
-    b'Gz5750W/X/ezsM+VqFa7bK0pVJgNOkgmHsWP6lBUa7ii9DqC7jI6AD/jGHO1BW3DyNv5V2Jy'
-    b'w7MdY672UhC80jSS7kj49BMculFabUHrB+V/n+/kn+UQp3CmgH0yop7CIRw+X3vx44SUPHSc'
-    b'c28sD0ISkNlSU86M4XKYFe/7F7h6bRuuQDhcUT7cQAZPJt2n09642j17imbo0R1/TeMb+nuZ'
-    b'kkNJd505xEqGtoDQHX4GY5QKZYAClzYOyoEyJU2VYzx2d8eomi2Kyh8il8S9Lz0EiHNYjNjo'
-    b'JkVhrm37GZfDW+LTv0k6VQlFk4LbJzFXvoexua/LiK3tFPN6v+IeYOolfQ2JTcxyE1LWSclB'
-    b'cg/OfQ8Pj1g1TQZ+pZqcTIluiFItFGVu2lyE+nkcwb1P6HOFyzCZxIMrOcwnp7T5A/MCQSeH'
-    b'KcZxxOXwHtMjN6lPv/l8J+FZCQfNf2G2zkDoiJ33Xzi8Z69NxEaaNysLZhZpfcyk+Wq5744j'
-    b'2mtoMMoS25BgORcbn3HunB24EzJhMSCrzR5lmBhqr2fNCgiDoxmoSTwPWDeFbHmSTChR+G3f'
-    b'3nELep6iqlEFWJ5URJ3BM9FSbZrTO9V6H6dp2ts5G2nNynbWCYDydpJpy02LpnQELyrskyje'
-    b'ahKDM+tQPDZ56TmWN7ksU6NWlA1c4QV+/f1YOQA/opq7XnnYvV6Dr0fw/Zgd4Iwl1SYlMMuC'
-    b'GXziPdJ//BG7YddMGe60UNVSFBrpGlLCOiJSFtopqXj85sVpfYshujSx7kDVHDQJqI5NQRMF'
-    b'JXN/fvNxwyCUu9cwk7nAHGZ+0NZAJH+KbqYwW7V78rP844D+/OFVqqkLFXQ3JbtDkrAw7AKv'
-    b'C2YXrvYaBilhoOQUzu9e7pmdbd9J1UWsebqiXkUF7u3jZ9zUaWEiI/u8tDzHwdCpk6e373FT'
-    b'Xe8e4IrCVF8oKowNoWj6DJG+7uk0SvTrb1tcjoeFaO+8WE3XAaW6DE6Lx4BjJIfz5XwKB/8T'
-    b'qqrK/SxoIRKK9DWjXASAzPEEnBz8A9rbGWoSR6SrUfaskNloLD2bMbgHwPntxxzsEgKQ5Ooy'
-    b'VkV+u1ggbfpOoFpvfYfPjPPHT0FjkA4DkjgyKWOORMAmlAKJlfA4DriFyROXGhQRzMwRkoI/'
-    b'Bb2T2ccW9SqaFHX3i6DXUlU9Z6PBaqgmiexh9Y8EYyQdQ3uLxk9VswmeAqk3Pc0TF1mhwzPF'
-    b'xsIem3LSqm62cwphdxcHvwgd+gzwjm9J5L78BQ0+9LeYyFcUNYpqnQtgDZ8a2RSysQQnwXtR'
-    b'1OHgb9G35xcH4HvsGMjB7V7gVjvw7QAO+cQs8OxsfCKrUBfUjFlYOGP4+AMcbAnd9hkoGzVv'
-    b'mpYtKvdYcmyWtIJ1G0sAqsdvHioex8jBWwdyzjka3t6kEY20V+9P79FXutq/zCIMSg9DKSzL'
-    b'lyZJr2loIVC6uRMB5cNXuGkm9fQO7ruso6KM+845P4pQd1LCEeX3mWeAtp/cwlabkBNAWUPJ'
-    b'mQAt3dw5clK8iNyQ4CYDYlzX0a7zfj5gCApcU5gkK7jEdotYjw5KuPJyeEN7m3z6n7xfeXqe'
-    b'TQUbkaKlNKxKOmmN02s6r5GHly8g59D3Pa7XE8aR9WbOohMWh5UmVlgOO4IBHI/+Hj6/vKAO'
-    b'Y4QS1mSrtBIeTGycMplqPTn474dfUOp24Ra4aLIoqBqdVphSiiNOP37HOA7ep+DhGSCOI5kk'
-    b'CjDr5fTMcr5uJt68Xm+iyc3l/Sekay8LQS/lagMb9VeQOWWaGwJj6FrcT34fK+tgtMMLFAwZ'
-    b'8jBpfmSCqYyyrFCuZve+IUa8IhdRE6neL+/0E9toKZBNWunUFbLv73Gd1+s9ilUzF0JqL00Q'
-    b'UCYjDWNGc1IErKgbVKE5G/s26kJYTaUBppujeiTZwKNSgIITKJ8xtPcYJOXKFYqynqewhNmV'
-    b'PG/SUCWJwk17LLkSRdl4PUF/+y8OwJ8ZGLje+6S+2wnj+Qe4v4v5X14m9kiPi4Shwux5Hj7+'
-    b'8OYrRYny6W+golROfXlpM1vWMi8KqjWEIoa0mf3BSKWvGIfzr2RO2n410/kuFfnJ0Jvw5+Ec'
-    b'7IhdEQV3GhM1CFEWkNdUtwqzDaurZQCrp68xBXC4nQPqIKtoykw0stexHPQEZz698z5U4eV6'
-    b'BxddpvLGxSrKyIAT2OSMtA1vUTfRva89H+PcKxs9Rb6LGBC8jGUTGovr4d2P9hDFjj/rNIxD'
-    b'gkSaYW7vbKydlAYJ7+np5SuKosA49Lgcj/q5pLnwlKN0zFaJSBKFjRqGt58/4sHvHMUiO/XK'
-    b'pwVBHUm+Oi3wRRDhZHXM4+itV2lK3yMluErDK7POGwufzaBpvGlf7137mOHKyjsvGo6LBkux'
-    b'+Pqctz7xDlerBtXaHxyXjzf07T3HSog1spAaYpkpkQSzG0pNX/oOt3jwNwreZqOoJgtxgAZd'
-    b'M4KuqGJH3N+vaCdlPz5BYXiG7VVNY1V2TDlKFT7K0LbRAbXe7OM9NKSRmbJ9mvzKP49tt+4D'
-    b'cXZBN9Ghv5+RjyCw8qugxBckladY5tI6NZAyz6nudowoQ1mvk0LK1kjBaDFYlDkZgeWKmNTH'
-    b'PH5zp//6vzGAP+I2tdqBts8AjxhPv4DutoysidQTYqPzolTMNB2KHiKmokbx+FvmMgYiY0+l'
-    b'xDHNcutD/hrQm1Y8OLaPoNARD6c3jO0lqfxSQpaF9JyNbsgCmP1B05/e/M+tVnDNOg9m4GVx'
-    b'SCboWChpPpOXlPuXQJ34yQLuW+Sp9OKxsFYgsdoIrbc8hqq42j5Gy0sY8OIS0Ua6GTE8DfIu'
-    b'pSjrOKvch/llObsvYzlZxHLO1bbFL84Pz+X47u16ibB5fIErC7V9UEqmQZuymA9pJjsRltDE'
-    b'ePr6m0cXmHG7XkRPzHIYOq+9LQvW1MYzeXcjD3h78yLbl9fXgLJ8gpxlgggZmUvaUWgqtnwb'
-    b'A5AL4qmjR5aEr4Icy+PkGc2b82Rz49y0I+0ix6HH9eMNzIxq1WD99JojHkJ0SUtuj+p9CccG'
-    b'9rnuTShIb6cPdO0ty0agT04+tn7OdFgwFilCBqG7XbRrX0IHWLmYSgpFuRxK8+/e2XHqiPv2'
-    b'jvPHL4sBhx4dFhoCCBSELYFYfoB1cZTPoV7vcgd4wxhpDlciGzKSGqPgxlqFEDUeerTR50WK'
-    b'u0hNW3DCq32eh2KYOHHQadyOXqBJDtVqq5FezthYI6E7wXKVtb7PyyjLNVxRjQB+c+Fbfp++'
-    b'3a22cI9/B1wJPv30EbawLSztCBYyN/3opHW/gMMYHVUruM1TKKxGG7ElEjnqC8NErJXcmedA'
-    b'wNJcs5874vN7MPJhPUWQdC6U+mqLtkDtC8QY7udw8ANutfamOiRG5Djpu8WYoBk+yJTFSips'
-    b'InJB5Ty5cL8Edzt7XMgciWFdPas3FFKkxqAIL8XBn26kJP4mFRcy64d7qrekj35aYjWTbW97'
-    b'R3+/CB5/qVCi7FBMG1S10Y0jGIzr8RCmFhz2L19BcApOYtEVklgKzJZSmpLnKl/ixIQvf/sv'
-    b'KIOA8XY5i82UsgXPKl6FNAVFtiqna1u8h4N/t3/MdReUuljk1yeCqoRPHdfSNUyuiJn13eRl'
-    b'T0tjgennYZv7ZcO4hXJKZex7XN5/xUNx+/wqVOichRDxtE8wfV5lS9CAgHJVownTGO355LUn'
-    b'C5G7MU43y4fAX/xig0YF7ucj+kBHrbZ7maMorHApowvo03Y9/+VKP9Ln+egWt+Pbp60JRTg9'
-    b'zVFhS/P2SYWJiOx562d/8EshsIqfzj49K82AhfwDQLnagshhHEfczh9mMUTKD4VUAFOWV2HC'
-    b'KZQ9B8PQYQjCPnIlqmafb7uCY8tHngUiJ+512vi6cgVy5R3AVxe+9p9zS1XBPXwDNTuM1wNw'
-    b'O6l4lTSeUPEN5uOazGRefmG8Twd/AxcqOCvCJYW+s3AewnKOe7pB5Eol/9rl7KI3XI8YwgFt'
-    b'buBQE9DZzD5ExTXd2vF+wXCd4ngf4EIFR6KgyFj8BVhcnSRpDnf6OPHceU7xv2N3T0yKyHhg'
-    b'kauN42bE0NqdvMvpDrOwrto+RUtWeT/YEqBkV81k4GITzTHFa/7OZv8yTy7crsb9YxNZYdbW'
-    b'wJR0JZR+LyEqiZ0rsU3iXFleOOJFaFVRKSx4PoKaud8/vwRLUuB2PinRbDoNQHLHSaZbSBLm'
-    b'lD9FXdfi+OE3uN12mx1AxEux0bP9LKsGUgtTI3zrqmjw1N1ORlHIqRZQOEfqvmIRiUo26nEY'
-    b'cD14SHq12WH3+k2F1mQT0TxPZeTPou0iGQ8CJriyijP03f2K7n7LdqXUe4SlI2LaXFjHH4kM'
-    b'gaRYvF9OkY5q9k8wJ3Dor1F5hcSJ4sYVlYfZnfMmRWFt2NqA5KoSLWBftFxoJDqcob3jNmmx'
-    b'yKFe73PAntWMcsJvy00sX7Msnum6WXthNHs6KgIHyGN5l3mhBE8ltks+mlCquYH1kbltKLAS'
-    b'Rf+k65A+1ST3ba3BkaOx/h7WIFeeATxP81f/yKq7zWN08BvObxh5FAuNjGaC1SZBkccb43sf'
-    b'3//0dsCYnPQ2An5m4+wjW1QEW9jDpKuk6WAlV6DYPvtL093QH3/mxgsqdConrNkoNfKoCMJw'
-    b'Pc4w+MMXFKs1FECYHmZkBZTmbZaeamBdVoVFNinsub1jSG1tZeYB5QeHCXUawBUDuL39AQ68'
-    b'W9Fs48Gv5JECvqPUdnJpQyJZOnDGea12j/G5as8Hw1NndsYjs/tn9RxNgVPpcz1xp0VZYrV7'
-    b'gEuLG0pQL/6MlPkkCYKRZSGMo18n9aqOHf/x4y0fWeR01Ezzz8oOeHaYyub4iRn32x2Hg/+M'
-    b'dbNaAAdYeAWwHedsJ2lFbptcEZX9/e0KZtKiYRb+56qAI2OViO0uNZIZR7TBAKnZP2D7/AVL'
-    b'IV4Th5uh8GJqIqIXaR5JUMZTUWL36k18hq6NufWZ7TCnyg9CblnPia2vCA3j9Pyev2YcGLfz'
-    b'B4ZgirR5fEm8IWC6e7LUUulVM1PzCS3lnPMCV+cpqHvoiG0qT94nkaNiPUVk34+huwXfgBDH'
-    b'O8HxyTq0lPOknsl8Fow4bzqYvE1uEWzHu9s50ZokTVJGr7GB2+dFHhn+GxLdGbo22quX1Sq6'
-    b'CGZarBQdzQaUWCHiabGauiY6V8G58gcATB6r/5NTWDLM1vP9DD79BGWwlWhbxBnFpp88x8N/'
-    b'OARFPxGKx99A9WoiGeYqXPiEMonZUtYCiVwElAoESVp6o3z6DXAOPHToTz9TCZ2aqc5uAFsx'
-    b'j+LJZcZwO0VuvXz4Gvzzk6laKeE1wn+s4UWtxiWzpfWGSIRxaNGeQuFmdqRipEZ4rrJcWMnN'
-    b'bj++e48AciiazSzeMjeDRHHLet40u4XTYUqkzIfGYQAzUG/38fm4nz6SkT6G7OPiZmrOm+eR'
-    b'mJHacQ5MwDXE4rqiRLPZQU0ApI5ZZiPAn6O30rl5HENxU6Cq/QZ0OrxDKy4x+1sQTGrLOsWn'
-    b'rx3Dz+m7DpezPxjr8POUQyekr4I+SEigHhAjfhxU/T4yeo7mJRZe6HH/TIO4ZlREwqYsE9JS'
-    b'p7qwQU92veuHpxndyeg2jVLlnu4WvMiJaNH/tqxK7F5/C0jU4AuOT3x5WKuYrCBJ8Y0k1hOj'
-    b'v15CemSBzeMrpBGIkGHlrh8CaWWCaSE8HdhVs4kmPpOuYIkHsVEgA01MiwNB4xADfduivfoi'
-    b'qqwbFPG8QFIAs0nBSCo2TftMB/8mVK5cbWJh0bdXDF2Xfwa2WpsEjKYFpHtJzBSu99Beonix'
-    b'qNfRD4VJu7vqud7cyQ+UQXb5Oi0KuHL1PwCcJ9LyP9NnzK22KB6+ATxiOPwJ7q6LcIwcgSJz'
-    b'yHwOwxkvH8A4AkWF4vnfggubgLIM8PcTq2VbVEZSfDF/Zfn4LUA6HBMCSVw4VcMuOCgZpqMY'
-    b'Lh/RerHav0S70jnhjpSZC8veMFPg05wRD1sAM0P1hGr7DCoK8DB4rcEw2M8LGeYQ8ppzbuQy'
-    b'H/yJa996v5xzwiJ6NKUcrBorUcxn44xMsWqv1rsIG1/evoOH0cYpU4mtDDyR8JhK2aJo3lPW'
-    b'K9SZDwNrCl09H2xrVhbg0ez5HkfUQUF9Ph7CmI+hjCZaTKrL6ASZlhuQhbbr4xx/HfPNNVWR'
-    b'jEsLFAcGWicwsHDPyBVwoZuaRqUgNAPp7ctSN9X0oxgroPxcmTrVse/R3Sf++wHM8OgJJ2JC'
-    b'IsUiaJZcXZTsGodcRey//t1fL2ZcD28alUztVEF2Fcr2pq7m7+F1UdMz6ooS2+evxuQIL1YT'
-    b'JNbhrGUms9GoN7uo5emCv8WS5b+2JRYcNVFeomfupRyLje5+jlHOVbNBuWqUA2V2XWRhwazo'
-    b'Ri3A889oWTWoJxq4bzF0V+1NYzSGxNq+wrRnneoezjPu2/s5oHoUonhZTETBRhjkKiSyUfKI'
-    b'eDu4ov6/APw+Hfz/H6d8ZL2Ge/wbUDXg8xv4ftFdEhsKDelLMm3giaPbeAmK/qoJxYX8PsZf'
-    b'6lwSkiODxOT3Uu7CNQkIy/0XUOBQvcPefR6vUfSBpX7/bOo1KPrZw5vlxoum1NigZY+V+fjl'
-    b'tbMOnRAOQzwfrtXDi5/l5xH9+d13ksZ+ID8vTR2ykRY+JbZNb6w7/gTgx6Ryc6IF7J6FdJix'
-    b'bH4ozDXk5lmuZ2rh+v4DQ9fap19GBhoFHcn432QRjUM076mbNYqyNEVJLDsZEk8xaYk4m7JX'
-    b'jzQQE5xzqIOL3uV4wDVs7vb0lUVnGON/xh7c9y2u17CpVmWmV7AOBenON7scL5TlArlz05rr'
-    b'2gwypWWuJHKVrDpm2AdrcnMyn/6Hx+TKZ+4jgvXRMn6Wo72JH328za7A9uk1uPeNOL//xFIb'
-    b'Gjt+Yc4jE5RSGkkKepnYeyKEztuVFZqHF3tvZigRWKY5oflacJynZ5F+6P3jpxS7qaBSsdbS'
-    b'b0kihqGoY7GfErHS/jD85M6E6NWbR5TVSpwxIqCKpHW2pqxiIYv82S6qOo4sjn2H9nqKniNC'
-    b'8KSmj1gTY2I/IygFMPkivL+fo3ixmszs2KBf0v2ToMzq0nvFctIiVKjOFf83gD+ng/8/0nkZ'
-    b'IgfaPIGaHfh2DIc19OywWuxkTPTMB1d/+onh6BeEqzdwm0fz4FSzl0yfDOlr5jvjbmf8GAhG'
-    b'KG69A4XKdbgewFEAJw49ymFqKMY22HGKzr0//PQ3sqxAAeZXLV86v80Lm9iCYIY1rpQZ7dSP'
-    b'8yx/fzlEsyR9qTk32AmhHSRrVkrGNcNz107Jg3UDt9rock1oabIZWCxbX1Fm85tG0rIP52Gg'
-    b'Wq3jAr0efqHv7kKHwbpwo79KB8hlhvfzaT7417NNsFhHizAnFKJDcwAJYLuJzWAH1lvfeVzO'
-    b'B5w+3k3BEvMUjGVNbcydM2c/b34cu7bF/R4mM0Jhw/gXflEuTiJVZMgOgQFyoGD5OsGa87Wk'
-    b'nJKT0zMMBXfS4jjt/A3XwzuGzv+s9f7Rv9ORjY1VxjPnh8+0xrMVmI7jBfqq2T/6McxxxPnn'
-    b'd7VVSQdeFmmELArU7MoS5QQxU6YlKIoSq83WI47jkKALbCw3ymteUxIgxtfIK/ung39o72iv'
-    b'J93xs06AXDZWSw5l1uC/LzAuPrGOCKvtPovypYCEZgRGyrPTkkhaI0cczoaYAzAJ/FhPPSn9'
-    b'wBJ3Z59m2fXNrHqLCnWzF1cuNyCTSIWig9hXlVfmAAAgAElEQVTWV43z9f0/AfwzjPPR/0jV'
-    b'HASA1g9wQdk/nr5Hc4HIF5NdnWfciuCyx7d/xiLC7V7gmm2iqSOza2NDjENGV5pVyRLWDvav'
-    b'0z101TrG847XU7TuHXnUY1mkY3lzd/x80xi7O7rDd/8v5Srw+6zeqyVuScU75kJgW6Yzz5L7'
-    b'r632ryjCJMEQfafZ1EKSWnwsPN3zyNjp+/rAuxXNFkW9UhAbxHtCFh/JeecPawMQVq4MUOHr'
-    b'1Gq79zx/4PiHNH54MWqNtK+A8LVOv/d8+IU2dDXNdh9U9nkio/TAnwt5ygRqcxEqtQCcHD0E'
-    b'N2UBgLELfv3t7YbL8QCv/h2zCoGEGUKe/jU3bJT9PCSOaD36KVZ5QjQYWNCW68ZCIApkRHcj'
-    b'CTn2zmEA973Xa6R8O8SAqZXHy4K0JjbxwUkoefjznxENWj88B8qBoMdbbdfQ1O41H36xXAwJ'
-    b'RVWjCMXN+e37/HJG7UlTkyTTlkkbsCiEbrpe4zALUKsarlzlN8gIkswTTHkemlJ4KYsAGEZR'
-    b'lKgmE5/ujtvxPX+u4vNnL0L6xGVR0mzT7/v7LaCl5NXuxAG5NczjGWKKQFIytAQGxM9QVo0P'
-    b'6xlH3M7vOfoREQwLPYTu6ME6qVDofzylcAv3cI2y2cEwjhBcDISzrYXAW4kuAI/d/w7g/3AA'
-    b'cPyv/+sJwJ9piIprdj6wp79j/PjueX7W1UVaObL5hmdIcDj+CBnxhOLpt9gNs172OfRFmsvR'
-    b'Qevi4aVcaJY5QlZNdNMb7xf0AYUIJpjKyIUFZ8yy2ovjTYTxfoojgsV65ztv0glfZPadVk3F'
-    b'om1bXDvxD261nuOH7xdw2NwXq36tyEqeY1LphFNBAQDleu83HCtIQuRvcjrzaiZWELQ1hU70'
-    b'WjU7rLYeLeouRwztzbDOkJoTa3QuHafMl/PtdEAfRrLW+wfASVGCzqTgaTyQ2TAvSgV6ZGa1'
-    b'zM8oYRfGB9v7DefTARCH5CSBZyxpqsVtTWuEEI5zvVwwDL6gr1aNrfUg0vQmGSKNlMrMoOqZ'
-    b'uHZTxz8O6K4nIzs9Rz2y65vteZ+rfCb++/DnPzH2PVxRoNk/Qk1+LaxBVkIJNvUIEAeHcwXq'
-    b'Jrj3Bah/yaiTWT4WrGx+JQLJlKMV7fWCNmg0iqqGI8opEP6X8NS8eGS9HqeVURRltMv2s/zv'
-    b'c3GXMaJkrhOOoUdAOvGhR439HR6HIXr0gwir9W7OA0guJGc21JydKbzgy5pdW6IYwFWs1jFV'
-    b'8X5+Bw8LcegE5ftiDi2yzWVOfz329zjKV9UbFMXK2o5zvRpzdsBz1pCmB1X6Ix3A+PP8/h9/'
-    b'xIM//Ot/z46F1RZu98XDEcfvcQTPi3201dPk8y432nSZDqef3kK2KFE+/RtARewK2VJChSqX'
-    b'hNOKV2praJnkzpPO5RLALhQ1Ve2V/SCM3dXb6/rbsPCA6O48n+2fxU3j7Rpn+MsJ1QDPWfWT'
-    b'lSQvOvBrA5/FyZeFpwOEIgTZjO0NY3TvgyFpsbUVnLxX+cv7A0yufQ+RVtCsdT4qSBM3mSZ4'
-    b'sIFhKHFfjhqXm2107+tuF/Rta8QmW+UUZ6ctpSNc4sC7Hd7Rh6z6zcNLFBPanQpJJBrasytn'
-    b'k60se6LZTW7/9OKDeroO5zByx8MI4qSIZVKfcGG/D+NzYQMPm9zxcIgPWz0ZMJGwNGYDUGda'
-    b'PHBtJXqQvwVxH48Dbsc39Zxoy4FkJIr09hDfmwU2jSNOv/70Pv1lhXX0YdDmW4uhV9Bx2BYk'
-    b'Pz17rihQb7ahcPzIZvllr6Jq3GQDt6igrOELm/z99BECjzwd5UOkAqrBecyR6bQg4stlEtzE'
-    b'LcW1VZRYbfb+vQ4Dbqf3PBDKrB74U0IMEoFI7kHf3nC/zJM1HoYXYXBigoQsF0hJwtESa0yo'
-    b'6u0cRnQ7YQjBOZyJGfKwLaZUmMpa5C7dRBOOp7ufo0d/UTfCtZWUed5EXfOSPsws9uIZ+N/D'
-    b'X/2nSx72/5a53pUruP0rUDcYL+8+qY+SB12kjBniTdWUDxMEXjVwe0uBqk1KeIJLzM4wn3Dh'
-    b'LP41FbdMf+viy1TPfwecA4YBw/U0N+UsEQfS4hvziPE3f7h+zI52+5cZfkOuGjcC2nLE45M2'
-    b'jhdEQ+lEQhHUqWN7xXC/wh6lEcN3ZPDOrN9od5yjTotEL6E3l7ndZAF7Kygx4VcjWMALOZAM'
-    b'rEPu+NC1Pk3LPH1IjBVRHmGVVOTElCnUvV1vB3IOm4fnuXBLY+8MDRUtwDAsaCiYCpX5e6eg'
-    b'nqHvcD0fMY5D5oeRfQzY1qRzHczIswL8T/v187sf7QNQN024tlrBy8vGy6K+y0IKkhHY8P1B'
-    b'3MfjiPvhLRY56cWTS50zPdOCTTdpUoLHEZc3Hxtd1o0f52OGK/IvzuVDk9bD8OzlpYNrNnRy'
-    b'ZRlMdIDb8QPdJIrOvN11Gbpo9UpW88zgYQSDcDu+R1SqeXhOSQRoopDM7YKTTpLllJYQSxZl'
-    b'iebhGa4ofCrg6cOgg8T1IjWEaZnmqckhBjC013mGv6o9zUCcbZ6kCtMlTv2TWiSBWqpmk1gT'
-    b'38BDm79OAv1HIWQ6z8eA9GIimk2vsrHKkYNVr58AK6tGzO3z5++fTTDBdHgMQvv/Fv74PfUg'
-    b'/X/jQxjenFs/wzUP4MsHxsOP1DfOaFNFASDeXH/6ifHwp6/emh1ckuaWzyH+C9oiydMmZHW6'
-    b'gRJr2GP6VT7+FpTh7MV97CtazwEu8H/ZeiBTf9dfDoGDIpTbJ1C9yoqJGYXLI4T5UycrNpiN'
-    b'GSCOhwDPqvEiXN+xu6P9+B6fQFJYZ/JqwbGCssFUVvPD7fFn1HwU9cZzYrBvYba5R+57+Saz'
-    b'cDM0s+EIWD++BKHYgKG7q1CjpYqJF9AAeeWvx4/oD759fInjR1jaoBcZ8fyAZmvTIU30vHz9'
-    b'LYgZOdj2khSz5GUFL7wDoaxPr/P3P/6IxVWZ3kMgm3kXgxGLxksZqZ1UJpMAyxVVsOAOBjDC'
-    b'6zwV9rF4OY1gk6i5SY1ETq59VdN4u16aQ4imzousDol5Ed3QnDmiGZerqhiL290u6K6zaJiE'
-    b'8pizcHEyXfksBDS+xDjifj5i6Npg3vM6OwKSXD9krghWBwjDHm70e4CjAuv9c4wfnubrFcZH'
-    b'ArUV84LmWB1pRLK/32PxVDVblM12tvomCNFwvk+yQR/hUykohSNgFdFSHvqkeBP8OYvPw3pw'
-    b'KaOfydDKjAO6m6e8nCtQ1FuFCLLG9KzljCwsyKgAwl+FMx4/E6if/5+Ui2UGaPsA2v7/vL1Z'
-    b'r3RXch244gw5Z97xG8giq1TW2JbkhhsNdDe6HxpoPzT6t5T8nyS9GjZsSJCsuWVDMmzJGqzS'
-    b'VCWpVKwi+Q13yjnzDOGHvc8+O2LHuaRKkglUkfx4h8yT5+yIWGvFWpfg6oh2e+fhXR4UUpHm'
-    b'NKJPtnn83FkAwzkD5pOFMtKgCFp8nicxPXbYgOPJsL30f+WLa8CvhDXHjSseLA0TzKUrlkyK'
-    b'bDzI0QbMQJYhn61cBCixyd2zegr52YmKB/6cEgtlggvOQZaB6wrV01sH9ydpZCpCM8lEZ4vc'
-    b'dY2EnxTz8cwf5q2Fs0fKfE45U2vFzh6b++LgX2Dn18/coDoe3Mpi0ufr2FcWgju9IhN/3oft'
-    b'k3sg8xzLmxeBAxRHMtlNAxtKW2kRLGFDq/isrm+ReTHjfruBJWixZUZ9YWOde8Asmqt37/rC'
-    b'P5qOZcsUpf0xS41MsoRH+kywRVdZUQa//tP2KYFn41VIGnr+B/UF7tBvm8btRJNLyXPvbYbF'
-    b'9YsoylgmU4q7lY3UTG3HagXqAMiyHIvrlwCRz5E4DHZHafNIw2x8QAn7LffGr/K1jVO8O1dC'
-    b'/3l3tBQrN1TqhbqMAZ1NLMY1Enwmi8uwy9+7E6p3xkkOYfTos4HGxahUhBA3pyDOHM8vgpdG'
-    b'DL4JQJyRJMmadvcJuuzOL/KoRufe13Lr/QrY9KsEW60+aQYngvYFQewU/aedp8HGKDvHVcsB'
-    b'kzlEpvOgkRwLeopJv0b+tv+Hxyx61d/S3QNNVsgWNwA3aDfvo7U3DXhFv2hAudk8fAquTo5/'
-    b'Xr0AxrOoBsQ3owqjoDRHnCI/eZEbbxSRuKGI74JitvJRskC9fueMfEwBMSdctWn75d9M9fgm'
-    b'xPFmnfUiKzEfAdqe2OakbOKRE1lqf6265qVYXoPywnWVm3v3YKnueLCJ0pC9Em5WT3eu0Heu'
-    b'fVnmFekm8xDjW+qzSR38rEYwSYAhxnhx4X5ByzhtHvqNjESlTfZr0JRYSIDz63zbdeBtF1e3'
-    b'IcNd4MPJxESJvYKe+E0aQLkBEYD5chWu6fGwsw9oJuPz4qT5NeyhAAAPd06AVhQFRsXIWC3r'
-    b'403jNDtSh3SyZD+01p+XAWVz06I8vmKhpaQarBM39UnvDXkIbV2HwjSaLhwUTr0nfz93qyOd'
-    b'zJle7HNzqtV12qGswOrlhy54pa7COmiIH1ZZCdr+gIVWhJO3ysIClkNOBRFhdnkbrbel87sa'
-    b'N9L8hYQeIPk+fdHOyxGKkefAo4AsVg16fyaTOs/Jbg51rWNCU1Vh9XM8vwgNDVkiXmiInUz5'
-    b'kxgUWV4T55yZhZU+tC2O+4eeZlLbWEQp6pcIs1UKWPzK60jYlxdjlOUEantP8QVkaIdoYOBg'
-    b'SCkcA6Cuxp+i0wx/Kfzqya29ZctbgHK0u3vH8ys/SNKAKdsB183j50BbA3nurHqzQt2MbH8/'
-    b'U5IFz1Fe+6AQj5GslvRrNQSUU+TeR6DZPaHZr+UOJKyCY/HF/cVtqxOqp07HMEY2mYdmj81O'
-    b'kQyIm20Ag/Xdy+a6NHs+vVzeBMOUavvoLIQ5yXowHOUohXvVX6f1O4BbZ94znT/D/rKx6max'
-    b'pKkDGMeTEPcri93Xjbx7H4NxeLoTq4NalS2a08iFSJr5yU76EHz6R5hf3doq8/hC6nAg0gcM'
-    b'GVkCMIVADGA6W4RsgO167VaaKBfzNg3xeVpwZYS/MICHB1f4x+MJyvEo9cugdIoiBf+bTKRp'
-    b'6MOu8OfuPdWHnRlvm+ZWxO+TvxARyyjz3HXk079YIS8KbxGsqo1lna24UVbe6LFDbEww5qPS'
-    b'u/dlaJsGx91GP8DRU5HaKVNiWyBR0PC7iNBGBlMx1D8I3ZMqFqSbCtmYMnEa4ElOZNeJ35rz'
-    b'KQjTrBuMQrJm2ggH2jHS2GiUpW0qtI3jv8ezpR396y8cJxA7m5GHwwZenoYkYDRZOPqSW5y2'
-    b'j2i5bwzIsNClREFvPOcGLd9Up96qtxghy8fCICjWtZBeCeaBszOmfKnHPP35+5fd94TCv/n5'
-    b'f/kezG+dit5f0LxEvnzhkvp2D2i3j1GgjdEhKmvhboLi+ozG8/tUjJGvXkorTBrokki7WpPN'
-    b'I4SiQAb3Jw+x7l7LyjGKCxeq0R63aA+bNOQwiVTTE2THTbb+5+xQb967D3K6RO6TpJLjkVS9'
-    b'oJTHkYcTYQBHHxQKjS5unXsfgOa0c7761tGZ3JSGJaX6oqoz7ylGyCdLOQ1DJWdJMM5eh7KG'
-    b'Z35W4IFiPHWQHDP2j3ciBtXo1wyAWm01KEXzaRfZ9U5mhgjROtOlDzwLZIHtyQZm5DvyokDh'
-    b'/fP3HfqgMgHitkrLq2LOnBUq5oaZFpv1GsyM+WKBJH9EqwpihITT8Ff5ZhhWFHOWj0Izej7s'
-    b'1ATDEqWLJOw8QB5bzTkFeqINE/F4uVLdhSzsJNbBkKjOpL6EhIiqo0q66Xh6ceXDkxgHHwnM'
-    b'iUBwiOLR3Xi8ShgljGYZuGlRHX3mQZ47BAzaCl5ZNg6t9wkevkc7ySDus6IME39dnXrrXjZo'
-    b'VlbUKCuElAzBYfS2q+PeZ9QTyslM2vkOqPrFoEE8fJgQiaeHonXE0XQZhfVsg55JCI5FYGyk'
-    b'GRlUg8QljTxis+61UuXUb2NYUe1Dsc1knJ2cmjK5n/L2zV//5vuk8PtX9efyJmTQ/NIF9ggj'
-    b'H3mzsOgrOEaGQOTU/O3OF4vJAtniyl8sMg9CIl3MDRkGp1adDBlakpzMJDv08vIDIMtdWM/+'
-    b'MYG7LHMmYoNX9a+lOazRHFyXX8wuUMxW4sHRO73acY2Th58MPhpfAHy6j7lY3oQ1u/a0BzeV'
-    b'Icoa1g0o9jT6TFvUPpkrG89Qzi/AzxTpcLCwUfAHNhfYQnDih4yBcrbo3fse3rrJwJxAyfj5'
-    b'bFObkZf9MfLpl0WGE+UAYOgSjKE3XXYkg1bxgSFlidHE+/Wvn1D7DQMyd6T1O1YqcjUxk3+P'
-    b'2427VxfLZSqLJFW6WU+SZLwnNn3mOwlUlufhQK2Pe2X6pNUv0eZOzNKwQUjFIjYC8jxHfTqH'
-    b'wjjzq3ys1AMJPEP21WSSUJn2iCEA8HkRWZYHVGNz93l0/VI+j2moeWK5Js5xcXF/1tQVTrso'
-    b'tW48SddY+xEwhXEMCk9/STf1xzx8luchyKapTtiv71Iaic1gQPH5pf5MKr69rXHcPvqGPMNo'
-    b'uhAyX9K6JKSUlvBcoajBowGtVOazTqbLgGrUVYRqsPLDiGnxBPtn9Y+KguMW55DpkqH0hmti'
-    b'H99AXNkK/zDQVG3ORIhruy78wJ/pHokmK2SrF0Bbo316i9aLEWLAiuKpjtOpvLn/JPgAZIsb'
-    b'ZNOLgXPdMgNmmGG4pJt4EodEN53zQLvEAIqr145zbBsXrENGQwEbJhVrRP4Dr3ePwSyn3+E3'
-    b'2HPqRU3JEBJD2wPlflDTEB3UWZZ710CgOR3RNlViM8vPSo701NwL4+quuZnMUAhUw9grF8pu'
-    b'JBt95u6WIWGQYyxQjmcYzZx733H7FCAz+gJIONYV66m7u03Ox32YZMbTOXLKw/RihpIQW1Lv'
-    b'AfPOyB3T3rj32dkFJlNvBrPbRAI/ka1rIiSWR4COI6jrCgefXHd5dd175BAlJZvNnLXnYHdj'
-    b'CgeDsiKY+NTng09EjFPSZCSz+U/JfWE828zY3r0JPgzjxSqCTa3EwsgdklMEg9hCGqVYpLs9'
-    b's6JA7sVv+4f3/UkZ2yiCvd2y5uOVAIW0ALf/HKvjLmgYivEEWZGrDQ9KzPiHYqGHnpiOGom3'
-    b'bDIqMJ67jaGmOuO0fer1RXrQUpHiPDhcpK+tOR1x2j4GZDHOA+EIfGVWq9vJNg3LQog+vMq+'
-    b'HoxyPIk8+926cHztByx9wogk/DhJJuZx62qMC5Dah2ax9OvXOlNe7aolrgxMqokzNmL88/dn'
-    b'zxR+/lPFcoPGc+SXHwJZgWbzDuwPfbkaFiuBoMRqjPruE5fdThnyy9egyQJx/jUpYUiStaJE'
-    b'DUQJlQ9rIa632mW9Mg6A3Uqf37Nvtw9AXQuemBjmtoA40hhBhNXsHsPXF8srUDFKKlhiZa5j'
-    b'VTlVmMsbOJ0UaWB6zv3D0lZHtJ0D1sDj1geHUHIiUESRtNXJ+wJ4177RZLCViFW8AoymZ7g3'
-    b'SrcU+rOwn7yL6SzAm+fdGk1dQ4vE5HxjcwtsQA3nww5nPy2O586nQMCMbEQIJQmcaeYDGboO'
-    b'y4OJOt524Rub/S7A/cpdpm8eabgBYJ1wB6CqKhx94b+5fRGpo1hB69I4Rl8uhsGZK742TGp5'
-    b'0dNP1dmr7yM7UY49o3pXMlLvgwdKMCJtw+Nnn4QMB+fTr5foELIpkj6fFIqhrKSh1uYAdnQX'
-    b'd0Ev7pnY3r+TvLCVNkTJeGpC3/rjrQ77sE43ni2RF+PEFZONeXgIlZJ02NAAQMhGJSbLK1CW'
-    b'oW1qhzp4M66WW18XtFibhLaAyQpIIoHFNfUpmPeU4ykKP8QIziDaACKdiklaOEHqW5RbYHRZ'
-    b'smIUfl/b1M49sHP3S2yQKZJCKLqp+73cN0JE7n9Nc0bjM1SyYoRyskwnCrZirOSuGQ3oGAwZ'
-    b'4J8OF36mb+r5hMqx4/mnS/DuAe3+HnaiNEQqZ+dMx1WNZv0eYBfFW1x/JUwVxIaYhSn1yeF0'
-    b'ekjuXXOVuf/Qta6ZAOTzq1C4qvW7ANMTLN5hYHyMfl+9uQ/QTT679DeKYTsbP5aJNz1Flq9R'
-    b'OA6RNvs3gnrkHdxRDW11DLy8afpgrN8I9jU6o+rdpuelpssAaxpnhEAw9ET2HG/R+39HiVpM'
-    b'4f5iOKON3r3v0MPGPnKWv2hapLiTlq/nsHnC+dj59K8SAWsiimQyLVnZavSilcBYzKoxrTzP'
-    b'Mfd+/afDHvvNWkHM8sSSsRhD/rD9n55PJ1Rnh5K8evU6AdlTvywa5GRYelkn1EJ//TMUXUZG'
-    b'XftVLSv0Q66U6V9NBvpGUSPVNLWz660cPSJd++ShI9X67FGIqOArZI3i0sgpJViMxhjPfMDS'
-    b'4z3Ox53Y9ZcNEqf21UJjoamgvp0877eBypgsL0TOh4k6GRsbrs9Xg0YU7MOGRCDLckyWl8jy'
-    b'HNwyzocNAEbrXU/BbgolxBHk6dkCJU4lpcepq1N4f+VkHsKBOnEjBtA0TrQmEQpBlAADiR6I'
-    b'CFlWBBMfJ6LcJDvxBghj0pyaf2dP8bb12TuqOmGfRjRsODf2oIgaUNb0juXewN8cLvzEfyLF'
-    b'Wf528PB8e3hCu34LbuvBoBnZRxDaw2PP749nyC8+CF7a1jfTc+QrSS7UmuZkJos0BiJWcOpk'
-    b'hmzqOq1mcxfCeuQHm2bIJ2va/g+q9TvHSeUF8tlKmQBxOhipw1GYWZBWqGqYU+kp9JnGQLG4'
-    b'cq+9rtxKX5fa9RwkzgpcIinQqbYPYWc+n0yd+pXSz4GHO4Hg4kpG4iJB2m92jxkRJzTy9PI2'
-    b'cI0uwQsSRWIFQUIZ3pDtpX7YPIT94dnqqt8bRp9Nz2SQJnqKiD5suc6ng15JiWYJlGVYrC5C'
-    b'kT7sd9EGEqVEmIFbkoGwdPfG6XxC3dQgInz40UcGzK+5ySEuQZozpToYKfLrQmy4bVAfD6re'
-    b'G4555jIfJdxp7LnHLWN75+168wJT76ZHhgSBWFJvlghF9tfGTnf0r3kxwsgX/uP2Cef9Phk+'
-    b'YYAKpBTgbA44Pk2TCKfDDvXZIxoXN4l+j0hb5UDea2HGoGew60hjEa2/TRcXfpefo5VFRO6W'
-    b'UT48RddLDwE6jC06Z5rqjKbuVvmWKEZj09KcDF4/VvwzpyABs6R3OOJbuyeqnC4Bynz08aOW'
-    b'fyqtltq6IhtRjRNOnVWvV/SXE2R+y41UJJrcjNBIhwrq8gdg0ji4h/tPBgv/5uf/5RsAn2r4'
-    b'Lpuu3FpffUb7+Dn4tLexZeZkqm0eP3c78gCy2SXy5W3fqRMSBzIWnL2HHokSgat8gNQeDhli'
-    b'B2MfPMty5HN3KDTHLer90/DkYd2vEYXQVicXxwtGNpp657wBttlQMgrPAJN3I/Nt0BCxC6Bc'
-    b'+XzwpkG1fQSaOoG4SWubyGpE+sP//NQnNRaTJSjLowOVZbNNKWQVr1aw0XTIeE1WimBJm8yu'
-    b'XnhE4+x90WNveTaQoLT5IqTIxGH9hLo6g7IM88vrxDGE1AoeEyX8ASmjK06aUn3XS7g3yzIs'
-    b'r268wOgcoH7t6JbuNLP5Z/GwAAKeHh7QNg2ICK8/+IqbrJmftYqmL8zsTYWo4R2ys5ntoH7m'
-    b'FufDWs3trHLh7ZdCkScDpS0dmBvsPMyelyPM/HVk84kiUSzIeM9SwhElDlKvi+hgsbwsg6vk'
-    b'+bBDfTqYCaPmkcDPylNcc0MMbp2iv21q5yx5dSvvsWgbSZjmECeNozhHkgCrnlqhSNVWTmYo'
-    b'OvHb6YBhH2ruUyS7QdI8vPrkwQ7paKuzK4xEGE1X6tNjRSeSaqHj5qYP5yLWg4VxN/gfPZos'
-    b'gkNhddhFVJ99MuvzjZ4b2uG2BdruHO2cAmEvqOstGnF+pJ16/5T0YohP33z7N948w/EDAP5Y'
-    b'Two0WSC7+hDIclHI5fRrxOcy0Dx+Cj45y9Hi+iOQt13ULn+pj7kCbCnliDn50qGKYsk4fYTt'
-    b'5WvX2dXnKKxHTvswnJQC39jt8J8PqHcPAQLPp6sIpjaibZWtIqtpPxH4kVK3KwqBjC5ztLrx'
-    b'PvqMev+ElpvE5MHqTgWr1IXp+OtwenjjgpYoQzG/ADISphkiX7HziaeBE42f0YRRbGvMZoPT'
-    b'Tfwtt6i8p3cfpkP9vrDWDyQqdTmFH3cbVxSzDPPLG2SUy51fUhMU8zNvzUYGkAwI/XHUfe/l'
-    b'9QtQlqGuzjgdDkiVbZQytNQvp8WGi9or4P698+knIrx6/UGyx53c9gL61Z6W6SQiywcFpCcU'
-    b'/rbFafOUUnnd2WCs3rEBY7JhZsBNi71fpSvG4+BqZ0vNjd8hBMJsQtFp4Kb7vqwoMfcNaXU8'
-    b'4HzYYyjJ8Dl9qBXgFRf15nxyAsEsw9znVmjSnsV5wsGS21q1FA1iXOSov5f6tcwSeWfi4+F4'
-    b'4aHBA3byZPDCLDVi3aurzkdw24BATsTLKX6R5hmw4ZdCwuNEKzUiFkC8XqHsP+/FFaM0wtQi'
-    b'FgfpcHCD6rQFuAVRhnKyUo+cdgYaCDpS1rQqqab3/AH/sf5+q/D/UaIKzkvkqxeg6QXa7Xs0'
-    b'm7fDXIs6mOr333X8flGiuP2qU9E7X8kEXh7siG0sU/FrqU5azYwq497dncXlK1BeOGX/5s5Y'
-    b'E1T798IHu7/Zm/0arXc2LJbXyKdLwcxxcrNSauIRe3ZHPz/2idd9ACvTmPg5KFe3XmDoXh/X'
-    b'le3O+cw85N9deK3dxJ8VI4yWV64oKgpFCxNhLuDAfpDBkXVytDhH0YHrv3i8cDoKbhvsH94F'
-    b'KoNhq91FT0i92ZG8dxmnvdMx5HmJ1e0rt0bHqX+DmhPVhdUrbpQmHlJ69TkSu11c37o0TGac'
-    b'jns3IbDlBpKugkl7YJIHMgHv3jq73izLcHF5qfIRkG7ccKQST3QJZCMf4Xf2/94VDDDjuHkw'
-    b'mhlEvKWKxDYIhHQlzKEJwad/PMX8+kXUxCKVSYmEUbKbmERPxiZFVpRjLG88ElVXqI77KNQs'
-    b'OVr6d2yFE4nBQBoAVcd9WHWbX79UQ4LSBHB/3sRhMTTQgA8ly3VvOSvKMPFXxz2q86G3n6a0'
-    b'y2Q11cf58hQ/Gx3czoyjdxulLHPUiUIvfGUAACAASURBVJGYSFqQCssEyWimdKQuEldyjMZR'
-    b'WE/lHPZINUTd8MYWhaPjt6PzsGlr1L5WZHmJ8fQi6k80VK/CxQB7I8r0XQ1DwB99mcL/h5Zw'
-    b'gebXyJY3bp//3XfAPpaVBzFsoD2u0Tx86vn9BfKrD2EadhAn+Ks05NUcpViqi1g+iVsH0MdD'
-    b'oqTeGINRrF6E1LBm+wD2O5uxspnFYRRBstRDgfXmLqzylRcvkftVPqGWJa0dsBP6Euic05R6'
-    b'HuAh42ZndPESuRfF1Mcd2rqS36eyQiXpoIUp7k44e5FgPp6gXFzJBg5p/aMk7KPvUJjSRsCy'
-    b'thUeSpGQbjRdeFviFpu330NT1TLkhGG624XPku2N/2O0H33x4kNQnivWTcn96IuhjDi1jAyk'
-    b'LHbk6g62q9uXgTc97vaDmgRN7pqrWWp//e2bz8Ne9mQytfkiksIp2G2sBOUSrxp5jYty4hA2'
-    b'79evuXxWgiyxey2ake7wN9AWbsOOezmZYjybGxUNdsDYoFGK7Q1BUinnrqfXFDAzjtunAJUn'
-    b'9th6g0BFspLihzqovK1rnPwqX1YUnsow8hHU9oHeaEigd70hIux3++eZ8iLs8lenA46bxxAI'
-    b'FCOZpNIWWUwnMsMiRuSa6uRDnBiU5SgnswRJligFJd71iZ7CKPKUAAN9w5mX4/Ae2+qM+rSX'
-    b'QT/GRkFYTWUkTUL8Tl2i6NF/fiP3e5gTvifNmeEE5WB9rsXDX/8z//DLFP4/iCGiTlCezS6Q'
-    b'r5zTXfP4GdrDYypSUdBRs3tEu/e7mMtb5Mtb83liLbrSPvnJAyv5buLnzkIOHaGE1lx3ms+v'
-    b'QF1x3N6hOe3U+5LtldVkMTlhH3tOqrx46VAE2FODniaIMJyZHV2XoWk9XANlSJJP5iGPoDls'
-    b'fVaChk5p4CQkFRXs/qzxK0T5ZOEKv1HraAjPDFsbw9EZbFhial1F4Bqnc+RlCTBj+/5zF28J'
-    b'5R8ADHvKQ/L/3YEQjFHKEvPLGz36KsdJhuWpQfF0og8aUpbEupiHaN4XyHxa5G67NpLOrF84'
-    b'5NAuEZ13bz5zhbgoMZlNB9mIXv1kGUgqVMNSS/cDp3veyjGy3FkPn3Ybt9ccP1+xlkP72Cbr'
-    b'b7E7ZP8lbV3j6DUR49kC5XTei1Qp3msfKpZIJ0FDs9F/lr3tWz+heve+9SOg6Cqy9usjNb0Y'
-    b'TgQA6O3PqzOOG3+u5gUmXW7Fc/kWbCF7sdtqtLaoplUpe2PkXTGGi649rO9hxlSzwU9HTbeg'
-    b'zKLnpKmPIfLXOQVO0nOR5f2RDELaRCdKQO0zHZKRK5w2WV6E3fqmqXD2q4XGA272hkz2Newa'
-    b'my7WvBhNkY9m4p4PiB0PnK3RMEGUNvd9ImA45/7gCwv/5ud/5i8IeIyhEGa3z59dvAaNZmif'
-    b'3jjvfbIgx/5VNg+fOo94yhzMP13Jjt1InkTyZhREF4dIg56jjaPa4UQxMezScuOU/eNZCNNp'
-    b'NvdoN3cDpjj68ScB0VUPn/twngLF8gaJiky5ovXqbjaiWtP3QUPiGaSHcdxrFD7xqT0fUB93'
-    b'INgjo7Ugwwau1HWqxWzlDYIs2Fp2oDbjF41w3L9m4WGvrYzV1JePJ+FQODzdBYetRJVOGm1L'
-    b'zJlFVet8+ovRxHm8e07agtviW5ENioks8ya2hEHpf1td+QhUAHtvlMLRlJjmN2AwrKqbiro/'
-    b'v7/rfPrHKItSsW0kxbE60IlTPoCezUPtD9Z8POlte3ebKA2PQwZH4mKnUJzhdacQYhbsekfz'
-    b'BYqy7PsSpgjxI79v/UzOMLFcyWUy87HiQ6ucTELOwv7xfZK8ySQfK/bIBRlPIBkQfNs2ofCX'
-    b'4wnyvASb9uS2mY0l6wm4U4Df1SpjNH9RkTsTHyI0tTPxYWnjFoEZOn6YzIRFjt5gfT4Fj4Ji'
-    b'NMFoPE/CtcK0w5wOGwLViHM+ONK+RGiSEabDYAf1E4Gb2hV+1iIGqahng/rpe7i+KasjRb9b'
-    b'45NwBosI8wGtQEJl0xBT/vj5t3/jL77MxA8Av5/UoqxEtnoFml+i3T+guf8e4OF+i9vk6ui+'
-    b'hltQOUZx81WLBDHLq4C1fXCCmEAidztrPz+eHoUZjFLTE4CsnAQFfnPcupU8BfUnwjd1yDK3'
-    b'qLtwntGkd+yjmJaggeJuB8vo98FDWHpSx1lA40UXRHQ+OqtdXWUG1ofMgIm2QetRg3J+gWxU'
-    b'DkyC3fNNiRo6jXCV0ysn/90IIw8Tv5/mABye7tHWta3jNBtMKFV8z413Pv3laNyvKOkVWoJE'
-    b'a1jRNEQ2kqFQmhRm7P+azJcoSneNt+u1s4Vl2dAMFUFdaCgyhqrrGg/3rvBPpzPkeZE8gRTT'
-    b'sao3Yku3YfpdsDoY2a0u+fdUHbYAN/39RlZaIwV9KTPZvhrqsz1unlB5k6nJYiUmQB70qyRh'
-    b'NiMfx6j5IU7bV4VsleMZssJd0+3dW6n5iJPrSItOMAxpU/9sVMcdTjs3gY5mS8tYXwNbIsDL'
-    b'wtjSnaGUjAo6jaLEZHnpNobaFqf9xvxAtCKdhWeAvePvzqozal9bRtMF8tFkULMDc96PWk1K'
-    b'I1fIQhchzbgIhGI868N6/Kq3aGTiFUCOvAtoWKsBAs7HtV8/JhSj2RBTjtRcnCQSxKTmGpZI'
-    b'gXu5v2+VDrPwM+H3LNgyv3iJ/OIDgBnN3XfR7B6UhXc/vbZPb1DffeJ+yewC+fVHEaLEA5M5'
-    b'pw5ohl+AjphNbFTJgOfi60+MrJtqihLlzUde2X9C/fTO1C2weoAomrTa4w5VCOdZeWGf0EGl'
-    b'V1OJlYbJ2+4gthSr+iKmnlvF4todnvUZ9fa+N9robhC29Ocyz5nIcdznx3do/X57MVuCstIa'
-    b'daPPLRZMsYRJmWIny4jeim5uso6dvp6U0zlGc3ewn7ZPAT4zG0pDDc+MRPrTNk2AGcvJ1HGz'
-    b'0HkKxsdAKZABcZAYK6GUnDaIlxHH4ylG3gVut35EVdc2Y6Q/g5jrpygG1l+38+mIzdq9x/li'
-    b'gbzI0+vEEZJK6nrpSjeUUWC05sVoFtTS1WmfQrJ4Zm1QmC4RjP7KXauH92gqdy90Pv0pBUHp'
-    b'L+N4HTQZn9XhS0pzxdHEP0XpP7f9071bu1NIN0UIR2fhq29yJqOHYqA+nXDyyYPj+SKl1DiG'
-    b'iqVGIkQERxA7D+B+vb5CopugDOPZKqy7nfcbtaVH5v1AhgkUq+9hAHV1DOY2o6lbq5O9DZv9'
-    b'faIRiRu9mFbWMHzswR+F9ZSjGfIQKrWONC+UqF50lgiRGuu6xrFtnFUvM4hyjCbLOBAXdviQ'
-    b'5uFixb6yZlZaBib83pcu/GD8Fwu6p8nKrfUVI8fzP32mdqE9VNG2qO4+QfP0xtv0foh8eTOQ'
-    b'MCRtFFPlLcN6FK3pl42oZ06mApLGdwyMrj90nDwz6s17kcZkVdm+6HtoavsQXP/Ki5fIp2o9'
-    b'g8lsQsStSc9wFpGj4XBnLeQz4dtGFy9c19o2qDYP4LpWY+czudXKeu70+MZRNx7qpyy9Oymx'
-    b'F2YjQU3t85MFD0eCI0rXlJgdPz29uPHT4y7i+MlAl4wcAVIIA4Djbh0O1dF0HiY3KF8CuwNg'
-    b'wQmTahisnCIkcGO8T86YzByisduscTrulUDU4g4YghyObvRu+jmdTyKgp/AH60CdhU6No8Hu'
-    b'k5MwH30Y5aOenqmPB2/kJTerWW+xqJEt4eCjF99yi93D+9AEdjv1KcnD8l6MYXVig2ajlHpk'
-    b'mJBLPhpj5Cm24/rRmdwkWUAkigMRDQj+UlHUab/x+/POvMeaWHVCkwQ7ORnUEv1C7IPP0s2T'
-    b'mDGazEImQRXbgbN2reRhXJdStNL9vH2I43XXUT3/RGp7iAaodxKxtiG/VSMrhikqkfMr6JT9'
-    b'1WmPpq7kEEqUUpsqXUb/va1rNOe91xCNUU6XfdmjlDJji0OlXhMimhW1LeRf3n/50oWfgP9s'
-    b'2jUXI+Q3X0W2vAXvHlB/9pdo908JQNzu7lG/+xvw4QnZ7ALl6x/1++QDXaHiDAl2VvsQScA6'
-    b'hGKou0/7tIBkwHNy9e4BrQ9PCCsq8aslTTS5wt8J50Y3HyL3Dz0/16yw9HfWJjdf5JXCQ5aT'
-    b'cTFhwvjqpdudZrfL320taBxfOwDDkG2cHt64TpwyX/hzaB9zVvcnBU1GDAuzpn+Nzzfit5jT'
-    b'Gue/rzvY6+rkpjxDr2jZbYR61q2mNa4wHtZPwY1sPJvLpoMxOGUmlYIGMgKgjYKH7NzcD5n7'
-    b'SNn9do3jbtcL7YJIktNJXVUZJnkh6nOFvaczLi6vkGVZD4Wz/TnKsJpB1QlsgUF/ulOWhwCU'
-    b'ujp7F0jZSJOhbKbIV180joZQdHv31tE+AGaXNwbwk9i4iTZ6yKyrO9xJTZIUTXQOiZph7HMW'
-    b'DptHVMcjgvew1q2wxQ8Dlv88+8P9vN+hqSuX5xC/P3QTvQSKw1lBhum/ACDJ/tiM06wYTXrk'
-    b'posHji6y0Fc9O7EhaS7Oh02I43VUhoEIcV/0ZFAcia8Rel5Ohy7r4e5ee15OgsCvrk6oT/s0'
-    b'n6b7jYxkj94ilJr6jLrTSY2mKMcLoaFgGhhxY0G4YmQ0UibDmvg/f+nCv/75n/kEjO/oKkUE'
-    b'5KtXyK8/chfj3d+gfvh+NIG4V9E8fobGw/z55QcoXv0wxHoKp6k1HKcHJ564xojFqoOl1FXJ'
-    b'UvmLB7njwedXfXjI7hGNNyhyEyTb62DRn9WbO4cSZDnKS5/4p4Yy0+U0vimjB4RIH7ApN0m6'
-    b'ErKEd7sOcHT5OuQR1PsN0NZRZ85asC7aYVLCoNPjW3DTgPLCpfJRDjNXOVHiU5/QNiClSpQO'
-    b'zEJdTAOykOnlLUCEtq4C78k8QDMjvteMAsXOrrfjh6fLy8Dx83MWiTA6H5aKd8n/8WBaXLfb'
-    b'3PGGC+/Xf9zvcOzMUiDNbPT4QjD8m6MLcTqdcPTit8tLF7jSwYbxrUehGaDnCFY841OWIFWU'
-    b'EfIuAKWuxMTPBEPYyglEazdK7KmaGpv3nV1vjtnl1QD6BJkaCd2wxW0iSf8MUloiJuFtMJrM'
-    b'w0rfeb910zkjIFLxFoA8/exQAlb7NdVx757DLAtmQemn0Iv05PnMAu2jwTZOFlaQjE3OR+N+'
-    b'l/90QNvUydScPtLKYC1uuvwt29Y1zvtNaARGkznEVkR3RnUUHMvIsnTZhQVFK2o8G2cEO5dJ'
-    b'grNf7tahuVP2Ew33Lxw14QPwdl3tAxqVF2NkWRFEpv1154RSS84/QwvCglUgAPjO59/6jU++'
-    b'PNTv/vpPlvkJTRYobr8Oml2gWb9D/b1vOvU+t07ktn6D6vt/hmb9FjRZovzgx5CvXkA7YLD6'
-    b'90FDuWfkJ0l14uGzmZIUtH7hMZsukS+u+8K/vRfTpghDUDvYxMD57nte0Z/30z63/eGZmDn0'
-    b'YifhcBf9Tu05QINjJg3DAQyUV6+Cp0Bz2Hjlu7K1FI29EW3pX/95/R4AIytHKBeXJnWRHEDq'
-    b'cNNuZdpCmElfn2QwEw/B5OLGTTlti8PTffKwE6USJUq0B/2nc9g8Og90IufTH/sUEGxtgFhL'
-    b'smkbHgRSDOOp6B5beETjdDziuN+J54bJoMA4pev1y6nOJ5x9ZO317S2yPDOnB6ZnSHcesPKn'
-    b'gWkyen679DpuWzTnI7TRlTk3sZ/Y2FDAxcWlbbF/eA9uW2RFKSdiJgPa1k2bwPeC4r7/ETSQ'
-    b'2BmbFPW/tz6fglAtpTAhvRI4XQ3VL69tGpwPWzC3yPICi5tX6WsgE+oSz5YWRzPizZqByT/6'
-    b'8VlR9MjN6YCDj9Bl4jQfIwkesvh/Xxjrsyv8ALI8RzldKJGjJF+sxk1earI7GxGXm2Zntn41'
-    b'M9jpti1Ou4fUHMzqf2PHR/FRMKrDplf0+59NShTEoEE7CRa0W5pW2S9OMJj4Pw0V9+cK/+/2'
-    b'D2PkblWOkL/4IRfVW59Qfe+bqD7/Nvh8AJ8PqD//FqrvfxOozyhuPkb54U+AyjHSwFI9nXdm'
-    b'E/wsMJrAUkkykeFM5SHModz4bDRFef0VAIT2dEAdlP0UqTXlK2I/OTfVyRV+79GfjWaCX2Xr'
-    b'4CRK+E9hSEnKNIXJNm1kSwpISaRxJzZsTjtwdZKO02wZv7Igyxynxqi9srWYzEPhp0g5mwpt'
-    b'nsfFeaBIkhEPSgPD5WR56WyDucX+4a1Ty0Y3APOApWanR/E/qBM9HjZPaOoKWZb7Hf6ugcj6'
-    b'F6wmTWKr0rE2GzaQhn70IGtCpt69r6pOOB52z3Jegmvk9Anq/ux4PKKuKhARbl+8RJEXz/jE'
-    b'04D0Im7E1XNL0ZNOnLTvYS+7rXHabmTDE9uixQccGUs2RkPdNnVk1zvpxX1RDbAYfAmwyemL'
-    b'9X1INEAf+sJfjIJNMLctqsNBWHH31wZpbgelAbni/bVNQLayosDi6qX6nGUBSRrtCPmQCW4R'
-    b'pRabKVGvN4mvSl6UYpf/6O2XSTVOvTufpckg2VDBbR91WwJ5OUY5nkK8Uh5+ppM20/IO0xke'
-    b'MQjizwMCIfOvZzRZBGX/cXMv9AlESEz1LIQ+NFkMHPePzoqYMpTxmqLGJXUMtpnGFZ/VpOK3'
-    b'CQT63b974Sf8jjAsiQ6GbH6F4uUPg8YLtNs71J/+Gaq/+a+ovvMHqL7/TbS7R9BohuLVD7tw'
-    b'nwT29j0N6ax6Mh22TC6UbSrRzKa3IAX0nA8BGN1+7Hj+tgkFjrQgKHJQ6n5Rs3tEvfaK/tkF'
-    b'8tkq7UK1xSlrpVicFc5pwBCZiTapHoJt57WiM6I47VEfttL/ntL1qVgAGe/K1v6BLGYrZOO5'
-    b'KDLWlEaMgYJCiVharKR0iml6xt/f/308v3DJVszY3b8BN80XICGxsDB92PZrlz5IWYbV7Stk'
-    b'eR7Vufiaa796mNoMc+qOfcdJQHOQZjuE65evQVmGpq5xiIqkoTFKWmvWtJD/gu12g9YnLF5e'
-    b'XomJkfj5JOoYgkxzv1noDFgUZgoNe0ertW3r99F7Fz4OU42xhxVD61H/zFGj0dZ1ZNc7ERM/'
-    b'Gda4RHpbPm2i09405vQ52dDJshzz69uA/AXoepitjPIt+Fk9D7dNKLJ5OcLYU0HDoiASVIoO'
-    b'8pGumRQdNZTuokc+GJQVQcDoDIXugVj9YNuMyhbKqN/1+RDEguVkHsR1/XH2HNVGdjiAWkMN'
-    b'g2MwXKTomJOTUDlZBC3Dab9GUzfqB0rjKTLQkYDW1GdUhw7NKFFMln3znBnZIkg5/QTY0cuJ'
-    b'0j3td/7OhX/9cz/zewDWAn7tXtt4juL1jyK/+gDgFtVnf4HjN38Nxz/5FVTf/3OgqZDffITy'
-    b'9Y+FAgFjv5HZ4pUIpCZc3Ux1JhrStIISMZAojWxsvUTfM7r+infbYzTbezTnI4gyUEax307/'
-    b'AHIv7GuOfu/78hXy2dI7KmVfoGdJMdk4dUykcLOyJqX+2NVZBeJWaFuAOZr4D6i2D1LGpG4i'
-    b'lqnhvcSVGU33QM4ve7U7pZa1yTEagj78ax7aq0e/dtaLyQw3w+hBKKbzYHKzu3uDpqk0vS6P'
-    b'1ojL1gkCxAhFI8+L4NPPBuQazzVs7dBTZPVM0lNiMMNBA6LMuHn5AbIsdxD2bis3FtJQQBVH'
-    b'HQ+n/Z893L0PaNDq4jItP/w8k2QKjhKzmH5MYfUiHURMrojFrm+scugti9QBdX9ombgNhXE0'
-    b'W2B5+1Kg+olCP55POYXxiUlNmAb/T5KWyooCs9WN+/OWsX96cNckz1KlCdmosYXsMBhNVePg'
-    b'zXvycoQiFk3DSp/sZfaiwaT+/QmkUMmLhvS+WVFgPF/5rIw2GApRso8dazfi84XVwOY+nOp0'
-    b'ROPjhsezJUofcdw/OnLLh+JddmaL0zV4fzU5MgffESE4YHcPFeXENzhHtM3ZOsHDewtrmKSv'
-    b'M6OpT8KqdzReRAMvp0Fz2vo3fEac/H6Dzlx/9pe//ns/CNQPMP4jiwtHwXc6W71A8frHkS1f'
-    b'AM0Z7eY92s17oD4hW75A+cFPIF+9jNbxyNgbTw0jmCSvrKPFmPowFTkUsBCBcfBEZzFhxgdL'
-    b'3F7kqxfeiQ6oHz5HE/Y2JefCUS0EgOrhU6+UJxSrW+TjmY31GJN4L+U06CddDFUHSMnBr/dG'
-    b'+4O/XPa7/NX6rl9XhM5HYsNOyL3O48Mbz8e6nxe2NMTkYBkVsVLDSzaNnwlUlJbCmrR2P6Uc'
-    b'TZCPXUfemfjEfg6s/YM5siYV3b3zKogP1cn8Yrj6kR0ERCy1DXGxZ30owDKsYWEbe/3qA+R5'
-    b'7nzfdzs0baugW5IbHl0sLynUOvqw3791CZ1ZlmE6nQ7cm/YYSXqStJT1TM/BbyhGE5d/0LY4'
-    b'bR+hrBr7rYRE10Gi0aBkAiK0dRMsl8fzBWbdOl+y86z5WLJjjhVdxZArwdr6t3tNk8XKN/+M'
-    b'3eN7SAMf+f5IDTTyviHxPU11xNE3p8VoLN8TSXWiBtysyOX0+ZAFk40BnUDOKnh5iSwvQiaB'
-    b'1oNQIoFQq9nESdNTnfZoPAc+mq365jjuA3lgbY5UQ9FZtSebDPw8YhzRO8VoGrj4pqlCuE4A'
-    b'JjklWihROVL47Bq/Dp0XIxRee8WxKDBKskxCerrsCiabWpWV9T8+V9qfL/xE/yHOnnaKR3+g'
-    b'TZYoP/4plB//NGjcd2U0XqD86CdRfvxTwGQRYE0TAk3swSg1bEuiFiVHI7z6Ff9jGmDEPzH6'
-    b'gmJ+iWLpDolq/d4n9em5LHpQvXL/9O67QNsCWYZycQWiYghpM7js3kyDlOyHxT1jUANswIKk'
-    b'QjL8axxdvAAVI3DT4Pz0FhwMRaSdJis1atxdHt990u/wz1dhygalKX9p0bcwfyPuNJkyKB0v'
-    b'FT9eTGZu5QfAcfOI2qvVU9N5ikxXpEGRWzPLAOoLfzEaIy/Ue4yNP1hx3Enh1FfYfy/rwVU6'
-    b'Feq74eWHH4d96e3mSRg5ybWd1AUwaUz8Z/n2zefuX7MMo8lY/Sz1tDKb+tmeklAdaHzycUrd'
-    b'dar+LMtdQl+gL0isdFnxXyQuHIf1triRbqvKR+E6n35xN9GANogJSRUOb9+G3/XnTQrJLKcz'
-    b'5EXRiw1Zcu/JecdyCOAkG8CdQ6fdJnDg49lSoC6UDBnysyM2mvO43vvnoxO+iqFAucQBwHR5'
-    b'5ZE/xvmwgfDhR+rcR5aRFknRX+03FkDkbIGTY4BTAx7D3LMbUKVDJidMaxAIDnD0VIyCiJGb'
-    b'unfw6z4lSlFYEcrTvQBinPfrSNg361Fhw/qebSdugValfh4UDR30H37wwg/+bblG0TdcRBmy'
-    b'i1coXv+I4/JXL5Etb1G8/LpX8r90F550pKSC+tl85wl0IVTdOlKREPEj9LxggtVE2aEAeYHi'
-    b'6kMAhPa8d4WfEO2CcmiRuwe1rQ6oHj6FU7qPUaxuE8EODy2gk/S0Thqj+P5hGgANDGbdiMQc'
-    b'Xb1GXk4AMKrNfUjpI5Iag34/mpKG6XT/mdsIoMwJ+7JCQaiGZLM7PPznwipJkKw1R6UWZ+Ue'
-    b'pq9DMZ5ivHCT+Xm/Rl2dlN983BWqIZ/jucG9usAPT6ag7j1qBx51wPIzGe+xhWcfXhLDvJSK'
-    b'nwIMTFheXaMcuWjl9eMdEoM3Qz+QtA+ReLBtW7zzhb8sSoz9odbf3gMpEfRF3LQFOsawf6Tq'
-    b'n0yRFZ1f/zpBl9gmjAa0TfLrzqdDMLeZLC8cPF436WAQxzdTZFCj6zzp6xk11wboGyKxx9Mg'
-    b'Ytw/3Yt0vj41lAVIwrALUHx/HLfrkEMwWV5INNTUM1GihdAOcCG9lFmcx8mWiNr6KCcz5KW7'
-    b'NysvPOWBlcRYD2RpX9jrF6rjrt/h76zP2xYDywC9v4MlGIwmaVKhaAZraFagLMudCA/kMxLu'
-    b'w39rW1Y6J05v1HD8tDh5YR8oQzlZRD2ohnko8QawFtaMUPfYAeO3f+DCv/65n/kdABuOO0YP'
-    b'X7nvLpHffg3jH/0/MfnJ/weTn/wXGP/4/4Xi9mtAXvbhJtHUHK9XxdDNUHQidG9gWG2SkTxF'
-    b'KhxGD85xZG/3VeOXXwfyHGhqnB8/R9pjyVWVZrcWwr5idZvsCqfFVC5dJr2PgY7qFCZ9kZ51'
-    b'OAUwvvkKsk6Bu9+4FEFEEbc23iXQ0ePd9wF2K1LFdOVVr/IQBdKDKhjkiH1iRaEkcfas7FlV'
-    b'5EH0mkfTOSbLK3/47FEfD4LuMC11xXvsT97d431IdZvMli75Lx4K49hSMqyi44bWcPlLM3Uo'
-    b'oDQk1QZODNS2IAYKf7huHh58mp08VFkX4SHtFAOnwx4PD96nfzbDZDoRUDpxWm7Z9GpQb56G'
-    b'mhFOsqRG00VSMNLGJQ1PSpxLjGfitFuj9quK09WVMMiCioEG5GroYPSX8Jgn5XXBfcGO0Jh8'
-    b'NEY5nXkK6gFNXYvnKfHl6Aqv8VmG275tcdqu0VQnEGWYXtza2hqhAOdkoLCtvzki+jipX2QY'
-    b'jGXFKLJfPqA6HfyzSyZ9QGQNYRzqQ1Odcdz57YAsD0ges7T3jdG2YHWszI5iHohVyCszUmTL'
-    b'aiz9zxvNL1yiJDNO+ycVIhUjGVq10/+wtq5Q++TXLMsxml1En5OlVkG67sjRIMHDgy0RNp/9'
-    b'5a/9zt9j4gcI+C2ZisXBcIAIyGeXKF7/GMqv/jTKr/3PjvefX/kONx6vaHhKeS4OT3GVpEQ/'
-    b'VjZ9KuShL+iWfBG5/Sqy0k1A1d330By2wUozbeII1eNnveDt4oXzxTeU4t1hYedoWH5hCjUg'
-    b'svXiw26O4nXm03mv7D9ufdAOqTAZSieO6E2cn9yKYzaaovShRqJcDVxctjBnY0lZCgpJJlpp'
-    b'PYgaQjvb3qY69xyctWeTiMNINAbbh7ch53y6uuzDa4gSkwxw7IzGCe+uQ7/FZhrpSTnl+OOj'
-    b'c+x5+M3TvfPL0N8rwJB0nTXeNjyeTni8d1PLYrnEeDQ2Hgiy6RvLLVJb9BKewyM8SjMLu/yd'
-    b'S6Kb6jiVLcdrWIP8vG/E2xa7+/dofJ7E9OIqsh004O/kSqevm7TQyvDyT8S/xCinUxeX66f0'
-    b'tqnSdT7dCJKFmkn45LTfOB1L8lYRSgAAIABJREFUlmHhVwb186ZjvuN+hdmOOY5topNtU1Km'
-    b'1/778rL063Zupe+0W6e0STyNczpqu1rSgEGoqyNOvvAX5cTl1EeHC6nPnKydfQtySv6oT4Mk'
-    b'2SmlK6JMmCyuPWIK1Kc9mqZR9B8S9bc+D5vmjNq7u2Z5ifHsymQzteCULcqYkQh2e+CKwcBv'
-    b'fVFd/8LCz8Bv6v3jTMTMEqgokI2XLrq3GMm6HS7yQF0zMklJPM8kAl1M3Q2l54EOhY8d9Lri'
-    b'ol9TcfESmV9Rqe4/Rb2+S6CX+Mw9vf3bMD2Xl6+dOHAQ9R2AwDSAQam3dhBsJVYoZEwupN66'
-    b'E+n0Jj5bND7yMhH06eCgCGqsNg/uGk0XbmVx+PkyFBFqJ58TKiyaNfpTlq3RLH5GvdCts+1t'
-    b'mxrVYT8cpMMpLUIRv7x/ug+FaLa67Dl+RfeQ8AHXhiLRSmL0WXPUBHGgi2igMZEn2tQrm7fr'
-    b'Jxz3O9P+ORmENR7aTfzHI9ZPj77wrzCbz0X7OZhGZN3DCT9KA2unECNXXva8aX0+yfmX4wjc'
-    b'oYOdBEoRn4u7hz6eeX59myjyrfhpkxOP4XsangiH4OIsKzDxq3bnw84d+kxqZjZAZo7oEZao'
-    b'TsuM896Z91CWYXb1ov96SuMk0neXcu1spBeIe8EKF/XbD3lRhqm8qc5OqElDk9wAPBb9S33q'
-    b'43hHs0X42YICsmQ/zCnia9FSkcK+i2rnSItABuHOxCjGvcCvPh9QnbZCq8G68Oj8EQLq0xFN'
-    b'dfD3v8uroLR1ND4rVqR3+oALRNq9j9/8exd+Av3GUH6TSM7Lc7dP7b+gDfG5Q/GOpDpOFuIk'
-    b'gfhp2JL7C86iYLK2LTenoGCtQhJOy2dLN7UDaPZPOD98X4o44s0AYpze/i3QNqC8xOjmK6C8'
-    b'TI4ptjjKuHB0sBWlToZp2CBJPjC2wI09v4mT/qLooodPez+9y1uLLPrAf0lTnQKyUcyWyMcz'
-    b'2f3zF95Etm89UZoDH4wo5PRnrZi17Ar/pFud4hbH7SPQtl/wkrRHuvv//eM96voMEGF+9cLB'
-    b'e9GULke2VNUvtXqM1EZM7xCaFne9sVTu/nzW+b5vN9j6VbWuGU7MZTgt3PEnfD4dsfWCusvL'
-    b'K4wnU8kMWiUtgSQjvwnNa+itAKbk/gVRmOa6mOfBoS2WGRCnYVVxP9i2zqe/qf1KnYP6Kcuk'
-    b'Sj5GbfQJTemEwgnHzynooBCTvCgwv7wO03Dw69fNtn4jpHrwOMGvqcLGQpYXmF+9cGdB0w5u'
-    b'1Qhpso68jrMqrNfDUjgpO2hClpeYLi+DZfZh8xAGjSEQhZQ2K+4Zm7qP4x3PL4JPgBPBqYh1'
-    b'WBU9RXc1Zhg/KHEjRGScf93KcNGHLrX1GefdUxAP6oQyM2WFgfPhKSj6y/EcWV7KQ+MZKjth'
-    b'+FkWCqaETP2Nv3fhf/q5b/wRQJ8ku4NZ5i50y67IB9MOf4Rn3UqC4n7j3OKIewmcOxsPN2vJ'
-    b'iOSNwppgzAlwej31VngqhmGMXnzNR/SecX7z16G4xAEPTIR694T6ya9FTRYorz5UPqcakeFo'
-    b'EyVWudtOhUwGiiSaIQOuhlwFizvP8vIlQBna6oTj3adom0ZcR475SgWiVLuncEAX0yWyokwD'
-    b'2CxPhigKKwleYTuDXuSVhzdAIldN0wyj+SLcO4fHOzRtawScWWlALHwgDptHd13Im/f4uFpS'
-    b'hAwreJsURC639A3fa4NHN+CI8P8L7z53POyx325Cc8eskxCjhiRBYLz4rTrjsHeq95sXLzCb'
-    b'LcRynBWvmmgzSG/OKAOViHYgQ2dBRMGYpfG+5ZSooinR/7ByAtQi9bapcXi8A7ct8nKEmS+8'
-    b'nReDEBobwjnpn9M35CTxnnTFzwA68nIU7HTbqkq0DIkNtfpB/V56f23bpgmK/izPMZ4vQXBu'
-    b'fhYcoVUR2hWSLM5VFfeertNma4wsLzC7eIEsy52j4HatTtZU6axj3OOHoTkfg4/9ZHGJIeyI'
-    b'hjA9hnFO8MCqX+cyqJp4Nbk7e+ISo9lFuMeOu0fhPUeiTyIzTuJ8WDuEkgil91UR2RRMKW3N'
-    b'RpICKfJC60IIn3z6F7/6R3/vwu//+jXoBLxIBUzep98ZxrSh+LN64SwGCEumydKIh6Npe6hA'
-    b'cBzeYXVg0YE7BMNHfx+//ich1Ob8/hM0QXVMQkBS3X2Kevfg+f2XbhWQ05uSI1Vhz6PFq17p'
-    b'VMisTSciIC7AW0ZUL7nDMc29ZoyvXvvo4RbV0ztwfXINWzLfcdK0nJ/eB/i0mC1BZSnCVaSR'
-    b'izxEiHujIWHEK1e3U4FCj+NBLTcJYaSbDlYgP53v7t6ElRm1lyW6Y33oEzP2myeAGVmWYXn9'
-    b'EoQcupdmC5iLNSc8fLhrfoO0fSmrZ8FvRawuO7/+Aw7btSRPdNAI67RH2QEdDwdUngO/ffkK'
-    b'RZmL6Ys5XXfToXzCS8qiKxLqRn4MYLeG2RX+ar8Fssw312wtZyM2YjFqU/hr/3gPZkY5nmBx'
-    b'+1JA6kHlHXthaOqA0iIhgQKGjVHJASLLcixffAAQoWlqN6knolZjdZa0tqf/q2nq3ho3y53o'
-    b'M0n8U4l00M6ESbs5mMCXuKEqTwgXgnTrVnuZcdqvhX++pjM44bH9lfNrbdX54JoYn8onGpch'
-    b'V6mY3iTG4M6L2OGLV3uROu2lEA4m886zoMV595SslWLA8ZK7e/y48/dFgYlHlaFFmEnDwEEs'
-    b'LsAagtBAKZDq175MQf+yhf9XYR5gsQCLxY60VQT7z48GDGrIdnSLuS4VTsCRqCFtDNJtAQXa'
-    b'Jd9TXn6IzHdk9ePnqB4/M5HI42ffQtvBUq9+CMXiyuRByVqvYkNyEj1dlCQUqjz5yMCAkweV'
-    b'kzaUAYyvP0DmldT1fu3SvSh71iGx+//jO0dpuMJ/AcpyZbFrCVRsCht2P5MId/QYJbTdSmQ2'
-    b'mi3D6tTu4S3a8ynhlVMhWsS1+8PqsH4IMOri8haUZ8mgkK6byR9MNGx5S0qQZxmqWOjvxc0L'
-    b'UJahOp9x8HG6VnaB7ZUhDWNOx2PQRtzc3IrD1djKR6IAE1DrQGqmdTZExZYyQjHpE/q6Fcqu'
-    b'0JnCQjbWpiB9O9q2xd5/huVkhsXNSxmBREM3o6K3EivGOJ2Pet2RJkmi5y/Lc/f7lbOdVL2w'
-    b'sf0Qb8GwqEHN+RQCbIrRuPfSUGcqGWdtYj+OFFyJ9+qTxoc5Qnr686mczsOGxvmwU9THM9sg'
-    b'Kt+BwTjv3FRMRBhNFwqlSWZ4cW7EU7OklgzFvGFtTnECJKdGTqPpCnnhhLDn40bu7St0QyCC'
-    b'xGjOB1Re0Z+PJh49SM3KSblScky5DDBwBhHwq/+Qhf9XBiq4E0lkGTLK3G5/lomIWSiuJTkU'
-    b'SWx4wzrVKBGEMMxkVQxpS+xRQaZQtW4SWd2gWLmoy+a4w+mzb0tOz99kx8++7fj9YoTJBz8C'
-    b'yorIBCeGpFh0hpxIe0gebN0xzUqFqsWybFAEquOlEAlLLp7Xr97Uh423nrQ2QaGc+IDD20/c'
-    b'A5kXKFfXLrRiEB5U3ijcP0gyRIR0ppI8VIjThqfrAcOt527f8eIi7PLvH9+j8oW/WyVN7w3l'
-    b'b+1fdOc+lpclxstVSmvqIh7WhSyvfqPpVVU6Xnhh6/71MPf1y1cOTm1q7Hfb6Ddx0kSbsRTR'
-    b'gbLfbcO9c3F5ZUZg8eCzDvU8Upqwrc1HlE1s93K6SNe2rrF7fB/RfUb6YQyvk6bo5DPcTcST'
-    b'5QoXrz9Oo3wNroVjQZfePiJKrw6nHLH88Fyw1XR56WgGbrF9/1bd6xzOErnqrDpD6u5jxmHz'
-    b'GLZORtOF80KILtzQ8kz4TIw9fjwTh5FYiBoK3rwoQ3RtddxFVEhf3EmENiFh37umZv905xC3'
-    b'vEA5nUNvrgxN1L1IN3XC5GjKJ2VGw+pMj1e+5XIOu9wAr0upTnuc9xtFX0ZIaZzpwoTzcYv6'
-    b'7Oi10XiBcjzvG1ximPtuLA2XnnPRpi+q1T9o4X/6uW/cAfhtifmQcsOTRSDmVSzJQ8zzMKds'
-    b'qVi7iqc/kragKVjN+m/Q2qIEk42bkGKE8asfDoE9p8++jXa/Fl92evPXON+5mON8tkKxvI0g'
-    b'H23KAZGOQfrQEc+ArO40wGnF/vxk7m1zIp4pZnPk4yie93QYdt1To8Pp4XMHU5UTjFeO0xsu'
-    b'b3YTxgbfzSbbwyp/gdP1MXWrj5eXmKwc4nLaPkUTv5rwSQlSY46agH2wQp1gPJnD3olPH7u4'
-    b'EPZxv6lZiIDLIekBSofG8HtvXva2vYfdzgfsUAKjprKm6Pf5ovlwfx8K/3J1Ie1mLS+J54KS'
-    b'TKdHSpwMycAP8vHUe9k3ODy+E8cnJTMPD9xsck3WRaduPf2zRFGWkvZSWqFuD1ymK/JgLkQA'
-    b'qK1rkoT8sZuGCweDbx/fqWtFkcOu5fKYUpyn7TpoBaYXV5HzW4Yk+4MGbBf07jeQ7sAbn63Q'
-    b'Hka3Xl6UKEfdqtsB5/1GXkEmG1lRr646HXH0m0N5OcZoPE/tk825UMOKQ1scnNDLZGTdJzsO'
-    b'XdDZeIbx3OkOmuqE0+5RCkMVABg3p+f9k7d1B0ofzEO6VkJ7G7CEY7QI3kCLCfzbn/75r9z9'
-    b'Q078YMIvx1MpLFEEqSQpjjp2dafpm4w1z0G60+sT9XjoQFI3Pj1bkdTPyLJwwScf/YTg+auH'
-    b'z4TOYv+3/w2NbwZGtx+jWN7YXSlHnJH28RFcbvzgUZoxrhKJekSF5RSpp3CWMGQI6znuUG0f'
-    b'7NA/kpAVc4vKu1UVsxXGV6/d5Qo59ZwsGopcaH6mN2XrSIjXLJWoSnltu8/MTT/zaxfGct5v'
-    b'/b4sex2C/jZKVwsBnA97nLx5z3g691ak9Pz9k1igsog+07G8xkduXwz1R9evPgy2vftOcxL7'
-    b'asS3DCsRXBxRAMLduzdgr2OYL5eIpXOsFKUBxBwOBzcEjGm3w6rJYTjHxSzEna79dGUkk5HV'
-    b'1NgXktsW1dFNVt0OvRCbxTwMQ+PcEfOsXwIZMYvGvazcJrO8CDD47v5dQhLFXKW229VKEm4Z'
-    b'593Grz8C09V10LWQIjAH71keCnBK+7m4YFOgafzpH2HZVJZ+OndQ/2F9P3Ab03OCHrT1EWe/'
-    b'OTSaLjCaLSIBt1px5lgzxkKHQTFpRfwsujEc5MdqTZ6dIHXqLKDbpsJh/S40gMKBTzskNjXO'
-    b'+0e/gpljFDxQoKyHOeL1depfbOBDYnVbNgT0y1+2nn/pwk/AL6XQmpmtJrsYtjIZSQfK9gIZ'
-    b'reAPiv1oe50sLYDiwJMP2nBbYlkAuq8Y3X4VxcUrPx2vsfvr/wo+7QEGqofPcfjOHzvOOy8w'
-    b'fvV1ZN2+KXOaeEfyUdYbNTQQH8tKeCaKKjMMU3HzmY+vz+jyBQBCczrg/PReiQhJt6sg3yQ0'
-    b'3hSnXFwgH88S9SlT6jQm+iqysgMNjp+UWQ8b44Zp3MaYX/vPq6784UhOnKf8Q4g4meQZwH59'
-    b'j6NflZosVsjyPBWmDTXFLA9IqXlko0+wAHZ5nRhOzEUA5osVMp/stlv3YSgxTaEV1zCoorZp'
-    b'QkBPUZaYzxYgg2vUb47NYUpNJbAgCxYbLB1an1GGohy7oB5mHNcPMixHG2bgmUYpEsC1zMHO'
-    b'drxYGu+GU1W/dY6RblTYdFyUB0qaGJeXRcis3z+8B7d1AiJQf2MmK+6xxTMAnA5btHXt1k2v'
-    b'X/Q/I8sS+mGQD4+95VgilFZSIJlUaX9u5fkI0+UVAEJ9PmK/vvMeKW167ePgKpUJXp+rYLU8'
-    b'mi1RRFn1rGk5bSutsxUCKqM3VVgV0ehaMw+jCP6fR9NVcPA7bO56PIrjc1p6t1TVCefDOiAZ'
-    b'49llP7IxzGFN6nt1djlLsycWmoRf+gcv/E8/+40/BPAtabKSRIuFwqc5fRJ380CgIOnenjz/'
-    b'pneV2eCGU8sKJtXaakc5YlMXkI1nmH71pwPcf/ibP8Tp3ScAAbu/+n2c33uYf7rE+MXXkVEW'
-    b'3dTqtUUcq/YvHxqk0qGf7HhrHhpDOYGTAcb09qtAloGbCueHz9G2tVIpq5uKgPP6DuxXbIrZ'
-    b'BagcpRbGAxHZUt9DCTxFFm0o+MEkVitp4rufNb1yugxuGrT+gKWceoRIXDwS0x3BhfME856L'
-    b'a+R5IeRSMnZHZdQFS1dOmxkhqGJzJVoPknGbx+SEYl386vrxIYjzxEnBOq+cZCgVA1V9xt17'
-    b'58A4mUwwnoyT1oZV4500TsDzUb0JDdJDZRxNnOVs4VCMKNmNmFRTS/JZofTTiJvpw+NdKPzT'
-    b'5cVAl5b02Ol9a07fBp0oUDdOmossL9zkCuC4eULjrYQpim/l5PSi5HEm71FyPvQ+9oub14Je'
-    b'6SZqijBjGnjtkmYnE4kiC5CnFB7IigKzy5dOy9A0zkeDFI1mNhHCXhXN+RBW+UazZRQ4hsQD'
-    b'm9XKo1wEirdr4o0gFZwVoT3dFjYLmSt6mtn/22i6CkY+5/3aC/Y4+d3xM1Md1qhOe99sz1BO'
-    b'Fqq4cxByJrHalCLpvSBIryLwtz7983//h//ghd+fKb8oHjntqMdxI5emvfVwiC3+C2KW+CZh'
-    b'tjLdTKiNmHqhjmo4xIHVhcYwmSIkAjD5yo8j97ubze4B22/+/1j/t9/C/q9+P6TUja4/RHn1'
-    b'gUp+ogFdgXxomNhYdpKTe4hdtSIaYuvKpAUy3KNAGL/4uA9HWb8HV5WACXVGPdiH8/gd/nJ5'
-    b'5Vd3oi6OKT08TTickwGerbfD3VNoeLP7hytJfWUKtr1tW+PwcOd5cCfcipExHkCjDk8PAUZd'
-    b'XHfmPTZLakr4hIW2gX8QpyYyz6AHsdiIsiz49a8f7hRqpocnkvv8EWzc1DUe771P/3SO6Wym'
-    b'0AJK3MZTsRRg22UzLGUhR65qndOeg/onwef91K0okqRKZLpjf+ZoppjJKfrXbz6NoPDL5PNx'
-    b'VIKCURX8LbYg4iKlO3NxIqs8gi7ljjIXpAPgtNugOh2jJpjMTIDwHKpwybZtAr9P5NZNk0GI'
-    b'WSAnWoDLZLt6xhIHgQAq7xYYpntZ5oyE8qIU8bxsFENr3br7faf9JqzyjadLt2MfQ+mC+jXV'
-    b'LJYVaOTIx1AHK8KKqKCnWehz4j2B0XQZ9vnr6ujW+jBgs+z/4bh9QNsZ90zmyIux95qLkTSK'
-    b'DOLI1jYwMLy6AwD4xb9LLf87FX4m/ILuAofFXborjvghggmjcvSQ8TONOg/wiqwQCIp2JIUa'
-    b'nG2Tkw5SZwCjl1/H5MMfcz+3qbH7q9/Dw+/+K5ze/a3ntiaYfvxTKHxADCEzr0hIjmIrbpbM'
-    b'aMU0SEZO7zRw/UBWXGN/s09uP0LujVOqjbshk/347mD199jh7XddJ04ZxpcvnRcAWWXgmQGL'
-    b'pc83D6ahPGcE2JPVlh4xcJ4t4+nNd90hEk0EcQMY1qSiw3H3eIemrkBZjosXH7owKss73SDo'
-    b'E3GW5drHRt1AfEjrpPv+teVFjsnMfW6bxwcc/VRL8fey3ndO4eumbrB+cgfzfLnEfDZX/Gk0'
-    b'EQ5x2eKWItUEcroOF2dBRCBOMZr0avDDRrmuEaAtazn1ktc2/Ou3n6GpziCi3rxHFQKOVZTE'
-    b'xvMSf6oyxjnF4Tk6rBVkA0JRjjC/vA0akiZaM+WBprITO3OELVGWoanrsBKY5QXGq8uEyWS9'
-    b'BkzSAjs9VOS2hRbipX4g1onMKCdTr2Vgt27IkQaIORKupuc2k1vp3D+9A7cNKMswXlz2RFk3'
-    b'PBosErSuiA34MNpMILaa+HhCk8EwrC5wXoww8jqptqmwf3yjEEwOiK/b3z/juL33KE0WxIGJ'
-    b'n0mXEsswaiMZcy4LatF/9S/8oxX+p5/9xq8z8DZ25EvSgVXnmyy9UAqXio+BKDkGKU01TzpH'
-    b'ta8S3dAp9N+DiapwUV+VstEE06/9M2Rehcn1Ge1xG/bZy4uXmH78PyHLi6jBSD8jNq3tOG0E'
-    b'ovUXqJUSDbyFA5S1az890zERyuUViq5j3T6gOWwS9I6JvRFTH8cLbpGPJhhfvvK8bHyAsC1W'
-    b'U6vTKctDsLdspeMjG1SH1SyMZgsU5QTMLTZvv++aFSOkh00lCmH3eAfmFlme4/L1RyEv3vxt'
-    b'4dDkxFxE+x6ytajCA00NoGdZB/VThunc3Yfb9SPW9+99gSCDB6dQQPRZUTc1Nl4jcHF5hel8'
-    b'Bm0cEExjONW+UTDUst4vUvOb1Cw1XKu8GKH0u/zV8eAnoPhZ4TCRdSgKD/D9nV3v5u6Na97y'
-    b'3Pnks8miRfdCmp/BxmeebtVwkhEg/mt3xhUFFjcvPId9QuV9P7RddwqZQrqbAmiqY1hVzMtR'
-    b'H1krLj8n3Qmp20ssEmv3TC2KJoXixrRd1NAV5SSCwDdgNPLqWd4skStjXflVPgB5XmI8WyJZ'
-    b'a1Zrb0RG0gFxcOMjXcC5X9skM4aPB+IpnKFa65G38WwF8mfD/ultn5bJfdPKrX9f5yPOe9+s'
-    b'FSNMFreqNpp3pmq8OdWMUSKpffv9P/v3v/6PVvj9X/+uT0/TdgOc4JaKaVQcu91I8jNTRt8+'
-    b'ssxaV0zygFlfHwJJbILkcRb15IMfxfTjf9pnzwcNwByLH/vfUF59GA04nMpkdVMBKbgS4Ly2'
-    b'Y+aUA0pz1tMHiemZLU9yxR8A6sMatU/CErcfOyet7iZLFP2suTpKC4AJ+5P8WmMS1+R9F1VK'
-    b'AyK7+O+jxSqoi3d3b8BNM8w7Bzvh3la32yHOixLXH34NlGeaPJHjHrPROg5snJCpaJFQpOgf'
-    b'WDYJlAX3vv12g83TQ3TyaeEj2/wsnLhvv3dw8c3NLWbzZSLcI9YGIhH3KD5HilTJjOc6M9YV'
-    b'BADluVdJuwCT4EYphgIyFf1klTlunWtf0yAvR5hf3aZ9MCkoV8G+mqCVaW62Ir133IuiWTv+'
-    b'm3LMr184L/umDquGpDRG1vmoqZPz4YCDn/hH07kLeTE0VjSkszHS3FjTewptFehyZJ2sjYfy'
-    b'0ShEEJ/2m2DIpM8pjqka7s/A6rgPqXz5aIzx4iJKvuwzGkSWyxAQQXrZhgZLCScYW/+6SNCB'
-    b'PTI0ml8Giup82OC0fxT+FcG1FoTT7j6khRbjGcbTVbrSwQkpiKFdTGGJL4/Kf/d3LeI/SOH/'
-    b't7CKkHWBBTJAIB1LaYRbPB89BqWalpl1NHjkQWQCsFryJ0MwxACK1S1mP/y/olzd9h1ulmP8'
-    b'wY9g+k/+uTPESWyM2eAEGVYeF5mLqfYVTXLDmNKAdzJ2cWUIOEYXLwEQ2tMB56d3tlqa+sJT'
-    b'dTGZiysUkcd07PTFNlaaTMNMw6tGgjtWiLlpcaF+1Hi6CCY+h/V9EAqlflGsipr7iv3jnYeg'
-    b'x5hf3th8FnUWmayGfx3Lmx7CpNU6RjNKkf6EfHEEAUVe4OLaTQvH/Q7bp0cA7BTekL+bYtFS'
-    b'V/B9dkFTNzh7nvnFq1fILCc70i6Tqdo4Vco/r/azEvCyvAjBJ3V1xnm/E+gWQa5JPUsnNc4u'
-    b'fHf/DsyMYjQJUL9GI6X6Ik0NTQXLLDzzKRhlxYoPEtoc9qY7WZ5junT79swtDk/3chZXK3Nk'
-    b'DlRd4d+GgJ7J6tLlSLA09uLBkB7D+yS2T6dhbAMJmshJm+JiZleettlh//jumf6fE61MddoH'
-    b'/cJ4tsJosggUFOl0QB4QWw6dQKqfYzFZGZJptfZIXlPRTeiTxXWA+5vqiMP6XaRnadGt/oFb'
-    b'HNbvg334eHqBzEdgC2lxdL5RvApsBpuRMIuKJLD/9h+98D/97Dd+AcCDqD3xtGxYpBKTwZlY'
-    b'rmhswKsEbfaSBOGQgvUHPFN5ACsSlpsKKRh/8COY//j/gfEHP4ry5iNMv/pTWP74/45yeYO0'
-    b'JHUOWXqv1pjUY52BUJVKt6svYM/VOKkdnijh4ScvvwrKC3Db4Hj/aRAqRsoZdLvb+8/+CrX3'
-    b'KxhfvgCNRrBGCuKhTQMIBILs8Tf9V2YxSRLsKID46o4XF+GwP++3aJrarbBxI1Eg1k2ne8E7'
-    b'DzWOJjO3HmVixFFksEn3k2iCWE1ebNkAUTqHBOGUv3Z5mePm1QcgIlTnE3Y+XQ9G1gJHE1V3'
-    b'f2U+pKaqz6hrh4S8/vArEoxRO+jW6jon6xGsxLSSj+xXE42tGiKUs3ngSw+Pd9AC1QQB0YdG'
-    b'6HbcP+6fvF3veIzFtbLrBVIXPyb7mVHNssBqmBKPjdSvgaO97UVQ5W/v3jw74bNwvpRFqzkd'
-    b'UPl1t/nl7QANBfPpJ+PPh3hvqaMb8OJWTWxejjBZXgIgNHWF/eN7WHMsKxqjG9Wqwy4k100W'
-    b'/URtf180LAf+nwI1T2wLoAWKqFCcmE4kY86M33JRToLXfts0ODy9Q+trX4xCVKcdjht3plBW'
-    b'YNJ5vaTAJiyr355u44Qn7FE5BggP3/vTX/6Ff/TC73/9v4Hwkabh7l+Z+sTrTDQkUbQcupKd'
-    b'Z4prqJKI8zCXEzf2bEXmyl9ezC+x/Kn/Gxf//P/F6p/9C1z8L/8fpl/3037yDshwgYKKgO1H'
-    b'ZiFC1QKhpEeRIcMibCaqRGKiYbkPQARMXnw1CPzOd5+FvAEKey39O9p9+lfhv48uXiArRqbD'
-    b'lY7XFOtfurHuGsS0yY56DxKNESPyRyCJdlDUFM6uXnnOeO92pmNREIagcUJ1OuDg+dPxfBk5'
-    b'otm9lpkLHigbvcc40PikQLg4X+VjRbh99aGDjNsWWw+ltnFTJ5gm+efd87Jdr4Po8eXrD0QD'
-    b'k9iHsuEq2e0R02BpSJTflkEU+6am46m5abC7fwsrrMRGh1hcX4ZLTesMmMrpHPOrWzuVzXAq'
-    b'JPMDZvszjimPWHiod8vZ0YnFaOzNoID1u89lA6F0UnqLlaPh6Xzco6lOABEWtx+kNhcU8cbi'
-    b'2ZIPGg007Gyq0xX5b4Tddyl909W1W+lTuQTWA6TPzPNh66g5Ii/ssyVb4nHqqCHieOHHwKOG'
-    b'YocVShc/d4zkHgm0XEaYXb52ZyHcPv95v3ahRX6TAwyctvfO0x9AMZpiunwZNSxxLLwUPkO5'
-    b'R+v1Tk7HzX/zg9TwH6j6qM/gAAAgAElEQVTwE/CvIQI1OOErBTSo7XOTPW3pqWx92MSUwHFk'
-    b'DGSkcBAbBDLSkCieNHve0PHbF5i8/hFMP/6nmLz6IeTlJPx3y1s8udUpFaGIR1LHF2s9hAom'
-    b'jztTQpzgZLv4xT7Sk5dfReFhudPTWzTe6Uymojnk4vDmb8BtDcpLTG+/AspLNQXylwQl+ust'
-    b'/BwMn3ca8OamdF0jmU86976mOqE67D2XnKn3xwn1s3u4C8Kp6fLCr/IpZElB+AQyTwdOAlCU'
-    b'UkCJFntomyxlaHjN169eB6X0frtB27ZqfS+uV0Y0KDPefObjmIlwdXWT0lR2SnQihCRODXZk'
-    b'Y0/PQP39tes0GW3TYP/0PrlvaJjGTWgfblscPRIyni8wWazSn0XDeRQpJJgig5IWlI6bav4J'
-    b'93IxGgf3vs27T1VjRgnK0pt0Rqp6clB/Fxm9vH0t1t261Tzm1A+ChwYqBaNRMv73B2iSHBg1'
-    b'Rk6CQpgur7y7JOO0W9tmYtzTWN2PaJoKx+1jpHxfwSb3IgtjseZJhspGuSNEK4C9foaGGFYD'
-    b'J+FAE4KByeKq9+0/bnF4euNR2sxTaw12j5+HNb7x/NJ5E6ifzzxAS2j/X1JGa/Kl/ev/YYX/'
-    b'8We/8YtgvDXH6JTUCROhvXKhni1OH2wy/LJB6iOOlNaa4bIYcx3ox5HSLNl/BUCTubPmzUvP'
-    b'4TXGuZ+KuyhxKJQkGxmFhb9I+6AcEPs8iHSDoPsKZpfZnZVjlCsHO1Xbe1TbR4CBlls1GQOH'
-    b'999zUPNk7mJ9wYNxtLbMg1O4D0jWLsXVIS9giUVAek0pztqIruf0ygup6hqbd5+G95ziClKb'
-    b'sH14j7NvgJY3r5DleepPQZLOST4vihAfwU3TILzPA9E4Or4ZAC6uXgQKYvN4D7dAmsnDTw2s'
-    b'enL79HvfRdu2yPMcF5cX/rWTVavFA0nG+mJYOSSVnmdMUzxAa5TTuQt84ha7+/fpM0EDkDRJ'
-    b'FjzLM2dws+99+vXFTu5bovTUt4ql1qlAi/6i/XiOCrnPsygnM/d6AGzv3uC4Xftf1OCZB0ec'
-    b'I23d4LTd+gCbHKtXX5EXSOy2szKSiSFWfn4Vm2ONk1xTSyZ+lmt0LqXP+zLsnyJUhGx61x/6'
-    b'zfkUbH6zvHArbyS3DUibWyhr6fQMlyl9HSIsljc1JT0w5rMRK19Ol5itXgaaavPuu0HEBzAO'
-    b'63fYPXzmB48C88sPQlMAGhgODUSQlX4LiuoA6O33/vSXfvF/WOH3f/0rEwplNkU1jC+yPJVc'
-    b'UOqDBesTflZoxIZSV6Jx9Cw3FoRu3Lgo2iwPQh1745xSTpB4SHYCkeVsPBRhviAVJcnx4ceG'
-    b'aQwNP9wAxjcfOj7uuMfh7XfAaEXhBYC2OuHsp7DR8hr5/AqJb7sp/40HfTK4VHmNUoU+iUS0'
-    b'fgWny86kQXBhdnnrUuzaBg+ffgetV/ZTMmtKVPfwdIf6fARlGS5efgVZVgiXORGfp1GuYEyj'
-    b'uWiGVsXFokIie3JFLNCLHvj5xYULfIFz7wMz8rLoXcgYCbRN/529Nw22LL2uAte69755nnIe'
-    b'akhVlUpDySUZy/JIG7CIHswPmo6O6L/gCQIiiAAcBAQBwWAIAgiHA2xsDbYFdhs32G2bPxgZ'
-    b'2ZZtWZZUlkolqVRzji8z38t883Tv7h/n3HP29N10g6SqspUOq6oyX75377nnfHvvtdZeS/Hp'
-    b'BHHz+lUMBgOMjY1jemYORsg5CrgJ3Kx71C0TUNDVOK6VHYxNzrQWqPc3YGO57aEhLHAt9c89'
-    b'2t9tmrdJ49qX7ADKCNjXgcNZnkVbiKTd3dYP8nAtmMTY5CSm6wCpvfsbDR1RrYGJZ/ijDxKB'
-    b'weC4WXfr9MYwt3I6KEJEPCaIZiNIF2vT/oqkk3IwTh5Sb8HCsf2a3vh0Y098tLuNw537yDVb'
-    b'9vk4Otir3P5Qh2PNzAdE0Lu3Bm1WJmvMhPHuhrXXm6lMVbssNsFEnS5mls/VcD+wv30Xe/du'
-    b'YSDVCt/O3ddwUrv1jU3MYGphLT+VH0BpNSCL2wBT9/1/+O8t3v8DhV9+XjJoglrg4hWxEebK'
-    b'JgHKA4iGtLAxiMDo+SpJ7hwxkg9oPWdT5AcDiPQhUv2TImCnA7IbNaWpqj9OxtLAXhLBJbE3'
-    b'qogvX/pWp1HPlzILyW5zbadOPQT2xio74psvYnB8VL/XdgrZu/EC+vsVdDq+dBrdiUmvMXEw'
-    b'rgQgQHOf7SEjgWeEa4JUEHc4yOgsI/TdMDW/VDkTiuD+9ZcqRa2DkiQQ6YK9+xsYnJyg0+1h'
-    b'8fQ5dDrdujBzJINRQlCH3usI16r987YvyL3yRSlNBcD4xCTG689g+94Gjo8OW1VvJohVh8Vw'
-    b'X/vm9evV5zkxUbn26YPPG0glOcHiuVIihwk44pmlLhaTDQx+sLUJfUPY9Dr/3Ov4zeq4vn/z'
-    b'Go73a/HbwnL8kJJddyapLSJuu4eSWNXaiVCSw7pTozNjkzOYXam0J4e729XqIqCa7bbZYGF4'
-    b'6B8ft1snYxMNHC4OIvJIJT3i5EWXymeFyQ1tqAQmAlx1acYmhq8LODoYKvszh0JtxUucHOy3'
-    b'iv6ZBUzWvv9G8yR52A6Te6tBIsRVGSYJaup7DkW/jQeDm/ipzM0EwNT8ikrrO8Dd157Fxmuf'
-    b'w91XP4ftO69VdYPE1PwaxiZnW6N7iRlxLA1pjNkzLsHx57/mhf/eh//yr4PyPLwwQVySUibz'
-    b'hRPMSrQC1Vx9iI6lpFOFOHjEu6rTPxzU8L40D73mu8hOZdgQOF3fXajpltpHPIPJEKgKEsU4'
-    b'UILmWwhi8FTbtebZNvpaTa5dbAR+B3euon+wY4sWgO2XP1uvxBGTy2ebAzp+jgyrJ5KMDYKC'
-    b'6RaTadygGn5yi8r44ec/Ob/U8MZb69fRPz4OT5F3QCSJ7Vpt3e2NYeH0xWaHv6gPcW+EIiPW'
-    b'2FkcNL0HwJDXkoTu6vV6mKpV8Nv3N3GwvxsAF3+o0XFlw4CemdnZtvCb1Mgke0F5lXu3w5ib'
-    b'N2q6Fq+wwdj0TOPed7i7FV6/nmJt/VXrT6yU5PdvXUf/uOJUp5dWYuM/LDout54FV7QGcJG4'
-    b'IitelOVRl+aHC3oTk5hdPdMU8OEuv72daH+gPuulLvz1xD82OdVQPtTaEBNtnltKh5mi4C0W'
-    b'HizHSYtCJYcmUp3eRGOb3T8+wu7mbcTVP3E271Jl1R9XoVrTCyuNTiDDSP30K0gg8KLZoA2L'
-    b'Ck0h7WEqaXPYknfjk3OYXbnQQPgHO5vYWn8J23dfxclRNe13xyYxu3QORCdZzfZnhrgUWkQC'
-    b'wJrbPf/as//511+HiR+A8Of0q2dymJubUBAhtWzUdf8dXO2HPtMGInUKd2bAtzIJkQi9U7vQ'
-    b'6YeCrIRVROXoZvKv1cfJLMKUrVlRqa2Da1JoVVdC91ul0iFivhMl/9rJ1fPo1WKTo/u3cXRv'
-    b'vfEWHxaJnVe/AMgA7I1hYvks0B3Lx930eUsEbcy9DSW7JpTEWEVx8/5+qv85MTuPqfna6Gbz'
-    b'drPLj1iaTBe9vbFeT6ATmGn2v31Klv/EKgqGWmdhRseYXa6dK/VwzVHwwTAPfGwcM/MVhL2z'
-    b'dR+721vmGAkPmVlRrl7lvdrnf3FpGVO14Uo4XqTsLgxP4SjEyq5qMm4EuImZNcffq1GMip9P'
-    b'fPBE6UJcsdXo+tb6dfRPjtDpdjG7cioLLQyPlvhqzSjcQ5kVMHHR8VGr3ku318P04kr9XgYN'
-    b'n012Ckp6u05HAscHuzioNzkmZuZUcYq76GlIWWSOchcwr4tQgwclCVxTL7g7PoaZxbVKszEY'
-    b'1GJNhjOuamwHjS/+/vZGlVVPYnJuqfl9QzP40LMEWJICo6trgg6+ssLdkh1xjvcN/3Rm8TTG'
-    b'p4Yi0gEO97aahEGAmJ5fw8TMcvIMiEVUjBJdNQWq8ZKoWfm5/5HS/T9W+IGfDZGIIikJbDeN'
-    b'WDD9YCxTzZ5mkNbCeDsocYsfrq1IItlJ8SeDe60ISmB3OFK//1hkmFY4S02EFDkk8baGrqNu'
-    b'K5IJGXHrYuhBNDaB8aVqCjnZ38He9S8D/X7z8w7v3cLhZrV61Juaw8RyLU5hRMnCqSX2QDXF'
-    b'XqLpE0v2ipJNx2oalnhmjU/NYXpptZkgT44Oyt7/6jDZ3ahMOMYnpzFRp6kF5NxNjcRwZ75E'
-    b'60i0KVaIERXbICUPCnVdu8rEZ393B/t7u4jBv7De+M0jJOgPBs3+/8raqSr0h9of3Omm/Dai'
-    b'tmwNqn5Jn3eUVMs12jU2OY2xidq2d38Pg/4JjHum9xKQZJalYCAD7Nyp3BrZ6WJ2ea1wiGdc'
-    b'sXtm3A0p2iYF7faPZFbU+javr0u16rbYfL/duvlitxczZbwfSf1N97fu4Wi/QgqmFpZDQWvu'
-    b'KY2+NGif+H7Uvv/Cea21DKJsmtPnSarBaGbpVOPZv791N8KN2i2VlVXv/v27TeLg5NyycwlU'
-    b'FGGS7i54QL2W7LROzg7KSEqo5BM+NbdSTf1D34/awAcAuuOTmFu9jN7EdKT6hgJEsR6U0qDP'
-    b'tCgEGYynIPjZ163w3/vwDz4rwMd0xy8FkbfNeC4BolFTm7ouSoK6q1U80k4WvoMNdEJp8qxv'
-    b'1uHKXJt7rZiN7NzPMPtC19dwsIyGO+bbuZGfkuGUTpjEpOWvL8LsxbdWyMWgj53XvoDjve3m'
-    b'p++88vmG359YOVt59Idup6Bi8DG8ITVMFG4rBedA5NdsxAbB8JEYrvSdHB3gcG+7Ua3n9ySx'
-    b'd+9OM/FPzi02WojkhMzumLRdzW1TLF0hhBHm5eaH7cHe7XWxWBe0g71d7O3stBWGuekVFcp1'
-    b'fHSI/b0Kglw7dRqdDo2WolXlM9/sE3MOFc7ERM8ikjyrQx6819r2Hh3Ukbo21Ef86mvys6Q/'
-    b'wM7Gndq1bwKzq6cd9O3bsWxyRa6RYWIQrVZnqdk9UdSAel7Hp2cbEePO3ZsF6a0N6NBi8+OD'
-    b'vSp1kMTM0lrpZrHqqQSZC1RJ+Kxctj3j1zWfRiLEGpuaQW98mLh4HydHB0CpgEqVX7B//26j'
-    b'95ieX6l+SqfjhPssBnp5YZ8kB7LP+ygbUxVOUhZqT7eH2ZXzmJxdqelg1CjPBGYXz2JybtnQ'
-    b'E+IedP/zi76e4R7lx64++6vPvp4TPwD8u6SncgMLE04LQVwhegrU8FVYbXP71WYVj8bC0ufJ'
-    b'jLqgMf/RTf2SH3oSIOGwRB0m9YQqTjhT1ShJa68mWZhGMtU0xjcJlzV9/rGW519/BUcblfBL'
-    b'jo+x/fLnMBjypacuozs5XQ7hQW7TTj/h0kF+Q74ve5yNmGgYVWrz7NOjT4jppVPNSt/u3XVz'
-    b'1FOJ+6pMe8HW7RuNlerM4kq1Guaam7bBE8txljuQUCjEw3kS+eT2JlVRvurPVs5U7n0nJ8c4'
-    b'2N8d0WgGPBo7W1s4OqzS4U6dPYdufVCJ3nVWO/oU9WA6t7dssyJkLbDl4D1ECgD9YdhVrQQf'
-    b'9E9qVb7XOBClve727Bi04reJScydOlOgndz5JAlPnOm6fR+T+qt7dUX73SZm5tCrtQzbd27W'
-    b'JkqSFGN9P0ijNdrfvof+yTE6nS4WTl2wXbY626jX4LTHh785PR3E/H2P3P0Thr86NjHV2DAf'
-    b'7e/ioKY1/Kk0/J2Tw9ajf3JuCZPzSyZATRBTmbO1EaNFtYtEZU9/rY4vzRP0n4s3XqvEe8sX'
-    b'nsT0wul6s2EWc6uXsHT+cYxNzDbXm1msLh1kJFltintrUtfc17XwE/gIgGMvnqOeOEtiXyOy'
-    b'UoYWtJ1XFuAr/jGVXCdg8qq9Ze8fqtOnyXuQujHJ/RSS1x9W17Ioz8iY0x1dZj+3aZQkCsY8'
-    b'z6FXylRrO7l2qeLuARxtb2Drhc8ABA7uXsXu1S9WMOX4JGYuPl7v5zqnK6rYTI6afaVx4Wsb'
-    b'O1HTapFKU4EXiEH15kBphWwzS6cq5nnQx/2br6I/5PnFKmqHDnbbG7dwWO9/L5292Kzo2O0x'
-    b'if24qDmCPh/B7f4WXMjiNoYbMVwNXztzHiQrq9DdnTwV0VyV9nveuXMb/f4JSOJsbdeb7RMn'
-    b'ypdQtIVxl8Z6QEiew+EpKALjjW3vSb0CVkhtHEG7igywVzdv41MzmJ5bBjIFhFdFq0jU5v1L'
-    b'RGLoUAum0XD6PGgnGakn/vGaQtrduI3jgwP43XBJOunKkbBfNaZS0Qbzp84Zwlv0mSNixH7i'
-    b'9TRim+eEHUzvhtDLkmnq9Nj4JKaGHiGHe9i9d9sVZjb6hirCd6tJLJyaW2qao1ZIKJEpSJHU'
-    b'2MBQ/30CiTmKe5tikN9WiuOCAsy5VX0m04tnML92CdOLZzCzdAazKxcxMbNkHyEv4SfLbyFk'
-    b'SyhUgDgG8ZHXvfBvfugHdwD8TNYgapFGnGxL3KsUWH//kT8oAc3H7SYnSUohBPd124WJBOtL'
-    b'iabs8WeJHuhYaGdyfpeJEUyAq+jeamo+1R7Q3fEJzFx8ooH7t1/5HLZf/jzuPffbTSLfxOJp'
-    b'TJ1+2EDAhW4r2qEa+DATBxRdHRoREDNQNMkm0vfVzMqpKtwGwP0br2DQHwQzHH1hdjZuY9A/'
-    b'ATtdLJy+gG498T/YCl1TRDmc7LPezR6/+gqagqS+Ay3BsHLmXGWLKoLdrft1+E5GPNi7SQjc'
-    b'vXUT/dq1b3X1dFYWy1Nv/qjlOcOJLsPrZqjWzYYOaIN+H3ubdzLGwvVSicS138dhLXYcn5rG'
-    b'5OJiHmP+AMeCocCXLfeWNBnKThoxpKk1iml/TczMNTz/3r27OD7cCzbN2ZRNYZVVX6MZ3bFx'
-    b'zNWFP/2cGJsaY/jC2NMFa6KEavKxvNn5RlRR5vOnKs570D/BzsYtg2AN44ylbrx3N9crZJFs'
-    b'NgLQfAaqkWSu8m9XpyUMypIwb35Fz+pqmJyTEeVoKDpVPrq9ccwsX8DKhSexdO4JTC2sJnqr'
-    b'6IFiY45Lw37Y+fuZ1z77Kzuve+Gvf/20UdXnVLDLObEwp3e8EzNdxHUgnTQlAaqTQj0qOyZI'
-    b'JKlNJz2CZDJwnUY3zVlFx9cnjn5Ud2jZwBcRAvMIMUbz78MvnL/ydGPfu7/+Kq79lw/h7jMf'
-    b'hfSrNb7Zy09ibGaheRU+0MX9R86SqTUZLz5iShFp5zZd9hgkAKp0Nofy1MIKxuuVvns3XsHR'
-    b'XhZoI9V2BlB7xFd71wunzlU+AA/i8cVziZLqhiS55mReFNv9Zu33Z1311s5cQLduarY2N/JT'
-    b'eCiGcuFI166+AhGp3ufSUrLvoifIUqXXkyOj5av+riygBrT0z3ASlkEfexu3R58yGoFRn//x'
-    b'wT6Ohrvgs3Po1RsooVwkqlCKBaHF8YLBQKzG1E0r63Zo/TM/PjWFmZVKe3J0sIfjw4r7lr44'
-    b'F07D4zYCuGHoTXd8vFb1V5kN4W9JhMEt1SlFNEnS5licFfSoY1TQ7QwFfhNVXv3m7fo1RJ+X'
-    b'k6NDbN+9CZEBOp0eZhZP5QNiurcvBXrWNwZx58H+VzKQ6IYpdGdiz8HmLOlgbHIak3NLmJhZ'
-    b'RLc3rhAdseiOO8t0PRMk4trQkPOnvxIF+ytS+Dc/9IMfBfBMiqIwaWZJq4bVSm1hmJRi9rZt'
-    b'EiieFmDO6Wm/cQeLe+V9Zs2pYah8N0AMDCopADv8kCUJ/2KBNUSwEBvCjYWMr5B8k+WOzF56'
-    b'K6bPPFL9vZMj7N96BSfDXOypWcw//BS641MZ3GKNkySjfdmuR0lS/OrumeW+wYG+EnsNN/WT'
-    b'gqn55WZ62N1Yx/Ewi8A/SOwAZBOc0h0bx+zSarqKnr6vTDhZorM4GiQxLbNBEiyVs7R2Cr2a'
-    b'iti8uw4M+ohLkkzvo+tXX6veZ7eHmZnZ4k4NEy6FgZ3VB2cipiKTxFP7JHbYhYCYmJlDp9ur'
-    b'UIx69zvbbhHfUCor54OdrbqYAlPzi9YS2sjlCyYubt9bghmGa0sl4Zuy2Oz6V29sEvNrFa3W'
-    b'Pz7GycF+pYTvdvL7plnpFxzt7WK3nvjHJqbQ7Y4lzR6S7AEJq6ISdEEyGoSj1QaJoqe8d/zw'
-    b'7J2cW2x0G/tbd3F8uFsP5gPzA44PdrG3WflK9CamML24GvQDZpMCeaBQeM7c4UDT4MWz0nfo'
-    b'xqvCoR8hqkDSyTGul4fNChmBQ/lVbNM0PPPqZ3/5o2+Ywl//+rAXjTDpbkpnqRT4PBIBSSji'
-    b'/8g6NSRL8FXCWOtMxXTpJ6XxhjvppIJ+ih4ghmbwrBkV/GMsYv3CrRfymBstgrUjzSzEfvwL'
-    b'j38julNz7oV3MHvhcUyeuuTaEQncU54CjsjNa81EWfxuro4Ust5ZzHOqJv7Z+pA93N3C8cEu'
-    b'0nmBlc/21u3rDTdcpcVJep8J/PKc25dOY5FHbIvAa6vFxDXrJmD4eU5Oz2B8suJBN2/fwkm/'
-    b'n6BWURA7GAywfrPyDp+YnMT4xESygBdFt9TNR0aFSSJGZdrp+nda/bROB2Mz89UKmEgDaZP2'
-    b'WY5zqPpOAuxt3KlU7wCmF5bds0jEm9aJbUWs6ZZHzP3w0vwdhEkWGsmpL0qn18P82rlGy7Cz'
-    b'sZ72+BzSiMqq9WDrXpN2Nzm7UCx4nkSyZ5rk9yddoNQINR8dVy/m5m5P57GJaUzWCXuHu1vY'
-    b'3VgPO+gEcLy3jcMajZucmcfU7HIx21vMNol1/mzvT6vUDCvULNyczT+ssyfVh09jUBc1BZLB'
-    b'8unELunrIOz7i8kdzT344a9Usf7KFX7iQyAGHk2Kogo3xZmNJCsOahsn8dTVSOBesq4ii8oV'
-    b'pj2kJIcGvaK8tiIOoatCs+OrxVutBT8D7d2KG33HZ3elGTCJKGaUTLcQBI7Vvyw8/k2YOf9Y'
-    b'bUpUP7yzi1h627dgfG7ZugeGHyIp7ZpGu+oDv/nss1wF+yFT6wvKe2Tm4Fo4fbGCEw8PsH9/'
-    b'I1eUCLC9fqM6hFHZ/VZmMgwpc0zWn2SUb69uiESSwlg2TQn8LdstCAowXafO3du4g5Pj4+hi'
-    b'VkOrGoE5PDzAnfUK2ZiemcHY+LizT0YSt2xA5/SlCh+AjYhFbqxSpPom0/OtqGt/a7P2sI9T'
-    b'lz539SE9GAywvbHeuPbNLK+60dZThLpZYULhwIXVKGpBHCUi5Tqsz8FOt4eZ5bXKtGcwwNat'
-    b'a4XUTn0kVP+3t7XRhA8NV1Urasrx0GT7WZWikSMrZCzDh54P6YFKiRA8Y3PYm5jC7MqZeqrf'
-    b'w9b61SYCfSAnzfO8ffc6+ke1Y9/SKXTGxgwNlPjrQcxSAm1hTrtq1aZLa9o2RG2CoFbCW251'
-    b'anX6YRtalLtVsjibCtIAAcmXmpOzZEDIh95whX/zgz+4ScEHS1tOxpXOT6tqMtANQJZPL8og'
-    b'QwrVn4k3LINLWmbKms/51Ot8nkOTwgHjGktBTAAMYsjguqUOf0lc+EWlDAgyoDZAmx4y7U3N'
-    b'YuEt78HU2iV0p+YwNruMuUeewsyFx6vdVMmlmEIXETyy8RL7oOmpyZc7Juubeg1J/DPUfnH/'
-    b'pA8CVV45KgHR1vq1yhkMCu2tb677t6/jYKeiNhZPn68V5lIUABuYL02vi+t+whH6h8KQZVCh'
-    b'Zi+8KubzS5Vi/f7GXexu37fR1BJRXAA4OT7Gxp2KP59fWMRYbbKS8VBkLjy174X2AC4YbYg7'
-    b'CWmovuprJuYWMVYr+6vJVkpItoV6h/f7YICtWzcqgSbraOYQCSixQfT2j6LHe0EGVmnBKk1j'
-    b'qrp3UUIu9T6mFpbQ6fUggz62bl0zGx0eyWgagL5gf2sT/ZNjsNOp6ALSwRCSSxiYIJdJo2aE'
-    b'alI6P+H8MNoGY3ivD8/V7tg4ZlfO1PTNAFu3r9YMC2uTMuLoYLdOzxyg0+1ibvWck+DYfQQp'
-    b'TniedmEQIBrJ7IhQnOL+v3JvNbSRtxpnnLP07Sd+JdZpoDgKNqs+6w++8ge/vPnGm/ir1/0B'
-    b'3RGyxBzSTvvG6rNEPkqhhZUC1Eor5hfv+sXMPTBfYRkZ7MXRyuF2gvB80gN2oX2Bp3d2Z7xB'
-    b'1epcfD2MjFM9miy89b1Y/cb3Y/GJb8LyU9+Jtff8WYwPXbRYelWCsqkr4uok7b0AybcnpInj'
-    b'ZUA6RnFiTVdOYGblTKXsF8H9G6/W02B9wKnP4v6taw1EvHrxSs2fIom8ltH3IyPKaw4vE1wF'
-    b'GzyjI3oz1zB3R66cqpqa/d1tbN+/l+HFzigEONzfx9b9Ci5eWl7B1NQU/E9qXJKDO6UXoFqT'
-    b'mVBMxHKznnprTI4bc5u5Jtzl+GDPugJ6rIlwy4MCYIDdjduQfh+d3hhmlldhUUdLR4Ti6tGW'
-    b'xABeaG15xawAus4+cfUiqnW1Ifd979bVYOYiEB+5isHguGqG6lCw+dMXbVxtxvHTT5IegvUW'
-    b'VuKK2B/iDHZpdT5+e3phtXmvW7ev4Whvu9bUVMLUw5372L5TUWzdsQnMLp9JD1opcruSdco6'
-    b'XDQ9i4yjhF6NTgJ8GLoG9+MkskkiBVKqcWbNnU5o6IJkX6N6Nj/wlazVX9HCv/mhH/y4AL9h'
-    b'202xkaWScPZBpeUOkOyS+Z3N5rD1iUsl5yjJQ8S8MYWegEILLSrRy0JL8SP0aVMjKmXCRbbc'
-    b'uNqcDv7bNIpj8x0Y6a5KGUz0Jmcw99A7sfj4N2Hxifdicu0C0OlmQ0XapEiG7kgyXfnwGDjo'
-    b'VDe4PhWNKHt0D/+4U7sSrp5tjEQ2r79Ux/NWpj2iYNr7t65CBgN0uj2sXnwU3bGxSA0Hok4g'
-    b'UhCtwmpSMpkm6Xhnl6JWsqsZ/qC1s9Uu/+HBAXa27o2EdYffZXdvF3u7ldbh1JmztU7Abb9Q'
-    b'Ri3Zuslb/W8Guyl6w7t4kxby7JCYqOmLk8OD6rOiq2AK9vfZeoP+ALublWvf2OQU5tfOlJvp'
-    b'9LFzZkAU5+5Hl+gX36/fNScj5TM+Nd2s9O1u3Eb/5CRuArgVY+n3G91Dp9PD3OrpnFpje23F'
-    b'HAoc0bCr88qkpYnJokDBIjt4OStKc2J2EVO1l8Lhzj1sXnux+rPa+XTn7nUc7lXrlxMz85he'
-    b'WG0Mujji+cuzYHERJOsAACAASURBVOhvFfuswTadoVlpBIGjEieZnsue0tLUL12wUWNWI1n7'
-    b'4rJJTBCUAJDfeOUP/t+Pv2ELf/1CfwIB7sintqAHUGEumj8U/zBlrhNJwDnp1qZG2HSzML1B'
-    b'rLFDUPtS7/FmcbgSaWB6iNA1A+LVuGyHCS/igdNCpE2FpA9uh6zVtkBvdhEzl57A5NoFdLu9'
-    b'GiofBCb0ATs98BIKskCDS+F7hVVBZ4SDrNBKfThW1MTc6tmGD92+fR3Hh/v1QzhoSzKB++tX'
-    b'66ljDIvnLjVJW+Fzpp2Y6GkoiWbUkhQJOhMCm6ku7fSBNO0BJHD20sPodLvonxxjb2c7tNDU'
-    b'e9f1723f38RxjWycu3AJvV7PxrEqC9qsoIUV3Sx0yOs2mIFCdFORAJ0OJuuV0ZOjw8rER6za'
-    b'3rf9+mwYDE7qbQBgbGoai2cvOSkIi4haiDROjLWQ4VJORCY+nVEYvB16E5ON+c7Bzn0c7e2q'
-    b'qdlXrFoAd3SAnXrFsTs23jRIBYaoQVOM/4ELHfLPMk0+gI5zFlsoKUbXQm+Eq+7b8alZzK6e'
-    b'q1CLfh93XnmuaQiPDnaxce2FJvlzbu0CehPTdgpHhuyI2kyig9dsE250eJFPLYQNMRVb5PYR'
-    b'ZfemAOjS3TcMB0x9LmhXT09V8Se+0nX6K174Nz74gz8lwFXNDQW8ReKFH4aeGFVzCXGSBIGS'
-    b'vLdF8EO30HD8+NwUSzp+ZsQYnPUkkodJeE0BnUJYixop1sBEu5d7Xpc6GU2Krtx2ykYlQOr2'
-    b'JtDp9MJ0kwUoZk5jYY1SiWbo12GyYdryI60FqV8ny9WDzWc2MTuPhTMX64ljq0lE08Kc48N9'
-    b'3LtRrbhNzsxjduVUGCREw6GB7lGkSzFdMnmvoflMd0q9qVxzWc4/fAXdbrcStd3fdKKrpHAT'
-    b'uLO+3ux9r546DYhgMHANLR1MALtdkVFdEu4ORhFsIEt9xDExPlNtlVRmNRt181Oy+7QXpX98'
-    b'jP2axpiYnsX86XP1OZI82Sznh1hEwgMYXonr35pdvhYVhdw8X71xLJy9WFMa+zjcuadqPlXh'
-    b'bd/i3v3NZod/bKoKNJJRFJSNGYxXm5lmPHov0EFZjdLJ6TTMwKbugLHxCcyfuohOrwdAcP/W'
-    b'q9jdvAUC2N/ewPada/WZ08XSuYfrc4whhMns/8uoh6rVAFE0bSa2ADPF0YzuKlxbgaFX4Dwk'
-    b'Mroyzl+SNg9MZp2hAZT60quvPPNLP/WGL/z16//xojeyEbhJHvYi7pB31Z6FtYpwxrT4HbwW'
-    b'M1ZpPjgRqIFzmBZTKqtJc9gEt51wfqgmT9yfEZkoT781C4FJUPYi1TnUQB87zdQvdcdfOcLV'
-    b'u+4i8YiRuKYpyPn4IVQhI8xlC49jCHxlMB/xkGv734vnH6mnyAPs3L6JYWzykGzY2bhdOYsB'
-    b'mF05XeeAW0SEmUgtFOzE38kk3gki+K9DWGKQBIugO3H6/KUqWQ/Avbt3moKuVwDFOZes37jW'
-    b'fIeFpeXqJzQeABGO8ecjC6oon2HQ9my5A2VmtkLWUbOocty316+pnABECtCy/hicnOBge+j3'
-    b'voDxqemSwR/gkjtzdTBDg5/nBKg529GG3mimsrOdwNKZy3WOxBG27667xpmNdkDqz/RgawP7'
-    b'W5Wea2ZpDWOT0/B+ZobqcoLFLPLZR5lnn63Jhxel3JfU5QQ+X0UEmF09g+navvdwdwtXP/c7'
-    b'uPPKc7jx3O+164lzy1g481AszBkcW1rooToZ9HBU34eSFebh+3HPIB12Ev5dEuogbN+MgkGl'
-    b'sGJhRcFsYngJQH78q1GjvyqFH4Ifo9DJ+rJ987wttV73mbEJTLqb9o6PIS/q4Q12lJl8WMqk'
-    b'Ni38D8dhtgIdJxaqXxsJH/QW4L3QThZUqnmENNubkUgUInmGdfVQDzOyBwhbB8zxAv1aWYT/'
-    b'h9BVthURz5BW06fWkyAFFzZPK7d/vnj2IZAd9I+PsP7S53FydAh2us1l2bz2Eo72Kt57+fxD'
-    b'sfA7RKRlIAWpaZ+UaECmy/ziGwjjDN2uL9rgFcHC8irG6gS0u+s3zH0miPjmYDDA9auvVnRO'
-    b'r4fZufla36GmJKgtEiEESdws/LRXGnscpMeMY7dt4Nj0LNjtYtDvY/vODTNhRuzWXsn+8VGT'
-    b'tTC9WO2C9wf99POgMLgqjmoSEkgLcZjX10JSNLEWM2D+9Dl0Oh0MBgNs3bxaXAEbChz3tzbr'
-    b'xEJg6dxldDqdwLOY84A0HKdxPaV2ISy88bDuJ2aqoEZBpdAv1f8yNbeEhTOXmybz9sufx/Uv'
-    b'/D7uvvYlyKAPsoPlC1caLY53sQuvw4fqiL3O2Wxl161dzeWIWPjSlpKOOmZsTpnc9zra2G8D'
-    b'pHEl4nEH/tibpvBvfOgH1gXybwQj76ukm0sUq6mJi8Qxy1vTSbRPtVoxaZPyNKDJYGJtOWZa'
-    b'/UHLeapt5bCK6ANbVKAk/VTlemrJrF4DkqishcXqEbKJzEzPUhXEOjiDIFjD/Swehu4jzNbZ'
-    b'sr6WTjHAJEULKJnPIQ+fBUwCXn3tF89dbtbEbn3pD3ByfGyu6/qLz9VrUl2ce+wpdHu9WMCY'
-    b'NRZuVYsFmQJtCE8plTLGx0bXIAPDEhifqPbe79y8jv5JP0gRWBd8EeDo6KAp/JNT05ifr3ji'
-    b'bg3Dti5x9R1pctct2iPhYXBoayrcyT5Qy6NPzi6i2xuDDPrYubveZksKC+EbrYfG7ubtxq53'
-    b'emG5vEg9wut/VAEUd06Iak4JpUfKTABhe4Kp+cUqBEoEG6+9kGgY2r/dPznGwfb9CpkhsXTu'
-    b'4RrJEVNoJPAW+qbiaLqF5QYnxNaZn2UNj+ygUP3v2MQUli5cwdhktUFytL+D+7dewXH9WY1N'
-    b'TmP5wpXsEInTAJN0EkaDtBx5LGSJe8tCfS7Sro9bCoWmkSxbjzJ5riXarFOnlcLZK+PfvPKZ'
-    b'X1x/80z81a9/HZ6kRO0aHpZwLWn/m4WJl27ySfgcv6qZxpinv5GcwHpFKFk7s7y4FDy1FY9G'
-    b'F6ErDmwUURuQkVNsjIGKwR3e/jIiMVL4vIq6lrJbReIxLeqQKEji2zO9umbe8SuxVAzud/Xn'
-    b'P7d2vrEBvXfjldbBr+b511+sBEfjk1M4/cgT6HTHwv1J8StlrdVzyCoXdyaGIZfl28scrBIO'
-    b'VIuOENOzFTS+sX4Tu7UPgS+0g0F1sxzs7+N27do3v7BYTfzi1+PaiT/zFKMH2PVfHrS+CI2y'
-    b'UP8TUQBmJuhOB1Pzi62Jz72NtLlgAlULgK1b13BSxw3P1n74xiZaQcFSypYu5jxbisaKKGmL'
-    b'HWGEcUEPRKLbG29yJO5efbFZJfWwXrfbhQz6DSTe6XSxeO5ygtWPWnMd9SzGbIygrKLzpzBT'
-    b'U8L/J83LwulLLZQvUq9rDgASC2cfwuLZR1rAq3Sgh3vBcx2SeEWwHMPb1B11VppjV4rXrKUH'
-    b'kkMwW+aHTfmj9+6mvnYeDSAA/uuvVnH+qhX+jQ/+wB8Q+IUYlegPFAQlt0XTJax2SPY9FG+a'
-    b'LttkPJHz1WcwYRYFOdPxYhJqa3NThIHOeQaQ6c5+A/3SB/801n7udavsdB+ula4EJhpU5kXc'
-    b'ILRhf5UJLFV4bENSUXLzC9waDKzgSU8warLxfKOopnx8Zg7LF680kOntF5+D9AeAVFPinVee'
-    b'r+HhFcyttnvEuYZImuveAjbtxol461ZltkTmUwxHAV8lyqeGa5frvPnNu7dxf+NuerSJVGZG'
-    b'x4dHjXnP8uoa5uYXAFbObxE6l/K6kTZsET+h+BuezhkT8QFW73ZibrGJ5z3Yud/eE0kei76C'
-    b'/ZMTbK3fxODkGCSrwi/Z/a/yK9Ipooj3F1g/GzRLeAqQ8b2KoDc9g9nlNQDA9p2bONzZKkyJ'
-    b'1YbD1vpw13283lLhyEmFKXVokUrvN69wrPgxOQdSJoXYGxFpEmd8eharl59o4fz6b0zMLGDl'
-    b'4mPodLsPWg4qpZwhSUizn7c43wZn5pZ14VEUjeCM2Yb0MBVXWt+KUlNQ03kmWlnskCT4hZc/'
-    b'/Z/+4E1X+Ovz4UctO2pLkXheNyUUkZi9JFioj8PU9Xu4jyrpx6TuH6bTmfmI2ULWfxg4PNuk'
-    b'9Wpto5QXj05E3+Z2Xcj7pEdrVUkAr/T1ZlsP8NN1rezV3Bkz0WCCqBU+T/9Zxge1sAKSyHVN'
-    b'gp8ITj3yJNjpYtA/wdXPfQL9kwruv/7FZ7BXK/0Xz1yqveLbSQ5+IvAPrbD5Orp1NkrB9tSh'
-    b'MFKETZKm0EEua2eqtbD93W1s3r5lBx93Yh0c7GN3p/JEP3PuPObnF2w9SosfRxSXgkwzW5wO'
-    b'/vGah27vofGpOYzXJj6Hu9tN0ZE09VmZHskA27dvYtA/QXd8AnNrZ+qmpjOCv6U/ox7wWUlw'
-    b'dI2gdBb+g2BiNTExg6ULD1fvc2cL+86HQVecw90d3F+/VlMh85iYnW0nw+EmQAovKo6/+dGq'
-    b'pGS0miS5jAoR5RDNUKb5dALcTNjW6fSwfOEKTr/lKYxPV2FMEzPzOP3oO7F8/i3WbGwobMyE'
-    b'dP5ck8JnJ87OFzRG4Sw58DhUSW/KGMDe2bwXkU5BQuNY3ZSffULFIX70q1mbv6qFf+MDP/BR'
-    b'iPxaKH8ihSLESC353zC2mnSGFa4gKZibYQS1FEKT+Cc+mcytVzhToBD7y/jAe05aKCmkmB0A'
-    b'zd9ztlwP1MiL4m0Vh2QYPSYQWyZ4hLUxzUK8csgxSyssGCchaWSAkZRAaZocvuTVR96KsZoP'
-    b'v/rZ38XR7hZI4KVPfqxy8yNx4a1Pozc2GaY0+gmdllJIziVHlYq/rZOmBrEbZTLiSouYEcCF'
-    b'h9+CTreLo8ND3PMT//DZqs1SDg/2cXx01BT+sfFxt+ifb4S3GKW1UBYU9typxWCaphNzLbUI'
-    b'cfhtu2M9TExX9MWQAyZ1gApDTMbQkGlnYx0igvGpaSyff6iFrb2ve8FqkaHKecSbAclg9rw6'
-    b'HlGCQhLoToxhsV4z7Z8c4/6ta66vbO/zw90tHNSK/tmVM3XUq6M9REJfmkdIaERGUnKP6l4O'
-    b'ujVhmPhtU1FGsqbmlnD6ylNYPPswppdOYfHcw1h7+MkqjjndqmpTH9McCfXzyi59iZsGvWsj'
-    b'E4G9jGIvTUqhdwGNZcwiEs1UX2gW3Cn5ay9/6j999KtZm7+qhb++CD8SDng6BaTQuLyJJMyz'
-    b'RDghHraJ2G9oY+vJUpFQr/Up3hxOHpZnbLANYuFvhgJX6fEmYyQiNFoFv8lOZAtvHgJvXwod'
-    b'1CTmIZcRx0A29WtbU6ardYYHluF0J+lkK4UpCwWCopwFETcMli88iqma59+6fR3XvvBp3Hn5'
-    b'eVz/0jP1pDmD808+jc5YT8HBTFAdMfeTXtNrEt7Uge/whwTA0PcY0SYR5qytaG8JCs499Ghj'
-    b'srR5Z90lylXfr1KAA/fvbVYqdwBnzl0I0x4TNAJ+f1oNy0QeKyr1uqTXUgkZWgvv8SNA6953'
-    b'dICj/T3TvEpBrCUywF6tCRifmsHShYcaLwsLHEraxJrOrWkUYvPvu2lB0u25pDs606d+/wQd'
-    b'djG9uNKsyW5ce8k1iu0Zs7+1USn6SaxcumKKhyRHXMsGiunO6Sgb7yaKTCQcZhbRvLNtLFSi'
-    b'YFrSSEwvruH8W/8ELrz9fTj7+NOYXlgNjRdFLPJJBpKSqVBDEnHkEJGzpxvFNo7pvBQcD4nU'
-    b'+TRrIJJn1uKSRBoDG2eZH/lql+WveuG/+4Ef+EVAfieOx0wGuhGKW70xI62xON1YPHwoR0fX'
-    b'Kp7dc+OpsYMgjd40UA3C/lNqdoEcnTAmWSb7Ws/4dNXX74OIRSQantStwzQgGEdQAAxfH9Cu'
-    b'LKUKycMlVFCbGOvbbIxvYPTMlElseIoUGsRhNvjpK28HUJnDPPOr/w6/+ZF/id27FTy+ePoC'
-    b'5tbOuNS9OL0ICtWShYnfd/LSht8IrZmRd7eGSP4z234ViytrDZx9++Z19Ou9bxqYtQMB8OpL'
-    b'X64ti2vzHjPQ0+giCsxm4sWTqOCFtgioN89UTc2GW+6wg8m68B8fHmD79vXwvEWYtPqvYeGf'
-    b'nFuofPpLiYFCs0XS/rY4jQmDlUtw65CCKxc1ouGb/QHY7WBqYamxhr776vN14A9aBJLA4KSP'
-    b'7fXrGPRP0Ol2sfrQYwFpDOpMv2minEtZ2A3OgmtoZQnmvGF6PRC0MZ6+GBufxNL5R3D2saex'
-    b'dO7RRsipdTriKqod1GznKc4MjkHZ3aIw1qzUDVfhzGBIHdX6luaZYYKOppZ9YqzLLVMlzXND'
-    b'2wX/zkuf+o+/+KYv/PVF/leBmnXQOVPmHeoUaf9UUj90mhtECghxM4upmNqStj21uZTRrD7j'
-    b'eYjMvGdUHKMYaiKZHpv4UOcH3fDHHtJioZhJM5lI6R1lgsGMI5PsqGRqWSw6QczByIZbZU7p'
-    b'kyXQ1sWtCnD56e+oOHwA6y9+Htee/WTD9Z99/ClMTM+mPGIRjYCEGM92hTPC5no3W8BmghUD'
-    b'm4qhsXzrSLcrNju3UEH2AG4rcx71hFT/Nhjgpee/iMFggLHxcaysrtlGm2IaCp9r4SHX5upK'
-    b'bPhY8llvntfCUn797ifqrPn+0RE2r73sCgpT5zMZSJOuODm3kBg8+YkBTdE2nK3f5qBld72b'
-    b'nxBx1U0ZxtCICYfvuqJephdXMTlXefZvXn0JBzv3IVI1psNKfXy4j7tXK3/73vhkPfHbLRy/'
-    b'Bd2eJ/QDt1sJprm2JpjJD1MOUpeEaPQIQubErXl8j/SWyErSUU7CuFiaDe2Mia/p17LFP4ao'
-    b'LhHPKvMEDmOLRbu7SjBsMqcTzUavc22FMTerAZV/9bUoyV+Twn/3g9//swA+ZTq6NBJXHxS6'
-    b'M4uwfjRByvmTLLPeowsGrRbXOgcRsihDIectN1zz8no0LxXXEz4lPBx2vCEyLwODMIxwSZSm'
-    b'EBQQCw+jM97GNNGldA2VjCDFLMViIPAkOIyp/x+bgun5ftLODJLkxp95/KnaFhSQQR+DOqJ3'
-    b'an4JF558N8bGJoMZSitYL9AgjIdfHAILeoV8ySTJgkBYVRreiFMzM5iZW6gL/1Vs11OvF80C'
-    b'wKsvvgAAmJtbwPLa6WKzRscxI2thvElU09zle59M53UJdx87xOT8UiXEPDnGveuvwHNY0f9Q'
-    b'cLS33SjjhwE4sRJIyjPEJDv/1SNgnByTQYhlVv0ae93a2Gah8ezf39rETu3gp7/b4OiwuQYT'
-    b'03OYXTkNnzwa7jdGuk1oGxvtQaBFfQ0nrXkYb3wimfRTI4a6aRDzA2kQOt14SCz05nsxLkqo'
-    b'+00MKpsKAkzbyuQMpdEsUJ1RNoDNrJOSiXJfCmrD9sOQlF4zGzGfeun3/+PP/pEp/PWvfyFq'
-    b'5GPi3Z8D/jIiq1lCfCoDP4WUgTHflyooIezf2pOhiZFXT4/eSIhuk0P8r6BEETqoiYafHx7+'
-    b'wUNcPwiSIBpBZIiYG+DSCG3KYKFFkEhSsdR4kO0DLQXtgN+XCQeN00iIxOvb/FkUP04vLOPR'
-    b'9/4pBS9Wr+vCk+/G2ceeAjp0dw9zAy8LRrTFbkQaQtHNsKTq14EoRQhR0On2sLRW7axv3r2N'
-    b'u+u3qqlxYJPt+gPBzetVHsHq6dNYXFqOni20cO4oLwux3WygR3wAj4TGlwZNaFDqTgfTi6vo'
-    b'jo1XGe616I2CNOeBNZpx5+Uv43C3cu2bWzuLEfLRUXBk/Gyk5FJJH6mQfsLUmQXNnVU95+NT'
-    b's/VOfpUzcO9GhW50O10M+gOAwPbGetMQzCyfcr21puzEQd5JI2meHVj421sTu22AnHbS7VfS'
-    b'HNEWW7uJZzUKFCZMeDnx2teD1uUv8T5xaX+gpAirIF/I8Fo0MQhqYdihowXM5pq465ConYh/'
-    b'8bUqxl+zwn/3A9//MwA/3W6kSIlCyxOwYr1D3BZgSK9jQPyo6DEFdVJyqsFnRIeC5H2q/Ykg'
-    b'dvWOWRPiyi0lQOs22pQPTPaNojuJN3a2qiXxYR5O1rFceaU/7VQmys/aWLnSIr+STMLUiuyE'
-    b'CMr4fSYHFYmL73gvli9eQXdsAp1uD7PLp/HQ09+G6YUlBQ+7LkQyrLL+jLXISCx8TQX7S4k2'
-    b'8d7uLl6PoYG0e9MTk1M4c/5SxXHvbGGzcbuj2Sc6PjzAznY1EZ+7eBmzc3PpLWEH2YgOmbWu'
-    b'2ljJSzMbhMSp2cnkKXZTGgWYWlhqXN527t6ycLlbw5Jh4X/lyzg+2AdJzJ86q+6fPKvCi8NK'
-    b'jRkdFEVlzedttVtDLcbY2qSRHpucwvKFhxsq5s7Lz9cnceWGJIMBNq+9VG03kFg6dynu5Jtn'
-    b'K4fVc1W6jOx97JJANjno+YsGkTRNEu2BacO1WEYGE61VGp3CAqXGYLWZBbqnK5w20VIs1eSG'
-    b'TQubeKqytJmE4K5ot1v46Rc/+f/8zB+5wl/f/v88VTVl2QVFGLv+TpI8tnRaAUkeb6olUK3+'
-    b'FUtDiDotQkyO8cUuk1qSrG2xkE3LzLWvhDaK5Fy0tKB3cxY5a2OqnGeKvfni9oCo90ET0ylu'
-    b'1GChiWmFUDpLwZVsZhkEokwyEltRljEi002LYOnCI3jbn/7zuPD2P4Gzj78Lb/uT34PL73pf'
-    b'5dY34lBkIo1m4jAmStQpYg8XOtfCcNfSCyHV5ZEkZxqVcO/Co48DQLXSd/dOUwylzdnFwd4e'
-    b'Dmuv98sPX0Gv17PvjYl+xe9yUVxUsPMUdEIyS+Gz1jaI9ZgWe6cJicnZeYzXK3179+62h2hS'
-    b'w2UwgMgAm9deRv/4CJ3eGBbr5LtI42WEA9OAoUgADh9zUeeA/nxyakDsCWIjZrsdLJy9iN7E'
-    b'JEQGWH/puearOt0uTo4OcfvFL0BkgE63h7WH3+r6eBpdVLS7kHj2qOmYrkCNzhp1wEBGc0hi'
-    b'JobSeRipOGoYnpKzlqFho3Ho0/VUnOEXEzc9JCDjcAWUXlCk6SHxTZ8kTbM7L+hQq8Tcp/63'
-    b'f/61rMVf08J/5wPf/xEAv8cUVckz7SlMHfdIx917TkfgDuQ0E8YeEGaPtP0wo0EHjReBJIVc'
-    b'89NNSE92xxlPdzGvt+GeiXx72qVPheAOXTuE6eDPrHEJJj5RAcs0rR35mJXxX6OkAeoJYQJU'
-    b'SIl3jEAJBER3fAIPv/vbcOWb/zSuvPe78Ni3vB8ziyvWCc6riJOEMFEJas3rK1EwjsKQITfo'
-    b'Vi7NVojnACmJkVT1O+cvP9LQDbeuv2Ya2OHEevWVF3FU7/BffOhh2JVORmvRojmPFyqqrYth'
-    b'FKowWBVT32BhT0yMTmVschqTc8rEB5Z6sI9MJezbunWjnaIvPpxTM5Rs7FcNZ05rBbRNRDuH'
-    b'xAbR6C/ZNgy+cRNgfu085lYqvcX9m1ebBD4IcLCz3bhKjk1MYvWhx1Vinw7cYeq4J/EmMo2D'
-    b'FNZMq1lGzPPFdEZhJKqDoBiG9qRv7pMHWcppSY1/PpGjpTGGgc2KaxY05nl8c52cK2gEHCTc'
-    b'kFRIrJ+wRHkuCZNUpurn/d6Ln/yFj/yRLfz1Bftn5gESD1vR6dsEIRNdOdeJ6wrppo7WO9tJ'
-    b'kjhaAcDCQc7Q3SewlZqASYnTgYMv2wLd3uB6h9bki2tkmn6dkaY4WAJQQuZ2utNdEEf4TYPS'
-    b'Gp0/YPUkKd6dL5PON54LYps+NYnmn6FvEOufMqisaydnFnDpne/FQ09/O+ZWT6dbFUxnPn3e'
-    b'6qYgptEj259wrymLkI6vIk9a14fd2tnzTaLgzddewcnREbq9XjtriuC5z34G/ZMTdLtdnDpz'
-    b'1k1NlrscTjPMKDf/DFDzqLS0GROUC97i1dUSATpjE43a/fhgH3v372ZjWTtRSx+7m1VW/fj0'
-    b'LOaHa5lS4jDQmlqZEBbJ8aIkl8VhWcgGOCSUhziecHJ2HiuX3lI1OTtbuPq532sm4o3Xvozt'
-    b'O1VDM7O0htnlU67ylt35RYvrUrWov1etN0kw80q4ebrJPgDbRmcj0Cl0SW/g1vZ0I+GRglKe'
-    b'Am1SnwMjWDrlBfm1pENCEoOiFlXxkeUKbRG/ISPRNrG12/xnX+sy/DUv/Hc+8P0/T8HHjOOe'
-    b'3n+nwLOm6YfkCnk4oHyHGqIeC0TXEAb0nas2Ucn4JT/gBi4sttHM1MIiBUQiGWDEuU+xkGTY'
-    b'ICACSbjy4fcVh4kEt0LR7IbYG30Ub0hx11eK3GSbfseyj0rCe4tZJmbkQQlML1S+/L3xSskv'
-    b'g0EodKIONroo0GwKiF7l5ZYwLUwBstVOkbS0pjrIltdOY2qm8re//upL2K1FblSaky8++wxE'
-    b'BBOTk1g7fcbsfIueoqSEVAw1LP7ElnDvioOZGqc0gUu3o12dHMZ3dzqYml8GAPSPD7F181pI'
-    b'920+3W4HMhDs3auag4npWUwvrWZkbaJVdIIZ4YinLd8A0tN8uiEkbN+zxOdtbHIK59/2DSA7'
-    b'GPRP8OpnPg4AOOkf4+aXPovjgz2AxPKlK+j0ug7eTmwiBamqP/OL8Tw9kdvhNnXJdX+SXR9h'
-    b'6n7noUWRxO3QpkQl5zea8yD/yCQDOEIuQ2Bd1QOlIXw6jdaQKm1RigTxSOg7HyUwwmn1Yy/8'
-    b'3n/4+T/yhb/+4H5Y2XLF7NYELs6g3tKeteSlNT7cUuLARHm2S+jwTTCQxIep9HMsVcWCajzJ'
-    b'fFerik1TJP71lCNf29damBayRiXA625HWkZNtn4+yn3MvXOxNw6hSGDH7X2S5wo0ECiHRWJQ'
-    b'Q6Ut5z7on4CdrqGUmMGRYXpgXE5jAW71fARy3jXfZUkQVnUdZucXsbJ2pob6r2J/e0uZJVZf'
-    b'89LzXwQALCytYGl5zbJJDZrU3sfZrnyMJg54QWIeY5/rsAde62uG8Ofw96cWq8I/ODnBvRuv'
-    b'mqHA26Qf7u3gYLva4Z9eXGqsmS2yklxwKa3FJrqaQqNmbJSzk4guAKu5D2pXxW4Pqw89jok6'
-    b'ZfHWl5/F1Wc/iZtfeAbXn/sUgCqY50xtPgUC6HYQeXTViaeqfqeST7zMhM47Q7+n4b3E0Uye'
-    b'bzm8fjhS1SsgeAAAIABJREFUmQllFxBa9/2YSwxYyiJJ3ERLyI5u3o1zn288a28Ri2AwGhtJ'
-    b'RPWySlRfux9+PWrw61L47/zk9/8qwF+24jivnLWHE8tNuVu1YG7GEyZTmr1ve3Ml8A7j4QdG'
-    b'h15P81Ap2gWlJFuaA4uMBj7irV69Y26Wdc7yvGzEjrQ8H0MEqz0MAmdWpE1oHi7GYTI+mMon'
-    b'38g7kqlaiu2fHVvY6VRxoHV2wHCXH76QSd7IIKF9DE0nYqYy5sCEElVFKIPqAGSpCKm/1u32'
-    b'cPGRCi7e3d7CnfWbZoVre+s+7ty6CQA4c/4C5heXHAovrZiPFpwN1IujW/T7NdcjcY/Lj2gx'
-    b'7ovVPdTB9PwyOt0qVGnj1RcCaqPTPe/fuIqjvQrlmGng8IRrHVW1pED00YlhxWaAinpupORK'
-    b'lg4L7c0wvbSGlYuPVp/fvbv4wkd/CV/+nf+Cezer9cupuUWceeydhqLwPDpdgRJjk+24dXnQ'
-    b'M6MHH/egirNAVoPYENETxkaREgcxOLdQFj4LyoilTKZYWQq/awxUXFMkWQcjGa7YIgOZlihP'
-    b'QrUDmCR1DYJffuET/+FX/9gU/vrXP/bTRzvdizNukNIz5YqpFGqdLucM1bwIzzrFZzggMhWM'
-    b'ES8TaTydNogxueW09JxuQlyhlVSlSBQNfSgJwJyNADBCyNCiSry2qYOp9VhGthokSBh1tq+N'
-    b'GY+QeWaXIHejB+hCBkPlbrfyS/ctRKa90JNv8nmLKN8ElfWdwn7+bjPoShtHLfCwKVPw4Mrb'
-    b'3lVBxMdHuPHay+bPrr/2MnZqc5tH3vJ4TKwzGgzlkuiTz5Swc7glwyS73KvdYeyH7QdG73JI'
-    b'gh1iZuUUumMTAID7dQHMypUM+rj72ouNp/9wla/93EYRLklzJ+5I0PeRJJOyirmjwMHt9hsb'
-    b'my/1c8Ynp3H6sXdU0bQiuPn853DzS59tHPyWLz6K2dUzaWHR7oDMMmSbsCqxazMCs+nk73Vk'
-    b'W/XSHgosNO02a0XssyO0aghlfWv9LMQ0K23Gg80/MRsSSaNKMr/+4tQZGpXRZmzBpCG1CU3o'
-    b'0gLC563+LZLxj1+v4vu6Ff47P/l9Hwfkw7pWGRX5yD0Tpmhc2It3MJ3oA0fE9RRM967BUVND'
-    b'0nO6HVMfL2qfKCoerdyCkFGfwNRireCNkPIjUuCn6faGVZchKLqGFZFVoSpszj4177KMpWZC'
-    b'L6fr9anASpfODsFOp4b4WRf+2F/ZKyHgiAHJTsFl8WYUAg8PGTFbEizc2+Lh2vrLHnvH0+iN'
-    b'jUNE8NKXnms8+wHi85/5FE6Oq5z6K48/iU4nih/tITj8FzogSCLCknrwxx1pkuEDY0Insd4M'
-    b'mDt1DhMzFfy9dfsGUBvaeKB0MBjg7itfrlb5ul2sXLrSXj3alcso2JR0MjN4o1uxoPLEaAuf'
-    b'WIQwOyeExVunNzaGc4+/C9NLlY3ywfY97G7eBlBpFh5+97cng4IPxZKcTWIZXs4GlGwDIHwf'
-    b'8+NcFogOOTJreVQDhwTR8iivc47MS4jUAh+AtWQ6ryyhUsQjPOIQQUnZ2aEWgEj0DmrVUg1s'
-    b'H37hEz//8T92hb++Hv9Q32V5sW98sCw8LaV7huZLzM5qIVhj+IcMfkv53MARt6T4h10SKFws'
-    b'/iDxLRkx2bDQi6cT6G5yf/hkcZMJd9ZeZbqDRjc39vCm23WN54ibSIQxZrNk90+EQHbx648c'
-    b'1QqiEQfSdScdds14R2RyPQaEpfFDEAnbD8JkqUr9njD0e+4z04VYq60ZmRVVhS8+8hbM1Ctw'
-    b'X/jsp9EfUhgQfPLj/w0AMDY+gXMXL4eLRTBwmSkYnPkWpNanChXQ74keNCV8yJvUE9704gqm'
-    b'FpYAVLv8h4d7OdPSP8FG7effG5/E2kNXnF2SxPck8flvCz2zS5CeAyGfRUPpDimwzp+uwe50'
-    b'sHzpUZx65AnLI5JYuvAIzj35tHKmg0UOaE2MrfGMJIia3lFvRW2NmZkk66R087QzztEZYVZX'
-    b'q/6DMTiryF4JA22bglN1AW9RFIuqUArHNmOQkDgKrqVQJUyV1Derf1bEbkuH3Rla/4j6rf3D'
-    b'17P2vq6F/85Pfv/zAH7YpLWJpMiu9Y53Rc95zDf3ESO8k4b6BIDLH2xMJlsaaF7cpGkQOMld'
-    b'BI25COPN5BXnplkOG3FRKUdmALObivWKVOJ1H5qbhraXHMpKYQAmUbuxR6GHF03hk4LbCJ1a'
-    b'Q6MW6vAa3lcd3QhmMtG4niiQdq2H2bqOy43TTQsZvQgklB7TRIizybVpDe0O+vTsLNbOVL7v'
-    b'N159CRu3bgIU3Lt7By984VkAwOzcHE7XX2Nd37Kuy9mhmvu/FT/SH+gl8aJZEVSWMxKTGQf9'
-    b'PrpjE406/3h/F/v3N8LhTRCDfh9b69er6XhmDiuXHy1DP+baxm2Eoco/M2DOvN9UXIUJOAqn'
-    b'iEF+GdgFgpiYnsUj7/lOLJ29DHY6IDuYWz2Dx9733ZissxgCikWpwYYHiFA8iJUkoEruUxNo'
-    b'MgkBQSwKrBnU+TTDRTDFlBKdmgkm7esOWz+UMviiw6sacCumW1BoEQf6g1Bylz993RlNN90u'
-    b'0w9/+Xf/7+f/2Bb++tc/gGA992UeGp+U/Wk9BCMYbdNob113eEv82xALD4a8HdpHQpzdantQ'
-    b'xhRzojC5SwbhM2m+JQHB7NRBZUBEju6CW35NQj0rcviK08s+PbckaQ8kiVoF0/GLwx2ynWyH'
-    b'6iDQOaqTFw9aM7y2HOtxIUFFKkZB+IklDjO4SKNZjRdFtp+tTIDUd7zytqcAANv37+Ezn/gt'
-    b'iBBf+vxnsblRrbpdfPhRrJw6DR9FYZzSqFPw6D5zRTaIU4t718uEA2XWFPtYYhWyNbNUCfVO'
-    b'Dg+xPfTsd/qHg50t7G5UsPj04jIWzlxAlnYWb1eGSZkS/eFFoUEUIktWCBMpo3dl8byqP9NO'
-    b't4tzT74Ll5/+Vswsn8L04gouvP0b8dDT36oQhGhVI2lptw92u7LmR9Gy6kGkdELF5DkmViER'
-    b'5UlgueEatjAgkC16Yg+mQCuqrR+rrXGNi7MBj76ZbqWZekvH0xuImi/d2ApzO3GnIQCwDvAf'
-    b'vN5F93Uv/Ld/8vt2Qfx9/RHRdVOpsYSMXLJzfJTkATUmYQyxROU7ICNSsjI7n1yPAB3PKnFS'
-    b'IZMCC88FZNclFvYmgUpiObFrSdaR0DYwYou1esCDTblCOmgcsWKzwtL1ZboxbJcFCvJ5p7Io'
-    b'oDo54ekLn0Yg0g4/wS8bpXPSxMZMIgnAgRR2PgwSVP/znd/4vobn/9THP4ZB/xjPfOLjODo8'
-    b'AAC86z3vxdz8glVsi6OlnIe4JUuT1MxEbCYaBg2Tm4vWdsKw9kd1MVevKPZPjrH+4pdMAzGE'
-    b'qrfv3MT+VrXKN7t6Ojx7DOb2CZUTImN0bVIe8xk17PYfpKTyLbvFNp/hxPQ8Lr/rm/GW9/0Z'
-    b'XHnvd+Ghp78NvYnJgl9+Rp9Y5EtfY72nr7eAgDzYZmix3MYvwxpXKaRB3Ao2GRt8m/mLxKpZ'
-    b'0Q60NtGlzZjhZs4QHbP3qnqGmJy5+v7LYBrPuerMCTc2pus7EhfJvQ8CiL//5d/5ud0/9oUf'
-    b'AG7/xPf9KMFPRJiwAL2KD4BsM8KJEdyvlA5su2ifog+MD4o2eWkPL4lsqbhkL+X1b5wGkyIw'
-    b'PPaYwZhpihzL7x/5hJ+VSdN0J+srdBNr/jNbsDS1tmUBmVUmMK1o5sG/RGGW0boURfgXSJxd'
-    b'RX2WtAXQc/TisgToUheNoM/QLCqNEUxjT2OIgd5+AR5+7EnML1X775/91O/iF37q3+L3fuvX'
-    b'ISLojY3hiXe8K7ZARLCfLRqNiMQgXYkaG/MsEFn4gm3avbahfgHzp85XPvaDPjavvWSu3TCP'
-    b'4P6tq5XJDYCFM+fD51bSLeRNlIuyTdCWKACOEa9apcukWKUBOayMi049/ASeev//gXd89/+O'
-    b's4+/s70vKSgZgjM5AITmgEz5NDI34ZEgLnXFrREzirlfiCym26ndwy5v21iIM9vPmyTmq7Si'
-    b'16UNFKoMydKH3mZoJLHpKSWs0wolLieSJVfF5mJ94vnf/rkffSPU3DdE4a8/8r/X+lAj8Xy2'
-    b'KUx0HL8UH/KApYdDv/1MaSE7F/no7Z8aSFBcNonfBvGQqAS/njJdB4bJ1sNyLMUJSr6bnB0k'
-    b'LR1XNyQiZhNvhE9ZYR8aRndREvAyc1gbHjKNA5oVNvodcNMGGgGTlP1z6sJO8Wr01kNARtl/'
-    b'MoP6YR0HWc4iELJ8MKGwMqoejMGgUrwvrZ3GhcuPAAA2bt/Cf/rIB/DKC9WkfPrseTzy2Fsh'
-    b'IhgMxMQW+xNOsveCeN9CJ9GpNSuho3TN6egnTI80VQWQnQ6WLj6KiZlKsDiM59XiXBkMcPfV'
-    b'l3BydAh2Olh7+PHkni6bJulnPl3ZCEp8FvzwE4TBwMJUNY+erbMlo9NBb3ISk3OL4HDtUpgg'
-    b'mUjEZXqocMFh2Zc66sLfXoSneBBEbWIok0SV7B6SEAWdTOLBCEvxR8KC4JRSh0AhTNphy5KW'
-    b'FpHU5TS+2Gh+xPgZJjnNkp2Igr/3Rqm3b5jCf/snvu8/A/xIFoIhtFyvFaX56ZfJxU84/9IU'
-    b'KdYGNn099cHls+MyZFEUV+d5IkLK1sHi0AzSIKnU2QSCCFX7Ed2D3YlzHk1kZDkzPh6MCZDO'
-    b'zErUNVXi0WExvKt++DMLUnEbCtRoQYaQIBoR2TTAUtqfBMAoroi1k11qg2qifBX9mqw2iss4'
-    b'cN+kenDr0W1qehpvfdd70BsbBwDcuXUDJ8fHAIC3fcN7sHbmDEDWe/yiLIac54NK0/MnobCM'
-    b'XHjnOLP+FIZdumlWgWH118ytncX00goAYGdj3QithJWi/+6rLwAiGJ+axqlHnxjVOcXP31t3'
-    b'M+JTcUNDEhccFn5ezgTphqo9W9y6mVe+ZTwSRRN1iHm2RSVpXpCBAqyH4vYNmWFt2RdLMj27'
-    b'hpl64EqyLlRQ1+j8FAR9B+sBpvXxZ+EtOopLdJUQw1qkokcpsTymKfnI87/9s//564U/f1r/'
-    b'rggGfi+e8LaSdCKuBL7OkLWU7CmjAnq6lJBi5sJz1F8Kqz5puk0A1tQf2RwCScIt9D0n7kDQ'
-    b'XxMihZuGxK+7pUe62lFV0ZUSMijc95agEo/8uiB1A9WBG1AufmFqkHA4mu5bmPI+5qCXRDBo'
-    b'4EBkgF8QSdJPjJJ0/RKnaT3Bae42zXBQ1dGTBt/0HX8aq6fPttcewMLiMr7zz/wvmBiftBas'
-    b'QT3N5NOJyECWH+D3yJugF+fsJ440ZXLT6M9ldqXi+ffvbWBr/YaZ4Pr9PjavvgwAmJpfwtm3'
-    b'vD2hv9qCIslqVoT9s/hj1UhLbJrBGGJt2lCRqAgX2uZSDQQxAOoBjpQ6JptMC3TYiNDdsSti'
-    b'QGxCTRnWmhVRSJkDvItOVygFIiFpeGA2LYQonGLO4VRa+pS1SNlaEiNA9R6WpeUxrL6MUNod'
-    b'ZxkuGQLdvL4BgL/7Rqq0b6jCv/4T3/ciwL9joHchvCqKHqCiQ52Dio9BC0dXUBkWUu3hyMQu'
-    b'U9vdtjeAmFWetoiVuXlriMdEMxavgS9IItmD5H4/7ESKyZAuQeLS6BEUWqIO2LDnT5rrHqaA'
-    b'ZJ7RnDlNuJJ9cUxbJtquPGn+InjnjjbXKNAfGiMP4aRBSEILU0c5b1Dj11R9W8YWURmK3R56'
-    b'/G144p1Po1en9XV7PTz29nfibd/wbktjpbx3VtXEBFwN+XsJ9xQxmk3zXr52MTGsbwLodLtY'
-    b'OF3x9od7O7jxxWdMaT7Y3cLW7WqVb3b1NGZWTqHssCQhGTdqYBimWfEBVLRDtbc0Sg25He8n'
-    b'zuiG9on3ZvUWDYi7tKppZvKQoyxKdps64gWIErvbZqMkmZnob1azay3h3LLSB7Eueojrh9Jk'
-    b'jNCBspLEfUs74WumKRttaJ9/usHBu/1luhHGoJmIvlT//ne+9PF//+LXC//I4v+9/wjAMyRV'
-    b'jGuy1A7nZgXtFAZ33GpB0rDMS5706B8Elh6eNmaRJecrNyoS3o6V5S0b/2A7T31tZBHV4zTn'
-    b'nL1GrpGgNTzShUjCAyKm69X/GyI+US58GcdvnmqdPcLkAEdh4vYTc0YZBj/+HLowyWU1OlJm'
-    b'5GM+ubPsSFEVUc5hWuQkyX2OoKZuCYXxsXH8yf/5z+Gt73o3VtZO48oTb8d3f89fwNzCUn5A'
-    b'JRSQOKrLoJ8U23xlSIoze8iNkcQUqgjgCEhi+eIj6HR76B8d4sZzn2lfzmCA2y9+CXubGwCA'
-    b'5YsPV9dOORaWVktt1WAO8wZqwqnNUUixg7d6lXCbMWzUwCI4kqnvI3ovLhLW+l2IddXL9lC8'
-    b'CUpy7rQDDC3NxIz+EjuMeS4uSwj36JsS+XmDJCYjAtVFkiy7C1YzIP45ZYsOCHWAcJxGpEiW'
-    b'uijrxJulrjPPfOm3/v0/eqPV2Tdc4a+v3t9GnAs0ZhoOj8Dph+meIWFBPxgc4REc5D405deu'
-    b'oaS+NV6gE49G0rwaV0eMn1vrbUBJDySjrhb9tMlomH3I8YpfZYMpVEZNIPkBwqSaZpbiEY6n'
-    b'OuLEoAylgi8ZbO6lc8xT/iTjA4a+C9Jy0sbCVsqzvwx5ELp0rmFDJbqUZ5sOqh1khC+o1iup'
-    b'aKin3/sd+I73fw/e/u5vwrd81/vxrd/1foz1ejmU4zZGwrOlJtQstEqkkAovGbaBpNUNM1Kz'
-    b'C89OF6sPPY7x6Spy+NaXn20/58EA1z73SRwf7IGdDs7UMH/q9540WrqRRL5DEcWITimnkx8N'
-    b'Wije8shJYClFmkdD5rHYJVRMQ2PEasowkzJRuSjbZUqBeETYiy8hXDFDNycPmTaHCZdWK+RD'
-    b'7p5visiE+NKW086zwbEKjfOyktQE230aFiHp9cU0EhF54d9+I5bYN2ThX/+J7/0VCD5ojmaj'
-    b'sBbr1KcCKOjuDslWMZq9fsZJE0wgLBp7bGW0m2hxaLr8dKpAZpZhVddmS1hieIb3lNYdti2s'
-    b'YiDzEL+rbfiVoYt9bJPK7tfZC0ZibE/1VEU7nC5MHr0JFLFFUgrxnEYcOBRf+nQwKYl42jul'
-    b'6f3J1Ckx7UVd3pjZE679E0QKjspe3CdObcwy0SCK2+iO9fAN7/1WfPef+wv4lv/pz2Byaio7'
-    b'hJIjW/J+VzTIW2iEQxJljnNY62e9UmYd7ob/P7t6uknc27z6Mnbvb4Codvuvff7TAICxqWmc'
-    b'feKdxThouBRNO83Roli61DrMO7PQkZTK8X8uRUqB+Sxu6QV9brGANmj0R/KGq6ihYWuGQTul'
-    b'BIycHrIgXRwu7TOWvgj3nkUM6kqzV+/U+u4eIR16IwjRvYJM3G1XdwmxdK/ggRHaBhGzEEny'
-    b'+csHv/Sb/+5Xvl74///8In4IwD0mGUwhtU0VtQCxqZUX07snk4GAycMdbWypxlwiV5rrfl3i'
-    b'i3JZv65Ie8/ptMgxXz4vrpUUVtt0ELsksKOB8xXzoF+rF5/7hDtB7n5G71Yo5gIVwweDv69E'
-    b'HjFbZ0oji6F2/9WGgkhhxS01T0gOlohXiRMx0TdvhY7GaD/CR0PIYAAR4PzlR/Du930nLj36'
-    b'mOr1JKBjwuiRHk3oPTwOo4oST944gxUZMXWH3XJYr/fexCSWL1Yrinv37uLlT/4mBMD27ZtY'
-    b'f+ELAIDZ5TWcffwd1SFWr8AxQfzoGku/xx9uMcYulkWwN7JH1lrbQfCOohTCRewyz3IIVFMO'
-    b'4dCjcA5psCifxKhenwaljJ7MC/BmYCyvuhq3TFr0hCNWD41Zt1i6UbIzrHBW2Lfrd2cYri1L'
-    b'13d45iWZP0HpUUWr3wP4Q2/U8vqGLfy3/u333gLwt4bzj8RqYaEgJ9YIExkjZB0kdIUExvTB'
-    b'SCBsM42rU5/KNjiIFkdMdmYxhQki7uE/se5awS+AOXTfHtjDYZeFyQJONJilE7qVKVKJFwui'
-    b'CTroRkvxJCm2KSJhx8dwALrVomZSMetkuVRfUmyfxX7LZ5ebSU/fp948qSDmlyQmVPTk2uk0'
-    b'PHen00Gn0zXxp0KLelHh66mxUg5aqs/ENqzDJkmUniTXuyOY9hqNS/1od8fGcOrRtzZpil/+'
-    b'7V/D4e42XvjER7F3r7IiXr38FkzNLRSw4lwfkZm426IC401g6gcFhUzMESl8Em9vJDRL8vLE'
-    b'vx7TPMsoMMjecz5zwjXewlIgrxhBLDFqEo5K9+x663XhxtsgGWrsT5dGLCxpmx0RpsA+BLTL'
-    b'IX3C0jdOk//89yDd2VaZB/2tL/7mR259vfD/9xX/HwPwqzbjxWVlpza3fopPvNjpPN7d35AR'
-    b'kKH+vmbfnVbs1050YodrkYJbnW8YItzvTqP4TUrS/IAiJFvLUiloJXCesJ73tHAtUNqvzwx6'
-    b'ZNSw3DZFNflGhu4Akn1vYuSOIdPLo3hys2okTroQld/plIGCop8YIbaO9yX9wZ2uetNYMg+G'
-    b'Arf6dQ1kkJ6/7YqUtAiCvp8k4YlH2GFq+L7NtaAr7lKkXNwaNwREp9PDqStvx/j0LADg1U//'
-    b'Np776K/guf/6y+gfHwEkLn/DN7sXENX2zQTvU9SM+J4BDQm5GArtSPVwlFzzoARfUhpIJEGE'
-    b'ROOXpajuRJ+iIbk0UjxxJBHXqBkdVPt+LYpD5/RIm5za/CuL5VKc378EsaReqZMyKCUF1X2I'
-    b'KHiQwY5+HqQxgaIWS5dVy+0dXn3pr37xNz7yY2/k2vqGLvz1r78BZ9koQuOMpR9RCTuqCYhT'
-    b'w3lZlGv4VF1+tF3zcJIcEesGOOSrCGv2wxJkxQSGLFSMzAaQI75ecsEVmQOIDNOtBOOkZoKV'
-    b'VB8eJg0pPpU6IEN9PgFhsRydZBsYYcuP7oH/Q5j/CsNeLsVBhHoCZoZCqMlFUDRD0VbAOsHV'
-    b'nb/1ZK2PIWt20ul0MBgMMBgIpD9of5ZjUcQUN3FgiaQFplj36Z367GaNGNhWw7tMw1X0RV+5'
-    b'9Giz1rd37y6e+6+/hNsvfRFAlVd/6ak/4Rpu8V5EDhnRPvwsohypBYjbdAnmfyWbPCPUd+su'
-    b'2mhMlKEPmXT/tGQlPX3mthSYQ90UT1gwiOr0/1q/DhYLtc6xEMnwDow4V5OZ/QFLN3G1F+4Q'
-    b'Qe591FxvZm87Eso+ajn5Y32/qXngb7zRi+obvvDf+rff+yyAv+kXocwNx/xINjeUvonraiUF'
-    b'Ij0m7OV7+DZ4RZoCIdb6v7DalBXtmGneNBdW+2L9AZxoSeLZYw8a5O9LvENZA3FI2+L4MI5R'
-    b'u1Pqa63KQty6npvKBcoSORIqkvU2TIw5NDNES++0meP+02d6EGiqiYbjlATql9FwrBMoGizD'
-    b'NYVtZry05lWAWfsTSA3xdyD9PsDqv5WrTu7trjlhiXgMJdNqWT0Fk1z6iAbpV5qICWnvX0gV'
-    b't3vxqfeCnS4A4Nrnfh+HO1sAgLOPvwNrDz/h4GPdD7vALiPUKwtVJZlE03rln38R5KH29vvm'
-    b'65N2S0hPsJKOspILCzMnzgRIExM2FTOFTeEmCyaCEuiJzII8iFlHhBZJkr8uBSCfXnJpEAvt'
-    b'd8HcERO5RwqV4CRYX4RQC+tYqs7nv/mF3/iZZ79e+L8Cv27++F/6pxD+ehwOomOVkGWlb2gJ'
-    b'GCC57C97qI5u9caBAk4rwJQTMzcdFZPGyBeKm1RbHSDDAeBfjz8MREZwg5KwWn5tQZxhCct8'
-    b'W6OTEquW1ms1OX/GxJBJimmJoaM3jloSuvL2okaLUCnygO3rGn1PtVNmW7RzKiCC/bR3JmlQ'
-    b'BolYr13dBMBON82L0Kt0Vj7JhM2EilAtVr007HDo3uehX5q2PIo1xF2Y7tgYHnrPt2JyrvLt'
-    b'Pzk6rA6s3hiufMufwsTsbNT+gIlho3399FB+VLumoj+Ttuh2XUlGa3s/mQrd+q3lhI2Yz+hA'
-    b'qB4HSZqaIgsTN20lc/93z0qJphuVVGqGEndttbBS/MnpGjaW8r0zusAGcQmQWmmbqVxoIJvh'
-    b'JtMwc6UxakvW+aKBnKj14eZk+/XnPvbT//TNUFPfFIW//nz/+oihsiXv3MaW5srI2OKXrGAF'
-    b'ceq2iWISNXrMQk5KUDp98JVtCgpQf6ZZNAOD37mmWyUy04p7+Jgw8WRTAARRWJaBhO0WviCY'
-    b'8MFN8MbJTD/XaqWOeZOS5iTYI8EaiunPm9abX6/4+KnV7H8zGsCJD/+lm06GWwOSYFJsp/Hh'
-    b'4eSdzdIdB78uVv9np8OgchfFVRDOCCYkC3pKLTNbzkY41XiaItlqYZj4JzKrlPWfrF1+DJff'
-    b'9T506xyCanf/bXjL+/5UUnQk0HHhw8itPZPnyS+y2kPeeoE4m+xhmybu7xAF3wq3MhhuaMGI'
-    b'uhvor2TKsBIR7Y9fpHQyVGTEOm+mgUnQl8xsTKMRCAmBhaEgeb7z89samaXiPWmblca1UaRw'
-    b'le0PlbjX/9ffLOX0TVP4b/74X/oUgB/KssBp8W/3UCI9OtkEqngIKUvJ9bnlrmhJzgk1D5o3'
-    b'Q2OEncT3pw8OfYhTyKgHNwZSx5t7eFiJVjA7+kM9YM0gTgkHF7PZQvOFqnECUIhCynfMIw0T'
-    b'mx/xDRRlxNAqwSpF/7e4mtF40iP7Pi7jTKwTGn0ipFDFIvnjkchIg1TX6XUe3otUIsqitQui'
-    b'UCcP24o/+81Kk6jb3gZgRbMe5rxqoQ5PLa7gqf/1/8Tiuctgt4vpxRW848/+eaw+9BiKojWn'
-    b'4jTuasb0Bs1GAtJgLzpzy0RcK7Sonr736RE4CQ7jKXzUfA1TdsXQZMgBFHuDudbRCY6VX5Wx'
-    b'y4ojSz6AMGxZlYanVmiZB+OM9gmJOEbW47BAC2ScIqIgUTWLtB1/QHWTF/ZDz/23n/rU1wv/'
-    b'V6f4/xMIfs3eeVqgJIkbJROV/PC5yP0ecyOQPM2FjZe9KmRhaKc9BBRcLukt7E/tYSFTS68q'
-    b'DjiNgCxspCpcLTpW0PLvhTa93YkfTvJCA0uWpvNyU5L386I2CbS3giQhM7EGMNkzRLBIFkoR'
-    b'ZBHthsJcAAAgAElEQVQF6WmP/DiCaRGW9a9NBw0Wz1ML4WZmYF5BninRxAtRYyPmmRxjapKN'
-    b'O7STnHn8aJEPDn8+GTCeNnGy/LnpYf3Uo0/i8W9/P84/+TSufPN34ZH3fJvfpQnFwK6z2pAn'
-    b'ljpIjCD2Jbak9j1lGnF6vNG92iQWSTgyXM+onJwOMCjXZdhe++0ACb2BJMNUYfJItENOc5Cs'
-    b'PdKct7k7oC/W4hGIxEY3U/KLsxsUtUIbL0HbFJgUviA61U1OTGwl8GvP/fpP/ZM3Uy3t4c33'
-    b'66+B+IOmPRUiWIIxovdDqNqsoYRzsPmmzupSCpGQYqPaEtUZC1K6dE1ME0uiVsxMQqGG8R1+'
-    b'WIyNEwVlJXpCvSdDpkdpnEgkcF/F87NjGwtBJ2bBqM+gM+RDxX5eHVeAbHwSRw0E0Il9ZkoR'
-    b'WhhQFybaVTW4YCJ77dzXhzUDdYntaaj2lAVEx3rJqWvQHOaKvqHjI0Vdb/3Skh4oqZuCuJjW'
-    b'aTjsiOyLmVDNvEgkvs+C8la4X56sGrLxqWl8w//2f+GRb/x2zJ06g8UzFyPSh057o7kbXLzW'
-    b'QWy33Lostgf/wPWnkrSkPm9QXACPiBKaSbHGNWfLQDfkRlvjW+YsIdPzCKKU/zT8fbWua1c9'
-    b'M+rO1nUCMrCGZCx3J3leWKt81hohUhpKafgaRaIw0QwhWksxXEslUOW6KmM1iTa9kGwAkbaF'
-    b'o0VEmu+vEACL1oiA+GtvtiLaebO94Js//pc+B+FfNR23P2CCAlWM6E7PQLafS4g4Zqp814Un'
-    b'pj4YNTEzL6bNOxJJ3PBKJwcdn8ckHKo+jsxDIxGKK/0MClAK4QAevCCX5YXqulh4X8wIftII'
-    b'eQQwgUHNVfRmRMkETcl95jXsGYun1OeXhKnSykAzmxHJ8xF0Y5KkgRnTNCtdRBiKXGPjySS4'
-    b'6YuOIigRGLqAGQ9/L3RLbWgt7pGZJTHcy8Okxg5mlldx4e3vxvK5h9AdG3eFxR7gSH2x1PvQ'
-    b'scGiaDrq/o05dZa7g1kDouF1JNOwNt3g5ki22HvKI5jJPZHZkRdgyyAGEGYTgKdMrTWuePiK'
-    b'TNwb1MfZXO8SreLOOm/G5r4yteKRDLXQQx6jMN9BwdnnZIwFJc1s+auf/+iHP/f1wv81Kf5/'
-    b'8UeE+IXmlmRyrPqc5kR0V4gLcWePW3oThAnTILcj1GhFWF6YcFLhDsu8hpIY2EwKk0cCs+Q4'
-    b'5gOQJH8AEfzzExwjuPL5iddPoE5g6HMKRNSkJ1arIYz1dqgqlggtig/SUQeZwbChQ3qSxDF9'
-    b'PCQeAPAoE62umbTbIFThThqxStcME73JUFZpGjvVSYrEA1KkdK/lU6BGvMR4pTt2P/PG8K6X'
-    b'huONK2YEgE4nIXeibTUlA5rFcPJp0Ssn+5qmN8fDxDgqSpbNYeCZGOZIW0eRBcqO8lOw14QF'
-    b'BkPSHtybj6f9jaZ66PBHTS0pLQ3dPSWZVXPTSOYW7GY90DRnhRml+B8S3RDdlW37HwleSIVf'
-    b'v/D5j37oR96MNfRNWfjrI/GvAFhnqatNfKilVHihzWgkgEDI3MuyppOJRsXEQMbITIaNA28t'
-    b'5vfGY8SIb6H9rnEug2LZmpiJ1S8yG1mWz3SDyzECFxLPZf35iSvk0UJcBf9I5v1uRYnZS6ya'
-    b'CGkmPBsiglCA4GmaUr4w3bcYFvFEVE46wx4NRzOKDo1OhOXDn9L6CwynFbM94mii8BzJgx7A'
-    b'UkywKA6e2h+4uReFjPgA9XqWVxWW5FxWKyAZrQFJ0R6UKLd0c4zmPYrYdloSCDr2vuLMYAo/'
-    b'U3knyIgugc61Kn/PYgWZwmTrKA4z2cp0lMJnnQuT/UhRtsgFwbHkYUJwbKpIBOn9gCGeAiv1'
-    b'ASOhVNdhQDwvAhDrAvyVN2v9fNMW/hs/9hdvAPjL0fRLbEKeGw5YAI10gIrPZuYf5iAMnaR7'
-    b'eFIrUItEiLvnmoaFNPecwKnD4xHTFmiT263vW+vEFx8FCdGho4JKgtAo+KZLunecbHFBdBBP'
-    b'Epzk/z1cu6ZD0Ly7ZOA6bLTjA4JYzPuVNLZUnCtRQzkEwZKvbYzxnqn4tOT9ywAei8Xx3dEr'
-    b'xoVOShOh1qUr9KAp0/VDRbZeBxYByl6zGGUG4dQFXtHJrGy0DXn0wGJBNJZpJRP4NovQpWpq'
-    b'CG/BUeoYivd5bEZb6IsF9M+D2OKyLeiLadIQB4aIqpH33b7WfRRF9+KCeLxY1tNJ+YJiQCV9'
-    b'tkpQyYr9/FRz7bsXls625GRLRhS7tdF+s7/8+f/6oRtfL/yvT/H/eQD/UoKzRuR5kLjhpR3h'
-    b'aHcbNxmzCIchHEbhJdiHWkpNqDRRtaSeHuAiXUXxcS38Rl2IRZy4kW7LhdZCRmcLS/LaiREt'
-    b'eKxfoh8kRpqkfRvtpCgKrckoAnOQilgPFCUmKo+xYqZkMUWOI6aFbNpXgiDaaTC942o0J/9e'
-    b'SDrVRJHdwgTuNcRQF2T2zMxgIma4vmkxwoqhlm1IpqzXL8NC9DIa2suMhA1UJKG4Sh7IAwRL'
-    b'bfn/2nvTsGvTqjpwrdNJj4mtSZp0m9id1tASpZnFoAbFEWRS5qmgmAQuoAkxQDEVNMVQTBZT'
-    b'FRQgCFRJQVESZFQpGf0YhaKkTAgEMaBpqkXpxNht0/2u/HjP89x7r73vU3AhUPV9z31dUO/3'
-    b'DuecZ7r33muvvZbdiJIqSJAoLuwRA1eZlNwhJxUkQ6LXyYODha4Obz9UdzQPFMvYcL39R6HT'
-    b'6N0qIzLsRDnQuD2ikcSSfV91VnRFgtSktKobtcyrfEX66J/A9E3Uq/rpENI51vOu+O1XXnxN'
-    b'jp3X6MC/D/6PJPDBrJrC6j1OH2phH8Fc6Y2dw1fe7SJ0LHWOwZPyI+0wTJUP2UOQmbfY8RZo'
-    b'lp42OnQAsSuEIzmMZh9HYetkj4AoxZY4T8w8mhOgdlWTvgSodLPV2SimPTXZe1x9YOCMjal8'
-    b'f8RMJOsT2OVmffWuSCSMFd45OKJxeCgoEwsqOWyAM7Eq6uZQNvJVcgAe7HQFZ+eMQDEzpoXJ'
-    b'yGuDOY1WBa3tUx01Mx8CpafChojKtk2W1ew81nTjezwoQxyLBBkfUtNInGYkkj22i8cwJBRM'
-    b'I8rF0bTl0ugAmqdGF7+xoqQx962ynyqKhMKJZgSQ9S6qPNgs92Y01EntSNMWXe5L2j4YZK4n'
-    b'Ln0fvOLSVzzymh43r/GBf78eAu3tyOKFM4HIWX+p2/DoKBabJ7uVB6bBynHmVzgkRRc3Y3UP'
-    b'ZSS5sPnNdQZV9vCri/sN1E8UUHExy4n+BUamlKoHfX4aff6nkaVpmd2oetjstlwdiE8zkyNk'
-    b'7fsmlCkIE2mFQ/2Cy6R1kdAMTgp6Ne2FsvvQjs6PnwF27hKd4rsw8YHWIOWtRNnZzHOZjWLq'
-    b'vdIrJ7kaG+dom5VcCZqlbHNXnzjQ7qekH53bCNKsOz6ZmFBo0aUEOgbcpS3HBpK3VlW4N2kP'
-    b'qFD9Pbyb36mSsuAE2RBLdh2jyz2T/VPcOyt8nxOccP9PLKrLo+iJe3HAyY3Y0hazDEvTbV2N'
-    b'8mQVU6/PGK1JBoA4AvCQkyFgnhSB/4/Pf+BlAB68QnUF3DpAzQwmLj3jN27YlnmqM7fSZMwt'
-    b'1JLss+wiMRv+Ms6aS7VcZ7pZO4xK8Lh1CPZGhMvbUckhNcvcEnTKpJ0/FXGg2Vjw7LOyqW81'
-    b'w42pLNNrh3uIvE5VYl0OlOF60P89IQEiJk59cTgqVDs6Vii1CNOwl1Eum+NEEnpNNVgbQAg9'
-    b'/HGBgk5FB8/CxROVNAGuGgk7mB1U10T3VFBVYqwShjrc7pMO/TMlYGvi3fEEPHgeHvAfiXmZ'
-    b'JGJ4nohOw0oyAJtNZ5J5iKM0BXzoqJv3Ly03zt3Chbb1kRNKxDnLgAbMpM+zcIOY9w4Ftcac'
-    b'gKlF33jALl3ggz/5zldctgX+q1fwfxnA83tS1hDYyKHRqrcQXXlIkMYr9QQYMDxuTD1FNtVO'
-    b'cWErIkBEg1yiV8BSgnPzY8qAVA/to9nMcxcQZ4m8UhXbPNxaqudqmJP0l4LQ0Cq9G8PIVRoC'
-    b'sn3/KL8pF7xZ2w6qJIJWp1MdTp+ifeyXylGboCxC24BK1uHVi/3bVBsyuS1WzPvPxugt4gmm'
-    b'ao05jl15U1Q351TlecclUa3GHcxSDzvXgMv0nIo5/WPfxbH7PaQApt4kdra9bJLsiKDXRJvt'
-    b'CDEOWM52KvZE31JvVACU+9RcWfyqt/CBlL87ZpYIyex7IlVOkh2sGsBqPp/YP/vzIWlT1QzJ'
-    b'eM4jl88+fECG4qhWFdK42YZn5fxP/tbLX3ayxMuTJvADwB+/5AEPFvjhDNmzuVlNdx1h3Oaq'
-    b'ppnMUERBWW1R8Ir9Kmro+Pp4l1DF9toWADuYW00FwWI1LHQWujJo1yudbhti49KVH7SWGrbO'
-    b'27MRRvHCiOnF2M17szU3LToLRblXNgZFV3/LFq/JateIQMdJw0RLfVqlGqysJt1SrZVLCyOY'
-    b'+tDY75qYkScSGc29nUpA8voZ7DyVEqhLfvIrTYOKGglYctKWkevSTfriE+TH8pp0YR0JIsJY'
-    b'r2cc6i11BwBmJMlizey6H5rEvGqURU2VsFOly9h+g/E8mkER4YDFh1D0EqRuf8j7SDTbYZ3v'
-    b'gTRB3JifA6qGdrE5fjPf6uyB22RJe3cUNf0cjomY/f9/+Pd+6+UPPpli5UkV+Pe3xwMB/GWu'
-    b'ldmbKzD3JAepTgZtdTuQmpvZVN3SJhnmS2nBDLBpcxXxQXXWlOxILzMo0+V8tWqqr39tsEKu'
-    b'GHNATFvaXiFPkwI8Keu53G21fEvjQ97ZpHrQz7TLSoEu6xOWXbBDIuOe4GSEyYx/lkBdEj/D'
-    b'RNk1VvJG5+5iBepfiWIyWdSGvtVp8mhS97HJ7Ur1TLSw0n58tBhOdT3hOHKrGhDqVXUNps6V'
-    b'brgDlmSrqHayr7ylMkghMk1u+GuyzJWi6O7XGj1j75rcG9PL1SXARe2zjtCyuJjmkbWo2y/n'
-    b'BdS5ycrpcCW8VP0zOzfCgu6cgoLomCTPsTu3Qc2EtuK2zkYlsGyZf4njmHJSrZMu8P/RSx54'
-    b'OYgHoITRpvpIptl59GOFgKQcjDiNv4HcxylYUKKS1eAzDIylJ6vW0KMXOrHGl8PncGGXusMs'
-    b'oLK6tqLQ2g2tUDvjTHGAaRUyDjYtDA2TkYn7JqYJPjKxkW0ZqoOtjsmUMTr0Prv8eenUD0EX'
-    b'34bC4VMeRVLtvbBrzZRZdtWWAnkAZlVmXs9607FHzfHMMI3bGfdBOTAHMKbJMjjhZiox7F3K'
-    b'PU8AGMFXGkpxTaJLZhUuLRMPitP1GX8vHM+2om+ebnWOf2rc4+z8dC0v19JdtQ/UPKdKXhXp'
-    b'GEKdQtbssVgveNj3FhBH6q4mFVk5TwZrpM593B+kPsGHyj2M2fRF07Gb5cEiHvB7v/nyy7fA'
-    b'f00I/i9+4AUAntkke9OhJHbMJ1VlM5808/E9tBmtOuSpB/jYyd66lSVnKGsptYmZzn4vWLwa'
-    b'w6TPw4RQ0M6EOPEDD2iHWGcWog832uS8MetN/dWZqkgO4VFX/tBQmuiogUupsFYpyGNzUTWw'
-    b'VOndHchZgye+TW1VDRSoq5/20Cx7ODbN7huLPOnO+0NTB+Zt9DszrN1ceCq1K78PKiE3To7M'
-    b'VHY764fW12DieDe7JurIZayJujRPrGRJvoq2Qbhv3G9HzSw6a6I6N/5im4BUaCdP8xyS6xjt'
-    b'o+x7UlsHKkl4vAdSMZQASRWkp6TkVWTBCHsZkVLkb9Eq/3jZxud45u/9xssuOBlj5EkZ+I+D'
-    b'/wPOIPDm+TbfDPK4xBStuR4cr9j5AjSs60mc30NWzThLfPYDw5tsmsc0KeJ9hSwc4CokkhJx'
-    b'cGw9VQp5Ex6jbRUJ6SuRCazecBdW7hg5s6Rpv1cShuaD5OqajVZ8mxL0m6Pt8UxqeGygz+o9'
-    b'0Fs4515ndKtjgW0N4yXS9U/vUTDzPN/N6GCoxuq1gVxiMqFmdAoTHYxet0hhqJXlXlUbrKcD'
-    b'bC1kXuU9Gpa6MLmhOYSixIxUcGjYr7/joZlxTI6ThM0KEbY2E+G5r3p+NegHlcUcunNLjWzP'
-    b'rBqAqDWLMnnjBM2bXDA7wZwZImXKhSl/pSGaMdGYTE0oRAA2KNr+5d58+W+89IyTNT6etIF/'
-    b'fw3vC/DTnTe7qObesj6sNx5Vs8yK7nllg+mTS/CrEEqh9UyBThicqTpn2ztHmIVeCVys1QET'
-    b'QIrGTZAw/d9JleWPdzzLBNGTGxcN/bFBNGpgcsllZJcbdTA9m0p06eHWaM6o9y9vfdQkIBP8'
-    b'bPzRWknVJndE50abBZ1srnosqZrcBfIpW9iTONBlqs+VJpHVHP5YBgoPvGzrDhjvGSUHylrP'
-    b'Kqd3TWaZjZzYMMIi8hACDFfz3UKdSb4RcUSMGdWgmn2jFemKYmOsaKTy7P9CmO1aWYrHo9wC'
-    b'GWB41avv5uVrolZ9GBknaCBUi7BKrMyKfzp0c1xF4s9yLQdqwWajUb71s1LTpwHc92SOjSd1'
-    b'4P+jFz/gSwBOjw/fzLTH+/JK2WSmk0tBYdzUsMQG3gv3pDq3LFa1Map/kDuILjPaVXRbhgQh'
-    b'C+os99qRGuRNpdqjnZO6BTP/nqUWh7P9ELxXQxR77Y6pFh35QhtBE8igtDdorIvgvS2rONR4'
-    b'L6wvFeckU2+SiTw61R7AxBkxciVW0/Iy45fvYRsZ61PWIcpTcDB1xVhtXcjyHKnWhmjQFRdE'
-    b'rBdoUvlRDbEsBl1MNvnR2+9c8NaHb4Gx5alszlZThX+gx+8AUH5GYnZQ9UFkLRy4qdTMw57h'
-    b'JiBCuy0cJieN9a5Sjm57puXAyB9Qh5cpncsxStkUF4kg3ZD0VICndXNfFRoV75GOXRATonKM'
-    b'p1/+jvO/tAX+a/D6wovvfwLA6ej6RIoOW5qUNnbDxJEgWtZfKmPUsSiNUk7er/RgEpi5wwqT'
-    b'tdcaNrBkx0qf00YzljbPrj2hyLCxVyPdrh0Tpzg4OTYIuQ9AuDZZJTD08VQrbFrg61qKDv3R'
-    b'q7HqkpRFiiJSYqVs75KHMk/VQrLRhMa5DXUuMSeT9I1zEkFZ1d1QFB5718ciNBRYnmr4AiwI'
-    b'lqs01p5qT+5DmTLgkpzo0NT/TMQow9HyG8oywpWtb7r7MsdJKReUmYXeuD7aniN2Sn1dSqNp'
-    b'NsbVWZR2DFYBh31APfGoSOOmGL+H01c9ENUspROTQnN7pjvL0UeyJvZrjt4QnARU7ghxgNU1'
-    b'S8xO/8TbX3LiZI+LJ33g3wf/V0E4S2Ujom2+VlA3QafIa4Y+36J3PtjqLAxehiBETOzKF2ny'
-    b'NQblGdrxWYxUxF5tR61kr4pVaLv5Bne0HHBUN7luAj2dTJbtjZ1AiVQq+vI3sWEimpDLRKbZ'
-    b'5tpkQVNt0Og3USpI1TbTAuu1YT7fruvvRUsWLmoKKE8s0UGV+XNpEVFCbhN4kZuSIkYEaRwL'
-    b'k+GPElQ73NI6ZoYwxY3RqMYZYUsrIlOZ2ZpcZxbcW5Ph9dxmQodIpS2ArQ0zjOsx84MWwnlN'
-    b'CVNnrNUELNrzpr7dVIh9tHu9NTiqfJPleiuiNdFIyGKt6O2N8EPa9AUi+jLhJJX8oaJA7E6X'
-    b'EaUParMcr7M+8baXvOpUiImnRODfB/8zQVxQZtpXxTVmG8uyMTXZN9kyhLN8Z4Dacx9hhcjy'
-    b'jxv9fB3OVpn6GCpcwyTOUlq7nMDLTUeW6IYKan8Rc7jZbYMxC1zqxwq7zoMme6wOOS2aJ82S'
-    b'iBX5lJmiXPw4zYREoSQj2Iv6ZmsZZ3SF46RSXpMRlzVT1YekJRbQ7E4KG3CxQwziPing7O9j'
-    b'Ls5yM+kWHm5lRDW+jvhG1ZRsgtKrucSefGJymzn7nJZIuIhQUpmQX2dO602BvVbzBB9il+TF'
-    b'G6ZRcnT8XqrFTjU2mnxqsbeVmGhHpBzY9tBpN0GNjr/qMyJMFDzC2GUxKlbpTviHuOCyt734'
-    b'zFMlHp4ygR8AvnDe/U8D+L5kf0mu9DkP8fIxGG+iqdsk1CJ0Ve7a6XqsvVAEqL+ETs6e7yzd'
-    b'6WnxgR5eFiXMMrnRd5WqhKoKnaNWXV69h/n/iOwpkx7GMamD9zwByopnITTVIMSAl2vRKaDN'
-    b'pVtS1p08NgkBR8Dqr5MaOdHxVegIpWq0kDyLgl6la6no3yu1ovJ4qopCologOgxLBnXKAusr'
-    b'9FnZA8o0Qhab+1UT5FuNWWE0w/Kx2IN9+PicN2JB+T6MUD/LSH4rx0w26pYRpfKxQLbtHibt'
-    b'H7WoQ01kmHv+uWPjaU1iyJfXJStBtsukyAl8j8ZsS9O9iUKro1YnpezRtgx3ba3UrPN9l731'
-    b'vNNOpVh4SgX+/YN7TwCfOzQ9kh/40JdWV4DT9vROVDqPOq0Pr+9qEvqOpZoCuBcl6rXDJyL3'
-    b'bNjlM03ySEbgHKT1argdk+w+azgu+lgXmqGH4j6HIhtb5HIjPG3Sy0O2d/yeWwZrsmkNgRE2'
-    b'LmvV/mTdbdW4zCWWHE3RMGUUTYshQwiZ38ESQGJ7lja22vnfiS5yw2FtGoiuFT7OJj+M5k1k'
-    b'VoxsmO7VmVHNVBxxeI6gw42Pr51af4lw3tuJjDwtcAj1muOGcS6jS45Uxx9Tsqa2MkcGstCr'
-    b'eaIRE1POqIwL0UqdNIqgCU0NjoaKNuaJaOztRZaiKF3V1I7q23pSV5FY6+L43v2cqHueanHw'
-    b'lAv8Xzjv/p8HeA8BX6GyYEWyj6WL+tDgxI49UyGq9rZ0wk8HoRu81RuGRd4As2tcqViIOGFE'
-    b'O6y1KlYgPa5wsjlgXWUrwh5a5X6fGkUQJSswBqOb7GPvhX/31pz9q/GuJZq591XsJ58s+vVN'
-    b'521/FKWvKXvN+MfyqeoB9Xfsf9Y0U+pgHJrOSY8OsZNgDG0hmgth5LqtPJWwC1ODChs5sJqQ'
-    b'9lKbRKw6ihrnSDPXtMAvaVUW3ISnGew/1OLLHst+SwW/g2KixKtIAVB5A6WAz+42nKg25ntR'
-    b'BWXMQT8L4LBBYXwvIxqL6UnSqbYMH7a/EalofCYbd0j7jEQyHsIMLVoLmwbVWQyMgK9AuMdl'
-    b'bznv81vgPwXW58+73wcA3D2Ok8iMJ3KFUeiodYbcd2bC9OiZitTeuINZQpqTDNh7c7ahaWZk'
-    b'Im8WmFzpWgJyohpAzPrdUzJa8r3PG5U0qVQCxq5OXEcHglpsdWiGCCAbJXVID/MGy1hiyuSg'
-    b'jdLvydaaHrAmb8u0ho+Zxh2va42Mv+8+b95ERWthhb8pwrLMJjzs0OTYlgm7sgzin8rtdtbV'
-    b'jClDLdcYkIuMvFStjcRWl0oA64XgK7RPu1cG+sCqBIQeCcuTt40v7iRrlaNl6tGj6CNfhJIi'
-    b'jL+IMoVkujogOzMjJkwMiI6q413B5O3aLfdgKwLROCI2GxBTf6L6c4x9xlo3apKLY5Tq7h9/'
-    b'y7kfOBVj4CkZ+PfB/xIAD7vqtBwrJFkTXFYJW3XKuCpwddre0piVWtYx1UmcmhhNmSljsmk9'
-    b'3nuI3nQgR/AZeaecHNZKgF1HgpO6gjPRDg3kgb3hXWdNWlvv1bFtBCX1fY0luJN7AETDVnhS'
-    b'vHbFkJu5KDtBhVFOvyadRRo72bmWG5ZzpYqLMGLG6680XgrMfg4VWMjAfgLE6dr2+TgmZsRB'
-    b'O4FVH7vDz4IgXrRfnglidZP/sgDVEs5cIMivP2MrA4nkKObjYX3xwuKvI5f9FAENjSAaO+eY'
-    b'EIVEVOrHNrvHap1C8u4Nm/eyBFq5XE+2wUiJHxoH0P3IaAPcRe0TNo9Lbk8UwZKHffzN515y'
-    b'qsa/UzbwA8Dnz73fuQCegrSHTeagm6cij0B1Km8NLJiq23HDZl/wqa1QQCRqIuKsVa5VZtDU'
-    b'DzTZ+llthCptSRNQXSqFTPpbqhkYZoUz4aQ8R0tY0AXCWgHUNBCrj8wTyd4KSWRVMqt6pQRf'
-    b'Kn0688Ntvb6zG2RlcGfRnogOsDEr73n9BGe3VOxnq9E66BCa5aQq5cBwTUPZ/RcFatbnJUjn'
-    b'DgEqTfJTjWdFAQ3T5PGlpkna4qvACXQ2DGS621fpklL+7MrsntsatbHprQlTVNRMiFcJZgZA'
-    b'uAuXUJ5FUr2LKWkBlvX41+M2C2h0Axdc35qIGiVNeqoeQlRbIIRRVfdUSJ4j6Y+e8rFff9G5'
-    b'p3LsO6UDPwD823Pv9yQA5zm9uL/JzEaEneWnE/EYqoCwGS1jVwklDJTdZrOTD3xPvLWtrdz0'
-    b'ENWD5OuTqTJClieI5uzcWkPRDE0GPB790ClT9FP3emhkPjsIb7YZqh2GKFV46EVy7C1ZruBA'
-    b'v9MnMOTEyOJ0licIqj5LRFe4bsTsKptuqkETFTnPOeDTlKps6/R5mLQkOj0YKqMo8R5aXdsU'
-    b'6K9sjIFoRkhq2hEJ1Z7oWSjLcaWALTQjiPsr2Nk+Kl7HOm1xqBWYFAOZtSdKZY2JJHRMljsu'
-    b'0mSqzzVIoqxt1hVRqfgVXR+VL1AXYJcRu9XU6MB9mH0h1E4DsG3uKc+/+nZW4Y/zPvbrL3zS'
-    b'qR73TvnAvw/+DxVwEdW5zYTuV7JC70ltJHOvLLJfVUl1I9HOPvRuDAIpVZlgD31GhnHWzvM2'
-    b'hG3qKzO7sTH1CTJlMQCffY9bq6ROEqcrcGrbQtWgtiYbqrhjw52OJiRZA7042HiqgTRG1aAG'
-    b'pc9hkDzlxxjewzYnSZjPZvXa6qU1E5IVWBuqlPPNxNjILc2OKjHMs9uhGySthFM2Y5z7FxFw'
-    b'4BiKZF+iicWnow2M3c3CBnHypM0scMvlbFC8yr5lew+uc+YLD0OjcdDJ3WrSPvO9gamXH6cw'
-    b'JoluKzA1zqxb9SQ/ABusPyTFtCSHiqimoQipym85DzYwmASijDckNMzhSJrlRb/7phc8dIt4'
-    b'W+CPwf/uIN/RbYIJkl+f3RkP1qfn+4eZsVuoSF6Cs6Qm74RGdY+lInVte860ZaNWuw6Km5ka'
-    b'XUy8mZnFK6koHi0b0R0b1+GQLpRnCKH6K9rj3kNlbdcwJC5lPK4kBUyoRPJLj6IuhYikPM4+'
-    b'yD0AACAASURBVCHSEb1wwDK5q1aTpxh8GrCQPqQ5bFVbBePayMxSljl1L/QX0R5JpVVRnQ0m'
-    b'SV93rDYZ1k5zBDOqbmJAmgyEK/MQxCZZsixXVgB0D4UaUST5lIbphAg1QcTENAvo6YksOhrK'
-    b'CtEzfYHlyqhOifRp82in0ZLbOm3EKWJaRHiZWw75BNJOLhs+gjAbKaL5AkB4x0f/xfPvvkW6'
-    b'LfB3gfSOAE4UdrLDrbOKzFNoHDK2q4QiTuBotpajfUuATYWtxYQGro1Pk3/XnPfXP14D5CTa'
-    b'IB0hxZgWTNRMEXHjXPBpUhnGvr4S1D912mXelJM50pr4ZIllKkCzxulI0yFUXxEeOIddIlY0'
-    b'XMIoRzEn6RAAZsvceGuuxxJNpcgDbQvXIWgg7HCduCYQhyNANTtS+6uthkNJ3cKEDDU9xx0x'
-    b'LGq/0wQCGFWr4rlntqyNcx+N/H0Zs618C6XcjS1h1cR3fMSYE7vwkDCrqBZWw6iZEfY6xqw+'
-    b'X2O411qJjWAzXXgD/jWnV7i+Z434bll+AsQdtwC3Bf52/eG59/sLQHcAcLkcUg/WrVLuFIZR'
-    b'27TpxPn66KK13JjqNoLOQtjH7mDqU8zwqMteMmwsSRvf4pJaCp/3IKu+AVvcQUUSd25lnDc2'
-    b'rqM/DbVQpWxAEqyJpCHf5F0WOVqXOpucvVFpEbNPsKNGlSU2pqSqGghJocbqRdYAPx9lG/dC'
-    b'/VEjlaQcOsZ+2e3WOTeJI3xrMhcskfuKscUcmgTJmhnyU0DDEhiUBdlYYEY/ekN7BqUlnZa2'
-    b'HWM6+x2JMA0hyp/ZLPEdj4ERUoc9i+yls2nJsDpysrquxwwdmcP36rIV9dczk/3y8YrVlZGW'
-    b'kPnrsxul1jhvLrGcfIyON4TLAdzho298/l9sEW4L/PPg/6L7fRHAzwP4TC5xVArGAUu7c1nI'
-    b'yoOqWy11WexMazmlIrSiNcFQiuKp2u8IaM2cEqfuoTFzln1CTqBOZREhZF/y1kikcU1cRWnY'
-    b'q7e3yOsEaHDFMdl8IK1SUTusxarVUPgHKp+5TE0Elz/GD6Q6gieHLBwCSMY7bDShWwAqH3QS'
-    b'jJqxFVmKqTpLzTQ/n/r97FCi5jVddbHRY/bmwai2Ec54aGN07YS2bWXtopK6+DgZD7Zl2udN'
-    b'/gFGj72C7GwDbFSdcOJ7fn32uZYmV1Ywm22mRGFeDqAZt1Xm2ti0SaddGEsO0W9zO2eKY6Yc'
-    b'gl+rGGZCBz5D8Oc/+sbnfXGLbFvg/yqC/30/C+DnQHxhBajF7mmxjV0N9Mm8q18FMa9D8UX1'
-    b'ULesHRarhqLI1xfYajZY9w5hopyPpCOrD06icCKJzUU6sulPID41DCfOnU/CHqvCmC+/SLbI'
-    b'hvdCW9sYdrMRKthq3si0RqsuL5sdV+wHM0KZYRRLqpC5YOiMaelKVchmOXdqes2FWHhIujnZ'
-    b'N7OrH9drwAa+b+18235+p/USXeCUUacWfFAvzAe01TONYKhZC6dFstXrXKTsRgWjcZGnbmiO'
-    b'NvY53oBdb2H/a11rqvJTyr2fXP44uYnN+jzeTa79r4y+qFhLDDIyO3viaof4BQk/95FfO+ez'
-    b'W0TbAv/XEvyvgHB7UVdmkh6LSUfO4B34VjIH4aSucvMf+VPmLm8KYhi9iLYJA9UxH9rYUe5v'
-    b'MyUUK0zNMRbVbihdmbWI38zcudyfQzHQja1Ws+5At2UH67FYFTNW8NKUHiST/+xm7pdPRTHV'
-    b'NG555sYudRSQX0XlvbSZZq4kAXIu1V3fJmAjbduQw/eBVNY/7rgv8ZDMfMmNbjxwx37zihYY'
-    b'3kOiVagvt56q01wynhrHGu+HgrI0kDc1p5qVjKRcpYZoGUm8JUh25losiGAxkirz97VTziWh'
-    b'b7RxaW2BuSy2cntGqL0TsJ4TuqpmFjJK/BQtksgsw73xeiW1TOBKAbf/yK+dc8UWybbA/zWv'
-    b'z73ovh+DeDsIf5p6+qw3cjWq6LjcDWPYUQBOKM/0jaZVJq+BrGV2hw3VfQLiprjCt8pWsbHH'
-    b'WOas47yubANpZD1WPfbG5dDoUg4r0hX4yjlqdP8VDJOYndSKmurM0ESN7WcCm5193V9/Jxb2'
-    b'/ZBZ2MyNDPYj0PlssI044VY+MDKp2KPNyS9bA4Xh++DgMJXd3Wjtr7WX7xr1naKlC/SoTS0r'
-    b'AgeVhGMk7pw8PxqWHgcrflVNkHJnKsHvi5CRZsBZqmhpFkHN7Ihq/7vdQWzMPbZuinRvmiBR'
-    b'A7ONz1mU+5BEA/NpF4wwydpuc8Ot7j49Tg7+VMDtPnLJL31si2Bb4P86gv/pHyJxW0BfLpth'
-    b'B2+3DnvZaS7F8dLznVcbURluKr4WHgzKgkOqWg3LDXoCqAUpvKcvgyeZJDbpmCBsOzAInBXO'
-    b'pW9nwexHKOhK24V0xS/xIAci6eUr6yLTep+cSB6vzGf2m/5MSqwGtBxoS1WpLHqUDos1qCdC'
-    b'qDAnd3SfSLmtQWZBCiUUJRwmexi5m34c0xi1pdW71LoWQkB1qMO9IKr2JGa8CFZHB0VRKqI0'
-    b'h+YNgIY+GyVsox8ADs3IR7+8SdrfaBYUVKBRrI5Ogf0VyxDYghrQNCOOvz33SvR7lClFjsUD'
-    b'UczUZm1S6ssAbvvhNzz3Q1vk2gL/173+4IX3PQHwNhC+TDR7Rrx1yXb+Gm0vPVfMET5n90xj'
-    b'PiDGJsAsgjwsZkBxk1Da4OkQeEdaYpN169BWWzfaqi1i7OJiz605gFHsWHODm74hudDOASU+'
-    b'AckKFU3Hkqa5wCSwwq8mtpbrElXlPPBwEqAQNttEFmQ0DOqPc+QYWeEx2e22gTLDINEgaWlJ'
-    b'0a1w2d+/ziXQdOYzkgMriiZxemZTnz9BSHVyYwB7PZlPk1y9SwTW+XbX0Sge8b3aJhueCRvj'
-    b'qyLWxNzm64SwpuJAcxGArFEi1ycJMIUaB8pljzHxoJw0egtC4e5Q91R9GcJtPnTxc05sEWsL'
-    b'/H+Fwf/03wFwawF/SlRZjXWTlIpHOLwf3hmB0FXOO87MoZ3b6bAxQI+NVMV4qFfLmutor4g5'
-    b'Yr8wR0CFcR2hHe83JHi48GnaFjgcLDPiUcebGoESWYXEGmeyg1nc5Ub7QrZBlveeGJnE1k7X'
-    b'Ee5PARseEwdRywLssVRqNWai08dYMpy6WaebV7MPaGx7FTGbNn1QGI8k6/Vpa2n2DPt0cxgW'
-    b'1jHtbYacah4HqsmSIo8n5hDVhY6dA1DXzuEcx6s5slf4zGS+oM2vyfXkFPhQ9gpwT481v+BX'
-    b'B2QVuaHKvxjj0jD/iPHbrTnZMbx/6w9d/Jzf2SLVFvi/EcH/BICfBXClb9xzgD5IlmpeHctM'
-    b'MRPwxYYX63P6Ut0sfdbduxNC60PfhVUTod1vzsq7h2x7CRGggPmybknUHuWxPay6TWKCRFxF'
-    b'YZjOc/5sYfZ7lWIOs/VOii5cjzqyxuQYpmKCNzwVNDWab0em2YXaoX2gwKJmJFwxvF/8DAqd'
-    b'qS7GqM5Q+zngcue2/sa1lzJHrBoCKpkIZ5wmfCzn3l392sDUWD9GnQKhl62OlbasylaC//3d'
-    b'VYNkQNDoo3DlP2aFba2rljMSEzRv5ZUH22+2eS89ZwSqPwtESirjGN6CaFtP6BOtMq4qXgng'
-    b'Zz/0+mdvlf4W+L+Bwf8Fp38IwK0AfqHHW0cZywaml/talhs9Kk6FhEFWsXbPQjMTJkbZXtUI'
-    b'FR52UZPq30VNlBvGExe1kYhwNhR3QL6VRZfP4d1Sd/nMcyvgFg1vMiTqLmVDLS8qiTWjcmKZ'
-    b'B4/XJcs4MPTKJ9wEm+PvWh7ZIyHmXFW3uHijaCSk7tKsJjB2LvAp30szoFzvJbWVqoDW1rbB'
-    b'l8KIl8pnKB7B5Xy7BS0RVQs9syL68hZ9hVzIqM41UIXFQ/JTuSadaYInPTIivJq2QkcuGZB7'
-    b'GVZN/XO0TSV11s7KCX4vdpUhfdJ7S+Ee0QF0byIDLOILhG71wdc9a+vpb4H/G78++4LTPybg'
-    b'ltiL/JSbPgZLEpMGGSr3P5uT0HsBvi+IXTxDY4iJ7BjGvNPTobRKynLpjZH0MycXpc7pHPtm'
-    b'FXkmLakTcyHQNomdANd5BdtmL4eNI8eCJgasOfQtajLBZITOJUJ3HZopL8HsSoOLjgxGT7FB'
-    b'3XvkY43J2GqT2kgkqrjrsW2w1OuxICIGSau2vTh7rcavRw3Jb646l0fIVBCVfH+Wv1cmogpx'
-    b'msQEnNToVPjEa4seofiCsAPhipunJ1JKx4tewBBIZN9MziV7m6pi8OWjsphAbpx1YBiS16hJ'
-    b'QUsEaxKwivOIt/zA6561sfe3wP/NrPzvcwWAnwFxOezBrLrzytUbI+icq0k1lWqr/yNOYG71'
-    b'QQUm84s9VMgM81XbzrAdsQO80eh7Kx/PvLdgrxce/aZnPcf0Q3JERzqAA+W15TejLSPNIAm1'
-    b'M/L5vPbVrWbJDqMjIdFqIrh74L5VwXa4z1oSfj+wJksssHfDrHP914A6MBjguIFMNG6h+qQh'
-    b'BmWZHkUuipn61lMfCzX3TdOqUOePYLcdW/u/mcBQI9LXRk+7N+Rpes7m1SkONiJLVZZ5dnBh'
-    b'SiaNYEbeRfhESW6YRi3wezyqfhqhrztXhqSoFdFKh3I5gJ/5wEVnb3P6W+D/VlT+9/ksoZ+m'
-    b'jo19FkiN3UZENvFPhpazarSv31N9jtlk5m5T2o6sIWOoy2fYK2ixEfBa+U2lsOu6to2IUakE'
-    b'uyrfMYY+oanCe2pRZE6QFVkZtm5WE4bSQRpHSt4IaoYWs8Plg/QuGxjbyvYOKWjAEEzG4gb6'
-    b'qtoOaSnqjtaE0nmpkDkCaCReqZOIDaOO7uM4BIJMO7FFbXQ4tiXBrO6hGUkD7SGhOjJh5Brs'
-    b'TX3mbefk0UH01S9bjKOxl1xaTg0XR9E23JMD5aMnq9WNJk0MdGE3CoLRzg1y534VtJI3idiC'
-    b'YeM5yJMX6hGrE4R++gOvPXtT5NsC/7du/Zvnn/5FkT9F4B0z6pUJsY+HddbnVwUraTIwLI/S'
-    b'RB+MptCTAqONeCnDnQqQuWb2sVWFqAkc7LN3EyVJEWKtFmqLQ+y2LjoSfkDLXw3Xn2UHp01K'
-    b'ZxOfiK0rOL1NTk9Ha0vmRSqFfmFMN05q5bMJKEptPlXBCaqAw/oQeSqTYV+nx9u9RwOz3Mz+'
-    b'vCX+gnxcUZ1v0xzMd4a9ckWaWmeNoE13vN6KZhy7s5Dd2B8hKvPIi/yJGl6WmQ5ngnGUNevZ'
-    b'sjWdys9css2aDWiU5GTwP9h5kUqTqYk4jUR05gDLz6lGfij0cuR55vF6B4CfOvGrZ2/a+1/n'
-    b'+mvbKfgrqPyff++/AHCr73nEq18L6G6x1uBCEmfMdiNI6dR29SI7PgG2ZMUuyysMF77MQAu7'
-    b'n9qAS4uaJFuCGRofczTxn84ao6X6DJtAPOYlgu961jbXCnEXchbt/8XxuuGoVhGbXTjldH3z'
-    b'4bC3bFK7UC6VynmNZV2GITRyeQ0SwhKgtGblWgPswvgeSsTVaEhWWEoxctVVp/yaRJA7w5I4'
-    b'hUHErnYkjkAARxkOKJKwMjEncwWc2UU7l4PjWhLAkb01Grc3B1Z0FIBnAjjqjWWmyZLYoEzj'
-    b'syWHTQbyIhs0MLVkzLEvHlyDU4w8sJdLXtNLdYhbhuZJ4OionrMsK7afxjmC3QHK061Cksz2'
-    b'rW/hzCSk4QgXnbjw6Xffos1W8V8Nq/973x3kebKAzaZSyztNjZp0SVWrCoeevdnCslaPGRfI'
-    b'pC01Ql9rIFGUg2W7UUZSTpW4Wdz2hMaasAiIRV3CZP5RRFhGPb7q+sXRPKAgF7FADzL+YeNh'
-    b'k8+40uIY9ZNXQNaWGUG0ayEwb/SRmJi4DZ0+ebClZTOHraaKk3Jk1mhL+Fy0fGQsft6uk8yu'
-    b'taIavJ23EREStuVnIsNV6sNM/d4SCnWCuRkhiO+XRuTimSmJX+QtKIv8sPGbP5A3V7g/VNol'
-    b'edeUq0I7afIyv5M8TnebP54s6MPsdZKgT+Wbtq9YHD4tQQjI5Hm/c+HTtqC/Bf6rcfB/3r0f'
-    b'SugpJdNPHvEc6nixINvvbkwSpqES41D/In1eNmrTM+35jGBhMemxTU7Wt2OwwQyBM71nbGUQ'
-    b'pYpbNciltupwa95K2u/d0BiNO5LqB4PhifrNVbUdo65a2h+n6OhMTGa8H2pUxwZVzy1OTeRM'
-    b'Q2Lj5isrONGZJbGNMGr7/tktjcqCMFz9zycjEuoaXPPRrMVBcj0uzZsiVfioIipi28upJj2q'
-    b'SYDa85UVNRiFZdBe8r06Zvyb6qWhr6adIiQp4GnKQMx0jO3g1ao+VnObTtLDiYK9SLWTkasT'
-    b'aNbi0EyTyMXE1oICT3n/BU996BZZtsB/tV+fed59ngTgYbLo320cqWKj7FnOatnJkyZsZFm4'
-    b'Q1aBMVcRvUZPv9mmnnEHBYYKmD2gPVS32OoXaIJSNq9UK0sbE1OyNW3GKFtYWZ2Oi5EvOSm0'
-    b'2DKVHflIdZOa1EeTdsYk8bE4gWrV2igJonrXD9ykegPFqQbRfCKKxaxSqItokWWahbIZz+8M'
-    b'sY6tGcSkgWxJCExoV8bxVUiWRoQ0/we1AbYZ/ItSyY0YF4qtTgEUkp+EYt8mtQ7Ynj81pfLQ'
-    b'LFDVYYpEveJNgJbnGY9gRnhl1dpeW1RJ7Mq5JSU7IgQ87P2veeqTtoiyBf5rUPC/97kA7kTh'
-    b'KzIJ3Ja3HmHVCSM8q9xp4vJq/UnWkSAavJYqzc5nwKD+PJLF8NC68lp2xCvkrKnwIWfSB902'
-    b'Uyvo5b01EYtJ4Y8T+JImjXp41rxIDLMyKKIZSyuWJwMjNNOkR8XXMY+dVNTPR7LY1cR8gk0C'
-    b'FLkGsZoWq3ZUtZfVmByhTIpdpkRpVTiz3HG5eupxc10VCME+mUpjq+yufGbs0dAEVgA8yCaj'
-    b'DeJFZOuAkRCnZ5kO3pVbWpMHi50YT0ARC/GXjuOEHUimubmfSCqgixot7+MvvyLoTu9/9Vnn'
-    b'bpFkC/zXxOB/CYAfJfS5FOZVgfa5fevyNIbqMpRXvuEWCwsNwhrbAOvBRRUWpGXyjOazCp/B'
-    b'+qFicOhiJQi2EsYqqqVTxPMAS3qc1AwfJi915q/lLy4mxpy6pM2TF03MjXAViraJ8OBVMhvv'
-    b'AduBC7xt0sST4McETzN79MARo6YYT1VqALqDxyw9u/GZdauqVT9EK1Oc4RHNcjKrdFtXBLQW'
-    b'wxVa2SMkRoilov1Tcz+qwD8JeSpICMpUQifpUF6jeR2VN1XvO8AmmItXfSMjozDLuXAzck+G'
-    b'jCQTv/wcwB99/6vPumSLIFvgv8auTz/v3h+AcHMA7/MNkDbHn3vUHp+tQqBZoa57AEu+UINj'
-    b'RBC6itFEgFZ/dFe82xMEOcXq18AjLxPiTDmbv+l81AvCaUZC7nA20QvKRVQOMnGsivbC7MM3'
-    b'oiixF5JRzMeJY2tSNG3qDsc7On9jTVbkarmjnWC4/XBlDqwP110v8SdcbZVtvofaGScvvG3E'
-    b'Ov5WMooyw2fnNWm1Ty4w2io4jooFH8RwD7EgPAoohxrDo0GRE9LQXzc+6RbPga+ndnh9cBnk'
-    b'SQQwr/CRjZIyisOaOEplwkNm4xvZ/oe1Lfzp6FG6vJ8J+z3y5u971f/+gS1yfGPXNs73zQn+'
-    b'nwdw82s/8jWvIXivzOgLVR3UjHktWKoZ1miMBK4/Jst4TGugwbGRszS3q5lO0QzonFmZA30M'
-    b'h6vEaZQdXoOeM8Vp+vHR420Gto9RIjQIQ5UY8WrOsG0GRn60NGUeneuFmtIFGUzIpSLTgFDz'
-    b'uGejhMBadRa1OrKK0hWVt6HcGNEUuQ4us1ANOpQmBAS1Aj9mz9scj4L4fge2d6x3zSwhZiFH'
-    b'XCvpBE/vR2sVkju5WmOyyl5+/yggPEzHp0DmWf9fR3kCJzyzstncdfJGwy+DR9UAaAb6uFcW'
-    b'9zLSOqqJwfE+c9SYKjdcALPnppLAXxHLWhMkN/uJ6aOdv/VxOcIF73nlk0/bosVW8Z98CcA5'
-    b'p50G6KxGXL8CiIX8whKc6viLKbKxDtnJ5FoLP6Cdz2YlBHqVqryRjcCkXmbOK3234SQNfqej'
-    b'g4jkwYa0nWrWElicSOWM7yiG0igktlr6q9a9eq/zqZc9eo/xzvSsddPJE1+Ek0TtXaMTovPr'
-    b'vO8a5VnTf7M3wnr5GXra6jKRQKZkJwplpEz37pHd0axITk5DWILjgC5qAp5lge33W3SufgbN'
-    b'kpHVJrmU+jlWukwxU1U8bQ9IjsygyETMJKSrPLZWzg/zC/QHGUZs/XxWmq3Wz7s/FWdtQX8L'
-    b'/Cf1+tfnnHYmxNNTL9j3v0JMkqmHtQB4njc6IA86mOWeYDTeXMxgdoYqffOrTnzSASQ2UMQr'
-    b'0c0nyDXGAgkT2pO1JZBm/DsIOO5ly6hktn4lOrmTKNS3tC9SACSSgVLmnXGfRDV2yt0cu0kB'
-    b'5whmLkOskGzZaEssVepds0QLJVRGcxHlcG6iDn4Hw3NloVcvF1dwgze0U4rkrZwxndEoy3W+'
-    b'Tkug4qTNsN6inmQ1x27JnjocoxxKg2Bp7ptNeXuAzYGN5F01uidM0a2LHYIpIJ61EZZ7gwk3'
-    b'YE1Ggdadc/8ap7/nFU86c4sMW+A/BYL/vV4F8IcBfDo/c1w3lhKPO5IWD7jaKtv70gIda35+'
-    b'lTULI2KJ3DfOXXCPSKo+2u2mGc0BJr1blQkxDO3y0FcVZ4J1qF7nHc4uE2LJbRJGDwW7IFJn'
-    b'+4pybdWKvOf5/sQ18N4whdaMYTYd0EzYpXMQIoKggmjQbHjGDZA/eG5b2LBgEjViSqYqCa2H'
-    b'LTiRG25L8AaUSpMgahAHuvxT5rx4wtzZb5dA6WpVrcGvRcuWlOcOfdlkSeXeroTd/jlUO0Y8'
-    b'UEP50YRzmoV+2oGEgirg0wB/+D2/fOartoiwBf5TKfifAHQzAW/2yJag9bWPr7Zyda8LB3Y5'
-    b'6w1OiN5qIWw2+jAe3l2o1ZrJxgSjtQyqBbF6lIAT+NygTzGKmOSNU8na1tXkYjIwManx2EIZ'
-    b'8UoNrFADUw4ecbrAdfuV5u5HBOIgb6qfD5+HRR1KiVaHxBQ4kkmLRsA2BaQ6XRctEwWnkPfc'
-    b'Rla4iD1voIJWbY+k8gp0OC9c/p6dE6YO5xrqIYbqo8E+GU2zFItgl7wPXwdGWZ6vSZCX35os'
-    b'ehVSV2HQhTsTekNYW4oqGhE43vNu9u6XP/HEFgm+NWsj930rg/8vnfYlALe7zj+74GwRj9Ge'
-    b'oJZ5ZZoYvSX7kxQzvWXQofmaFE0MeH6UDPWqj0XvfFTpkbsYlc+sZZ6+P6hkdOfQ4vC26uiX'
-    b'0ip4iwdvgGRlvDO5Nwp5DMn92WkiJx0Tj/X94zapAJUz666zy7zIwZFiGPXsvBnCZ1JKnObS'
-    b'sDE4MdkzRP8D5YmHvXNjupbsPAeUk81S2XKYME3CVwyMrRaCJbflUoSeBk2FXqkNU7yn3dLx'
-    b'WKNeyorYyBLCXf7AFAxV1CFZLLiz7n5KccQKcylKKjXZ0Cq3naiEOAqIhI4QSIyq0sjhZ7F6'
-    b'mDTBwg5hc/yLPwEJHemZ73rZE87Ydv+t4j/l17/6pXudAeA0Qn9Z+p9W1TNYueZtdWF4y3Tf'
-    b'bfPtFLNiqOMcDmCj712SkQBBN9S3do/qd84SUgt0qm4OGKjJkCP4zMjE2qtvqvXKZ4p6/AM7'
-    b'r5zHrjrtIOJJW8UN16VWmZfd+Lc6fkWdieBkfM8dIGgBRnHGohA3g7/Bei8Ot7c1mdPsPswE'
-    b'UDIj/6xAc1Owz6CHGEBVWmWcEOBoJMj2rdVm0Gtf3e/QSBx1b4tMytWB5D8gL6kf1M5UrAl5'
-    b'amSoYnxO4Wm5B8oSRdGnoVzL4xf8Swinvetlj9+C/hb4t7WsTz33XhcIuCmgD0d29PEzx9Sz'
-    b'Y9u3Wx5iTio+NjB5N4vMZkzPHPVmhsLMDnyJ0BMq3QhBqoHpLdKmTacE4Db0oxe88WOxjc4J'
-    b'Z9k0qRNRaayPWDObmTxv1vUP2g1UYnArICGlRWw4OZexxpoN2KXVuLcMb3dC4sprYEmXyhTA'
-    b'AS3FwEts7kJW5CA+BFmnYc6hSNGUTYZBu+5obKiLcZUT9yYkWPbtgI6+yvLx1XzPfz8k9FeZ'
-    b'eCRB6nA6TcDIr7/MdrnLmbo2Bs3bIK8PA7rpb7/0cRdsO/0G9W+rBv/LAfzgdX7xwpeIeFB0'
-    b'f5NXBlQbnxmIdIrGKwyWvTX+2vZHQz41NojEuSImcbJsSkOASEOHYMeJAv1xTrrOqDNP8ScE'
-    b'Gl7aH3Jtw4D0WQPIMUM5VndMo5Ex9doxB/ZdsPTVbmy59BYHu4BnRxOth8WVQ7B+vlRV7lAl'
-    b'EF3iWZiKONnfstGXT4FsV5OxjiymINMaZvFCpe1JBmfI8QpB79Lo6+ANVMa52mmR5XwOHQEN'
-    b'J+Ymgg5H2KrnLxwNd1wNZU1acjpseJmMqkoyogV7z8+JQsWv6A45aafEXl5qsCS3PhWkRZ2m'
-    b'gpH0VgJh0ChY20wTAy5I51/6ksc+eNvdt4p/W1cF/T/3ng8G8AtYm36ZYMRFTrPGpLQR5Na0'
-    b'CjG8rRYiuch72zOANboRdQUWq7uee48nItGidKO+iapoxhJlatVrmcvd5KRsC5s0AZAIh2qQ'
-    b'huxUE0cNhpvdkK6VKcBhUkZFB0aus/axjQOZPn3s/S7/PiBkN9VojNU+KzKB1tX3quV0ssvi'
-    b'glpU9Re1BkN1/E0z8f0CALAFHNafp3E4J2XUu4eJuJj79WoSn1H5qr1v0Y2aBr/o5O7nfIoO'
-    b'RGEzVmuKTgP0Ub3WQFF/jB8vGRd1IgFJXXG9bkcgfmEL+lvg39bXEvyfc8+XAbgxgA86zrwE'
-    b'lAJws8LPahDfBO0rbxJqf3cWC1Tg0/6dy/Y/SHqhDZGsg8VBtiPKzMC6cTFUGuzJAkSDVkRo'
-    b's+MZUJEfmHkW1i1gY0mT9mMnOgYJXHmP3HWHmc893dCEppKiLtDvQ1EzShZ8lFb1ONh1Zmh3'
-    b'OETO5mwPMqVQGCHMyVDNRVjLzcbLpVSk6dCEbuJvqfZzOzxC+0q4h9B1i7rImIOvutbjUQAA'
-    b'IABJREFUzKpwSRzYWWASRbK3khU9qT9gv6A5DiMaIRBobbmLlZUUJmAcwbF7/fjHHwRw40vP'
-    b'O+Nl206+Qf3b+hrXv3zOPS8DcLN/9M8vPAfQP82GOl36z9CDn0DeHbRc4O7BJDhYTIR9NlYk'
-    b'iR2fdoRd0ZtBGWljdh8MJjk14CzYc3XFWyHf0CNnMVNRG020wMcSwF2eSFzRCVl/dGz6O9Zr'
-    b'kt9tnBt2zdLU2Ahwvvdp1GUXnGzqPR9NRdmNA/1IYji0ypUuPluOYGgU53q3a7uLWcXQ4IJG'
-    b'XqKZXkAt4OVTBab8t7Qklt9NMrUFhRjND9mryzwFVg+Ko+W3jgLeHoYP4vgGZDbeWYt3TAdw'
-    b'qN4F/VxHtvIsxfHfMLo7pKTXSYF2njT/eZrcFZ73znMf/cht994q/m19/QnAI0HcBcCVOARj'
-    b'rygAa4nOgk9W1bJ9sEtwZbOrD4S5MfuIUwUYjm1T+n7rHboPLGogW9bKc6nmluqEMbFQqFaD'
-    b'fnut4sKW5nZ7Po6WgZW5VDC714q5Da1VgYrRLEmGoniOBzYLfG0Vp4bVX11g5wJOPaEL5S60'
-    b'5ki4/myyvWp5o3EunCeY0KbJPdUJ50xuuMVRsDra6fA5Lq+mDIeXudpwo5gmTza8Yc0Xu4Qn'
-    b'ifYokA+ZEIFsFuUpEG2SMbszRu8CdbidyrZyJcC7vPPcR21Bfwv82/qrWr//7HteDOAGAC7J'
-    b'Q8WRblx57qtNr9gq/3nwFeN2KTPxCPuweQwwDThHExntDVG83mX4eVZ5Y4x5B5YcV1fkmytL'
-    b'1DKOo81li6KWANFA9Stpb05Gy46IjbDCUlVSyauhvuEBBToxSxSHk6HcjF+vjQ4ERPcCaEmX'
-    b's/EuZXXGdM/QevRT4RufkGj8DiRk/cAoUTi/Hinnoo8bNjmBPyZm5etAUayFPWFex+eomqdQ'
-    b'qcVFNCJdnCN3sraQu0JK1p8nik4FY3Mj3aqcGEblk6PjA7yEwA1+60X//OJtp75mrA3qv0YF'
-    b'/3v8OwB3+r5H/erDAT5/X64MxJexamX5/jKiQy8riCwbzByk2e//Q1HMqsIEBWt3DH2H4Dn0'
-    b'80YlaBIwIVixWvLuvAo1776ob+8TAQYuRMRcdLEYtdWzdlHtj4kz4Ez+AvAT7XltdXxa/pzG'
-    b'NVoEiRLzS5mYMG4Iq+Z2eUpztWLs2xfJ+bE7mCQlG4JK6xWrMg8veYrJlCvF3rKwS0iB6IJG'
-    b'bturIeZzJENqbKQTWCm1i7PkUYHCEcyhlFoIiRdQIHk5uDZRxFuY+5nFn4i73g5AENtZpn60'
-    b'nzgIfs0JT0oiQCa1e9DPOohBS4/4jRf84gu33Xmr+Lf1jU8AXijoeiAvNcR1P8fdbdC1cmCU'
-    b'F1PuoNf2ajU7qRbuM9IQk/TsbHor99/D13HDuorCLiUnUQ54qh8+bIIZ/piOcVhMWeukhDir'
-    b'Fp9q8Xfrz2ZkgAEvyBFpjr4XMlg6ZmP9DX/gpk2hOTDuxM6GRBcslQLjXAUqTlMqPFClF3If'
-    b'6+86+3/ijihZjS+u+hOJj2elLum8AD/RsXKO58ueB6YrWwYTlnt9/hqZ2OetJxdbGiBfJb6u'
-    b'nh1G7FXcD6gW5dh/cSmA621Bf6v4t/XNDf6fBPCT3//oXz0D4DPiw8s0EbUQ0VBmr7O9zJhv'
-    b'Z1OrMim35cJQUyN5rra8Js1yXLDucuBKgikxXSAbZT4VeJgmuLN8kaRpY2K0nqzdKmu2ypla'
-    b'YB0EP4bC+Jjot7PiV3vdAsYRPZe7jfsrA1ZLNATISGQbqnxtt0HE+oHYJ39p9pu7Pn1agQTW'
-    b'C4ddtvpL8vHKAUxNGtGMjKT+/8xFMSEC9WPH0zhu0qPyOjJ+h5Jxffhbae9rr3ycagyufKKC'
-    b'3L+11oQ3lviRZHcsC4zsvhk6A27EqMb2/hgAUiWcFLddIdft8lS0EPjitM2xHsHRY3/jnEee'
-    b've3CW8W/rW/RuuJZ9zhbwI1BvLuUSJHUJbabZX7sleDKqKimCUbdj3TFqnACG9pMVjEQ0R7+'
-    b'bXqxLAhFrmQ7OB9eOCuC0irHws4Kt+nm7vHOBncIFdRE0102CR5P1agQM9tCEZPx0b9OkCH2'
-    b'jqkmNcu4TpGmLcF5aO0304G59TPRmRWdYGc/jwgDQ7BTL0VbSayhBcQ27oWk0DUeQnSNx92N'
-    b'9NF4IYjjqmZhpe7hUfiPUjuGU9WFMYYpf3JFc1k0nEX2YJgtNru2Rzg+Eu8WdON3bEF/q/i3'
-    b'dXUI/nf/GIBbXPcxr300gGeu429iqsYzHK4eZvWRsbjVcfD9SwVv+/AuMYdpVf8gzy3VfDPp'
-    b'n1iEq57f+hEKK2CYyfhmnVRgFZoZ1heOkP0u0bRS2U/anylzDXZxpI5dwsUwGslcqBcr1vz5'
-    b'GHv88OtbE4/2KqmUxns9AXa27PmWafUL0Lc7ZgQRdTr1nh4wZwX0ANqU+tG9SYS7zsSe/nGQ'
-    b'Z+71U9XyWUg9/lQbr74FytU6kEb3xrk+yhLHVEFE1BBBI/+mpD7796Gd/8WER+XRPlYdXJAG'
-    b'qRn8X/2L08TQY97+3Ec8a9ttt4p/W1ez9cln3v1ZAK4r6G3YQ39sqhor4VCBYOYiUsFJTF5F'
-    b'NpNLyAnCcRWu1gU8/zM2uSuW3VbF9j4p6O0Th7aF7MkQZTCHepBiT0yLG+aYymOpFt10Js5D'
-    b'r8lUF2XZwzOJ+x3/NuQxTGjLil+EqlxB15Ht2+kwVNGINo1kjBGViTKNRLSS+KomN/pGeDjg'
-    b'zqM3JUOdNj1XIaF0gBoujYjXlKyCFkFAqxgqzQSsSu7FKVs+oy5uzhzu+oQahKRvOd2UATou'
-    b'npEHKVM/4fhHbwN03S3obxX/tq7ewf8KALf+Xx9z0YMgnA3i21eImrlKY2DDtxaxyIFw7ZXL'
-    b'gyU7fGD/K2z377XKTW1dDhtbMjHySxz0CQX0lWRH9o6M+cxjCFa1Ym9r7Dr4BaRmjY1JjVjl'
-    b'OND4BmgllbkFcTgjS6W3VJ+7EAsDWaPwAdYTHzvOS8UZ/N/RCxXxkFSvsijQmpCJh5OIzp3P'
-    b'bQnUI0zlzXfIwSy2Oo40tPoRWff7Fz3aCz0d5XtFDYlxjafGcpUTPpokdx3xU/+rq1DQ/gd5'
-    b'qqFDFZy7EZ+JTBAs7Q1DdPYv+WUAZ7ztOQ8/f9tVt4p/W9eQ9XvPvNv5AK4D8JWri7nyTHkU'
-    b'L8kbT6jQZdBvMLBJKm9tjTuMvVXIZSgsNqaqLYQkGyGcMtFdfEQdVh2hefu0sYotjGYluDrZ'
-    b'1iqnPDbhhwINNG1wq7usoFapsEull4q4OPKlFXE5iCooYyhwslmXDHIID43q2MfC2KAJuUCH'
-    b'0Cspqv14VlFrpg7d3o1Jlrj7fdqNE50SEXgZ8VnpJIKliSGPTd2oq/DrtUkWB2yeg4SkKAfz'
-    b'yTWX/S/87JUAr/O2Zz9sC/pbxb+ta2Dw/yKA+13vjNddAuBpAq4fZ7nbytZmtmk99igfGoN0'
-    b'npVXgifZKu0jjcIx4L8S92RztpXfQkSvc+7uaJI/wfrJEiwe5/GITLBvJgdWBd0gB8x8tDsj'
-    b'p7urYIQqVic5jmrVNQliUIxINhnU8EwaOAboxStQDZ+DphXUKrl7shKo5oJspK6SxdLryaB+'
-    b'DK5HaTHBEOlWIZF9AtORE3XcZ0/5lAwVEAtWQBFH+4RGQVkS9gykxIA5ZztCTko1aY5JEUzL'
-    b'7xUpC7LJgkToD/19Bs4FARwd1TxgpREIn4Dw+Lc+66Fv3XbPLfBv6xq+Lj/7rm8F8NbrPfZ1'
-    b'j5NwFvcTaMsGnpTrmTh8aVvipBpx0dOx6e/CZs9+k+PwCe/9BbL4TeyNu9K9hFYWFlZhKsDX'
-    b'yXg29DuKIcry2mzUBw8wHWnGt5wUmrnVoiFilBQXmWgIUk6gaB/GzXrYuL+sgVqa9S86leIJ'
-    b'eiBY06ax/QU6PhmjgE8z46miLTRxqVnuJY2E7GjyXJCLOI+3X0oxPnh4q/vfUVZN3EflOG6Z'
-    b'yHYl1DMTbLX/nLE9s960R2E00P98tPG8vKfysYcpRT9nRwCe+JazH/L0bbc8NdYG9Z9KCcAz'
-    b'7vp0ENcWcOEiTFKDLasNqjJHnBNOVe6Wm1qd1OqwVNSziJmXKjCJ56QY0R0Fr8o91txq0Nob'
-    b'eJ80acmxUwQaUHzlGwS4WA3lceFMiM0IYla2U+zx52wsBNVczDaHGrQEmuo5VOvJbIe1FE+S'
-    b'sJrEZh4+/e1UYqn4VdtQQEky4/uLMAlhBgXJBeX3D12JfWyzuKDcF+9dRvwgOwHGAC7zKCBM'
-    b'ahqxAVduivpMHkrS0p2iCwFc+83P2IL+VvFv62QO/p8FcK/rP/Z1F0p8Momb5kLVXM+kVGl3'
-    b'E+trcKMs5A62kHbMhLokvasEO8cW/OKU1+3DKmhFPArmkW5mP7+ycXNObuQkRRlH6MExIAO0'
-    b'9kNspazchh1avYWdEtO8w1VWstYSjRZVpET/tk9ZVdjgrnyKyYD20rRJpnCXoGiuPPOgPE8E'
-    b'CecceIp18CFpxtYq2E6poTNu5Ryb2Y244UgMlOfghmTvgaTE0tak7HfkH8CSnaOIDB2NeyeS'
-    b'DuXeiDIMZf8siMeNDJcPjm584yN8GMCT3/yMB7992xW3wL+tU2R94hl3fTuAt9/gca9/KIAz'
-    b'AVzLN16fAoBV3ZyWFEtVuqubMmxibtkpd5EsJ2i32yvf5WRiZ4p/OSLQtOcxd7P1IKNusiGT'
-    b'zSbie7mSNztZJVc62AjlcnwmOrQPshGu5t7vN6q59WMDWRtgnBc3IzAdgH32VlzmltdkrGl3'
-    b'ewJZJb25CUxrNtiNeHTEtmKSqIy4mCfCStzbxU+QrW1r9rp6567J61GKuMOqFyVJ6L+xnqdp'
-    b'krA/Cn/d5fMdZdbemLzP6pl+8y5m2tqLWK1KeyO7AIUrBTzlTU994LnbLnjqrg3qP8XXZU+/'
-    b'y7kAvhvAMxE2rMHfCnB7qIxpcGvcsVncX5Yykn0xl4RcVGFXZBNWhqwjF4OqVXwDmbKZQ18U'
-    b'/xYxljTW779qkYozXQL7Lx1JVkYoQqrgGnZZLMEZium9BOdkrI6LZSYyexxXoIAN+rFHHsis'
-    b'jT9BlOXmQYaI1POqhhXZZwSZpRD1elTaEmMwgvWlk9AlQ0I70BRZYkb1+WFvaqzED/EEx82l'
-    b'YNiAODkNse4n7JogJ5zHf/RMAN/9L856wBb0t4p/W1vwv8t/BHDGDR/3+l+m8HhQ9ymjXcy9'
-    b'YrZVvyvmC0yC/OHn+8qsUv4G8z5Vn0JWzGtCAenjCTvzFklsQlN8455UP/rqu+Q5UGOsF6ZF'
-    b'5Y8M7ojNrAObyX/FFgbTyNsyRbALJ0RJtScQKguuockY40JG2x+/Oo3/kFMEDgOLg2MIREk5'
-    b'7ygE3wOiQIdL5IyiBETqEGmSPJ7Vj9L5BUhIf7DXMhAqo95vPFmygf7jr+0YZVOfI7EkJ/m1'
-    b'FU5LdtmLKAdM2CeaMu2//yoIT3vjk+/76W2329YW+LeV1seffpdPAzj9ho9//UsBPBbEbWBy'
-    b'pZ2MLVv39vD9VJ2yFdc57uUvldxub5DC1CZQqfE1+e+wVF2CJT1Usw4fllnyyFEgE1mNkbCw'
-    b'Y2vmA6ARTTK0oOkfMKIlquTEVd+IfcujVKk+0EjWdot9IzkyijYhOZIjlWDqevyC2wUPPgaa'
-    b'4Qv2joSltyJ0UkKzFlT8nLn3r9LzX812uW87Jdncob5YL4o5IEoFn0jpAI/q+ZOyM89ySsTW'
-    b'24FB5new+Ndz+xYKz3jDmfc5se1u29oC/7YOJwBPu8sJALe90eMv/lkAjwF081w75gA1Rq1G'
-    b'cOG+8ky17n5DS53gJR7sgOIDIKVdvNaXi/bgrgQoutZ/cMzLoXJfCe9UXQAbud+lY5GMWpYT'
-    b'UFCM/RvvzA+g5j1pDNHVBO2wc5eCjRyh5TbH1XxoKcTxs118ednMQJoTLD5u0dI4JnxqU5z2'
-    b'FDRltP2z94ZCfxY77kZGGGaVO7qKGY2lsf17Ddzd7Jz/M+ZzMWFY0qw4IXGU3y+bXnEl8ym6'
-    b'6I3c470Annnx4+/1tm0329YW+Lf1Na2PPe3ObwPwths94Q13FvQoAj+Qq1Nji7sAAGuwhmkG'
-    b'FL2dQAyMdrLxLdfuQRjdSuq3HnjDuECuwKNqTWvgniYc2AacEC4ZrW5bNmEN0EmKDUVWeHRK'
-    b'Yr8lCt1UI581QVm7AIsRTzw0pt+RSQZkSbldel92rL2QDAb3hP2ZOVqPT+oDI00HwPkjmlzf'
-    b'ldDHXLEPVMIlbI0fIHYzBtMIPgI4B5+C2epBlh4DR4PfIdidXi2BFyOio6ISGB6Co0YhU/gI'
-    b'gGe//rH3uHjbvba1Bf5tfX0JwFPvdDGAi2/8hDfcE8IvgrhhqoCH8tda3Kb4tq+2I+RPr0qt'
-    b'Wlv73CrxDFUAL8Lu2WxkTQw4E/DPOcDyt0U5MGQezPOG+/dEkeqZTz203neJ1pe/v6sys5M+'
-    b'fELWdyOqxnn1fnQzyDrTy21LVMr4A0vxrKyVeBzgfAQdWcUv/8JExc/kkZOXQHN+Fyh8UbZL'
-    b'PXER4lGWsZ4Fe8sH1ymIxe2uGE0tsslBWtnmC4cW/3I8RzAz30ScVMroEjrxcQDPfd1j7nrh'
-    b'tlttawv82/orXb/71DtdCODCGz/hDfci8UiAN+ogzdIvNxegQkpmDn3HsrccKmxAFv5Vo4Wv'
-    b'LH8b5WxpwbgtwJEE8pDyFAt+SrLHueIk8ux9UR52DfYdC9w/WhVhFpEZcqcnGuQ0qZFdHK7O'
-    b'dLugrUBLgIQeYOfUUU9WsRfiXAe3N78QUfXCvt+Nq6gxY5D4o2JWZhzIhvYjdIWZN+4hmHmO'
-    b'mP4djy2mIApSlJSSfa6KaG9ITo1j0Bo8Jlveo3gCPwbonNc+6s4XbLvTtrbAv61vdAJwAYAL'
-    b'bvLES+4G4BEA/nEX/IeozKJBbz12ZRSZoYZZeuaxB53q0ISO7yF8HugCB57azkbnFpEbRaHZ'
-    b'VPj2yj5D34ajjV/YZQyAhIo+fnUJDME9iBdFkSQGUmH9WBU1oJS08FOyZVr9QhTkqee+AAAW'
-    b'vGn0y0YYOQEGa3uBuYZFjXs2AbLLqAaK0cyK9CzkPB5VBj5NiVBHxrKnjGcXeupBc1/Z/bbY'
-    b'R6tkYFpHSI9cllI1YTP+/wdBPP/CR97hom032tYW+Lf1TV0fPeuOFwG46CZPvOT2AB4O4Cdi'
-    b'YFiFeGjKfE1szOH0eLPe7ZhQfLcPPrar3QcqZrh9tBo6TffR0F4C7LIJ90WzGqJfni44nkqg'
-    b'9clRevAMSno1QCJ2LIY3PIAdPSAz2e0qzPHLkxVHA7rZN7NXVpTw3RMNNJmnnxEW89EpOxku'
-    b'8sOKRnY9fOTOxevZI0d7KYo3wc5/OCYdze9nd5s+Rgr2iUNUDWD0rw09/P7sZLhHGW9SLetz'
-    b'oM8y1ZcCeuEFj/i5N227z7a2wL+tb3UC8CYAb/qBMy+5BaCHgrzj2ptGKXxDJWoGOEu9yeOR'
-    b'vqF61zvAr/t9gtWbdkIXnXZWTgVboVGKhnQkjBcy6sFPvGLQvG1Sl1tY9YEQuVT1fZxmjig7'
-    b'Za8F732UCOzufTTnm6VyZeAQ7gl5uy5YZQpfhw4MENvnAZpgS39N9E5GBeAYmghJyDA6JCrj'
-    b'EYkyYKN5Mheb9Qhj2V/yk0BgtL59Pl9HFWmQna8wArje38IlAs599cNv+65tt9nWFvi3dbVa'
-    b'H3nKHd8F4F0/+OQ3Xo/kQwA8mEbbIw4Q3EMlu855Y4dUyzNyARbYnsN7Pga4PakN+z4tmUvd'
-    b'pZe+WJzmYG7GAmQS34EZEddKVeFYMp4xCsDe1m89voQy5HOwTCgUSIR+TlUyr/VccWez+a4Z'
-    b'aCoNWiSIWegbyhPwZTBxea3aHR/HU9CPq1qJ6h84HOarU/IPy/k0QQgw+7Miq+vnOrlbrdK8'
-    b'SkE/V/hCyQIA8CWAXvwrD7315dvusq0t8G/rar0+9OSfvxzAQ37oKW96EsQHgfgFgX+/Nfmx'
-    b'Xn0MEjsLeDvH+uNWuo8gGVGQFbuB6LeQtgDsyCR4w9VIR2uQE1yrYFLUI8/5kzZ90M2kxZZ9'
-    b'JPB1E4GsY32rYc3CNt/twh9F9uPOPrSgZV6Q0TyWVrkH0IBaNQGSoFGofZssKHkIy9AHhWvh'
-    b'Tn1rjtLN+zMHeUXUY+UuEEd7URwy2t12gXbhi+R+O0noKKRC3vOX0hRDCvIaiADLe7u+PwDi'
-    b'CzjCS0Gd/8oH3fLKbTfZ1hb4t3WNWifOvP2VAM4CcNbNn/7mewN8AIB/0kXMSAIbhjAMxD8M'
-    b'VnciAyasILjwDdlbhiC4SPtGHcFSndJU5hJ3fKjidV0EmFMhko88a1shwsJRrCaI6ySsIAnh'
-    b'yXr5ZrzjMr5S4yk7tUxcFQvLwUoN4ZEF1UhVNPemsouGvpndewsotQWY86UkCLU0+cM9kj+q'
-    b'VhRA69jcyOSOdGTzhXshnjji5ygAB7lidSFUtNEZ99Eg/Y0KX1E7YCQk7wPw8l9+wE+9ets5'
-    b'trUF/m2dFOu9j7vtqwG8+hZnv/WHCNwPwH0zCWBEQe2p/scbNqtm0C6GdtbSmY0HQOr76rjK'
-    b'Ty8X7X8Ndk4eA0MXYLQclJT8UirjzP2JVWAcHVx4C6NCzmF1iB8xy+am0n9JAJpAPcgRQzhn'
-    b'n2WM1khAUEhLDjiZdmAIfWyTgvXnzI6N7vOXNIGroD5iVpDMgos2UxboUTScKrP1OUgvo30u'
-    b'08t1/l8jsbF3ilK6apoc+58cAXylpFe87H4/vsnqbmsL/Ns6Ode7zrj1CQAnfvJZb38UgNMB'
-    b'3AfC9X1gmyTQCdpEwRPmEcFSiLqJC3t9d8sZWn2f9S8DI3GuFG/sslrOlhi2thWY8Qov6mNN'
-    b'flzslgM2XQCs0HwoWYN1bQ7MHqqT2ry7JCUVOqXEBM3fL2hLdcTLJ8SRFJaP52TDICCkqCCZ'
-    b'X9wlbsf39vec9p4RUUhHNoe/yE4f5dFTSY1WX/2s+1/6BMBXAfiVl55+8z/bdoVtbYF/W6fE'
-    b'euejb/VnAM4BcM4tn/ubtwBwmoB7UfzrXBrjgXHfmcp44GPqT9Nj3FrVK5LK1qivPPoXq9s9'
-    b'7E6ol/adW8XUVQGInHkAc2I+eldEhoTp+Ifmtl3GBaJL3hBK6j5zkr+1XxGri84QrlG4fMdz'
-    b'dMeB2QhwZSKw0ukGoVF5WL8xOKpZ3EhHjtbreRQUgW3cL+UKwyI6MvWPX2UkB94KWCt+Krrs'
-    b'fQXkBZBe85J7/cjGzt/WFvi3dWqvd/ziT78LwLtu/bx3/m8A7gniHqBuHjd4seG/G8GtjQNB'
-    b'vCaO/S2kst2qNdwZygwnubUCb4x+HGrIuQFLsc3Y4zc9fQTMoBPKUWdyUwQO3J2PSf4Y6V1g'
-    b'CYAX9UWYYA2skSzP/E4WhMeoW7XN9Y4B23MZeRDrVTQiXzos1UuUDQyiuH6E7OMYIofWb/x4'
-    b'UqbksTHuGb//Xgm/CuDC8+5+sz/fnvZtbYF/W9sK663/9Cf/HMD5AM6//Qt/+/tJ3A3AXUFe'
-    b'e91RdzYrrjjHH0LtGii0R+cz5Eq36A12upLA3S7A7FGWl2UCgd7+Du93zILHmm54j9/kAvIX'
-    b'7PwEFuW+/c92LsozVAc71bwRvt1FT+U9uToaYj0WYNeOJ2qtn0OPf0ESOr/6EJCXJCzX2fv3'
-    b'n6niaAqmHF+/KNm7fIaj5JYbkgtmuV1iOl+fP6PSfRgu06cFvA7ARS+6802v2J7sbW2Bf1vb'
-    b'+irWmx7+41cAeCKAJ97xxe/5MYB3BnAnCNcao/3MwnwrCW8fpNzIRvVrhTZCMn2RzMnP4m9S'
-    b'iEHjMjhY37uYbJhV8K4z8GO0Je41+FcTowJ7K5P+MAh8WRfAjqxJMsRjEabh4Lf3INAuyQWP'
-    b'U93W++tXCT0w4kJ0BYzTdI2Nfa3yc14UpR9Gd14x6Cu55TH054+lfQMdsGj1h2C/AgcCqCsh'
-    b'vAHAxc+/w43evT3B29oC/7a29XWsSx7yo+8G8G4AD73bS99/awh3wA4/L+A7Muy9F+pZoicA'
-    b'7JgkXqfiMK4Lm1TwYhJgAZQZtrfJvJURnlEBp/KzVZ1z8Rsmo6MxliZmtb3ZLH2tqXeVMGet'
-    b'Ay6M/8AqJFVOndr39Cn1TPtLww2KmgwyKMXRfKXIXjoFjf6BEFz1DiUVRyabu0L7jRyg8GcC'
-    b'3ijw18653fXeuj2p29oC/7a29Q1YF/3Cj7wVwFsB3P+er/jAbQTdfgfeTsK1yMA8D73eWDTn'
-    b'+G6z+2lzpwXoSYKAGc/PhIciTjAbH5jpEgONoI5WH79S8iZGIyYv6mwIwhn1iT2xBmGusr4x'
-    b'rDNB9WqTAIbAC9lI3fpNlQbCCn50J0aZN0EhJGYW2c2Nj01PXiGwZzni9beuBPDrAN/03Ft/'
-    b'31u2J3JbW+Df1ra+ievC+93sLQDeAuCB9/mVD/0EgNtAuDWpaydN/K4adZZcILd1JL4REL0s'
-    b'D+NkrIQ8hmh/jPI3I3FJgz9+PRO+DVMOwa1PRJ/wdO9lKIC6U5TKXpjNMdbqV+lAl5qcXR4E'
-    b'Hx3MI4vMVnb+fR66hmrOa8D3IykvmEb6wR/zReCifp/eJ5tvefbPfO+l25O3rS3wb2tbV4P1'
-    b'qtN/8FIAlwJ45P1f8+Eb7IBbgbglsJ8OSKV2VMnTyglIgkANfX4NZqViH/32UWwzByDsSrVP'
-    b'7CYs/dBOiHnGzrXzVSRwh/gOqmFNoiQwB+jm/NBhBsXsZt9Id5+FiG2oCNKuH1tWiXc2PwwY'
-    b'/cJ5EOZjjgOpGFlP7N+vinmhXy85jrIa67wXwjsEvv3sn/iey7YnbFtb4N/Wtq7G65dPu+ll'
-    b'AC4D8IwHXfjRvw3gp0H8FMifBPFdsVpUnPvnmFvnLprbBGc+14RN/x2qd1kIeIx7LcZBiznQ'
-    b'DiN4R6c+WvIhmxbI4v6h+g0IAJIqH62nviAKQG2UB/W+NW8JkwFqQPdUIXtjXkGIT8nzAKya'
-    b'RjFBWKCUxRyokQ5ogZN0iZQRECW3PuxV+PB5AO8E8FsQfvMZP/YPvrQ9SdtQhYZRAAAEyUlE'
-    b'QVTaAv+2tnUNXOff8yZfAvDa/f/wsIt+9/ogfhzELUD+GIC/yUYAQIkoxxLHHM5fQzZlcH78'
-    b'RabhOXIkFB5IK0nQ39oQgTISQLPfBSZyhOF4vYpeUIw9qhF8EMBgTZxeOhghrT8IfXWasp/K'
-    b'vMJ4neg3EH4xEf3suhXthCAEpaMxk0/gPwh4N6h34Yi/fdYPf+cntqdlW1vg39a2TsL1orvd'
-    b'+BMAPoFj1UD8s4s//kMgbg7hn5D4EQDflg1uemmgru++2vCmgtbkZclk/cOl/xyC9tp0kJJV'
-    b'bpIgptbxuiIStHAKGJv9DJr+srFGpQQnJwbJh64kIStyLssAxNAJCK8hJRHB9WOoUuxlWgkj'
-    b'KzKJ3h0sbVj0EtJp+fcA3w/ofQDe+6SbXmvTxt/WFvi3ta1Tcf3SnW94AsAJAGcDwKN/7bKb'
-    b'EPghCDcD8Y8F/INFLjYH7YlS4Lyormp8yTbXA+e+LRD9CBbCfoLxqxBANr4ZFTf3rxcrddKD'
-    b'bGNasMD4A9ZIhxqnJEb8l52Bo1Txy7T6zRYpZDD1PPaiR+UMfg7ABwF8AMCJJ97wOz663e3b'
-    b'2tYW+Le1rbKedYcbfBTARwG8AACe8KbLv4vgTQH8AIGbALgxgG9HE3sr7G5x1Kx3czUdOAbI'
-    b'Zjax2uUk2CFgEbJqV4MZWBIOpYlFJlWhVep4+RFNuz9H/ZR0EKaxHLr/njSwpEoVWmCTTgU+'
-    b'4pcB/O7+un1E4IefcP1v+/x2N29rW1vg39a2vub11Ntf7/MAPg/gkuV7T3nLJ79XwA0J3ADA'
-    b'9UFeD8B3JqIaA5zfvG5W5j/+DqNGQJk4VBAoCjP1cbQPi6QujYMwcAmloQZWKVzmEUZFhjyC'
-    b'LI+6UUAWvXqX8QGiAM965Gb4s7xHfNn1/f6Y4OUAPsFjAufHz7zR3/rUdqdua1tb4N/Wtr5h'
-    b'68zbXPdTAD4F4KLle898x+//XUDXFfn9BL4P4D8CcR0Q16rBflKv0/D6KEE8+7PVhMjMZeCE'
-    b'uTw3Lyop46W4LUC746C/w67LVgZaUPCGbjSv1OmN8U85H1eC+FcA/iWE3wd0BYBPPvWH/94X'
-    b'tztwW9vaAv+2tvUtX4+55fd9EcAXcawlsK7nX/qpvyPgfyF4bUL/EOL3gPhuAP+zgGtx5i27'
-    b'KNhFCz8Trk1Ou8lEqBOzscJ+idykhd49oVACF9Zc0AFYmxEcecMqet+mAAwi+dzP0q9IwJUC'
-    b'/gDAZyH8G0CfwbHBzb9+we2v9yfbXbWtbW2Bf1vbusatR/zE9/4JgD/BMYEwrfPf85m/gR3+'
-    b'JwD/I8TvAvX3Af49QN8J8n8A9N9D/LtkweMRBYVScW0mRMRABBIG4KNxJiEsdy8MiYErGka3'
-    b'wDCs90WA/weAfwfojwH9EYAvEPg8gX9L4A/ffOa9N5vabW1rC/zb2tapsx70o//wzwFcsf9f'
-    b'uy784B9Q0LUA/Hck/w7Avw3gbwH8DgDfDvG/BfFtAP4mgL8B6L8B+F8D+K8k/Jci/guC/zmA'
-    b'vw7gr0H4z7DDziQFjij8/yD+PwJfAfD/EvhLCf8PyP9bwF8A+I+U/hzc/QeA/x7A/0XgywD+'
-    b'DNSfAvoSoD8R8X8CuvKLl7+54Pd/+FngD7fLvq1tfcvXfwK1yOA2AzeC3gAAAABJRU5ErkJg'
-    b'gg==')
+The images are read from the PNG files of the Resources folder when they
+are requested, so importing this module costs nothing and no bitmap stays
+in memory after use. The objects have the same interface as the
+PyEmbeddedImage objects previously generated by img2py.
 
-#----------------------------------------------------------------------
-DSPDemo_Icon_Small = PyEmbeddedImage(
-    b'iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAYAAABw4pVUAAAABmJLR0QA/wD/AP+gvaeTAAAA'
-    b'CXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4gEKAQs0BgeetAAAAB1pVFh0Q29tbWVudAAA'
-    b'AAAAQ3JlYXRlZCB3aXRoIEdJTVBkLmUHAAAgAElEQVR42uWdd7wtZXX3v2tmdju93nPu5dC8'
-    b'1AsIgkYEQxCNDYOoEQNKExWkKBpFicaXRGNBXyMiUgRpCjEKEYMSY8HYIkpRurRLue30uvue'
-    b'WfljZs+eus++CGjedz4fPuy7z572rLV+67fK8zzCn8Bx0tW3cdWJLw5996Ebf5vJWmY+Z0ou'
-    b'a5mjWcvYP28ZG7KmsT5nGjtlLWO8K2sO9eat7t6cle3JWvTlrVpfIVO84CvfmLv4mpsmK2I9'
-    b'cfDRRz26brfdH+hbM/rbQnfvlJm1agLVjx4wUPPv9cNH+cwr1v8pDAXWH/PmR3/pJ3z7zMN9'
-    b'YZzytd8MZE3ZkDPNvUEOAg4E2Q/oAlAA8f5rHur+TwQEcoZITh0dUtXdDNM4VBAQQQBFy4Lc'
-    b'DXrneb+eut2u1R6s1+r3ffqIXRebl3vvjXdxwRtf8P+XQF5+/i386JzX8O0zDwfgzZf+7OW5'
-    b'TOZYlANR2REYaXsBSf6skvRbQTypiVBAeDHKiz1ZzqDOpg/e8sAd9Xrt+i8ctf+PmsJ419U/'
-    b'4bITD/9/WyAv+tgN9PTk+dE5r+Hwz3y3O2dlTstlrQ8Bw+IOpyAaHvDmYAbHXqN/dv8izc9B'
-    b'IaEokvZIIyKMKOwv6MlnfvM3W+xa7YJ6vXLBZSceXgc46eLvcdW7X/ucjZHxbN/gBX/3r63B'
-    b'USe7vFze/SX/+O1P4zAL+jmBUcBQRHyV1+CYS0wGxMZdfQtJQLPWJ40bmnryVhUDmFD4rKhR'
-    b'OfmS//jM8V/8zoZapeIr7Zs+fu3/boHsf+6/ctcnjwHgwI988xCQL4vIXSgfAnKJgxZX8tbg'
-    b'rXI/8U8U/5oSxDVpj34twakBnAP8Qh37kjd/8usvBbjh74/nqHMv/d8LWb/71DE8/8PfHDYM'
-    b'vRh4pUJ/WN8lMCCSpNrJg5fiQ0IylQRRavzaGrpMTGIDOJwCvPGN5115i2M7p3/746csHnnO'
-    b'RXz3/DP+9C1k7w9e53/e90PXZ57/4W+8VcR5EngzvjCSBySgnYnX1ug/NPqH8NUdjXqgBIYW'
-    b'+EqlLYEYBD3OaTSmjjznomOfLWE8owLZ+wNf54HPHgfAPudctw/KdYp+DaQrXfETVNrjr9oW'
-    b'WuLXE9QfVG2+mOIxrJZ0JEWuqXioAeIgZAWue837L/j3V7338/v6rPG0T/1pCWSP91/LA597'
-    b'KwAbPnjdmaj8J8Jf08GgSgpOSfOr1JPi6C8aEE6b8e3ku6gJaViArwP9/ivO/MxZAD+65FwO'
-    b'f9cn/jQEsvv7rmW33TYAsNfffu0q4IsI61p0VNuIRAIaGnDEGni6JAjTYESYZjEJgpOW0DTB'
-    b'FUk7CYasS0BZhyP//PLTPnXTHse/1/jJZR/lL075xz++QB7+5+N56KH7hvd4/9duVzhRg4AT'
-    b'iKLViwnSNbHlXgOySRumZPH6oy0Bi9GIGYXPFX982z6di6gauZBgAkety4387LCTz9vpv674'
-    b'GIce/1EOOe7c514gz3vP1QDsdvY1B4vI7YIeFNXG5oOrhm8UC9S0xbekk5sHYISE64a1X1Lh'
-    b'SUNQJ+0BLAU+vV8fguothx7/0T/7xbWfQEU4+C3nPHcC2fWsq3jsiyey/r3X/DnwbWAXjdLL'
-    b'AOVsJi8kDlSJsCP69JREVD3FVd8idRUnJomxkMTPSfkq8PUGUf3Owced+/r//vong7z72RXI'
-    b'LmddxcYLT2LXs676M1X9KehYit77T6uxF5UoIQ24Ck2noG2i7hA2Bi1P20tXEzVDUz1+68k1'
-    b'yULHDNVrDj7mg6/71b98hhe+8exnXyCPX3gSu5x55Z8DtyXZsSRyyiQfIileRRJBRsMONRHH'
-    b'VBOcuqwecK7OBdsgV5y596nq1S964/sOuf3GL3DQUWc9OwKZePcVAOx8xlcPBr7ZNmROyAIm'
-    b'M5iU6ELbCSiNEmmMom7/scqZGueNwVdQ9c8fUrjhoKPOetEd37mQF7zujGdWIBPvvpwNZJg4'
-    b'/YphVa4HxpJ4ocYCZ2mfN0qSYZBlBQxCOlVzjTPjdBffkaRbopK4pQqaFh+NA/9+wJGn73rX'
-    b'zRex/2tOe2YEsu60r7Dp4nfwnxefgCjfB90l2YAjhYkIxdTVoEFSHL1qmmOKf6/aZjg7SS5u'
-    b'p6hk1RzcmKDXP/9Vpw7+7pZL2PcVb//DBLL21K+w5ZJ3ArDDuy+/SuGgsE5IykNrTFvTsrXp'
-    b'yUXtWKdbFtdGWAloKCRZX0ouTVeP71MA+MXAeQcc+X75gy1k66XvbFrJmcAJ8btqMmRJJ25T'
-    b'E7mZ74e1Dcxo+j0UOhRgkqIInSX6Wx48KCiNgIX6l3Le06gtHHvvD7/Khped+IdB1tpTL90H'
-    b'OBeQZrQq7SykCbbSoTbHrElXQadmrCGJtEE6YEmJMYgEE5EJgWu0pKJJMCje9xJHYYdr9z78'
-    b'hIn7b72avQ47/ukJZPxdl2VU5Txgnf8MsormNaWiLR2UmC1JG1iXcBosVtKV8IDo6rYhoUEn'
-    b'OQzUprW28UJRAhjBMdFmLJTo9wxBbgJ48KfXsuehx3UukDXvuKRJ446BQNZW2gFQWlq2M6yN'
-    b'W1mEIKQwZolWrSTOplU6ImbpFpL04CJI1B5FE0A5dOy/15+/9WyA3//ius4EMnrKJUxdfhqj'
-    b'p1w8DFy2OkprPIDTZMiRDjhNpzFEPKbWltKqrh7VJ5ARjSmRhsdaoxbVNqgPlJSbv1VTlffs'
-    b'ceixO3UMWdNXnOYpgFyC1w8VzhdKW42Tpto2OwhEknUmJWEVDa5T2UvKQ4i0PzM6iNJWCVrn'
-    b'OwHL00ggGqNjkhLkug+3qzr6zt0Ofot0DFkjp1xyGPDKROqXQkIkKdqO/VYSByXR/mQ1fNO2'
-    b'0XR7hemElSX4h45MN+JDJMHHoh9V214LsOtBbwidHmpyGDr5yxiQBU4G+tJcQjQ91MrpBr40'
-    b'wkxfCTv5p5U8DP5C0nFeVxNmCqGQkAZFCluSnHcIGYBK6OwgnGrcaL4MHL2qhajIzihv7jT3'
-    b'IwkUMVCRSuX/25PcW72+Lu0caWf+SJu5qISrJFqHxtiUJjU1aWrW76hdDjz6wI13/Bs7H/D6'
-    b'uECGTrqIuStPR1VPAbqfTh5U/WBI2w69JKtnahDYGRVIcr6SRqfiz2SEUsRJ0U/Ed0qytXt+'
-    b'U1YNklUE+QjAE7+9KS6QuavOYPiki7qBs9tGwZJOa4Vof1ObKqAmX0UDKtUcn0q5yBMP/i6S'
-    b'itEOY3RZVYwKqNP80ClkabJSSZJVSHJ1U/UlO+3/VxtikDV40kVeMMlpQK69x9UOchi6XVRW'
-    b'k5LtTV4gBpt+fw9fP/9carXyqsI2LAMxJCV2SFcId9BlOwp9EiGK4X9rhEYntXcorBWVV8cE'
-    b'Mn+Vn6//0GqaJSKrBn4dZVUlEj2n+HLHcSivLLPHC17CxgfuxjTNUFIwWHc0BB599DGmp6ZX'
-    b'txGJg1Nqo4MmK5VKkgdpCUCkRU01Feb1yJ32e22/L5D+E1zrGDjxopcDw62oO3mg1UnXGCWU'
-    b'MWmLGOo42LUKOC0ekOQF7XqNSmmFAw9/LY/cfTuGaflYrSFXLtQbDS679FK+feP1ITqYll2J'
-    b'xeXaJiUd+5siqmG/LglZZ2mOqCZgvwB6hDqt+pKxeI1vHcc2x2X7yvPii8NPe0g4+SMJXH15'
-    b'06Pcf+OXcNRO9rfeF41GnXJxiZ333p9NjzyAYRghAQb92vLyCqNr1jAxNtRR1lai+C4pGpQY'
-    b'A4rrlmOZE/GVJa7NwY8ajPiPDkFW34kXDgAHslrDh6blwgMoKcFsbzIVVXUoz2+lPLuV8vx0'
-    b'Agy2FMixbex6jd6BIRy70QaVoV6vU8jn2GliHerYKc4iAI+OE/Y3MfPWWOFE2sCWdpJeDkRj'
-    b'LcvVtwOs2+svvfBNZQPCjqsWgyQpfxR9S43BTuwlGg3sSpGdXnoU0w/ejphWOhNTx60EGgb5'
-    b'Qg/l4rL/OhJ5DNtuYFomA0OjVMvLQS4b9x8i3HHTtfzq+kvijiUKZppQCpAEoiUp2e/m4Gta'
-    b'SKl7rt3zFWNbHvyBT3v3Rhlp3/bZUiBJdOpCfWmW5cfuiuVwovDrOA0a5RVGNxzM/OMPIGKk'
-    b'QkqjViFX6MaxbcZ2Xs/c5BYMQ+KFLREmt25jaGCQ3oER6qXFiOWFeW6tVKRaLPLobbdiNPNt'
-    b'ktBqJynuRRNYiG5PMBsFHjkGwOg74cIMcFBiEakjyPK9NKWn7mfy1q/RqJbC05OipzmK1qoU'
-    b'Bkapl1dAJJCTC9zXMFicnqRnYBjHthlZuyNTW57yBRh8QsMQHn98I+vWrSPf3U+9ukKsZSjw'
-    b'ENXSCvneftbufQDFhdlk2AzGWIYRVpw2DXSrppUjY+x5ojc0fUhe0QNjTCktjE4LURybRnGB'
-    b'wRf8JaVNDyFipvgQoV5ewurqBRQjk8OpVQPZlpZKGiLMbnuS3uFRHMdmdIedmNu2GTHMGJEU'
-    b'Mdi8+SnG160lkytgV4tJ0Zz/Hna9jt2oseO+L2TTfXdimFbg/gHIUtf65jc9yuzjvw87j1jG'
-    b'sZM0NbGsnqe3B7oCUXIo+wXix3D8ZNdxqisttpHi9tVxcCpF+vc5jNKT9yCGSbxiKIghVOa2'
-    b'URheh2PbdI+uY2V6ExhGgjYZrMzN0D+8Bse2GR5fx9Smxz1tDjMcQwzmZmZYO74OwcJol1QX'
-    b'oVpcJtfVzejz9mLy4fswTDN1JB3bZuvvf8vd37+uZUk+nQxgimh73ErM1Pq+OTu2/oj9DJTR'
-    b'YN1DI0678tidzH3/YrRe8xRGEtovBae8hJHvJjcwRnV2q6edre5EadqfGJRnt5AfGkcdm541'
-    b'O7K87UnEE4gEJ9eIsDgzSffAMI5j0zc4SnFpMV7cF0FEmJubpbevx71jW74oLGx9ir416xia'
-    b'2JX5LU8E4Ch+Xq20TL5vgJFd9mR5Zqv7rJqWZZAwG0upNUiT+Lb+ZInIvoYK+7eiskg6wnFo'
-    b'zDyJNbwT9ZknU5yvy4DKkxvJjUyAKkaugFMtJSY3RITq3Dbyg2tQu0Hv+C4sTz0VwHAJ/bZS'
-    b'XKKrb8C9rmFg23asP8L3VX65XbGsbID6RhOJBgtbnqRvzTrMTAa17Ug6P6z5dqOGqrLjvi9h'
-    b'euP9nvUnZGO853Dqdex6tX1sE//OBN3TADYklSzdKLmCqkPvAa+ivPFOMMxIPaRJzg2qk4+T'
-    b'G5lA7Qb5NbtSmd3s0U6Ncef6yjxWvgd1HHrGJrxYxEhMrzSqVUwP30HJ5PI4Tjxd4KhNo9GK'
-    b'PcxsF069nDIUwtL0VnpHxhDAyFjYtWpLw3HCz1utYFpZ+tftzOLWxzGa8JrS8L3tkTt58Kff'
-    b'dGE4tRoXgzYDWG8A6xMnThomja2PkFu7G5mhtdQXtgRKs9GMnkF9cYrMwDiO2uTX7ERlugVD'
-    b'0eFw6lXEtFBVMrku6uVipIjVDHiVTC4XViPLolaphNmNIawsL9PVVfDf0Mp1Q6OWXMgyhOXp'
-    b'bRT6BrFtm/6xCZZnJyPVvhZDLM1PU+gbJJMrUC0VW2KVOGTVqyVETLr6RliZ2eKNQUeNaqDs'
-    b'YAA7RfMVrj81qW55gMz4HqjjYPaMYK/MpaRPFW3UMKwsOK5AqtNP+Y46mAR0GjXMbD5MGw0j'
-    b'NmVBRKiuLGNlc/4gKdA3OEylVAw9hyEGU5OTjK4Z839nWnkcu5pSUlTsRh0zkwHHoX98gvnN'
-    b'j7uDF+tiEZZnJ+nqH0Edh0LvANXSSkLPsXvnRrWCYVms2+cQ5jY9iOGTm5TEjbgI473/qIHq'
-    b'eKwsqS7DacxvxewdQR2b3Ph6qlsfRkJsxIO20hJGvse9saNkeoepLc0gGOHwRYTa4gy5/tFA'
-    b'YOXd00uLhPJd81P0Da9p0QKFXFc3xeWFMMMyDDY/9SQTO0z4PsXIFlC7RlJbn91okMkVUFVU'
-    b'HfrHJliZ2RZIo0hI68tLc3T1D6Lq0DO6A8X5Sd/nRYe6Ua9gmBkKfcNUi4t+djBcTfSSPwLl'
-    b'4ixL0w97Y6VDhjqN4XjuRrBLi1jdA+4FHZvs2Hpqk495fiGYdTOozW0lO7QWdRzPpZigDqp2'
-    b'xEkbVJdmyI9MuL/1OFi2q5eap3W+LYnB4vQ2egdHPZ/h8r++/iGKS0sxyJqdnWGHiQma7sWw'
-    b'cmijGo9rDaE4P+MOsOPgOA6D63ZmeWbSV6BoHqtWWiHb1YvaNn1rdqA0P+2Pg0SgsLKyQL67'
-    b'HxzIdvdRKy3HSEJzEpHj2NSK89TLi9QqiyDSazjzm/tdnNMQu2nMPkVmbD04NqhiDa7FXpqJ'
-    b'CEQQw6A2t5ncyI6t3LwqZqEXp16JaX1lZjO5wTHU+62g5HoGqC7Nhx7cMAwWprYwOD4BvvAg'
-    b'39NLaWUp1A5giMm2rVsZHl3jXlcVMSzQRiLDWpzcTP/aHT0LUbqHRigtzUfaW8Wvx7QyA0r3'
-    b'wCjF+Zl4WsY7o7aySK53EMWhe3Cc0uJ0LD5Vj3nZtTKmlWVo4gBKC5sRMfKGPfWYQSCqbjr0'
-    b'+rZHyIw9z69tihiuT3DqsWJ0bW4ruZEd/UEGyPQO0SguxWhsdX6S/OCYLzxVJd8/5Jl3mB4v'
-    b'z3qQ1ew/UqW7t4/i4kJMgeZ8C3H879zscBiyRAyWp7bQNzruC8+wrEg/Veu6tdIyVr7g/l2V'
-    b'XFcPVV/r42XZ8vI8ua5e1HHoHhijvDwbIxZNn2rXy4hpYZgZDNPCsesZwykvadyRGTQWtmAO'
-    b'rPNgx9P6ngHs4mIkgSM0VuawugdbzlcdrO5B6stzfpDUbN2pLc+R6RkI+ZB83xDV5QWMUEHa'
-    b'YHl2iv41HhR633f19lGtlj1n2MpjTW7dyvDQCOq0KneO7cQTN4bB/OYn6BufaK2/gaC2A05w'
-    b'sRqX3xfnp+keGPZ9gGFarfW3YtlfxXHqGIbpQ7Gb10vuYK6Wl8nkekAdct0j1MoLGJLrrjnV'
-    b'Ygi/1bHdXJKVCWTVHaz+cRoL28KmrW4AKZmMp0XuX7L9ozRWFmJOXWtVjEw2MEwO+f5h14dE'
-    b'2EetUnS1LVSWM3BsO9ZF4ji2q+mhgqrh+6qgH1ua3kbfiAub4oGflS9Qr1ZCxQ/3t1voHnKh'
-    b'0L+dmcFuVCP1EaFeKZHJdvm/M5quIBo3NYtvlRUyuR4clEyuh0atWDfMoR2KzvyWVluLCFqc'
-    b'd9lVJLecGVxHY3k2lLJwamVXcJHUtNXdT6M477fE+JGsSCw+MTM5GrVyDAXser0VhAVe0jSt'
-    b'8LwMB/oHB2IvriJexCwhC1ma3ELP8BrUadHpXKGLanEpYk1CaX6GnqGxlvUI5Lp6qVcqMTgu'
-    b'L81R6B/xZ3KpgmnlWlF71Jq0gZgZP8xQ1bJh9I/POYuTflStCI2lKayB8XBLjCpmz1AEsjy4'
-    b'6hsl2rJnZPPY9WpL30SwK0UyXb0JDbYS6ztTVRceEhp9bccOWY2q0t3dE8rDiQoYGRy7Hju/'
-    b'XimRKXSFmFS+f5Dq8lLMmkrz03QPjQZIiJApNIPZsC8tLkxS6B/2n01EsLIF6qFuGfcatcoK'
-    b'VrY7hCoiVA2xspNqN/zuCBGwl6Yx+9aEo1b1pNh8bc9cGytzZPrXhBy6S30NF0sDQV2jtEQ2'
-    b'GIOEilZ2q9ooUC0uY+VysZ+anpCcQNyiqhQKhQQtFOxqOdz66iiOY0fyckK+u9d11oGuAhGh'
-    b'vLxIrqvfz6YouNmFajGMmiKUFmfo6hvx4U0QMvluGrVyZCKrUCnOkS30B/JwBmJmewwV4wnJ'
-    b'5NB6peVDaiUk351IGZtRebPToLHsCkRiyU0vAd4cOBFqS3NkegddIQXrUF4niW3XfegsryzS'
-    b'Ozgaa8yxMhnEEOxAfb3RqNOo1yNwpSAWDR8uPBrbqJPv6ffhqvmXgu/HwpbnK5q0Bt7KFahX'
-    b'yuE6lRhUlufJdvUEcoqCaWVwGvXIhCahVpwn1zMUej8rUygZhpV5VDIFtLLcipjFwDAzcY0z'
-    b'LMTM4tQq/pd2ZQWzqzdUHQR16+SGhdNoDUijOE+mdyjGfJo+yKnX/JcuLs7R1T8UYELNXFaG'
-    b'WrVKw/stIlSrlXjCUT3n6z+r679KC3PkevtCVqpAJl+gVi6F4bhWxcxkASeUfjVM0x0nDdeD'
-    b'3PjHbHWdeIMfyjp767rUqkUy2a7Qc1jZrl8YmNkHMC3PQgStlV1al8klvqBYWZxq2WdIWq8j'
-    b'hhXTZLEyYIBTa6Wha8sLWN39Ec4vGFYGERMnoOWlpXn6R9eGoRCwMllEDOxGwxfewvw82Wwu'
-    b'ofJt0KiWW7MPRSguzDIwPoHihBigYZqRTAFUVpbI9w7G8iNNWhuEoUatQrbQE5r3p96YOXYj'
-    b'ZGm2XfdyXGHUNozMbw0R87diZf00g9ZK7k0z+biFmBaGlfWEB2rbiGn4+a2QUzVMREwX3jw8'
-    b'depVrFx3jL2ZVgYxDBreM4gI5cU5uvoGIpQXLMvCbjRoNFrCW1pcYHhkJARDzSy0S5EDicKZ'
-    b'bXQPjgSctDdrThW73gjhfGlhmq5B10kHJ32aGXeQJRCElpdnyfcNB1dzQIBMNu9CsWrLOkqL'
-    b'5LoHfMX0ntoG4/cGwpTRM1y2Fybd/FOjBmbWrX2Q3J7U9AtOrYwYFuLBmwReRkwLxMDxBeLG'
-    b'KxhGQj+uKxCn3vChpby8RO/QmhgBsDJZxDCwvdqHIcL87Axj42txItakqjh2vdU5JgbLU5P0'
-    b'j+0QE55lZVDH8b5XTynm6RvxrFSDND2PY9ut+4lQWZ6ny6O8YUqfx2nU/TwfCNXiPLnu4agv'
-    b'bSh6j4Fj14yeobudlRm3IDS9kczwjiT0SIKAke/GLi95Aqkglgtj4WqjO29EpBWYOXYDMU03'
-    b'rog2KRuG50Bb2lyrlMjm8jF/Y1qmf73mYMxMT9M/OBCb3yGR5S9EhJW5KXqH14R7YhWsbA67'
-    b'Xgtc16C0MEP34Jq48LJZnEbNfzc3Bpmlq2/YFV6A1plW1hVIq3ucWnmJfPdgpDOZ+uSjP77H'
-    b'wNEqcGdmYl+Kt15OY/YpzDW7RuaLtwIdq3eExvIMoDh1j2mYVmI7n5HJorbLMOx6FclkW7/V'
-    b'eIOdCy8a6Co02szhFb/hbWlxgdHRsdbAtUJl7EYLv5s+pNvPj7XCIDNXABw//yVAeWUxFIOE'
-    b'A9mqW/qlqfVL5Lr7AtDUYmWKx9aaAWGj7na5aKhH9TcAxtLXzqphN263xnfHmtiHwgFHIo4T'
-    b'7zZsRuD9ozQWpzwCUHX9R6xU6zYZmN391Jfn3Yi5WnKtxrCCjbAty7LcMiqIKwyv6yS23pUq'
-    b'ViYbaoRYmJ+jq6s7RiwM03JhyHZatLdew8rlw75JwcrlcBoN77de+bhSwkjoIzCtHI5j49DK'
-    b'bisa6JzR0KzubKGXmhdQN+oVzEwu0oGnADf5vb0ID2LXZ3J7HobRNRDK20T9iJHJ49SrOPUy'
-    b'tbktZAbXEpva5jW+ZXoGqC/NuFpRLbvw5ltTOB+W7eqjsuJ2lDRqVS9KNxJ7eE3TpFJa8aHB'
-    b'sRvk8oVglOZmCzwt9Bu6m7Q04ch4QnIczz/ajhcIxxvcmjISvyG8hpXJJy8L7ShdfSOUF6cR'
-    b'Q6hXVsgUeokv4Cbf8gWiqveBbMJpgDruxJW0+q9j07XLASz8+ibKT91HbnSXloYEpaeQ6Rmi'
-    b'tjjtl24Nw0ysswtK18AwleV5FKhXypiZLIZlJlpqd28fpZUV/9+Oo5GmaRcKDNOiUaviNBpu'
-    b'64Jt+6QgrvUZ7EbdzRiIC7GmlXFTNxpvp80WuqmWV7zGvyLZXFfiytuqSr53iOLSJCKml1Ds'
-    b'jqL7A1sf+s+tAEb/iV9i6ZqzFoE7EtbxjEO3Y9O9+4sob3qQwsTeGE34CD2w29Vn5nuxK0W/'
-    b'pchlXpGlMbxzCn3DFOem3SJPpUSuqwfDsBIsVenq7WNmcjNiuGnzXC4XaZtzB9G03Ay0qo0C'
-    b'tXIRw7ISi0tub5dBc5OGWrlIptDdSvOHmKZS6BuiND+FGEKttESm0JO8GpEohukyuHqtRKNR'
-    b'84LuYCO3cY0Ps4tXn9n8fH1zlGL9VJF5DU6jzrq/OY++/V6GNuoJ/b8ttmN29dFYmae2OE2m'
-    b'ZzC5ZViVQv8Q5aU51BsMy8pEuglbl+8fGmVxYQ5BqFTK5AuFUFa4yRcMK+NbCECtXCLX3ZfS'
-    b'XyaoOjj1KqDUSivke/pdfNJYAxZdA6Msz04iYrjPm+9KnqSkbulicO3uTD16B3at7FlIiFTc'
-    b'0AplvWPh6jN+BLIlUBVJ6T2W1voyTrDBLC5AdWx6d96H+ft/TmnbRnLD60hbvTeT76KyvICI'
-    b'UK+WsTJZDNNIXCmhd2CQxdkZN14pFSnkwwJpEgEvpe078OryIplcPgxvtCaRFvoGKC3Nu7X/'
-    b'0jLZrq6YhTRP6Oofpji3zUt01jGtbKgvOWSsjkPfmp2pV4pk8j0hVBGRH4swObHPa1oCGTjx'
-    b'S82TL1itf0hSdy4IdA82X8Cx6dv9hczc8QPsWpFs33DbDj4xTOxaxaWvoq357pENWvoGh1lZ'
-    b'WkQEiisrZHO5RGtC3GRisxBVLa2Q7e5JtBBVpWdknOUZtxRRKxWxmtmKhMU8zUwWVYd6zc2r'
-    b'WblcaCpDEl2f2Ocwekd3jk5nvvnJe763tOm+W1oCWfBgy7DtC8Jte2377QgvmhqkceJDh6rN'
-    b'Lm98H+OH/rUPb4mrjqpD/9qdmdv0GLXyCrlCX+tJIm9nWRa1agVUKK4sk83lMA0jOZDN5HAc'
-    b'RUWolVbI5PMxpy6eQPpH17I0ucnVA8dx4SqyUJYEkomDa3dl6tG7qZdWyBb6CK9rEW93NcyM'
-    b'pwzNbACbVfhBiKo3PwyddBGz15xVBz6n7VayX23tEX/ioydax6Fr7XoyPQOh2khSh/navQ9k'
-    b'0723UZybonfNeKo5qiq5fIGGXadcKpHL5SLJutbyodmuHsoLswiCXa+TyRWSuxlV6Rldy9LU'
-    b'ZjdsrlXcJr2UTnbHthnf80A23vFjDMsiE6TdpO6iET1+9eTv/v3eRIHMeVOjReRqQRcSV1Vj'
-    b'O45QatpO7OoI/dyxGd/t+eoy9kcAAAkdSURBVDz83z9g8pH7GBjbMb2bX5WevgHmpiZRxyGT'
-    b'yYSYU5C/FfoGKc3PuMpuGCntra41W9k85eUFHMehXimR7+1P3c8E3A6UvQ47mrHdDkBtZzuX'
-    b'9RAUzgPYJWlpDXAXn1HVhxC5IXFJ5w6XI0xq8E7fOyTQLWkIe7/s9Uzs80IMy0xVAsdx2HH9'
-    b'7jxy/92YlkUmk02dHNM1MMLS5CZQqHhVyPRHdehfM8H8pseoLM5T6BtsvXfCZFe3ye55ZPJd'
-    b'fnqp7fuHB+HGx+/89r0AjyctrQEwd+XpzF15ekNwrgKZT1DMhClZKasESDjWEOI7EkT7ie16'
-    b'jee/8hj2OPTVOJ6/SVovxLZt1u+9P7+/5y4W52cZGBqKpemb0NY1OMLS1BYcVWqlojvIKYfd'
-    b'aLD+4CO4/d+uRNVx4S1t3o9K6grXQeROnWBlcGbSMyTa7/QVp/8c9JbVtT+h8Tq44rC0aPIq'
-    b'7MC/huPYsRbUqFQcx2an3fbk9/fcxcaHH2Rs3Q4kKg9KrruXlXk3fVOcm3arkBpvcGvWd8b3'
-    b'2I9coYddDvqLVrtRRwQnxWFIJKpzZ17906O3fWvr+j/769UFMnpKc71FTgdqqYMXWx5BA0GZ'
-    b'BhYQ0cDuNJrC1FpT27W5kmFg75HQ2huBY6f1ezI7tY2hkTXpG4kZgmVlqZWLVIvLdA8OJzxB'
-    b'6xmdRoNDTzjbrZlE6unhk5IgSiNBACSsDfOwiFwB8Oivv7W6QKavOI0177iU6StOWwROinI+'
-    b'VU2cp566SJAGIUvSIUsjp0iI+MeOWrXMSe/9MCed9QHq9Vqqxji2w/he+/PQz77vdsJEe8ia'
-    b'k/y0lRYxg7+R1XJJybYjySjSEOSyh355/ca0MxMha+ryUxl756VMfuXU64GbQ/sEISlxSOQx'
-    b'E15Eo/mudu8Xm8MXX2o0my/Q1z+YQoTcQXYadfZ46av42ZX/l90PeXnyNDcNThjonEtqDJqS'
-    b'shahX92xXK58HmCPl27HMrEAk185tXmfc4EtQMo8a0lOLmqUgLZ/KU1w/qsidjMt0m45QHXI'
-    b'9fbzhn+4hB02vCDBL7SmQHfu6xLCAE1ZQaBFx6sq+rbNt3/L2euw43no59dtn0Cax9ZL33Uv'
-    b'8Gm3CJ++0FBYN+KLgMXcv6Tpo64mGeK2087JCU69zviez0/S2JhY6Aidkrf2i107uCCayJse'
-    b'uPWaRza87Hge/Gn6Fq4dbVex5ZJ3Xgh8lxjUhCEr9lKtWcJtN0IJu4z4WharLeG66h46wqrL'
-    b'cou02wEh4ZraoU9xL3qBZMz/2PcVb+f+W9vvp9vBdhWXu1UxGm9A+WX81pJwMWn77LrK87fZ'
-    b'oirZQjqG/fSV8jRN+G0cenzJv0Q69nOQj99zy2X2vT/86qpPaKxuHe9gh3dfzuTFpzmCHItw'
-    b'vyY8cdgKNORj0jbESWTPbfb6aJNJoZ16bk92QToVbNK6NvH7zCK87e7/uHR2/1c/Qxu6AGy+'
-    b'+B1MvPsKnrr47U8KnCwwGXXqmrTOh6btM6X+Kg+SZj26HUPX8WLLq68YrNthY5riFz0tqQEH'
-    b'/fbmLz/R+Uhvxx5Umy4+hZ3P+CpPXPT2XwOnIiylrZMeWlEucZVdScUtSXLRq9GftjsLa+Ke'
-    b'WDGu2A73tD1YtaiF//0ShnHYHd+58ImDXv8eAH73vUueWYE0j13OvJLHv3TyTShvBeY6rZck'
-    b'VEA6z1Tq0wUX7Rym1EHStv5Leg2N+xDv30sictxvbvj8bS9849nccdMXt2t8t0sgT1zk7qG0'
-    b'q7uX4c2gfwWyLYXWB1bM6byw0inca2LKIhVMOpDKKjxbEuPO6Bc1RV75q3/97HcBbr/xC9ur'
-    b'709jH8MvnczGC0/iee+5mse+eNIvgaPwfQrhDVhUUoLD6JrwcYVcbcH8Dhar3S7hpMaXHX+p'
-    b'swh7/Pf1n7rtkOP+jqd7PO29cB/74onsdvY1PPKFE34DvATkNlceEonUJcUm0payjNAvWX0j'
-    b'7va1r85WnY+vt7CKtMP3/LkYxkE/v/YTT7z0+I/yy+s++dwLBOCRL5zA7u+7lof/+fiNwGtw'
-    b't+5OTGhtb22rncPW5Az3H+RHWl5AU7lBNFL3jgtAj/6vr/6fJwB+fu0ftq/6M7J99x7v/xoP'
-    b'ff5t87Vq9WzgrdHu5GikLm1Ww9aUvQ9Wi9Q13cF07JMkZUOw8PP50W5VkdeprX/7k8s/NnvE'
-    b'u/7pT2M/dYCHPv829v7A18kXCnr/Z4+7DoydgTub+a9oL4YmpqZpn9uKCVjbMB7ZLgvx1z9O'
-    b'2+Y1fDQEbhPT2PeHF33wu0Y2YwP8+LKP8F9XfOwPHkuLZ+h44HNvBWCfD17PfZ/9m03AQft9'
-    b'6BtnA+8R2DU5l5XUpqGrangnzS/bc4jPRdqlVhTgYYHLqpb1+R+ef4bz2nMu4nvnn8EzeRg8'
-    b'w8d9nz2WfT90PQD3fOYtXwAOV/iEpETO+jRGMhqcpS2M3SlUacitpyUf5Z8EXnXz+Wd87ofn'
-    b'n+G89gMXPuPCeFYEAnDvZ47l+R/+hhuhfuotTwp8TER2EHcOhCa7eElJPGqb+DollyXaPpWe'
-    b'2CWbEqgqN4qw7sbzTv7oTZ88dSPA6875Mt/73FnPxtA9c5AVPe7+9Fv8z3d98hjFLXId/cK/'
-    b'v+FAQT+CyEuAtXFkksgAS1oxMRy3dGprCXgnsQwCm4FfiSHnXf/BN98L8JZPX883PnwsADef'
-    b'f/qzNWzPnkCixwv//gYMA379D2+6E3jTyz793Q0IrwaOBI7w6zgJe0toGyVfPQHT2YZJXs3/'
-    b'xwI3i8gPrjzt1aGOwqYwnu3jORPI7R9/EwCH/ONN/PJjr+fWDx95P3D/6y+89QqBMRGOBt6O'
-    b'6J4S2sxwdd8ibUN7TZWmB48PCHINcAMwefFbX+oveHLKV37AFe/8S57Lw+I5Pn75sdeH/n3T'
-    b'WS9bBBaB84Hzz/zGHWPAMShvAA4EyXrPaQZ9nmg6Y0ugwI5HwRsoddwJljeJyLc+dcT6rc1f'
-    b'vv/mkFE858L4owik3XHGv9zBl95y0CRwofcfn/juffsJ7AvsCawHdgBGEYaAXiCPSMZzzHWg'
-    b'giHLIjKn6kyr6iZVHgMectB7PrJ//z1p9//86/b9o4/B/wDmQeVqxfg00gAAAABJRU5ErkJg'
-    b'gg==')
+"""
+import os
+import wx
+from .constants import RESOURCES_PATH
 
+class LazyImage:
+    def __init__(self, filename):
+        self.filename = filename
+
+    def GetPath(self):
+        folders = [os.path.dirname(os.path.abspath(__file__)), RESOURCES_PATH]
+        for folder in folders:
+            path = os.path.join(folder, self.filename)
+            if os.path.isfile(path):
+                return path
+        return os.path.join(RESOURCES_PATH, self.filename)
+
+    def GetData(self):
+        with open(self.GetPath(), "rb") as f:
+            return f.read()
+
+    def GetImage(self):
+        return wx.Image(self.GetPath(), wx.BITMAP_TYPE_PNG)
+
+    def GetBitmap(self):
+        return wx.Bitmap(self.GetImage())
+
+    def GetIcon(self):
+        icon = wx.Icon()
+        icon.CopyFromBitmap(self.GetBitmap())
+        return icon
+
+DSPDemo_Icon = LazyImage("DSPDemo_Icon.png")
+DSPDemo_Icon_Small = LazyImage("DSPDemo_Icon_Small.png")
@@ -0,0 +1,562 @@
+"""
+Instrumentation: pyo object counts, audio thread CPU load and per-branch
+cost of the loaded module.
+
+"""
+import os
+import sys
+import time
+import json
+import weakref
+import tempfile
+import threading
+import subprocess
+import wx
+from .engine import *
+from .constants import LATENCY_PROFILE_SETTINGS, TIMING_BINS
+from .analysis import AnalysisBus
+from .benchmark import RESULT_PREFIX, WORKER_FLAG
+
+# CPU time of the calling thread (Python 3.7+). The process clock, which
+# also counts the GUI thread, is used on older versions.
+cpu_clock = getattr(time, "thread_time", time.process_time)
+wall_clock = getattr(time, "perf_counter", time.time)
+
+def moduleObjects(module):
+    """
+    Returns the pyo objects used by a module, in a WeakValueDictionary
+    keyed by their ids (pyo objects can't be hashed).
+
+    The objects are found from the module's attributes, through lists,
+    tuples and dicts, the helper objects of this package, the panels
+    the module holds (the InputPanel) and the attributes of the pyo
+    objects themselves (their inputs). Only the module's own graph is
+    visited, so this stays cheap whatever the size of the application.
+    The AnalysisBus is shared by the modules and isn't visited, the
+    analyses in use are reached through the module's consumers.
+
+    """
+    objects = weakref.WeakValueDictionary()
+    seen = set()
+    stack = [module]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, PyoObjectBase):
+            objects[id(value)] = value
+            stack.extend(vars(value).values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, AnalysisBus):
+            continue
+        elif isinstance(value, wx.Window):
+            if value is module or value.GetParent() is module:
+                stack.extend(vars(value).values())
+        elif type(value).__module__.startswith(__package__ + "."):
+            stack.extend(getattr(value, "__dict__", {}).values())
+    return objects
+
+def countStreams(objects):
+    """
+    Returns the number of audio streams used by the given pyo objects.
+
+    """
+    return sum([len(getattr(obj, "_base_objs", [])) for obj in objects])
+
+def branchObjects(obj):
+    """
+    Returns the pyo objects a branch is computed from: the object itself
+    and, recursively, the pyo objects among its attributes (its inputs).
+
+    """
+    objects = []
+    seen = set()
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, PyoObjectBase):
+            objects.append(value)
+            stack.extend(vars(value).values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+    return objects
+
+def moduleBranches(module):
+    """
+    Returns the (name, object) pairs of the pyo objects playing in a module.
+
+    Objects held by the module's own panels (the InputPanel) are included
+    with a prefixed name. An object referenced by several attributes is
+    listed only once.
+
+    """
+    branches = []
+    seen = set()
+    def collect(owner, prefix):
+        for name, value in sorted(vars(owner).items()):
+            if isinstance(value, wx.Window):
+                if prefix == "" and value.GetParent() is module:
+                    collect(value, name + ".")
+            elif isinstance(value, PyoObject) and id(value) not in seen:
+                seen.add(id(value))
+                if value.isPlaying():
+                    branches.append((prefix + name, value))
+    collect(module, "")
+    return branches
+
+class CpuMonitor:
+    """
+    Measures the CPU load of the audio thread and detects xruns.
+
+    The server calls `callback` at the beginning of every buffer, in the
+    audio thread. The CPU time consumed by this thread between two calls,
+    divided by the duration of a buffer, is the load of one period. Loads
+    are kept in a ring buffer and read from the GUI thread.
+
+    A buffer computed in more than its duration is an overrun. The wall
+    time elapsed between callbacks, minus the duration of the buffers, is
+    the lag of the stream: when it grows past `tolerance`, the device
+    missed audio (underrun). Short bursts of callbacks, when the host's
+    buffer is larger than the server's one, don't count.
+
+    The loads are also counted in a histogram (TIMING_BINS slices of the
+    budget, the last one for the late buffers) and every xrun is queued,
+    with its wall clock time, for `readEvents`.
+
+    """
+    def __init__(self, server, size=256):
+        self.server = server
+        self.loads = [0.0] * size
+        self.count = 0
+        self.readcount = 0
+        self.overruns = self.underruns = 0
+        self.readxruns = (0, 0)
+        self.events = []
+        self.clearTiming()
+        self.reset()
+
+    def clearTiming(self):
+        self.histogram = [0] * (len(TIMING_BINS) + 1)
+        self.worst = 0.0
+        self.worstms = 0.0
+
+    def setBufferDuration(self):
+        self.bufdur = self.server.getBufferSize() / float(self.server.getSamplingRate())
+        self.tolerance = max(2 * self.bufdur, 0.025)
+
+    def reset(self):
+        """
+        Restarts the measurements, after the server has been (re)booted.
+
+        """
+        self.last = self.lastwall = None
+        self.lag = 0.0
+        self.setBufferDuration()
+        self.server.setCallback(self.callback)
+
+    def callback(self):
+        now = cpu_clock()
+        wall = wall_clock()
+        if self.last is not None:
+            load = (now - self.last) / self.bufdur
+            self.loads[self.count % len(self.loads)] = load
+            self.count += 1
+            for i, limit in enumerate(TIMING_BINS):
+                if load < limit:
+                    break
+            else:
+                i = len(TIMING_BINS)
+            self.histogram[i] += 1
+            if load > self.worst:
+                self.worst = load
+                self.worstms = (now - self.last) * 1000
+            if load > 1:
+                self.overruns += 1
+                self.events.append((wall, "overrun", load))
+            # Slow decay to absorb the drift between the device's clock
+            # and the system's clock.
+            self.lag = max(0.0, self.lag * 0.999 + wall - self.lastwall - self.bufdur)
+            if self.lag > self.tolerance:
+                self.underruns += 1
+                self.events.append((wall, "underrun", self.lag))
+                self.lag = 0.0
+        self.last = now
+        self.lastwall = wall
+
+    def read(self):
+        """
+        Returns (mean, peak, blocks) for the buffers computed since the
+        last call. Loads are fractions of the real-time budget.
+
+        """
+        count = self.count
+        blocks = min(count - self.readcount, len(self.loads))
+        self.readcount = count
+        if blocks <= 0:
+            return 0.0, 0.0, 0
+        size = len(self.loads)
+        values = [self.loads[(count - i - 1) % size] for i in range(blocks)]
+        return sum(values) / blocks, max(values), blocks
+
+    def readXruns(self):
+        """
+        Returns (underruns, overruns) detected since the last call.
+
+        """
+        xruns = (self.underruns, self.overruns)
+        underruns, overruns = xruns[0] - self.readxruns[0], xruns[1] - self.readxruns[1]
+        self.readxruns = xruns
+        return underruns, overruns
+
+    def readEvents(self):
+        """
+        Returns the (time, kind, value) xruns detected since the last call.
+        `value` is the load for an overrun and the lag for an underrun.
+
+        """
+        events, self.events = self.events, []
+        return events
+
+class GuiWatchdog:
+    """
+    Detects the stalls of the GUI thread.
+
+    A timer is expected every `period` seconds; when it comes more than
+    `threshold` seconds late, the GUI thread was busy (and most likely
+    held the GIL, which also blocks the Python callbacks of the audio
+    thread). The last stalls are kept as (start, end) wall clock times.
+
+    """
+    def __init__(self, period=0.05, threshold=0.1, size=64):
+        self.period = period
+        self.threshold = threshold
+        self.size = size
+        self.stalls = []
+        self.last = wall_clock()
+        self.timer = wx.Timer()
+        self.timer.Bind(wx.EVT_TIMER, self.tick)
+        self.timer.Start(int(period * 1000))
+
+    def tick(self, evt):
+        now = wall_clock()
+        if now - self.last - self.period > self.threshold:
+            self.stalls.append((self.last, now))
+            if len(self.stalls) > self.size:
+                del self.stalls[0]
+        self.last = now
+
+    def stalled(self, when, margin=0.05):
+        if when - self.last - self.period > self.threshold:
+            # The GUI thread is still blocked.
+            return True
+        for start, end in self.stalls:
+            if start - margin <= when <= end + margin:
+                return True
+        return False
+
+    def stop(self):
+        self.timer.Stop()
+
+class LatencyTuner:
+    """
+    Steps the buffer size up or down according to the xruns detected by
+    a CpuMonitor, within the range of a latency profile.
+
+    `update` must be called regularly from the GUI thread. When the buffer
+    size should change, `callback(bufsize)` is called and the owner is
+    expected to reboot the server and call `rebooted`.
+
+    The buffer size is doubled when `maxruns` xruns happen in less than
+    `window` seconds. It is halved after `calm` seconds without xrun if
+    the peak load is below the profile's headroom. A buffer size that
+    produced xruns with a module is not tried again with this module:
+    the size reached by each module is remembered and proposed when the
+    module is loaded again.
+
+    A buffer size outside the profile is brought back within it, the
+    owner stops calling `update` when the user chooses a buffer size.
+
+    """
+    def __init__(self, monitor, profile, callback, window=5, maxruns=2, calm=20, settle=1):
+        self.monitor = monitor
+        self.callback = callback
+        self.window = window
+        self.maxruns = maxruns
+        self.calm = calm
+        self.settle = settle
+        self.module = None
+        self.floors = {}
+        self.setProfile(profile)
+
+    def setProfile(self, profile):
+        self.profile = profile
+        self.settings = LATENCY_PROFILE_SETTINGS[profile]
+        self.floors = {}
+        self.rebooted()
+
+    def rebooted(self):
+        now = time.time()
+        self.xruns = []
+        self.lastxrun = now
+        self.ignore = now + self.settle
+        self.monitor.readXruns()
+
+    def clip(self, bufsize):
+        return min(max(bufsize, self.settings["min"]), self.settings["max"])
+
+    def moduleBufferSize(self, name):
+        """
+        Returns the buffer size to use with a module.
+
+        """
+        self.module = name
+        return self.clip(self.floors.get(name, self.settings["start"]))
+
+    def update(self, bufsize, peak):
+        now = time.time()
+        xruns = sum(self.monitor.readXruns())
+        if now < self.ignore:
+            return
+        if bufsize != self.clip(bufsize):
+            self.callback(self.clip(bufsize))
+            return
+        if xruns:
+            self.xruns.append((now, xruns))
+            self.lastxrun = now
+        self.xruns = [x for x in self.xruns if now - x[0] < self.window]
+        if sum([x[1] for x in self.xruns]) >= self.maxruns:
+            if bufsize < self.settings["max"]:
+                self.floors[self.module] = bufsize * 2
+                self.callback(bufsize * 2)
+            else:
+                self.xruns = []
+        elif now - self.lastxrun > self.calm and peak < self.settings["headroom"]:
+            floor = max(self.settings["min"], self.floors.get(self.module, 0))
+            if bufsize // 2 >= floor:
+                self.callback(bufsize // 2)
+            else:
+                self.lastxrun = now
+
+class Instrumentation:
+    """
+    Collects the measurements shown in the status bar and exported as JSON.
+
+    `update` must be called regularly from the GUI thread.
+
+    """
+    def __init__(self, server, historysize=1200, logfile=None):
+        self.server = server
+        self.monitor = CpuMonitor(server)
+        self.watchdog = GuiWatchdog()
+        self.historysize = historysize
+        self.logfile = logfile
+        self.start = time.time()
+        self.history = []
+        self.modules = []
+        self.current = None
+        self.load = self.peak = 0.0
+        self.xruns = {"cpu": 0, "gui": 0, "device": 0}
+
+    def elapsed(self):
+        return round(time.time() - self.start, 2)
+
+    def moduleLoaded(self, name, objects, buildtime):
+        if self.current is not None:
+            self.current["timing"] = self.timing()
+        self.current = {"name": name,
+                        "loaded_at": self.elapsed(),
+                        "build_time": round(buildtime, 4),
+                        "objects": len(objects),
+                        "streams": countStreams(objects.values()),
+                        "cpu_mean": 0.0,
+                        "cpu_peak": 0.0,
+                        "branches": {},
+                        "xruns": {"cpu": 0, "gui": 0, "device": 0},
+                        "_live": objects,
+                        "_blocks": 0}
+        self.modules.append(self.current)
+        self.monitor.clearTiming()
+        self.xruns = self.current["xruns"]
+
+    def liveObjects(self):
+        if self.current is None:
+            return 0, 0
+        objects = list(self.current["_live"].values())
+        return len(objects), countStreams(objects)
+
+    def classify(self, events):
+        """
+        Attributes each xrun to the CPU (an overrun of the audio thread
+        around that time), the GUI (the GUI thread was stalled) or the
+        device (neither of them).
+
+        """
+        overruns = [e[0] for e in events if e[1] == "overrun"]
+        window = 2 * self.monitor.bufdur
+        classified = []
+        for when, kind, value in events:
+            if kind == "overrun":
+                cause = "cpu"
+            elif [t for t in overruns if abs(t - when) <= window + value]:
+                continue
+            elif self.watchdog.stalled(when):
+                cause = "gui"
+            else:
+                cause = "device"
+            classified.append((when, kind, value, cause))
+        return classified
+
+    def log(self, xruns):
+        if self.logfile is None:
+            return
+        try:
+            if not os.path.isdir(os.path.dirname(self.logfile)):
+                os.makedirs(os.path.dirname(self.logfile))
+            with open(self.logfile, "a") as f:
+                for when, kind, value, cause in xruns:
+                    f.write("%s\t%s\t%s\t%s\t%d\t%.3f\n" %
+                            (time.strftime("%Y-%m-%d %H:%M:%S"), cause, kind,
+                             self.current["name"] if self.current else "-",
+                             self.server.getBufferSize(), value))
+        except:
+            pass
+
+    def timing(self):
+        """
+        Returns the timing of the audio callback since the module was loaded.
+
+        """
+        monitor = self.monitor
+        return {"histogram": list(monitor.histogram),
+                "bins": TIMING_BINS,
+                "worst": round(monitor.worst, 4),
+                "worst_ms": round(monitor.worstms, 3),
+                "budget_ms": round(monitor.bufdur * 1000, 3),
+                "late": monitor.histogram[-1],
+                "xruns": dict(self.xruns)}
+
+    def update(self):
+        xruns = self.classify(self.monitor.readEvents())
+        for xrun in xruns:
+            self.xruns[xrun[3]] += 1
+        self.log(xruns)
+        self.load, peak, blocks = self.monitor.read()
+        if blocks == 0:
+            self.load = self.peak = 0.0
+            return
+        self.peak = peak
+        self.history.append((self.elapsed(), round(self.load, 4), round(peak, 4)))
+        if len(self.history) > self.historysize:
+            del self.history[0]
+        if self.current is not None:
+            total = self.current["_blocks"] + blocks
+            mean = self.current["cpu_mean"]
+            self.current["cpu_mean"] = mean + (self.load - mean) * blocks / total
+            self.current["cpu_peak"] = max(self.current["cpu_peak"], peak)
+            self.current["_blocks"] = total
+
+    def setBranchCosts(self, baseline, costs):
+        if self.current is not None:
+            self.current["branches"] = dict([(k, round(v, 4)) for k, v in costs.items()])
+            self.current["branches_baseline"] = round(baseline, 4)
+
+    def report(self):
+        modules = []
+        for module in self.modules:
+            entry = dict([(k, v) for k, v in module.items() if not k.startswith("_")])
+            if module is self.current:
+                entry["live_objects"], entry["live_streams"] = self.liveObjects()
+                entry["timing"] = self.timing()
+            for key in ["cpu_mean", "cpu_peak"]:
+                entry[key] = round(entry[key], 4)
+            modules.append(entry)
+        return {"sampling_rate": self.server.getSamplingRate(),
+                "buffer_size": self.server.getBufferSize(),
+                "elapsed": self.elapsed(),
+                "underruns": self.monitor.underruns,
+                "overruns": self.monitor.overruns,
+                "cpu_history": self.history,
+                "modules": modules}
+
+    def export(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+class BranchProfiler(threading.Thread):
+    """
+    Estimates the cost of each playing branch of a module.
+
+    The module is built again in a benchmark process (see benchmark.py),
+    with the state of the controls of the running one, and rendered with
+    pyo's offline server, so the live audio is never interrupted. The
+    real-time factor of the whole module is measured first, then each
+    branch is stopped in turn, with every object it is computed from, for
+    `duration` seconds of rendering: its cost is the difference.
+
+    `callback(baseline, costs)` is called in the GUI thread when every
+    branch has been measured, with `baseline` None if the measure failed.
+
+    """
+    def __init__(self, modindex, source, state, sr, bufsize, callback, duration=2):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.modindex = modindex
+        self.source = source
+        self.state = state
+        self.sr = sr
+        self.bufsize = bufsize
+        self.callback = callback
+        self.duration = duration
+        self.proc = None
+        self.cancelled = False
+
+    def run(self):
+        baseline, costs = None, {}
+        handle, statefile = tempfile.mkstemp(suffix=".json")
+        try:
+            with os.fdopen(handle, "w") as f:
+                json.dump(self.state, f)
+            args = ["--case", str(self.modindex), str(self.source), "--dur", str(self.duration),
+                    "--sr", str(int(self.sr)), "--bufsize", str(self.bufsize),
+                    "--state", statefile, "--branches"]
+            if getattr(sys, "frozen", False):
+                executable = os.environ.get("EXECUTABLEPATH", sys.executable)
+                cmd = [executable, WORKER_FLAG] + args
+            else:
+                cmd = [sys.executable, "-m", "Resources.benchmark"] + args
+            cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            env = dict(os.environ, DSP_DEMO_PRECISION=PRECISION)
+            self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                         universal_newlines=True, cwd=cwd, env=env)
+            out, err = self.proc.communicate()
+            for line in out.splitlines():
+                if line.startswith(RESULT_PREFIX):
+                    result = json.loads(line[len(RESULT_PREFIX):])
+                    baseline, costs = result.get("rtf"), result.get("branches", {})
+            if baseline is None and not self.cancelled:
+                lines = err.strip().splitlines()
+                print("Branch profiling failed: %s" % (lines[-1] if lines else self.proc.returncode))
+        except Exception as e:
+            print("Branch profiling failed: %s" % e)
+        finally:
+            os.remove(statefile)
+        if not self.cancelled:
+            wx.CallAfter(self.callback, baseline, costs)
+
+    def cancel(self):
+        """
+        Stops the measures without calling `callback`.
+
+        """
+        self.cancelled = True
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.kill()
@@ -1,15 +1,21 @@
+import os
 import sys
+import time
 import wx
 from wx.adv import AboutDialogInfo, AboutBox
-from pyo64 import *
-from .modules import *
+from .engine import *
+from .modules import MODULES
 from .constants import *
-from .utils import audio_config, dump_func
-from .widgets import DocFrame, Knob, ShowCapture
+from .utils import boot_server, revalidate_devices, NullAudioDriver, dump_func, audio_config, load_config, update_config, set_audio_config
+from .analysis import AnalysisBus, DisplaySpectrum, DisplayScope, MultiResSpectrum
+from .granular import clearEnvelopes
+from .instrument import Instrumentation, BranchProfiler, LatencyTuner, moduleObjects
+from .widgets import DocFrame, HeadTitle, Knob, ShowCapture, AudioSettingsDialog, TimingOverlay, \
+                     saveState, restoreState
 from .images import DSPDemo_Icon_Small
 
 class MainFrame(wx.Frame):
-    def __init__(self, parent, title, pos=(50, 50), size=(1000, 725)):
+    def __init__(self, parent, title, pos=(50, 50), size=(1000, 725), server=None):
         wx.Frame.__init__(self, parent, -1, title, pos, size)
 
         self.Bind(wx.EVT_CLOSE, self.onQuit)
@@ -19,7 +25,7 @@ class MainFrame(wx.Frame):
 
         self.createMenuBar()
 
-        self.createAudioServer()
+        self.createAudioServer(server)
 
         mainsizer = wx.BoxSizer(wx.HORIZONTAL)
         leftbox = wx.BoxSizer(wx.VERTICAL)
@@ -58,6 +64,13 @@ class MainFrame(wx.Frame):
         mainsizer.Add(rightbox, 1, wx.TOP|wx.BOTTOM|wx.RIGHT|wx.EXPAND, 2)
         self.panel.SetSizerAndFit(mainsizer)
 
+        self.statusbar = self.CreateStatusBar(2)
+        self.statusbar.SetStatusWidths([-1, -1])
+        self.profiler = None
+        self.statusTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.updateStatus, self.statusTimer)
+        self.statusTimer.Start(500)
+
         self.Show()
 
     def createMenuBar(self):
@@ -69,6 +82,25 @@ class MainFrame(wx.Frame):
             moduleMenu.Bind(wx.EVT_MENU, self.loadModule, id=MODULE_FIRST_ID+i)
         fileMenu.AppendSubMenu(moduleMenu, "Modules")
         fileMenu.AppendSeparator()
+        fileMenu.Append(AUDIO_SETTINGS_ID, "Réglages audio...")
+        fileMenu.Bind(wx.EVT_MENU, self.onAudioSettings, id=AUDIO_SETTINGS_ID)
+        latencyMenu = wx.Menu()
+        audio = load_config().get("audio", {})
+        for i, profile in enumerate(LATENCY_PROFILES):
+            latencyMenu.AppendRadioItem(LATENCY_FIRST_ID+i, LATENCY_PROFILE_SETTINGS[profile]["name"])
+            latencyMenu.Bind(wx.EVT_MENU, self.onLatencyProfile, id=LATENCY_FIRST_ID+i)
+            if profile == audio.get("profile", AUDIO_LATENCY_PROFILE):
+                latencyMenu.Check(LATENCY_FIRST_ID+i, True)
+        latencyMenu.AppendSeparator()
+        latencyMenu.AppendCheckItem(AUTO_LATENCY_ID, "Ajustement automatique du bloc")
+        latencyMenu.Check(AUTO_LATENCY_ID, audio.get("autotune", True))
+        latencyMenu.Bind(wx.EVT_MENU, self.onAutoLatency, id=AUTO_LATENCY_ID)
+        fileMenu.AppendSubMenu(latencyMenu, "Latence")
+        fileMenu.Append(PROFILE_BRANCHES_ID, "Mesurer le coût des branches du module")
+        fileMenu.Bind(wx.EVT_MENU, self.onProfileBranches, id=PROFILE_BRANCHES_ID)
+        fileMenu.Append(EXPORT_STATS_ID, "Exporter les mesures (JSON)...")
+        fileMenu.Bind(wx.EVT_MENU, self.onExportStats, id=EXPORT_STATS_ID)
+        fileMenu.AppendSeparator()
         fileMenu.Append(wx.ID_EXIT, "Quitter\tCtrl+Q")
         fileMenu.Bind(wx.EVT_MENU, self.onQuit, id=wx.ID_EXIT)
         helpMenu = wx.Menu()
@@ -84,51 +116,156 @@ class MainFrame(wx.Frame):
         self.menubar.Append(helpMenu, "Aide")
         self.SetMenuBar(self.menubar)
 
-    def createAudioServer(self):
-        # Setup audio server.
-        sr, outdev = audio_config()
-        self.server = Server(sr, AUDIO_NCHNLS, AUDIO_BUFSIZE, AUDIO_DUPLEX)
-        self.server.setOutputDevice(outdev)
-        self.server.boot()
-
+    def createAudioServer(self, server=None):
+        # Setup audio server (usually already booted during the splash screen).
+        if server is None:
+            server = boot_server()
+        self.server = server
+        settings, cached = audio_config()
+        self.driver = None
+        self.revalidation = None
+        if settings["host"] == "null":
+            self.driver = NullAudioDriver(self.server)
+            self.driver.start()
+        elif cached:
+            # The cached device list is checked once the frame is shown.
+            self.revalidation = settings
+            wx.CallAfter(self.revalidateDevices)
+
+        # CPU load and object counts.
+        self.instrument = Instrumentation(self.server, logfile=TIMING_LOG_FILE)
+
+        # Buffer size tuning from the xruns.
+        audio = load_config().get("audio", {})
+        self.latency = LatencyTuner(self.instrument.monitor,
+                                    audio.get("profile", AUDIO_LATENCY_PROFILE),
+                                    self.onLatencyChange)
+        self.autolatency = audio.get("autotune", True)
+
+        # Analyses reused by the spectral modules when their FFT settings change.
+        self.anabus = AnalysisBus()
+
+        self.createOutputGraph()
+
+    def createOutputGraph(self):
         # Audio vizualizers.
         self.fadein = Fader(1).play()
         self.outgain = SigTo(0.5, mul=self.fadein)
         self.outsig = Sig([0,0])
         self.outdisp = Sig([0]*3)
-        self.outspec = Spectrum(self.outdisp, function=dump_func)
+        self.outspec = DisplaySpectrum(self.outdisp, function=dump_func)
         self.outspec.function = None
-        self.outscope = Scope(self.outdisp, function=dump_func)
+        self.outmrspec = MultiResSpectrum(self.outdisp).stop()
+        self.outscope = DisplayScope(self.outdisp, function=dump_func)
         self.outscope.function = None
         if WITH_VIDEO_CAPTURE:
             self.voicerec = Input(0, mul=1).mix(2).out()
             self.fol = Follower(self.voicerec, freq=4)
             self.talk = self.fol > 0.02
-            self.amp = Port(self.talk, risetime=0.25, falltime=0.5)
-            self.ampscl = Scale(self.amp, outmin=1, outmax=0.3)
+            self.voiceamp = Port(self.talk, risetime=0.25, falltime=0.5)
+            self.ampscl = Scale(self.voiceamp, outmin=1, outmax=0.3)
         else:
             self.ampscl = Sig(1)
         self.mixoutsig = Mix(self.outsig, 2, self.outgain*self.ampscl).out()
 
+    def rebootServer(self, index=None, bufsize=None, sr=None, output=None):
+        """
+        Reboots the audio server with new settings.
+
+        Every pyo object is lost when the server is shut down, so the
+        output graph and the module (the current one, or MODULES[index])
+        are built again. The controls of the current module are replayed
+        on its new instance.
+
+        """
+        state = None
+        if index is None:
+            index = self.moduleIndex
+            state = saveState(self.module)
+        started = self.server.getIsStarted()
+        if self.rec.GetValue():
+            self.server.recstop()
+            self.rec.SetValue(False)
+        if hasattr(self.module, "onEnd"):
+            self.module.onEnd()
+        self.anabus.clear()
+        clearEnvelopes()
+        if started:
+            self.server.stop()
+            time.sleep(0.1)
+        if self.driver is not None:
+            self.driver.stop()
+        self.server.shutdown()
+        self.revalidateDevices()
+        if bufsize is not None:
+            self.server.setBufferSize(bufsize)
+        if sr is not None:
+            self.server.setSamplingRate(sr)
+        if output is not None:
+            self.server.setOutputDevice(output)
+        self.server.boot()
+        if self.driver is not None:
+            self.driver = NullAudioDriver(self.server)
+            self.driver.start()
+        self.instrument.monitor.reset()
+        self.server.setMeter(self.meter)
+
+        self.createOutputGraph()
+        self.outgain.value = pow(10, self.amp.getValue() * 0.05)
+        self.outscope.setLength(self.scopeLength.getValue() * 0.001)
+        self.scope.setAnalyzer(self.outscope)
+        self.setSpectrumAnalyzer()
+        self.specZoom(self.zoomH.GetValue())
+        self.replaceModule(index, state)
+        self.latency.rebooted()
+        if started:
+            self.server.start()
+
+    def createModule(self, cls):
+        start = time.time()
+        module = self.buildModule(cls)
+        buildtime = time.time() - start
+        self.instrument.moduleLoaded(cls.name, moduleObjects(module), buildtime)
+        return module
+
+    def buildModule(self, cls):
+        module = cls(self.panel)
+        module.SetBackgroundColour(USR_PANEL_BACK_COLOUR)
+        module.processing()
+        return module
+
     def loadInitModule(self):
-        self.module = InputOnlyModule(self.panel)
-        self.module.SetBackgroundColour(USR_PANEL_BACK_COLOUR)
-        self.module.processing()
-        wx.GetTopLevelParent(self).SetTitle("DSPDemo - " + InputOnlyModule.name)
+        self.moduleIndex = 0
+        self.latency.moduleBufferSize(MODULES[0].name)
+        self.module = self.createModule(MODULES[0])
+        wx.GetTopLevelParent(self).SetTitle("DSPDemo - " + MODULES[0].name)
         self.connectModuleToOutput()
 
     def loadModule(self, evt):
+        if self.profiler is not None:
+            return
+        index = evt.GetId() - MODULE_FIRST_ID
+        if self.autolatency:
+            bufsize = self.latency.moduleBufferSize(MODULES[index].name)
+            if bufsize != self.server.getBufferSize():
+                self.rebootServer(index, bufsize)
+                return
         if hasattr(self.module, "onEnd"):
             self.module.onEnd()
-        index = evt.GetId() - MODULE_FIRST_ID
+        # The released analyses would keep the old module's sources running.
+        self.anabus.clear()
+        self.replaceModule(index)
+
+    def replaceModule(self, index, state=None):
         oldmodule = self.module
-        self.module = MODULES[index](self.panel)
-        self.module.SetBackgroundColour(USR_PANEL_BACK_COLOUR)
-        self.module.processing()
+        self.moduleIndex = index
+        self.module = self.createModule(MODULES[index])
         self.leftboxmid.Replace(oldmodule, self.module)
         oldmodule.Destroy()
         self.leftboxmid.Layout()
         wx.GetTopLevelParent(self).SetTitle("DSPDemo - " + MODULES[index].name)
+        if state is not None:
+            restoreState(self.module, state)
         self.connectModuleToOutput()
 
     def connectModuleToOutput(self):
@@ -137,17 +274,133 @@ class MainFrame(wx.Frame):
         num = len(self.module.display)
         for i in range(num):
             self.outdisp[i].setValue(self.module.display[i])
+        self.spectrum.obj.setActiveChannels(num)
+        self.outscope.setActiveChannels(num)
         if hasattr(self.module, "onStart"):
             self.module.onStart()
         
     def onQuit(self, evt):
+        self.statusTimer.Stop()
+        if self.profiler is not None:
+            self.profiler.cancel()
+            self.profiler = None
+        self.instrument.watchdog.stop()
         if hasattr(self.module, "onEnd"):
             self.module.onEnd()
         if self.server.getIsStarted():
             self.server.stop()
             time.sleep(0.25)
+        if self.driver is not None:
+            self.driver.stop()
         self.Destroy()
 
+    def updateStatus(self, evt):
+        self.instrument.update()
+        if self.autolatency and self.profiler is None and self.server.getIsStarted():
+            self.latency.update(self.server.getBufferSize(), self.instrument.peak)
+        if hasattr(self.module, "onCpuLoad") and self.server.getIsStarted():
+            self.module.onCpuLoad(self.instrument.load)
+        objects, streams = self.instrument.liveObjects()
+        self.statusbar.SetStatusText("Objets pyo: %d (%d flux)" % (objects, streams), 0)
+        if self.profiler is not None:
+            text = "Mesure des branches en cours..."
+        elif self.server.getIsStarted():
+            text = "CPU audio: %.1f %% (max %.1f %%), bloc: %d" % (self.instrument.load * 100,
+                                                                   self.instrument.peak * 100,
+                                                                   self.server.getBufferSize())
+        else:
+            text = "CPU audio: -"
+        self.statusbar.SetStatusText(text, 1)
+        self.timing.setTiming(self.instrument.timing())
+
+    def onProfileBranches(self, evt):
+        if self.profiler is not None:
+            return
+        source = 0
+        if hasattr(self.module, "inputpanel"):
+            source = self.module.inputpanel.GetSelection()
+        # The module is measured offline, in another process.
+        self.profiler = BranchProfiler(self.moduleIndex, source, saveState(self.module),
+                                       self.server.getSamplingRate(), self.server.getBufferSize(),
+                                       self.onBranchesProfiled)
+        self.profiler.start()
+
+    def onBranchesProfiled(self, baseline, costs):
+        self.profiler = None
+        if baseline is None:
+            wx.MessageBox("La mesure des branches a échoué.", self.module.name,
+                          wx.OK | wx.ICON_ERROR, self)
+            return
+        self.instrument.setBranchCosts(baseline, costs)
+        lines = ["%s: %.2f %%" % (name, cost * 100) for name, cost in
+                 sorted(costs.items(), key=lambda x: x[1], reverse=True)]
+        wx.MessageBox("Charge totale: %.2f %%\n\n%s" % (baseline * 100, "\n".join(lines)),
+                      self.module.name, wx.OK, self)
+
+    def onExportStats(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Exporter les mesures",
+            defaultDir=os.getcwd(),
+            defaultFile="dspdemo-mesures.json",
+            wildcard="JSON (*.json)|*.json",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            self.instrument.export(dlg.GetPath())
+
+        dlg.Destroy()
+
+    def onAudioSettings(self, evt):
+        settings, cached = audio_config()
+        dlg = AudioSettingsDialog(self, settings, load_config().get("devices"))
+        if dlg.ShowModal() == wx.ID_OK:
+            new = dlg.GetSettings()
+            precision = new.pop("precision")
+            if new["bufsize"] != self.server.getBufferSize() and self.autolatency:
+                # A buffer size chosen by the user isn't changed by the
+                # automatic adjustment (it would be brought back within
+                # the latency profile).
+                self.autolatency = False
+                self.menubar.Check(AUTO_LATENCY_ID, False)
+                new["autotune"] = False
+            def update(config):
+                config["precision"] = precision
+                config.setdefault("audio", {}).update(new)
+            update_config(update)
+            if precision != PRECISION:
+                wx.MessageBox("La nouvelle précision sera utilisée au prochain lancement.",
+                              "Réglages audio", wx.OK, self)
+            if new["host"] != settings["host"]:
+                wx.MessageBox("Le nouvel hôte audio sera utilisé au prochain lancement.",
+                              "Réglages audio", wx.OK, self)
+            else:
+                output = new["output"]
+                if output == -1:
+                    output = load_config().get("devices", {}).get("default_output", settings["output"])
+                self.rebootServer(bufsize=new["bufsize"], sr=new["sr"], output=output)
+        dlg.Destroy()
+
+    def onLatencyProfile(self, evt):
+        profile = LATENCY_PROFILES[evt.GetId() - LATENCY_FIRST_ID]
+        self.latency.setProfile(profile)
+        set_audio_config(profile=profile)
+        bufsize = self.latency.moduleBufferSize(self.module.name)
+        if bufsize != self.server.getBufferSize():
+            self.onLatencyChange(bufsize)
+
+    def onAutoLatency(self, evt):
+        self.autolatency = evt.IsChecked()
+        set_audio_config(autotune=self.autolatency)
+        if self.autolatency:
+            self.latency.rebooted()
+
+    def onLatencyChange(self, bufsize):
+        if self.profiler is not None or self.rec.GetValue():
+            self.latency.rebooted()
+            return
+        self.rebootServer(bufsize=bufsize)
+        set_audio_config(bufsize=bufsize)
+
     def onModuleDoc(self, evt):
         doc_frame = DocFrame(self, self.module.__doc__)
 
@@ -207,9 +460,12 @@ class MainFrame(wx.Frame):
                                    orient=wx.HORIZONTAL)
         self.server.setMeter(self.meter)
 
+        self.timing = TimingOverlay(self.panel)
+
         sizer.Add(amplabel, 0, wx.LEFT|wx.TOP|wx.EXPAND, 5)
         sizer.Add(self.amp, 0, wx.LEFT|wx.RIGHT|wx.EXPAND, 5)
         sizer.Add(self.meter, 0, wx.LEFT|wx.RIGHT|wx.TOP|wx.EXPAND, 5)
+        sizer.Add(self.timing, 0, wx.LEFT|wx.RIGHT|wx.TOP|wx.EXPAND, 5)
         return sizer
 
     def createSpectrum(self):
@@ -230,6 +486,11 @@ class MainFrame(wx.Frame):
         self.specMag.Bind(wx.EVT_TOGGLEBUTTON, self.specMagScale)
         toolbox.Add(self.specMag, 1, wx.TOP|wx.LEFT, 4)
 
+        self.specMulti = wx.ToggleButton(self.panel, -1, label="Multi-Rés")
+        self.specMulti.SetValue(0)
+        self.specMulti.Bind(wx.EVT_TOGGLEBUTTON, self.specMultiRes)
+        toolbox.Add(self.specMulti, 1, wx.TOP|wx.LEFT, 4)
+
         self.specWin = wx.Choice(self.panel, -1, choices=WINCHOICES)
         self.specWin.SetSelection(2)
         self.specWin.Bind(wx.EVT_CHOICE, self.specWinType)
@@ -292,6 +553,18 @@ class MainFrame(wx.Frame):
             self.server.start()
         else:
             self.server.stop()
+            self.revalidateDevices()
+
+    def revalidateDevices(self):
+        # PortAudio is only queried while the server is stopped.
+        if self.revalidation is None or self.server.getIsStarted():
+            return
+        settings, self.revalidation = self.revalidation, None
+        name = revalidate_devices(settings)
+        if name is not None:
+            wx.MessageBox("Le périphérique audio '%s' n'est plus disponible.\n"
+                          "Le périphérique par défaut sera utilisé au prochain lancement." % name,
+                          "Réglages audio", wx.OK | wx.ICON_WARNING, self)
 
     def handleRec(self, evt):
         if evt.GetInt():
@@ -306,6 +579,25 @@ class MainFrame(wx.Frame):
     def specMagScale(self, evt):
         self.spectrum.setMscaling(evt.GetInt())
 
+    def specMultiRes(self, evt):
+        self.setSpectrumAnalyzer()
+
+    def setSpectrumAnalyzer(self):
+        if self.specMulti.GetValue():
+            self.outspec.stop()
+            analyzer = self.outmrspec.play()
+        else:
+            self.outmrspec.stop()
+            analyzer = self.outspec.play()
+        analyzer.setActiveChannels(len(self.module.display))
+        analyzer.setSize(1 << (self.specSize.GetSelection() + 6))
+        analyzer.setWinType(self.specWin.GetSelection())
+        analyzer.setGain(rescale(self.specAmp.value, ymin=0.0625, ymax=16, ylog=True))
+        w, h = self.spectrum.GetSize()
+        analyzer.setWidth(w)
+        analyzer.setHeight(h)
+        self.spectrum.setAnalyzer(analyzer)
+
     def specWinType(self, evt):
         self.spectrum.obj.wintype = evt.GetInt()
 
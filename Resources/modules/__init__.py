@@ -0,0 +1,77 @@
+"""
+Registry of the application's modules.
+
+The menu is built from the metadata below, without importing the modules'
+implementations. A module's code is imported the first time the module is
+selected (or its documentation requested). To add a module, write its
+class in one of the submodules and register it here.
+
+"""
+import importlib
+
+class ModuleEntry:
+    """
+    Metadata of a module.
+
+    name: the module's `name` attribute, used in the menu and window title.
+    path: "submodule:ClassName", where to find the implementation.
+
+    Calling the entry creates an instance of the module, like calling the
+    class itself.
+
+    """
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self._cls = None
+
+    def load(self):
+        if self._cls is None:
+            modname, clsname = self.path.split(":")
+            module = importlib.import_module("." + modname, __name__)
+            self._cls = getattr(module, clsname)
+        return self._cls
+
+    @property
+    def doc(self):
+        return self.load().__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+MODULES = [
+    ModuleEntry("00-Sources", "sources:InputOnlyModule"),
+    ModuleEntry("01-Échantillonnage - Fréquence d'échantillonnage", "sampling:ResamplingModule"),
+    ModuleEntry("01-Échantillonnage - Quantification", "sampling:QuantizeModule"),
+    ModuleEntry("02-Filtrage - Comparaison des filtres", "filters:FiltersModule"),
+    ModuleEntry("03-Délai - Délais fixes", "delays:FixedDelayModule"),
+    ModuleEntry("03-Délai - Délais variables", "delays:VariableDelayModule"),
+    ModuleEntry("03-Délai - Phasing", "delays:PhasingModule"),
+    ModuleEntry("03-Délai - Transposition", "delays:TransposeModule"),
+    ModuleEntry("03-Délai - Réverbération", "delays:ReverbModule"),
+    ModuleEntry("04-Spatialisation - Panoramisation", "spatial:PanningModule"),
+    ModuleEntry("04-Spatialisation - Spatialisation binaurale en 3D", "spatial:BinauralModule"),
+    ModuleEntry("04-Spatialisation - Scène multi-sources", "spatial:SceneModule"),
+    ModuleEntry("05-Dynamique - Valeur crête vs RMS", "dynamics:PeakRMSModule"),
+    ModuleEntry("05-Dynamique - Suivi d'amplitude", "dynamics:EnvFollowerModule"),
+    ModuleEntry("05-Dynamique - Porte de bruit", "dynamics:GateModule"),
+    ModuleEntry("05-Dynamique - Compresseur", "dynamics:CompressModule"),
+    ModuleEntry("05-Dynamique - Compresseur Multi-Bande", "dynamics:MBCompressModule"),
+    ModuleEntry("06-Domaine Spectral - Vocodeur", "spectral:VocoderModule"),
+    ModuleEntry("06-Domaine Spectral - Filtrage", "spectral:SpectralFilterModule"),
+    ModuleEntry("06-Domaine Spectral - Synthèse croisée", "spectral:CrossSynthModule"),
+    ModuleEntry("06-Domaine Spectral - Vitesse et Hauteur Indépendantes", "spectral:SpectralPlaybackModule"),
+    ModuleEntry("06-Domaine Spectral - Délai Spectral", "spectral:SpectralDelayModule"),
+    ModuleEntry("07-Granulation - Vitesse et Hauteur Indépendantes", "granulation:GranulationPlaybackModule"),
+    ModuleEntry("07-Granulation - Réorganisation temporelle", "granulation:GranulationReorganizeModule"),
+    ModuleEntry("07-Granulation - Paramètres indépendants par grain", "granulation:GranulationRandomModule"),
+    ModuleEntry("08-Synthèse Additive - Sommation de sinusoïdes", "additive:AddSynthFixModule"),
+    ModuleEntry("08-Synthèse Additive - Synthèse Additive", "additive:AddSynthVarModule"),
+    ModuleEntry("08-Oscillateurs - Modulation de largeur d'impulsion", "oscillators:PulseWidthModModule"),
+    ModuleEntry("08-Oscillateurs - Oscillateur synchronisé", "oscillators:OscSyncModule"),
+    ModuleEntry("09-Modulation - Modulation de l'amplitude", "modulation:AmpModModule"),
+    ModuleEntry("09-Modulation - Modulation de fréquence", "modulation:FreqModModule"),
+    ModuleEntry("09-Modulation - Auto-modulation", "modulation:AutoModModule"),
+    ModuleEntry("10-Distorsion - Fonctions de Chebychev", "distortion:ChebyFuncModule"),
+    ModuleEntry("10-Distorsion - Algorithmes de distorsion", "distortion:DistoFuncModule"),
+]
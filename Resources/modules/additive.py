@@ -0,0 +1,345 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle, LabelKnob
+from ..bandlimited import AdditiveSynthesis, TriTable
+
+class AddSynthFixModule(wx.Panel):
+    """
+    Module: 08-Synthèse Additive - Sommation de sinusoïdes
+    ------------------------------------------------------
+
+    Ce module permet de construire graduellement des formes d'onde
+    en dent de scie, carrée et triangulaire par sommation d'ondes
+    sinusoïdales.
+
+    Dent de scie:
+        Constituée de toutes les harmoniques. L'amplitude de chacune
+        des harmoniques est l'inverse de son rang, A(n) = 1 / n.
+    Onde carrée:
+        Constituée uniquement des harmoniques impaires. L'amplitude
+        de chacune des harmoniques est l'inverse de son rang, A(n) = 1 / n.
+    Onde triangulaire:
+        Constituée uniquement des harmoniques impaires. L'amplitude
+        de chacune des harmoniques est l'inverse de son rang au carrée,
+        A(n) = 1 / (n*n). Dans le cas de l'onde triangulaire, chaque
+        deuxième harmonique est inversée en phase.
+
+    Contrôles:
+        Forme d'onde:
+            Choix de la forme d'onde à construire. Les choix sont:
+            Dent de scie, Onde carrée et Onde triangulaire.
+        Fréquence fondamentale:
+            Fréquence, en Hertz, de l'oscillateur qui lit la forme d'onde.
+        Nombre d'harmoniques:
+            Détermine de combien de composantes est constituée la forme
+            d'onde. Plus le nombre est élevé, plus la forme est précise.
+    """
+    name = "08-Synthèse Additive - Sommation de sinusoïdes"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.which = 0
+        self.order = 10
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        typelabel = wx.StaticText(self, -1, "Forme d'onde")
+        choices = ["Dent de scie", "Onde carrée", "Onde triangulaire"]
+        type = wx.Choice(self, -1, choices=choices)
+        type.SetSelection(0)
+        type.Bind(wx.EVT_CHOICE, self.changeWaveType)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence fondamentale")
+        self.fr = PyoGuiControlSlider(self, 40, 4000, 172, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFreq)
+
+        labelhr = wx.StaticText(self, -1, "Nombre d'harmoniques")
+        self.hr = PyoGuiControlSlider(self, 1, 50, 10, integer=True)
+        self.hr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.hr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeHarms)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelhr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.hr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changeWaveType(self, evt):
+        self.which = evt.GetInt()
+        if self.which == 0:
+            self.output.table = self.sawtable
+        elif self.which == 1:
+            self.output.table = self.sqrtable
+        elif self.which == 2:
+            self.output.table = self.tritable
+        self.output.table.order = self.order
+        self.output.table.normalize()
+
+    def changeHarms(self, evt):
+        self.order = int(evt.value)
+        self.output.table.order = self.order
+        self.output.table.normalize()
+
+    def changeFreq(self, evt):
+        self.freq.value = evt.value
+
+    def processing(self):
+        self.freq = SigTo(172, 0.05)
+        self.sawtable = SawTable(10)
+        self.sqrtable = SquareTable(10)
+        self.tritable = TriTable(10)
+        self.output = Osc(self.sawtable, self.freq, mul=0.707)
+        self.display = self.output
+
+class AddSynthVarModule(wx.Panel):
+    """
+    Module: 08-Synthèse Additive - Synthèse Additive
+    ------------------------------------------------
+
+    Ce module permet d'expérimenter avec certains algorithmes de réduction
+    de données dans un contexte de synthèse additive à forme d'onde variable.
+    Ce module permet de générer un palette très large de timbres, explorez
+    différentes combinaisons de paramètres.
+
+    Contrôles:
+        Nombre de partiels:
+            Détermine le nombre d'oscillateurs composant le signal sonore.
+        Env. att - dec - sus - rel:
+            Enveloppe d'amplitude de type ADSR (Attack, Decay, Sustain, Release).
+            att: Durée, en millisecondes, de la phase ascendante de l'enveloppe.
+            dec: Durée, en millisecondes, de la phase d'atténuation suivant la
+                 phase d'attaque.
+            sus: Valeur d'amplitude de la tenue de l'enveloppe.
+            rel: Durée, en milliseconde, de la relâche, c'est-à-dire le retour
+                 à zéro de l'enveloppe.
+        Réduction amp:
+            Facteur de réduction d'une série de puissance permettant de
+            générer l'amplitude de tous les partiels avec une seule valeur.
+            L'amplitude de chacun des partiels est l'amplitude du partiel
+            précédent multipliée par ce facteur. A(n) = A(n-1) * facteur.
+        Réduction dur:
+            Facteur de réduction d'une série de puissance permettant de
+            contrôler la durée de l'enveloppe de tous les partiels avec
+            une seule valeur. La durée des segments de l'enveloppe de
+            chacun des partiels est la durée des segments de l'enveloppe
+            du partiel précédent multipliée par ce facteur.
+            att(n) = att(n-1) * facteur, dec(n) = dec(n-1) * facteur, etc.
+        Fondamentale:
+            Fréquence fondamentale du signal en Hertz. Pour des timbres
+            inharmoniques, on dirait plutôt que c'est la fréquence du premier
+            partiel.
+        Expansion:
+            Facteur de compression/expansion d'une série de puissance servant
+            à générer la fréquence de chacun des partiels. L'expression est
+            la suivante: f(n) = fond * n ^ facteur
+            La fréquence fondamentale est multipliée au rang harmonique, élevé
+            à une puisssance donnée par ce paramètre.
+            - Pour un facteur de 1 la série harmonique (multiples entiers) de
+            la fréquence fondamentale.
+            - Pour un facteur prés de 0 de légères déviations (chorus) de la
+            fréquence fondamentale.
+            - Pour un facteur > 1 une expansion exponentielle des fréquences
+            des harmoniques.
+        Amp. Var. amp - freq - type
+            Contrôle les balises des générateurs aléatoires associés à
+            l'amplitude des différents partiels. Chaque partiel possède son
+            générateur aléatoire indépendant.
+            amp: Profondeur des variations.
+            freq: Vitesse, en Hertz, des variations.
+            type: Type de générateur, 0 = random avec interpolation,
+                  1 = random avec tenue (sample-and-hold),
+                  2 = random uniforme (bruit blanc).
+        Freq Var. amp - freq - type
+            Contrôle les balises des générateurs aléatoires associés à la
+            fréquence des différents partiels. Chaque partiel possède son
+            générateur aléatoire indépendant.
+            amp: Profondeur des variations.
+            freq: Vitesse, en Hertz, des variations.
+            type: Type de générateur, 0 = random avec interpolation,
+                  1 = random avec tenue (sample-and-hold),
+                  2 = random uniforme (bruit blanc).
+        Forme d'onde:
+            Permet de changer la forme d'onde lue par chacun des partiels.
+            Une forme d'onde complexe permet de décupler rapidement, et
+            efficacement, la quantité de composantes dans le signal final.
+        Jouer:
+            Bouton permettant de jouer un son. Un premier clic déclenche la
+            première section de l'enveloppe (att - dec - sus) qui maintient
+            sa valeur de tenue. Un second clic active la phase de relâche
+            de l'enveloppe.
+
+    """
+    name = "08-Synthèse Additive - Synthèse Additive"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelpt = wx.StaticText(self, -1, "Nombre de partiels")
+        self.pt = PyoGuiControlSlider(self, 1, 60, 30, integer=True)
+        self.pt.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.pt.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.setPartials)
+
+        sizer.Add(labelpt, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.pt, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+        envel = wx.StaticText(self, -1, "Env. ")
+        self.att = LabelKnob(self, " att", mini=1, maxi=2000, init=10, log=True, outFunction=self.setAttack)
+        self.dec = LabelKnob(self, " dec", mini=1, maxi=2000, init=100, log=True, outFunction=self.setDecay)
+        self.sus = LabelKnob(self, " sus", mini=0, maxi=1, init=0.7, outFunction=self.setSustain)
+        self.rel = LabelKnob(self, " rel", mini=1, maxi=2000, init=500, log=True, outFunction=self.setRelease)
+        box1.AddMany([(envel, 0, wx.ALIGN_CENTER_VERTICAL), (self.att, 1), (self.dec, 1), (self.sus, 1), (self.rel, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 5)
+
+        box2 = wx.BoxSizer(wx.HORIZONTAL)
+        ampbox = wx.BoxSizer(wx.VERTICAL)
+        labadf = wx.StaticText(self, -1, "Réduction amp")
+        self.adf = PyoGuiControlSlider(self, 0.5, 1, 0.9, size=(120,16))
+        self.adf.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.adf.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.setAmpDamp)
+        ampbox.Add(labadf, 0, wx.LEFT|wx.TOP, 5)
+        ampbox.Add(self.adf, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box2.Add(ampbox, 1)
+        timbox = wx.BoxSizer(wx.VERTICAL)
+        labtim = wx.StaticText(self, -1, "Réduction dur")
+        self.tim = PyoGuiControlSlider(self, 0.5, 1, 0.9, size=(120,16))
+        self.tim.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.tim.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.setTimeDamp)
+        timbox.Add(labtim, 0, wx.LEFT|wx.TOP, 5)
+        timbox.Add(self.tim, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box2.Add(timbox, 1)
+
+        sizer.Add(box2, 0, wx.EXPAND)
+
+        box3 = wx.BoxSizer(wx.HORIZONTAL)
+        funbox = wx.BoxSizer(wx.VERTICAL)
+        labfun = wx.StaticText(self, -1, "Fondamentale")
+        self.fun = PyoGuiControlSlider(self, 40, 4000, 172, log=True, size=(120,16))
+        self.fun.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fun.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.setFreq)
+        funbox.Add(labfun, 0, wx.LEFT|wx.TOP, 5)
+        funbox.Add(self.fun, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box3.Add(funbox, 1)
+        spdbox = wx.BoxSizer(wx.VERTICAL)
+        labspd = wx.StaticText(self, -1, "Expansion")
+        self.spd = PyoGuiControlSlider(self, 0.001, 2, 1, log=True, size=(120,16))
+        self.spd.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.spd.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.setSpread)
+        spdbox.Add(labspd, 0, wx.LEFT|wx.TOP, 5)
+        spdbox.Add(self.spd, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box3.Add(spdbox, 1)
+
+        sizer.Add(box3, 0, wx.EXPAND)
+
+        box4 = wx.BoxSizer(wx.HORIZONTAL)
+        ampvar = wx.StaticText(self, -1, "Amp. Var.  ")
+        self.ard = LabelKnob(self, " amp", mini=0, maxi=1, init=0, outFunction=self.setAmpVarAmp)
+        self.ars = LabelKnob(self, " freq", mini=0.01, maxi=20, init=1, log=True, outFunction=self.setAmpVarFreq)
+        self.art = LabelKnob(self, " type", mini=0, maxi=2.66, init=0, integer=True, outFunction=self.setAmpVarType)
+        box4.AddMany([(ampvar, 0, wx.ALIGN_CENTER_VERTICAL), (self.ard, 1), (self.ars, 1), (self.art, 1)])
+
+        box5 = wx.BoxSizer(wx.HORIZONTAL)
+        freqvar = wx.StaticText(self, -1, "Freq Var.  ")
+        self.frd = LabelKnob(self, " amp", mini=0, maxi=0.5, init=0, outFunction=self.setFreqVarAmp)
+        self.frs = LabelKnob(self, " freq", mini=0.01, maxi=20, init=1, log=True, outFunction=self.setFreqVarFreq)
+        self.frt = LabelKnob(self, " type", mini=0, maxi=2.66, init=0, integer=True, outFunction=self.setFreqVarType)
+        box5.AddMany([(freqvar, 0, wx.ALIGN_CENTER_VERTICAL), (self.frd, 1), (self.frs, 1), (self.frt, 1)])
+
+        sizer.Add(box4, 0, wx.EXPAND | wx.ALL, 5)
+        sizer.Add(box5, 0, wx.EXPAND | wx.ALL, 5)
+
+        box6 = wx.BoxSizer(wx.HORIZONTAL)
+        wavbox = wx.BoxSizer(wx.VERTICAL)
+        wavelabel = wx.StaticText(self, -1, "Forme d'onde")
+        choices = ["Sinus", "Scie 5", "Scie 15",
+                   "Scie 30", "Scie 60",
+                   "Carrée 5", "Carrée 15",
+                   "Carrée 30", "Carrée 60",
+                   "Triangle 3", "Triangle 6",
+                   "Triangle 12", "Triangle 24"]
+        wave = wx.Choice(self, -1, choices=choices)
+        wave.SetSelection(0)
+        wave.Bind(wx.EVT_CHOICE, self.setWaveform)
+        wavbox.Add(wavelabel, 0, wx.LEFT|wx.TOP, 5)
+        wavbox.Add(wave, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box6.Add(wavbox)
+        playbox = wx.BoxSizer(wx.VERTICAL)
+        playbox.Add(wx.StaticText(self, -1, ""), 0, wx.LEFT|wx.TOP, 5)
+        gobutton = wx.ToggleButton(self, label="Jouer")
+        gobutton.Bind(wx.EVT_TOGGLEBUTTON, self.play)
+        playbox.Add(gobutton, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        box6.Add(playbox, 1)
+
+        sizer.Add(box6, 0, wx.EXPAND)
+
+        self.SetSizer(sizer)
+
+    def play(self, evt):
+        if evt.GetInt():
+            self.addsynth.play()
+        else:
+            self.addsynth.stop()
+
+    def setPartials(self, evt):
+        self.addsynth.setPartials(int(evt.value))
+
+    def setAttack(self, x):
+        self.addsynth.setAttack(x * 0.001)
+
+    def setDecay(self, x):
+        self.addsynth.setDecay(x * 0.001)
+
+    def setSustain(self, x):
+        self.addsynth.setSustain(x)
+
+    def setRelease(self, x):
+        self.addsynth.setRelease(x * 0.001)
+
+    def setAmpDamp(self, evt):
+        self.addsynth.setAmpDamp(evt.value)
+
+    def setTimeDamp(self, evt):
+        self.addsynth.setTimeDamp(evt.value)
+
+    def setAmpVarAmp(self, x):
+        self.addsynth.setAmpVarAmp(x)
+
+    def setAmpVarFreq(self, x):
+        self.addsynth.setAmpVarFreq(x)
+
+    def setAmpVarType(self, x):
+        self.addsynth.setAmpVarType(x)
+
+    def setFreqVarAmp(self, x):
+        self.addsynth.setFreqVarAmp(x)
+
+    def setFreqVarFreq(self, x):
+        self.addsynth.setFreqVarFreq(x)
+
+    def setFreqVarType(self, x):
+        self.addsynth.setFreqVarType(x)
+
+    def setWaveform(self, evt):
+        self.addsynth.setWaveform(evt.GetInt())
+
+    def setFreq(self, evt):
+        self.addsynth.setFreq(evt.value)
+
+    def setSpread(self, evt):
+        self.addsynth.setSpread(evt.value)
+
+    def processing(self):
+        self.addsynth = AdditiveSynthesis()
+        self.output = Sig(self.addsynth.output)
+        self.display = self.output
@@ -0,0 +1,480 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle, LabelKnob
+from ..dynamics import DynamicsEngine
+from .inputpanel import InputPanel
+
+class PeakRMSModule(wx.Panel):
+    """
+    Module: 05-Dynamique - Valeur crête vs RMS
+    ------------------------------------------
+
+    Ce module illustre la différence entre la valeur crête (peak)
+    et la valeur efficace (RMS).
+
+    L'oscilloscope affiche le signal en rouge ainsi que ses valeurs
+    crête et RMS en vert et bleu respectivement.
+
+    """
+    name = "05-Dynamique - Valeur crête vs RMS"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        label1 = wx.StaticText(self, -1, "Signal source en rouge.")
+        self.label2 = wx.StaticText(self, -1, "Valeur crête en vert. 0.000")
+        self.label3 = wx.StaticText(self, -1, "Valeur RMS en bleu. 0.000")
+
+        sizer.Add(label1, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.label2, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.label3, 0, wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def getPeakValues(self, *args):
+        wx.CallAfter(self.label2.SetLabel, "Valeur crête en vert. %.3f" % args[0])
+
+    def getRMSValues(self, *args):
+        wx.CallAfter(self.label3.SetLabel, "Valeur RMS en bleu. %.3f" % args[0])
+
+    def processing(self):
+        server = Sig(0).getServer()
+        dur = server.getBufferSize() / server.getSamplingRate()
+        self.peak = PeakAmp(self.inputpanel.output, self.getPeakValues)
+        self.rms = RMS(self.inputpanel.output, self.getRMSValues)
+        self.output = self.inputpanel.output
+        self.disp = [self.output, SigTo(self.peak, dur), SigTo(self.rms, dur)]
+        self.display = Mix(self.disp, voices=3)
+
+class EnvFollowerModule(wx.Panel):
+    """
+    Module: 05-Dynamique - Suivi d'amplitude
+    ----------------------------------------
+
+    Ce module illustre le suivi d'enveloppe d'amplitude. La source
+    est d'abord analysée puis son suivi d'amplitude est utilisé pour
+    contrôler l'amplitude d'un bruit rose en accompagnement.
+
+    Le suivi d'enveloppe est effectué à l'aide d'une rectification
+    positive de l'onde puis d'un filtrage passe-bas. La fréquence
+    du filtre passe-bas permet de contrôler la réactivité du suiveur.
+
+    Contrôles:
+        Fréq. du filtre passe-bas en Hz:
+            Contrôle la fréquence du filtre appliqué au signal rectifié.
+            Plus la fréquence est grave, plus le lissage est prononcé
+            et moins les petites variations d'amplitude seront perceptibles.
+
+    """
+    name = "05-Dynamique - Suivi d'amplitude"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelfr = wx.StaticText(self, -1, "Fréq. du filtre passe-bas en Hz")
+        self.fr = PyoGuiControlSlider(self, 0.1, 100, 10.0, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFreq)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changeFreq(self, evt):
+        self.freq.value = evt.value
+
+    def processing(self):
+        self.freq = SigTo(10, 0.05)
+        self.amp = Follower(self.inputpanel.output, self.freq)
+        self.new = PinkNoise(self.amp)
+        self.output = Mix([self.inputpanel.output, self.new], voices=2)
+        self.display = self.output
+
+class GateModule(wx.Panel):
+    """
+    Module: 05-Dynamique - Porte de bruit
+    -------------------------------------
+
+    Ce module permet d'expérimenter avec la porte de bruit.
+
+    Lorsque le suivi d'amplitude du signal passe sous le seuil spécifé,
+    l'amplitude descend à zéro à une vitesse donnée par le temps de
+    relâche. Lorsqu'il remonte au-dessus du seuil, l'amplitude retourne
+    à 1 à une vitesse donnée par le temps d'attaque.
+
+    Contrôles:
+        Seuil en dB:
+            Seuil, en décibels, au-dessous duquel l'amplitude du signal
+            est brsquement rammenée à 0.
+        Temps d'attaque en seconde:
+            Durée, en seconde, que prend l'amplitude pour retourner à
+            1 lorsque le suivi d'amplitude passe au-dessus du seuil.
+        Temps de relâche en seconde:
+            Durée, en seconde, que prend l'amplitude pour descendre à
+            0 lorsque le suivi d'amplitude passe en dessous du seuil.
+        Anticipation en milliseconde:
+            Le signal est retardé de cette durée alors que le suivi
+            d'amplitude lit le signal original: la porte s'ouvre avant
+            l'arrivée des attaques.
+
+    La réduction de gain courante est affichée sous les contrôles.
+
+    """
+    name = "05-Dynamique - Porte de bruit"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelth = wx.StaticText(self, -1, "Seuil en dB")
+        self.th = PyoGuiControlSlider(self, -70, 0, -50.0)
+        self.th.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.th.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeThresh)
+
+        labelri = wx.StaticText(self, -1, "Temps d'attaque en seconde")
+        self.ri = PyoGuiControlSlider(self, 0.0001, 0.25, 0.01, log=True)
+        self.ri.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ri.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRise)
+
+        labelfa = wx.StaticText(self, -1, "Temps de relâche en seconde")
+        self.fa = PyoGuiControlSlider(self, 0.0001, 0.25, 0.05, log=True)
+        self.fa.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fa.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFall)
+
+        sizer.Add(labelth, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.th, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelri, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ri, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfa, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fa, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labella = wx.StaticText(self, -1, "Anticipation en milliseconde")
+        self.la = PyoGuiControlSlider(self, 0, DYNAMICS_MAX_LOOKAHEAD * 1000, 0)
+        self.la.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.la.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeLookahead)
+
+        sizer.Add(labella, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.la, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grlabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grlabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.updateReduction, self.timer)
+
+    def changeThresh(self, evt):
+        self.engine.setThresh(evt.value)
+
+    def changeRise(self, evt):
+        self.engine.setRise(evt.value)
+
+    def changeFall(self, evt):
+        self.engine.setFall(evt.value)
+
+    def changeLookahead(self, evt):
+        self.engine.setLookahead(evt.value * 0.001)
+
+    def updateReduction(self, evt):
+        self.grlabel.SetLabel("Réduction de gain: %.1f dB" % self.engine.getReduction()[0])
+
+    def processing(self):
+        self.engine = DynamicsEngine(self.inputpanel.output, "gate", thresh=-50, rise=0.01,
+                                     fall=0.05)
+        self.output = self.engine.output
+        self.display = self.output
+        self.timer.Start(100)
+
+    def onEnd(self):
+        self.timer.Stop()
+
+class CompressModule(wx.Panel):
+    """
+    Module: 05-Dynamique - Compresseur
+    ----------------------------------
+
+    Ce module permet d'expérimenter avec le compresseur.
+
+    Lorsque le suivi d'amplitude du signal passe au-dessus du seuil spécifé,
+    le signal est compressé en fonction du ratio de compression. Lorsque le
+    suivi d'amplitude est sous le seuil, le signal passe sans modification.
+
+    Avec un seuil près de 0 dB et un ratio très élevé (entre 50 et 100), le
+    compresseur agit comme un limiteur.
+
+    Contrôles:
+        Seuil en dB:
+            Seuil, en décibels, au-dessus duquel le signal est compressé.
+        Ratio de compression:
+            Rapport entre le gain du signal en entré et en sortie du
+            compresseur. Un ratio de 2 signifie que pour 2 décibels
+            au-dessus du seuil en entrée, l'amplitude du signal en sortie
+            sera de seulement 1 décibel au-dessus du seuil.
+        Temps d'attaque en seconde:
+            Durée, en seconde, que prend le compresseur pour atteindre son
+            plein niveau de compression lorsque le suivi d'amplitude passe
+            au-dessus du seuil.
+        Temps de relâche en seconde:
+            Durée, en seconde, que prend le compresseur pour arrêter de
+            compresser lorsque le suivi d'amplitude passe au-dessous du
+            seuil.
+        Gain post-compresseur:
+            Gain, en décibels, appliqué au signal compressé.
+        Anticipation en milliseconde:
+            Le signal est retardé de cette durée alors que le suivi
+            d'amplitude lit le signal original: la compression débute
+            avant l'arrivée des attaques.
+
+    La réduction de gain courante est affichée sous les contrôles.
+
+    """
+    name = "05-Dynamique - Compresseur"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelth = wx.StaticText(self, -1, "Seuil en dB")
+        self.th = PyoGuiControlSlider(self, -70, 0, -50.0)
+        self.th.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.th.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeThresh)
+
+        labelrt = wx.StaticText(self, -1, "Ratio de compression")
+        self.rt = PyoGuiControlSlider(self, 1, 100, 4, log=True)
+        self.rt.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.rt.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRatio)
+
+        labelri = wx.StaticText(self, -1, "Temps d'attaque en seconde")
+        self.ri = PyoGuiControlSlider(self, 0.0001, 0.25, 0.01, log=True)
+        self.ri.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ri.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRise)
+
+        labelfa = wx.StaticText(self, -1, "Temps de relâche en seconde")
+        self.fa = PyoGuiControlSlider(self, 0.0001, 0.25, 0.05, log=True)
+        self.fa.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fa.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFall)
+
+        labelga = wx.StaticText(self, -1, "Gain post-compresseur")
+        self.ga = PyoGuiControlSlider(self, 0, 24, 0)
+        self.ga.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ga.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeGain)
+
+        sizer.Add(labelth, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.th, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelrt, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.rt, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelri, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ri, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfa, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fa, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelga, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ga, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labella = wx.StaticText(self, -1, "Anticipation en milliseconde")
+        self.la = PyoGuiControlSlider(self, 0, DYNAMICS_MAX_LOOKAHEAD * 1000, 0)
+        self.la.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.la.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeLookahead)
+
+        sizer.Add(labella, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.la, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grlabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grlabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.updateReduction, self.timer)
+
+    def changeThresh(self, evt):
+        self.engine.setThresh(evt.value)
+
+    def changeRatio(self, evt):
+        self.engine.setRatio(evt.value)
+
+    def changeRise(self, evt):
+        self.engine.setRise(evt.value)
+
+    def changeFall(self, evt):
+        self.engine.setFall(evt.value)
+
+    def changeGain(self, evt):
+        self.engine.setGain(evt.value)
+
+    def changeLookahead(self, evt):
+        self.engine.setLookahead(evt.value * 0.001)
+
+    def updateReduction(self, evt):
+        self.grlabel.SetLabel("Réduction de gain: %.1f dB" % self.engine.getReduction()[0])
+
+    def processing(self):
+        self.engine = DynamicsEngine(self.inputpanel.output, "compress", thresh=-50, ratio=4,
+                                     rise=0.01, fall=0.05, gain=0)
+        self.output = self.engine.output
+        self.display = self.output
+        self.timer.Start(100)
+
+    def onEnd(self):
+        self.timer.Stop()
+
+class MBCompressModule(wx.Panel):
+    """
+    Module: 05-Dynamique - Compresseur Multi-Bande
+    ----------------------------------------------
+
+    Ce module permet d'expérimenter avec la compression multi-bande.
+
+    Pour chacune des quatre bandes de fréquence, lorsque le suivi d'amplitude
+    du signal passe au-dessus du seuil spécifé, le signal est compressé en 
+    fonction du ratio de compression. Lorsque le suivi d'amplitude est sous 
+    le seuil, le signal passe sans modification.
+
+    La plage de fréquence des quatre bandes est:
+
+        basse: 0 - 150 Hz
+        mid-basse: 150 - 600 Hz
+        mid-haute: 600 - 3200 Hz
+        haute: 3200 Hz et plus
+
+    Avec un seuil près de 0 dB et un ratio très élevé (entre 50 et 100), un
+    compresseur agit comme un limiteur.
+
+    Le suivi d'amplitude et le calcul du gain des quatre bandes sont
+    effectués ensemble, par les mêmes objets.
+
+    Contrôles (pour chacune des bandes):
+        seuil:
+            Seuil, en décibels, au-dessus duquel le signal est compressé.
+        ratio:
+            Rapport entre le gain du signal en entré et en sortie du
+            compresseur. Un ratio de 2 signifie que pour 2 décibels
+            au-dessus du seuil en entrée, l'amplitude du signal en sortie
+            sera de seulement 1 décibel au-dessus du seuil.
+        rise:
+            Durée, en seconde, que prend le compresseur pour atteindre son
+            plein niveau de compression lorsque le suivi d'amplitude passe
+            au-dessus du seuil.
+        fall:
+            Durée, en seconde, que prend le compresseur pour arrêter de
+            compresser lorsque le suivi d'amplitude passe au-dessous du
+            seuil.
+        gain:
+            Gain, en décibels, appliqué à la bande compressée.
+
+    Contrôles (communs):
+        Anticipation en milliseconde:
+            Le signal est retardé de cette durée alors que le suivi
+            d'amplitude lit le signal original: la compression débute
+            avant l'arrivée des attaques.
+
+    La réduction de gain courante de chacune des bandes est affichée
+    sous les contrôles.
+
+    """
+    name = "05-Dynamique - Compresseur Multi-Bande"
+    bands = ["Basse (0 - 150 Hz)", "Mid-basse (150 - 600 Hz)",
+             "Mid-haute (600 - 3200 Hz)", "Haute (3200 Hz et plus)"]
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        for band, name in enumerate(self.bands):
+            label = wx.StaticText(self, -1, name)
+            box = wx.BoxSizer(wx.HORIZONTAL)
+            knobs = [LabelKnob(self, "seuil", mini=-40, maxi=0, init=-20,
+                               outFunction=lambda x, b=band: self.changeBand(b, "thresh", x)),
+                     LabelKnob(self, "ratio", mini=1, maxi=20, init=2,
+                               outFunction=lambda x, b=band: self.changeBand(b, "ratio", x)),
+                     LabelKnob(self, "rise", mini=0.001, maxi=0.2, init=0.01,
+                               outFunction=lambda x, b=band: self.changeBand(b, "rise", x)),
+                     LabelKnob(self, "fall", mini=0.005, maxi=0.5, init=0.1,
+                               outFunction=lambda x, b=band: self.changeBand(b, "fall", x)),
+                     LabelKnob(self, "gain", mini=-24, maxi=24, init=0,
+                               outFunction=lambda x, b=band: self.changeBand(b, "gain", x))]
+            box.AddMany([(knob, 1) for knob in knobs])
+
+            sizer.Add(label, 0, wx.LEFT|wx.TOP, 5)
+            sizer.Add(box, 0, wx.EXPAND | wx.ALL, 5)
+
+        labella = wx.StaticText(self, -1, "Anticipation en milliseconde")
+        self.la = PyoGuiControlSlider(self, 0, DYNAMICS_MAX_LOOKAHEAD * 1000, 0)
+        self.la.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.la.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeLookahead)
+
+        sizer.Add(labella, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.la, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grlabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grlabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.updateReduction, self.timer)
+
+    def changeBand(self, band, param, x):
+        self.engine.setBand(band, param, x)
+
+    def changeLookahead(self, evt):
+        self.engine.setLookahead(evt.value * 0.001)
+
+    def updateReduction(self, evt):
+        values = " / ".join(["%.1f" % x for x in self.engine.getReduction()])
+        self.grlabel.SetLabel("Réduction de gain (dB): %s" % values)
+
+    def processing(self):
+        self.split = FourBand(self.inputpanel.output, freq1=150, freq2=600, freq3=3200)
+        self.engine = DynamicsEngine(self.split, "compress", thresh=[-20] * 4, ratio=[2] * 4,
+                                     rise=[0.01] * 4, fall=[0.1] * 4, gain=[0] * 4)
+        self.output = self.engine.output.mix(1)
+        self.display = self.output
+        self.timer.Start(100)
+
+    def onEnd(self):
+        self.timer.Stop()
@@ -0,0 +1,138 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from .inputpanel import InputPanel
+
+class FiltersModule(wx.Panel):
+    """
+    Module: 01-Filtrage - Comparaison des filtres
+    ---------------------------------------------
+
+    Ce module permet de comparer l'effet des principaux filtres sur
+    le signal audio. En plus du choix du filtre, des contrôles sont
+    offerts pour la fréquence de coupure (ou centrale), le facteur
+    de qualité (Q du filtre), le gain des filtres d'égalisation et
+    l'ordre des filtres de base (passe-bas, passe-haut, passe-bande
+    et réjecteur de bande).
+
+    Contrôles:
+        Type de filtre:
+            Permet de sélectionner le type de filtre parmi le choix
+            suivant: passe-bas, passe-haut, passe-bande, réjecteur de
+            bande, crête/creux, dégradé passe-bas et dégradé passe-haut.
+        Fréquence de coupure/centrale:
+            Fréquence de coupure (ou centrale) du filtre en Hertz.
+        Facteur de qualité:
+            Facteur de qualité (Q) du filtre, définit comme étant
+            le rapport de la fréquence centrale sur la largeur de
+            bande (Q = f / bw).
+        Augmentation/réduction (dB):
+            Le contrôle de gain, en dB, pour les filtres d'égalisation
+            (crête/creux et dégradé).
+        Ordre du filtre:
+            L'ordre des filtres passe-bas, passe-haut, passe-bande et
+            réjecteur de bande. L'ordre correspond au plus grand nombre
+            d'échantillons passés utilisés par le filtre. Plus l'ordre
+            est grand, plus le filtre peut de produire des bandes de
+            transition abruptes.
+
+    """
+    name = "02-Filtrage - Comparaison des filtres"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.factor = 1
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        chooselabel = wx.StaticText(self, -1, "Type de filtre")
+        choices = ["Passe-bas", "Passe-haut", "Passe-bande",
+                   "Réjecteur de bande", "Crête/Creux (peak/notch)",
+                   "Dégradé passe-bas", "Dégradé passe-haut"]
+        self.choose = wx.Choice(self, -1, choices=choices)
+        self.choose.SetSelection(0)
+        self.choose.Bind(wx.EVT_CHOICE, self.changeFilter)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence de coupure/centrale")
+        self.fr = PyoGuiControlSlider(self, 50, 15000, 1000, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFreq)
+
+        labelq = wx.StaticText(self, -1, "Facteur de qualité")
+        self.q = PyoGuiControlSlider(self, 0.5, 10, 1, log=True)
+        self.q.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.q.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeQ)
+
+        labelbo = wx.StaticText(self, -1, "Augmentation/réduction (dB)")
+        self.bo = PyoGuiControlSlider(self, -48, 12, -6)
+        self.bo.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.bo.disable()
+        self.bo.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeBoost)
+
+        orderlabel = wx.StaticText(self, -1, "Ordre du filtre")
+        choices = ["2", "4", "6", "8"]
+        self.order = wx.Choice(self, -1, choices=choices)
+        self.order.SetSelection(0)
+        self.order.Bind(wx.EVT_CHOICE, self.changeOrder)
+
+        sizer.Add(chooselabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.choose, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelq, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.q, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelbo, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.bo, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(orderlabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.order, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changeFreq(self, evt):
+        self.filtfreq.value = evt.value
+
+    def changeQ(self, evt):
+        self.filt1Q.value = evt.value / self.factor
+        self.filt2Q.value = evt.value
+
+    def changeBoost(self, evt):
+        self.filter2.boost = evt.value
+
+    def changeOrder(self, evt):
+        stages = evt.GetInt() + 1
+        self.factor = rescale(stages, 1, 4, 1, 3)
+        self.filter1.stages = stages
+        self.filt1Q.value = self.q.getValue() / self.factor
+
+    def changeFilter(self, evt):
+        which = evt.GetInt()
+        if which <= 3:
+            self.filter1.type = which
+            self.output.interp = 0
+            self.bo.disable()
+            self.order.Enable(True)
+        else:
+            self.filter2.type = which - 4
+            self.output.interp = 1
+            self.bo.enable()
+            self.order.Enable(False)
+
+    def processing(self):
+        self.filtfreq = SigTo(1000, 0.05)
+        self.filt1Q = SigTo(1, 0.05)
+        self.filt2Q = SigTo(1, 0.05)
+        self.filter1 = Biquadx(self.inputpanel.output, freq=self.filtfreq,
+                               q=self.filt1Q, stages=1)
+        self.filter2 = EQ(self.inputpanel.output, freq=self.filtfreq,
+                          q=self.filt2Q, boost=-3.00)
+        self.output = Interp(self.filter1, self.filter2, 0)
+        self.display = self.output
@@ -0,0 +1,508 @@
+import os
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from ..granular import GrainEngine, RandomGrainEngine, ScrubIndex, ENVELOPES, ENVELOPE_NAMES, envelopeTable
+
+class GranulationPlaybackModule(wx.Panel):
+    """
+    Module: 07-Granulation - Vitesse et Hauteur Indépendantes
+    ---------------------------------------------------------
+
+    Ce module permet d'expérimenter avec les variations de lecture
+    du son par le procédé de granulation.
+
+    Le point de départ des grains dans un fichier son, qui est complètement
+    indépendant de la vitesse à laquelle le son est lu à l'intérieur du
+    grain, permet d'étirer ou de compresser la durée d'un son sans en 
+    affecter la hauteur. La vitesse à laquelle chacun des grains est lu
+    permet de contrôler la transposition (sans affecter la durée de lecture).
+
+    Contrôles:
+        Fichier sonore:
+            permet de sélectionner le fichier son à lire.
+        Démarrer la lecture:
+            Lance la lecture du son par le procédé de granulation.
+        Vitesse de lecture:
+            Contrôle la vitesse de lecture, c'est-à-dire la vitesse
+            à laquelle le pointeur de départ des grains se déplace
+            dans le fichier son.
+        Transposition:
+            Contrôle la transposition des grains à la lecture.
+        Densité (grains/s):
+            Nombre de grains générés par seconde. La densité est
+            réduite automatiquement lorsque la charge du processeur
+            dépasse le budget alloué à la granulation; les grains
+            abandonnés sont affichés sous les contrôles.
+        Enveloppe des grains:
+            Forme de l'enveloppe d'amplitude appliquée à chacun des
+            grains.
+
+    """
+    name = "07-Granulation - Vitesse et Hauteur Indépendantes"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        loadbutton = wx.Button(self, -1, "Fichier sonore")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        sizer.Add(loadbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        sizer.AddSpacer(10)
+
+        self.buttonplay = wx.ToggleButton(self, -1, "Démarrer la lecture")
+        self.buttonplay.Bind(wx.EVT_TOGGLEBUTTON, self.startPlayback)
+        sizer.Add(self.buttonplay, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelspeed = wx.StaticText(self, -1, "Vitesse de lecture")
+        self.speed = PyoGuiControlSlider(self, -2, 2, 0.5)
+        self.speed.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.speed.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSpeed)
+
+        sizer.Add(labelspeed, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.speed, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelpitch = wx.StaticText(self, -1, "Transposition")
+        self.pitch = PyoGuiControlSlider(self, 0.1, 2, 1)
+        self.pitch.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.pitch.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePitch)
+
+        sizer.Add(labelpitch, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.pitch, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labeldens = wx.StaticText(self, -1, "Densité (grains/s)")
+        self.dens = PyoGuiControlSlider(self, 10, 2000, 128, log=True)
+        self.dens.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.dens.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeDens)
+
+        sizer.Add(labeldens, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.dens, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelenv = wx.StaticText(self, -1, "Enveloppe des grains")
+        envChoice = wx.Choice(self, -1, choices=ENVELOPE_NAMES)
+        envChoice.SetSelection(0)
+        envChoice.Bind(wx.EVT_CHOICE, self.changeEnv)
+
+        sizer.Add(labelenv, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(envChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grainslabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grainslabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        sizer.AddSpacer(20)
+
+        message = wx.StaticText(self, -1, "Une vitesse de 0 produira")
+        sizer.Add(message, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+        message2 = wx.StaticText(self, -1, "un gel du son!")
+        sizer.Add(message2, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+
+    def getState(self):
+        return {"soundfile": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+
+    def startPlayback(self, evt):
+        if evt.GetInt():
+            self.basedur.value = self.soundtable.getDur()
+            self.index.mul = self.soundtable.getSize()
+            self.index.reset()
+            self.grains.play()
+        else:
+            self.grains.stop()
+
+    def changeSpeed(self, evt):
+        self.rate.value = evt.value
+
+    def changePitch(self, evt):
+        self.pit.value = evt.value
+
+    def changeDens(self, evt):
+        self.grains.setDens(evt.value)
+
+    def changeEnv(self, evt):
+        self.grains.setEnv(envelopeTable(ENVELOPES[evt.GetInt()]))
+
+    def onCpuLoad(self, load):
+        self.grains.update(load)
+        self.grainslabel.SetLabel("Grains: %d/s (abandonnés: %d/s, %d au total)" %
+                                  (self.grains.density, self.grains.droprate, self.grains.dropped))
+
+    def processing(self):
+        self.soundtable = SndTable(initchnls=2)
+
+        self.basedur = Sig(1)
+        self.rate = SigTo(0.5)
+        self.index = Phasor(1./self.basedur*self.rate, add=Noise(50))
+        self.pit = SigTo(1, mul=Noise(0.002, 1))
+
+        self.grains = GrainEngine(self.soundtable, envelopeTable("hann"), dens=128, pitch=self.pit,
+                                  pos=self.index, dur=0.2, dev=0.01, mul=0.2)
+        self.grains.stop()
+        self.output = self.grains.output
+        self.display = self.output
+
+class GranulationReorganizeModule(wx.Panel):
+    """
+    Module: 07-Granulation - Réorganisation temporelle
+    --------------------------------------------------
+
+    Ce module permet d'expérimenter avec les variations sur la position
+    de lecture du son par le procédé de granulation.
+
+    Ce module permet de contrôler deux techniques de réorganisation
+    temporelle du son par granulation.
+
+    1) En imposant des sauts au pointeur sur la position de départ 
+    des grains.
+
+    2) En ajoutant un déplacement aléatoire sur la position de départ 
+    des grains.
+
+    Contrôles:
+        Fichier sonore:
+            permet de sélectionner le fichier son à lire.
+        Démarrer la lecture:
+            Lance la lecture du son par le procédé de granulation.
+        Ambitus des sauts:
+            Contrôle sur la distance des sauts imposés au pointeur
+            de lecture.
+        Vitesse des sauts (Hz):
+            Vitesse de génération des sauts, en Hertz.
+        Ambitus variations aléatoires:
+            Contrôle sur l'écart maximum des variations aléatoires
+            imposés au pointeur de lecture.
+        Vitesse des variations (Hz):
+            Vitesse de génération des déplacements aléatoires, en Hertz.
+        Densité (grains/s):
+            Nombre de grains générés par seconde. La densité est
+            réduite automatiquement lorsque la charge du processeur
+            dépasse le budget alloué à la granulation; les grains
+            abandonnés sont affichés sous les contrôles.
+        Enveloppe des grains:
+            Forme de l'enveloppe d'amplitude appliquée à chacun des
+            grains.
+
+    """
+    name = "07-Granulation - Réorganisation temporelle"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        loadbutton = wx.Button(self, -1, "Fichier sonore")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        sizer.Add(loadbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        sizer.AddSpacer(10)
+
+        self.buttonplay = wx.ToggleButton(self, -1, "Démarrer la lecture")
+        self.buttonplay.Bind(wx.EVT_TOGGLEBUTTON, self.startPlayback)
+        sizer.Add(self.buttonplay, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labeljump = wx.StaticText(self, -1, "Ambitus des sauts")
+        self.jump = PyoGuiControlSlider(self, 0, 1, 0)
+        self.jump.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.jump.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeJump)
+
+        sizer.Add(labeljump, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.jump, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labeljumpspeed = wx.StaticText(self, -1, "Vitesse des sauts (Hz)")
+        self.jumpspeed = PyoGuiControlSlider(self, 1, 20, 8)
+        self.jumpspeed.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.jumpspeed.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeJumpSpeed)
+
+        sizer.Add(labeljumpspeed, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.jumpspeed, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelrand = wx.StaticText(self, -1, "Ambitus variations aléatoires")
+        self.rand = PyoGuiControlSlider(self, 0, 1, 0)
+        self.rand.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.rand.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRand)
+
+        sizer.Add(labelrand, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.rand, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelrandspeed = wx.StaticText(self, -1, "Vitesse des variations (Hz)")
+        self.randspeed = PyoGuiControlSlider(self, 1, 20, 8)
+        self.randspeed.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.randspeed.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRandSpeed)
+
+        sizer.Add(labelrandspeed, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.randspeed, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labeldens = wx.StaticText(self, -1, "Densité (grains/s)")
+        self.dens = PyoGuiControlSlider(self, 10, 2000, 128, log=True)
+        self.dens.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.dens.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeDens)
+
+        sizer.Add(labeldens, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.dens, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelenv = wx.StaticText(self, -1, "Enveloppe des grains")
+        envChoice = wx.Choice(self, -1, choices=ENVELOPE_NAMES)
+        envChoice.SetSelection(0)
+        envChoice.Bind(wx.EVT_CHOICE, self.changeEnv)
+
+        sizer.Add(labelenv, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(envChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grainslabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grainslabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+
+    def getState(self):
+        return {"soundfile": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+
+    def startPlayback(self, evt):
+        if evt.GetInt():
+            self.index.setSound(self.soundtable.getDur(), self.soundtable.getSize(False))
+            self.index.playAfter(self.grains)
+        else:
+            self.grains.stop()
+
+    def changeJump(self, evt):
+        self.index.setJump(evt.value)
+
+    def changeJumpSpeed(self, evt):
+        self.index.setJumpFreq(evt.value)
+
+    def changeRand(self, evt):
+        self.index.setRand(evt.value)
+
+    def changeRandSpeed(self, evt):
+        self.index.setRandFreq(evt.value)
+
+    def changeDens(self, evt):
+        self.grains.setDens(evt.value)
+
+    def changeEnv(self, evt):
+        self.grains.setEnv(envelopeTable(ENVELOPES[evt.GetInt()]))
+
+    def onCpuLoad(self, load):
+        self.grains.update(load)
+        self.grainslabel.SetLabel("Grains: %d/s (abandonnés: %d/s, %d au total)" %
+                                  (self.grains.density, self.grains.droprate, self.grains.dropped))
+
+    def processing(self):
+        self.soundtable = SndTable(initchnls=2)
+
+        self.index = ScrubIndex()
+
+        self.grains = GrainEngine(self.soundtable, envelopeTable("hann"), dens=128, pitch=Noise(0.002, 1),
+                                  pos=self.index.output, dur=0.2, dev=0.01, mul=0.2)
+        self.grains.stop()
+        self.output = self.grains.output
+        self.display = self.output
+
+class GranulationRandomModule(wx.Panel):
+    """
+    Module: 07-Granulation - Paramètres indépendants par grain
+    ----------------------------------------------------------
+
+    Ce module permet d'expérimenter avec les variations de paramètres
+    indépendantes pour chacun des grains.
+
+    Au démarrage de chaque grain, une valeur aléatoire est tirée pour
+    sa transposition, sa position dans le son, sa durée, sa position
+    dans l'espace stéréo et sa forme d'enveloppe. Chaque grain possède
+    ainsi ses propres paramètres, ce qui produit un nuage sonore dont
+    la texture dépend de l'ampleur des variations.
+
+    Contrôles:
+        Fichier sonore:
+            permet de sélectionner le fichier son à lire.
+        Démarrer la lecture:
+            Lance la lecture du son par le procédé de granulation.
+        Vitesse de lecture:
+            Contrôle la vitesse à laquelle le pointeur de départ des
+            grains se déplace dans le fichier son.
+        Densité (grains/s):
+            Nombre de grains générés par seconde. La densité est
+            réduite automatiquement lorsque la charge du processeur
+            dépasse le budget alloué à la granulation.
+        Durée des grains (s):
+            Durée moyenne des grains, en secondes.
+        Variation de la transposition:
+            Écart maximum de la transposition de chaque grain.
+        Variation de la position:
+            Écart maximum de la position de départ de chaque grain,
+            en proportion de la durée du son.
+        Variation de la durée:
+            Écart maximum de la durée de chaque grain.
+        Variation de la panoramisation:
+            Étendue de la position des grains dans l'espace stéréo.
+
+    """
+    name = "07-Granulation - Paramètres indépendants par grain"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        loadbutton = wx.Button(self, -1, "Fichier sonore")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        sizer.Add(loadbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        sizer.AddSpacer(10)
+
+        self.buttonplay = wx.ToggleButton(self, -1, "Démarrer la lecture")
+        self.buttonplay.Bind(wx.EVT_TOGGLEBUTTON, self.startPlayback)
+        sizer.Add(self.buttonplay, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        controls = [("Vitesse de lecture", -2, 2, 0.1, False, self.changeSpeed),
+                    ("Densité (grains/s)", 10, 2000, 500, True, self.changeDens),
+                    ("Durée des grains (s)", 0.01, 0.5, 0.1, True, self.changeDur),
+                    ("Variation de la transposition", 0, 1, 0, False, self.changePitchDev),
+                    ("Variation de la position", 0, 1, 0, False, self.changePosDev),
+                    ("Variation de la durée", 0, 1, 0, False, self.changeDurDev),
+                    ("Variation de la panoramisation", 0, 1, 0, False, self.changePanDev)]
+        for label, mini, maxi, init, log, function in controls:
+            text = wx.StaticText(self, -1, label)
+            slider = PyoGuiControlSlider(self, mini, maxi, init, log=log)
+            slider.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+            slider.Bind(EVT_PYO_GUI_CONTROL_SLIDER, function)
+            sizer.Add(text, 0, wx.LEFT|wx.TOP, 5)
+            sizer.Add(slider, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.grainslabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.grainslabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier son",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+        self.grains.setTableSize()
+        self.basedur.value = self.soundtable.getDur()
+
+    def getState(self):
+        return {"soundfile": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+
+    def startPlayback(self, evt):
+        if evt.GetInt():
+            self.index.reset()
+            self.grains.play()
+        else:
+            self.grains.stop()
+
+    def changeSpeed(self, evt):
+        self.rate.value = evt.value
+
+    def changeDens(self, evt):
+        self.grains.setDens(evt.value)
+
+    def changeDur(self, evt):
+        self.grains.setDur(evt.value)
+
+    def changePitchDev(self, evt):
+        self.grains.setPitchDev(evt.value)
+
+    def changePosDev(self, evt):
+        self.grains.setPosDev(evt.value)
+
+    def changeDurDev(self, evt):
+        self.grains.setDurDev(evt.value)
+
+    def changePanDev(self, evt):
+        self.grains.setPanDev(evt.value)
+
+    def onCpuLoad(self, load):
+        self.grains.update(load)
+        self.grainslabel.SetLabel("Grains: %d/s (abandonnés: %d/s, %d au total)" %
+                                  (self.grains.density, self.grains.droprate, self.grains.dropped))
+
+    def processing(self):
+        self.soundtable = SndTable(initchnls=2)
+
+        self.basedur = Sig(1)
+        self.rate = SigTo(0.1)
+        self.index = Phasor(1./self.basedur*self.rate)
+
+        self.grains = RandomGrainEngine(self.soundtable, dens=500, pos=self.index, dur=0.1, mul=0.1)
+        self.grains.stop()
+        self.output = self.grains.output
+        self.display = self.output
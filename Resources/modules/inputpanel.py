@@ -0,0 +1,257 @@
+import os
+import wx
+from ..engine import *
+from ..constants import *
+from ..bandlimited import DSPDemoBLOsc
+
+class InputPanel(wx.Choicebook):
+    sources = ["Oscillateur multiforme", "Oscillateur anti-alias",
+               "Fichier sonore", "Générateur de bruit"]
+    def __init__(self, parent):
+        wx.Choicebook.__init__(self, parent, -1, size=(300, -1))
+        self.SetBackgroundColour(USR_PANEL_BACK_COLOUR)
+
+        # Pulse-Width-Modulation
+        creators = [self.createLFOPanel, self.createOscillatorPanel,
+                    self.createSoundfilePanel, self.createNoisePanel]
+        for name, creator in zip(self.sources, creators):
+            panel = creator()
+            self.AddPage(panel, name)
+        self.Bind(wx.EVT_CHOICEBOOK_PAGE_CHANGED, self.OnPageChanged)
+
+        ### Audio processing ###
+        # Multi-waveforms oscillator
+        self.lfofreq = SigTo(172, 0.05)
+        self.lfooscil = LFO(freq=self.lfofreq, sharp=0.0, type=7)
+
+        # Band-limited oscillator
+        self.oscfreq = SigTo(172, 0.05)
+        self.oscbright = SigTo(0.5, 0.05)
+        self.oscshape = SigTo(0.25, 0.05)
+        self.oscillator = DSPDemoBLOsc(freq=self.oscfreq, bright=self.oscbright,
+                                       shape=self.oscshape)
+
+        # Soundfile player
+        self.soundtable = SndTable(initchnls=2)
+        self.soundfile = TableRead(self.soundtable, freq=1, loop=0, interp=4)
+        self.soundcall = TrigFunc(self.soundfile["trig"][0], self.onSoundfileEnd)
+        self.soundfilemono = self.soundfile.mix()
+
+        # Noise generator
+        self.whitenoise = Noise()
+        self.pinknoise = PinkNoise()
+        self.brownnoise = BrownNoise()
+        self.noisegenerator = InputFader(self.whitenoise)
+
+        # Audio output
+        self.output = InputFader(self.lfooscil)
+
+    def OnPageChanged(self, evt):
+        self.setSource(evt.GetSelection())
+
+    def setSource(self, sel, fadetime=0.1):
+        if self.GetSelection() != sel:
+            self.ChangeSelection(sel)
+        obj = [self.lfooscil, self.oscillator, self.soundfilemono,
+               self.noisegenerator][sel]
+        self.output.setInput(obj, fadetime)
+
+    def createLFOPanel(self):
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        choices = ["Sinusoïde", "Rampe", "Dent de scie", "Carrée",
+                   "Triangle", "Impulsion unipolaire", "Impulsion bipolaire"]
+        wtyp = wx.Choice(panel, -1, choices=choices)
+        wtyp.SetSelection(0)
+        wtyp.Bind(wx.EVT_CHOICE, self.onLFOWaveType)
+        sizer.Add(wtyp, 0, wx.ALL|wx.EXPAND, 5)
+
+        pitbox = wx.BoxSizer(wx.VERTICAL)
+        labelpit = wx.StaticText(panel, -1, "Fréquence")
+        self.opit = PyoGuiControlSlider(panel, 20, 4000, 172, log=True)
+        self.opit.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.opit.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.onLFOFreq)
+        sizer.Add(labelpit, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.opit, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        panel.SetSizerAndFit(sizer)
+        return panel
+
+    def onLFOWaveType(self, evt):
+        realtype = [7, 0, 1, 2, 3, 4, 5][evt.GetInt()]
+        self.lfooscil.type = realtype
+        if realtype == 7:
+            self.lfooscil.sharp = 0
+        else:
+            self.lfooscil.sharp = 1
+
+    def onLFOFreq(self, evt):
+        self.lfofreq.value = evt.value
+
+    def createOscillatorPanel(self):
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        pitbox = wx.BoxSizer(wx.VERTICAL)
+        labelpit = wx.StaticText(panel, -1, "Fréquence")
+        self.opit = PyoGuiControlSlider(panel, 20, 4000, 172, log=True)
+        self.opit.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.opit.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.onOscillatorFreq)
+        sizer.Add(labelpit, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.opit, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        row2 = wx.BoxSizer(wx.HORIZONTAL)
+
+        shpbox = wx.BoxSizer(wx.VERTICAL)
+        labelshp = wx.StaticText(panel, -1, "Forme d'onde")
+        self.oshp = PyoGuiControlSlider(panel, 0, 1, 0.25, size=(120, 16))
+        self.oshp.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.oshp.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.onOscillatorShape)
+        shpbox.Add(labelshp, 0, wx.LEFT|wx.TOP, 5)
+        shpbox.Add(self.oshp, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        brtbox = wx.BoxSizer(wx.VERTICAL)
+        labelbrt = wx.StaticText(panel, -1, "Brillance")
+        self.obrt = PyoGuiControlSlider(panel, 0, 1, 0.5, size=(120, 16))
+        self.obrt.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.obrt.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.onOscillatorBright)
+        brtbox.Add(labelbrt, 0, wx.LEFT|wx.TOP, 5)
+        brtbox.Add(self.obrt, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        row2.Add(shpbox, 1)
+        row2.Add(brtbox, 1)
+
+        sizer.Add(row2, 0, wx.EXPAND)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        panel.SetSizerAndFit(sizer)
+        return panel
+
+    def onOscillatorFreq(self, evt):
+        self.oscfreq.value = evt.value
+
+    def onOscillatorBright(self, evt):
+        self.oscbright.value = evt.value
+
+    def onOscillatorShape(self, evt):
+        self.oscshape.value = evt.value
+
+    def createSoundfilePanel(self):
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        row1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        loadbutton = wx.Button(panel, -1, "Choisir")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        row1.Add(loadbutton, 1, wx.ALL|wx.EXPAND, 5)
+
+        self.playbutton = wx.ToggleButton(panel, -1, "Jouer")
+        self.playbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onPlaySoundfile)
+        row1.Add(self.playbutton, 1, wx.ALL|wx.EXPAND, 5)
+
+        loopbutton = wx.ToggleButton(panel, -1, "Loop")
+        loopbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onLoopSoundfile)
+        row1.Add(loopbutton, 1, wx.ALL|wx.EXPAND, 5)
+        sizer.Add(row1, 0, wx.EXPAND)
+
+        labelpit = wx.StaticText(panel, -1, "Vitesse de lecture")
+        self.spit = PyoGuiControlSlider(panel, 0.25, 4, 1, log=True)
+        self.spit.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.spit.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.onSoundfileSpeed)
+        sizer.Add(labelpit, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.spit, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        panel.SetSizerAndFit(sizer)
+        return panel
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir un fichier son",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+        self.soundfile.freq = self.soundtable.getRate()
+
+    def getState(self):
+        return {"source": self.GetSelection(), "soundfile": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+        self.setSource(state["source"])
+
+    def onPlaySoundfile(self, evt):
+        if evt.GetInt():
+            self.soundfile.play()
+        else:
+            self.soundfile.stop()
+
+    def onSoundfileEnd(self):
+        if not self.soundfile.loop:
+            self.playbutton.SetValue(False)
+
+    def onLoopSoundfile(self, evt):
+        self.soundfile.loop = evt.GetInt()
+
+    def onSoundfileSpeed(self, evt):
+        self.soundfile.freq = self.soundtable.getRate() * evt.value
+
+    def createNoisePanel(self):
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+
+        choices = ["Bruit blanc", "Bruit rose", "Bruit brun"]
+        ntyp = wx.RadioBox(panel, -1, "", wx.DefaultPosition, wx.DefaultSize,
+                           choices, 3, wx.RA_SPECIFY_ROWS | wx.NO_BORDER)
+        ntyp.Bind(wx.EVT_RADIOBOX, self.onNoiseType)
+        sizer.Add(ntyp, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        sizer.AddSpacer(5)
+        sizer.Add(wx.StaticLine(panel, size=(300, 2)))
+        sizer.AddSpacer(5)
+
+        panel.SetSizerAndFit(sizer)
+        return panel
+
+    def onNoiseType(self, evt):
+        sel = evt.GetInt()
+        obj = [self.whitenoise, self.pinknoise, self.brownnoise][sel]
+        self.noisegenerator.setInput(obj, 0.1)
@@ -0,0 +1,311 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from ..bandlimited import TriTable
+
+class AmpModModule(wx.Panel):
+    """
+    Module: 09-Modulation - Modulation de l'amplitude
+    -------------------------------------------------
+
+    Ce module permet de comparer la modulation en anneaux et la modulation
+    d'amplitude.
+
+    La différence, au niveau de l'implantation, entre ces des deux types
+    de modulation se situe au niveau de l'oscillateur modulant. Pour la
+    modulation en anneaux, il est bipolaire (oscille entre -1 et 1),
+    tandis que pour la modulation d'amplitude, il est unipolaire (oscille
+    entre 0 et 1).
+
+    Le spectre d'une modulation en anneaux consiste en la somme et la
+    différence entre chaque composante du signal porteur et chaque
+    composante du signal modulant.
+
+    Le spectre d'une modulation d'amplitude présente les même composantes
+    que la modulation en anneaux, en plus du signal porteur inchangé.
+
+    Contrôles:
+        Type de modulation:
+            Permet de sélectionner le type de modulation désiré.
+        Fréquence porteuse:
+            Fréquence, en Hertz, de l'oscillateur porteur. Cet oscillateur
+            est toujours bipolaire.
+        Fréquence modulante:
+            Fréquence, en Hertz, de l'oscillateur modulant.
+        Forme d'onde de la porteuse:
+            Permet de changer la forme d'onde lue par l'oscillateur porteur.
+            Une forme d'onde complexe enrichira d'autant plus le spectre du
+            signal final.
+        Forme d'onde de la modulante:
+            Permet de changer la forme d'onde lue par l'oscillateur modulant.
+            Une forme d'onde complexe enrichira d'autant plus le spectre du
+            signal final.
+
+    """
+    name = "09-Modulation - Modulation de l'amplitude"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        typelabel = wx.StaticText(self, -1, "Type de modulation")
+        choices = ["Modulation en anneaux", "Modulation d'amplitude"]
+        type = wx.Choice(self, -1, choices=choices)
+        type.SetSelection(0)
+        type.Bind(wx.EVT_CHOICE, self.setType)
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence porteuse")
+        self.fr = PyoGuiControlSlider(self, 40, 2000, 344, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePortFreq)
+
+        labelfr2 = wx.StaticText(self, -1, "Fréquence modulante")
+        self.fr2 = PyoGuiControlSlider(self, 1, 2000, 172, log=True)
+        self.fr2.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr2.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeModFreq)
+
+        choices = ["Sinus", "Scie 2", "Scie 5",
+                   "Scie 10", "Scie 20",
+                   "Carrée 2", "Carrée 5",
+                   "Carrée 10", "Carrée 20",
+                   "Triangle 2", "Triangle 5",
+                   "Triangle 10", "Triangle 20"]
+
+        wavelabel = wx.StaticText(self, -1, "Forme d'onde de la porteuse")
+        wave = wx.Choice(self, -1, choices=choices)
+        wave.SetSelection(0)
+        wave.Bind(wx.EVT_CHOICE, self.setWaveform)
+
+        wave2label = wx.StaticText(self, -1, "Forme d'onde de la modulante")
+        wave2 = wx.Choice(self, -1, choices=choices)
+        wave2.SetSelection(0)
+        wave2.Bind(wx.EVT_CHOICE, self.setWaveform2)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfr2, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr2, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(wavelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(wave, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(wave2label, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(wave2, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def setType(self, evt):
+        self.scaling.value = evt.GetInt() * 0.5
+
+    def changePortFreq(self, evt):
+        self.freq.value = evt.value
+
+    def changeModFreq(self, evt):
+        self.freq2.value = evt.value
+
+    def setWaveform(self, evt):
+        self.port.table = self.tables[evt.GetInt()]
+
+    def setWaveform2(self, evt):
+        self.mod.table = self.tables[evt.GetInt()]
+
+    def processing(self):
+        self.scaling = SigTo(0, 0.05, 0)
+        self.tables = [HarmTable(), SawTable(2), SawTable(5), SawTable(10), SawTable(20),
+                      SquareTable(2), SquareTable(5), SquareTable(10), SquareTable(20),
+                      TriTable(2), TriTable(5), TriTable(10), TriTable(20)]
+        self.freq = SigTo(344, 0.05)
+        self.freq2 = SigTo(172, 0.05)
+        self.mod = Osc(self.tables[0], self.freq2, mul=1-self.scaling, add=self.scaling)
+        self.port = Osc(self.tables[0], self.freq)
+        self.output = self.port * self.mod * 0.707
+        self.display = self.output
+
+class FreqModModule(wx.Panel):
+    """
+    Module: 09-Modulation - Modulation de fréquence
+    -----------------------------------------------
+
+    Ce module permet d'explorer le potentiel de la modulation de fréquence
+    selon l'algorithme de John Chaowning.
+
+    Le spectre d'une modulation de fréquence présente la fréquence porteuse
+    et une série de bandes latérales (de chaque côté de la porteuse) aux
+    multiples de la fréquence modulante (P-M, P+M, P-2M, P+2M, P-3M, P+3M ...).
+
+    Contrôles:
+        Fréquence porteuse:
+            Fréquence porteuse en Hertz. À cette fréquence viendra
+            s'additionner le signal de l'oscillateur modulant pour
+            produire la fréquence modulée de l'oscillateur porteur.
+        Ratio porteuse:modulante:
+            Ce ratio détermine la fréquence de l'oscillateur modulant,
+            en relation avec la fréquence porteuse. La fréquence modulante
+            est la fréquence porteuse divisée par le ratio. Les rapports
+            d'entier donnent toujours un spectre harmonique.
+        Index de modulation:
+            Indique l'amplitude de l'oscillateur modulant en multiples
+            de la fréquence modulante (fréquence modulante multipliée
+            par index de modulation égale amplitude de l'oscillateur
+            modulant). Détermine le nombre de bandes latérales (I+1)
+            de chaque côté de la fréquence porteuse.
+        Forme d'onde de la porteuse:
+            Permet de changer la forme d'onde lue par l'oscillateur porteur.
+            Une forme d'onde complexe enrichira d'autant plus le spectre du
+            signal final.
+        Forme d'onde de la modulante:
+            Permet de changer la forme d'onde lue par l'oscillateur modulant.
+            Une forme d'onde complexe enrichira d'autant plus le spectre du
+            signal final.
+
+    """
+    name = "09-Modulation - Modulation de fréquence"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence porteuse")
+        self.fr = PyoGuiControlSlider(self, 40, 5000, 344, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePortFreq)
+
+        labelra = wx.StaticText(self, -1, "Ratio porteuse:modulante")
+        self.ra = PyoGuiControlSlider(self, 0.1, 10, 1)
+        self.ra.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ra.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRatio)
+
+        labelind = wx.StaticText(self, -1, "Index de modulation")
+        self.ind = PyoGuiControlSlider(self, 0, 40, 5)
+        self.ind.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ind.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeIndex)
+
+        choices = ["Sinus", "Scie 2", "Scie 5",
+                   "Scie 10", "Scie 20",
+                   "Carrée 2", "Carrée 5",
+                   "Carrée 10", "Carrée 20",
+                   "Triangle 2", "Triangle 5",
+                   "Triangle 10", "Triangle 20"]
+
+        wavelabel = wx.StaticText(self, -1, "Forme d'onde de la porteuse")
+        wave = wx.Choice(self, -1, choices=choices)
+        wave.SetSelection(0)
+        wave.Bind(wx.EVT_CHOICE, self.setWaveform)
+
+        wave2label = wx.StaticText(self, -1, "Forme d'onde de la modulante")
+        wave2 = wx.Choice(self, -1, choices=choices)
+        wave2.SetSelection(0)
+        wave2.Bind(wx.EVT_CHOICE, self.setWaveform2)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelra, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ra, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelind, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ind, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(wavelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(wave, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(wave2label, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(wave2, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changePortFreq(self, evt):
+        self.freq.value = evt.value
+
+    def changeRatio(self, evt):
+        self.ratio.value = evt.value
+
+    def changeIndex(self, evt):
+        self.index.value = evt.value
+
+    def setWaveform(self, evt):
+        self.port.table = self.tables[evt.GetInt()]
+
+    def setWaveform2(self, evt):
+        self.mod.table = self.tables[evt.GetInt()]
+
+    def processing(self):
+        self.tables = [HarmTable(), SawTable(2), SawTable(5), SawTable(10), SawTable(20),
+                      SquareTable(2), SquareTable(5), SquareTable(10), SquareTable(20),
+                      TriTable(2), TriTable(5), TriTable(10), TriTable(20)]
+        self.freq = SigTo(344, 0.05)
+        self.ratio = SigTo(1, 0.05)
+        self.index = SigTo(5, 0.05)
+        self.modfreq = self.freq / self.ratio
+        self.modamp = self.modfreq * self.index
+        self.mod = Osc(self.tables[0], self.modfreq, mul=self.modamp)
+        self.port = Osc(self.tables[0], self.freq+self.mod, mul=0.707)
+        self.output = self.display = self.port
+
+class AutoModModule(wx.Panel):
+    """
+    Module: 09-Modulation - Auto-modulation
+    ----------------------------------------
+
+    Ce module illustre l'auto-modulation.
+
+    L'auto-modulation consiste à moduler le pointeur de lecture d'une
+    forme d'onde avec la lecture (pondérée) de la forme d'onde elle-même.
+    Le résultat est équivalent à une modulation de fréquence dont le ratio
+    est fixé à 1.
+
+    freq ---> + ---> OSC ------>
+              |             |
+              ---<--- x <---
+                      |
+                    index
+
+    Contrôles:
+        Fréquence porteuse:
+            Fréquence porteuse en Hertz. À cette fréquence viendra
+            s'additionner le signal de sortie de l'oscillateur pour
+            produire la fréquence modulée de ce même oscillateur.
+        Index de modulation:
+            Indique le volume du signal de sortie de l'oscillateur qui
+            est additionné à la fréquence porteuse afin de moduler la
+            fréquence de l'oscillateur.
+
+    """
+    name = "09-Modulation - Auto-modulation"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence porteuse")
+        self.fr = PyoGuiControlSlider(self, 40, 2000, 172, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePortFreq)
+
+        labelind = wx.StaticText(self, -1, "Index de modulation")
+        self.ind = PyoGuiControlSlider(self, 0, 1, 0.1)
+        self.ind.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.ind.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeIndex)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelind, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.ind, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changePortFreq(self, evt):
+        self.freq.value = evt.value
+
+    def changeIndex(self, evt):
+        self.index.value = evt.value
+
+    def processing(self):
+        self.table = HarmTable(size=32768)
+        self.freq = SigTo(172, 0.05)
+        self.index = SigTo(0.1, 0.05, mul=0.17)
+        self.port = OscLoop(self.table, self.freq, feedback=self.index, mul=0.707)
+        self.output = self.display = self.port
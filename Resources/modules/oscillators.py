@@ -0,0 +1,199 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from ..bandlimited import TriTable, PWM, OscSync
+
+class PulseWidthModModule(wx.Panel):
+    """
+    Module: 08-Oscillateurs - Modulation de largeur d'impulsion
+    -----------------------------------------------------------
+
+    Ce module génère un signal audio à l'aide de la technique dite
+    de modulation à largeur d'impulsion.
+
+    Un signal à modulation de largeur d'impulsion (Pulse Width
+    Modulation ou PWM en anglais) est constitué de deux composantes
+    principales qui définissent son comportement: un rapport cyclique
+    et une fréquence. Le rapport cyclique décrit la durée pendant
+    laquelle le signal est à l'état haut (ouverture) en pourcentage
+    de la durée d'un cycle complet. La fréquence détermine combien de
+    cycles complets le signal effectue à la seconde.
+
+    Contrôles:
+        Fréquence fondamentale en Hz:
+            Contrôle le nombre de cycles (périodes) complets par seconde.
+            C'est la fréquence fondamentale du signal en Hertz.
+        Cycle d'ouverture en %:
+            Contrôle la proportion de la phase d'ouverture par rapport
+            à la durée complète du cycle. 50 % signifie que le signal
+            passe autant de temps dans le positif que dans le négatif,
+            générant ainsi une forme d'onde carrée.
+        Filtre anti-alias:
+            Qualité du filtre passe-bas servant à adoucir les transitions
+            du signal entre 1 et -1. Une valeur de 0 signifie qu'il n'y a
+            pas de filtre anti-alias et que le signal alterne entre les
+            deux pôles de façon instantannée. Une valeur positive indique
+            la taille de la réponse impulsionnelle du filtre passe-bas
+            utilisé. La taille est équivalente à la valeur de ce paramètre
+            multiplié par 2.
+
+    """
+    name = "08-Oscillateurs - Modulation de largeur d'impulsion"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence fondamentale en Hz")
+        self.fr = PyoGuiControlSlider(self, 40, 2000, 172, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFreq)
+
+        labeldc = wx.StaticText(self, -1, "Cycle d'ouverture en %")
+        self.dc = PyoGuiControlSlider(self, 1, 99, 50, integer=True)
+        self.dc.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.dc.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeDuty)
+
+        labelfl = wx.StaticText(self, -1, "Filtre anti-alias")
+        self.fl = PyoGuiControlSlider(self, 0, 32, 0, integer=True)
+        self.fl.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fl.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFilter)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labeldc, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.dc, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfl, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fl, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changeFreq(self, evt):
+        self.freq.value = evt.value
+
+    def changeDuty(self, evt):
+        self.duty.value = evt.value * 0.01
+
+    def changeFilter(self, evt):
+        self.output.damp = int(evt.value)
+
+    def processing(self):
+        self.freq = SigTo(172, 0.05)
+        self.duty = SigTo(0.5, 0.05)
+        self.output = PWM(self.freq, 0, self.duty, 0, mul=0.5)
+        self.display = self.output
+
+class OscSyncModule(wx.Panel):
+    """
+    Module: 08-Oscillateurs - Oscillateur synchronisé
+    -------------------------------------------------
+
+    Ce module permet d'explorer le potentiel de l'oscillateur
+    synchronisé.
+
+    Un oscillateur synchronisé, dans les synthétiseurs analogiques,
+    était réalisé à l'aide de deux oscillateurs, un "maître" et un
+    dit "esclave". L'oscillateur maître est celui qui correspond à
+    la fréquence jouée au clavier et sert à remettre la phase de
+    l'oscillateur esclave à zéro chaque fois que son cycle recommence.
+    En désaccordant la fréquence de l'oscillateur esclave, on peut
+    donc créer des formes d'ondes inédites puisque la phase de ce
+    dernier sera forcée de revenir à zéro avant d'avoir terminée
+    son cycle. Cette technique génère un signal riche en harmooniques.
+
+    Contrôles:
+        Forme d'onde:
+            Permet de changer la forme d'onde lue par l'oscillateur
+            esclave. Une forme d'onde complexe enrichira d'autant plus
+            le spectre du signal final.
+        Fréquence maître en Hz:
+            Fréquence de l'oscillateur maître (que l'on entend pas).
+            Cet oscillateur ne sert qu'à la re-synchronisation mais
+            contrôle tout de même la fréquence fondamentale du signal.
+        Fréquence esclave en Hz:
+            Fréquence de l'oscillateur esclave. Selon que cette
+            fréquence est plus ou moins déphasée par rapport à la
+            fréquence de l'oscillateur maître, la forme d'onde de
+            cet oscillateur ne terminera pas son cycle
+            (f_slave < f_master) ou aura le temps d'en commencer
+            un nouveau avant d'être re-synchronisé
+            (f_slave > f_master).
+        Fondu enchaîné en ms:
+            Ce paramètre permet de passer du mode "hard sync" (lorsqu'à
+            0) au mode "soft sync" (plus grande que 0) en utilisant
+            deux oscillateurs synchronisés et en appliquant un fondu
+            enchaîné entre les deux. la re-synchronisation est
+            systématiquement appliquée à l'oscillateur qui est dans
+            le silence afin d'adoucir l'impact (et la quantité
+            d'harmoniques) du changement de phase instantanné.
+
+    """
+    name = "08-Oscillateurs - Oscillateur synchronisé"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        wavelabel = wx.StaticText(self, -1, "Forme d'onde")
+        choices = ["Sinus", "Scie 5", "Scie 15",
+                   "Scie 30", "Scie 60",
+                   "Carrée 5", "Carrée 15",
+                   "Carrée 30", "Carrée 60",
+                   "Triangle 3", "Triangle 6",
+                   "Triangle 12", "Triangle 24"]
+        wave = wx.Choice(self, -1, choices=choices)
+        wave.SetSelection(0)
+        wave.Bind(wx.EVT_CHOICE, self.setWaveform)
+        sizer.Add(wavelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(wave, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelfr = wx.StaticText(self, -1, "Fréquence maître en Hz")
+        self.fr = PyoGuiControlSlider(self, 40, 2000, 172, log=True)
+        self.fr.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeFreq)
+
+        labelfr2 = wx.StaticText(self, -1, "Fréquence esclave en Hz")
+        self.fr2 = PyoGuiControlSlider(self, 40, 2000, 200, log=True)
+        self.fr2.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fr2.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSlave)
+
+        labelfl = wx.StaticText(self, -1, "Fondu enchaîné en ms")
+        self.fl = PyoGuiControlSlider(self, 0, 2, 0)
+        self.fl.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.fl.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeCrossfade)
+
+        sizer.Add(labelfr, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfr2, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fr2, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelfl, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.fl, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def setWaveform(self, evt):
+        self.output.table = self.tables[evt.GetInt()]
+
+    def changeFreq(self, evt):
+        self.freq.value = evt.value
+
+    def changeSlave(self, evt):
+        self.slave.value = evt.value
+
+    def changeCrossfade(self, evt):
+        self.xfade.value = evt.value
+
+    def processing(self):
+        self.tables = [HarmTable(), SawTable(5), SawTable(15), SawTable(30), SawTable(60),
+                      SquareTable(5), SquareTable(15), SquareTable(30), SquareTable(60),
+                      TriTable(3), TriTable(6), TriTable(12), TriTable(24)]
+        self.freq = SigTo(172, 0.05)
+        self.slave = SigTo(200, 0.05)
+        self.xfade = SigTo(0, 0.05)
+        self.output = OscSync(self.tables[0], self.freq, self.slave, self.xfade)
+        self.display = self.output
@@ -0,0 +1,204 @@
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from .inputpanel import InputPanel
+
+class ResamplingModule(wx.Panel):
+    """
+    Module: 01-Échantillonnage - Fréquence d'échantillonnage
+    --------------------------------------------------------
+
+    Ce module illustre l'effet de l'opération d'échantillonnage sur
+    le spectre de fréquence d'un signal. Il est composé d'un choix
+    de fréquences d'échantillonnage (en division de la fréquence
+    d'échantillonnage courante), d'un filtre anti-repliement
+    (appliqué avant le ré-échantillonnage afin de contrôler le
+    repliement de spectre) et d'un filtre de reconstruction
+    (appliqué avant la reconstruction du signal afin d'éliminer
+    les copies du spectre d'origine apparues lors de la numérisation
+    du signal).
+
+    Contrôles:
+        Ré-échantillonnage:
+            Choix de la nouvelle fréquence d'échantillonnage.
+            "sr" : aucun ré-échantillonnage
+            "sr/2" : Moitié de la fréquence d'échantillonnage courante
+            "sr/4" : Quart de la fréquence d'échantillonnage courante
+            "sr/8" : Huitième de la fréquence d'échantillonnage courante
+        Filtre anti-repliement:
+            Le filtre utilisé avant échantillonnage pour assurer que le
+            signal à échantillonner ne contient pas de composantes au-dessus
+            de la fréquence de Nyquist.
+            "Aucun" : Auncun filtre n'est appliqué
+            "FIR-8" : Fonction pieuvre à 8 points
+            "FIR-32" : Fonction pieuvre à 32 points
+            "FIR-128" : Fonction pieuvre à 128 points
+        Filtre de reconstruction:
+            Le filtre utilisé pour reconstruire le signal en éliminant les
+            copies (autour des multiples de la fréquence d'échantillonnage)
+            provoquées par la multiplication du signal par un train
+            d'impulsions.
+            "Aucun" : Auncun filtre n'est appliqué
+            "FIR-8" : Fonction pieuvre à 8 points
+            "FIR-32" : Fonction pieuvre à 32 points
+            "FIR-128" : Fonction pieuvre à 128 points
+
+    """
+    name = "01-Échantillonnage - Fréquence d'échantillonnage"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.factor = -1
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        downlabel = wx.StaticText(self, -1, "Ré-échantillonnage")
+        self.down = wx.Choice(self, -1, choices=["sr", "sr/2", "sr/4", "sr/8"])
+        self.down.SetSelection(0)
+        self.down.Bind(wx.EVT_CHOICE, self.resample)
+
+        filt1label = wx.StaticText(self, -1, "Filtre anti-repliement")
+        f1 = ["Aucun", "FIR-8", "FIR-32", "FIR-128"]
+        self.filt1 = wx.Choice(self, -1, choices=f1)
+        self.filt1.SetSelection(0)
+        self.filt1.Bind(wx.EVT_CHOICE, self.changeFilter1)
+
+        filt2label = wx.StaticText(self, -1, "Filtre de reconstruction")
+        f2 = ["Aucun", "FIR-8", "FIR-32", "FIR-128"]
+        self.filt2 = wx.Choice(self, -1, choices=f2)
+        self.filt2.SetSelection(0)
+        self.filt2.Bind(wx.EVT_CHOICE, self.changeFilter2)
+
+        sizer.Add(downlabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.down, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(filt1label, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.filt1, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(filt2label, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.filt2, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        self.SetSizer(sizer)
+
+    def resample(self, evt):
+        self.factor = [-1, -2, -4, -8][evt.GetInt()]
+        mode1 = self.downsig.mode
+        mode2 = self.output.mode
+        self.processing()
+        self.downsig.mode = mode1
+        self.output.mode = mode2
+        wx.GetTopLevelParent(self).connectModuleToOutput()
+
+    def changeFilter1(self, evt):
+        order = [1, 8, 32, 128][evt.GetInt()]
+        self.downsig.mode = order
+
+    def changeFilter2(self, evt):
+        order = [0, 8, 32, 128][evt.GetInt()]
+        self.output.mode = order
+
+    def processing(self):
+        self.blocked = DCBlock(self.inputpanel.output)
+        server = self.blocked.getServer()
+        server.beginResamplingBlock(self.factor)
+        self.downsig = Resample(self.blocked, mode=0)
+        server.endResamplingBlock()
+        self.output = Resample(self.downsig, mode=0)
+        self.display = self.output
+
+class QuantizeModule(wx.Panel):
+    """
+    Module: 01-Échantillonnage - Quantification
+    --------------------------------------------
+
+    Ce module illustre l'impact du nombre de bits de quantification
+    utilisés lors de la numérisation d'un signal. En dessous de 8
+    bits, on perçoit clairement l'ajout du bruit de quantification
+    au signal original. Le module permet aussi d'ajouter un bruit
+    de dispersion (dither) afin de masquer le bruit de quantification
+    (autant que possible!) à l'aide d'un bruit moins aggressant à
+    l'écoute.
+
+    Contrôles:
+        # de bits de quantification:
+            Définit le pas de quantification, entre 2 et 16 bits.
+        Choisir le signal:
+            On peut visualiser (et écouter) le signal dégradé ou le
+            bruit de quantification seul.
+        Bruit de dispersion:
+            Ajout d'un bruit de dispersion. Diverses variantes de bruit
+            sont offertes.
+
+    """
+    name = "01-Échantillonnage - Quantification"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.nbits = 16
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        labelbt = wx.StaticText(self, -1, "# de bits de quantification")
+        self.bt = PyoGuiControlSlider(self, 2, 16, 16, log=False)
+        self.bt.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.bt.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeBits)
+
+        chooselabel = wx.StaticText(self, -1, "Choisir le signal")
+        choices = ["Signal dégradé", "Bruit de quantification"]
+        self.choose = wx.Choice(self, -1, choices=choices)
+        self.choose.SetSelection(0)
+        self.choose.Bind(wx.EVT_CHOICE, self.changeSignal)
+
+        ditherlabel = wx.StaticText(self, -1, "Bruit de dispersion")
+        choices = ["Aucun", "Rectangulaire", "Triangulaire", "Gaussien",
+                   "Bruit hautes fréquences", "Bruit basses fréquences"]
+        self.dither = wx.Choice(self, -1, choices=choices)
+        self.dither.SetSelection(0)
+        self.dither.Bind(wx.EVT_CHOICE, self.changeDither)
+
+        sizer.Add(labelbt, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.bt, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(chooselabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.choose, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(ditherlabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.dither, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        self.SetSizer(sizer)
+
+    def changeBits(self, evt):
+        self.degrade.bitdepth = self.nbits = evt.value
+        self.ndither.mul = 1 / (pow(2, self.nbits) / 2) * 0.66
+
+    def changeSignal(self, evt):
+        if evt.GetInt() == 0:
+            self.output.setInput(self.degrade, 0.1)
+        else:
+            self.output.setInput(self.qnoise, 0.1)
+
+    def changeDither(self, evt):
+        self.ndither.mul = 1 / (pow(2, self.nbits) / 2) * 0.66
+        self.ndither.value = self.nsignals[evt.GetInt()]
+
+    def processing(self):
+        self.nsignals = [Sig(0), Noise(), ((Noise()+Noise())/2),
+                         ((Noise()+Noise()+Noise()+Noise()+Noise()+Noise())/2),
+                         Atone(Noise(), 2500), Tone(Noise(), 2500)]
+        self.ndither = Sig(self.nsignals[0], mul=0)
+        self.blocked = DCBlock(self.inputpanel.output)
+        self.degrade = Degrade(self.blocked, bitdepth=16, add=self.ndither)
+        self.qnoise = self.degrade - self.blocked
+        self.output = InputFader(self.degrade)
+        self.display = self.output
@@ -0,0 +1,29 @@
+import wx
+from ..widgets import HeadTitle
+from .inputpanel import InputPanel
+
+class InputOnlyModule(wx.Panel):
+    """
+    Module: 00-Sources
+    ------------------
+
+    Ce module permet d'explorer les différentes sources sonores
+    disponibles, sans traitement.
+
+    """
+    name = "00-Sources"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        self.SetSizer(sizer)
+
+    def processing(self):
+        self.output = self.inputpanel.output
+        self.display = self.output
@@ -0,0 +1,555 @@
+import os
+import math
+import wx
+from ..engine import *
+from ..constants import *
+from ..widgets import HeadTitle
+from ..hrtf import HRTFSet, BinauralRenderer, FOUND_H5PY
+from .inputpanel import InputPanel
+
+class PanningModule(wx.Panel):
+    """
+    Module: 04-Spatialisation - Panoramisation
+    ------------------------------------------
+
+    Ce module permet de comparer trois différents algorithmes de
+    panoramisation.
+
+    - Linéaire:
+        Le moins coûteux en temps de calcul, l'intensité totale
+        est réduite de 6 dB au centre par rapport aux extrémités.
+    - Sinus/cosinus:
+        Le gain pour chaque haut-parleur est calculé à partir de
+        fonction cosinus (pour le canal de gauche) et sinus (pour
+        le canal de droite). L'intensité totale est toujours de
+        1, peu importe la position de la source. Cet algorithme
+        est plus coûteux en temps de calcul.
+    - Racine carrée:
+        Cet algorithme est un compromis entre les deux précédents
+        en ce qui a trait au temps de calcul (plus coûteux que
+        la panoramisation linéaire mais moins que sinus/cosinus)
+        tout en conservant une intensité totale de 1 sur tout
+        l'arc de panoramisation. Par contre, la courbe est un peu
+        abrupte aux extrémités (proche de 0 ou de 1).
+
+    Contrôles:
+        Algorithme de panoramisation:
+            Permet de choisir l'algorithme de panoramisation.
+        Pan gauche - droite:
+            Position du signal sur l'axe gauche - droite.
+            0 = complètement à gauche, 1 = complètement à droite.
+
+    """
+    name = "04-Spatialisation - Panoramisation"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        typelabel = wx.StaticText(self, -1, "Algorithme de panoramisation")
+        choices = ["Linéaire", "Sinus/cosinus", "Racine carrée"]
+        type = wx.Choice(self, -1, choices=choices)
+        type.SetSelection(0)
+        type.Bind(wx.EVT_CHOICE, self.changePanType)
+
+        labelpn = wx.StaticText(self, -1, "Pan gauche - droite")
+        self.pn = PyoGuiControlSlider(self, 0, 1, 0.5, log=False)
+        self.pn.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.pn.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePan)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelpn, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.pn, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def changePanType(self, evt):
+        choices = [self.pan1, self.pan2, self.pan3]
+        self.output.setInput(choices[evt.GetInt()])
+
+    def changePan(self, evt):
+        self.pan.value = evt.value
+
+    def processing(self):
+        self.pan = SigTo(0.5, 0.05)
+        self.pan1 = Sig(self.inputpanel.output, mul=[1 - self.pan, self.pan])
+        self.pan2 = Pan(self.inputpanel.output, pan=self.pan)
+        self.pan3 = Sig(self.inputpanel.output,
+                        mul=[Sqrt(1 - self.pan), Sqrt(self.pan)])
+        self.output = InputFader(self.pan1)
+        self.display = self.output
+
+class BinauralModule(wx.Panel):
+    """
+    Module: 04-Spatialisation - Spatialisation binaurale en 3D
+    ----------------------------------------------------------
+
+    Ce module permet d'expérimenter avec la panoramisation 3D en
+    stéréo à l'aide des algorithmes VBAP (Vector-Based Amplitude
+    Panning), pour les déplacements de la source, et HRTF 
+    (Head-Related Transfert Function), pour la simulation du 
+    filtrage causé par les oreilles, la tête, les épaules, etc.
+    Les réponses impulsionnelles proviennent de Gardner et Martin
+    du MIT Media Lab:
+
+    http://alumni.media.mit.edu/~kdm/hrtfdoc/hrtfdoc.html
+
+    On contrôle la position de la source est spécifiant ses
+    coordonnées en azimuth et en élévation.
+
+    D'autres jeux de réponses impulsionnelles peuvent être chargés à
+    partir de fichiers SOFA (AES69, nécessite le module h5py). Les
+    spectres de toutes les directions mesurées sont alors calculés une
+    seule fois et conservés sur le disque. La source passe d'une
+    direction mesurée à l'autre par un court fondu enchaîné.
+
+    Pour bien entendre l'effet Binaural des filtres HRTF, il est
+    préférable d'en faire l'écoute aux écouteurs!
+
+    Contrôles:
+        Fichier HRTF (SOFA):
+            Permet de charger un jeu de réponses impulsionnelles
+            au format SOFA, à la place du jeu du MIT.
+        Position en azimuth:
+            Contrôle la position de la source en azimuth (plan
+            horizontal). La position est donnée en degrés, entre
+            -180 et 180 degrés. -90 signifie que le son est
+            complètement à gauche et à 90 degrés, le son est
+            complètement à droite.
+        Position en élévation:
+            Contrôle la position de la source en élévation (plan
+            vertical). La position est donnée en degrés, entre
+            0 et 90 degrés. 0 degrés signifie que le son est
+            au niveau des oreilles et à 90 degrés, le son est
+            au dessus de la tête.
+
+    """
+    name = "04-Spatialisation - Spatialisation binaurale en 3D"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        hrtfbutton = wx.Button(self, -1, "Fichier HRTF (SOFA)")
+        hrtfbutton.Bind(wx.EVT_BUTTON, self.onLoadHrtf)
+        hrtfbutton.Enable(FOUND_H5PY)
+        self.hrtflabel = wx.StaticText(self, -1, "")
+
+        sizer.Add(hrtfbutton, 0, wx.ALL|wx.EXPAND, 5)
+        sizer.Add(self.hrtflabel, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelaz = wx.StaticText(self, -1, "Position en azimuth")
+        self.az = PyoGuiControlSlider(self, -180, 180, 0.0, log=False)
+        self.az.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.az.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeAzimuth)
+
+        labelel = wx.StaticText(self, -1, "Position en élévation")
+        self.el = PyoGuiControlSlider(self, 0, 90, 0.0, log=False)
+        self.el.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.el.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeElevation)
+
+        sizer.Add(labelaz, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.az, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.el, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadHrtf(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier HRTF",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            wildcard="SOFA (*.sofa)|*.sofa",
+            style=wx.FD_OPEN)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            self.loadHrtf(dlg.GetPath())
+
+        dlg.Destroy()
+
+    def loadHrtf(self, path):
+        try:
+            hrtf = HRTFSet(path, self.binaural.getSamplingRate())
+        except Exception as e:
+            wx.MessageBox("Impossible de charger le jeu de HRTF '%s':\n%s" % (path, e),
+                          self.name, wx.OK | wx.ICON_ERROR, self)
+            return
+        old = self.renderer
+        self.renderer = BinauralRenderer(self.inputpanel.output, hrtf)
+        self.renderer.setPosition(0, self.az.getValue(), self.el.getValue())
+        self.output.setInput(self.renderer.output, 0.05)
+        self.binaural.stop()
+        if old is not None:
+            wx.CallLater(100, old.stop)
+        self.hrtflabel.SetLabel("%s (%d directions)" % (os.path.basename(path), hrtf.count))
+
+    def getState(self):
+        return {"hrtf": self.renderer.hrtf.path if self.renderer is not None else None}
+
+    def setState(self, state):
+        if state["hrtf"] is not None and FOUND_H5PY:
+            self.loadHrtf(state["hrtf"])
+
+    def changeAzimuth(self, evt):
+        self.azimuth.value = evt.value
+        if self.renderer is not None:
+            self.renderer.setPosition(0, evt.value, self.el.getValue())
+
+    def changeElevation(self, evt):
+        self.elevation.value = evt.value
+        if self.renderer is not None:
+            self.renderer.setPosition(0, self.az.getValue(), evt.value)
+
+    def processing(self):
+        self.renderer = None
+        self.hrtflabel.SetLabel("MIT (intégré)" if FOUND_H5PY else "MIT (intégré), h5py requis pour SOFA")
+        self.azimuth = SigTo(0.0, 0.05)
+        self.elevation = SigTo(0.0, 0.05)
+        self.binaural = Binaural(self.inputpanel.output, self.azimuth, self.elevation)
+        self.output = InputFader(self.binaural)
+        self.display = self.output
+
+    def onEnd(self):
+        if self.renderer is not None:
+            self.renderer.stop()
+
+class SceneModule(wx.Panel):
+    """
+    Module: 04-Spatialisation - Scène multi-sources
+    -----------------------------------------------
+
+    Ce module permet d'expérimenter avec la spatialisation d'une scène
+    composée de plusieurs sources sonores.
+
+    Chaque source joue l'un des générateurs du panneau d'entrée (ou la
+    sortie du panneau), avec un délai qui lui est propre. Les sources
+    sont réparties sur un arc devant l'auditeur, chacune peut ensuite
+    être déplacée individuellement, et la scène peut tourner autour de
+    la tête. La scène est rendue en stéréo avec l'une des lois de
+    panoramisation ou en binaural (HRTF).
+
+    Les gains de toutes les sources sont calculés ensemble, par des
+    objets qui traitent une source par canal, et les filtres HRTF sont
+    partagés par toutes les sources: le coût d'une source supplémentaire
+    reste faible, même pour des scènes de plusieurs dizaines de sources.
+
+    Contrôles:
+        Nombre de sources:
+            Nombre de sources de la scène.
+        Rendu:
+            Loi de panoramisation (linéaire, sinus/cosinus, racine
+            carrée) ou rendu binaural avec les filtres HRTF.
+        Fichier HRTF (SOFA):
+            Permet de charger un jeu de réponses impulsionnelles
+            au format SOFA pour le rendu binaural, à la place du
+            jeu du MIT.
+        Étalement:
+            Largeur de l'arc sur lequel les sources sont réparties,
+            de 0 (toutes au centre) à 1 (tout autour de la tête).
+        Vitesse de rotation (Hz):
+            Nombre de tours par seconde des sources autour de la
+            tête.
+        Position en élévation:
+            Élévation de toutes les sources, en degrés (rendu
+            binaural seulement).
+        Source:
+            Source dont l'entrée et la position sont modifiées par
+            les trois contrôles suivants.
+        Entrée de la source:
+            Signal joué par la source: la sortie du panneau d'entrée
+            ou l'un de ses générateurs (ils jouent tous en même temps).
+        Déplacement en azimut:
+            Décalage de la source sur le cercle, en degrés, par
+            rapport à sa place sur l'arc.
+        Élévation de la source:
+            Élévation de la source, en degrés, ajoutée à l'élévation
+            de toutes les sources (rendu binaural seulement).
+
+    """
+    name = "04-Spatialisation - Scène multi-sources"
+    counts = [4, 8, 16, 32, 64]
+    inputs = ["Sortie du panneau d'entrée"] + InputPanel.sources
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        countlabel = wx.StaticText(self, -1, "Nombre de sources")
+        self.countChoice = wx.Choice(self, -1, choices=[str(x) for x in self.counts])
+        self.countChoice.SetSelection(1)
+        self.countChoice.Bind(wx.EVT_CHOICE, self.changeCount)
+
+        modelabel = wx.StaticText(self, -1, "Rendu")
+        choices = ["Linéaire", "Sinus/cosinus", "Racine carrée", "Binaural (HRTF)"]
+        self.modeChoice = wx.Choice(self, -1, choices=choices)
+        self.modeChoice.SetSelection(0)
+        self.modeChoice.Bind(wx.EVT_CHOICE, self.changeMode)
+
+        hrtfbutton = wx.Button(self, -1, "Fichier HRTF (SOFA)")
+        hrtfbutton.Bind(wx.EVT_BUTTON, self.onLoadHrtf)
+        hrtfbutton.Enable(FOUND_H5PY)
+        self.hrtflabel = wx.StaticText(self, -1, "")
+
+        labelspread = wx.StaticText(self, -1, "Étalement")
+        self.spread = PyoGuiControlSlider(self, 0, 1, 0.5, log=False)
+        self.spread.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.spread.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSpread)
+
+        labelrot = wx.StaticText(self, -1, "Vitesse de rotation (Hz)")
+        self.rot = PyoGuiControlSlider(self, -1, 1, 0.0, log=False)
+        self.rot.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.rot.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeRotation)
+
+        labelel = wx.StaticText(self, -1, "Position en élévation")
+        self.el = PyoGuiControlSlider(self, 0, 90, 0.0, log=False)
+        self.el.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.el.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeElevation)
+
+        # Controls of one source.
+        sourcelabel = wx.StaticText(self, -1, "Source")
+        self.sourceChoice = wx.Choice(self, -1, choices=[])
+        self.sourceChoice.Bind(wx.EVT_CHOICE, self.changeSource)
+
+        inputlabel = wx.StaticText(self, -1, "Entrée de la source")
+        self.inputChoice = wx.Choice(self, -1, choices=self.inputs)
+        self.inputChoice.SetSelection(0)
+        self.inputChoice.Bind(wx.EVT_CHOICE, self.changeSourceInput)
+
+        labeloffset = wx.StaticText(self, -1, "Déplacement en azimut")
+        self.offset = PyoGuiControlSlider(self, -180, 180, 0.0, log=False)
+        self.offset.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.offset.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSourceOffset)
+
+        labelheight = wx.StaticText(self, -1, "Élévation de la source")
+        self.height = PyoGuiControlSlider(self, -40, 90, 0.0, log=False)
+        self.height.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.height.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSourceHeight)
+
+        sizer.Add(countlabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.countChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(modelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.modeChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(hrtfbutton, 0, wx.ALL|wx.EXPAND, 5)
+        sizer.Add(self.hrtflabel, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelspread, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.spread, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelrot, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.rot, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.el, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(sourcelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.sourceChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(inputlabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.inputChoice, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labeloffset, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.offset, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        sizer.Add(labelheight, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.height, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+        # The HRTF renderer gets the positions of the sources from Python.
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.updatePositions, self.timer)
+
+    def onLoadHrtf(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier HRTF",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            wildcard="SOFA (*.sofa)|*.sofa",
+            style=wx.FD_OPEN)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            self.loadHrtf(dlg.GetPath())
+
+        dlg.Destroy()
+
+    def loadHrtf(self, path):
+        try:
+            self.hrtf = HRTFSet(path, self.pans.getSamplingRate())
+        except Exception as e:
+            wx.MessageBox("Impossible de charger le jeu de HRTF '%s':\n%s" % (path, e),
+                          self.name, wx.OK | wx.ICON_ERROR, self)
+            return
+        self.hrtflabel.SetLabel("%s (%d directions)" % (os.path.basename(path), self.hrtf.count))
+        if self.mode == 3:
+            self.setMode(3)
+
+    def getState(self):
+        return {"hrtf": self.hrtf.path if self.hrtf is not None else None,
+                "inputs": self.sourceInputs, "offsets": self.sourceOffsets,
+                "heights": self.sourceHeights}
+
+    def setState(self, state):
+        if state["hrtf"] is not None and FOUND_H5PY:
+            self.loadHrtf(state["hrtf"])
+        # Used by the scene rebuilt when the number of sources is restored.
+        self.sourceInputs = state["inputs"]
+        self.sourceOffsets = state["offsets"]
+        self.sourceHeights = state["heights"]
+
+    def changeCount(self, evt):
+        self.buildScene(self.counts[evt.GetInt()])
+
+    def changeSource(self, evt):
+        self.showSource()
+
+    def showSource(self):
+        source = self.sourceChoice.GetSelection()
+        self.inputChoice.SetSelection(self.sourceInputs[source])
+        self.offset.setValue(self.sourceOffsets[source], propagate=False)
+        self.height.setValue(self.sourceHeights[source], propagate=False)
+
+    def changeSourceInput(self, evt):
+        self.sourceInputs[self.sourceChoice.GetSelection()] = evt.GetInt()
+        self.selector.voice = self.sourceInputs[:self.count]
+
+    def changeSourceOffset(self, evt):
+        self.sourceOffsets[self.sourceChoice.GetSelection()] = evt.value
+        self.offsets.value = [x / 360. for x in self.sourceOffsets[:self.count]]
+
+    def changeSourceHeight(self, evt):
+        self.sourceHeights[self.sourceChoice.GetSelection()] = evt.value
+        self.heights.value = self.sourceHeights[:self.count]
+
+    def changeMode(self, evt):
+        self.setMode(evt.GetInt())
+
+    def changeSpread(self, evt):
+        self.spreading.value = evt.value
+
+    def changeRotation(self, evt):
+        self.rotation.freq = evt.value
+
+    def changeElevation(self, evt):
+        self.elevation.value = evt.value
+
+    def updatePositions(self, evt):
+        if self.renderer is None:
+            return
+        elevations = self.elevations.get(all=True)
+        for i, azimuth in enumerate(self.azimuths.get(all=True)):
+            self.renderer.setPosition(i, azimuth, elevations[i])
+
+    def setMode(self, mode):
+        self.mode = mode
+        old = [self.binaural, self.binauralmix]
+        self.binauralmix = None
+        if mode < 3:
+            for pointer in self.gains:
+                pointer.table = self.laws[mode]
+            self.binaural = self.renderer = None
+            self.timer.Stop()
+            self.output.setInput(self.panning, 0.05)
+        elif self.hrtf is not None:
+            self.renderer = BinauralRenderer(self.sources, self.hrtf, mul=self.level)
+            self.binaural = self.renderer
+            self.updatePositions(None)
+            self.timer.Start(50)
+            self.output.setInput(self.renderer.output, 0.05)
+        else:
+            self.renderer = None
+            self.timer.Stop()
+            self.binaural = Binaural(self.sources, self.azimuths, self.elevations, mul=self.level)
+            self.binauralmix = self.binaural.mix(2)
+            self.output.setInput(self.binauralmix, 0.05)
+        for obj in old:
+            if obj is not None:
+                wx.CallLater(100, obj.stop)
+
+    def buildScene(self, count):
+        """
+        Builds the sources and the panning of a scene of `count` sources.
+        Every object has one stream per source.
+
+        """
+        old = [self.panning, self.binaural, self.binauralmix]
+        self.count = count
+        self.level = 1.0 / math.sqrt(count)
+        # Every source picks its generator and has its own delay, so the
+        # sources playing the same generator aren't correlated.
+        self.selector = Selector(self.generators, voice=self.sourceInputs[:count])
+        self.sources = SDelay(self.selector, delay=[i * 0.0371 for i in range(count)],
+                              maxdelay=count * 0.0371)
+        # Sources spread around the front, moved one by one, wrapped in
+        # -0.5 to 0.5 turn.
+        self.layout = Sig([i / float(count) - (count - 1) / (2.0 * count) for i in range(count)],
+                          mul=self.spreading)
+        self.offsets = Sig([x / 360. for x in self.sourceOffsets[:count]])
+        self.azimuths = Wrap(self.layout + self.offsets + self.rotation, min=-0.5, max=0.5, mul=360)
+        self.heights = Sig(self.sourceHeights[:count])
+        self.elevations = Clip(self.heights + self.elevation, -40, 90)
+        self.pans = Sin(self.azimuths * (math.pi / 180), mul=0.5, add=0.5)
+        mode = min(self.mode, 2)
+        self.gains = [Pointer(self.laws[mode], 1 - self.pans), Pointer(self.laws[mode], self.pans)]
+        ears = [Mix(self.sources * gain, voices=1) for gain in self.gains]
+        self.panning = Mix(ears, voices=2, mul=self.level)
+        self.binaural = self.renderer = self.binauralmix = None
+        self.setMode(self.mode)
+        for obj in old:
+            if obj is not None:
+                wx.CallLater(100, obj.stop)
+        source = min(max(self.sourceChoice.GetSelection(), 0), count - 1)
+        self.sourceChoice.SetItems([str(i + 1) for i in range(count)])
+        self.sourceChoice.SetSelection(source)
+        self.showSource()
+
+    def processing(self):
+        self.hrtf = None
+        self.renderer = None
+        self.binaural = None
+        self.binauralmix = None
+        self.panning = None
+        self.mode = 0
+        self.hrtflabel.SetLabel("MIT (intégré)" if FOUND_H5PY else "MIT (intégré), h5py requis pour SOFA")
+        # Right channel gain of the panning laws, read backward for the left.
+        points = [i / 8192. for i in range(8193)]
+        self.laws = [DataTable(8193, init=points),
+                     DataTable(8193, init=[math.sin(x * math.pi / 2) for x in points]),
+                     DataTable(8193, init=[math.sqrt(x) for x in points])]
+        self.spreading = SigTo(0.5, 0.05)
+        self.rotation = Phasor(0)
+        self.elevation = SigTo(0.0, 0.05)
+        panel = self.inputpanel
+        self.generators = [panel.output, panel.lfooscil, panel.oscillator, panel.soundfilemono,
+                           panel.noisegenerator]
+        # Settings of every source, kept when the number of sources changes.
+        most = max(self.counts)
+        self.sourceInputs = [0] * most
+        self.sourceOffsets = [0.0] * most
+        self.sourceHeights = [0.0] * most
+        self.output = InputFader(Sig([0, 0]))
+        self.buildScene(self.counts[self.countChoice.GetSelection()])
+        self.display = self.output
+
+    def onEnd(self):
+        self.timer.Stop()
+        if self.renderer is not None:
+            self.renderer.stop()
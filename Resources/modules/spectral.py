@@ -0,0 +1,1101 @@
+import os
+import wx
+from ..engine import *
+from pyo.lib._wxwidgets import DataMultiSlider
+from ..constants import *
+from ..widgets import HeadTitle, LabelKnob
+from ..analysis import SpectralSwitcher, CurveTable, FFTVocoder, vocoderSize
+from ..preanalysis import PreAnalysis, FramePlayer, truncation
+from .inputpanel import InputPanel
+
+class VocoderModule(wx.Panel):
+    """
+    Module: 06-Domaine Spectral - Vocodeur
+    --------------------------------------
+
+    Ce module illustre le vocodeur dans le domaine temporel.
+
+    Un vocodeur comprend une partie « analyseur » et une partie « synthétiseur ».
+    Un suivi d'amplitude est appliqué à différentes tranches de fréquence dans la
+    « analyseur » et le résultat est utilisé pour moduler l'amplitude des tranches
+    de fréquences respectives dans la partie « synthétiseur ».
+
+    Contrôles:
+        Freq:
+            Fréquence de base pour la séparation en tranche de fréquence.
+        Exp:
+            Facteur d'expansion appliqué aux fréquences successives (en 
+            commençant par la fréquence de base) pour déterminer la fréquence
+            centrale des filtres passe-bande.
+        Q:
+            Facteur de qualité des filtres (largeur de bande = fréquence centrale
+            divisée par le facteur de qualité).
+        Pente:
+            Réactivité des suivis d'amplitude. Plus cette valeur est élevé, plus les
+            suivis sont précis dans le temps.
+        Nbrs:
+            Nombre de filtres passe-bande constituant le vocodeur.
+            Au-delà de 64 bandes, le vocodeur est calculé dans le
+            domaine spectral: les bandes (placées par Freq, Exp et Q)
+            pondèrent les tranches de la FFT, dont la taille donne au
+            moins deux tranches entre les deux bandes les plus proches
+            (8192 points au plus). Les bandes au-delà de la fréquence
+            de Nyquist sont ignorées.
+
+    """
+    name = "06-Domaine Spectral - Vocodeur"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Sources Sonores")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        row1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        loadbutton = wx.Button(self, -1, "Enveloppe")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        row1.Add(loadbutton, 1, wx.ALL|wx.EXPAND, 5)
+
+        loadbutton2 = wx.Button(self, -1, "Excitation")
+        loadbutton2.Bind(wx.EVT_BUTTON, self.onLoadSoundfile2)
+        row1.Add(loadbutton2, 1, wx.ALL|wx.EXPAND, 5)
+
+        sizer.Add(row1, 0, wx.EXPAND)
+
+        self.playbutton = wx.ToggleButton(self, -1, "Jouer les sons")
+        self.playbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onPlaySoundfile)
+        sizer.Add(self.playbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(10)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        sizer.AddSpacer(10)
+
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+        self.p1 = LabelKnob(self, " Freq", mini=40, maxi=250, init=100, outFunction=self.setFreq)
+        self.p2 = LabelKnob(self, " Exp.", mini=0.5, maxi=2, init=1.2, outFunction=self.setExp)
+        self.p3 = LabelKnob(self, "  Q ", mini=1, maxi=100, init=20, outFunction=self.setQ)
+        self.p4 = LabelKnob(self, "Pente", mini=0, maxi=1, init=0.5, outFunction=self.setSlope)
+        self.p5 = LabelKnob(self, " Nbrs", mini=2, maxi=256, init=24, integer=True, outFunction=self.setStages)
+        box1.AddMany([(self.p1, 1), (self.p2, 1), (self.p3, 1), (self.p4, 1), (self.p5, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 0)
+
+        labeldb = wx.StaticText(self, -1, "Volume (dB)")
+        self.db = PyoGuiControlSlider(self, -60, 18, 0)
+        self.db.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.db.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeVol)
+
+        sizer.Add(labeldb, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.db, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+        self.soundfile.freq = self.soundtable.getRate()
+
+    def onLoadSoundfile2(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'excitation",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile2(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile2(self, path):
+        self.soundtable2.setSound(path)
+        self.soundfile2.freq = self.soundtable2.getRate()
+
+    def getState(self):
+        return {"soundfile": self.soundtable.path, "soundfile2": self.soundtable2.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+        if state["soundfile2"] is not None:
+            self.loadSoundfile2(state["soundfile2"])
+
+    def onPlaySoundfile(self, evt):
+        if evt.GetInt():
+            self.soundfile.play()
+            self.soundfile2.play()
+        else:
+            self.soundfile.stop()
+            self.soundfile2.stop()
+
+    def setFreq(self, value):
+        self.freq.value = value
+        self.updateVocoder("setFreq", value)
+
+    def setExp(self, value):
+        self.exp.value = value
+        self.updateVocoder("setSpread", value)
+
+    def setQ(self, value):
+        self.q.value = value
+        self.updateVocoder("setQ", value)
+
+    def setSlope(self, value):
+        self.slope.value = value
+
+    def setStages(self, value):
+        value = int(value)
+        if value <= VOCODER_MAX_FILTER_BANDS:
+            self.filterbank.stages = value
+            self.setMode("filters")
+        else:
+            self.bands = value
+            self.setMode("fft")
+            self.updateVocoder("setBands", value)
+
+    def updateVocoder(self, method, value):
+        for vocoder in self.switcher.chains():
+            getattr(vocoder, method)(value)
+        self.resizeVocoder()
+
+    def vocoderSize(self):
+        return vocoderSize(self.soundfilemono.getSamplingRate(), self.bands,
+                           self.freq.value, self.exp.value)
+
+    def resizeVocoder(self):
+        # Another FFT size needs a new vocoder, the switcher crossfades
+        # to it once it outputs valid frames.
+        if self.mode == "fft":
+            size = self.vocoderSize()
+            if size != self.switcher.size:
+                self.switcher.change(size=size)
+
+    def buildVocoder(self):
+        return FFTVocoder(self.soundfilemono, self.soundfilemono2, self.bands, self.freq.value,
+                          self.exp.value, self.q.value, slope=self.slope)
+
+    def setMode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        if mode == "fft":
+            self.switcher.chain.play()
+            self.switcher.output.play()
+            self.output.setInput(self.switcher.output, 0.05)
+            self.resizeVocoder()
+        else:
+            self.filterbank.play()
+            self.output.setInput(self.filterbank, 0.05)
+        wx.CallLater(100, self.stopUnused)
+
+    def stopUnused(self):
+        if self.mode == "fft":
+            self.filterbank.stop()
+        else:
+            for vocoder in self.switcher.chains():
+                vocoder.stop()
+            self.switcher.output.stop()
+
+    def changeVol(self, evt):
+        self.gain.value = pow(10, evt.value * 0.05)
+
+    def processing(self):
+        self.gain = SigTo(1, 0.05, mul=0.25)
+        self.fade = Fader(fadein=1, mul=self.gain).play()
+        self.freq = SigTo(100, 0.05)
+        self.exp = SigTo(1.2, 0.05)
+        self.q = SigTo(20, 0.05)
+        self.slope = SigTo(0.5, 0.05)
+
+        # Soundfile player 1
+        self.soundtable = SndTable(initchnls=2)
+        self.soundfile = TableRead(self.soundtable, freq=1, loop=1, interp=4)
+        self.soundfilemono = self.soundfile.mix()
+        # Soundfile player 2
+        self.soundtable2 = SndTable(initchnls=2)
+        self.soundfile2 = TableRead(self.soundtable2, freq=1, loop=1, interp=4)
+        self.soundfilemono2 = self.soundfile2.mix()
+
+        self.filterbank = Vocoder(self.soundfilemono, self.soundfilemono2, freq=self.freq,
+                                  spread=self.exp, q=self.q, slope=self.slope)
+        self.anabus = wx.GetTopLevelParent(self).anabus
+        self.bands = 128
+        self.switcher = SpectralSwitcher(self.anabus, [], self.buildVocoder,
+                                         size=self.vocoderSize())
+        self.switcher.chain.stop()
+        self.switcher.output.stop()
+        self.mode = "filters"
+        self.output = InputFader(self.filterbank, mul=self.fade)
+        self.display = self.output
+
+    def onEnd(self):
+        self.switcher.close()
+
+class SpectralFilterModule(wx.Panel):
+    """
+    Module: 06-Domaine Spectral - Filtrage
+    --------------------------------------
+
+    Ce module permet d'expérimenter avec le filtrage dans le 
+    domaine spectral.
+
+    Une analyse FFT est d'abord effectuée sur le signal et le 
+    volume de chacune des tranches de fréquence peut ensuite
+    être contrôlé indépendamment à l'aide d'un graphique à bande.
+
+    Contrôles:
+        Taille FFT:
+            Nombre de points dans l'analyse FFT. Le spectre entre
+            0 et la fréquence d'échantillonnage sera séparé en
+            autant de tranches. Le nombre de tranches effectives
+            est donc `taille FFT / 2`, c'est-à-dire les tranches
+            entre 0 et la fréquence de Nyquist.
+        Chevauchements:
+            Le nombre d'analyses qui se chevauchent sur la durée
+            correspondant à la taille FFT. Pour certain effets 
+            (en particulier la transposition et l'expansion 
+            temporelle), plus cette valeur est élevé, plus le rendu
+            sonore est de qualité. 
+        Fenêtre:
+            Le type de fenêtre appliqué avant et après l'analyse, afin
+            d'éliminer les artefacts dans le rendu sonore.
+        Dessiner le filtre (256 points):
+            Les volume individuels des 256 premières tranches de 
+            fréquence (0 à Nyquist pour une taille de 512).
+
+    """
+    name = "06-Domaine Spectral - Filtrage"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        self.inputpanel = InputPanel(self)
+        sizer.Add(self.inputpanel, 0, wx.EXPAND)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        # FFT properties widgets #
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        sizeBox = wx.BoxSizer(wx.VERTICAL)
+        sizelabel = wx.StaticText(self, -1, "Taille FFT")
+        sizeChoice = wx.Choice(self, -1, choices=SIZECHOICES)
+        sizeChoice.SetSelection(4)
+        sizeChoice.Bind(wx.EVT_CHOICE, self.changeSize)
+        sizeBox.AddMany([(sizelabel, 0, wx.EXPAND), (sizeChoice, 0, wx.EXPAND)])
+
+        overBox = wx.BoxSizer(wx.VERTICAL)
+        overlabel = wx.StaticText(self, -1, "Chevauchements")
+        overChoice = wx.Choice(self, -1, choices=OVERLAPS)
+        overChoice.SetSelection(1)
+        overChoice.Bind(wx.EVT_CHOICE, self.changeOver)
+        overBox.AddMany([(overlabel, 0, wx.EXPAND), (overChoice, 0, wx.EXPAND)])
+
+        typelabel = wx.StaticText(self, -1, "Fenêtre")
+        type = wx.Choice(self, -1, choices=WINCHOICES)
+        type.SetSelection(2)
+        type.Bind(wx.EVT_CHOICE, self.changeType)
+
+        box1.AddMany([(sizeBox, 1, wx.ALL, 1), (overBox, 1, wx.ALL, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 4)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        # FFT properties widgets #
+
+        box2 = wx.BoxSizer(wx.VERTICAL)
+        graphLabel = wx.StaticText(self, -1, label="Dessiner le filtre (256 points)")
+        grapher = DataMultiSlider(self, [0.0 for i in range(256)], outFunction=self.changeFilter)
+        box2.AddMany([(graphLabel, 0), (grapher, 0, wx.EXPAND)])
+
+        sizer.Add(box2, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(sizer)
+
+    def changeSize(self, evt):
+        self.switcher.change(size=int(evt.GetString()))
+
+    def changeOver(self, evt):
+        self.switcher.change(overlaps=int(evt.GetString()))
+
+    def changeType(self, evt):
+        self.switcher.change(wintype=evt.GetInt())
+
+    def changeFilter(self, values):
+        if hasattr(self, "curve"):
+            self.curve.setCurve(values)
+
+    def buildChain(self, pva):
+        self.pvf = PVFilter(pva, self.curve.table)
+        return PVSynth(self.pvf, wintype=pva.wintype)
+
+    def processing(self):
+        self.anabus = wx.GetTopLevelParent(self).anabus
+        self.curve = CurveTable(256)
+        self.switcher = SpectralSwitcher(self.anabus, [self.inputpanel.output], self.buildChain)
+        self.output = self.switcher.output
+        self.display = self.output
+
+    def onEnd(self):
+        self.curve.stop()
+        self.switcher.close()
+
+class CrossSynthModule(wx.Panel):
+    """
+    Module: 06-Domaine Spectral - Synthèse croisée
+    ----------------------------------------------
+
+    Ce module permet d'expérimenter avec la synthèse croisée dans
+    le domaine spectral.
+
+    Une analyse FFT est d'abord effectuée sur deux signaux puis leurs
+    spectres sont ensuite multipliés afin d'appliquer le profil spectral
+    du premier son sur le contenu fréquentiel du second.
+
+    Les fichiers sonores sont analysés une seule fois, hors temps réel,
+    et les analyses sont ensuite lues en boucle. En attendant la fin de
+    l'analyse, la synthèse croisée est calculée en temps réel.
+
+    Contrôles:
+        Enveloppe:
+            Permet de choisir la première source sonore (enveloppe spectrale).
+            Ce signal doit généralement être dynamique, tant au niveau
+            des fréquences que de l'amplitude.
+        Excitation:
+            Permet de choisir la seconde source sonore.
+            Ce signal doit généralement être riche en contenu fréquentiel
+            et stable au niveau des amplitudes.
+        Jouer les sons:
+            Lance la lecture des sons.
+        Taille FFT:
+            Nombre de points dans l'analyse FFT. Le spectre entre
+            0 et la fréquence d'échantillonnage sera séparé en
+            autant de tranches. Le nombre de tranches effectives
+            est donc `taille FFT / 2`, c'est-à-dire les tranches
+            entre 0 et la fréquence de Nyquist.
+        Chevauchements:
+            Le nombre d'analyses qui se chevauchent sur la durée
+            correspondant à la taille FFT. Pour certain effets 
+            (en particulier la transposition et l'expansion 
+            temporelle), plus cette valeur est élevé, plus le rendu
+            sonore est de qualité. 
+        Fenêtre:
+            Le type de fenêtre appliqué avant et après l'analyse, afin
+            d'éliminer les artefacts dans le rendu sonore.
+        Volume (dB):
+            Permet d'ajuster le volume après la synthèse croisée.
+
+    """
+    name = "06-Domaine Spectral - Synthèse croisée"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.size = 1024
+        self.overlaps = 4
+        self.wintype = 2
+        self.paths = {"env": None, "exc": None}
+        self.ready = {"env": None, "exc": None}
+        self.analyses = {"env": None, "exc": None}
+        self.stale = set()
+        self.pending = False
+
+        head = HeadTitle(self, "Sources Sonores")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        row1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        loadbutton = wx.Button(self, -1, "Enveloppe")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        row1.Add(loadbutton, 1, wx.ALL|wx.EXPAND, 5)
+
+        loadbutton2 = wx.Button(self, -1, "Excitation")
+        loadbutton2.Bind(wx.EVT_BUTTON, self.onLoadSoundfile2)
+        row1.Add(loadbutton2, 1, wx.ALL|wx.EXPAND, 5)
+
+        sizer.Add(row1, 0, wx.EXPAND)
+
+        self.playbutton = wx.ToggleButton(self, -1, "Jouer les sons")
+        self.playbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onPlaySoundfile)
+        sizer.Add(self.playbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(10)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        # FFT properties widgets #
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        sizeBox = wx.BoxSizer(wx.VERTICAL)
+        sizelabel = wx.StaticText(self, -1, "Taille FFT")
+        sizeChoice = wx.Choice(self, -1, choices=SIZECHOICES)
+        sizeChoice.SetSelection(4)
+        sizeChoice.Bind(wx.EVT_CHOICE, self.changeSize)
+        sizeBox.AddMany([(sizelabel, 0, wx.EXPAND), (sizeChoice, 0, wx.EXPAND)])
+
+        overBox = wx.BoxSizer(wx.VERTICAL)
+        overlabel = wx.StaticText(self, -1, "Chevauchements")
+        overChoice = wx.Choice(self, -1, choices=OVERLAPS)
+        overChoice.SetSelection(1)
+        overChoice.Bind(wx.EVT_CHOICE, self.changeOver)
+        overBox.AddMany([(overlabel, 0, wx.EXPAND), (overChoice, 0, wx.EXPAND)])
+
+        typelabel = wx.StaticText(self, -1, "Fenêtre")
+        type = wx.Choice(self, -1, choices=WINCHOICES)
+        type.SetSelection(2)
+        type.Bind(wx.EVT_CHOICE, self.changeType)
+
+        box1.AddMany([(sizeBox, 1, wx.ALL, 1), (overBox, 1, wx.ALL, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 4)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        # FFT properties widgets #
+
+        labeldb = wx.StaticText(self, -1, "Volume (dB)")
+        self.db = PyoGuiControlSlider(self, -60, 18, 0)
+        self.db.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.db.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeVol)
+
+        sizer.Add(labeldb, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.db, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        self.waitinglabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.waitinglabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable2.setSound(path)
+        self.soundfile2.freq = self.soundtable2.getRate()
+        self.paths["env"] = path
+        self.analyse("env")
+
+    def onLoadSoundfile2(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'excitation",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile2(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile2(self, path):
+        self.soundtable.setSound(path)
+        self.soundfile.freq = self.soundtable.getRate()
+        self.paths["exc"] = path
+        self.analyse("exc")
+
+    def getState(self):
+        return {"soundfile": self.soundtable2.path, "soundfile2": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+        if state["soundfile2"] is not None:
+            self.loadSoundfile2(state["soundfile2"])
+
+    def onPlaySoundfile(self, evt):
+        if evt.GetInt():
+            self.soundfile.play()
+            self.soundfile2.play()
+            self.excindex.reset()
+            self.envindex.reset()
+            self.playing.play()
+        else:
+            self.soundfile.stop()
+            self.soundfile2.stop()
+            self.playing.stop()
+
+    def changeSize(self, evt):
+        self.size = int(evt.GetString())
+        if self.switcher is not None:
+            self.switcher.change(size=self.size)
+        self.analyse("env", "exc")
+
+    def changeOver(self, evt):
+        self.overlaps = int(evt.GetString())
+        if self.switcher is not None:
+            self.switcher.change(overlaps=self.overlaps)
+        self.analyse("env", "exc")
+
+    def changeType(self, evt):
+        self.wintype = evt.GetInt()
+        if self.switcher is not None:
+            self.switcher.change(wintype=self.wintype)
+        self.analyse("env", "exc")
+
+    def analyse(self, *roles):
+        # Several parameters may change at once (restoreState), the
+        # analyses start when they are all set.
+        for role in roles:
+            self.ready[role] = None
+            self.stale.add(role)
+        if not self.pending:
+            self.pending = True
+            wx.CallAfter(self.startAnalysis)
+
+    def startAnalysis(self):
+        self.pending = False
+        for role in self.stale:
+            self.analyses[role] = None
+            if self.paths[role] is not None:
+                self.analyses[role] = PreAnalysis(self.paths[role], self.size, self.overlaps,
+                                                  self.wintype, self.analysisDone, mono=True)
+                self.analyses[role].start()
+        self.stale.clear()
+
+    def analysisDone(self, analysis, frames):
+        roles = [role for role in self.analyses if self.analyses[role] is analysis]
+        # A newer analysis was started, or the module was closed.
+        if not roles or frames is None:
+            return
+        self.analyses[roles[0]] = None
+        self.ready[roles[0]] = frames
+        if self.ready["env"] is not None and self.ready["exc"] is not None:
+            self.usePreAnalysis()
+
+    def usePreAnalysis(self):
+        env, exc = self.ready["env"], self.ready["exc"]
+        self.envindex.freq = 1.0 / env["dur"]
+        self.excindex.freq = 1.0 / exc["dur"]
+        # The current frames (or the live analyses) keep playing until the
+        # crossfade is done.
+        previous = self.player
+        self.player = FramePlayer(exc, self.excindex, mul=self.playing,
+                                  envelope=env, envindex=self.envindex)
+        self.output.setInput(self.player.output, self.fadetime)
+        if previous is not None:
+            wx.CallLater(int(self.fadetime * 1000) + 100, previous.stop)
+        if self.switcher is not None:
+            wx.CallLater(int(self.fadetime * 1000) + 100, self.closeSwitcher)
+        self.waitinglabel.SetLabel(truncation(env) or truncation(exc))
+
+    def closeSwitcher(self):
+        # The live analyses aren't needed anymore.
+        if self.switcher is not None:
+            self.switcher.close()
+            self.switcher = None
+
+    def changeVol(self, evt):
+        self.gain.value = pow(10, evt.value * 0.05)
+
+    def buildChain(self, pva, pva2):
+        self.pvmult = PVMult(pva, pva2)
+        return PVSynth(self.pvmult, wintype=pva.wintype, mul=self.fade)
+
+    def processing(self):
+        self.gain = SigTo(1)
+        self.fade = Fader(fadein=1, mul=self.gain).play()
+        # Soundfile player 1
+        self.soundtable = SndTable(initchnls=2)
+        self.soundfile = TableRead(self.soundtable, freq=1, loop=1, interp=4)
+        self.soundfilemono = self.soundfile.mix()
+        # Soundfile player 2
+        self.soundtable2 = SndTable(initchnls=2)
+        self.soundfile2 = TableRead(self.soundtable2, freq=1, loop=1, interp=4)
+        self.soundfilemono2 = self.soundfile2.mix()
+
+        self.anabus = wx.GetTopLevelParent(self).anabus
+        self.switcher = SpectralSwitcher(self.anabus, [self.soundfilemono, self.soundfilemono2],
+                                         self.buildChain)
+
+        # Pre-analysed frames, read in loop.
+        self.playing = Fader(fadein=0.05, fadeout=0.05, mul=self.fade)
+        self.excindex = Phasor(freq=0)
+        self.envindex = Phasor(freq=0)
+        self.fadetime = 0.1
+        self.player = None
+
+        self.output = InputFader(self.switcher.output)
+        self.display = self.output
+
+    def onEnd(self):
+        self.paths = {"env": None, "exc": None}
+        self.analyses = {"env": None, "exc": None}
+        self.closeSwitcher()
+
+class SpectralPlaybackModule(wx.Panel):
+    """
+    Module: 06-Domaine Spectral - Vitesse et Hauteur Indépendantes
+    --------------------------------------------------------------
+
+    Ce module permet d'expérimenter avec la resynthèse dans le 
+    domaine spectral.
+
+    Une analyse FFT (Vocodeur de phase) est d'abord effectuée sur
+    le signal et le résultat de chacune des analyses successives
+    est sauvegardé dans un tableau. La lecture du tableau permet
+    un contrôle indépendant de la vitesse de lecture et de la 
+    hauteur (transposition) du son.
+
+    L'analyse est calculée hors temps réel, aussi vite que le permet
+    le processeur, dès que le fichier est chargé. Elle est conservée
+    sur le disque: un fichier déjà analysé avec les mêmes paramètres
+    est disponible immédiatement.
+
+    Contrôles:
+        Fichier sonore:
+            permet de sélectionner le fichier son à resynthétiser.
+        Taille FFT:
+            Nombre de points dans l'analyse FFT. Le spectre entre
+            0 et la fréquence d'échantillonnage sera séparé en
+            autant de tranches. Le nombre de tranches effectives
+            est donc `taille FFT / 2`, c'est-à-dire les tranches
+            entre 0 et la fréquence de Nyquist.
+        Chevauchements:
+            Le nombre d'analyses qui se chevauchent sur la durée
+            correspondant à la taille FFT. Pour certain effets 
+            (en particulier la transposition et l'expansion 
+            temporelle), plus cette valeur est élevé, plus le rendu
+            sonore est de qualité. 
+        Fenêtre:
+            Le type de fenêtre appliqué avant et après l'analyse, afin
+            d'éliminer les artefacts dans le rendu sonore.
+        Jouer:
+            Lance la lecture du tableau contenant les analyses
+            successives.
+        Vitesse de lecture:
+            Contrôle la vitesse de lecture, c'est-à-dire la vitesse
+            à laquelle les analyses successives sont lues.
+        Transposition:
+            Contrôle la transposition du spectre à la lecture.
+
+    """
+    name = "06-Domaine Spectral - Vitesse et Hauteur Indépendantes"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.path = None
+        self.size = 1024
+        self.overlaps = 4
+        self.wintype = 2
+        self.pending = False
+        self.analysis = None
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        loadbutton = wx.Button(self, -1, "Fichier sonore")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        sizer.Add(loadbutton, 0, wx.ALL|wx.EXPAND, 5)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        # FFT properties widgets #
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        sizeBox = wx.BoxSizer(wx.VERTICAL)
+        sizelabel = wx.StaticText(self, -1, "Taille FFT")
+        sizeChoice = wx.Choice(self, -1, choices=SIZECHOICES)
+        sizeChoice.SetSelection(4)
+        sizeChoice.Bind(wx.EVT_CHOICE, self.changeSize)
+        sizeBox.AddMany([(sizelabel, 0, wx.EXPAND), (sizeChoice, 0, wx.EXPAND)])
+
+        overBox = wx.BoxSizer(wx.VERTICAL)
+        overlabel = wx.StaticText(self, -1, "Chevauchements")
+        overChoice = wx.Choice(self, -1, choices=OVERLAPS)
+        overChoice.SetSelection(1)
+        overChoice.Bind(wx.EVT_CHOICE, self.changeOver)
+        overBox.AddMany([(overlabel, 0, wx.EXPAND), (overChoice, 0, wx.EXPAND)])
+
+        typelabel = wx.StaticText(self, -1, "Fenêtre")
+        type = wx.Choice(self, -1, choices=WINCHOICES)
+        type.SetSelection(2)
+        type.Bind(wx.EVT_CHOICE, self.changeType)
+
+        box1.AddMany([(sizeBox, 1, wx.ALL, 1), (overBox, 1, wx.ALL, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 4)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        # FFT properties widgets #
+
+        sizer.AddSpacer(10)
+
+        self.playbutton = wx.ToggleButton(self, -1, "Jouer")
+        self.playbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onPlay)
+        sizer.Add(self.playbutton, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelspeed = wx.StaticText(self, -1, "Vitesse de lecture")
+        self.speed = PyoGuiControlSlider(self, -2, 2, 0.5)
+        self.speed.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.speed.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changeSpeed)
+
+        sizer.Add(labelspeed, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.speed, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        labelpitch = wx.StaticText(self, -1, "Transposition")
+        self.pitch = PyoGuiControlSlider(self, 0.1, 2, 1)
+        self.pitch.setBackgroundColour(USR_PANEL_BACK_COLOUR)
+        self.pitch.Bind(EVT_PYO_GUI_CONTROL_SLIDER, self.changePitch)
+
+        sizer.Add(labelpitch, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(self.pitch, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+
+        sizer.AddSpacer(10)
+
+        self.waitinglabel = wx.StaticText(self, -1, "")
+        sizer.Add(self.waitinglabel, 0, wx.EXPAND|wx.LEFT|wx.TOP, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.path = path
+        self.analyse()
+
+    def getState(self):
+        return {"soundfile": self.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+
+    def changeSize(self, evt):
+        self.size = int(evt.GetString())
+        self.analyse()
+
+    def changeOver(self, evt):
+        self.overlaps = int(evt.GetString())
+        self.analyse()
+
+    def changeType(self, evt):
+        self.wintype = evt.GetInt()
+        self.analyse()
+
+    def analyse(self):
+        # Several parameters may change at once (restoreState), the
+        # analysis starts when they are all set.
+        if self.path is not None and not self.pending:
+            self.pending = True
+            wx.CallAfter(self.startAnalysis)
+
+    def startAnalysis(self):
+        self.pending = False
+        if self.path is None:
+            return
+        self.waitinglabel.SetLabel("Analyse...")
+        self.analysis = PreAnalysis(self.path, self.size, self.overlaps, self.wintype,
+                                    self.analysisDone)
+        self.analysis.start()
+
+    def analysisDone(self, analysis, frames):
+        # A newer analysis was started, or the module was closed.
+        if analysis is not self.analysis:
+            return
+        if frames is None:
+            self.waitinglabel.SetLabel("Analyse impossible.")
+            return
+        # The current frames keep playing until the crossfade is done.
+        previous = self.player
+        self.player = FramePlayer(frames, self.index, self.pit, mul=self.gain)
+        self.index.freq = self.rate / frames["dur"]
+        self.output.setInput(self.player.output, self.fadetime)
+        if previous is not None:
+            wx.CallLater(int(self.fadetime * 1000) + 100, previous.stop)
+        self.waitinglabel.SetLabel(truncation(frames))
+
+    def onPlay(self, evt):
+        if evt.GetInt():
+            self.gain.play()
+        else:
+            self.gain.stop()
+
+    def changeSpeed(self, evt):
+        self.rate.value = evt.value
+
+    def changePitch(self, evt):
+        self.pit.value = evt.value
+
+    def processing(self):
+        self.gain = Fader(0.05, 0.05, 0)
+
+        self.rate = SigTo(0.5)
+        self.index = Phasor(freq=1/5*self.rate)
+        self.pit = SigTo(1)
+
+        self.fadetime = 0.1
+        self.player = None
+        self.output = InputFader(Sig([0, 0]))
+        self.display = self.output
+
+    def onEnd(self):
+        self.path = None
+        self.analysis = None
+
+class SpectralDelayModule(wx.Panel):
+    """
+    Module: 06-Domaine Spectral - Délai Spectral
+    --------------------------------------------
+
+    Ce module permet d'expérimenter avec le délai par tranche de
+    fréquence dans le domaine spectral.
+
+    Une analyse FFT (Vocodeur de phase) est d'abord effectuée sur 
+    le signal puis chacune des tranches de fréquence peut être
+    délayée (avec facteur de récursion) indépendamment les unes
+    des autres.
+
+    Contrôles:
+        Choisir un son:
+            Permet de sélectionner un fichier sonore.
+        Jouer:
+            Lance la lecture du fichier son en boucle.
+        Taille FFT:
+            Nombre de points dans l'analyse FFT. Le spectre entre
+            0 et la fréquence d'échantillonnage sera séparé en
+            autant de tranches. Le nombre de tranches effectives
+            est donc `taille FFT / 2`, c'est-à-dire les tranches
+            entre 0 et la fréquence de Nyquist.
+        Chevauchements:
+            Le nombre d'analyses qui se chevauchent sur la durée
+            correspondant à la taille FFT. Pour certain effets 
+            (en particulier la transposition et l'expansion 
+            temporelle), plus cette valeur est élevé, plus le rendu
+            sonore est de qualité. 
+        Fenêtre:
+            Le type de fenêtre appliqué avant et après l'analyse, afin
+            d'éliminer les artefacts dans le rendu sonore.
+        Délai par tranche de fréquence:
+            Ce graphique à bande permet de contrôler le temps de délai
+            (en multiple de la taille FFT divisée par le nombre de 
+            chevauchements) indépendamment pour chacune des tranches de
+            fréquence. La mémoire allouée au délai est fixe (celle d'un
+            délai de 2 secondes avec 4 chevauchements en double
+            précision), le délai maximal est donc plus long lorsqu'il y
+            a moins de chevauchements ou avec le moteur en simple
+            précision. Il n'est jamais inférieur à 2 secondes.
+        Récursion par tranche de fréq.:
+            Ce graphique à bande permet de contrôler le facteur de récursion
+            indépendamment pour chacune des tranches de fréquence.
+
+    """
+    name = "06-Domaine Spectral - Délai Spectral"
+    def __init__(self, parent):
+        wx.Panel.__init__(self, parent)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.fftsize = 1024
+        self.overlaps = 4
+        self.computeMaxDelay()
+
+        head = HeadTitle(self, "Source Sonore")
+        sizer.Add(head, 0, wx.BOTTOM|wx.EXPAND, 5)
+
+        row1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        loadbutton = wx.Button(self, -1, "Choisir un son")
+        loadbutton.Bind(wx.EVT_BUTTON, self.onLoadSoundfile)
+        row1.Add(loadbutton, 1, wx.RIGHT, 5)
+
+        self.playbutton = wx.ToggleButton(self, -1, "Jouer")
+        self.playbutton.Bind(wx.EVT_TOGGLEBUTTON, self.onPlaySoundfile)
+        row1.Add(self.playbutton, 0)
+
+        sizer.Add(row1, 0, wx.ALL|wx.EXPAND, 5)
+
+        sizer.AddSpacer(10)
+
+        head = HeadTitle(self, "Interface du Module")
+        sizer.Add(head, 0, wx.EXPAND)
+
+        # FFT properties widgets #
+        box1 = wx.BoxSizer(wx.HORIZONTAL)
+
+        sizeBox = wx.BoxSizer(wx.VERTICAL)
+        sizelabel = wx.StaticText(self, -1, "Taille FFT")
+        sizeChoice = wx.Choice(self, -1, choices=SIZECHOICES)
+        sizeChoice.SetSelection(4)
+        sizeChoice.Bind(wx.EVT_CHOICE, self.changeSize)
+        sizeBox.AddMany([(sizelabel, 0, wx.EXPAND), (sizeChoice, 0, wx.EXPAND)])
+
+        overBox = wx.BoxSizer(wx.VERTICAL)
+        overlabel = wx.StaticText(self, -1, "Chevauchements")
+        overChoice = wx.Choice(self, -1, choices=OVERLAPS)
+        overChoice.SetSelection(1)
+        overChoice.Bind(wx.EVT_CHOICE, self.changeOver)
+        overBox.AddMany([(overlabel, 0, wx.EXPAND), (overChoice, 0, wx.EXPAND)])
+
+        typelabel = wx.StaticText(self, -1, "Fenêtre")
+        type = wx.Choice(self, -1, choices=WINCHOICES)
+        type.SetSelection(2)
+        type.Bind(wx.EVT_CHOICE, self.changeType)
+
+        box1.AddMany([(sizeBox, 1, wx.ALL, 1), (overBox, 1, wx.ALL, 1)])
+
+        sizer.Add(box1, 0, wx.EXPAND | wx.ALL, 4)
+
+        sizer.Add(typelabel, 0, wx.LEFT|wx.TOP, 5)
+        sizer.Add(type, 0, wx.LEFT|wx.RIGHT|wx.BOTTOM|wx.EXPAND, 5)
+        # FFT properties widgets #
+
+        box2 = wx.BoxSizer(wx.VERTICAL)
+        self.delayLabel = wx.StaticText(self, -1, label=self.delayLabelText())
+        self.delay = DataMultiSlider(self, [0.0 for i in range(256)], yrange=(0, self.frames), size=(-1, 100), outFunction=self.changeDelay)
+        box2.AddMany([(self.delayLabel, 0), (self.delay, 0, wx.EXPAND)])
+
+        sizer.Add(box2, 0, wx.EXPAND | wx.ALL, 5)
+
+        box3 = wx.BoxSizer(wx.VERTICAL)
+        feedLabel = wx.StaticText(self, -1, label="Récursion par tranche de fréq.")
+        feed = DataMultiSlider(self, [0.0 for i in range(256)], size=(-1, 100), outFunction=self.changeFeed)
+        box3.AddMany([(feedLabel, 0), (feed, 0, wx.EXPAND)])
+
+        sizer.Add(box3, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(sizer)
+
+    def onLoadSoundfile(self, evt):
+        dlg = wx.FileDialog(
+            self, message="Choisir le fichier d'enveloppe spectrale",
+            defaultDir=os.getcwd(),
+            defaultFile="",
+            style=wx.FD_OPEN | wx.FD_PREVIEW)
+
+        if dlg.ShowModal() == wx.ID_OK:
+            path = dlg.GetPath()
+            if sndinfo(path) is not None:
+                self.loadSoundfile(path)
+
+        dlg.Destroy()
+
+    def loadSoundfile(self, path):
+        self.soundtable.setSound(path)
+        self.soundfile.freq = self.soundtable.getRate()
+
+    def getState(self):
+        return {"soundfile": self.soundtable.path}
+
+    def setState(self, state):
+        if state["soundfile"] is not None:
+            self.loadSoundfile(state["soundfile"])
+
+    def onPlaySoundfile(self, evt):
+        if evt.GetInt():
+            self.soundfile.play()
+        else:
+            self.soundfile.stop()
+
+    def computeMaxDelay(self):
+        # PVDelay keeps a magnitude and a frequency for every bin (size / 2)
+        # of every frame (one per hop), that is `sr * overlaps` values per
+        # second of delay and per channel, whatever the FFT size. The
+        # memory given to the line is the one of a SPECTRAL_DELAY_TIME
+        # seconds line at 4 overlaps in double precision, at the current
+        # sampling rate, and the delay never gets shorter than that.
+        sr = self.GetParent().GetParent().server.getSamplingRate()
+        itemsize = 4 if PRECISION == "single" else 8
+        # The sound table always has two channels.
+        memory = SPECTRAL_DELAY_TIME * sr * 4 * 8 * 2
+        persec = sr * self.overlaps * itemsize * 2
+        self.maxDelay = max(SPECTRAL_DELAY_TIME, memory / float(persec))
+        self.frames = int(self.maxDelay * sr / (self.fftsize / self.overlaps))
+
+    def delayLabelText(self):
+        return "Délai par tranche de fréquence (max %.1f s)" % self.maxDelay
+
+    def changeSize(self, evt):
+        self.fftsize = int(evt.GetString())
+        self.computeMaxDelay()
+        self.switcher.change(size=self.fftsize)
+        self.delay.yrange = (0, self.frames)
+
+    def changeOver(self, evt):
+        self.overlaps = int(evt.GetString())
+        self.computeMaxDelay()
+        self.switcher.change(overlaps=self.overlaps)
+        self.delay.yrange = (0, self.frames)
+        self.delayLabel.SetLabel(self.delayLabelText())
+
+    def changeType(self, evt):
+        self.switcher.change(wintype=evt.GetInt())
+
+    def changeDelay(self, values):
+        if hasattr(self, "delcurve"):
+            self.delcurve.setCurve(values)
+
+    def changeFeed(self, values):
+        if hasattr(self, "feedcurve"):
+            self.feedcurve.setCurve(values)
+
+    def processing(self):
+        self.soundtable = SndTable(initchnls=2)
+        self.soundfile = TableRead(self.soundtable, freq=1, loop=1, interp=4)
+
+        self.delcurve = CurveTable(256)
+        self.feedcurve = CurveTable(256)
+        self.anabus = wx.GetTopLevelParent(self).anabus
+        self.switcher = SpectralSwitcher(self.anabus, [self.soundfile], self.buildChain)
+        self.output = self.switcher.output
+        self.display = self.output
+
+    def buildChain(self, pva):
+        self.pvd = PVDelay(pva, self.delcurve.table, self.feedcurve.table, maxdelay=self.maxDelay, mode=1)
+        return PVSynth(self.pvd, wintype=pva.wintype)
+
+    def onEnd(self):
+        self.delcurve.stop()
+        self.feedcurve.stop()
+        self.switcher.close()
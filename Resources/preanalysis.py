@@ -0,0 +1,319 @@
+"""
+Offline phase vocoder analysis of sound files.
+
+The frames of a sound file (magnitude and phase increment of every bin)
+are computed by pyo's offline server, as fast as the CPU allows, in a
+separate process (pyo runs only one server per process). They are kept
+in a cache file named after the file's hash and the analysis parameters,
+so a file that has already been analysed is available immediately.
+
+A cache file is a JSON header line followed by the magnitude matrices
+then the phase increment matrices, one per overlap and channel, each
+made of `frames` rows of `size // 2 + 1` bins (the bins above Nyquist
+are not used by IFFT), as float32 or float16 (needs numpy).
+
+The worker is run from the application folder:
+
+    python -m Resources.preanalysis sound size overlaps wintype output [format] [--mono]
+
+With --mono, the channels of the sound are mixed before the analysis.
+Frozen builds (py2app, PyInstaller) have no interpreter to run the
+module, the application's executable is started with WORKER_FLAG as
+first argument instead and dspdemo.py hands the rest to `main`.
+
+A cache file is read into one flat array per matrix, in the file's
+format. The rows pyo needs to build a NewMatrix (lists of Python floats,
+four to eight times larger) are made by `frameRows` for one matrix at a
+time, when its NewMatrix is created. Only the frames that fit in
+SPECTRAL_FRAMES_MEMORY once expanded at the engine's precision are read,
+the header then gives the duration that was cut ("truncated").
+
+"""
+import os
+import sys
+import json
+import array
+import hashlib
+import tempfile
+import threading
+import subprocess
+import wx
+from .engine import Server, sndinfo, SfPlayer, Sig, FFT, IFFT, CarToPol, PolToCar, FrameDelta, \
+                    FrameAccum, NewMatrix, MatrixRec, MatrixPointer, PRECISION
+from .constants import SPECTRAL_CACHE_PATH, SPECTRAL_CACHE_FORMAT, SPECTRAL_FRAMES_MEMORY
+
+try:
+    import numpy
+    FOUND_NUMPY = True
+except:
+    FOUND_NUMPY = False
+
+CACHE_VERSION = 1
+
+WORKER_FLAG = "--preanalysis"
+
+def fileHash(path):
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def cacheFile(digest, size, overlaps, wintype, mono=False):
+    name = "%s-%d-%d-%d%s.frames" % (digest, size, overlaps, wintype, "-mono" if mono else "")
+    return os.path.join(SPECTRAL_CACHE_PATH, name)
+
+def encode(values, fmt):
+    if fmt == "float16":
+        return numpy.asarray(values, dtype=numpy.float16).tobytes()
+    return array.array("f", values).tobytes()
+
+def decode(data, fmt):
+    if fmt == "float16":
+        return numpy.frombuffer(data, dtype=numpy.float16)
+    values = array.array("f")
+    values.frombytes(data)
+    return values
+
+def frameRows(values, bins):
+    """
+    Returns a decoded matrix as the list of rows of `bins` values
+    expected by NewMatrix.
+
+    """
+    if FOUND_NUMPY:
+        return numpy.asarray(values).reshape(-1, bins).tolist()
+    return [values[j:j+bins].tolist() for j in range(0, len(values), bins)]
+
+def writeFrames(filename, header, matrices):
+    """
+    Writes the header and the matrices (lists of rows). The file is
+    renamed only when complete, an interrupted analysis leaves no cache.
+
+    """
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write((json.dumps(header) + "\n").encode("utf-8"))
+        for rows in matrices:
+            for row in rows:
+                f.write(encode(row[:header["bins"]], header["format"]))
+    os.replace(tmp, filename)
+
+def readFrames(filename):
+    """
+    Returns the header of a cache file, with the magnitude ("mags") and
+    phase increment ("phas") matrices added (flat arrays, see
+    `frameRows`), or None if the file can't be used.
+
+    The frames past SPECTRAL_FRAMES_MEMORY are skipped, "frames" and
+    "dur" are then those of the frames kept and "truncated" is the
+    duration of the whole sound (0 if nothing was skipped).
+
+    """
+    try:
+        with open(filename, "rb") as f:
+            header = json.loads(f.readline().decode("utf-8"))
+            if header.get("version") != CACHE_VERSION:
+                return None
+            if header["format"] == "float16" and not FOUND_NUMPY:
+                return None
+            width = 2 if header["format"] == "float16" else 4
+            rowsize = header["bins"] * width
+            count = 2 * header["overlaps"] * header["chnls"]
+            # Size of a row once in a NewMatrix.
+            itemsize = 4 if PRECISION == "single" else 8
+            frames = header["frames"]
+            kept = min(frames, max(1, SPECTRAL_FRAMES_MEMORY // (count * header["bins"] * itemsize)))
+            matrices = []
+            for i in range(count):
+                data = f.read(rowsize * kept)
+                if len(data) != rowsize * kept:
+                    return None
+                matrices.append(decode(data, header["format"]))
+                f.seek(rowsize * (frames - kept), os.SEEK_CUR)
+    except:
+        return None
+    header["truncated"] = 0
+    if kept < frames:
+        header["truncated"] = header["dur"]
+        header["dur"] = header["dur"] * kept / frames
+        header["frames"] = kept
+    half = len(matrices) // 2
+    header["mags"] = matrices[:half]
+    header["phas"] = matrices[half:]
+    return header
+
+def analyse(path, size, overlaps, wintype, output, fmt, mono=False):
+    """
+    Records the frames of a sound file with the offline server and
+    writes them to `output`. Must be called in a fresh process.
+
+    """
+    nsamples, dur, sr, chnls = sndinfo(path)[:4]
+    if mono:
+        chnls = 1
+    hop = size // overlaps
+    # The last frame is completed with silence.
+    nframes = (nsamples + size - 1) // size
+    if nframes < 1:
+        raise ValueError("Sound file too short for a %d points analysis." % size)
+
+    server = Server(sr, chnls, 256, duplex=0, audio="offline")
+    server.boot()
+    handle, tmp = tempfile.mkstemp(suffix=".wav")
+    os.close(handle)
+    server.recordOptions(dur=(nframes + 2) * size / float(sr), filename=tmp)
+
+    # Same chain as pyo's fft/07_fft_stretch example: every overlap of
+    # every channel records one row per frame, `hop` samples after the
+    # previous overlap. The recording starts one frame late, the FFT's
+    # first frame is its latency (silence).
+    player = SfPlayer(path)
+    if mono:
+        player = player.mix(1)
+    fin = FFT(player, size=size, overlaps=overlaps, wintype=wintype)
+    pol = CarToPol(fin["real"], fin["imag"])
+    delta = FrameDelta(pol["ang"], framesize=size, overlaps=overlaps)
+    delays = [size + i * hop for i in range(overlaps) for j in range(chnls)]
+    mags = [NewMatrix(size, nframes) for i in range(overlaps * chnls)]
+    phas = [NewMatrix(size, nframes) for i in range(overlaps * chnls)]
+    magrec = MatrixRec(pol["mag"], mags, 0, delays).play()
+    pharec = MatrixRec(delta, phas, 0, delays).play()
+    server.start()
+    magrec.stop()
+    pharec.stop()
+
+    header = {"version": CACHE_VERSION, "size": size, "overlaps": overlaps,
+              "wintype": wintype, "chnls": chnls, "frames": nframes,
+              "bins": size // 2 + 1, "sr": sr, "dur": dur, "format": fmt}
+    # NewMatrix only exposes its data through its matrix stream.
+    writeFrames(output, header, [m._base_objs[0].getData() for m in mags + phas])
+    server.shutdown()
+    os.remove(tmp)
+
+def truncation(frames):
+    """
+    Returns the message telling that the frames were cut by readFrames,
+    or an empty string.
+
+    """
+    if not frames["truncated"]:
+        return ""
+    return "Analyse limitée aux %.1f premières secondes (sur %.1f)." % (frames["dur"], frames["truncated"])
+
+class PreAnalysis(threading.Thread):
+    """
+    Gets the frames of a sound file in a background thread, from the
+    cache or from a worker process, then calls `callback(self, frames)`
+    in the GUI thread. `frames` is the readFrames dictionary, or None
+    if the analysis failed. With `mono`, the channels of the sound are
+    mixed before the analysis.
+
+    """
+    def __init__(self, path, size, overlaps, wintype, callback, mono=False):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.path = path
+        self.size = size
+        self.overlaps = overlaps
+        self.wintype = wintype
+        self.callback = callback
+        self.mono = mono
+        self.format = SPECTRAL_CACHE_FORMAT
+        if self.format == "float16" and not FOUND_NUMPY:
+            self.format = "float32"
+
+    def run(self):
+        frames = None
+        try:
+            filename = cacheFile(fileHash(self.path), self.size, self.overlaps, self.wintype, self.mono)
+            if os.path.isfile(filename):
+                frames = readFrames(filename)
+            if frames is None:
+                self.analyse(filename)
+                frames = readFrames(filename)
+        except Exception as e:
+            print("Spectral analysis of '%s' failed: %s" % (self.path, e))
+        wx.CallAfter(self.callback, self, frames)
+
+    def analyse(self, filename):
+        if not os.path.isdir(SPECTRAL_CACHE_PATH):
+            os.makedirs(SPECTRAL_CACHE_PATH)
+        args = [self.path, str(self.size), str(self.overlaps), str(self.wintype), filename, self.format]
+        if self.mono:
+            args.append("--mono")
+        if getattr(sys, "frozen", False):
+            # py2app gives the path of the app's launcher, sys.executable
+            # is its bundled interpreter.
+            executable = os.environ.get("EXECUTABLEPATH", sys.executable)
+            cmd = [executable, WORKER_FLAG] + args
+        else:
+            cmd = [sys.executable, "-m", "Resources.preanalysis"] + args
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True, cwd=cwd)
+        out, err = proc.communicate()
+        if proc.returncode != 0:
+            lines = err.strip().splitlines()
+            raise RuntimeError(lines[-1] if lines else "returncode %d" % proc.returncode)
+
+class FramePlayer:
+    """
+    Resynthesizes pre-analysed frames.
+
+    `index` (0 to 1) is the reading position in the sound and `pitch`
+    the transposition factor. `output` has one stream per channel of the
+    sound.
+
+    With `envelope`, the frames of a mono sound analysed with the same
+    parameters and read at `envindex`, the magnitudes are multiplied by
+    the envelope's magnitudes (cross synthesis, as PVMult does).
+
+    """
+    def __init__(self, frames, index, pitch=1, mul=1, envelope=None, envindex=0):
+        size, overlaps, chnls = frames["size"], frames["overlaps"], frames["chnls"]
+        bins = frames["bins"]
+        self.mags = [NewMatrix(bins, frames["frames"], frameRows(m, bins)) for m in frames["mags"]]
+        self.phas = [NewMatrix(bins, frames["frames"], frameRows(m, bins)) for m in frames["phas"]]
+        self.objects = []
+
+        # Only the bin numbers of this FFT are used, they give the bin
+        # each sample of the overlapping frames belongs to.
+        self.clock = FFT(Sig([0] * chnls), size=size, overlaps=overlaps, wintype=frames["wintype"])
+        # The frames keep their pitch at any sampling rate.
+        self.pitch = pitch * (frames["sr"] / float(self.clock.getSamplingRate()))
+        self.position = self.clock["bin"] / self.pitch
+        # Transposing up reads past Nyquist, these bins are muted.
+        self.mask = self.position <= size // 2
+        self.mag = MatrixPointer(self.mags, self.position / bins, index, mul=self.mask)
+        self.pha = MatrixPointer(self.phas, self.position / bins, index, mul=self.pitch)
+        mag = self.mag
+        if envelope is not None:
+            # One envelope matrix per overlap, shared by the channels.
+            self.envmags = [NewMatrix(bins, envelope["frames"], frameRows(m, bins))
+                            for m in envelope["mags"]]
+            matrices = [m for m in self.envmags for i in range(chnls)]
+            self.envelope = MatrixPointer(matrices, self.clock["bin"] / bins, envindex)
+            self.objects.append(self.envelope)
+            mag = self.mag * self.envelope
+        self.accum = FrameAccum(self.pha, framesize=size, overlaps=overlaps)
+        self.car = PolToCar(mag, self.accum)
+        self.ifft = IFFT(self.car["real"], self.car["imag"], size=size, overlaps=overlaps,
+                         wintype=frames["wintype"], mul=mul)
+        self.output = self.ifft.mix(chnls)
+
+    def stop(self):
+        for obj in [self.clock, self.mag, self.pha, self.accum, self.car, self.ifft] + self.objects:
+            obj.stop()
+
+def main(argv):
+    args = [arg for arg in argv if arg != "--mono"]
+    path, size, overlaps, wintype, output = args[:5]
+    fmt = args[5] if len(args) > 5 else "float32"
+    analyse(path, int(size), int(overlaps), int(wintype), output, fmt, "--mono" in argv)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,6 @@
 import sys
+import threading
+import traceback
 import wx
 from .constants import *
 from .images import DSPDemo_Icon
@@ -21,13 +23,17 @@ def GetRoundShape(w, h, r):
     return wx.Region(GetRoundBitmap(w, h, r))
 
 class DSPDemoSplashScreen(wx.Frame):
-    def __init__(self, parent, callback):
+    def __init__(self, parent, callback, worker=None):
         display = wx.Display(0)
         size = display.GetGeometry()[2:]
         st = wx.FRAME_SHAPED|wx.BORDER_SIMPLE|wx.FRAME_NO_TASKBAR|wx.STAY_ON_TOP
         wx.Frame.__init__(self, parent, -1, "", pos=(-1, size[1]//6), style=st)
 
+        # `worker` runs in a thread while the splash screen is shown. Its
+        # result is given to `callback`, in the main thread, and the splash
+        # screen closes when the callback returns.
         self.callback = callback
+        self.worker = worker
 
         self.Bind(wx.EVT_PAINT, self.OnPaint)
 
@@ -43,7 +49,9 @@ class DSPDemoSplashScreen(wx.Frame):
         dc = wx.ClientDC(self)
         dc.DrawBitmap(self.bmp, 0, 0, True)
 
-        wx.CallLater(2000, self.OnClose)
+        thread = threading.Thread(target=self.RunWorker)
+        thread.daemon = True
+        thread.start()
 
         self.Center(wx.HORIZONTAL)
         if sys.platform == 'win32':
@@ -66,6 +74,15 @@ class DSPDemoSplashScreen(wx.Frame):
         dc.DrawLabel("%s v%s" % (APP_NAME, APP_VERSION), wx.Rect(70,380,200,15))
         dc.DrawLabel(APP_COPYRIGHT, wx.Rect(70, 400, 200, 15))
 
-    def OnClose(self):
-        self.callback()
+    def RunWorker(self):
+        result = None
+        if self.worker is not None:
+            try:
+                result = self.worker()
+            except:
+                traceback.print_exc()
+        wx.CallAfter(self.OnClose, result)
+
+    def OnClose(self, result):
+        self.callback(result)
         self.Destroy()
@@ -1,37 +1,219 @@
 import os
-import sys
-from pyo64 import pa_get_devices_infos, pa_get_default_devices_from_host
+import json
+import time
+import threading
+from .engine import Server, pa_get_devices_infos, pa_get_default_devices_from_host
+from .constants import *
 
 def dump_func(arg):
     pass
 
+# Serializes the read-modify-write cycles of the configuration file (the
+# server is booted in a worker thread).
+CONFIG_LOCK = threading.RLock()
+
+def load_config():
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+def save_config(config):
+    """
+    Writes the configuration. The file is replaced at once, so a reader
+    never sees it half written. Returns False if it can't be written.
+
+    """
+    tmp = CONFIG_FILE + ".tmp"
+    try:
+        if not os.path.isdir(CONFIG_PATH):
+            os.makedirs(CONFIG_PATH)
+        with open(tmp, "w") as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp, CONFIG_FILE)
+        return True
+    except (IOError, OSError):
+        return False
+
+def update_config(function):
+    """
+    Loads the configuration, calls `function(config)` to modify it and
+    saves it, while holding CONFIG_LOCK. Returns the new configuration.
+
+    """
+    with CONFIG_LOCK:
+        config = load_config()
+        function(config)
+        save_config(config)
+    return config
+
+def set_audio_config(**values):
+    """
+    Updates some values of the "audio" section of the configuration.
+
+    """
+    return update_config(lambda config: config.setdefault("audio", {}).update(values))
+
+def probe_devices(host):
+    """
+    Queries PortAudio for the output devices and the default device of
+    the given host. This is the slow part of the audio configuration.
+
+    """
+    indev, outdev = pa_get_default_devices_from_host(host)
+    inputs, outputs = pa_get_devices_infos()
+    return {"host": host,
+            "default_output": outdev,
+            "outputs": [[i, outputs[i]["name"], outputs[i]["default sr"]] for i in sorted(outputs)],
+            "time": time.time()}
+
+def device_info(devices, index):
+    for device in devices["outputs"]:
+        if device[0] == index:
+            return device
+    return None
+
 def audio_config():
+    """
+    Returns the audio settings (host, output, output_name, sr, bufsize) and
+    a boolean telling whether they come from the cached device list.
+
+    The host comes from the DSP_DEMO_AUDIO_HOST environment variable, or
+    the saved configuration, or the platform's default. PortAudio is only
+    queried when the cache doesn't describe this host.
+
+    """
+    config = load_config()
+    audio = config.get("audio", {})
     host = None
 
     if "DSP_DEMO_AUDIO_HOST" in os.environ:
         host = os.environ["DSP_DEMO_AUDIO_HOST"]
-        # validate host...
-        if sys.platform.startswith("win"):
-            if host not in ["mme", "directsound", "asio", "wasapi", "wdm-ks"]:
-                host = None
-        elif sys.platform.startswith("linux"):
-            if host not in ["alsa", "oss", "pulse", "jack"]:
-                host = None
-        else:
-            if host not in ["core audio", "jack", "soundflower"]:
-                host = None
+        if host not in AUDIO_HOSTS:
+            host = None
 
     if host is None:
-        if sys.platform.startswith("win"):
-            host = "directsound"
-        elif sys.platform.startswith("linux"):
-            host = "alsa"
-        else:
-            host = "core audio"
+        host = audio.get("host", AUDIO_DEFAULT_HOST)
+        if host not in AUDIO_HOSTS:
+            host = AUDIO_DEFAULT_HOST
 
-    indev, outdev = pa_get_default_devices_from_host(host)
-    inputs, outputs = pa_get_devices_infos()
+    sr = audio.get("sr")
+    bufsize = audio.get("bufsize", AUDIO_BUFSIZE)
+
+    if host == "null":
+        settings = {"host": host, "output": -1, "output_name": "",
+                    "sr": sr or 44100, "bufsize": bufsize}
+        return settings, True
+
+    devices = config.get("devices")
+    cached = devices is not None and devices.get("host") == host
+    if not cached:
+        devices = probe_devices(host)
+        update_config(lambda config: config.update(devices=devices))
+
+    output = devices["default_output"]
+    if audio.get("host") == host and audio.get("output", -1) != -1:
+        output = audio["output"]
+    device = device_info(devices, output)
+    if device is None:
+        output = devices["default_output"]
+        device = device_info(devices, output)
+    if device is None:
+        # No known output device: PortAudio's default is used.
+        settings = {"host": host, "output": -1, "output_name": "",
+                    "sr": sr or 44100, "bufsize": bufsize}
+        return settings, cached
+
+    settings = {"host": host, "output": output, "output_name": device[1],
+                "sr": sr or device[2], "bufsize": bufsize}
+    return settings, cached
+
+def revalidate_devices(settings):
+    """
+    Probes the devices again and updates the cache. Returns the name of
+    the cached output device if it doesn't exist anymore (or another
+    device took its index), None otherwise. The saved device choice is
+    then dropped and the host's default device will be used at next
+    launch.
+
+    PortAudio can't be queried while a stream runs: this must be called
+    from the GUI thread while the server is stopped.
+
+    """
+    devices = probe_devices(settings["host"])
+    device = device_info(devices, settings["output"])
+    lost = settings["output"] != -1 and (device is None or device[1] != settings["output_name"])
+    def update(config):
+        config["devices"] = devices
+        if lost and "audio" in config:
+            config["audio"]["output"] = -1
+    update_config(update)
+    if lost:
+        return settings["output_name"]
+    return None
+
+class NullAudioDriver(threading.Thread):
+    """
+    Computes the audio of a "manual" server in real time, without any
+    audio device, so the application can run on headless machines.
+
+    `stop` must be called before the server is shut down.
+
+    """
+    def __init__(self, server):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.server = server
+        self.stopped = threading.Event()
+
+    def run(self):
+        clock = getattr(time, "perf_counter", time.time)
+        deadline = clock()
+        while not self.stopped.is_set():
+            bufdur = self.server.getBufferSize() / float(self.server.getSamplingRate())
+            if self.server.getIsStarted():
+                self.server.process()
+            deadline += bufdur
+            delay = deadline - clock()
+            if delay > 0:
+                self.stopped.wait(delay)
+            else:
+                deadline = clock()
+
+    def stop(self):
+        """
+        Stops the thread, once the buffer being computed is done.
+
+        """
+        self.stopped.set()
+        self.join()
+
+def boot_server():
+    """
+    Returns a booted Server configured by `audio_config`. A "manual"
+    server (null host) needs a NullAudioDriver to run.
+
+    May be called from a worker thread.
+
+    """
+    settings, cached = audio_config()
+
+    if settings["host"] == "null":
+        server = Server(settings["sr"], AUDIO_NCHNLS, settings["bufsize"], 0, audio="manual")
+        server.boot()
+        return server
+
+    server = Server(settings["sr"], AUDIO_NCHNLS, settings["bufsize"], AUDIO_DUPLEX)
+    server.setOutputDevice(settings["output"])
+    server.boot()
 
-    sr = outputs[outdev]["default sr"]
+    if cached and not server.getIsBooted():
+        # The cached device is gone, probe again.
+        update_config(lambda config: config.pop("devices", None))
+        settings, cached = audio_config()
+        server.setSamplingRate(settings["sr"])
+        server.setOutputDevice(settings["output"])
+        server.boot()
 
-    return sr, outdev
+    return server
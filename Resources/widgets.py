@@ -1,5 +1,7 @@
 import math
 import wx
+from .engine import PyoGuiControlSlider, PRECISION, PRECISIONS
+from pyo.lib._wxwidgets import DataMultiSlider
 from .constants import *
 try:
     import cv2
@@ -214,6 +216,230 @@ class LabelKnob(wx.Panel):
                 realvalue = int(realvalue)
             self.outFunction(realvalue)
 
+def stateWidgets(window):
+    "returns, in creation order, the windows whose state is saved by saveState"
+    widgets = []
+    for child in window.GetChildren():
+        if isinstance(child, wx.BookCtrlBase):
+            widgets.append(child)
+            for page in range(child.GetPageCount()):
+                widgets.extend(stateWidgets(child.GetPage(page)))
+            continue
+        if isinstance(child, (wx.Choice, wx.ToggleButton, wx.CheckBox, wx.RadioBox,
+                              LabelKnob, PyoGuiControlSlider, DataMultiSlider)):
+            widgets.append(child)
+        elif hasattr(child, "getState"):
+            widgets.append(child)
+            widgets.extend(stateWidgets(child))
+        elif not isinstance(child, Knob):
+            widgets.extend(stateWidgets(child))
+    return widgets
+
+def widgetValue(widget):
+    if hasattr(widget, "getState"):
+        return widget.getState()
+    elif isinstance(widget, (wx.BookCtrlBase, wx.Choice, wx.RadioBox)):
+        return widget.GetSelection()
+    elif isinstance(widget, LabelKnob):
+        return widget.knob.value
+    elif isinstance(widget, PyoGuiControlSlider):
+        return widget.getValue()
+    elif isinstance(widget, DataMultiSlider):
+        return list(widget.getValues())
+    return widget.GetValue()
+
+def sendCommand(widget, evttype, value):
+    evt = wx.CommandEvent(evttype, widget.GetId())
+    evt.SetEventObject(widget)
+    evt.SetInt(value)
+    if isinstance(widget, (wx.Choice, wx.RadioBox)):
+        evt.SetString(widget.GetString(value))
+    widget.GetEventHandler().ProcessEvent(evt)
+
+def setWidgetValue(widget, value):
+    if hasattr(widget, "setState"):
+        widget.setState(value)
+    elif isinstance(widget, wx.BookCtrlBase):
+        if hasattr(widget, "setSource"):
+            widget.setSource(value)
+        else:
+            widget.ChangeSelection(value)
+    elif isinstance(widget, wx.Choice):
+        widget.SetSelection(value)
+        sendCommand(widget, wx.wxEVT_CHOICE, value)
+    elif isinstance(widget, wx.RadioBox):
+        widget.SetSelection(value)
+        sendCommand(widget, wx.wxEVT_RADIOBOX, value)
+    elif isinstance(widget, wx.ToggleButton):
+        widget.SetValue(value)
+        sendCommand(widget, wx.wxEVT_TOGGLEBUTTON, value)
+    elif isinstance(widget, wx.CheckBox):
+        widget.SetValue(value)
+        sendCommand(widget, wx.wxEVT_CHECKBOX, value)
+    elif isinstance(widget, LabelKnob):
+        widget.knob.setValue(value)
+        widget.knobOutput(value)
+        widget.knob.Refresh()
+    elif isinstance(widget, PyoGuiControlSlider):
+        widget.setValue(value, propagate=True)
+    elif isinstance(widget, DataMultiSlider):
+        widget.update(value)
+
+def saveState(window):
+    """
+    Returns the state of the controls of a module, to be replayed by
+    restoreState on a new instance of the same module (after a reboot
+    of the audio server). Windows can save more than their controls
+    with optional getState/setState methods.
+
+    """
+    state = [(widget.__class__.__name__, widgetValue(widget)) for widget in stateWidgets(window)]
+    if hasattr(window, "getState"):
+        state.insert(0, (window.__class__.__name__, window.getState()))
+    return state
+
+def restoreState(window, state):
+    """
+    Replays the state returned by saveState. Every control sends its
+    event, as if the user had set it again.
+
+    """
+    widgets = stateWidgets(window)
+    if hasattr(window, "setState"):
+        widgets.insert(0, window)
+    if [w.__class__.__name__ for w in widgets] != [s[0] for s in state]:
+        return False
+    for widget, (name, value) in zip(widgets, state):
+        if widget is window:
+            widget.setState(value)
+        else:
+            setWidgetValue(widget, value)
+    return True
+
+class TimingOverlay(wx.Panel):
+    """
+    Histogram of the audio callback's processing time (in fractions of
+    the buffer duration, late buffers in red), worst case and xruns.
+
+    """
+    def __init__(self, parent, size=(-1, 70)):
+        wx.Panel.__init__(self, parent, -1, size=size)
+        self.SetBackgroundStyle(wx.BG_STYLE_CUSTOM)
+        self.SetBackgroundColour(APP_BACKGROUND_COLOUR)
+        self.timing = None
+        self.Bind(wx.EVT_PAINT, self.OnPaint)
+
+    def setTiming(self, timing):
+        self.timing = timing
+        self.Refresh()
+
+    def OnPaint(self, evt):
+        w, h = self.GetSize()
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.Brush(APP_BACKGROUND_COLOUR))
+        dc.Clear()
+        if self.timing is None:
+            return
+
+        font = wx.Font(8, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        dc.SetFont(font)
+        dc.SetTextForeground("#222222")
+        xruns = self.timing["xruns"]
+        dc.DrawText("Pire: %.2f ms / %.2f ms" % (self.timing["worst_ms"],
+                                                 self.timing["budget_ms"]), 2, 0)
+        dc.DrawText("Xruns: CPU %d, GUI %d, Pilote %d" % (xruns["cpu"], xruns["gui"],
+                                                           xruns["device"]), 2, 12)
+
+        histogram = self.timing["histogram"]
+        top, bottom = 27, h - 2
+        total = max(sum(histogram), 1)
+        barw = (w - 4) / float(len(histogram))
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        for i, count in enumerate(histogram):
+            if count == 0:
+                continue
+            # Log scale, so that a few late buffers are visible.
+            height = (bottom - top) * math.log10(1 + 9 * count / float(total))
+            if i == len(histogram) - 1:
+                dc.SetBrush(wx.Brush("#CC2222"))
+            else:
+                dc.SetBrush(wx.Brush("#444444"))
+            dc.DrawRectangle(int(2 + i * barw), int(bottom - height),
+                             max(int(barw) - 1, 1), max(int(height), 1))
+
+class AudioSettingsDialog(wx.Dialog):
+    """
+    Host, output device, sampling rate and buffer size.
+
+    `devices` is the cached device list of `utils.probe_devices`. The
+    devices can only be chosen for the host they were probed from, other
+    hosts use their default device.
+
+    """
+    def __init__(self, parent, settings, devices):
+        wx.Dialog.__init__(self, parent, -1, "Réglages audio")
+        self.devices = devices
+        self.settings = settings
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        grid = wx.FlexGridSizer(5, 2, 5, 10)
+
+        self.host = wx.Choice(self, -1, choices=AUDIO_HOSTS)
+        self.host.SetStringSelection(settings["host"])
+        self.host.Bind(wx.EVT_CHOICE, self.onHost)
+        self.output = wx.Choice(self, -1, size=(250, -1))
+        self.sr = wx.Choice(self, -1, choices=[str(x) for x in AUDIO_SAMPLING_RATES])
+        if not self.sr.SetStringSelection(str(int(settings["sr"]))):
+            self.sr.SetStringSelection("44100")
+        self.bufsize = wx.Choice(self, -1, choices=[str(x) for x in AUDIO_BUFFER_SIZES])
+        if not self.bufsize.SetStringSelection(str(settings["bufsize"])):
+            self.bufsize.SetStringSelection(str(AUDIO_BUFSIZE))
+        self.precision = wx.Choice(self, -1, choices=["Simple (32 bits)", "Double (64 bits)"])
+        self.precision.SetSelection(PRECISIONS.index(PRECISION))
+
+        for label, ctrl in [("Hôte", self.host), ("Sortie", self.output),
+                            ("Fréquence d'échantillonnage", self.sr),
+                            ("Taille du bloc", self.bufsize),
+                            ("Précision", self.precision)]:
+            grid.Add(wx.StaticText(self, -1, label), 0, wx.ALIGN_CENTER_VERTICAL)
+            grid.Add(ctrl, 0, wx.EXPAND)
+
+        sizer.Add(grid, 0, wx.ALL, 10)
+        sizer.Add(self.CreateSeparatedButtonSizer(wx.OK|wx.CANCEL), 0, wx.EXPAND|wx.ALL, 10)
+        self.SetSizerAndFit(sizer)
+
+        self.setOutputs(settings["host"])
+        self.CenterOnParent()
+
+    def setOutputs(self, host):
+        self.outputs = [-1]
+        names = ["Défaut de l'hôte"]
+        if self.devices is not None and self.devices.get("host") == host:
+            for index, name, sr in self.devices["outputs"]:
+                self.outputs.append(index)
+                names.append(name)
+        self.output.SetItems(names)
+        if host == self.settings["host"] and self.settings["output"] in self.outputs:
+            self.output.SetSelection(self.outputs.index(self.settings["output"]))
+        else:
+            self.output.SetSelection(0)
+        self.output.Enable(host != "null")
+
+    def onHost(self, evt):
+        self.setOutputs(self.host.GetStringSelection())
+
+    def GetSettings(self):
+        output = self.outputs[self.output.GetSelection()]
+        name = ""
+        if output != -1:
+            name = self.output.GetStringSelection()
+        return {"host": self.host.GetStringSelection(),
+                "output": output,
+                "output_name": name,
+                "sr": int(self.sr.GetStringSelection()),
+                "bufsize": int(self.bufsize.GetStringSelection()),
+                "precision": PRECISIONS[self.precision.GetSelection()]}
+
 if FOUND_CV2:
     capture = cv2.VideoCapture(0)
     capture.set(cv2.CAP_PROP_FRAME_WIDTH, 240)
@@ -1,12 +1,28 @@
+import sys
 import wx
-from Resources.mainframe import MainFrame
 from Resources.splash import DSPDemoSplashScreen
 
-def onStart():
-    mainFrame = MainFrame(None, title='DSP Demo')
+def startAudio():
+    # Runs in a worker thread while the splash screen is shown: imports
+    # pyo and the modules, probes the audio devices and boots the server.
+    from Resources.utils import boot_server
+    return boot_server()
+
+def onStart(server):
+    from Resources.mainframe import MainFrame
+    mainFrame = MainFrame(None, title='DSP Demo', server=server)
     app.SetTopWindow(mainFrame)
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--preanalysis"]:
+        # Spectral analysis worker of the frozen builds (see Resources/preanalysis.py).
+        from Resources.preanalysis import main
+        main(sys.argv[2:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["--benchmark"]:
+        # Branch profiler of the frozen builds (see Resources/benchmark.py).
+        from Resources.benchmark import main
+        sys.exit(main(sys.argv[2:]))
     app = wx.App(False)
-    sp = DSPDemoSplashScreen(None, callback=onStart)
+    sp = DSPDemoSplashScreen(None, callback=onStart, worker=startAudio)
     app.MainLoop()
@@ -2,6 +2,10 @@ import os
 
 flags = "--clean -F -c"
 hidden = "--hidden-import wx.adv --hidden-import wx.html --hidden-import wx.xml"
+# Modules are imported on demand, pyinstaller can't find them by itself.
+for f in os.listdir(os.path.join("Resources", "modules")):
+    if f.endswith(".py") and f != "__init__.py":
+        hidden += " --hidden-import Resources.modules.%s" % f[:-3]
 icon = "--icon=Resources\DSPDemo_Icon.ico"
 os.system('pyinstaller %s %s %s "DSPDemo.py"' % (flags, hidden, icon))
 
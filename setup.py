@@ -5,15 +5,19 @@ Usage:
     python3.6 setup.py py2app
 """
 
+import os
 from setuptools import setup
 
 APP = ['DSPDemo.py']
 APP_NAME = 'DSPDemo'
 DATA_FILES = ['Resources/']
+# Modules are imported on demand, py2app can't find them by itself.
+MODULES = ['Resources.modules.%s' % f[:-3] for f in os.listdir('Resources/modules')
+           if f.endswith('.py') and f != '__init__.py']
 OPTIONS = {'argv_emulation': False,
            #'strip': False, # only for debugging purposes.
            'iconfile': 'Resources/DSPDemo_Icon.icns',
-           'includes': 'wx.adv,wx.html,wx.xml'}
+           'includes': ','.join(['wx.adv', 'wx.html', 'wx.xml'] + MODULES)}
 
 setup(
     name=APP_NAME,